@@ -29,9 +29,12 @@ from freestyle.types import (
 import parameter_editor
 
 import bpy
+from bpy.props import BoolProperty, StringProperty
+from bpy_extras.io_utils import ExportHelper
+import itertools
+import numpy
 import os
 import sys
-import itertools
 
 sys.path.insert(0, os.path.dirname(__file__))
 
@@ -85,7 +88,7 @@ class ParameterEditorCallback(object):
 
 
 class PathPlotter(StrokeShader):
-    """Stroke Shader for writing stroke data to a .svg file."""
+    """Stroke Shader for collecting the stroke coordinates of a lineset."""
 
     def __init__(self, name,  res_y, scale, split_at_invisible, frame_current):
         StrokeShader.__init__(self)
@@ -95,46 +98,45 @@ class PathPlotter(StrokeShader):
         self.h = res_y
         self.scale = scale
         self.frame_current = frame_current
-        self.strokes = []
+        self.coords = []
+        self.visible = []
         self.split_at_invisible = split_at_invisible
 
-    @staticmethod
-    def pathgen(stroke, height, split_at_invisible,
-                f=lambda v: not v.attribute.visible):
-        """Generator that creates SVG paths (as strings) from the current
-         stroke """
-        if len(stroke) <= 1:
-            return []
-
-        it = iter(stroke)
-        # start first path
-        for v in it:
-            x, y = v.point
-            yield (x, height - y)
-
-            if split_at_invisible and v.attribute.visible is False:
-                # fast-forward till the next visible vertex
-                it = itertools.dropwhile(f, it)
-
-                # yield next visible vertex
-                svert = next(it, None)
-                if svert is None:
-                    break
-                x, y = svert.point
-                yield (x, height - y)
-
     def shade(self, stroke):
-        stroke = list(self.pathgen(stroke, self.h, self.split_at_invisible))
-        self.strokes.append(stroke)
+        vertices = list(stroke)
+        n = len(vertices)
+        if n <= 1:
+            return
+
+        # the vertices are only touched by these two loops, everything else
+        # is done on the arrays
+        coords = numpy.fromiter(
+            itertools.chain.from_iterable(v.point for v in vertices),
+            numpy.float64, n * 2).reshape(-1, 2)
+        coords[:, 1] = self.h - coords[:, 1]
+        if self.split_at_invisible:
+            visible = numpy.fromiter(
+                (v.attribute.visible for v in vertices), bool, n)
+        else:
+            visible = numpy.ones(n, dtype=bool)
+        # no segment connects the last vertex with the next stroke
+        visible[-1] = False
+        self.coords.append(coords)
+        self.visible.append(visible)
 
     def get_strokes(self):
-        return self.strokes
+        """Returns the strokes split at invisible vertices as PackedPaths"""
+        if not self.coords:
+            return axi.packed.pack_arrays([])
+        return axi.packed.pack_visible(
+            numpy.concatenate(self.coords), numpy.concatenate(self.visible))
 
 
 class PathPlotterCallback(ParameterEditorCallback):
 
     def __init__(self):
-        self.lineset = []
+        # (lineset name, linestyle name, PackedPaths) per lineset
+        self.linesets = []
         self.shader = None
 
     def poll(self, scene, linestyle):
@@ -153,7 +155,31 @@ class PathPlotterCallback(ParameterEditorCallback):
         if not self.poll(scene, lineset.linestyle):
             return []
 
-        self.lineset.extend(self.shader.get_strokes())
+        self.linesets.append((lineset.name, lineset.linestyle.name,
+                              self.shader.get_strokes()))
+
+    def get_strokes(self, layer_by='LINESTYLE'):
+        """Returns the strokes of all linesets as PackedPaths. Each path
+        gets the layer (pen) of its linestyle or lineset, whose names are
+        stored in the metadata"""
+        names = []
+        chunks = []
+        for lineset, linestyle, packed in self.linesets:
+            name = linestyle if layer_by == 'LINESTYLE' else lineset
+            if name not in names:
+                names.append(name)
+            layer = names.index(name)
+            packed.layers = numpy.full(len(packed), layer, dtype=numpy.int32)
+            chunks.append(packed)
+        # keep the paths of a layer together, also if the linesets of a
+        # layer are not next to each other
+        chunks.sort(key=lambda packed: packed.layers[0] if len(packed) else 0)
+        result = axi.packed.concat_packed(chunks)
+        result.meta = dict(
+            layers=names,
+            linesets=[lineset for lineset, linestyle, packed in self.linesets],
+            linestyles=[linestyle for lineset, linestyle, packed in self.linesets])
+        return result
 
 
 def connect_plotter():
@@ -169,7 +195,179 @@ def disconnect_plotter(d):
     d.pen_up()
 
 
-class OperatorPlot(bpy.types.Operator):
+def drawing_options(scene):
+    """Returns the axi.Pipeline options as configured in the scene"""
+    plotter = scene.plotter
+    # the layers are optimized one after the other, as worker processes
+    # would start Blender again on platforms that spawn them
+    return dict(
+        scale=scale_factor(scene),
+        join=plotter.join_paths_threshold if plotter.join_paths else None,
+        sort=plotter.sort_paths,
+        processes=1)
+
+
+def prepare_drawing(lineset, options):
+    """Scales, joins and sorts the captured strokes. Does not access bpy so
+    that it can run on a worker thread"""
+    pipeline = axi.Pipeline(**options)
+    drawing = pipeline.run(axi.Drawing(lineset))
+    print(pipeline.report())
+    return drawing
+
+
+def dump_strokes(filename, lineset, options):
+    """Writes the captured strokes with the pipeline options, for running
+    the pipeline outside of Blender with 'axi pipeline <filename>'"""
+    lineset.meta['pipeline'] = options
+    axi.Drawing(lineset).dump_binary(bpy.path.abspath(filename))
+
+
+def export_strokes(filename, lineset, options, optimize):
+    """Writes the strokes to the binary drawing format. Without optimize the
+    pipeline options are stored with the raw strokes, so that the plotting
+    host can run them with 'axi pipeline <filename>'"""
+    drawing = axi.Drawing(lineset)
+    if optimize:
+        drawing = prepare_drawing(lineset, options)
+    else:
+        lineset.meta['pipeline'] = options
+    drawing.dump_binary(bpy.path.abspath(filename))
+
+
+def frame_path(filepath, frame):
+    base, ext = os.path.splitext(filepath)
+    return "%s_%04d%s" % (base, frame, ext)
+
+
+def render_strokes(callback, empty=False):
+    """Renders the scene with Freestyle and calls callback(scene, lineset)
+    with the captured strokes once rendering is complete. The callback is
+    not called if no strokes were captured, unless empty is set"""
+    pp = PathPlotterCallback()
+    editor = parameter_editor
+
+    def render_complete(scene):
+        editor.callbacks_lineset_post.remove(pp.lineset_post)
+        editor.callbacks_modifiers_post.remove(pp.modifier_post)
+        bpy.app.handlers.render_complete.remove(render_complete)
+
+        lineset = pp.get_strokes(scene.plotter.layer_by)
+        if scene.plotter.dump_strokes:
+            dump_strokes(scene.plotter.dump_strokes, lineset,
+                         drawing_options(scene))
+        if len(lineset) or empty:
+            callback(scene, lineset)
+
+    editor.callbacks_lineset_post.append(pp.lineset_post)
+    editor.callbacks_modifiers_post.append(pp.modifier_post)
+    bpy.app.handlers.render_complete.append(render_complete)
+
+    bpy.ops.render.render('EXEC_DEFAULT')
+
+
+# the plot job running in the background, if any
+job = None
+
+# optimized drawings and plans of the frames plotted in this session,
+# created by get_frame_cache as axi may not be available
+frame_cache = None
+
+
+def get_frame_cache():
+    global frame_cache
+    if frame_cache is None:
+        frame_cache = axi.PipelineCache(size=256)
+    return frame_cache
+
+
+def job_status(job):
+    progress = job.progress
+    frame = getattr(job, 'frame', None)
+    prefix = "Frame %d: " % frame if frame is not None else ""
+    if job.prompt is not None:
+        return "%s%s, then continue" % (prefix, job.prompt.capitalize())
+    if job.control.paused:
+        return "%sPaused at %s" % (prefix, progress.message)
+    if job.status == 'plotting' and progress.message:
+        return "%sPlotting %s" % (prefix, progress.message)
+    if job.status == 'failed':
+        return "Failed: %s" % job.error
+    return prefix + job.status.capitalize()
+
+
+def show_progress(plotter, job):
+    """Copies the progress of the plot job into the scene properties shown
+    in the panel. The job only records it, as bpy must not be accessed from
+    its thread"""
+    progress = job.progress
+    plotter.status = job_status(job)
+    plotter.paused = job.control.paused
+    plotter.progress = progress.percent_complete
+    if progress.percent_complete > 0:
+        plotter.eta = "%s elapsed, %s left" % (
+            axi.progress.pretty_time(progress.elapsed_time),
+            axi.progress.pretty_time(progress.eta))
+
+
+def tag_redraw(context):
+    for area in context.screen.areas:
+        if area.type == 'PROPERTIES':
+            area.tag_redraw()
+
+
+class JobOperator(object):
+    """Mixin for operators that start the plot job and then poll it with a
+    timer until it is done"""
+
+    _timer = None
+
+    @classmethod
+    def poll(cls, context):
+        return job is None
+
+    def start_job(self, context, new_job):
+        global job
+        job = new_job
+        job.start()
+
+        plotter = context.scene.plotter
+        plotter.progress = 0
+        plotter.eta = ""
+        plotter.plotting = True
+        show_progress(plotter, job)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def finished(self, context, job):
+        if job.error is not None:
+            self.report({'ERROR'}, "Failed to plot.")
+            print(str(job.error))
+
+    def modal(self, context, event):
+        global job
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        plotter = context.scene.plotter
+        show_progress(plotter, job)
+        tag_redraw(context)
+        if job.is_alive():
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        self.finished(context, job)
+        job = None
+        plotter.paused = False
+        plotter.plotting = False
+        tag_redraw(context)
+        return {'FINISHED'}
+
+
+class OperatorPlot(JobOperator, bpy.types.Operator):
     bl_idname = "plot.plot"
     bl_label = "Plot"
     bl_description = "Render and plot the result to an AxiDraw plotter."
@@ -178,60 +376,218 @@ class OperatorPlot(bpy.types.Operator):
         plotter = context.scene.plotter
         self.report({'INFO'}, "Area X: %f; Area Y: %f" %
                     (plotter.area_x, plotter.area_y))
+        captured = []
+
+        def plot(scene, lineset):
+            captured.append((lineset, drawing_options(scene)))
+
+        try:
+            render_strokes(plot)
+
+        except Exception as e:
+            self.report({'ERROR'}, "Failed to plot.")
+            print(str(e))
+
+        if not captured:
+            return {'FINISHED'}
+
+        # plotting continues in the background
+        lineset, options = captured[0]
+        return self.start_job(context, axi.PlotJob(
+            lambda: prepare_drawing(lineset, options),
+            connect_plotter, disconnect_plotter))
+
+
+class OperatorPlotFrames(JobOperator, bpy.types.Operator):
+    bl_idname = "plot.frames"
+    bl_label = "Plot Frames"
+    bl_description = "Render every frame of the frame range and plot " \
+        "each on its own sheet. Frames whose strokes did not change are " \
+        "not optimized again."
+
+    def execute(self, context):
+        scene = context.scene
+        options = drawing_options(scene)
+        frames = []
+        current = scene.frame_current
+        try:
+            for frame in range(scene.frame_start, scene.frame_end + 1,
+                               scene.frame_step):
+                scene.frame_set(frame)
+
+                def capture(scene, lineset):
+                    frames.append((frame, axi.Drawing(lineset)))
+
+                render_strokes(capture)
+
+        except Exception as e:
+            self.report({'ERROR'}, "Failed to render frames.")
+            print(str(e))
+            return {'FINISHED'}
+
+        finally:
+            scene.frame_set(current)
+
+        if not frames:
+            return {'FINISHED'}
+
+        return self.start_job(context, axi.BatchPlotJob(
+            frames, options, connect_plotter, disconnect_plotter,
+            get_frame_cache()))
+
+    _reported = 0
+
+    def report_timings(self, job):
+        """Reports the pipeline timings of the frames prepared since the
+        last call"""
+        timings = job.timings[self._reported:]
+        self._reported += len(timings)
+        for frame, stages in timings:
+            stages = ", ".join("%s %.2fs" % (stage, seconds)
+                               for stage, seconds, paths in stages)
+            self.report({'INFO'}, "Frame %d: %s" % (frame, stages))
+
+    def modal(self, context, event):
+        if event.type == 'TIMER' and job is not None:
+            self.report_timings(job)
+        return JobOperator.modal(self, context, event)
+
+    def finished(self, context, job):
+        JobOperator.finished(self, context, job)
+        self.report_timings(job)
 
-        pp = PathPlotterCallback()
-        editor = parameter_editor
 
-        def render_complete(scene):
-            if not pp.lineset:
-                return
+class OperatorPause(bpy.types.Operator):
+    bl_idname = "plot.pause"
+    bl_label = "Pause"
+    bl_description = "Pause or continue plotting after the current stroke."
 
-            device = connect_plotter()
-            if not device:
-                self.report({'ERROR'}, "Failed to connect to AxiDraw.")
-                return
+    @classmethod
+    def poll(cls, context):
+        return job is not None
+
+    def execute(self, context):
+        if job.control.paused:
+            job.resume()
+        else:
+            job.pause()
+        context.scene.plotter.paused = job.control.paused
+        return {'FINISHED'}
 
-            drawing = axi.Drawing(pp.lineset)
-            drawing = drawing.scale(scale_factor(scene))
 
-            if plotter.join_paths:
-                drawing = drawing.join_paths(plotter.join_paths_threshold)
+class OperatorCancel(bpy.types.Operator):
+    bl_idname = "plot.cancel"
+    bl_label = "Cancel"
+    bl_description = "Stop plotting, lift the pen and return home."
 
-            if plotter.sort_paths:
-                drawing = drawing.sort_paths()
+    @classmethod
+    def poll(cls, context):
+        return job is not None
 
-            device.run_drawing(drawing, True)
+    def execute(self, context):
+        job.cancel()
+        return {'FINISHED'}
 
-            disconnect_plotter(device)
 
-            editor.callbacks_lineset_post.remove(pp.lineset_post)
-            editor.callbacks_modifiers_post.remove(pp.modifier_post)
-            bpy.app.handlers.render_complete.remove(render_complete)
+class OperatorEstimate(bpy.types.Operator):
+    bl_idname = "plot.estimate"
+    bl_label = "Estimate"
+    bl_description = "Render and estimate the plotting time without a plotter."
+
+    def execute(self, context):
+        def estimate(scene, lineset):
+            drawing = prepare_drawing(lineset, drawing_options(scene))
+            e = axi.estimate(drawing)
+            scene.plotter.estimate = "%s (%d paths, pen down %s)" % (
+                axi.progress.pretty_time(e.time), len(e.path_times),
+                axi.progress.pretty_time(e.down_time))
 
         try:
-            editor.callbacks_lineset_post.append(pp.lineset_post)
-            editor.callbacks_modifiers_post.append(pp.modifier_post)
-            bpy.app.handlers.render_complete.append(render_complete)
+            render_strokes(estimate)
 
-            bpy.ops.render.render('EXEC_DEFAULT')
+        except Exception as e:
+            self.report({'ERROR'}, "Failed to estimate.")
+            print(str(e))
+
+        return {'FINISHED'}
+
+
+class OperatorExport(bpy.types.Operator, ExportHelper):
+    bl_idname = "plot.export"
+    bl_label = "Export Strokes"
+    bl_description = "Render and write the strokes of each lineset to a " \
+        "binary drawing file, for plotting on another machine."
+
+    filename_ext = ".axb"
+    filter_glob: StringProperty(default="*.axb", options={'HIDDEN'})
+
+    use_frame_range: BoolProperty(
+        name="Frame Range",
+        description="Export every frame of the scene's frame range to a "
+                    "numbered file",
+        default=False
+    )
+
+    optimize: BoolProperty(
+        name="Optimize",
+        description="Scale, join and sort the strokes before writing them",
+        default=True
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        options = drawing_options(scene)
+        frames = [scene.frame_current]
+        if self.use_frame_range:
+            frames = range(scene.frame_start, scene.frame_end + 1,
+                           scene.frame_step)
+
+        current = scene.frame_current
+        try:
+            for frame in frames:
+                filename = self.filepath
+                if self.use_frame_range:
+                    filename = frame_path(filename, frame)
+                scene.frame_set(frame)
+
+                def export(scene, lineset):
+                    export_strokes(filename, lineset, options, self.optimize)
+
+                render_strokes(export, empty=True)
+                self.report({'INFO'}, "Exported %s" % filename)
 
         except Exception as e:
-            self.report({'ERROR'}, "Failed to plot.")
+            self.report({'ERROR'}, "Failed to export.")
             print(str(e))
 
+        finally:
+            scene.frame_set(current)
+
         return {'FINISHED'}
 
 
+classes = (
+    OperatorPlot,
+    OperatorPlotFrames,
+    OperatorPause,
+    OperatorCancel,
+    OperatorEstimate,
+    OperatorExport,
+)
+
+
 def register():
     properties.register()
     ui.register()
-    bpy.utils.register_class(OperatorPlot)
+    for cls in classes:
+        bpy.utils.register_class(cls)
 
 
 def unregister():
     properties.unregister()
     ui.unregister()
-    bpy.utils.unregister_class(OperatorPlot)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
 
 
 if __name__ == "__main__":
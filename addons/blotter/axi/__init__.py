@@ -1,21 +1,29 @@
 from .device import Device
 from .drawing import Drawing
+from .estimate import Estimate, Estimator, estimate
+from .job import BatchPlotJob, PlotJob
 from .lindenmayer import LSystem
+from .motion import Trajectory, trajectory
+from .packed import PackedPaths, pack_paths
 from .paths import (
     convex_hull,
+    crop_packed,
     crop_path,
     crop_paths,
+    cubic_path,
     join_paths,
     load_paths,
     path_length,
     paths_length,
     paths_to_shapely,
     quadratic_path,
+    remove_duplicates,
     shapely_to_paths,
     simplify_path,
     simplify_paths,
     sort_paths,
 )
+from .pipeline import Pipeline, PipelineCache
 from .planner import Planner
 from .turtle import Turtle
 from .util import draw, reset
@@ -27,38 +35,10 @@ from .drawing import (
     A3_BOUNDS,
 )
 
-from .hershey import text, Font
-from .hershey_fonts import (
-    ASTROLOGY,
-    CURSIVE,
-    CYRILC_1,
-    CYRILLIC,
-    FUTURAL,
-    FUTURAM,
-    GOTHGBT,
-    GOTHGRT,
-    GOTHICENG,
-    GOTHICGER,
-    GOTHICITA,
-    GOTHITT,
-    GREEK,
-    GREEKC,
-    GREEKS,
-    JAPANESE,
-    MARKERS,
-    MATHLOW,
-    MATHUPP,
-    METEOROLOGY,
-    MUSIC,
-    ROWMAND,
-    ROWMANS,
-    ROWMANT,
-    SCRIPTC,
-    SCRIPTS,
-    SYMBOLIC,
-    TIMESG,
-    TIMESI,
-    TIMESIB,
-    TIMESR,
-    TIMESRB,
-)
+from .hershey import text, Font, TextLayout, get_font, FONT_NAMES
+
+def __getattr__(name):
+    # the fonts (axi.FUTURAL etc.) are loaded on first access
+    if name in FONT_NAMES:
+        return get_font(name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
@@ -0,0 +1,62 @@
+from __future__ import division
+
+import json
+import os
+import time
+
+# checkpoints record how far Device.run_drawing got: the index of the path
+# being plotted and the number of time slices of its plan that were sent to
+# the device. they are written to a json file at most every interval seconds
+# and at the end of every path, and removed when the drawing is complete.
+
+CHECKPOINT_INTERVAL = 5
+
+def fingerprint(drawing):
+    # identifies the drawing so that a checkpoint is not resumed with a
+    # different one
+    return [drawing.count, round(drawing.down_length, 6)]
+
+class Checkpoint(object):
+    def __init__(self, filename, drawing, interval=CHECKPOINT_INTERVAL):
+        self.filename = filename
+        self.fingerprint = fingerprint(drawing)
+        self.interval = interval
+        self.last_save = 0
+        self.path = 0
+        self.slice = 0
+
+    def load(self):
+        # returns (path index, slice index) to resume from, (0, 0) if there
+        # is no checkpoint
+        if not os.path.exists(self.filename):
+            return 0, 0
+        with open(self.filename) as fp:
+            data = json.load(fp)
+        if data['fingerprint'] != self.fingerprint:
+            raise Exception('checkpoint %s belongs to a different drawing' %
+                self.filename)
+        self.path = data['path']
+        self.slice = data['slice']
+        return self.path, self.slice
+
+    def update(self, path, slice, force=False):
+        self.path = path
+        self.slice = slice
+        now = time.time()
+        if force or now - self.last_save >= self.interval:
+            self.save()
+            self.last_save = now
+
+    def save(self):
+        data = dict(
+            fingerprint=self.fingerprint, path=self.path, slice=self.slice)
+        # write to a temporary file first so that an interruption while
+        # saving cannot corrupt the previous checkpoint
+        temp = self.filename + '.tmp'
+        with open(temp, 'w') as fp:
+            json.dump(data, fp)
+        os.replace(temp, self.filename)
+
+    def clear(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
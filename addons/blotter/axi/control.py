@@ -0,0 +1,38 @@
+import threading
+
+# lets another thread pause or cancel Device.run_drawing
+
+class Cancelled(Exception):
+    pass
+
+class PlotControl(object):
+    def __init__(self):
+        self._running = threading.Event()
+        self._running.set()
+        self.cancelled = False
+        self.path = 0 # index of the path being plotted
+
+    @property
+    def paused(self):
+        return not self._running.is_set() and not self.cancelled
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self.cancelled = True
+        self._running.set()
+
+    def check(self):
+        # called by run_drawing while the pen is up, blocks while paused
+        self._running.wait()
+        if self.cancelled:
+            raise Cancelled()
+
+    def check_cancelled(self):
+        # called by run_drawing while the pen is down
+        if self.cancelled:
+            raise Cancelled()
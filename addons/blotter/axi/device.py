@@ -1,16 +1,19 @@
 from __future__ import division, print_function
 
+import numpy as np
 import time
 
 from math import modf
 from serial import Serial
 from serial.tools.list_ports import comports
 
-from .paths import path_length
+from .checkpoint import Checkpoint
+from .control import Cancelled
 from .planner import Planner
-from .progress import Bar
+from .progress import TimeBar
 
 TIMESLICE_MS = 10
+RESUME_OVERLAP = 10 # time slices plotted again when resuming a path
 
 MICROSTEPPING_MODE = 1
 STEP_DIVIDER = 2 ** (MICROSTEPPING_MODE - 1)
@@ -41,6 +44,27 @@ def find_port():
             return port[0]
     return None
 
+def plan_steps(plan, steps_per_unit, error=(0, 0), start=0):
+    # compiles a plan into time slices of TIMESLICE_MS beginning with slice
+    # start. yields (number of slices done, x steps, y steps, accumulated
+    # step error) per slice
+    step_s = TIMESLICE_MS / 1000
+    ex, ey = error
+    i = start
+    t = i * step_s
+    while t < plan.t:
+        i1 = plan.instant(t)
+        i2 = plan.instant(t + step_s)
+        d = i2.p.sub(i1.p)
+        ex, sx = modf(d.x * steps_per_unit + ex)
+        ey, sy = modf(d.y * steps_per_unit + ey)
+        i += 1
+        t = i * step_s
+        yield i, int(sx), int(sy), (ex, ey)
+
+def wait_for_pen_change(layer, name):
+    input('change the pen for layer %s and press enter' % (name or layer))
+
 class Device(object):
     def __init__(self, **kwargs):
         self.steps_per_unit = STEPS_PER_INCH
@@ -148,20 +172,15 @@ class Device(object):
         while '1' in self.motor_status():
             time.sleep(0.01)
 
-    def run_plan(self, plan):
-        step_ms = TIMESLICE_MS
-        step_s = step_ms / 1000
-        t = 0
-        while t < plan.t:
-            i1 = plan.instant(t)
-            i2 = plan.instant(t + step_s)
-            d = i2.p.sub(i1.p)
-            ex, ey = self.error
-            ex, sx = modf(d.x * self.steps_per_unit + ex)
-            ey, sy = modf(d.y * self.steps_per_unit + ey)
-            self.error = ex, ey
-            self.stepper_move(step_ms, int(sx), int(sy))
-            t += step_s
+    def run_plan(self, plan, start=0, callback=None):
+        # sends the plan in time slices beginning with slice start, callback
+        # is called with the number of slices sent after each one
+        steps = plan_steps(plan, self.steps_per_unit, self.error, start)
+        for i, sx, sy, error in steps:
+            self.error = error
+            self.stepper_move(TIMESLICE_MS, sx, sy)
+            if callback:
+                callback(i)
         # self.wait()
 
     def run_path(self, path, jog=False):
@@ -169,26 +188,129 @@ class Device(object):
         plan = planner.plan(path)
         self.run_plan(plan)
 
-    def run_drawing(self, drawing, progress=True):
-        print('number of paths : %d' % len(drawing.paths))
+    def run_drawing(self, drawing, progress=True, checkpoint=None,
+            resume=False, control=None, pen_change=wait_for_pen_change,
+            plans=None):
+        # with a checkpoint filename the progress is saved periodically. with
+        # resume the device goes home, the paths that were completed are
+        # skipped and the interrupted path continues where it stopped.
+        # control is an optional job.PlotControl to pause or cancel the plot.
+        # progress is a bool or a progress sink like progress.StatusSink.
+        # when the layer changes between paths, the device goes home and
+        # pen_change is called with the layer and its name. plans optionally
+        # holds the plans of drawing.all_paths, made with this device's
+        # settings, so that the paths are not planned again
+        print('number of paths : %d' % drawing.count)
         print('pen down length : %g' % drawing.down_length)
         print('pen up length   : %g' % drawing.up_length)
         print('total length    : %g' % drawing.length)
         print('drawing bounds  : %s' % str(drawing.bounds))
+        if checkpoint is not None:
+            checkpoint = Checkpoint(checkpoint, drawing)
+        first, first_slice = 0, 0
+        if resume and checkpoint is not None:
+            first, first_slice = checkpoint.load()
+            if first or first_slice:
+                print('resuming at path %d' % first)
         self.pen_up()
+        if first or first_slice:
+            self.home()
+            self.error = (0, 0)
+        # the progress is measured in planned seconds
+        estimate = self.estimate(drawing)
+        pen_time = estimate.pen_time / max(len(estimate.path_times), 1)
+        ends = np.cumsum(
+            estimate.jog_times[:-1] + pen_time + estimate.path_times)
+        sink = None if isinstance(progress, bool) else progress
+        bar = TimeBar(estimate.time, enabled=bool(progress), sink=sink)
+        count = drawing.count
+        layers = drawing.layers
+        names = drawing.paths.meta.get('layers', []) if layers is not None else []
+        # a resumed plot asks for the pen of the layer it continues with
+        resumed = (first or first_slice) and layers is not None and \
+            layers.min() != layers.max()
+        # the paths are read a chunk at a time, a lazy drawing is not loaded
+        paths = (path for chunk in drawing.chunks() for path in chunk)
         position = (0, 0)
-        bar = Bar(drawing.length, enabled=progress)
-        for path in drawing.paths:
-            jog = [position, path[0]]
-            self.run_path(jog, jog=True)
-            bar.increment(path_length(jog))
-            self.pen_down()
-            self.run_path(path)
-            self.pen_up()
-            position = path[-1]
-            bar.increment(path_length(path))
+        try:
+            for index, path in enumerate(paths):
+                if index < first:
+                    # already plotted
+                    bar.skip(ends[index] - bar.value)
+                    continue
+                if index == first and resumed or \
+                        layers is not None and index > first and \
+                        layers[index] != layers[index - 1]:
+                    layer = int(layers[index])
+                    name = names[layer] if layer < len(names) else None
+                    bar.message = 'changing pen for layer %s' % (name or layer)
+                    bar.update(bar.value, force=True)
+                    self.run_path([position, (0, 0)], jog=True)
+                    position = (0, 0)
+                    waited = time.time()
+                    pen_change(layer, name)
+                    # waiting for the pen does not count for the eta
+                    bar.start_time += time.time() - waited
+                bar.message = 'path %d of %d' % (index + 1, count)
+                if control is not None:
+                    control.path = index
+                    waited = time.time()
+                    control.check()
+                    bar.start_time += time.time() - waited
+                if plans is not None:
+                    plan = plans[2 * index + 1]
+                else:
+                    plan = self.make_planner().plan(path)
+                start = 0
+                target = path[0]
+                if index == first and first_slice:
+                    # slices may still have been queued on the device when
+                    # it was interrupted, so back up a little
+                    start = max(first_slice - RESUME_OVERLAP, 0)
+                    p = plan.instant(start * TIMESLICE_MS / 1000).p
+                    target = (p.x, p.y)
+                self.run_path([position, target], jog=True)
+                self.pen_down()
+                bar.increment(estimate.jog_times[index] + pen_time)
+                self.run_plan(plan, start, self._slice_callback(
+                    index, ends[index], bar, checkpoint, control))
+                self.pen_up()
+                if checkpoint is not None:
+                    checkpoint.update(index + 1, 0, force=True)
+                position = path[-1]
+                bar.update(ends[index])
+        except Exception as e:
+            bar.stop()
+            # keep the checkpoint to resume from
+            if checkpoint is not None:
+                checkpoint.save()
+            if isinstance(e, Cancelled):
+                self.pen_up()
+                self.home()
+            raise
         bar.done()
         self.run_path([position, (0, 0)], jog=True)
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    def _slice_callback(self, index, end, bar, checkpoint, control):
+        step_s = TIMESLICE_MS / 1000
+        def callback(i):
+            bar.update(min(bar.value + step_s, end))
+            if checkpoint is not None:
+                checkpoint.update(index, i)
+            if control is not None:
+                control.check_cancelled()
+        return callback
+
+    def estimate(self, drawing):
+        # estimates the plot with the settings of this device. imported here
+        # as the estimate module uses the defaults defined in this one
+        from .estimate import Estimator
+        estimator = Estimator()
+        for k in vars(estimator):
+            setattr(estimator, k, getattr(self, k))
+        return estimator.estimate(drawing)
 
     def plan_drawing(self, drawing):
         result = []
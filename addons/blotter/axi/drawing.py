@@ -1,10 +1,17 @@
 from __future__ import division
 
-from math import sin, cos, radians, hypot
+import io
+import numpy as np
 
+from math import sin, cos, radians
+
+from . import raster
+from .packed import (
+    PackedPaths, pack_paths, dump_packed, load_packed, is_binary)
+from .svg import read_svg, write_svg
 from .paths import (
-    simplify_paths, sort_paths, join_paths, crop_paths, convex_hull,
-    expand_quadratics, paths_length)
+    simplify_paths, sort_paths, join_paths, crop_packed, convex_hull,
+    remove_duplicates, read_packed, concat_packed, PathReader)
 
 try:
     import cairocffi as cairo
@@ -19,33 +26,41 @@ A3_BOUNDS = (0, 0, 16.93, 11.69)
 
 class Drawing(object):
     def __init__(self, paths=None):
-        self.paths = paths or []
+        self.paths = paths if paths is not None else []
         self.dirty()
 
     def dirty(self):
         self._bounds = None
+        self._count = None
         self._length = None
         self._down_length = None
         self._hull = None
+        self._packed = None
 
     @classmethod
     def loads(cls, data):
-        paths = []
-        for line in data.split('\n'):
-            line = line.strip()
-            if line.startswith('#'):
-                continue
-            path = line.split()
-            path = [tuple(map(float, x.split(','))) for x in path]
-            path = expand_quadratics(path)
-            if path:
-                paths.append(path)
-        return cls(paths)
+        return cls(concat_packed(read_packed(io.StringIO(data))))
 
     @classmethod
-    def load(cls, filename):
+    def load(cls, filename, lazy=False):
+        # a lazy drawing parses the file again whenever its paths are
+        # iterated instead of holding them in memory
+        if is_binary(filename):
+            return cls.load_binary(filename)
+        if filename.lower().endswith('.svg'):
+            return cls.load_svg(filename)
+        if lazy:
+            return cls(PathReader(filename))
         with open(filename, 'r') as fp:
-            return cls.loads(fp.read())
+            return cls(concat_packed(read_packed(fp)))
+
+    @classmethod
+    def load_binary(cls, filename, use_mmap=True):
+        return cls(load_packed(filename, use_mmap))
+
+    @classmethod
+    def load_svg(cls, filename, tolerance=0.001):
+        return cls(read_svg(filename, tolerance))
 
     def dumps(self):
         lines = []
@@ -57,27 +72,34 @@ class Drawing(object):
         with open(filename, 'w') as fp:
             fp.write(self.dumps())
 
-    def dumps_svg(self, scale=96):
-        lines = []
-        w = (self.width + 2) * scale
-        h = (self.height + 2) * scale
-        lines.append('<svg xmlns="http://www.w3.org/2000/svg" version="1.1" width="%g" height="%g">' % (w, h))
-        lines.append('<g transform="scale(%g) translate(1 1)">' % scale)
-        for path in self.paths:
-            p = []
-            c = 'M'
-            for x, y in path:
-                p.append('%s%g %g' % (c, x, y))
-                c = 'L'
-            d = ' '.join(p)
-            lines.append('<path d="%s" fill="none" stroke="black" stroke-width="0.01" stroke-linecap="round" stroke-linejoin="round" />' % d)
-        lines.append('</g>')
-        lines.append('</svg>')
-        return '\n'.join(lines)
+    def dump_binary(self, filename, dtype=np.float64):
+        with open(filename, 'wb') as fp:
+            dump_packed(self.packed, fp, dtype)
 
-    def dump_svg(self, filename):
+    def dumps_svg(self, scale=96, **kwargs):
+        fp = io.StringIO()
+        write_svg(fp, self.packed, self.bounds, scale, **kwargs)
+        return fp.getvalue()
+
+    def dump_svg(self, filename, scale=96, **kwargs):
+        # see svg.write_svg for the precision, relative, travel and style
+        # options
         with open(filename, 'w') as fp:
-            fp.write(self.dumps_svg())
+            write_svg(fp, self.packed, self.bounds, scale, **kwargs)
+
+    @property
+    def packed(self):
+        if self._packed is None:
+            if isinstance(self.paths, PathReader):
+                self._packed = self.paths.load()
+            else:
+                self._packed = pack_paths(self.paths)
+        return self._packed
+
+    def chunks(self):
+        if isinstance(self.paths, PathReader) and self._packed is None:
+            return self.paths.chunks()
+        return [self.packed]
 
     @property
     def points(self):
@@ -89,29 +111,58 @@ class Drawing(object):
             self._hull = convex_hull(self.points)
         return self._hull
 
+    def _measure(self):
+        # bounds, lengths and number of paths in a single pass over the
+        # chunks, so that a lazy drawing is parsed only once for all of them
+        lo = []
+        hi = []
+        count = 0
+        down_length = 0
+        up_length = 0
+        previous = None
+        for chunk in self.chunks():
+            if not len(chunk):
+                continue
+            count += len(chunk)
+            lo.append(chunk.coords.min(axis=0))
+            hi.append(chunk.coords.max(axis=0))
+            down_length += chunk.path_lengths().sum()
+            starts = chunk.coords[chunk.starts]
+            ends = chunk.coords[chunk.ends]
+            if previous is not None:
+                ends = np.vstack([previous, ends])
+            else:
+                starts = starts[1:]
+            previous = ends[-1:]
+            d = starts - ends[:-1]
+            up_length += np.hypot(d[:, 0], d[:, 1]).sum()
+        if lo:
+            x1, y1 = np.min(lo, axis=0).tolist()
+            x2, y2 = np.max(hi, axis=0).tolist()
+        else:
+            x1 = x2 = y1 = y2 = 0
+        self._bounds = (x1, y1, x2, y2)
+        self._count = count
+        self._down_length = float(down_length)
+        self._length = float(down_length + up_length)
+
     @property
     def bounds(self):
         if self._bounds is None:
-            points = self.points
-            if points:
-                x1 = min(x for x, y in points)
-                x2 = max(x for x, y in points)
-                y1 = min(y for x, y in points)
-                y2 = max(y for x, y in points)
-            else:
-                x1 = x2 = y1 = y2 = 0
-            self._bounds = (x1, y1, x2, y2)
+            self._measure()
         return self._bounds
 
+    @property
+    def count(self):
+        # the number of paths, without parsing a lazy drawing again
+        if self._count is None:
+            self._measure()
+        return self._count
+
     @property
     def length(self):
         if self._length is None:
-            length = self.down_length
-            for p0, p1 in zip(self.paths, self.paths[1:]):
-                x0, y0 = p0[-1]
-                x1, y1 = p1[0]
-                length += hypot(x1 - x0, y1 - y0)
-            self._length = length
+            self._measure()
         return self._length
 
     @property
@@ -121,7 +172,7 @@ class Drawing(object):
     @property
     def down_length(self):
         if self._down_length is None:
-            self._down_length = paths_length(self.paths)
+            self._measure()
         return self._down_length
 
     @property
@@ -149,46 +200,132 @@ class Drawing(object):
         result.append([position, (0, 0)])
         return result
 
+    # layers: a drawing with packed paths may carry a layer (pen) per path.
+    # the path operations below work on each layer separately and return
+    # the layers in ascending order, so that every layer is plotted at once
+
+    @property
+    def layers(self):
+        if isinstance(self.paths, PackedPaths):
+            return self.paths.layers
+        return None
+
+    def split_layers(self):
+        # returns a list of (layer, drawing without layers) tuples
+        packed = self.packed
+        if packed.layers is None:
+            return [(0, Drawing(PackedPaths(packed.coords, packed.offsets)))]
+        result = []
+        for layer in np.unique(packed.layers).tolist():
+            p = packed.select(np.flatnonzero(packed.layers == layer))
+            result.append((layer, Drawing(PackedPaths(p.coords, p.offsets))))
+        return result
+
+    @classmethod
+    def merge_layers(cls, layers, meta=None):
+        # the inverse of split_layers
+        chunks = []
+        for layer, drawing in layers:
+            p = drawing.packed
+            chunks.append(PackedPaths(p.coords, p.offsets,
+                np.full(len(p), layer, dtype=np.int32)))
+        packed = concat_packed(chunks)
+        packed.meta = meta or {}
+        return cls(packed)
+
+    def group_layers(self):
+        # stable sort of the paths by layer, so that each pen is used once
+        if self.layers is None:
+            return self
+        layers = self.layers
+        if np.all(layers[1:] >= layers[:-1]):
+            return self
+        packed = self.packed.select(np.argsort(layers, kind='stable'))
+        return Drawing(packed)
+
+    def map_layers(self, func):
+        # applies func to a drawing of each layer
+        if self.layers is None:
+            return func(self)
+        layers = [(layer, func(d)) for layer, d in self.split_layers()]
+        return Drawing.merge_layers(layers, self.paths.meta)
+
     def simplify_paths(self, tolerance):
-        return Drawing(simplify_paths(self.paths, tolerance))
+        return self.map_layers(
+            lambda d: Drawing(simplify_paths(d.paths, tolerance)))
 
     def sort_paths(self, reversable=True):
-        return Drawing(sort_paths(self.paths, reversable))
+        return self.map_layers(
+            lambda d: Drawing(sort_paths(d.paths, reversable)))
 
     def join_paths(self, tolerance):
-        return Drawing(join_paths(self.paths, tolerance))
+        return self.map_layers(
+            lambda d: Drawing(join_paths(d.paths, tolerance)))
 
     def crop_paths(self, x1, y1, x2, y2):
-        return Drawing(crop_paths(self.paths, x1, y1, x2, y2))
+        return Drawing(crop_packed(self.packed, x1, y1, x2, y2))
 
-    # def remove_duplicates(self):
-    #     return Drawing(util.remove_duplicates(self.paths))
+    def remove_duplicates(self):
+        return self.map_layers(
+            lambda d: Drawing(remove_duplicates(d.paths)))
 
     def add(self, drawing):
-        self.paths.extend(drawing.paths)
+        if isinstance(self.paths, list) and isinstance(drawing.paths, list):
+            self.paths.extend(drawing.paths)
+        else:
+            # packed paths are concatenated to keep their layers, the layers
+            # of the added drawing are renumbered by name
+            a = self.packed
+            b = drawing.packed
+            names = list(a.meta.get('layers', []))
+            layers = b.layers
+            if layers is not None and b.meta.get('layers'):
+                for name in b.meta['layers']:
+                    if name not in names:
+                        names.append(name)
+                index = [names.index(name) for name in b.meta['layers']]
+                layers = np.array(index, dtype=np.int32)[layers]
+            meta = dict(b.meta)
+            meta.update(a.meta)
+            if names:
+                meta['layers'] = names
+            packed = concat_packed([
+                PackedPaths(a.coords, a.offsets, a.layers),
+                PackedPaths(b.coords, b.offsets, layers)])
+            packed.meta = meta
+            self.paths = packed
         self.dirty()
 
     def transform(self, func):
-        return Drawing([[func(x, y) for x, y in path] for path in self.paths])
+        # applies func(x, y) to every point, keeps layers and metadata
+        packed = self.packed
+        coords = np.array(
+            [func(x, y) for x, y in packed.coords.tolist()],
+            dtype=np.float64).reshape(-1, 2)
+        return Drawing(PackedPaths(
+            coords, packed.offsets, packed.layers, packed.meta))
+
+    def affine(self, a, b, c, d, e=0, f=0):
+        # maps (x, y) to (a x + b y + e, c x + d y + f) on the packed
+        # coordinates, keeps layers and metadata
+        packed = self.packed
+        m = np.array([[a, c], [b, d]], dtype=np.float64)
+        coords = np.dot(packed.coords, m) + (e, f)
+        return Drawing(PackedPaths(
+            coords, packed.offsets, packed.layers, packed.meta))
 
     def translate(self, dx, dy):
-        def func(x, y):
-            return (x + dx, y + dy)
-        return self.transform(func)
+        return self.affine(1, 0, 0, 1, dx, dy)
 
     def scale(self, sx, sy=None):
         if sy is None:
             sy = sx
-        def func(x, y):
-            return (x * sx, y * sy)
-        return self.transform(func)
+        return self.affine(sx, 0, 0, sy)
 
     def rotate(self, angle):
         c = cos(radians(angle))
         s = sin(radians(angle))
-        def func(x, y):
-            return (x * c - y * s, y * c + x * s)
-        return self.transform(func)
+        return self.affine(c, -s, s, c)
 
     def move(self, x, y, ax, ay):
         x1, y1, x2, y2 = self.bounds
@@ -235,16 +372,26 @@ class Drawing(object):
 
     def remove_paths_outside(self, width, height):
         e = 1e-8
-        paths = []
-        for path in self.paths:
-            ok = True
-            for x, y in path:
-                if x < -e or y < -e or x > width + e or y > height + e:
-                    ok = False
-                    break
-            if ok:
-                paths.append(path)
-        return Drawing(paths)
+        packed = self.packed
+        x1, y1, x2, y2 = packed.path_bounds().T
+        inside = (x1 >= -e) & (y1 >= -e) & \
+            (x2 <= width + e) & (y2 <= height + e)
+        return Drawing(packed.select(np.flatnonzero(inside)))
+
+    def render_preview(self, scale=109, margin=1, line_width=0.35/25.4,
+            bounds=None, show_bounds=True, lod=True):
+        # numpy based alternative to render() that does not need cairo.
+        # with lod, points closer than a pixel are dropped before drawing.
+        return raster.render(self.packed, bounds or self.bounds, scale,
+            margin, line_width, show_bounds, lod)
+
+    def render_tiled(self, filename, scale=109, margin=1,
+            line_width=0.35/25.4, bounds=None, show_bounds=True, lod=True,
+            tile_size=1024, processes=None):
+        # renders large previews straight to a png file, tile by tile in a
+        # process pool
+        raster.render_tiled(self.packed, bounds or self.bounds, filename,
+            scale, margin, line_width, show_bounds, lod, tile_size, processes)
 
     def render(self, scale=109, margin=1, line_width=0.35/25.4,
             bounds=None, show_bounds=True):
@@ -0,0 +1,104 @@
+from __future__ import division
+
+import numpy as np
+
+from collections import namedtuple
+
+from .device import (
+    ACCELERATION, MAX_VELOCITY, CORNER_FACTOR,
+    JOG_ACCELERATION, JOG_MAX_VELOCITY,
+    PEN_UP_POSITION, PEN_UP_SPEED, PEN_UP_DELAY,
+    PEN_DOWN_POSITION, PEN_DOWN_SPEED, PEN_DOWN_DELAY)
+from .planner import Planner, estimate_path_times, profile_times
+
+# all times are in seconds. path_times holds the pen down time of each path,
+# jog_times the pen up travel before each path plus the final move home.
+Estimate = namedtuple('Estimate', [
+    'time', 'down_time', 'up_time', 'pen_time', 'path_times', 'jog_times'])
+
+# estimates how long a drawing takes to plot without connecting to a device.
+# the settings have the same names and defaults as the Device attributes.
+class Estimator(object):
+    def __init__(self, **kwargs):
+        self.acceleration = ACCELERATION
+        self.max_velocity = MAX_VELOCITY
+        self.corner_factor = CORNER_FACTOR
+        self.jog_acceleration = JOG_ACCELERATION
+        self.jog_max_velocity = JOG_MAX_VELOCITY
+        self.pen_up_position = PEN_UP_POSITION
+        self.pen_up_speed = PEN_UP_SPEED
+        self.pen_up_delay = PEN_UP_DELAY
+        self.pen_down_position = PEN_DOWN_POSITION
+        self.pen_down_speed = PEN_DOWN_SPEED
+        self.pen_down_delay = PEN_DOWN_DELAY
+
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    def make_planner(self, jog=False):
+        a = self.acceleration
+        vmax = self.max_velocity
+        cf = self.corner_factor
+        if jog:
+            a = self.jog_acceleration
+            vmax = self.jog_max_velocity
+        return Planner(a, vmax, cf)
+
+    # servo durations as commanded by Device.pen_up and Device.pen_down
+    def pen_up_time(self):
+        delta = abs(self.pen_up_position - self.pen_down_position)
+        duration = int(1000 * delta / self.pen_up_speed)
+        return max(0, duration + self.pen_up_delay) / 1000
+
+    def pen_down_time(self):
+        delta = abs(self.pen_up_position - self.pen_down_position)
+        duration = int(1000 * delta / self.pen_down_speed)
+        return max(0, duration + self.pen_down_delay) / 1000
+
+    def path_times(self, packed):
+        return estimate_path_times(
+            packed, self.acceleration, self.max_velocity, self.corner_factor)
+
+    def jog_times(self, packed):
+        return self._jog_times(_jog_distances(packed, np.zeros((1, 2)), True))
+
+    def _jog_times(self, s):
+        return profile_times(
+            s, 0, 0, self.jog_acceleration, self.jog_max_velocity)
+
+    def estimate(self, drawing):
+        # works through the chunks of the drawing, so that a lazy drawing is
+        # not loaded at once
+        path_times = [np.zeros(0)]
+        distances = []
+        position = np.zeros((1, 2))
+        for chunk in drawing.chunks():
+            if not len(chunk):
+                continue
+            path_times.append(self.path_times(chunk))
+            distances.append(_jog_distances(chunk, position))
+            position = chunk.coords[chunk.ends[-1:]]
+        distances.append(np.hypot(position[:, 0], position[:, 1]))
+        path_times = np.concatenate(path_times)
+        jog_times = self._jog_times(np.concatenate(distances))
+        pen_time = len(path_times) * (
+            self.pen_up_time() + self.pen_down_time())
+        down_time = float(path_times.sum())
+        up_time = float(jog_times.sum())
+        return Estimate(
+            down_time + up_time + pen_time, down_time, up_time, pen_time,
+            path_times, jog_times)
+
+def _jog_distances(packed, position, home=False):
+    # pen up travel from position to each path, and back to the origin
+    # after the last one with home
+    p1 = np.vstack([position, packed.coords[packed.ends]])
+    p2 = np.vstack([packed.coords[packed.starts], np.zeros((1, 2))])
+    if not home:
+        p1 = p1[:-1]
+        p2 = p2[:-1]
+    d = p2 - p1
+    return np.hypot(d[:, 0], d[:, 1])
+
+def estimate(drawing, **kwargs):
+    return Estimator(**kwargs).estimate(drawing)
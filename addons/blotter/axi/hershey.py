@@ -1,90 +1,428 @@
 from __future__ import division
 
 from .drawing import Drawing
-from .hershey_fonts import *
+from .packed import pack_arrays
+from .paths import join_packed
 
 import itertools
-import string
+import numpy as np
 
-def text(string, font=FUTURAL, spacing=0, extra=0):
+from math import hypot
+
+# the font data is memory mapped from hershey_fonts.bin when a font is first
+# used and glyphs are only decoded when they are drawn
+FONT_NAMES = [
+    'ASTROLOGY', 'CURSIVE', 'CYRILC_1', 'CYRILLIC', 'FUTURAL', 'FUTURAM',
+    'GOTHGBT', 'GOTHGRT', 'GOTHICENG', 'GOTHICGER', 'GOTHICITA', 'GOTHITT',
+    'GREEK', 'GREEKC', 'GREEKS', 'JAPANESE', 'MARKERS', 'MATHLOW', 'MATHUPP',
+    'METEOROLOGY', 'MUSIC', 'ROWMAND', 'ROWMANS', 'ROWMANT', 'SCRIPTC',
+    'SCRIPTS', 'SYMBOLIC', 'TIMESG', 'TIMESI', 'TIMESIB', 'TIMESR', 'TIMESRB',
+]
+
+def get_font(name):
+    if name not in FONT_NAMES:
+        raise Exception('unknown font: %s' % name)
+    from .hershey_fonts import font_file
+    return font_file().fonts[name]
+
+def __getattr__(name):
+    if name in FONT_NAMES:
+        return get_font(name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+# glyphs with up to this many strokes are ordered by an exhaustive search
+MAX_EXACT_STROKES = 7
+
+def _order_strokes(paths, advance, reverse=False):
+    # orders and orients the strokes of a glyph for the least pen up travel
+    # from its left side to its right side, or the other way around if
+    # reverse is set, then joins strokes that touch
+    start, end = (0, 0), (advance, 0)
+    if reverse:
+        start, end = end, start
+    n = len(paths)
+    if n == 0:
+        return []
+    # oriented stroke (i, o) starts at heads[i][o] and ends at heads[i][1 - o]
+    heads = [(path[0], path[-1]) for path in paths]
+    def distance(p, q):
+        return hypot(q[0] - p[0], q[1] - p[1])
+    if n <= MAX_EXACT_STROKES:
+        # held-karp over the visited strokes and the last oriented stroke
+        best = {}
+        for i in range(n):
+            for o in (0, 1):
+                best[(1 << i, i, o)] = (distance(start, heads[i][o]), None)
+        for mask in range(1, 1 << n):
+            for i in range(n):
+                for o in (0, 1):
+                    key = (mask, i, o)
+                    if key not in best:
+                        continue
+                    cost = best[key][0]
+                    p = heads[i][1 - o]
+                    for j in range(n):
+                        if mask & (1 << j):
+                            continue
+                        for q in (0, 1):
+                            c = cost + distance(p, heads[j][q])
+                            k = (mask | (1 << j), j, q)
+                            if k not in best or c < best[k][0]:
+                                best[k] = (c, key)
+        full = (1 << n) - 1
+        keys = [(full, i, o) for i in range(n) for o in (0, 1)]
+        key = min(keys, key=lambda k:
+            best[k][0] + distance(heads[k[1]][1 - k[2]], end))
+        order = []
+        while key is not None:
+            order.append(key[1:])
+            key = best[key][1]
+        order.reverse()
+    else:
+        # nearest neighbor
+        order = []
+        remaining = set(range(n))
+        p = start
+        while remaining:
+            i, o = min(((i, o) for i in remaining for o in (0, 1)),
+                key=lambda k: distance(p, heads[k[0]][k[1]]))
+            remaining.remove(i)
+            order.append((i, o))
+            p = heads[i][1 - o]
     result = []
-    x = 0
-    for ch in string:
-        index = ord(ch) - 32
-        if index < 0 or index >= 96:
-            x += spacing
+    for i, o in order:
+        path = paths[i][::-1] if o else list(paths[i])
+        if result and result[-1][-1] == path[0]:
+            result[-1].extend(path[1:])
+        else:
+            result.append(path)
+    return result
+
+class Glyphs(object):
+    # the printable glyphs of a font moved to start at x = 0, with their
+    # advance widths and ink bounds. computed once per font by get_glyphs so
+    # that text can be laid out and measured without rendering it.
+    def __init__(self, font):
+        self.font = font
+        self.paths = []
+        self.advances = np.zeros(96)
+        self.bounds = np.zeros((96, 4))
+        self.inked = np.zeros(96, dtype=bool)
+        for index in range(96):
+            lt, rt, coords = font[index]
+            paths = [[(i - lt, j) for i, j in path] for path in coords if path]
+            self.paths.append(paths)
+            self.advances[index] = rt - lt
+            points = [p for path in paths for p in path]
+            if points:
+                xs, ys = zip(*points)
+                self.bounds[index] = (min(xs), min(ys), max(xs), max(ys))
+                self.inked[index] = True
+        # all glyph paths packed, glyph i has paths first[i]:first[i + 1]
+        self.packed = pack_arrays([
+            np.array(path, dtype=np.float64)
+            for paths in self.paths for path in paths])
+        self.first = np.zeros(97, dtype=np.int64)
+        np.cumsum([len(paths) for paths in self.paths], out=self.first[1:])
+        self._ordered = None
+        # height of all of string.printable, which excludes the last glyph
+        inked = self.inked.copy()
+        inked[95] = False
+        bounds = self.bounds[inked]
+        self.height = float(bounds[:, 3].max() - bounds[:, 1].min())
+
+    def layout(self, string, spacing=0, extra=0):
+        # glyph index of each character, -1 for characters without a glyph,
+        # and the x offset of each character followed by the end position
+        codes = np.frombuffer(string.encode('utf-32-le'), dtype='<u4')
+        index = codes.astype(np.int64) - 32
+        index[(index < 0) | (index >= 96)] = -1
+        advances = np.where(index >= 0, self.advances[index], 0) + spacing
+        if extra:
+            advances[index == 0] += extra
+        x = np.zeros(len(index) + 1)
+        np.cumsum(advances, out=x[1:])
+        return index, x
+
+    def measure(self, string, spacing=0, extra=0):
+        # ink bounds (x1, y1, x2, y2) of string and its advance width. the
+        # bounds are (inf, inf, -inf, -inf) if nothing would be drawn.
+        index, offsets = self.layout(string, spacing, extra)
+        return self.extent(index, offsets), offsets[-1]
+
+    def drawn(self, index):
+        # mask of the characters of a layout that draw something
+        drawn = index >= 0
+        drawn[drawn] = self.inked[index[drawn]]
+        return drawn
+
+    def extent(self, index, offsets):
+        # ink bounds of a layout
+        drawn = self.drawn(index)
+        if not drawn.any():
+            return (np.inf, np.inf, -np.inf, -np.inf)
+        bounds = self.bounds[index[drawn]]
+        x = offsets[:-1][drawn]
+        x1 = (x + bounds[:, 0]).min()
+        x2 = (x + bounds[:, 2]).max()
+        y1 = bounds[:, 1].min()
+        y2 = bounds[:, 3].max()
+        return (x1, y1, x2, y2)
+
+    @property
+    def ordered(self):
+        # the glyphs with their strokes ordered by _order_strokes, drawn
+        # from left to right as glyphs 0-95 and from right to left as glyphs
+        # 96-191. computed on first use.
+        if self._ordered is None:
+            arrays = []
+            counts = []
+            for reverse in (False, True):
+                for paths, advance in zip(self.paths, self.advances):
+                    paths = _order_strokes(paths, advance, reverse)
+                    arrays.extend(np.array(p, dtype=np.float64) for p in paths)
+                    counts.append(len(paths))
+            first = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=first[1:])
+            self._ordered = (pack_arrays(arrays), first)
+        return self._ordered
+
+    def pack(self, index, x, y, scale, reverse=None):
+        # packs glyph instances, glyph index[i] scaled by scale[i] and moved
+        # by (x[i], y[i]), into a single PackedPaths in one pass. with
+        # reverse the ordered strokes are used, drawn from right to left
+        # where reverse[i] is set.
+        if reverse is None:
+            table, first = self.packed, self.first
+        else:
+            table, first = self.ordered
+            index = index + 96 * reverse
+        paths = first[index + 1] - first[index]
+        ends = np.cumsum(paths)
+        ids = np.arange(ends[-1] if len(ends) else 0) - \
+            np.repeat(ends - paths - first[index], paths)
+        packed = table.select(ids)
+        owner = np.repeat(np.arange(len(index)), paths)
+        owner = np.repeat(owner, packed.counts)
+        coords = packed.coords * scale[owner, None]
+        coords[:, 0] += x[owner]
+        coords[:, 1] += y[owner]
+        packed.coords = coords
+        return packed
+
+_glyphs = {}
+
+def get_glyphs(font):
+    # font is the glyph data of a font or its name
+    if isinstance(font, str):
+        font = get_font(font)
+    glyphs = _glyphs.get(id(font))
+    if glyphs is None:
+        # the entry keeps the font alive, so its id is not reused
+        glyphs = _glyphs[id(font)] = Glyphs(font)
+    return glyphs
+
+def text(string, font=None, spacing=0, extra=0, optimize=False):
+    # font is the glyph data of a font or its name, FUTURAL by default. with
+    # optimize the strokes are ordered for less pen up travel and joined.
+    if font is None:
+        font = 'FUTURAL'
+    glyphs = get_glyphs(font)
+    index, offsets = glyphs.layout(string, spacing, extra)
+    if optimize:
+        layout = TextLayout(glyphs)
+        layout.add(index, offsets)
+        return list(layout.drawing(optimize=True).paths)
+    result = []
+    for i, x in zip(index.tolist(), offsets.tolist()):
+        if i < 0:
             continue
-        lt, rt, coords = font[index]
-        for path in coords:
-            path = [(x + i - lt, j) for i, j in path]
-            if path:
-                result.append(path)
-        x += rt - lt + spacing
-        if index == 0:
-            x += extra
+        for path in glyphs.paths[i]:
+            result.append([(x + u, v) for u, v in path])
     return result
 
-def _word_wrap(text, width, measure_func):
+def _word_wrap(text, width, glyphs, scale=1):
+    # greedy wrapping on the ink width of the lines. the ink extent of all
+    # words of a paragraph is computed at once from the glyph bounds, so the
+    # time is linear in the length of the text.
     result = []
     for line in text.split('\n'):
         fields = itertools.groupby(line, lambda x: x.isspace())
         fields = [''.join(g) for _, g in fields]
+        if not fields:
+            continue
         if len(fields) % 2 == 1:
             fields.append('')
+        # whitespace has no ink, so the ink of a word reaches up to the
+        # start of the next one
+        index, offsets = glyphs.layout(line)
+        drawn = glyphs.drawn(index)
+        lo = np.where(drawn, offsets[:-1] + glyphs.bounds[index, 0], np.inf)
+        hi = np.where(drawn, offsets[:-1] + glyphs.bounds[index, 2], -np.inf)
+        starts = np.cumsum([0] + [len(f) for f in fields[:-1]])[::2]
+        lo = np.minimum.reduceat(lo, starts).tolist()
+        hi = np.maximum.reduceat(hi, starts).tolist()
         x = ''
-        for a, b in zip(fields[::2], fields[1::2]):
-            w, _ = measure_func(x + a)
-            if w > width:
+        left, right = np.inf, -np.inf
+        for a, b, x1, x2 in zip(fields[::2], fields[1::2], lo, hi):
+            if (max(right, x2) - min(left, x1)) * scale > width:
                 if x == '':
                     result.append(a)
                     continue
                 else:
                     result.append(x)
                     x = ''
+                    left, right = np.inf, -np.inf
+            left = min(left, x1)
+            right = max(right, x2)
             x += a + b
         if x != '':
             result.append(x)
     result = [x.strip() for x in result]
     return result
 
+RECORD = np.dtype([
+    ('glyph', np.int32), ('x', np.float64), ('y', np.float64),
+    ('scale', np.float64), ('page', np.int32), ('line', np.int32)])
+
+# glyphs whose strokes end and start within this distance, relative to the
+# glyph scale, are joined into one path when optimizing
+JOIN_TOLERANCE = 1e-6
+
+class TextLayout(object):
+    # laid out text as glyph instance records: glyph index, offset, scale
+    # and the page the glyph is on. only glyphs that draw something are
+    # recorded, nothing is drawn until the pages are packed by drawing.
+    def __init__(self, glyphs):
+        self.glyphs = glyphs
+        self.chunks = []
+        self._records = None
+
+    def add(self, index, offsets, x=0, y=0, scale=1, page=0, line=0):
+        # adds a line laid out by Glyphs.layout, starting at (x, y)
+        drawn = self.glyphs.drawn(index)
+        records = np.zeros(np.count_nonzero(drawn), dtype=RECORD)
+        records['glyph'] = index[drawn]
+        records['x'] = offsets[:-1][drawn] * scale + x
+        records['y'] = y
+        records['scale'] = scale
+        records['page'] = page
+        records['line'] = line
+        self.chunks.append(records)
+        self._records = None
+
+    @property
+    def records(self):
+        if self._records is None:
+            if self.chunks:
+                self._records = np.concatenate(self.chunks)
+            else:
+                self._records = np.zeros(0, dtype=RECORD)
+            self.chunks = [self._records]
+        return self._records
+
+    @property
+    def pages(self):
+        records = self.records
+        return int(records['page'].max()) + 1 if len(records) else 0
+
+    def drawing(self, page=None, optimize=False):
+        # the glyphs of a page, or of all pages on top of each other. with
+        # optimize the glyphs use their ordered strokes, odd lines are drawn
+        # from right to left and touching strokes of neighbors are joined,
+        # so no global sort is needed.
+        records = self.records
+        if page is not None:
+            # lines are added page by page, so the records are sorted
+            i, j = np.searchsorted(records['page'], [page, page + 1])
+            records = records[i:j]
+        reverse = None
+        if optimize:
+            odd = records['line'] % 2 == 1
+            position = np.arange(len(records))
+            records = records[np.lexsort(
+                (np.where(odd, -position, position), records['line']))]
+            reverse = records['line'] % 2 == 1
+        packed = self.glyphs.pack(
+            records['glyph'].astype(np.int64), records['x'], records['y'],
+            records['scale'], reverse)
+        if optimize and len(records):
+            packed = join_packed(
+                packed, JOIN_TOLERANCE * records['scale'].max())
+        return Drawing(packed)
+
+    def drawings(self, optimize=False):
+        return [self.drawing(page, optimize) for page in range(self.pages)]
+
 class Font(object):
     def __init__(self, font, point_size):
+        if isinstance(font, str):
+            font = get_font(font)
         self.font = font
-        self.max_height = Drawing(text(string.printable, font)).height
+        self.glyphs = get_glyphs(font)
+        self.max_height = self.glyphs.height
         self.scale = (point_size / 72) / self.max_height
-    def text(self, string):
-        d = Drawing(text(string, self.font))
-        d = d.scale(self.scale)
-        return d
-    def justify_text(self, text, width):
-        d = self.text(text)
-        w = d.width
-        spaces = text.count(' ')
+    def text(self, string, optimize=False):
+        layout = TextLayout(self.glyphs)
+        layout.add(*self.glyphs.layout(string), scale=self.scale)
+        return layout.drawing(optimize=optimize)
+    def justify_text(self, line, width):
+        w = self.measure(line)[0]
+        spaces = line.count(' ')
         if spaces == 0 or w >= width:
-            return d
+            return self.text(line)
         e = ((width - w) / spaces) / self.scale
-        d = Drawing(text(text, self.font, extra=e))
-        d = d.scale(self.scale)
-        return d
+        layout = TextLayout(self.glyphs)
+        layout.add(*self.glyphs.layout(line, extra=e), scale=self.scale)
+        return layout.drawing()
     def measure(self, text):
-        return self.text(text).size
-    def wrap(self, text, width, line_spacing=1, align=0, justify=False):
-        lines = _word_wrap(text, width, self.measure)
-        ds = [self.text(line) for line in lines]
-        max_width = max(d.width for d in ds)
+        (x1, y1, x2, y2), _ = self.glyphs.measure(text)
+        if x1 > x2:
+            return (0, 0)
+        return (float((x2 - x1) * self.scale), float((y2 - y1) * self.scale))
+    def layout(self, text, width, line_spacing=1, align=0, justify=False,
+            height=None):
+        # wraps text to width and lays it out on pages that hold as many
+        # lines as fit into height, one page if height is None
+        glyphs = self.glyphs
+        lines = []
+        for line in _word_wrap(text, width, glyphs, self.scale):
+            index, offsets = glyphs.layout(line)
+            x1, _, x2, _ = glyphs.extent(index, offsets)
+            w = (x2 - x1) * self.scale if x1 <= x2 else 0
+            lines.append((line, index, offsets, w))
+        max_width = max(w for line, index, offsets, w in lines) if lines else 0
         if justify:
-            jds = [self.justify_text(line, max_width) for line in lines]
-            ds = jds[:-1] + [ds[-1]]
+            for i, (line, index, offsets, w) in enumerate(lines[:-1]):
+                spaces = line.count(' ')
+                if spaces == 0 or w >= max_width:
+                    continue
+                e = ((max_width - w) / spaces) / self.scale
+                index, offsets = glyphs.layout(line, extra=e)
+                x1, _, x2, _ = glyphs.extent(index, offsets)
+                lines[i] = (line, index, offsets, (x2 - x1) * self.scale)
         spacing = line_spacing * self.max_height * self.scale
-        result = Drawing()
-        y = 0
-        for d in ds:
+        rows = len(lines)
+        if height is not None:
+            rows = max(1, int(height // spacing))
+        result = TextLayout(glyphs)
+        for i, (line, index, offsets, w) in enumerate(lines):
             if align == 0:
                 x = 0
             elif align == 1:
-                x = max_width - d.width
+                x = max_width - w
             else:
-                x = max_width / 2 - d.width / 2
-            result.add(d.translate(x, y))
-            y += spacing
+                x = max_width / 2 - w / 2
+            row = i % rows
+            result.add(
+                index, offsets, x, row * spacing, self.scale, i // rows, row)
         return result
+    def wrap(self, text, width, line_spacing=1, align=0, justify=False,
+            optimize=False):
+        layout = self.layout(text, width, line_spacing, align, justify)
+        return layout.drawing(optimize=optimize)
+    def pages(self, text, width, height, line_spacing=1, align=0,
+            justify=False, optimize=False):
+        layout = self.layout(
+            text, width, line_spacing, align, justify, height)
+        return layout.drawings(optimize)
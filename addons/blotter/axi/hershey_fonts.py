@@ -1,3265 +1,133 @@
-ASTROLOGY = [
-    (-8, 8, [[]]),
-    (-12, 12, [[(-8, -10), (-4, -8), (-2, -6), (-1, -3), (-1, 0), (-2, 3), (-4, 5), (-8, 7)], [(-8, -10), (-5, -9), (-3, -8), (-1, -6), (0, -3)], [(0, 0), (-1, 3), (-3, 5), (-5, 6), (-8, 7)], [(8, -10), (5, -9), (3, -8), (1, -6), (0, -3)], [(0, 0), (1, 3), (3, 5), (5, 6), (8, 7)], [(8, -10), (4, -8), (2, -6), (1, -3), (1, 0), (2, 3), (4, 5), (8, 7)], [(-9, -2), (9, -2)], [(-9, -1), (9, -1)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-13, 14, [[(-1, -12), (-4, -11), (-7, -9), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-7, 6), (-4, 8), (-1, 9), (2, 9), (5, 8), (8, 6), (10, 3), (11, 0), (11, -3), (10, -6), (8, -9), (5, -11), (2, -12), (-1, -12)], [(0, -3), (-1, -2), (-1, -1), (0, 0), (1, 0), (2, -1), (2, -2), (1, -3), (0, -3)], [(0, -2), (0, -1), (1, -1), (1, -2), (0, -2)]]),
-    (-8, 9, [[(-2, -12), (-4, -11), (-3, -9), (-1, -8)], [(-2, -12), (-3, -11), (-3, -9)], [(3, -12), (5, -11), (4, -9), (2, -8)], [(3, -12), (4, -11), (4, -9)], [(-1, -8), (-3, -7), (-4, -6), (-5, -4), (-5, -1), (-4, 1), (-3, 2), (-1, 3), (2, 3), (4, 2), (5, 1), (6, -1), (6, -4), (5, -6), (4, -7), (2, -8), (-1, -8)], [(0, 3), (0, 9)], [(1, 3), (1, 9)], [(-4, 6), (5, 6)]]),
-    (-9, 10, [[(0, -12), (-3, -11), (-5, -9), (-6, -6), (-6, -5), (-5, -2), (-3, 0), (0, 1), (1, 1), (4, 0), (6, -2), (7, -5), (7, -6), (6, -9), (4, -11), (1, -12), (0, -12)], [(0, 1), (0, 9)], [(1, 1), (1, 9)], [(-4, 5), (5, 5)]]),
-    (-14, 14, [[(-2, -12), (-5, -11), (-8, -9), (-10, -6), (-11, -3), (-11, 1), (-10, 4), (-8, 7), (-5, 9), (-2, 10), (2, 10), (5, 9), (8, 7), (10, 4), (11, 1), (11, -3), (10, -6), (8, -9), (5, -11), (2, -12), (-2, -12)], [(0, -12), (0, 10)], [(-11, -1), (11, -1)]]),
-    (-11, 14, [[(-2, -5), (-5, -4), (-7, -2), (-8, 1), (-8, 2), (-7, 5), (-5, 7), (-2, 8), (-1, 8), (2, 7), (4, 5), (5, 2), (5, 1), (4, -2), (2, -4), (-1, -5), (-2, -5)], [(11, -11), (5, -11), (9, -10), (3, -4)], [(11, -11), (11, -5), (10, -9), (4, -3)], [(10, -10), (4, -4)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-12, 10, [[(-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -9), (0, -6), (-1, -3), (-2, -1), (-4, 1), (-7, 3)], [(-3, -12), (-2, -11), (-1, -9), (-1, -5), (-2, -2), (-4, 1)], [(4, -12), (2, 9)], [(5, -12), (1, 9)], [(-7, 3), (7, 3)]]),
-    (-9, 10, [[(-5, -12), (-5, 3)], [(-4, -12), (-5, -1)], [(-5, -1), (-4, -3), (-3, -4), (-1, -5), (2, -5), (5, -4), (6, -2), (6, 0), (5, 2), (3, 4)], [(2, -5), (4, -4), (5, -2), (5, 0), (2, 6), (2, 8), (3, 9), (5, 9), (7, 7)], [(-7, -12), (-4, -12)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-9, 10, [[(0, -4), (-3, -3), (-5, -1), (-6, 2), (-6, 3), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4)], [(0, -10), (-4, -8), (0, -12), (0, -4)], [(1, -10), (5, -8), (1, -12), (1, -4)], [(0, 1), (-1, 2), (-1, 3), (0, 4), (1, 4), (2, 3), (2, 2), (1, 1), (0, 1)], [(0, 2), (0, 3), (1, 3), (1, 2), (0, 2)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 12, [[(-1, -10), (0, -12), (0, 9)], [(2, -10), (1, -12), (1, 9)], [(-8, -10), (-7, -12), (-7, -5), (-6, -2), (-4, 0), (-1, 1), (0, 1)], [(-5, -10), (-6, -12), (-6, -4), (-5, -1)], [(9, -10), (8, -12), (8, -5), (7, -2), (5, 0), (2, 1), (1, 1)], [(6, -10), (7, -12), (7, -4), (6, -1)], [(-4, 5), (5, 5)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)], [(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(2, 7), (4, 5), (5, 3), (6, 0), (7, -4), (7, -8), (6, -10)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-3, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -4), (6, -9), (5, -11), (4, -12)]]),
-    (-10, 11, [[(2, -8), (-3, 9), (-1, 9)], [(5, -12), (3, -8), (-2, 9)], [(5, -12), (-1, 9)], [(5, -12), (2, -9), (-1, -7), (-3, -6)], [(2, -8), (0, -7), (-3, -6)]]),
-    (-10, 11, [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (5, -3), (-5, 3), (-7, 5), (-9, 9)], [(6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (1, -1)], [(4, -12), (5, -11), (6, -9), (6, -7), (5, -5), (3, -3), (-5, 3)], [(-8, 7), (-7, 6), (-5, 6), (0, 7), (5, 7), (6, 6)], [(-5, 6), (0, 8), (5, 8)], [(-5, 6), (0, 9), (3, 9), (5, 8), (6, 6), (6, 5)]]),
-    (-10, 11, [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3), (1, -2)], [(6, -11), (7, -9), (7, -7), (6, -5), (5, -4)], [(4, -12), (5, -11), (6, -9), (6, -7), (5, -5), (3, -3), (1, -2)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5), (-7, 4)], [(4, 0), (5, 2), (5, 5), (4, 7)], [(1, -2), (3, -1), (4, 1), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-10, 11, [[(5, -8), (0, 9), (2, 9)], [(8, -12), (6, -8), (1, 9)], [(8, -12), (2, 9)], [(8, -12), (-8, 3), (8, 3)]]),
-    (-10, 11, [[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (7, -11)], [(-2, -10), (3, -10), (7, -11), (9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5), (-7, 4)], [(4, -2), (5, 0), (5, 3), (4, 6), (2, 8)], [(1, -4), (3, -3), (4, -1), (4, 3), (3, 6), (1, 8), (-1, 9)]]),
-    (-10, 11, [[(7, -8), (7, -9), (6, -9), (6, -7), (8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1)], [(-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(4, 6), (5, 4), (5, 1), (4, -1)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-3, 9)], [(0, 9), (2, 8), (3, 7), (4, 4), (4, 0), (3, -2), (2, -3)]]),
-    (-10, 11, [[(-4, -12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (2, -1), (0, 2), (-1, 5), (-2, 9)], [(0, 1), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9), (-2, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)], [(-3, -11), (0, -11), (5, -9)], [(-5, -9), (-3, -10), (0, -10), (5, -9), (7, -9), (8, -10), (9, -12)]]),
-    (-10, 11, [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3), (-1, -2), (2, -2), (5, -3), (7, -4), (8, -6), (8, -9), (7, -11), (5, -12), (1, -12)], [(3, -12), (-2, -11)], [(-2, -10), (-3, -8), (-3, -4), (-2, -3)], [(-3, -3), (0, -2)], [(1, -2), (5, -3)], [(6, -4), (7, -6), (7, -9), (6, -11)], [(7, -11), (3, -12)], [(1, -12), (-1, -10), (-2, -8), (-2, -4), (-1, -2)], [(2, -2), (4, -3), (5, -4), (6, -6), (6, -10), (5, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(0, -2), (-5, -1)], [(-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8)], [(-7, 8), (-2, 9), (4, 8)], [(4, 7), (5, 5), (5, 2), (4, 0)], [(4, -1), (1, -2)], [(-1, -2), (-3, -1), (-5, 1), (-6, 3), (-6, 6), (-5, 8), (-4, 9)], [(0, 9), (2, 8), (3, 7), (4, 5), (4, 1), (3, -1), (2, -2)]]),
-    (-10, 11, [[(6, -4), (5, -2), (4, -1), (2, 0), (-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12), (6, -11), (7, -10), (8, -7), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 4), (-5, 4), (-5, 6), (-6, 6), (-6, 5)], [(-3, -2), (-4, -4), (-4, -7), (-3, -9)], [(6, -10), (7, -8), (7, -4), (6, 0), (5, 3), (3, 6)], [(-1, 0), (-2, -1), (-3, -3), (-3, -7), (-2, -10), (-1, -11), (1, -12)], [(4, -12), (5, -11), (6, -9), (6, -4), (5, 0), (4, 3), (3, 5), (1, 8), (-1, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (7, 9), (7, 4), (6, 9)]]),
-    (-10, 9, [[(7, -11), (3, -11), (-1, -10), (-4, -8), (-6, -5), (-7, -2), (-7, 1), (-6, 4), (-4, 7), (-1, 9), (3, 10), (7, 10)], [(7, -11), (4, -10), (1, -8), (-1, -5), (-2, -2), (-2, 1), (-1, 4), (1, 7), (4, 9), (7, 10)]]),
-    (-12, 13, [[(-3, -1), (-5, -1), (-7, 0), (-8, 1), (-9, 3), (-9, 5), (-8, 7), (-7, 8), (-5, 9), (-3, 9), (-1, 8), (0, 7), (1, 5), (1, 3), (0, 1), (-1, 0), (-3, -1)], [(1, -10), (-2, -1)], [(8, -8), (0, 0)], [(10, -1), (1, 2)]]),
-    (-10, 10, [[(-3, -7), (3, 7)], [(3, -7), (-3, 7)], [(-7, -3), (7, 3)], [(7, -3), (-7, 3)]]),
-    (-12, 12, [[(-4, 4), (-6, 3), (-7, 3), (-9, 4), (-10, 6), (-10, 7), (-9, 9), (-7, 10), (-6, 10), (-4, 9), (-3, 7), (-3, 6), (-4, 4), (-7, 0), (-8, -3), (-8, -5), (-7, -8), (-5, -10), (-2, -11), (2, -11), (5, -10), (7, -8), (8, -5), (8, -3), (7, 0), (4, 4), (3, 6), (3, 7), (4, 9), (6, 10), (7, 10), (9, 9), (10, 7), (10, 6), (9, 4), (7, 3), (6, 3), (4, 4)], [(-8, -5), (-7, -7), (-5, -9), (-2, -10), (2, -10), (5, -9), (7, -7), (8, -5)]]),
-    (-12, 12, [[(-4, -5), (-6, -4), (-7, -4), (-9, -5), (-10, -7), (-10, -8), (-9, -10), (-7, -11), (-6, -11), (-4, -10), (-3, -8), (-3, -7), (-4, -5), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-5, 9), (-2, 10), (2, 10), (5, 9), (7, 7), (8, 4), (8, 2), (7, -1), (4, -5), (3, -7), (3, -8), (4, -10), (6, -11), (7, -11), (9, -10), (10, -8), (10, -7), (9, -5), (7, -4), (6, -4), (4, -5)], [(-8, 4), (-7, 6), (-5, 8), (-2, 9), (2, 9), (5, 8), (7, 6), (8, 4)]]),
-    (-12, 13, [[(-8, -5), (-9, -6), (-9, -8), (-8, -10), (-6, -11), (-4, -11), (-2, -10), (-1, -9), (0, -7), (1, -2)], [(-9, -8), (-7, -10), (-5, -10), (-3, -9), (-2, -8), (-1, -6), (0, -2), (0, 9)], [(9, -5), (10, -6), (10, -8), (9, -10), (7, -11), (5, -11), (3, -10), (2, -9), (1, -7), (0, -2)], [(10, -8), (8, -10), (6, -10), (4, -9), (3, -8), (2, -6), (1, -2), (1, 9)]]),
-    (-10, 10, [[(0, -12), (-7, 8)], [(-1, -9), (5, 9)], [(0, -9), (6, 9)], [(0, -12), (7, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-7, 8), (-8, 9)], [(-7, 8), (-5, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(6, 7), (8, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(-4, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(6, 0), (7, 2), (7, 5), (6, 7)], [(3, -2), (5, -1), (6, 1), (6, 6), (5, 8), (3, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 4)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)], [(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6)], [(1, -12), (3, -11), (5, -8), (6, -4), (6, 1), (5, 5), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (7, 9), (7, 3)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-11, 9, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 12, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 8), (7, 9), (7, 1)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(6, 2), (6, 7)], [(5, 1), (5, 7), (4, 8)], [(2, 1), (10, 1)], [(3, 1), (5, 2)], [(4, 1), (5, 3)], [(8, 1), (7, 3)], [(9, 1), (7, 2)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(5, -12), (5, 9)], [(6, -11), (6, 8)], [(7, -12), (7, 9)], [(-10, -12), (-2, -12)], [(2, -12), (10, -12)], [(-5, -2), (5, -2)], [(-10, 9), (-2, 9)], [(2, 9), (10, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(3, -12), (5, -11)], [(4, -12), (5, -10)], [(8, -12), (7, -10)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(-4, -12), (4, -12)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(2, -12), (1, -10)], [(3, -12), (1, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-8, 8, [[(1, -12), (1, 5), (0, 8), (-1, 9)], [(2, -11), (2, 5), (1, 8)], [(3, -12), (3, 5), (2, 8), (-1, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 4), (-5, 3), (-4, 3), (-3, 4), (-3, 5), (-4, 6), (-5, 6)], [(-5, 4), (-5, 5), (-4, 5), (-4, 4), (-5, 4)], [(-2, -12), (6, -12)], [(-1, -12), (1, -11)], [(0, -12), (1, -10)], [(4, -12), (3, -10)], [(5, -12), (3, -11)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(6, -11), (-5, 0)], [(-2, -2), (5, 9)], [(-1, -2), (6, 9)], [(-1, -4), (7, 9)], [(-10, -12), (-2, -12)], [(3, -12), (9, -12)], [(-10, 9), (-2, 9)], [(2, 9), (9, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (6, -11)], [(8, -12), (6, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 7), (3, 9)], [(5, 7), (8, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -11), (-3, 8)], [(-2, -12), (-2, 9)], [(-7, -12), (1, -12)], [(-7, 9), (8, 9), (8, 3)], [(-6, -12), (-4, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-2, -10)], [(0, -12), (-2, -11)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)], [(3, 9), (8, 8)], [(5, 9), (8, 7)], [(6, 9), (8, 6)], [(7, 9), (8, 3)]]),
-    (-13, 13, [[(-8, -12), (-8, 8)], [(-8, -12), (-1, 9)], [(-7, -12), (-1, 6)], [(-6, -12), (0, 6)], [(6, -12), (-1, 9)], [(6, -12), (6, 9)], [(7, -11), (7, 8)], [(8, -12), (8, 9)], [(-11, -12), (-6, -12)], [(6, -12), (11, -12)], [(-11, 9), (-5, 9)], [(3, 9), (11, 9)], [(-10, -12), (-8, -11)], [(9, -12), (8, -10)], [(10, -12), (8, -11)], [(-8, 8), (-10, 9)], [(-8, 8), (-6, 9)], [(6, 8), (4, 9)], [(6, 7), (5, 9)], [(8, 7), (9, 9)], [(8, 8), (10, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 8)], [(-7, -12), (7, 9)], [(-6, -12), (6, 6)], [(-5, -12), (7, 6)], [(7, -11), (7, 9)], [(-10, -12), (-5, -12)], [(4, -12), (10, -12)], [(-10, 9), (-4, 9)], [(-9, -12), (-7, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 8), (-5, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-4, -1)], [(6, -10), (7, -8), (7, -5), (6, -3)], [(3, -12), (5, -11), (6, -9), (6, -4), (5, -2), (3, -1)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)], [(-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 12), (5, 14), (7, 14), (8, 12), (8, 10)], [(4, 10), (5, 12), (6, 13), (7, 13)], [(3, 6), (5, 11), (6, 12), (7, 12), (8, 11)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2), (-4, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(0, -2), (2, -1), (3, 1), (5, 7), (6, 9), (8, 9), (9, 7), (9, 5)], [(5, 5), (6, 7), (7, 8), (8, 8)], [(2, -1), (3, 0), (6, 6), (7, 7), (8, 7), (9, 6)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-10, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3), (-7, 9), (-6, 6)]]),
-    (-10, 10, [[(-8, -12), (-8, -6)], [(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(8, -12), (8, -6)], [(-8, -12), (8, -12)], [(-4, 9), (4, 9)], [(-7, -12), (-8, -6)], [(-6, -12), (-8, -9)], [(-5, -12), (-8, -10)], [(-3, -12), (-8, -11)], [(3, -12), (8, -11)], [(5, -12), (8, -10)], [(6, -12), (8, -9)], [(7, -12), (8, -6)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -11)], [(-6, -11), (-6, 4), (-5, 6)], [(-5, -12), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(-10, -12), (-2, -12)], [(4, -12), (10, -12)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)]]),
-    (-10, 10, [[(-7, -12), (0, 9)], [(-6, -12), (0, 6), (0, 9)], [(-5, -12), (1, 6)], [(7, -11), (0, 9)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-8, -12), (-6, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(8, -12), (7, -11)]]),
-    (-12, 12, [[(-8, -12), (-4, 9)], [(-7, -12), (-4, 4), (-4, 9)], [(-6, -12), (-3, 4)], [(0, -12), (-3, 4), (-4, 9)], [(0, -12), (4, 9)], [(1, -12), (4, 4), (4, 9)], [(2, -12), (5, 4)], [(8, -11), (5, 4), (4, 9)], [(-11, -12), (-3, -12)], [(0, -12), (2, -12)], [(5, -12), (11, -12)], [(-10, -12), (-7, -11)], [(-9, -12), (-7, -10)], [(-5, -12), (-6, -10)], [(-4, -12), (-6, -11)], [(6, -12), (8, -11)], [(10, -12), (8, -11)]]),
-    (-10, 10, [[(-7, -12), (5, 9)], [(-6, -12), (6, 9)], [(-5, -12), (7, 9)], [(6, -11), (-6, 8)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-8, -12), (-5, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(4, -12), (6, -11)], [(8, -12), (6, -11)], [(-6, 8), (-8, 9)], [(-6, 8), (-4, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(5, 7), (8, 9)]]),
-    (-11, 11, [[(-8, -12), (-1, -1), (-1, 9)], [(-7, -12), (0, -1), (0, 8)], [(-6, -12), (1, -1), (1, 9)], [(7, -11), (1, -1)], [(-10, -12), (-3, -12)], [(4, -12), (10, -12)], [(-4, 9), (4, 9)], [(-9, -12), (-7, -11)], [(-4, -12), (-6, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-10, 10, [[(7, -12), (-7, -12), (-7, -6)], [(5, -12), (-7, 9)], [(6, -12), (-6, 9)], [(7, -12), (-5, 9)], [(-7, 9), (7, 9), (7, 3)], [(-6, -12), (-7, -6)], [(-5, -12), (-7, -9)], [(-4, -12), (-7, -10)], [(-2, -12), (-7, -11)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-12, 12, [[(-9, -11), (-8, -7), (-7, -5), (-5, -3), (-2, -2), (2, -2), (5, -3), (7, -5), (8, -7), (9, -11)], [(-9, -11), (-8, -8), (-7, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (7, -6), (8, -8), (9, -11)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3)], [(-2, -2), (-4, -1), (-5, 1), (-5, 4), (-4, 7)], [(4, 7), (5, 4), (5, 1), (4, -1), (2, -2)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-12, 12, [[(-5, -8), (-5, 4)], [(-4, -7), (-4, 3)], [(4, -7), (4, 3)], [(5, -8), (5, 4)], [(-9, -11), (-7, -9), (-5, -8), (-2, -7), (2, -7), (5, -8), (7, -9), (9, -11)], [(-9, 7), (-7, 5), (-5, 4), (-2, 3), (2, 3), (5, 4), (7, 5), (9, 7)]]),
-    (-12, 12, [[(9, -9), (-6, -9), (-8, -8), (-9, -6), (-9, -4), (-8, -2), (-6, -1), (-4, -1), (-2, -2), (-1, -4), (-1, -6), (-2, -8), (9, -8)], [(-9, -5), (-8, -3), (-7, -2), (-5, -1)], [(-1, -5), (-2, -7), (-3, -8), (-5, -9)], [(-9, 6), (6, 6), (8, 5), (9, 3), (9, 1), (8, -1), (6, -2), (4, -2), (2, -1), (1, 1), (1, 3), (2, 5), (-9, 5)], [(9, 2), (8, 0), (7, -1), (5, -2)], [(1, 2), (2, 4), (3, 5), (5, 6)]]),
-    (-12, 11, [[(-3, 3), (-5, 2), (-6, 2), (-8, 3), (-9, 5), (-9, 6), (-8, 8), (-6, 9), (-5, 9), (-3, 8), (-2, 6), (-2, 5), (-3, 3), (-8, -2), (-9, -4), (-9, -7), (-8, -9), (-6, -10), (-3, -11), (1, -11), (5, -10), (7, -8), (8, -6), (8, -3), (7, 0), (4, 3), (3, 5), (3, 7), (4, 9), (6, 9), (7, 8), (8, 6)], [(-5, 1), (-7, -2), (-8, -4), (-8, -7), (-7, -9), (-6, -10)], [(1, -11), (4, -10), (6, -8), (7, -6), (7, -3), (6, 0), (4, 3)]]),
-    (-11, 13, [[(-10, -7), (-7, -10), (-5, -7), (-5, 4)], [(-8, -9), (-6, -6), (-6, 4)], [(-5, -7), (-2, -10), (0, -7), (0, 3)], [(-3, -9), (-1, -6), (-1, 3)], [(0, -7), (3, -10), (5, -7), (5, 9)], [(2, -9), (4, -6), (4, 9)], [(5, -7), (8, -10), (9, -8), (10, -5), (10, -2), (9, 1), (8, 3), (6, 5), (3, 7), (-2, 9)], [(7, -9), (8, -8), (9, -5), (9, -2), (8, 1), (7, 3), (5, 5), (2, 7), (-2, 9)]]),
-    (-11, 11, [[(5, -5), (3, 2), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(6, -5), (4, 2), (4, 8)], [(5, -5), (7, -5), (5, 2), (4, 6)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)]]),
-    (-9, 10, [[(-2, -12), (-4, -5), (-5, 1), (-5, 5), (-4, 7), (-3, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (3, -5), (1, -5), (-1, -4), (-2, -3), (-3, -1), (-4, 2)], [(-1, -12), (-3, -5), (-4, -1), (-4, 5), (-3, 8)], [(4, 7), (5, 5), (6, 2), (6, -1), (5, -3)], [(-5, -12), (0, -12), (-2, -5), (-4, 2)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1), (4, -4), (3, -5)], [(-4, -12), (-1, -11)], [(-3, -12), (-2, -10)]]),
-    (-9, 9, [[(5, -1), (5, -2), (4, -2), (4, 0), (6, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)], [(0, -5), (-2, -3), (-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]),
-    (-11, 11, [[(7, -12), (4, -1), (3, 3), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(8, -12), (5, -1), (4, 3), (4, 8)], [(4, -12), (9, -12), (5, 2), (4, 6)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)], [(5, -12), (8, -11)], [(6, -12), (7, -10)]]),
-    (-9, 9, [[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)], [(0, -5), (-2, -3), (-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]),
-    (-8, 8, [[(8, -10), (8, -11), (7, -11), (7, -9), (9, -9), (9, -11), (8, -12), (6, -12), (4, -11), (2, -9), (1, -7), (0, -4), (-1, 0), (-3, 9), (-4, 12), (-5, 14), (-7, 16)], [(2, -8), (1, -5), (0, 0), (-2, 9), (-3, 12)], [(6, -12), (4, -10), (3, -8), (2, -5), (1, 0), (-1, 8), (-2, 11), (-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 13), (-8, 13), (-8, 15), (-9, 15), (-9, 14)], [(-4, -5), (7, -5)]]),
-    (-10, 11, [[(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)], [(7, -5), (3, 9), (1, 13)], [(6, -5), (8, -5), (4, 9), (2, 13), (0, 15), (-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 12), (-7, 12), (-7, 14), (-8, 14), (-8, 13)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (4, 2)], [(-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 7)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 8), (-3, 9)]]),
-    (-11, 11, [[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (-1, -12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -2), (6, 1), (4, 6)], [(5, -4), (5, 0), (4, 4), (4, 8)], [(5, -2), (3, 3), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)]]),
-    (-7, 6, [[(1, -12), (1, -10), (3, -10), (3, -12), (1, -12)], [(2, -12), (2, -10)], [(1, -11), (3, -11)], [(-6, -1), (-5, -3), (-3, -5), (-1, -5), (0, -4), (1, -2), (1, 1), (-1, 6)], [(0, -4), (0, 0), (-1, 4), (-1, 8)], [(0, -2), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)]]),
-    (-7, 6, [[(3, -12), (3, -10), (5, -10), (5, -12), (3, -12)], [(4, -12), (4, -10)], [(3, -11), (5, -11)], [(-5, -1), (-4, -3), (-2, -5), (0, -5), (1, -4), (2, -2), (2, 1), (0, 8), (-1, 11), (-2, 13), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8, 14)], [(1, -4), (1, 1), (-1, 8), (-2, 11), (-3, 13)], [(1, -2), (0, 2), (-2, 9), (-3, 12), (-4, 14), (-6, 16)]]),
-    (-11, 11, [[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (-1, -12), (-7, 9)], [(7, -3), (7, -4), (6, -4), (6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3, 1)], [(-5, 1), (-3, 1), (-1, 2), (0, 3), (2, 7), (3, 8), (5, 8)], [(-1, 3), (1, 7), (2, 8)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)]]),
-    (-6, 6, [[(2, -12), (-1, -1), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3), (-1, 8)], [(-1, -12), (4, -12), (0, 2), (-1, 6)], [(0, -12), (3, -11)], [(1, -12), (2, -10)]]),
-    (-18, 17, [[(-17, -1), (-16, -3), (-14, -5), (-12, -5), (-11, -4), (-10, -2), (-10, 1), (-12, 9)], [(-11, -4), (-11, 1), (-13, 9)], [(-11, -2), (-12, 2), (-14, 9), (-12, 9)], [(-10, 1), (-8, -2), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -2), (1, 1), (-1, 9)], [(0, -4), (0, 1), (-2, 9)], [(0, -2), (-1, 2), (-3, 9), (-1, 9)], [(1, 1), (3, -2), (5, -4), (7, -5), (9, -5), (11, -4), (12, -2), (12, 1), (10, 6)], [(11, -4), (11, 0), (10, 4), (10, 8)], [(11, -2), (9, 3), (9, 6), (10, 8), (11, 9), (13, 9), (15, 7), (16, 5)]]),
-    (-12, 12, [[(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-4, -2), (-4, 1), (-6, 9)], [(-5, -4), (-5, 1), (-7, 9)], [(-5, -2), (-6, 2), (-8, 9), (-6, 9)], [(-4, 1), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -4), (7, -2), (7, 1), (5, 6)], [(6, -4), (6, 0), (5, 4), (5, 8)], [(6, -2), (4, 3), (4, 6), (5, 8), (6, 9), (8, 9), (10, 7), (11, 5)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (2, -5), (-1, -5)], [(-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 7)], [(4, 7), (5, 5), (6, 2), (6, -1), (5, -3)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 8), (-2, 9)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1), (4, -4), (2, -5)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1), (-4, 5), (-7, 16)], [(-4, -4), (-4, 1), (-5, 5), (-8, 16)], [(-4, -2), (-5, 2), (-9, 16)], [(-3, 2), (-2, -1), (-1, -3), (0, -4), (2, -5), (4, -5), (6, -4), (7, -3), (8, 0), (8, 2), (7, 5), (5, 8), (2, 9), (0, 9), (-2, 8), (-3, 5), (-3, 2)], [(6, -3), (7, -1), (7, 2), (6, 5), (5, 7)], [(4, -5), (5, -4), (6, -1), (6, 2), (5, 5), (4, 7), (2, 9)], [(-12, 16), (-4, 16)], [(-8, 15), (-11, 16)], [(-8, 14), (-10, 16)], [(-7, 14), (-6, 16)], [(-8, 15), (-5, 16)]]),
-    (-11, 10, [[(5, -5), (-1, 16)], [(6, -5), (0, 16)], [(5, -5), (7, -5), (1, 16)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)], [(-4, 16), (4, 16)], [(0, 15), (-3, 16)], [(0, 14), (-2, 16)], [(1, 14), (2, 16)], [(0, 15), (3, 16)]]),
-    (-9, 9, [[(-8, -1), (-7, -3), (-5, -5), (-3, -5), (-2, -4), (-1, -2), (-1, 2), (-3, 9)], [(-2, -4), (-2, 2), (-4, 9)], [(-2, -2), (-3, 2), (-5, 9), (-3, 9)], [(7, -3), (7, -4), (6, -4), (6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (1, -2), (-1, 2)]]),
-    (-8, 9, [[(6, -2), (6, -3), (5, -3), (5, -1), (7, -1), (7, -3), (6, -4), (3, -5), (0, -5), (-3, -4), (-4, -3), (-4, -1), (-3, 1), (-1, 2), (2, 3), (4, 4), (5, 6)], [(-3, -4), (-4, -1)], [(-3, 0), (-1, 1), (2, 2), (4, 3)], [(5, 4), (4, 8)], [(-4, -3), (-3, -1), (-1, 0), (2, 1), (4, 2), (5, 4), (5, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 5), (-4, 5), (-4, 7), (-5, 7), (-5, 6)]]),
-    (-7, 7, [[(2, -12), (-1, -1), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3), (-1, 8)], [(2, -12), (4, -12), (0, 2), (-1, 6)], [(-4, -5), (6, -5)]]),
-    (-12, 12, [[(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-4, -2), (-4, 1), (-6, 6)], [(-5, -4), (-5, 0), (-6, 4), (-6, 8)], [(-5, -2), (-7, 3), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3)], [(6, -5), (4, 3), (4, 6), (5, 8), (6, 9), (8, 9), (10, 7), (11, 5)], [(7, -5), (5, 3), (5, 8)], [(6, -5), (8, -5), (6, 2), (5, 6)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-2, -2), (-2, 1), (-4, 6)], [(-3, -4), (-3, 0), (-4, 4), (-4, 8)], [(-3, -2), (-5, 3), (-5, 6), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (6, 3), (7, -1), (7, -5), (6, -5), (6, -4), (7, -2)]]),
-    (-15, 15, [[(-14, -1), (-13, -3), (-11, -5), (-9, -5), (-8, -4), (-7, -2), (-7, 1), (-9, 6)], [(-8, -4), (-8, 0), (-9, 4), (-9, 8)], [(-8, -2), (-10, 3), (-10, 6), (-9, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 6), (0, 3)], [(2, -5), (0, 3), (0, 6), (1, 8), (3, 9), (5, 9), (7, 8), (9, 6), (11, 3), (12, -1), (12, -5), (11, -5), (11, -4), (12, -2)], [(3, -5), (1, 3), (1, 8)], [(2, -5), (4, -5), (2, 2), (1, 6)]]),
-    (-11, 11, [[(-8, -1), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -2), (1, 0)], [(-2, -5), (-1, -4), (-1, 0), (-2, 4), (-3, 6), (-5, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-8, 6), (-8, 8), (-9, 8), (-9, 7)], [(0, -3), (0, 0), (-1, 4), (-1, 7)], [(8, -3), (8, -4), (7, -4), (7, -2), (9, -2), (9, -4), (8, -5), (6, -5), (4, -4), (2, -2), (1, 0), (0, 4), (0, 8), (1, 9)], [(-2, 4), (-2, 6), (-1, 8), (1, 9), (3, 9), (5, 8), (7, 5)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1), (-5, 6)], [(-4, -4), (-4, 0), (-5, 4), (-5, 8)], [(-4, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(7, -5), (3, 9), (2, 12), (0, 15), (-2, 16)], [(8, -5), (4, 9), (2, 13)], [(7, -5), (9, -5), (5, 9), (3, 13), (1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14), (-8, 12), (-6, 12), (-6, 14), (-7, 14), (-7, 13)]]),
-    (-10, 10, [[(7, -5), (6, -3), (4, -1), (-4, 5), (-6, 7), (-7, 9)], [(6, -3), (-3, -3), (-5, -2), (-6, 0)], [(4, -3), (0, -4), (-3, -4), (-4, -3)], [(4, -3), (0, -5), (-3, -5), (-5, -3), (-6, 0)], [(-6, 7), (3, 7), (5, 6), (6, 4)], [(-4, 7), (0, 8), (3, 8), (4, 7)], [(-4, 7), (0, 9), (3, 9), (5, 7), (6, 4)]]),
-    (-12, 13, [[(-11, -6), (-8, -9), (-5, -6), (-5, 6)], [(-9, -8), (-6, -5), (-6, 6)], [(-5, -6), (-2, -9), (1, -6), (1, 6)], [(-3, -8), (0, -5), (0, 6)], [(1, -6), (4, -9), (7, -6), (7, 5), (9, 7)], [(3, -8), (6, -5), (6, 6), (8, 8), (11, 5)]]),
-    (-11, 11, [[(8, -9), (-8, 7)], [(8, -9), (5, -8), (-1, -8)], [(6, -7), (3, -7), (-1, -8)], [(8, -9), (7, -6), (7, 0)], [(6, -7), (6, -4), (7, 0)], [(-1, 0), (-8, 0)], [(-2, 1), (-5, 1), (-8, 0)], [(-1, 0), (-1, 7)], [(-2, 1), (-2, 4), (-1, 7)]]),
-    (-12, 12, [[(-10, -3), (-8, -7), (-3, 3)], [(-8, -5), (-3, 5), (0, -2), (5, -2), (8, -3), (9, -5), (9, -7), (8, -9), (6, -10), (5, -10), (3, -9), (2, -7), (2, -5), (3, -2), (4, 0), (5, 3), (5, 6), (3, 8)], [(5, -10), (4, -9), (3, -7), (3, -5), (5, -1), (6, 2), (6, 5), (5, 7), (3, 8)]]),
-    (-12, 12, [[(-9, -3), (-6, -6), (-2, -4)], [(-7, -5), (-3, -3), (0, -6), (3, -4)], [(-1, -5), (2, -3), (5, -6), (7, -4)], [(4, -5), (6, -3), (9, -6)], [(-9, 3), (-6, 0), (-2, 2)], [(-7, 1), (-3, 3), (0, 0), (3, 2)], [(-1, 1), (2, 3), (5, 0), (7, 2)], [(4, 1), (6, 3), (9, 0)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-CURSIVE = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8, 0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9), (10, 8), (10, 7)]]),
-    (-2, 2, [[(0, -5), (0, -1)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-11, 9, [[(-11, 9), (-9, 8), (-6, 5), (-3, 1), (1, -6), (4, -12), (4, 9), (3, 6), (1, 3), (-1, 1), (-4, -1), (-6, -1), (-7, 0), (-7, 2), (-6, 4), (-4, 6), (-1, 8), (2, 9), (7, 9)]]),
-    (-12, 11, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (6, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (5, -3), (2, -2)], [(1, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9), (0, 9), (-2, 8), (-3, 6)]]),
-    (-10, 10, [[(2, -6), (2, -5), (3, -4), (5, -4), (7, -5), (8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (5, 4)]]),
-    (-11, 12, [[(2, -12), (0, -11), (-1, -9), (-2, -5), (-3, 1), (-4, 4), (-5, 6), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11, 5), (-9, 5), (-7, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (8, 2), (9, -3), (9, -7), (8, -10), (7, -11), (5, -12), (2, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2), (10, 3)]]),
-    (-10, 10, [[(4, -8), (4, -7), (5, -6), (7, -6), (8, -7), (8, -9), (7, -11), (4, -12), (0, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-2, -3), (1, -2), (-2, -2), (-5, -1), (-6, 0), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (7, 4)]]),
-    (-10, 10, [[(0, -6), (-2, -6), (-4, -7), (-5, -9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11), (11, -12)], [(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)], [(-1, -2), (8, -2)]]),
-    (-11, 12, [[(-11, 9), (-9, 8), (-5, 4), (-2, -1), (-1, -4), (0, -8), (0, -11), (-1, -12), (-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-1, -3), (3, -3), (6, -4), (7, -5), (8, -7), (8, -1), (7, 4), (6, 6), (4, 8), (1, 9), (-3, 9), (-6, 8), (-8, 6), (-9, 4), (-9, 2)]]),
-    (-12, 12, [[(-5, -5), (-7, -6), (-8, -8), (-8, -9), (-7, -11), (-5, -12), (-4, -12), (-2, -11), (-1, -9), (-1, -7), (-2, -3), (-4, 3), (-6, 7), (-8, 9), (-10, 9), (-11, 8), (-11, 6)], [(-5, 0), (4, -3), (6, -4), (9, -6), (11, -8), (12, -10), (12, -11), (11, -12), (10, -12), (8, -10), (6, -6), (4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-9, 8, [[(5, 4), (3, 2), (1, -1), (0, -3), (-1, -6), (-1, -9), (0, -11), (1, -12), (3, -12), (4, -11), (5, -9), (5, -6), (4, -1), (2, 4), (1, 6), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-5, 3), (-3, 4)]]),
-    (-8, 7, [[(2, 12), (0, 9), (-2, 4), (-3, -2), (-3, -8), (-2, -11), (0, -12), (2, -12), (3, -11), (4, -8), (4, -5), (3, 0), (0, 9), (-2, 15), (-3, 18), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-4, 12), (-2, 10), (1, 8), (5, 6)]]),
-    (-12, 12, [[(-5, -5), (-7, -6), (-8, -8), (-8, -9), (-7, -11), (-5, -12), (-4, -12), (-2, -11), (-1, -9), (-1, -7), (-2, -3), (-4, 3), (-6, 7), (-8, 9), (-10, 9), (-11, 8), (-11, 6)], [(12, -9), (12, -11), (11, -12), (10, -12), (8, -11), (6, -9), (4, -6), (2, -4), (0, -3), (-2, -3)], [(0, -3), (1, -1), (1, 6), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-9, 10, [[(-5, 0), (-3, 0), (1, -1), (4, -3), (6, -5), (7, -7), (7, -10), (6, -12), (4, -12), (3, -11), (2, -9), (1, -4), (0, 1), (-1, 4), (-2, 6), (-4, 8), (-6, 9), (-8, 9), (-9, 8), (-9, 6), (-8, 5), (-6, 5), (-4, 6), (-1, 8), (2, 9), (4, 9), (7, 8), (9, 6)]]),
-    (-18, 15, [[(-13, -5), (-15, -6), (-16, -8), (-16, -9), (-15, -11), (-13, -12), (-12, -12), (-10, -11), (-9, -9), (-9, -7), (-10, -2), (-11, 2), (-13, 9)], [(-11, 2), (-8, -6), (-6, -10), (-5, -11), (-3, -12), (-2, -12), (0, -11), (1, -9), (1, -7), (0, -2), (-1, 2), (-3, 9)], [(-1, 2), (2, -6), (4, -10), (5, -11), (7, -12), (8, -12), (10, -11), (11, -9), (11, -7), (10, -2), (8, 5), (8, 8), (9, 9), (10, 9), (12, 8), (13, 7), (15, 4)]]),
-    (-13, 11, [[(-8, -5), (-10, -6), (-11, -8), (-11, -9), (-10, -11), (-8, -12), (-7, -12), (-5, -11), (-4, -9), (-4, -7), (-5, -2), (-6, 2), (-8, 9)], [(-6, 2), (-3, -6), (-1, -10), (0, -11), (2, -12), (4, -12), (6, -11), (7, -9), (7, -7), (6, -2), (4, 5), (4, 8), (5, 9), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 1), (8, -3), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12), (0, -10), (0, -7), (1, -4), (3, -1), (5, 1), (8, 3), (10, 4)]]),
-    (-12, 13, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (8, -12), (10, -11), (11, -10), (12, -8), (12, -5), (11, -3), (10, -2), (8, -1), (5, -1), (3, -2), (2, -3)]]),
-    (-10, 12, [[(3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9), (8, -5), (7, -2), (5, 1), (1, 5), (-2, 7), (-4, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (1, 9), (4, 9), (7, 8), (9, 6)]]),
-    (-12, 13, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (7, -12), (9, -11), (10, -10), (11, -8), (11, -5), (10, -3), (9, -2), (7, -1), (4, -1), (1, -2), (2, -1), (3, 1), (3, 6), (4, 8), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-10, 10, [[(-10, 9), (-8, 8), (-6, 6), (-3, 2), (-1, -1), (1, -5), (2, -8), (2, -11), (1, -12), (0, -12), (-1, -11), (-2, -9), (-2, -7), (-1, -5), (1, -3), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-8, 4), (-8, 2)]]),
-    (-10, 9, [[(0, -6), (-2, -6), (-4, -7), (-5, -9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11), (11, -12)], [(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)]]),
-    (-13, 11, [[(-8, -5), (-10, -6), (-11, -8), (-11, -9), (-10, -11), (-8, -12), (-7, -12), (-5, -11), (-4, -9), (-4, -7), (-5, -3), (-6, 0), (-7, 4), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (3, 3), (6, -5), (8, -12)], [(6, -5), (5, -1), (4, 5), (4, 8), (5, 9), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-12, 11, [[(-7, -5), (-9, -6), (-10, -8), (-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4, -11), (-3, -9), (-3, -7), (-4, -3), (-5, 0), (-6, 4), (-6, 7), (-5, 9), (-3, 9), (-1, 8), (2, 5), (4, 2), (6, -2), (7, -5), (8, -9), (8, -11), (7, -12), (6, -12), (5, -11), (4, -9), (4, -7), (5, -4), (7, -2), (9, -1)]]),
-    (-15, 13, [[(-10, -5), (-12, -6), (-13, -8), (-13, -9), (-12, -11), (-10, -12), (-9, -12), (-7, -11), (-6, -9), (-6, -6), (-7, 9)], [(3, -12), (-7, 9)], [(3, -12), (1, 9)], [(15, -12), (13, -11), (10, -8), (7, -4), (4, 2), (1, 9)]]),
-    (-12, 12, [[(-4, -6), (-6, -6), (-7, -7), (-7, -9), (-6, -11), (-4, -12), (-2, -12), (0, -11), (1, -9), (1, -6), (-1, 3), (-1, 6), (0, 8), (2, 9), (4, 9), (6, 8), (7, 6), (7, 4), (6, 3), (4, 3)], [(11, -9), (11, -11), (10, -12), (8, -12), (6, -11), (4, -9), (2, -6), (-2, 3), (-4, 6), (-6, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6)]]),
-    (-12, 11, [[(-7, -5), (-9, -6), (-10, -8), (-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4, -11), (-3, -9), (-3, -7), (-4, -3), (-5, 0), (-6, 4), (-6, 6), (-5, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3), (5, 1), (7, -5)], [(9, -12), (7, -5), (4, 5), (2, 11), (0, 16), (-2, 20), (-4, 21), (-5, 20), (-5, 18), (-4, 15), (-2, 12), (1, 9), (4, 7), (9, 4)]]),
-    (-10, 11, [[(3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9), (8, -5), (7, -2), (5, 2), (2, 5), (-2, 8), (-4, 9), (-7, 9), (-8, 8), (-8, 6), (-7, 5), (-4, 5), (-2, 6), (-1, 7), (0, 9), (0, 12), (-1, 15), (-2, 17), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-4, 12), (-1, 9), (2, 7), (8, 4)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(0, -14), (-8, 0)], [(0, -14), (8, 0)]]),
-    (-11, 9, [[(-11, 16), (9, 16)]]),
-    (-4, 4, [[(1, -7), (-1, -5), (-1, -3), (0, -2), (1, -3), (0, -4), (-1, -3)]]),
-    (-6, 10, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6), (4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-5, 9, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 2), (-4, 8), (-3, 9), (-2, 9), (0, 8), (2, 6), (3, 3), (3, 0), (4, 4), (5, 5), (7, 5), (9, 4)]]),
-    (-5, 6, [[(2, 2), (2, 1), (1, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (4, 7), (6, 4)]]),
-    (-6, 10, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6), (8, -12)], [(4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-4, 6, [[(-3, 7), (-1, 6), (0, 5), (1, 3), (1, 1), (0, 0), (-1, 0), (-3, 1), (-4, 3), (-4, 6), (-3, 8), (-1, 9), (1, 9), (3, 8), (4, 7), (6, 4)]]),
-    (-3, 5, [[(-3, 4), (1, -1), (3, -4), (4, -6), (5, -9), (5, -11), (4, -12), (2, -11), (1, -9), (-1, -1), (-4, 8), (-7, 15), (-8, 18), (-8, 20), (-7, 21), (-5, 20), (-4, 17), (-3, 8), (-2, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-6, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7)], [(4, 0), (2, 7), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-5, 10, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1), (-5, 9)], [(-5, 9), (-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-2, 5, [[(1, -5), (1, -4), (2, -4), (2, -5), (1, -5)], [(-2, 4), (0, 0), (-2, 6), (-2, 8), (-1, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-2, 5, [[(1, -5), (1, -4), (2, -4), (2, -5), (1, -5)], [(-2, 4), (0, 0), (-6, 18), (-7, 20), (-9, 21), (-10, 20), (-10, 18), (-9, 15), (-6, 12), (-3, 10), (-1, 9), (2, 7), (5, 4)]]),
-    (-5, 9, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1), (-5, 9)], [(-5, 9), (-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (2, 4), (-1, 4)], [(-1, 4), (1, 5), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-3, 5, [[(-3, 4), (-1, 1), (2, -4), (3, -6), (4, -9), (4, -11), (3, -12), (1, -11), (0, -9), (-1, -5), (-2, 2), (-2, 8), (-1, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-13, 12, [[(-13, 4), (-11, 1), (-9, 0), (-8, 1), (-8, 2), (-9, 6), (-10, 9)], [(-9, 6), (-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 2), (-2, 6), (-3, 9)], [(-2, 6), (-1, 4), (1, 1), (3, 0), (5, 0), (6, 1), (6, 3), (5, 6), (5, 8), (6, 9), (7, 9), (9, 8), (10, 7), (12, 4)]]),
-    (-8, 10, [[(-8, 4), (-6, 1), (-4, 0), (-3, 1), (-3, 2), (-4, 6), (-5, 9)], [(-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-6, 8, [[(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (3, 3), (2, 1), (0, 0), (-1, 1), (-1, 3), (0, 5), (2, 6), (5, 6), (7, 5), (8, 4)]]),
-    (-7, 8, [[(-7, 4), (-5, 1), (-4, -1), (-5, 3), (-11, 21)], [(-5, 3), (-4, 1), (-2, 0), (0, 0), (2, 1), (3, 3), (3, 5), (2, 7), (1, 8), (-1, 9)], [(-5, 8), (-3, 9), (0, 9), (3, 8), (5, 7), (8, 4)]]),
-    (-6, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8)], [(4, 0), (3, 3), (1, 8), (-2, 15), (-3, 18), (-3, 20), (-2, 21), (0, 20), (1, 17), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-5, 8, [[(-5, 4), (-3, 1), (-2, -1), (-2, 1), (1, 1), (2, 2), (2, 4), (1, 7), (1, 8), (2, 9), (3, 9), (5, 8), (6, 7), (8, 4)]]),
-    (-4, 7, [[(-4, 4), (-2, 1), (-1, -1), (-1, 1), (1, 4), (2, 6), (2, 8), (0, 9)], [(-4, 8), (-2, 9), (2, 9), (4, 8), (5, 7), (7, 4)]]),
-    (-3, 6, [[(-3, 4), (-1, 1), (1, -3)], [(4, -12), (-2, 6), (-2, 8), (-1, 9), (1, 9), (3, 8), (4, 7), (6, 4)], [(-2, -4), (5, -4)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-6, 6), (-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0), (2, 6), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-5, 5), (-5, 8), (-4, 9), (-3, 9), (0, 8), (2, 6), (3, 3), (3, 0)], [(3, 0), (4, 4), (5, 5), (7, 5), (9, 4)]]),
-    (-9, 12, [[(-6, 0), (-8, 2), (-9, 5), (-9, 7), (-8, 9), (-6, 9), (-4, 8), (-2, 6)], [(0, 0), (-2, 6), (-2, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0)], [(6, 0), (7, 4), (8, 5), (10, 5), (12, 4)]]),
-    (-8, 8, [[(-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 8), (0, 9), (3, 9), (6, 7), (8, 4)], [(5, 1), (4, 0), (2, 0), (1, 1), (-3, 8), (-4, 9), (-6, 9), (-7, 8)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-6, 6), (-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-6, 8, [[(-6, 4), (-4, 1), (-2, 0), (0, 0), (2, 2), (2, 4), (1, 6), (-1, 8), (-4, 9), (-2, 10), (-1, 12), (-1, 15), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (5, 7), (8, 4)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-CYRILC_1 = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -9), (5, -8), (6, -7), (7, -8), (7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -12), (0, 0)], [(-5, -9), (5, -3)], [(5, -9), (-5, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8, -6), (7, -12)], [(-7, 9), (0, 9)]]),
-    (-12, 12, [[(-4, -12), (-4, -6), (-5, 2), (-6, 6), (-7, 8), (-8, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-7, -12), (10, -12)], [(-11, 9), (10, 9)], [(-11, 9), (-11, 16)], [(-10, 9), (-11, 16)], [(9, 9), (10, 16)], [(10, 9), (10, 16)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-15, 16, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-11, -11), (-10, -10), (-11, -9), (-12, -10), (-12, -11), (-11, -12), (-10, -12), (-9, -11), (-8, -9), (-7, -5), (-6, -3), (-4, -2), (5, -2), (7, -3), (8, -5), (9, -9), (10, -11), (11, -12), (12, -12), (13, -11), (13, -10), (12, -9), (11, -10), (12, -11)], [(-4, -2), (-6, -1), (-7, 1), (-8, 6), (-9, 8), (-10, 9)], [(-4, -2), (-5, -1), (-6, 1), (-7, 6), (-8, 8), (-9, 9), (-11, 9), (-12, 8), (-13, 6)], [(5, -2), (7, -1), (8, 1), (9, 6), (10, 8), (11, 9)], [(5, -2), (6, -1), (7, 1), (8, 6), (9, 8), (10, 9), (12, 9), (13, 8), (14, 6)], [(-3, 9), (4, 9)]]),
-    (-10, 10, [[(-6, -9), (-7, -12), (-7, -6), (-6, -9), (-4, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-3, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(6, -10), (-6, 7)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(6, -10), (-6, 7)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)], [(-4, -18), (-4, -19), (-5, -19), (-5, -18), (-4, -16), (-2, -15), (2, -15), (4, -16), (5, -18)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(-10, -12), (-3, -12)], [(-6, -2), (1, -2), (3, -3), (4, -5), (5, -9), (6, -11), (7, -12), (8, -12), (9, -11), (9, -10), (8, -9), (7, -10), (8, -11)], [(1, -2), (3, -1), (4, 1), (5, 6), (6, 8), (7, 9)], [(1, -2), (2, -1), (3, 1), (4, 6), (5, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-10, 9), (-3, 9)]]),
-    (-13, 12, [[(-5, -12), (-5, -6), (-6, 2), (-7, 6), (-8, 8), (-9, 9), (-10, 9), (-11, 8), (-11, 7), (-10, 6), (-9, 7), (-10, 8)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-8, -12), (10, -12)], [(3, 9), (10, 9)]]),
-    (-12, 13, [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]),
-    (-11, 10, [[(6, -9), (7, -6), (7, -12), (6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-9, 10, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]),
-    (-10, 11, [[(-7, -12), (0, 4)], [(-6, -12), (1, 4)], [(8, -12), (1, 4), (-1, 7), (-2, 8), (-4, 9), (-5, 9), (-6, 8), (-6, 7), (-5, 6), (-4, 7), (-5, 8)], [(-9, -12), (-3, -12)], [(4, -12), (10, -12)]]),
-    (-12, 13, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-2, -9), (-6, -8), (-8, -6), (-9, -3), (-9, 0), (-8, 3), (-6, 5), (-2, 6), (3, 6), (7, 5), (9, 3), (10, 0), (10, -3), (9, -6), (7, -8), (3, -9), (-2, -9)], [(-2, -9), (-5, -8), (-7, -6), (-8, -3), (-8, 0), (-7, 3), (-5, 5), (-2, 6)], [(3, 6), (6, 5), (8, 3), (9, 0), (9, -3), (8, -6), (6, -8), (3, -9)], [(-3, 9), (4, 9)]]),
-    (-10, 10, [[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-10, 9), (10, 9)], [(9, 9), (10, 16)], [(10, 9), (10, 16)]]),
-    (-12, 11, [[(-7, -12), (-7, -1), (-6, 1), (-3, 2), (0, 2), (3, 1), (5, -1)], [(-6, -12), (-6, -1), (-5, 1), (-3, 2)], [(5, -12), (5, 9)], [(6, -12), (6, 9)], [(-10, -12), (-3, -12)], [(2, -12), (9, -12)], [(2, 9), (9, 9)]]),
-    (-16, 17, [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12), (0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)], [(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)], [(-14, 9), (15, 9)]]),
-    (-16, 17, [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12), (0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)], [(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)], [(-14, 9), (15, 9)], [(14, 9), (15, 16)], [(15, 9), (15, 16)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 5, [[(1, -12), (0, -11), (-1, -9), (-1, -7), (0, -6), (1, -7), (0, -8)]]),
-    (-9, 11, [[(-4, -3), (-4, -2), (-5, -2), (-5, -3), (-4, -4), (-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(5, -3), (5, 6), (6, 8), (8, 9), (9, 9)], [(5, -1), (4, 0), (-2, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(-2, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-10, 10, [[(6, -12), (5, -11), (-1, -9), (-4, -7), (-6, -4), (-7, -1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1)], [(6, -12), (5, -10), (3, -9), (-1, -8), (-4, -6), (-6, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]),
-    (-10, 10, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (3, -5), (6, -4), (7, -2), (7, -1), (6, 1), (3, 2)], [(3, -5), (5, -4), (6, -2), (6, -1), (5, 1), (3, 2)], [(-4, 2), (3, 2), (6, 3), (7, 5), (7, 6), (6, 8), (3, 9), (-8, 9)], [(3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (3, 9)]]),
-    (-10, 8, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (6, -5), (6, 0), (5, -5)], [(-8, 9), (-1, 9)]]),
-    (-12, 11, [[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5), (9, -5)], [(-9, 9), (-10, 14), (-10, 9), (9, 9), (9, 14), (8, 9)]]),
-    (-10, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 1), (5, -2), (4, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-13, 14, [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (4, -5)], [(-8, -4), (-9, -3), (-10, -4), (-9, -5), (-8, -5), (-7, -4), (-5, 0), (-4, 1), (-2, 2), (3, 2), (5, 1), (6, 0), (8, -4), (9, -5), (10, -5), (11, -4), (10, -3), (9, -4)], [(-2, 2), (-4, 3), (-5, 4), (-7, 8), (-8, 9)], [(-2, 2), (-4, 4), (-6, 8), (-7, 9), (-9, 9), (-10, 8), (-11, 6)], [(3, 2), (5, 3), (6, 4), (8, 8), (9, 9)], [(3, 2), (5, 4), (7, 8), (8, 9), (10, 9), (11, 8), (12, 6)], [(-3, 9), (4, 9)]]),
-    (-9, 9, [[(-5, -3), (-6, -5), (-6, -1), (-5, -3), (-4, -4), (-2, -5), (2, -5), (5, -4), (6, -2), (6, -1), (5, 1), (2, 2)], [(2, -5), (4, -4), (5, -2), (5, -1), (4, 1), (2, 2)], [(-1, 2), (2, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(2, 2), (4, 3), (5, 5), (5, 6), (4, 8), (2, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)], [(5, -4), (-5, 8)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)], [(5, -4), (-5, 8)], [(-3, -11), (-3, -12), (-4, -12), (-4, -11), (-3, -9), (-1, -8), (1, -8), (3, -9), (4, -11)]]),
-    (-10, 10, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (-1, -5)], [(-4, 2), (-2, 2), (1, 1), (2, 0), (4, -4), (5, -5), (6, -5), (7, -4), (6, -3), (5, -4)], [(-2, 2), (1, 3), (2, 4), (4, 8), (5, 9)], [(-2, 2), (0, 3), (1, 4), (3, 8), (4, 9), (6, 9), (7, 8), (8, 6)], [(-8, 9), (-1, 9)]]),
-    (-11, 11, [[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9), (-8, 9), (-9, 8), (-8, 7), (-7, 8)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5), (9, -5)], [(2, 9), (9, 9)]]),
-    (-11, 12, [[(-6, -5), (-6, 9)], [(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9)], [(6, -5), (6, 9)], [(7, -5), (7, 9)], [(-9, -5), (-5, -5)], [(6, -5), (10, -5)], [(-9, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-5, 2), (5, 2)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-11, 10, [[(-6, -5), (-6, 16)], [(-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -5), (-5, -5)], [(-9, 16), (-2, 16)]]),
-    (-10, 9, [[(5, -2), (4, -1), (5, 0), (6, -1), (6, -2), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-9, 10, [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-5, -5), (-6, 0), (-6, -5), (7, -5), (7, 0), (6, -5)], [(-3, 9), (4, 9)]]),
-    (-9, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16), (-8, 15), (-7, 14), (-6, 15)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)]]),
-    (-10, 11, [[(0, -12), (0, 16)], [(1, -12), (1, 16)], [(-3, -12), (1, -12)], [(0, -2), (-1, -4), (-2, -5), (-4, -5), (-6, -4), (-7, -1), (-7, 5), (-6, 8), (-4, 9), (-2, 9), (-1, 8), (0, 6)], [(-4, -5), (-5, -4), (-6, -1), (-6, 5), (-5, 8), (-4, 9)], [(5, -5), (6, -4), (7, -1), (7, 5), (6, 8), (5, 9)], [(1, -2), (2, -4), (3, -5), (5, -5), (7, -4), (8, -1), (8, 5), (7, 8), (5, 9), (3, 9), (2, 8), (1, 6)], [(-3, 16), (4, 16)]]),
-    (-10, 10, [[(-6, -5), (5, 9)], [(-5, -5), (6, 9)], [(6, -5), (-6, 9)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)], [(2, 9), (8, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (9, 9), (9, 14), (8, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 2), (-5, 4), (-2, 5), (0, 5), (3, 4), (5, 2)], [(-5, -5), (-5, 2), (-4, 4), (-2, 5)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(2, 9), (9, 9)]]),
-    (-15, 16, [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11, 9)], [(-13, -5), (-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)], [(-13, 9), (14, 9)]]),
-    (-15, 16, [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11, 9)], [(-13, -5), (-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)], [(-13, 9), (14, 9), (14, 14), (13, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-]
-
-CYRILLIC = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-5, -5)], [(-3, -12), (-5, -5)], [(4, -12), (3, -5)], [(5, -12), (3, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-15, 15, [[(-10, -12), (-10, 9)], [(-9, -12), (-9, 9)], [(-13, -12), (-6, -12)], [(-9, -2), (-2, -2), (1, -1), (2, 0), (3, 2), (3, 5), (2, 7), (1, 8), (-2, 9), (-13, 9)], [(-2, -2), (0, -1), (1, 0), (2, 2), (2, 5), (1, 7), (0, 8), (-2, 9)], [(9, -12), (9, 9)], [(10, -12), (10, 9)], [(6, -12), (13, -12)], [(6, 9), (13, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (9, 9), (9, 14), (8, 9)]]),
-    (-13, 13, [[(-8, -5), (-8, 9)], [(-7, -5), (-7, 9)], [(-11, -5), (-4, -5)], [(-7, 2), (-3, 2), (0, 3), (1, 5), (1, 6), (0, 8), (-3, 9), (-11, 9)], [(-3, 2), (-1, 3), (0, 5), (0, 6), (-1, 8), (-3, 9)], [(7, -5), (7, 9)], [(8, -5), (8, 9)], [(4, -5), (11, -5)], [(4, 9), (11, 9)]]),
-    (-4, 4, [[(0, -12), (-1, -5)], [(1, -12), (-1, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16), (4, 16)], [(3, -16), (4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16), (-3, 16)], [(-4, -16), (-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-10, 11, [[(-6, -9), (-7, -12), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (1, 9)], [(-2, -2), (7, -2)]]),
-    (-12, 12, [[(-4, -12), (-4, -6), (-5, 2), (-6, 6), (-7, 8), (-8, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-7, -12), (10, -12)], [(-11, 9), (10, 9)], [(-11, 9), (-11, 16)], [(-10, 9), (-11, 16)], [(9, 9), (10, 16)], [(10, 9), (10, 16)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(6, -10), (-6, 7)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-12, 13, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-2, -9), (-6, -8), (-8, -6), (-9, -3), (-9, 0), (-8, 3), (-6, 5), (-2, 6), (3, 6), (7, 5), (9, 3), (10, 0), (10, -3), (9, -6), (7, -8), (3, -9), (-2, -9)], [(-2, -9), (-5, -8), (-7, -6), (-8, -3), (-8, 0), (-7, 3), (-5, 5), (-2, 6)], [(3, 6), (6, 5), (8, 3), (9, 0), (9, -3), (8, -6), (6, -8), (3, -9)], [(-3, 9), (4, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8, -6), (7, -12)], [(-7, 9), (0, 9)]]),
-    (-15, 16, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-11, -11), (-10, -10), (-11, -9), (-12, -10), (-12, -11), (-11, -12), (-10, -12), (-9, -11), (-8, -9), (-7, -5), (-6, -3), (-4, -2), (5, -2), (7, -3), (8, -5), (9, -9), (10, -11), (11, -12), (12, -12), (13, -11), (13, -10), (12, -9), (11, -10), (12, -11)], [(-4, -2), (-6, -1), (-7, 1), (-8, 6), (-9, 8), (-10, 9)], [(-4, -2), (-5, -1), (-6, 1), (-7, 6), (-8, 8), (-9, 9), (-11, 9), (-12, 8), (-13, 6)], [(5, -2), (7, -1), (8, 1), (9, 6), (10, 8), (11, 9)], [(5, -2), (6, -1), (7, 1), (8, 6), (9, 8), (10, 9), (12, 9), (13, 8), (14, 6)], [(-3, 9), (4, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(6, -10), (-6, 7)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-12, 11, [[(-7, -12), (-7, -1), (-6, 1), (-3, 2), (0, 2), (3, 1), (5, -1)], [(-6, -12), (-6, -1), (-5, 1), (-3, 2)], [(5, -12), (5, 9)], [(6, -12), (6, 9)], [(-10, -12), (-3, -12)], [(2, -12), (9, -12)], [(2, 9), (9, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(-10, -12), (-3, -12)], [(-6, -2), (1, -2), (3, -3), (4, -5), (5, -9), (6, -11), (7, -12), (8, -12), (9, -11), (9, -10), (8, -9), (7, -10), (8, -11)], [(1, -2), (3, -1), (4, 1), (5, 6), (6, 8), (7, 9)], [(1, -2), (2, -1), (3, 1), (4, 6), (5, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-10, 9), (-3, 9)]]),
-    (-13, 12, [[(-5, -12), (-5, -6), (-6, 2), (-7, 6), (-8, 8), (-9, 9), (-10, 9), (-11, 8), (-11, 7), (-10, 6), (-9, 7), (-10, 8)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-8, -12), (10, -12)], [(3, 9), (10, 9)]]),
-    (-12, 13, [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-16, 17, [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12), (0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)], [(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)], [(-14, 9), (15, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]),
-    (-11, 10, [[(6, -9), (7, -6), (7, -12), (6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-9, 10, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]),
-    (-15, 16, [[(-10, -12), (-10, 9)], [(-9, -12), (-9, 9)], [(-13, -12), (-6, -12)], [(-13, 9), (-6, 9)], [(4, -12), (1, -11), (-1, -9), (-2, -7), (-3, -3), (-3, 0), (-2, 4), (-1, 6), (1, 8), (4, 9), (6, 9), (9, 8), (11, 6), (12, 4), (13, 0), (13, -3), (12, -7), (11, -9), (9, -11), (6, -12), (4, -12)], [(4, -12), (2, -11), (0, -9), (-1, -7), (-2, -3), (-2, 0), (-1, 4), (0, 6), (2, 8), (4, 9)], [(6, 9), (8, 8), (10, 6), (11, 4), (12, 0), (12, -3), (11, -7), (10, -9), (8, -11), (6, -12)], [(-9, -2), (-3, -2)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-16, 17, [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12), (0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)], [(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)], [(-14, 9), (15, 9)], [(14, 9), (15, 16)], [(15, 9), (15, 16)]]),
-    (-10, 10, [[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-10, 11, [[(-7, -12), (0, 4)], [(-6, -12), (1, 4)], [(8, -12), (1, 4), (-1, 7), (-2, 8), (-4, 9), (-5, 9), (-6, 8), (-6, 7), (-5, 6), (-4, 7), (-5, 8)], [(-9, -12), (-3, -12)], [(4, -12), (10, -12)]]),
-    (-10, 10, [[(-6, -9), (-7, -12), (-7, -6), (-6, -9), (-4, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-3, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-12, 14, [[(-2, -12), (-2, 9)], [(-1, -12), (-1, 9)], [(-9, -12), (-10, -6), (-10, -12), (2, -12)], [(-1, -2), (6, -2), (9, -1), (10, 0), (11, 2), (11, 5), (10, 7), (9, 8), (6, 9), (-5, 9)], [(6, -2), (8, -1), (9, 0), (10, 2), (10, 5), (9, 7), (8, 8), (6, 9)]]),
-    (-11, 11, [[(5, -12), (5, 9)], [(6, -12), (6, 9)], [(9, -12), (-3, -12), (-6, -11), (-7, -10), (-8, -8), (-8, -6), (-7, -4), (-6, -3), (-3, -2), (5, -2)], [(-3, -12), (-5, -11), (-6, -10), (-7, -8), (-7, -6), (-6, -4), (-5, -3), (-3, -2)], [(0, -2), (-2, -1), (-3, 0), (-6, 7), (-7, 8), (-8, 8), (-9, 7)], [(-2, -1), (-3, 1), (-5, 8), (-6, 9), (-8, 9), (-9, 7), (-9, 6)], [(2, 9), (9, 9)]]),
-    (-10, 11, [[(-5, -12), (-5, 9)], [(-4, -12), (-4, 9)], [(-8, -12), (-1, -12)], [(-4, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-8, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-10, 9), (10, 9)], [(9, 9), (10, 16)], [(10, 9), (10, 16)]]),
-    (-9, 11, [[(-4, -3), (-4, -2), (-5, -2), (-5, -3), (-4, -4), (-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(5, -3), (5, 6), (6, 8), (8, 9), (9, 9)], [(5, -1), (4, 0), (-2, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(-2, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-10, 10, [[(6, -12), (5, -11), (-1, -9), (-4, -7), (-6, -4), (-7, -1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1)], [(6, -12), (5, -10), (3, -9), (-1, -8), (-4, -6), (-6, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]),
-    (-10, 11, [[(-6, -9), (-7, -12), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (1, 9)], [(-2, -2), (7, -2)]]),
-    (-12, 11, [[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5), (9, -5)], [(-9, 9), (-10, 14), (-10, 9), (9, 9), (9, 14), (8, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)], [(5, -4), (-5, 8)], [(-3, -11), (-3, -12), (-4, -12), (-4, -11), (-3, -9), (-1, -8), (1, -8), (3, -9), (4, -11)]]),
-    (-10, 11, [[(0, -12), (0, 16)], [(1, -12), (1, 16)], [(-3, -12), (1, -12)], [(0, -2), (-1, -4), (-2, -5), (-4, -5), (-6, -4), (-7, -1), (-7, 5), (-6, 8), (-4, 9), (-2, 9), (-1, 8), (0, 6)], [(-4, -5), (-5, -4), (-6, -1), (-6, 5), (-5, 8), (-4, 9)], [(5, -5), (6, -4), (7, -1), (7, 5), (6, 8), (5, 9)], [(1, -2), (2, -4), (3, -5), (5, -5), (7, -4), (8, -1), (8, 5), (7, 8), (5, 9), (3, 9), (2, 8), (1, 6)], [(-3, 16), (4, 16)]]),
-    (-10, 8, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (6, -5), (6, 0), (5, -5)], [(-8, 9), (-1, 9)]]),
-    (-13, 14, [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (4, -5)], [(-8, -4), (-9, -3), (-10, -4), (-9, -5), (-8, -5), (-7, -4), (-5, 0), (-4, 1), (-2, 2), (3, 2), (5, 1), (6, 0), (8, -4), (9, -5), (10, -5), (11, -4), (10, -3), (9, -4)], [(-2, 2), (-4, 3), (-5, 4), (-7, 8), (-8, 9)], [(-2, 2), (-4, 4), (-6, 8), (-7, 9), (-9, 9), (-10, 8), (-11, 6)], [(3, 2), (5, 3), (6, 4), (8, 8), (9, 9)], [(3, 2), (5, 4), (7, 8), (8, 9), (10, 9), (11, 8), (12, 6)], [(-3, 9), (4, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)], [(5, -4), (-5, 8)]]),
-    (-11, 11, [[(-6, -5), (-6, 2), (-5, 4), (-2, 5), (0, 5), (3, 4), (5, 2)], [(-5, -5), (-5, 2), (-4, 4), (-2, 5)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(2, 9), (9, 9)]]),
-    (-10, 10, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (-1, -5)], [(-4, 2), (-2, 2), (1, 1), (2, 0), (4, -4), (5, -5), (6, -5), (7, -4), (6, -3), (5, -4)], [(-2, 2), (1, 3), (2, 4), (4, 8), (5, 9)], [(-2, 2), (0, 3), (1, 4), (3, 8), (4, 9), (6, 9), (7, 8), (8, 6)], [(-8, 9), (-1, 9)]]),
-    (-11, 11, [[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9), (-8, 9), (-9, 8), (-8, 7), (-7, 8)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5), (9, -5)], [(2, 9), (9, 9)]]),
-    (-11, 12, [[(-6, -5), (-6, 9)], [(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9)], [(6, -5), (6, 9)], [(7, -5), (7, 9)], [(-9, -5), (-5, -5)], [(6, -5), (10, -5)], [(-9, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-5, 2), (5, 2)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-15, 16, [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11, 9)], [(-13, -5), (-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)], [(-13, 9), (14, 9)]]),
-    (-11, 10, [[(-6, -5), (-6, 16)], [(-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -5), (-5, -5)], [(-9, 16), (-2, 16)]]),
-    (-10, 9, [[(5, -2), (4, -1), (5, 0), (6, -1), (6, -2), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-9, 10, [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-5, -5), (-6, 0), (-6, -5), (7, -5), (7, 0), (6, -5)], [(-3, 9), (4, 9)]]),
-    (-14, 15, [[(-9, -5), (-9, 9)], [(-8, -5), (-8, 9)], [(-12, -5), (-5, -5)], [(-12, 9), (-5, 9)], [(4, -5), (1, -4), (-1, -2), (-2, 1), (-2, 3), (-1, 6), (1, 8), (4, 9), (6, 9), (9, 8), (11, 6), (12, 3), (12, 1), (11, -2), (9, -4), (6, -5), (4, -5)], [(4, -5), (2, -4), (0, -2), (-1, 1), (-1, 3), (0, 6), (2, 8), (4, 9)], [(6, 9), (8, 8), (10, 6), (11, 3), (11, 1), (10, -2), (8, -4), (6, -5)], [(-8, 2), (-2, 2)]]),
-    (-10, 10, [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (3, -5), (6, -4), (7, -2), (7, -1), (6, 1), (3, 2)], [(3, -5), (5, -4), (6, -2), (6, -1), (5, 1), (3, 2)], [(-4, 2), (3, 2), (6, 3), (7, 5), (7, 6), (6, 8), (3, 9), (-8, 9)], [(3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (3, 9)]]),
-    (-15, 16, [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11, 9)], [(-13, -5), (-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)], [(-13, 9), (14, 9), (14, 14), (13, 9)]]),
-    (-10, 10, [[(-6, -5), (5, 9)], [(-5, -5), (6, 9)], [(6, -5), (-6, 9)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)], [(2, 9), (8, 9)]]),
-    (-9, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16), (-8, 15), (-7, 14), (-6, 15)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)]]),
-    (-9, 9, [[(-5, -3), (-6, -5), (-6, -1), (-5, -3), (-4, -4), (-2, -5), (2, -5), (5, -4), (6, -2), (6, -1), (5, 1), (2, 2)], [(2, -5), (4, -4), (5, -2), (5, -1), (4, 1), (2, 2)], [(-1, 2), (2, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(2, 2), (4, 3), (5, 5), (5, 6), (4, 8), (2, 9)]]),
-    (-10, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 1), (5, -2), (4, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-10, 11, [[(-1, -5), (-1, 9)], [(0, -5), (0, 9)], [(-6, -5), (-7, 0), (-7, -5), (3, -5)], [(0, 2), (4, 2), (7, 3), (8, 5), (8, 6), (7, 8), (4, 9), (-4, 9)], [(4, 2), (6, 3), (7, 5), (7, 6), (6, 8), (4, 9)]]),
-    (-11, 10, [[(4, -5), (4, 9)], [(5, -5), (5, 9)], [(8, -5), (-3, -5), (-6, -4), (-7, -2), (-7, -1), (-6, 1), (-3, 2), (4, 2)], [(-3, -5), (-5, -4), (-6, -2), (-6, -1), (-5, 1), (-3, 2)], [(2, 2), (-1, 3), (-2, 4), (-4, 8), (-5, 9)], [(2, 2), (0, 3), (-1, 4), (-3, 8), (-4, 9), (-6, 9), (-7, 8), (-8, 6)], [(1, 9), (8, 9)]]),
-    (-8, 9, [[(-3, -5), (-3, 9)], [(-2, -5), (-2, 9)], [(-6, -5), (1, -5)], [(-2, 2), (2, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-6, 9)], [(2, 2), (4, 3), (5, 5), (5, 6), (4, 8), (2, 9)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-FUTURAL = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8, 0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9), (10, 8), (10, 7)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (0, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (0, 9), (-7, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 8, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 1)], [(3, 1), (8, 1)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-8, 8, [[(4, -12), (4, 4), (3, 7), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4), (-6, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, 9), (6, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(1, 5), (7, 11)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2), (-7, -2)], [(0, -2), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)]]),
-    (-9, 9, [[(-8, -12), (0, 9)], [(8, -12), (0, 9)]]),
-    (-12, 12, [[(-10, -12), (-5, 9)], [(0, -12), (-5, 9)], [(0, -12), (5, 9)], [(10, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(7, -12), (-7, 9)]]),
-    (-9, 9, [[(-8, -12), (0, -2), (0, 9)], [(8, -12), (0, -2)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(0, -14), (-8, 0)], [(0, -14), (8, 0)]]),
-    (-9, 9, [[(-9, 16), (9, 16)]]),
-    (-4, 4, [[(1, -7), (-1, -5), (-1, -3), (0, -2), (1, -3), (0, -4), (-1, -3)]]),
-    (-9, 10, [[(6, -5), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-5, 7, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(6, -5), (6, 11), (5, 14), (4, 15), (2, 16), (-1, 16), (-3, 15)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-4, 4, [[(-1, -12), (0, -11), (1, -12), (0, -13), (-1, -12)], [(0, -5), (0, 9)]]),
-    (-5, 5, [[(0, -12), (1, -11), (2, -12), (1, -13), (0, -12)], [(1, -5), (1, 12), (0, 15), (-2, 16), (-4, 16)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(-1, 1), (6, 9)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-15, 15, [[(-11, -5), (-11, 9)], [(-11, -1), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -1), (0, 9)], [(0, -1), (3, -4), (5, -5), (8, -5), (10, -4), (11, -1), (11, 9)]]),
-    (-9, 10, [[(-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)]]),
-    (-10, 9, [[(-6, -5), (-6, 16)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 10, [[(6, -5), (6, 16)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-7, 6, [[(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 7, [[(0, -12), (0, 5), (1, 8), (3, 9), (5, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(-5, -5), (-5, 5), (-4, 8), (-2, 9), (1, 9), (3, 8), (6, 5)], [(6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9)]]),
-    (-11, 11, [[(-8, -5), (-4, 9)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)], [(8, -5), (4, 9)]]),
-    (-8, 9, [[(-5, -5), (6, 9)], [(6, -5), (-5, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16)]]),
-    (-8, 9, [[(6, -5), (-5, 9)], [(-5, -5), (6, -5)], [(-5, 9), (6, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-FUTURAM = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(0, -12), (0, 2), (1, 2)], [(0, -12), (1, -12), (1, 2)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-9, 10, [[(0, -16), (0, 13), (1, 13)], [(0, -16), (1, -16), (1, 13)], [(5, -9), (7, -9), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-6, -7), (-5, -5), (-4, -4), (4, 0), (5, 1), (6, 3), (6, 5), (5, 7), (2, 8), (-1, 8), (-3, 7), (-4, 6)], [(5, -9), (4, -10), (2, -11), (-1, -11), (-4, -10), (-5, -9), (-5, -7), (-4, -5), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-4, 6)], [(6, 6), (3, 8)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-4, 5, [[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11), (0, -5)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 6, [[(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-3, -11), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-3, 8)], [(-4, 7), (-1, 8), (1, 8), (4, 7)], [(3, 8), (5, 5), (6, 0), (6, -3), (5, -8), (3, -11)], [(4, -10), (1, -11), (-1, -11), (-4, -10)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(-4, -8), (-4, -7), (-2, -8), (0, -10), (0, 9), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-6, 9)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-2, -11), (2, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -1), (-7, 9)], [(-6, 8), (7, 8), (7, 9)], [(-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (-1, -3)], [(-5, -12), (-5, -11), (5, -11)], [(5, -12), (-2, -3)], [(-1, -4), (1, -4), (4, -3), (6, -1), (7, 2), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-6, 5)], [(-2, -3), (1, -3), (4, -2), (6, 1)], [(2, -3), (5, -1), (6, 2), (6, 3), (5, 6), (2, 8)], [(6, 4), (4, 7), (1, 8), (-2, 8), (-5, 7), (-6, 5)], [(-3, 8), (-6, 6)]]),
-    (-10, 10, [[(3, -9), (3, 9), (4, 9)], [(4, -12), (4, 9)], [(4, -12), (-7, 4), (8, 4)], [(3, -9), (-6, 4)], [(-6, 3), (8, 3), (8, 4)]]),
-    (-10, 10, [[(-5, -12), (-6, -3)], [(-4, -11), (-5, -4)], [(-5, -12), (5, -12), (5, -11)], [(-4, -11), (5, -11)], [(-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-6, 5)], [(-6, -3), (-5, -3), (-3, -4), (1, -4), (4, -3), (6, 0)], [(2, -4), (5, -2), (6, 1), (6, 3), (5, 6), (2, 8)], [(6, 4), (4, 7), (1, 8), (-2, 8), (-5, 7), (-6, 5)], [(-3, 8), (-6, 6)]]),
-    (-10, 10, [[(4, -11), (5, -9), (6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1)], [(5, -10), (2, -11), (0, -11), (-3, -10)], [(-2, -11), (-4, -8), (-5, -3), (-5, 2), (-4, 6), (-1, 8)], [(-5, 4), (-3, 7), (0, 8), (1, 8), (4, 7), (6, 4)], [(2, 8), (5, 6), (6, 3), (6, 2), (5, -1), (2, -3)], [(6, 1), (4, -2), (1, -3), (0, -3), (-3, -2), (-5, 1)], [(-1, -3), (-4, -1), (-5, 2)]]),
-    (-10, 10, [[(-7, -12), (7, -12), (-3, 9)], [(-7, -12), (-7, -11), (6, -11)], [(6, -12), (-4, 9), (-3, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-4, -4), (-2, -3), (2, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (2, 8), (-2, 8), (-5, 7), (-6, 5), (-6, 2), (-5, 0), (-4, -1), (-2, -2), (2, -3), (4, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-4, -11), (-5, -9), (-5, -7), (-4, -5), (-2, -4), (2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-2, -3), (2, -4), (4, -5), (5, -7), (5, -9), (4, -11)], [(5, -10), (2, -11), (-2, -11), (-5, -10)], [(-6, 6), (-3, 8)], [(3, 8), (6, 6)]]),
-    (-10, 10, [[(5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6), (-5, 6), (-4, 8)], [(5, -5), (4, -2), (1, 0)], [(5, -4), (3, -1), (0, 0), (-1, 0), (-4, -1), (-6, -4)], [(-2, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-2, -11)], [(-6, -7), (-4, -10), (-1, -11), (0, -11), (3, -10), (5, -7)], [(1, -11), (4, -9), (5, -5), (5, 0), (4, 5), (2, 8)], [(3, 7), (0, 8), (-2, 8), (-5, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-1, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2), (0, -1)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-1, -11), (2, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -3), (0, -2)], [(-5, -9), (-2, -11)], [(3, -11), (6, -9)], [(6, -5), (2, -2)], [(0, -2), (0, 2), (1, 2), (1, -2)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-8, 9)], [(0, -9), (-7, 9), (-8, 9)], [(0, -9), (7, 9), (8, 9)], [(0, -12), (8, 9)], [(-5, 3), (5, 3)], [(-6, 4), (6, 4)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-6, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1)], [(-5, -11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2)], [(-5, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-6, 9)], [(-5, -1), (2, -1), (5, 0), (6, 2), (6, 5), (5, 7), (2, 8), (-5, 8)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)], [(8, -7), (7, -7), (6, -9), (5, -10), (3, -11), (-1, -11), (-3, -10), (-5, -7), (-6, -4), (-6, 1), (-5, 4), (-3, 7), (-1, 8), (3, 8), (5, 7), (6, 6), (7, 4), (8, 4)]]),
-    (-10, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-6, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-6, 9)], [(-5, -11), (1, -11), (4, -10), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (4, 7), (1, 8), (-5, 8)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-4, -11), (-4, 8)], [(-5, -12), (7, -12)], [(-4, -11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)], [(-4, -1), (2, -1)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]),
-    (-9, 9, [[(-5, -12), (-5, 9)], [(-4, -11), (-4, 9), (-5, 9)], [(-5, -12), (7, -12)], [(-4, -11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)], [(-4, -1), (2, -1)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 0), (3, 0)], [(8, -7), (7, -7), (6, -9), (5, -10), (3, -11), (-1, -11), (-3, -10), (-4, -9), (-5, -7), (-6, -4), (-6, 1), (-5, 4), (-4, 6), (-3, 7), (-1, 8), (3, 8), (5, 7), (6, 6), (7, 4), (7, 1), (3, 1), (3, 0)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (-6, -12), (-6, 9), (-7, 9)], [(7, -12), (6, -12), (6, 9), (7, 9)], [(7, -12), (7, 9)], [(-6, -2), (6, -2)], [(-6, -1), (6, -1)]]),
-    (-4, 5, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)]]),
-    (-8, 9, [[(4, -12), (4, 4), (3, 7), (1, 8), (-1, 8), (-3, 7), (-4, 4), (-5, 4)], [(4, -12), (5, -12), (5, 4), (4, 7), (3, 8), (1, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 4)]]),
-    (-10, 11, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(8, -12), (7, -12), (-5, 0)], [(8, -12), (-5, 1)], [(-2, -3), (7, 9), (8, 9)], [(-1, -3), (8, 9)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(-5, -12), (-4, -12), (-4, 8)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-7, -7), (-7, 9), (-8, 9)], [(-7, -7), (0, 9)], [(-8, -12), (0, 6)], [(8, -12), (0, 6)], [(7, -7), (0, 9)], [(7, -7), (7, 9), (8, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-6, -9), (-6, 9), (-7, 9)], [(-6, -9), (7, 9)], [(-7, -12), (6, 6)], [(6, -12), (6, 6)], [(6, -12), (7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1, -11), (-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11), (-1, -11)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1), (-5, -1)], [(-5, -11), (3, -11), (5, -10), (6, -8), (6, -5), (5, -3), (3, -2), (-5, -2)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1, -11), (-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11), (-1, -11)], [(1, 6), (6, 11), (7, 11)], [(1, 6), (2, 6), (7, 11)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-5, -1)], [(-5, -11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2), (-5, -2)], [(0, -1), (6, 9), (7, 9)], [(1, -1), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (2, -1), (4, 0), (5, 1), (6, 3), (6, 6), (5, 7), (2, 8), (-2, 8), (-4, 7), (-5, 6), (-7, 6)], [(7, -9), (5, -9), (4, -10), (2, -11), (-2, -11), (-5, -10), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (2, -2), (4, -1), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 9, [[(0, -11), (0, 9)], [(1, -11), (1, 9), (0, 9)], [(-6, -12), (7, -12), (7, -11)], [(-6, -12), (-6, -11), (7, -11)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)], [(-7, -12), (-6, -12), (-6, 3), (-5, 6), (-4, 7), (-1, 8), (1, 8), (4, 7), (5, 6), (6, 3), (6, -12), (7, -12)]]),
-    (-10, 10, [[(-8, -12), (0, 9)], [(-8, -12), (-7, -12), (0, 6)], [(8, -12), (7, -12), (0, 6)], [(8, -12), (0, 9)]]),
-    (-13, 13, [[(-11, -12), (-5, 9)], [(-11, -12), (-10, -12), (-5, 6)], [(0, -12), (-5, 6)], [(0, -9), (-5, 9)], [(0, -9), (5, 9)], [(0, -12), (5, 6)], [(11, -12), (10, -12), (5, 6)], [(11, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (6, 9), (7, 9)], [(-7, -12), (-6, -12), (7, 9)], [(7, -12), (6, -12), (-7, 9)], [(7, -12), (-6, 9), (-7, 9)]]),
-    (-9, 10, [[(-7, -12), (0, -2), (0, 9), (1, 9)], [(-7, -12), (-6, -12), (1, -2)], [(8, -12), (7, -12), (0, -2)], [(8, -12), (1, -2), (1, 9)]]),
-    (-10, 10, [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-7, -12), (7, -12)], [(-7, -12), (-7, -11), (6, -11)], [(-6, 8), (7, 8), (7, 9)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-10, 10, [[(5, -5), (5, 9), (6, 9)], [(5, -5), (6, -5), (6, 9)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-10, 10, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (-1, -5), (2, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (2, 9), (-1, 9), (-3, 8), (-5, 6)], [(-5, -2), (-1, -4), (2, -4), (4, -3), (5, -2), (6, 1), (6, 3), (5, 6), (4, 7), (2, 8), (-1, 8), (-5, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)], [(6, -2), (5, -1), (4, -3), (2, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 5), (6, 6)]]),
-    (-10, 10, [[(5, -12), (5, 9), (6, 9)], [(5, -12), (6, -12), (6, 9)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-9, 9, [[(-5, 2), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)], [(-5, 1), (5, 1), (5, -1), (4, -3), (2, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 5), (6, 6)]]),
-    (-6, 8, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9), (1, 9)], [(5, -12), (5, -11), (3, -11), (1, -10)], [(2, -11), (1, -8), (1, 9)], [(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4), (4, -4)]]),
-    (-10, 10, [[(6, -5), (5, -5), (5, 10), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-4, 13), (-6, 13)], [(6, -5), (6, 10), (5, 13), (3, 15), (1, 16), (-2, 16), (-4, 15), (-6, 13)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-10, 10, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)], [(-5, -1), (-2, -3), (0, -4), (2, -4), (4, -3), (5, -1), (5, 9), (6, 9)]]),
-    (-4, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -9), (2, -10), (2, -11), (1, -12), (0, -12)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(0, -5), (0, 9), (1, 9)], [(0, -5), (1, -5), (1, 9)]]),
-    (-4, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -9), (2, -10), (2, -11), (1, -12), (0, -12)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(0, -5), (0, 16), (1, 16)], [(0, -5), (1, -5), (1, 16)]]),
-    (-10, 9, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(6, -5), (5, -5), (-5, 5)], [(6, -5), (-5, 6)], [(-2, 2), (4, 9), (6, 9)], [(-1, 1), (6, 9)]]),
-    (-4, 5, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)]]),
-    (-15, 16, [[(-11, -5), (-11, 9), (-10, 9)], [(-11, -5), (-10, -5), (-10, 9)], [(-10, -1), (-7, -4), (-5, -5), (-2, -5), (0, -4), (1, -1), (1, 9)], [(-10, -1), (-7, -3), (-5, -4), (-3, -4), (-1, -3), (0, -1), (0, 9), (1, 9)], [(1, -1), (4, -4), (6, -5), (9, -5), (11, -4), (12, -1), (12, 9)], [(1, -1), (4, -3), (6, -4), (8, -4), (10, -3), (11, -1), (11, 9), (12, 9)]]),
-    (-10, 10, [[(-6, -5), (-6, 9), (-5, 9)], [(-6, -5), (-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)], [(-5, -1), (-2, -3), (0, -4), (2, -4), (4, -3), (5, -1), (5, 9), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)], [(-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 6), (6, 3), (6, 1), (5, -2), (4, -3), (2, -4), (-1, -4)]]),
-    (-10, 10, [[(-6, -5), (-6, 16), (-5, 16)], [(-6, -5), (-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1, -5), (2, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (2, 9), (-1, 9), (-3, 8), (-5, 6)], [(-5, -2), (-1, -4), (2, -4), (4, -3), (5, -2), (6, 1), (6, 3), (5, 6), (4, 7), (2, 8), (-1, 8), (-5, 6)]]),
-    (-10, 10, [[(5, -5), (5, 16), (6, 16)], [(5, -5), (6, -5), (6, 16)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-7, 7, [[(-3, -5), (-3, 9), (-2, 9)], [(-3, -5), (-2, -5), (-2, 9)], [(-2, 1), (-1, -2), (1, -4), (3, -5), (6, -5)], [(-2, 1), (-1, -1), (1, -3), (3, -4), (6, -4), (6, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 3), (5, 4)], [(4, 3), (5, 5), (5, 6), (4, 8)], [(5, 7), (2, 8), (-1, 8), (-4, 7)], [(-3, 8), (-4, 6), (-5, 6)], [(6, -2), (5, -2), (4, -4)], [(5, -3), (2, -4), (-1, -4), (-4, -3)], [(-3, -4), (-4, -2), (-3, 0)], [(-4, -1), (-2, 0), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 6, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)], [(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4), (4, -4)]]),
-    (-10, 10, [[(-6, -5), (-6, 5), (-5, 8), (-3, 9), (0, 9), (2, 8), (5, 5)], [(-6, -5), (-5, -5), (-5, 5), (-4, 7), (-2, 8), (0, 8), (2, 7), (5, 5)], [(5, -5), (5, 9), (6, 9)], [(5, -5), (6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(-6, -5), (-5, -5), (0, 7)], [(6, -5), (5, -5), (0, 7)], [(6, -5), (0, 9)]]),
-    (-12, 12, [[(-9, -5), (-4, 9)], [(-9, -5), (-8, -5), (-4, 6)], [(0, -5), (-4, 6)], [(0, -2), (-4, 9)], [(0, -2), (4, 9)], [(0, -5), (4, 6)], [(9, -5), (8, -5), (4, 6)], [(9, -5), (4, 9)]]),
-    (-9, 9, [[(-6, -5), (5, 9), (6, 9)], [(-6, -5), (-5, -5), (6, 9)], [(6, -5), (5, -5), (-6, 9)], [(6, -5), (-5, 9), (-6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(-6, -5), (-5, -5), (0, 7)], [(6, -5), (5, -5), (0, 7), (-4, 16)], [(6, -5), (0, 9), (-3, 16), (-4, 16)]]),
-    (-9, 9, [[(4, -4), (-6, 9)], [(6, -5), (-4, 8)], [(-6, -5), (6, -5)], [(-6, -5), (-6, -4), (4, -4)], [(-4, 8), (6, 8), (6, 9)], [(-6, 9), (6, 9)]]),
-    (-7, 7, [[(3, -16), (-4, 0), (3, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-3, -16), (4, 0), (-3, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-GOTHGBT = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-6, 6, [[(0, -6), (0, -8), (-2, -10), (0, -12), (1, -10), (1, -8), (0, -6), (-2, -5)], [(0, -11), (-1, -10), (0, -9), (0, -11)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 13, [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-11, 11, [[(-6, -9), (-4, -11), (-2, -12), (0, -12), (1, -11), (8, 5), (9, 6), (11, 6)], [(-1, -11), (0, -10), (7, 6), (8, 8), (9, 7), (7, 6)], [(-4, -11), (-2, -11), (-1, -10), (6, 6), (7, 8), (8, 9), (9, 9), (11, 6)], [(-6, -5), (-5, -6), (-3, -7), (-2, -7), (-1, -6)], [(-2, -6), (-2, -5)], [(-5, -6), (-3, -6), (-2, -4)], [(-11, 9), (-9, 7), (-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-4, 7), (-3, 8)], [(-11, 9), (-8, 8), (-5, 8), (-4, 9), (-2, 7)], [(0, -8), (-6, 6)], [(-4, 1), (4, 1)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (6, -12), (8, -11), (9, -9), (9, -7), (7, -5), (3, -3)], [(6, -11), (8, -9), (8, -7)], [(4, -11), (6, -10), (7, -9), (7, -6), (5, -4)], [(5, -4), (8, -2), (9, 0), (9, 6)], [(7, -2), (8, 0), (8, 5)], [(5, -4), (6, -3), (7, -1), (7, 6)], [(-8, 9), (-5, 7), (-2, 6), (2, 6), (5, 7)], [(-6, 8), (-3, 7), (2, 7), (4, 8)], [(-8, 9), (-4, 8), (1, 8), (3, 9), (5, 7), (7, 6), (9, 6)], [(3, -3), (3, 6)], [(3, 0), (7, 0)], [(3, 3), (7, 3)]]),
-    (-13, 11, [[(-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-8, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3)], [(-8, -7), (-9, -4), (-9, 1), (-7, 5), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 0), (-7, 3), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 3)], [(-2, -8), (-2, 4)], [(-1, -8), (-1, 2)], [(0, -9), (0, 1), (-1, 3), (-2, 4)], [(-2, -8), (0, -9), (3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11), (4, -10), (6, -10)], [(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)], [(5, -9), (5, 6)]]),
-    (-11, 12, [[(-9, -12), (5, -12), (7, -11), (8, -9), (8, 6)], [(-7, -11), (5, -11), (7, -9), (7, 5)], [(-9, -12), (-8, -11), (-6, -10), (5, -10), (6, -9), (6, 6)], [(-3, -7), (-4, -6), (-5, -4), (-5, -3), (-7, -3), (-8, -2), (-8, 0), (-7, -1), (-5, -1), (-5, 4)], [(-4, -5), (-4, 2)], [(-7, -2), (-4, -2)], [(-3, -7), (-3, 1), (-4, 3), (-5, 4)], [(-9, 9), (-6, 7), (-3, 6), (1, 6), (4, 7)], [(-7, 8), (-4, 7), (1, 7), (3, 8)], [(-9, 9), (-5, 8), (0, 8), (2, 9), (4, 7), (6, 6), (8, 6)], [(0, -10), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-11, 11, [[(-9, -10), (-7, -12), (-5, -12), (-3, -11), (-1, -12)], [(-6, -11), (-4, -11)], [(-9, -10), (-7, -11), (-5, -10), (-3, -10), (-1, -12)], [(-4, -7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)], [(-4, -7), (-4, 2), (-5, 4), (-6, 5)], [(-1, -5), (0, -8), (1, -10), (2, -11), (4, -12), (6, -12), (9, -11)], [(2, -10), (4, -11), (6, -11), (8, -10)], [(0, -8), (1, -9), (3, -10), (5, -10), (7, -9), (9, -11)], [(-1, 3), (0, 0), (1, -2), (2, -3), (4, -3), (6, -2)], [(2, -2), (4, -2), (5, -1)], [(0, 0), (1, -1), (3, -1), (4, 0), (6, -2)], [(-7, 9), (-4, 7), (0, 6), (5, 6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8), (4, 8), (7, 9), (9, 7)], [(-1, -5), (-1, 6)]]),
-    (-12, 11, [[(-8, -10), (-6, -12), (-3, -12), (-1, -11), (1, -12)], [(-5, -11), (-2, -11)], [(-8, -10), (-6, -11), (-4, -10), (-1, -10), (1, -12)], [(-2, -7), (-3, -6), (-4, -4), (-4, -3), (-6, -3), (-7, -2), (-7, 0), (-6, -1), (-4, -1), (-4, 4)], [(-3, -5), (-3, 2)], [(-6, -2), (-3, -2)], [(-2, -7), (-2, 1), (-3, 3), (-4, 4)], [(1, -8), (1, 7), (0, 8), (-1, 8), (-5, 6), (-7, 6), (-9, 7), (-11, 9)], [(2, -8), (2, 6)], [(2, -2), (6, -2)], [(-2, 8), (-3, 8), (-5, 7), (-8, 7)], [(3, -9), (3, -3), (6, -3)], [(6, -1), (3, -1), (3, 5), (2, 7), (-2, 9), (-4, 9), (-6, 8), (-8, 8), (-11, 9)], [(1, -8), (3, -9), (6, -12), (8, -11), (10, -11), (11, -12)], [(5, -11), (7, -10), (9, -10)], [(4, -10), (6, -9), (8, -9), (10, -10), (11, -12)], [(6, -9), (6, 5)]]),
-    (-13, 12, [[(-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 6), (9, 4), (9, 1), (8, -1), (7, -2), (5, -3), (3, -3)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 6), (8, 5), (8, 1), (7, -1)], [(3, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (3, -3)], [(-2, -8), (-2, 5)], [(-1, -8), (-1, 3)], [(0, -9), (0, 2), (-1, 4), (-2, 5)], [(-2, -8), (0, -9), (3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11), (4, -10), (6, -10)], [(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)], [(7, -10), (3, -3), (3, 9)], [(3, 1), (7, 1)], [(3, 4), (7, 4)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-3, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11), (6, -11), (7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3), (5, -4), (7, -6), (8, -5), (9, -2), (9, 2), (8, 6), (6, 9)], [(6, -5), (7, -4), (8, -2), (8, 3), (7, 6)], [(5, -4), (6, -4), (7, -2), (7, 3), (6, 9)], [(3, -3), (3, 7)], [(3, 0), (7, 0)], [(3, 3), (7, 3)]]),
-    (-9, 10, [[(-6, -10), (-4, -12), (-1, -12), (2, -11), (4, -12)], [(-3, -11), (1, -11)], [(-6, -10), (-4, -11), (-1, -10), (2, -10), (4, -12)], [(1, -7), (0, -6), (-1, -4), (-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3, -1), (-1, -1), (-1, 4)], [(0, -5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7), (1, 1), (0, 3), (-1, 4)], [(7, -10), (5, -8), (4, -5), (4, 6), (3, 8), (1, 8), (-3, 6), (-5, 6), (-7, 7), (-9, 9)], [(5, -7), (5, 5)], [(0, 8), (-1, 8), (-3, 7), (-6, 7)], [(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-7, 8), (-9, 9)]]),
-    (-10, 10, [[(-6, -10), (-4, -12), (-1, -12), (2, -11), (4, -12)], [(-3, -11), (1, -11)], [(-6, -10), (-4, -11), (-1, -10), (2, -10), (4, -12)], [(1, -7), (0, -6), (-1, -4), (-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3, -1), (-1, -1), (-1, 4)], [(0, -5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7), (1, 1), (0, 3), (-1, 4)], [(7, -10), (5, -8), (4, -5), (4, 6), (3, 8)], [(5, -7), (5, 5)], [(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 3), (-5, 4), (-6, 5), (-7, 5)], [(-8, 4), (-5, 4)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-4, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11), (6, -11), (7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3), (6, -6), (7, -5), (9, -4)], [(5, -5), (7, -4), (9, -4)], [(9, -4), (7, -1), (5, 1), (3, 3)], [(5, 1), (7, 2), (8, 6), (9, 8), (10, 8)], [(7, 4), (8, 8)], [(5, 1), (6, 2), (7, 8), (8, 9), (9, 9), (10, 8)], [(3, -3), (3, 7)]]),
-    (-11, 11, [[(-9, -10), (-7, -12), (-4, -12), (-2, -11), (0, -12)], [(-6, -11), (-3, -11)], [(-9, -10), (-7, -11), (-5, -10), (-2, -10), (0, -12)], [(-4, -7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)], [(-4, -7), (-4, 2), (-5, 4), (-6, 5)], [(-7, 9), (-4, 7), (0, 6), (5, 6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8), (4, 8), (7, 9), (9, 7)], [(1, -9), (0, -8), (-1, -6), (-1, 3)], [(0, -7), (0, 1)], [(1, -9), (1, 0), (0, 2), (-1, 3)], [(1, -9), (3, -11), (5, -12), (7, -12), (9, -11)], [(6, -11), (7, -11), (8, -10)], [(3, -11), (5, -11), (7, -9), (9, -11)], [(5, -11), (5, 6)]]),
-    (-14, 14, [[(-6, -8), (-7, -7), (-8, -5), (-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 3)], [(-7, -6), (-7, 1)], [(-10, -2), (-7, -2)], [(-6, -8), (-6, 0), (-7, 2), (-8, 3)], [(-13, 9), (-11, 7), (-9, 6), (-7, 6), (-5, 7), (-4, 7), (-3, 6)], [(-10, 7), (-7, 7), (-5, 8)], [(-13, 9), (-11, 8), (-8, 8), (-6, 9), (-5, 9), (-4, 8), (-3, 6)], [(-6, -8), (-2, -12), (2, -8), (2, 5), (3, 7), (4, 7)], [(-2, -11), (1, -8), (1, 6), (0, 7), (1, 8), (2, 7), (1, 6)], [(-2, -2), (1, -2)], [(-4, -10), (-3, -10), (0, -7), (0, -3), (-3, -3)], [(-3, -1), (0, -1), (0, 6), (-1, 7), (1, 9), (4, 7), (5, 6)], [(2, -8), (6, -12), (10, -8), (10, 5), (11, 7), (12, 7)], [(6, -11), (9, -8), (9, 6), (11, 8)], [(6, -2), (9, -2)], [(4, -10), (5, -10), (8, -7), (8, -3), (5, -3)], [(5, -1), (8, -1), (8, 7), (10, 9), (12, 7)], [(-3, -10), (-3, 6)], [(5, -10), (5, 6)]]),
-    (-13, 12, [[(-11, -9), (-9, -11), (-7, -12), (-5, -12), (-3, -11), (-1, -8), (4, 3), (6, 6), (7, 7)], [(-5, -11), (-3, -9), (-2, -7), (4, 5), (7, 8)], [(-9, -11), (-7, -11), (-5, -10), (-3, -7), (2, 4), (4, 7), (5, 8), (7, 9)], [(4, -10), (6, -9), (8, -9), (10, -10), (11, -12)], [(5, -11), (7, -10), (9, -10)], [(4, -10), (6, -12), (8, -11), (10, -11), (11, -12)], [(-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1)], [(-9, -2), (-7, -2)], [(-11, 9), (-9, 7), (-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-5, 7), (-3, 8)], [(-11, 9), (-8, 8), (-5, 8), (-4, 9), (-2, 7)], [(-7, -11), (-7, 6)], [(7, -9), (7, 9)], [(0, -6), (1, -5), (3, -4), (5, -4), (7, -5)], [(-7, 2), (-5, 1), (-1, 1), (1, 2)]]),
-    (-13, 13, [[(-4, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (8, -9), (6, -11), (4, -12), (3, -11), (0, -9), (-3, -8)], [(-8, -8), (-9, -5), (-9, 1), (-8, 4)], [(-4, -12), (-6, -10), (-7, -8), (-8, -5), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -5), (7, -9), (6, -10)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -5), (7, -7), (5, -10), (3, -11)], [(-3, -8), (-3, 5)], [(-2, -8), (-2, 3)], [(-1, -8), (-1, 2), (-2, 4), (-3, 5)], [(3, -11), (3, 8)], [(3, -5), (5, -4), (6, -4), (8, -5)], [(3, 1), (5, 0), (6, 0), (8, 1)]]),
-    (-10, 12, [[(-7, -12), (-6, -11), (-5, -9), (-5, -3), (-7, -3), (-8, -2), (-8, 0), (-7, -1), (-5, -1), (-5, 7), (-8, 9), (-5, 8), (-5, 16), (-3, 14)], [(-5, -10), (-4, -8), (-4, 14)], [(-7, -2), (-4, -2)], [(-7, -12), (-5, -11), (-4, -10), (-3, -8), (-3, 14)], [(-3, -7), (0, -9), (4, -12), (8, -8), (8, 6)], [(4, -11), (7, -8), (7, 6)], [(2, -10), (3, -10), (6, -7), (6, 7)], [(0, 6), (3, 6), (6, 7)], [(1, 7), (3, 7), (5, 8)], [(0, 8), (2, 8), (4, 9), (6, 7), (8, 6)], [(0, -9), (0, 13)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-13, 13, [[(-4, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (8, -9), (6, -11), (4, -12), (3, -11), (0, -9), (-3, -8)], [(-8, -8), (-9, -5), (-9, 1), (-8, 4)], [(-4, -12), (-6, -10), (-7, -8), (-8, -5), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -5), (7, -9), (6, -10)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -5), (7, -7), (5, -10), (3, -11)], [(-3, -8), (-3, 5)], [(-2, -8), (-2, 3)], [(-1, -8), (-1, 2), (-2, 4), (-3, 5)], [(3, -11), (3, 8)], [(3, -5), (5, -4), (6, -4), (8, -5)], [(3, 1), (5, 0), (6, 0), (8, 1)], [(-2, 9), (-1, 8), (0, 8), (2, 9), (6, 14), (8, 15), (9, 15)], [(2, 10), (4, 13), (6, 15), (7, 15)], [(0, 8), (1, 9), (4, 15), (6, 16), (8, 16), (9, 15)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (0, 6), (3, 7)], [(-6, 8), (-4, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (3, -11), (5, -12), (7, -11), (8, -9), (8, -6), (7, -4), (6, -3), (2, -1), (0, 0)], [(5, -11), (6, -11), (7, -9), (7, -5), (6, -4)], [(3, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -1)], [(2, -1), (4, 0), (5, 1), (8, 6), (9, 7), (10, 7)], [(5, 2), (7, 6), (9, 8)], [(2, -1), (4, 1), (6, 7), (8, 9), (10, 7)]]),
-    (-11, 12, [[(3, -9), (2, -10), (0, -11), (-3, -12)], [(4, -10), (2, -11)], [(5, -11), (1, -12), (-3, -12), (-6, -11), (-7, -10), (-8, -8), (-7, -6), (-6, -5), (-3, -4), (5, -4), (7, -3), (8, -2), (8, 0), (7, 3)], [(-7, -7), (-6, -6), (-3, -5), (6, -5), (8, -4), (9, -3), (9, -1), (8, 1)], [(-7, -10), (-7, -8), (-6, -7), (-3, -6), (7, -6), (9, -5), (10, -3), (10, -1), (7, 3), (3, 9)], [(-9, -3), (-8, -2), (-6, -1), (3, -1), (4, 0), (4, 1), (3, 3)], [(-8, -1), (-6, 0), (2, 0), (3, 1)], [(-9, -3), (-9, -2), (-8, 0), (-6, 1), (1, 1), (3, 2), (3, 3)], [(-9, 9), (-6, 7), (-2, 6), (1, 6), (4, 7)], [(-7, 8), (-4, 7), (0, 7), (3, 8)], [(-9, 9), (-5, 8), (0, 8), (3, 9)], [(5, -11), (3, -9), (1, -6)], [(0, -4), (-2, -1)], [(-3, 1), (-5, 3), (-7, 4), (-8, 4), (-8, 3), (-7, 4)]]),
-    (-13, 11, [[(-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3)], [(-9, 1), (-8, 4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-8, -8), (-9, -5), (-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 3)], [(-10, -9), (-9, -11), (-7, -12), (-3, -12), (3, -11), (7, -11), (9, -12)], [(-2, -11), (2, -10), (6, -10)], [(-10, -9), (-9, -10), (-7, -11), (-4, -11), (2, -9), (5, -9), (7, -10), (9, -12)], [(1, -9), (0, -8), (-2, -7), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8), (0, 1), (-1, 3), (-2, 4)], [(5, -9), (5, 6)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-6, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-5, -10), (-3, -10), (-1, -12)], [(-7, -8), (-8, -6), (-9, -3), (-9, 1), (-8, 4), (-7, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 9), (10, 7)], [(-8, 1), (-7, 4), (-4, 7), (-1, 8), (2, 8)], [(-7, -8), (-8, -4), (-8, -1), (-7, 2), (-6, 4), (-4, 6), (-1, 7), (3, 7), (6, 6)], [(3, -9), (-1, -8), (-2, -6), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8), (0, 1), (-1, 3), (-2, 4)], [(3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 5), (9, 7), (10, 7)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 6), (9, 8)], [(5, -10), (6, -9), (6, 6)], [(3, -9), (3, 7)], [(3, -4), (6, -4)], [(3, 0), (6, 0)]]),
-    (-11, 12, [[(-8, -12), (-7, -11), (-6, -9), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)], [(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7), (1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6), (3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6), (8, 6)], [(0, -8), (3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 6)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 5)], [(5, -10), (6, -9), (6, 6)], [(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-13, 14, [[(-10, -12), (-9, -11), (-8, -9), (-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 6), (-10, 7)], [(-8, -10), (-7, -8), (-7, 6)], [(-10, -2), (-7, -2)], [(-6, 7), (-4, 7), (-2, 8)], [(-10, -12), (-8, -11), (-7, -10), (-6, -8), (-6, 6), (-3, 6), (-1, 7)], [(-10, 7), (-7, 7), (-4, 8), (-3, 9), (-1, 7), (2, 6), (4, 7), (5, 9), (7, 7), (10, 6)], [(-3, -10), (0, -12), (2, -10), (2, 6), (5, 6), (7, 7)], [(0, -11), (1, -10), (1, 6)], [(-3, -10), (-1, -10), (0, -9), (0, 6), (-1, 7)], [(5, 7), (6, 8)], [(5, -10), (8, -12), (10, -10), (10, 6)], [(8, -11), (9, -10), (9, 6)], [(5, -10), (7, -10), (8, -9), (8, 6), (7, 7)], [(-3, -10), (-3, 6)], [(5, -10), (5, 6)], [(-3, -4), (0, -4)], [(-3, 0), (0, 0)], [(5, -4), (8, -4)], [(5, 0), (8, 0)]]),
-    (-11, 11, [[(-10, -9), (-8, -11), (-6, -12), (-4, -12), (-3, -11), (5, 7), (6, 8), (8, 8)], [(-5, -11), (-4, -10), (4, 7), (5, 8)], [(-8, -11), (-6, -11), (-5, -10), (3, 8), (4, 9), (6, 9), (8, 8), (10, 6)], [(5, -12), (7, -11), (9, -11), (10, -12)], [(5, -11), (6, -10), (8, -10)], [(4, -10), (5, -9), (7, -9), (9, -10), (10, -12)], [(-10, 9), (-9, 7), (-7, 6), (-5, 6), (-4, 7)], [(-8, 7), (-6, 7), (-5, 8)], [(-10, 9), (-9, 8), (-7, 8), (-5, 9)], [(5, -12), (1, -3)], [(-1, 0), (-5, 9)], [(-6, -2), (-2, -2)], [(1, -2), (6, -2)]]),
-    (-11, 12, [[(-8, -12), (-7, -11), (-6, -9), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)], [(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7), (1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6), (3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6)], [(0, -8), (3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 12), (7, 14), (5, 16), (3, 15), (-1, 14), (-6, 14)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 7)], [(5, -10), (6, -9), (6, 6), (8, 9)], [(6, 15), (4, 14), (1, 14)], [(7, 14), (4, 13), (-2, 13), (-6, 14)], [(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-10, 10, [[(6, -11), (5, -9), (0, -3), (-3, 1), (-5, 5), (-8, 9)], [(4, -7), (-4, 4)], [(8, -12), (5, -8), (3, -4), (0, 0), (-5, 6), (-6, 8)], [(-8, -10), (-6, -12), (-3, -11), (3, -11), (8, -12)], [(-7, -11), (-3, -10), (1, -10), (5, -11)], [(-8, -10), (-4, -9), (0, -9), (4, -10), (6, -11)], [(-6, 8), (-4, 7), (0, 6), (4, 6), (8, 7)], [(-5, 8), (-1, 7), (3, 7), (7, 8)], [(-8, 9), (-3, 8), (3, 8), (6, 9), (8, 7)], [(-5, -2), (-1, -2)], [(2, -2), (6, -2)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-6, 6, [[(2, -12), (0, -11), (-1, -9), (-1, -7), (0, -5), (2, -7), (0, -9), (0, -11)], [(0, -8), (0, -6), (1, -7), (0, -8)]]),
-    (-8, 9, [[(-2, 0), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (0, 7), (3, 6)], [(-5, 4), (-4, 6), (-3, 7), (-1, 8)], [(-4, 2), (-4, 4), (-3, 6), (-1, 7), (0, 7)], [(-4, -2), (-2, -2), (1, -3), (3, -4), (4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(-3, -4), (-4, -3), (-1, -3)], [(2, -3), (5, -3), (4, -4), (4, 7), (5, 8)], [(-5, -3), (-3, -5), (-2, -4), (0, -3), (3, -2), (3, 7), (5, 9), (7, 7)], [(-5, -3), (0, 2)]]),
-    (-9, 9, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7)], [(-4, -8), (-5, -10), (-4, -11), (-4, 6), (-1, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7)], [(2, -4), (4, -3), (4, 6)], [(0, -3), (1, -3), (3, -2), (3, 7)]]),
-    (-8, 6, [[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -3), (-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -3), (0, -4), (2, -5), (3, -4), (5, -3), (6, -3)], [(1, -4), (2, -3), (4, -3)], [(-2, -3), (0, -4), (2, -2), (4, -2), (6, -3)]]),
-    (-9, 8, [[(0, -5), (-2, -4), (-5, -3), (-5, 6), (-7, 7)], [(-4, -3), (-4, 6), (-1, 8)], [(0, -5), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-5, -10), (-2, -12), (-1, -9), (5, -3), (5, 7)], [(-2, -9), (-4, -10), (-3, -11), (-2, -9), (4, -3), (4, 6)], [(-5, -10), (3, -2), (3, 7)]]),
-    (-8, 6, [[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -3), (-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -3), (0, -4), (2, -5), (5, -1), (3, 0), (-2, 3)], [(1, -4), (4, -1)], [(-2, -3), (0, -4), (3, 0)]]),
-    (-8, 5, [[(-4, -10), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -10), (-3, 7), (-1, 8)], [(-2, -10), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -10), (-1, -11), (1, -12), (2, -11), (4, -10), (5, -10)], [(0, -11), (1, -10), (3, -10)], [(-2, -10), (-1, -11), (1, -9), (3, -9), (5, -10)], [(-7, -5), (-4, -5)], [(-2, -5), (2, -5)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(-4, -2), (-4, 7), (-2, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14), (-5, 14)], [(1, -4), (4, -2), (4, 10)], [(1, 15), (-1, 14), (-2, 14)], [(0, -4), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14), (-1, 13), (-3, 13), (-5, 14)]]),
-    (-9, 9, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-4, -8), (-5, -10), (-4, -11), (-4, 7), (-2, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7), (3, 9), (2, 11)], [(2, -4), (4, -3), (4, 7), (3, 9)], [(0, -3), (1, -3), (3, -2), (3, 7), (2, 11), (2, 14), (3, 16), (4, 16), (2, 14)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -9), (2, -10), (0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0, -5), (-1, -4), (-3, -3), (-1, -2), (-1, 7), (1, 9), (3, 7)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 8)], [(0, -5), (1, -4), (3, -3), (1, -2), (1, 6), (2, 7), (3, 7)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -9), (2, -10), (0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0, -5), (-1, -4), (-3, -3), (-1, -2), (-1, 7), (1, 9), (2, 11)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 9)], [(0, -5), (1, -4), (3, -3), (1, -2), (1, 7), (2, 11), (2, 14), (0, 16), (-2, 16), (-2, 15), (0, 16)]]),
-    (-9, 8, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-4, -8), (-5, -10), (-4, -11), (-4, 7), (-2, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1, -4), (3, -2)], [(0, -4), (2, -1)], [(1, 0), (2, 1), (4, 6), (5, 7), (6, 7)], [(1, 1), (2, 2), (3, 7), (4, 8)], [(0, 1), (1, 2), (2, 7), (4, 9), (6, 7)]]),
-    (-5, 5, [[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8), (1, 9)], [(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10), (1, -12), (1, 6), (3, 7), (4, 7), (2, 8), (1, 9)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-11, 7), (-10, 7), (-8, 8), (-7, 9)], [(-9, -4), (-8, -3), (-8, 7), (-6, 8)], [(-11, -3), (-9, -5), (-7, -3), (-7, 6), (-5, 7), (-7, 9)], [(-7, -2), (-4, -3), (-2, -4), (-1, -5), (1, -3), (1, 6), (3, 7), (1, 9)], [(-2, -4), (0, -3), (0, 7), (2, 8)], [(-4, -3), (-3, -3), (-1, -2), (-1, 6), (-2, 7), (0, 8), (1, 9)], [(1, -2), (4, -3), (6, -4), (7, -5), (8, -4), (10, -3), (11, -3), (9, -2), (9, 6), (10, 7), (11, 7)], [(6, -4), (8, -3), (8, 7), (9, 8)], [(4, -3), (5, -3), (7, -2), (7, 7), (9, 9), (11, 7)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(0, -3), (1, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4, 6), (-1, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 7)], [(1, -4), (4, -2), (4, 6)], [(0, -4), (1, -3), (3, -2), (3, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-7, 7), (-5, 7), (-5, 16)], [(-5, -4), (-4, -3), (-4, 15), (-3, 14), (-4, 12)], [(-4, 7), (-3, 7), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-3, 8), (-3, 12), (-2, 14), (-5, 16)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7)], [(2, -4), (4, -3), (4, 6)], [(0, -3), (1, -3), (3, -2), (3, 7)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4, 7), (-2, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 16)], [(1, -4), (4, -2), (4, 15), (3, 14), (4, 12)], [(0, -4), (1, -3), (3, -2), (3, 12), (2, 14), (5, 16)]]),
-    (-8, 6, [[(-6, -3), (-5, -3), (-4, -2), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-5, -4), (-3, -3), (-3, 7), (-1, 8)], [(-6, -3), (-4, -5), (-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-2, -3), (2, -5), (3, -4), (5, -3), (6, -3)], [(1, -4), (2, -3), (4, -3)], [(0, -4), (2, -2), (4, -2), (6, -3)]]),
-    (-8, 8, [[(-5, -3), (-5, 1), (-3, 2), (3, 2), (5, 3), (5, 7)], [(-4, -3), (-4, 1)], [(4, 3), (4, 7)], [(-2, -4), (-3, -3), (-3, 1), (-1, 2)], [(1, 2), (3, 3), (3, 7), (2, 8)], [(-5, -3), (-2, -4), (0, -5), (2, -4), (4, -4), (5, -5)], [(-1, -4), (1, -4)], [(-2, -4), (0, -3), (2, -3), (4, -4)], [(5, 7), (2, 8), (0, 9), (-2, 8), (-4, 8), (-6, 9)], [(1, 8), (-1, 8)], [(2, 8), (0, 7), (-3, 7), (-6, 9)], [(5, -5), (4, -3), (2, 0), (-3, 5), (-6, 9)]]),
-    (-5, 5, [[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8), (1, 9)], [(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10), (1, -12), (1, 6), (3, 7), (4, 7), (2, 8), (1, 9)], [(-4, -5), (-1, -5)], [(1, -5), (4, -5)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7)], [(-6, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(3, -5), (1, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-2, 9), (0, 7), (3, 6), (5, 6)], [(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 5), (-2, 6), (0, 7)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6)], [(2, -4), (4, -3), (4, 5)], [(3, -5), (1, -3), (3, -2), (3, 6)]]),
-    (-13, 13, [[(-10, -5), (-9, -3), (-9, 6), (-6, 9), (-4, 7), (-1, 6)], [(-9, -4), (-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5), (-6, 6), (-4, 7)], [(-1, -5), (-3, -3), (-1, -2), (-1, 6), (2, 9), (4, 7), (7, 6), (9, 6)], [(-2, -4), (0, -3), (0, 6), (3, 8)], [(-1, -5), (0, -4), (2, -3), (1, -2), (1, 5), (2, 6), (4, 7)], [(7, -5), (8, -4), (10, -3), (11, -3), (9, -2), (9, 6)], [(6, -4), (8, -3), (8, 5)], [(7, -5), (5, -3), (7, -2), (7, 6)]]),
-    (-10, 9, [[(-7, -3), (-6, -3), (-4, -2), (-3, -1), (1, 7), (2, 8), (4, 9), (6, 7)], [(-5, -4), (-3, -3), (2, 7), (4, 8)], [(-7, -3), (-5, -5), (-3, -4), (-2, -3), (2, 5), (3, 6), (5, 7), (6, 7)], [(0, 1), (3, -5), (4, -4), (6, -4), (7, -5)], [(3, -4), (4, -3), (5, -3)], [(2, -3), (4, -2), (6, -3), (7, -5)], [(-1, 3), (-4, 9), (-5, 8), (-7, 8), (-8, 9)], [(-4, 8), (-5, 7), (-6, 7)], [(-3, 7), (-5, 6), (-7, 7), (-8, 9)], [(-5, 2), (-2, 2)], [(1, 2), (4, 2)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7)], [(-6, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14), (-5, 14)], [(2, -4), (4, -3), (4, 10)], [(1, 15), (-1, 14), (-2, 14)], [(3, -5), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14), (-1, 13), (-3, 13), (-5, 14)]]),
-    (-9, 9, [[(6, -5), (-6, 9)], [(-6, -3), (-4, -2), (-1, -2), (2, -3), (6, -5)], [(-5, -4), (-3, -3), (1, -3)], [(-6, -3), (-4, -5), (-2, -4), (2, -4), (6, -5)], [(-6, 9), (-2, 7), (1, 6), (4, 6), (6, 7)], [(-1, 7), (3, 7), (5, 8)], [(-6, 9), (-2, 8), (2, 8), (4, 9), (6, 7)], [(-4, 2), (4, 2)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]),
-]
-
-GOTHGRT = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-6, 6, [[(0, -6), (0, -8), (-2, -10), (0, -12), (1, -10), (1, -8), (0, -6), (-2, -5)], [(0, -11), (-1, -10), (0, -9), (0, -11)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 13, [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-12, 12, [[(-9, -10), (-8, -9), (-9, -8), (-10, -9), (-9, -11), (-7, -12), (-5, -12), (-3, -11), (-2, -10), (-1, -7), (-1, -3), (-2, 0), (-4, 2), (-6, 3), (-9, 4)], [(-3, -10), (-2, -7), (-2, -2), (-3, 0)], [(-5, -12), (-4, -11), (-3, -8), (-3, -2), (-4, 1), (-6, 3)], [(-6, 4), (-3, 7)], [(-7, 4), (-3, 8)], [(-9, 4), (-4, 9), (3, 4)], [(10, -11), (9, -10), (10, -10), (10, -11), (9, -12), (7, -12), (5, -11), (4, -10), (3, -8), (3, 7), (5, 9), (9, 5)], [(5, -10), (4, -8), (4, 6), (6, 8)], [(7, -12), (6, -11), (5, -8), (5, 5), (7, 7)]]),
-    (-13, 13, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0), (-1, 3), (-3, 5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11), (-2, -8), (-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (0, -2)], [(7, -5), (9, -3), (10, 0), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(6, -4), (7, -4), (9, -2)], [(4, -4), (7, -3), (9, -1), (10, 1)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)]]),
-    (-12, 12, [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9, -4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7), (-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3), (-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10), (-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1, -7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4), (4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12), (4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2, -11), (4, -9), (6, -9), (8, -10), (9, -11)]]),
-    (-13, 13, [[(-10, -6), (-10, -7), (-9, -9), (-7, -11), (-4, -12), (0, -12), (3, -11), (5, -10), (7, -8), (9, -5), (10, -1), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(-7, -10), (-5, -11), (0, -11), (3, -10), (5, -9), (7, -7), (9, -4)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(-10, -7), (-8, -9), (-5, -10), (0, -10), (3, -9), (5, -8), (7, -6), (9, -3), (10, 0)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(-2, -10), (-5, -7), (-6, -5), (-6, -3), (-4, 1), (-4, 3)], [(-5, -4), (-5, -3), (-4, -1), (-4, 0)], [(-5, -7), (-5, -5), (-3, -1), (-3, 1), (-4, 3), (-5, 4), (-7, 4), (-8, 3), (-8, 2)]]),
-    (-12, 12, [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9, -4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7), (-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3), (-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10), (-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1, -7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4), (4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12), (4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2, -11), (4, -9), (6, -9), (8, -10), (9, -11)], [(3, -4), (7, -7)], [(7, -7), (8, -6), (10, -6)], [(6, -6), (7, -5), (8, -5)], [(5, -5), (6, -4), (8, -4), (10, -6)]]),
-    (-12, 12, [[(-5, -4), (-7, -5), (-8, -7), (-8, -9), (-7, -11), (-4, -12), (-1, -12), (2, -11), (6, -9)], [(-7, -10), (-5, -11), (0, -11), (3, -10)], [(-8, -7), (-7, -9), (-5, -10), (0, -10), (6, -9), (8, -9), (9, -10), (9, -11), (8, -12), (7, -12)], [(1, -10), (0, -9), (-1, -7), (-1, -5), (0, -3), (4, 1), (5, 4), (5, 7), (4, 10), (3, 11), (1, 12)], [(2, -2), (5, 1), (6, 4), (6, 7), (5, 9)], [(-1, -5), (1, -3), (4, -1), (6, 1), (7, 4), (7, 7), (6, 9), (4, 11), (1, 12), (-3, 12), (-6, 11), (-7, 10), (-8, 8), (-8, 5), (-6, 2), (-6, 0), (-7, -1)], [(-6, 10), (-7, 9), (-7, 5), (-6, 3)], [(-3, 12), (-5, 11), (-6, 9), (-6, 5), (-5, 2), (-5, 0), (-6, -1), (-8, -1), (-9, 0), (-9, 1)], [(3, -2), (7, -6)], [(7, -6), (8, -5), (10, -5)], [(6, -5), (7, -4), (8, -4)], [(5, -4), (6, -3), (8, -3), (10, -5)]]),
-    (-13, 13, [[(3, -8), (2, -10), (1, -11), (-1, -12), (-4, -12), (-7, -11), (-9, -8), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5), (10, 2), (10, -1), (9, -4), (7, -6)], [(-7, -10), (-8, -8), (-9, -5), (-9, 0), (-8, 3), (-7, 5)], [(8, 5), (9, 3), (9, -1), (8, -4), (7, -5)], [(-4, -12), (-6, -11), (-7, -9), (-8, -5), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(5, 8), (7, 6), (8, 3), (8, -1), (7, -3), (5, -5)], [(3, -12), (0, -10), (-2, -8), (-3, -6), (-3, -5), (-2, -3), (1, -1), (2, 1), (2, 3)], [(-2, -6), (-2, -5), (2, -1), (2, 0)], [(-2, -8), (-2, -7), (-1, -5), (2, -3), (3, -1), (3, 1), (2, 3), (0, 4), (-1, 4), (-3, 3), (-4, 1)], [(2, -3), (7, -6), (8, -8)], [(10, -12), (8, -8)], [(7, -11), (11, -9)], [(10, -12), (9, -11), (7, -11), (8, -10), (8, -8), (9, -9), (11, -9), (10, -10), (10, -12)]]),
-    (-12, 13, [[(0, -12), (-2, -11), (-4, -9), (-5, -7), (-5, -5), (-4, -3), (-2, -1), (-1, 1), (-1, 3)], [(-4, -6), (-4, -5), (-1, -1), (-1, 0)], [(-4, -9), (-4, -7), (-3, -5), (-1, -3), (0, -1), (0, 1), (-1, 3), (-2, 4), (-4, 5), (-6, 5), (-8, 4), (-9, 3), (-10, 1), (-10, -1), (-9, -2), (-8, -1), (-9, 0)], [(0, -12), (2, -10), (4, -10), (6, -11)], [(-1, -11), (1, -10)], [(-2, -11), (-1, -10), (1, -9), (3, -9), (6, -11)], [(0, -2), (7, -7)], [(7, -7), (9, -4), (10, -1), (10, 2), (9, 5), (7, 7), (4, 8), (0, 9)], [(6, -6), (8, -4), (9, -1), (9, 3), (8, 5)], [(4, -5), (5, -5), (7, -3), (8, 0), (8, 4), (7, 6), (6, 7), (4, 8)], [(4, 8), (2, 8), (0, 7), (-2, 7), (-4, 8), (-5, 10), (-4, 12), (-2, 13), (0, 13), (2, 12)], [(1, 8), (-1, 8)], [(0, 9), (-2, 8), (-4, 8)]]),
-    (-12, 13, [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8, -6), (-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11), (5, -8), (7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)], [(-8, -8), (-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7), (9, -7), (10, -8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7), (-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10), (2, 12)], [(-4, 6), (-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5), (-4, 7), (-2, 10), (-1, 11), (1, 12), (4, 12), (6, 11), (7, 10), (8, 8), (8, 5), (7, 3), (5, 0), (4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0), (4, -1)], [(6, 11), (7, 9), (7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5, -4), (7, -4), (8, -3), (8, -2)]]),
-    (-12, 13, [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8, -6), (-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11), (5, -8), (7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)], [(-8, -8), (-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7), (9, -7), (10, -8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7), (-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10), (2, 12)], [(-4, 6), (-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5), (-4, 7), (-2, 10), (-1, 11), (1, 12), (4, 12), (6, 11), (7, 10), (8, 8), (8, 5), (7, 3), (5, 0), (4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0), (4, -1)], [(6, 11), (7, 9), (7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5, -4), (7, -4), (8, -3), (8, -2)]]),
-    (-13, 13, [[(9, -7), (8, -9), (6, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-6, -4), (-5, -1), (-2, 5), (-2, 7), (-4, 9)], [(-5, -4), (-5, -3), (-2, 3), (-2, 4)], [(-4, -10), (-5, -8), (-5, -5), (-4, -3), (-2, 1), (-1, 4), (-1, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8)], [(-10, 4), (-8, 8)], [(-11, 7), (-7, 5)], [(-10, 4), (-10, 6), (-11, 7), (-9, 7), (-8, 8), (-8, 6), (-7, 5), (-9, 5), (-10, 4)], [(-4, -3), (-4, -5), (-3, -7), (-1, -8), (2, -8), (4, -7), (6, -5), (7, -5)], [(3, -7), (5, -5)], [(0, -8), (2, -7), (3, -6), (4, -4)], [(7, -5), (-2, -1)], [(3, -3), (7, 6), (8, 7), (9, 7)], [(2, -2), (6, 6), (8, 8)], [(1, -2), (5, 7), (7, 9), (10, 6)]]),
-    (-11, 12, [[(8, 1), (7, 2), (4, 2), (3, 1), (3, -1), (4, -3), (6, -6), (7, -8), (7, -10)], [(4, -1), (4, -2), (7, -6), (7, -7)], [(5, 2), (4, 1), (4, 0), (5, -2), (7, -4), (8, -6), (8, -8), (7, -10), (6, -11), (3, -12), (-2, -12), (-5, -11), (-6, -10), (-7, -8), (-7, -6), (-6, -4), (-4, -1), (-3, 1), (-3, 2), (-4, 4)], [(-6, -7), (-6, -6), (-3, -1), (-3, 0)], [(-6, -10), (-6, -8), (-5, -6), (-3, -3), (-2, -1), (-2, 1), (-3, 3), (-5, 5), (-8, 7)], [(-5, 5), (-3, 5), (0, 7), (3, 8), (6, 8), (8, 7)], [(-4, 6), (-3, 6), (1, 8), (2, 8)], [(-8, 7), (-6, 6), (-5, 6), (-1, 8), (2, 9), (4, 9), (7, 8), (8, 7), (9, 5)]]),
-    (-16, 16, [[(-13, -1), (-13, 0), (-12, 1), (-10, 1), (-8, 0), (-8, -3), (-9, -5), (-11, -8), (-11, -10), (-9, -12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9, 0), (-9, -2), (-11, -5), (-12, -7), (-12, -9), (-11, -11), (-9, -12), (-7, -12), (-5, -11), (-3, -9), (-2, -6), (-2, 0), (-3, 3), (-4, 5), (-6, 7), (-9, 9), (-10, 8), (-11, 8)], [(-4, -9), (-3, -6), (-3, 0), (-4, 3), (-5, 5)], [(-8, 8), (-9, 7), (-10, 7)], [(-7, -12), (-5, -10), (-4, -7), (-4, 0), (-5, 4), (-6, 6), (-7, 7), (-8, 6), (-9, 6), (-12, 9)], [(-4, -11), (-2, -12), (0, -12), (2, -11), (4, -9), (5, -6), (5, 0), (4, 3), (3, 5), (1, 7), (-1, 9), (-2, 8), (-3, 8)], [(3, -9), (4, -6), (4, 0), (3, 4)], [(0, 8), (-1, 7), (-2, 7)], [(0, -12), (2, -10), (3, -7), (3, 1), (2, 5), (1, 7), (0, 6), (-1, 6), (-4, 9)], [(3, -10), (4, -11), (6, -12), (8, -12), (10, -11), (11, -10), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12), (9, -11), (10, -8), (11, -7), (13, -7)], [(13, -7), (10, -5), (9, -4), (8, -1), (8, 2), (9, 6), (11, 9), (14, 6)], [(10, -4), (9, -2), (9, 2), (10, 5), (12, 8)], [(13, -7), (11, -5), (10, -3), (10, 1), (11, 5), (13, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (0, -9), (1, -6), (1, 0), (0, 3), (-1, 5), (-3, 7), (-6, 9), (-7, 8), (-9, 8), (-11, 9)], [(-1, -9), (0, -7), (0, 0), (-1, 3), (-2, 5), (-3, 6)], [(-5, 8), (-7, 7), (-9, 7)], [(-4, -12), (-2, -10), (-1, -7), (-1, 0), (-2, 4), (-4, 7), (-6, 6), (-8, 6), (-11, 9)], [(0, -10), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (7, -5), (6, -4), (5, -1), (5, 2), (6, 6), (8, 9), (11, 6)], [(7, -4), (6, -2), (6, 2), (7, 5), (9, 8)], [(10, -7), (8, -5), (7, -3), (7, 1), (8, 5), (10, 7)]]),
-    (-14, 14, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3), (-5, -2)], [(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2), (-8, 2), (-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7), (9, -5), (10, -2), (10, 1), (9, 4), (8, 6), (6, 8), (3, 9), (0, 9), (-3, 8), (-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8), (7, -7), (8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6), (9, -4), (10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(7, 7), (5, 8), (2, 8), (-1, 7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-13, 14, [[(-10, -1), (-10, 0), (-9, 1), (-7, 1), (-5, 0), (-5, -3), (-6, -5), (-8, -8), (-8, -10), (-6, -12)], [(-6, -3), (-8, -7)], [(-7, 1), (-6, 0), (-6, -2), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -10), (1, -8), (1, 3)], [(1, 5), (1, 10), (0, 12), (-2, 13), (-5, 13), (-6, 12), (-6, 10), (-5, 9), (-4, 10), (-5, 11)], [(-1, -10), (0, -8), (0, 10), (-1, 12)], [(-3, -12), (-2, -11), (-1, -8), (-1, 3)], [(-1, 5), (-1, 10), (-2, 12), (-3, 13)], [(1, -8), (6, -12)], [(6, -12), (8, -9), (9, -7), (10, -3), (10, 0), (9, 3), (7, 6), (4, 9)], [(5, -11), (8, -7), (9, -4), (9, -3)], [(4, -10), (6, -8), (8, -5), (9, -2), (9, 1), (8, 4), (7, 6)], [(5, 7), (3, 4), (1, 3)], [(-1, 3), (-3, 4), (-5, 6)], [(5, 8), (3, 5), (1, 4), (-2, 4)], [(4, 9), (2, 6), (1, 5)], [(-1, 5), (-3, 5), (-5, 6)]]),
-    (-14, 14, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3), (-5, -2)], [(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2), (-8, 2), (-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7), (9, -5), (10, -2), (10, 1), (9, 4), (8, 6)], [(6, 8), (3, 9), (0, 9), (-3, 8), (-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8), (7, -7), (8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6), (9, -4), (10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(6, 8), (2, 8), (-1, 7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9), (-9, 8), (-10, 7)], [(2, 6), (4, 4), (6, 4), (10, 8), (11, 8)], [(5, 5), (6, 5), (9, 8)], [(3, 5), (4, 5), (8, 9), (10, 9), (12, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 4), (-1, 6), (-3, 8), (-5, 9), (-7, 9), (-9, 8)], [(-2, -10), (-1, -8), (-1, 4), (-2, 6)], [(-4, -12), (-3, -11), (-2, -8), (-2, 4), (-3, 7), (-5, 9)], [(-11, 4), (-9, 8)], [(-12, 7), (-8, 5)], [(-11, 4), (-11, 6), (-12, 7), (-10, 7), (-9, 8), (-9, 6), (-8, 5), (-10, 5), (-11, 4)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (0, -2)], [(2, -3), (6, 7), (8, 9), (11, 6)], [(3, -3), (7, 6), (9, 8)], [(4, -4), (8, 6), (9, 7), (10, 7)]]),
-    (-13, 14, [[(10, -10), (9, -11), (10, -12), (11, -11), (11, -9), (10, -7), (8, -7), (4, -9), (1, -10), (-3, -10), (-7, -9), (-9, -7)], [(7, -8), (4, -10), (1, -11), (-3, -11), (-6, -10)], [(11, -9), (10, -8), (8, -8), (4, -11), (1, -12), (-3, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7), (10, 5), (11, 2), (11, -1), (10, -3), (8, -4), (5, -4), (3, -3), (1, 0), (-1, 1), (-3, 1)], [(-6, 6), (-4, 7), (-1, 8), (3, 8), (7, 7)], [(-9, 3), (-7, 5), (-5, 6), (-2, 7), (3, 7), (7, 6), (9, 5), (10, 4), (11, 2)], [(6, -3), (5, -3), (1, 1), (0, 1)], [(11, -1), (9, -3), (7, -3), (5, -2), (3, 1), (1, 2), (-1, 2), (-3, 1), (-4, -1), (-4, -3), (-3, -5), (-1, -6)]]),
-    (-12, 13, [[(-6, -4), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-5, -12), (0, -12), (3, -11), (7, -8), (9, -8), (10, -9)], [(-8, -10), (-6, -11), (0, -11), (3, -10), (6, -8)], [(-9, -7), (-8, -9), (-6, -10), (0, -10), (3, -9), (7, -7), (9, -7), (10, -9), (10, -11), (9, -12), (8, -11), (9, -10)], [(3, -9), (0, -6), (-1, -4), (-1, -2), (1, 2), (1, 4)], [(0, -3), (0, -2), (1, 0), (1, 1)], [(0, -6), (0, -4), (2, 0), (2, 2), (1, 4), (0, 5), (-2, 5), (-3, 4), (-3, 2)], [(-8, 7), (-7, 8), (-8, 9), (-9, 8), (-9, 6), (-8, 4), (-6, 4), (-3, 5), (1, 7), (4, 8), (7, 8), (9, 7)], [(-6, 5), (-5, 5), (1, 8), (3, 8)], [(-9, 6), (-8, 5), (-7, 5), (-5, 6), (-1, 8), (2, 9), (5, 9), (8, 8), (10, 6)]]),
-    (-11, 11, [[(-8, -10), (-7, -10), (-6, -9), (-6, 5), (-8, 6)], [(-7, -11), (-5, -10), (-5, 6), (-2, 8)], [(-9, -9), (-6, -12), (-4, -10), (-4, 5), (-2, 7), (0, 7)], [(-8, 6), (-7, 6), (-5, 7), (-3, 9), (0, 7), (4, 4)], [(2, -10), (3, -10), (4, -9), (4, 7), (6, 9), (9, 6)], [(3, -11), (5, -10), (5, 7), (7, 8)], [(1, -9), (4, -12), (7, -10), (6, -9), (6, 6), (7, 7), (8, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0), (-1, 3), (-3, 5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11), (-2, -8), (-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(8, -7), (6, -7), (5, -6), (5, -4), (6, -2), (9, 0), (10, 2)], [(6, -3), (9, -1)], [(5, -5), (6, -4), (9, -2), (10, 0), (10, 4), (9, 6), (7, 8), (5, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)]]),
-    (-16, 17, [[(-13, -1), (-13, 0), (-12, 1), (-10, 1), (-8, 0), (-8, -3), (-9, -5), (-11, -8), (-11, -10), (-9, -12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9, 0), (-9, -2), (-11, -5), (-12, -7), (-12, -9), (-11, -11), (-9, -12), (-6, -12), (-4, -11), (-3, -10), (-2, -8), (-2, -4), (-3, -1), (-5, 2), (-7, 4)], [(-4, -10), (-3, -8), (-3, -3), (-4, 0)], [(-6, -12), (-5, -11), (-4, -8), (-4, -3), (-5, 1), (-7, 4)], [(-4, -11), (-2, -12), (1, -12), (3, -11)], [(5, -12), (2, -11), (1, -9), (1, -5), (2, -2), (4, 1), (5, 3), (5, 5), (4, 7)], [(2, -5), (2, -4), (5, 1), (5, 2)], [(5, -12), (3, -11), (2, -9), (2, -6), (3, -4), (5, -1), (6, 2), (6, 4), (5, 6), (3, 8), (1, 9), (-3, 9), (-5, 8), (-7, 6), (-9, 5), (-11, 5), (-12, 6)], [(-4, 8), (-7, 5), (-8, 5)], [(-1, 9), (-3, 8), (-6, 5), (-8, 4), (-11, 4), (-12, 6), (-12, 8), (-11, 9), (-10, 8), (-11, 7)], [(5, -12), (8, -12), (10, -11), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12), (9, -11), (10, -8), (11, -7), (13, -7)], [(11, -7), (9, -7), (8, -6), (8, -4), (9, -2), (12, 0), (13, 2)], [(9, -3), (12, -1)], [(8, -5), (9, -4), (12, -2), (13, 0), (13, 5), (12, 7), (11, 8), (9, 9), (6, 9), (3, 8)], [(7, 8), (6, 8), (4, 7)], [(12, 7), (10, 8), (8, 8), (6, 7), (5, 6)]]),
-    (-12, 12, [[(-7, -10), (-5, -10), (-3, -9), (-2, -8), (-1, -5), (-1, -3)], [(-1, -1), (-1, 3), (-2, 6), (-5, 9), (-7, 8), (-9, 9)], [(-4, 8), (-6, 7), (-7, 7)], [(-3, 7), (-4, 7), (-6, 6), (-9, 9)], [(-5, -11), (-2, -10), (-1, -9), (0, -6), (0, 3), (1, 5), (3, 7), (5, 8)], [(-9, -9), (-4, -12), (-2, -11), (0, -9), (1, -6), (1, -3)], [(1, -1), (1, 2), (2, 5), (3, 6), (5, 7), (7, 7)], [(-1, 3), (0, 6), (2, 8), (4, 9), (9, 6)], [(1, -6), (2, -9), (5, -12), (7, -11), (9, -12)], [(4, -11), (6, -10), (7, -10)], [(3, -10), (4, -10), (6, -9), (9, -12)], [(-7, 1), (-5, -3), (-1, -3)], [(1, -3), (5, -3), (7, -5)], [(-5, -2), (5, -2)], [(-7, 1), (-5, -1), (-1, -1)], [(1, -1), (5, -1), (7, -5)]]),
-    (-13, 13, [[(-10, -1), (-10, 0), (-9, 1), (-7, 1), (-5, 0), (-5, -3), (-6, -5), (-8, -8), (-8, -10), (-6, -12)], [(-6, -3), (-8, -7)], [(-7, 1), (-6, 0), (-6, -2), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -10), (1, -8), (1, -3), (0, 0), (-1, 2), (-1, 3), (1, 5), (2, 5)], [(-1, -10), (0, -8), (0, -2), (-1, 1), (-2, 3), (1, 6)], [(-3, -12), (-2, -11), (-1, -8), (-1, -2), (-2, 2), (-3, 4), (0, 7), (3, 4)], [(1, -8), (9, -12)], [(7, -11), (7, 8), (6, 11)], [(8, -11), (8, 6), (7, 9)], [(9, -12), (9, 4), (8, 8), (7, 10), (5, 12), (2, 13), (-2, 13), (-5, 12), (-7, 10), (-8, 8), (-7, 7), (-6, 8), (-7, 9)]]),
-    (-12, 12, [[(-4, -9), (-3, -11), (-1, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -5), (5, -3), (4, -2), (2, -1)], [(-1, -1), (-3, -2), (-4, -4)], [(4, -10), (5, -9), (5, -4), (4, -3)], [(2, -12), (3, -11), (4, -9), (4, -4), (3, -2), (2, -1)], [(-5, 3), (-4, 1), (-3, 0), (-1, -1), (2, -1), (5, 0), (7, 2), (8, 4), (8, 8), (7, 10), (5, 12), (2, 13), (-2, 13), (-4, 12), (-7, 8), (-8, 7)], [(6, 2), (7, 4), (7, 8), (6, 10)], [(2, -1), (5, 1), (6, 3), (6, 9), (5, 11), (4, 12), (2, 13)], [(-3, 12), (-4, 11), (-6, 8), (-7, 7)], [(0, 13), (-2, 12), (-3, 11), (-5, 8), (-6, 7), (-9, 7), (-10, 8), (-10, 10), (-9, 11), (-8, 11)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-6, 6, [[(2, -12), (0, -11), (-1, -9), (-1, -7), (0, -5), (2, -7), (0, -9), (0, -11)], [(0, -8), (0, -6), (1, -7), (0, -8)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 4), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(1, -4), (4, -2), (4, 6), (6, 8)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-6, -10), (-5, -9), (-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6), (-5, 7)], [(-2, -9), (-3, -7), (-3, 6), (0, 8)], [(2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-7, 6, [[(0, -4), (2, -2), (4, -3), (2, -5), (0, -4), (-3, -2), (-4, 0), (-4, 5), (-3, 7), (-1, 9), (3, 7)], [(1, -4), (3, -3)], [(-2, -2), (-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(-1, -3), (-2, -1), (-2, 4), (-1, 6), (1, 8)]]),
-    (-8, 9, [[(-1, -12), (-4, -9), (-4, -7), (-3, -6), (1, -4), (4, -2), (5, 0), (5, 3), (4, 6), (2, 8)], [(-3, -8), (-3, -7), (1, -5), (4, -3), (5, -2)], [(-3, -10), (-3, -9), (-2, -8), (3, -5), (5, -3), (6, 0), (6, 3), (5, 6), (2, 8), (-1, 9)], [(0, -4), (-4, -2), (-4, 6), (-5, 7)], [(-3, -2), (-3, 6), (0, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9)]]),
-    (-7, 6, [[(-2, 3), (4, -1), (1, -5), (-3, -2), (-4, 0), (-4, 5), (-3, 7), (-1, 9), (3, 7)], [(3, -1), (0, -4)], [(-2, -2), (-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(2, 0), (0, -3), (-1, -3), (-2, -1), (-2, 4), (-1, 6), (1, 8)]]),
-    (-6, 7, [[(6, -12), (5, -11), (3, -11), (1, -12), (-1, -12), (-2, -10), (-2, -5), (-3, -3), (-4, -2)], [(4, -10), (2, -10), (0, -11), (-1, -11)], [(6, -12), (5, -10), (4, -9), (2, -9), (0, -10), (-1, -10), (-2, -9)], [(-2, -7), (-1, -5), (0, -4), (2, -3), (4, -3), (4, -2)], [(-4, -2), (-2, -2)], [(0, -2), (4, -2)], [(-2, -2), (-2, 2), (-1, 14)], [(1, -3), (-2, -3), (-1, -4), (-1, 9)], [(0, -2), (0, 2), (-1, 14)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 9), (4, 11), (3, 13)], [(1, -4), (4, -2), (4, 8)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 10), (4, 12), (3, 13), (1, 14), (-2, 14), (-4, 13), (-5, 12), (-5, 11), (-4, 11), (-4, 12)]]),
-    (-8, 9, [[(-6, -10), (-5, -9), (-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6), (-5, 7)], [(-2, -9), (-3, -7), (-3, 7), (-2, 8)], [(2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2, 9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4, 10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1), (5, 2), (5, 5), (4, 9), (2, 12)]]),
-    (-5, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10), (1, -11)], [(-3, -3), (-2, -3), (-1, -2), (-1, 7), (1, 9), (4, 6)], [(-2, -4), (0, -3), (0, 6), (2, 8)], [(-4, -2), (-1, -5), (0, -4), (2, -3)], [(1, -2), (2, -3)], [(1, -2), (1, 6), (2, 7), (3, 7)]]),
-    (-5, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10), (1, -11)], [(-3, -3), (-2, -3), (-1, -2), (-1, 9), (-2, 12), (-3, 13), (-5, 14)], [(-2, -4), (0, -3), (0, 9), (-1, 11)], [(-4, -2), (-1, -5), (0, -4), (2, -3)], [(1, -2), (2, -3)], [(1, -2), (1, 9), (0, 11), (-2, 13), (-5, 14)], [(1, 9), (2, 11), (3, 12)]]),
-    (-7, 7, [[(-4, -10), (-3, -9), (-2, -7)], [(3, -12), (1, -11), (-1, -9), (-2, -7), (-2, -5), (-3, -3), (-4, -2)], [(-2, -2), (-2, 6), (-3, 7)], [(0, -9), (-1, -7), (-1, -5)], [(-1, -3), (-2, -3), (-1, -5), (-1, 6), (1, 8)], [(3, -12), (1, -10), (0, -7), (0, -3)], [(0, -2), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9), (3, 6)], [(0, -6), (4, -9), (5, -8), (5, -6), (3, -4), (1, -3)], [(3, -8), (4, -7), (4, -6), (3, -4)], [(0, -3), (5, -3), (5, -2)], [(-4, -2), (-2, -2)], [(0, -2), (5, -2)]]),
-    (-5, 5, [[(-3, -10), (-2, -9), (-1, -7)], [(5, -12), (2, -11), (0, -9), (-1, -7), (-1, 6), (-2, 7)], [(1, -9), (0, -7), (0, 7), (2, 8)], [(5, -12), (3, -11), (2, -10), (1, -7), (1, 6), (2, 7), (3, 7)], [(-2, 7), (0, 8), (1, 9), (4, 6)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7), (-8, 9)], [(-10, -4), (-8, -2), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8, 6)], [(-12, -2), (-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-4, -4), (-2, -3), (-1, -1), (-1, 6), (-2, 7), (0, 9)], [(-2, -4), (-1, -3), (0, -1), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(-7, -2), (-4, -4), (-2, -5), (0, -4), (1, -2), (1, 6), (2, 7), (0, 9)], [(4, -4), (5, -3), (7, -2), (7, 7), (9, 9), (12, 6)], [(5, -4), (8, -2), (8, 6), (10, 8)], [(1, -2), (4, -4), (6, -5), (7, -4), (9, -3), (10, -3)], [(9, -2), (10, -3)], [(9, -2), (9, 6), (10, 7), (11, 7)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7), (-4, 9)], [(-6, -4), (-4, -2), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-8, -2), (-5, -5), (-3, -3), (-3, 6), (-2, 7), (-4, 9)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(1, -4), (4, -2), (4, 6), (6, 8)], [(-3, -2), (0, -4), (2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-4, -2), (-4, 6), (-5, 7)], [(-3, -2), (-3, 6), (0, 8)], [(-1, -3), (-2, -2), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-4, -2), (-1, -3), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-8, 9, [[(-3, -8), (-5, -6), (-5, -4), (-4, -1), (-4, 6), (-6, 8)], [(-4, 7), (-3, 14)], [(-4, -5), (-4, -4), (-3, -1), (-3, 9)], [(-4, -7), (-4, -6), (-3, -4), (-2, -1), (-2, 6), (-1, 6), (1, 7), (2, 8)], [(-2, 7), (-3, 14)], [(1, 8), (-1, 7)], [(2, 8), (0, 9), (-2, 7)], [(-4, 7), (-6, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 14)], [(1, -4), (4, -2), (4, 9)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (4, 14)]]),
-    (-7, 7, [[(-4, -3), (-3, -3), (-2, -2), (-2, 6), (-3, 7)], [(-3, -4), (-1, -2), (-1, 7), (1, 8)], [(-5, -2), (-2, -5), (0, -3), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9), (3, 6)], [(2, -4), (3, -2), (5, -3), (4, -5), (0, -3)], [(3, -4), (4, -3)]]),
-    (-6, 5, [[(6, -12), (5, -11), (3, -11), (1, -12), (-1, -12), (-2, -10), (-2, -5), (-3, -3), (-4, -2)], [(4, -10), (2, -10), (0, -11), (-1, -11)], [(6, -12), (5, -10), (4, -9), (2, -9), (0, -10), (-1, -10), (-2, -9)], [(-2, -7), (0, -2)], [(-2, -2), (-2, 2), (-1, 14)], [(-1, -3), (-2, -3), (-1, -4), (-1, 9)], [(0, -2), (0, 2), (-1, 14)], [(-4, -2), (-2, -2)]]),
-    (-6, 6, [[(1, -9), (0, -6), (-1, -4), (-2, -3), (-4, -2)], [(1, -9), (1, -3), (4, -3), (4, -2)], [(-4, -2), (-1, -2)], [(1, -2), (4, -2)], [(-1, -2), (-1, 6), (-2, 7)], [(0, -3), (-1, -3), (0, -5), (0, 6), (2, 8)], [(1, -2), (1, 6), (2, 7), (3, 7)], [(-2, 7), (0, 8), (1, 9), (4, 6)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7)], [(-6, -4), (-4, -2), (-4, 6), (-2, 8)], [(-8, -2), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-6, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 6)], [(4, -5), (2, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 6), (6, 8)], [(4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6), (-5, 7)], [(-4, -4), (-4, -3), (-3, 0), (-3, 6), (0, 8)], [(-4, -6), (-4, -5), (-3, -3), (-2, 0), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-12, 13, [[(-7, -7), (-9, -5), (-9, -3), (-8, 0), (-8, 6), (-9, 7), (-7, 9)], [(-8, -4), (-8, -3), (-7, 0), (-7, 6), (-8, 7), (-7, 8), (-6, 7), (-7, 6)], [(-8, -6), (-8, -5), (-7, -3), (-6, 0), (-6, 6), (-5, 7), (-7, 9)], [(-3, -4), (-1, -3), (0, -1), (0, 6), (-1, 7)], [(-1, -4), (0, -3), (1, -1), (1, 6), (4, 8)], [(-6, -2), (-3, -4), (-1, -5), (1, -4), (2, -2), (2, 6), (4, 7), (5, 8)], [(-1, 7), (0, 7), (2, 8), (3, 9), (6, 8)], [(2, -2), (8, -5), (9, -3), (10, 0), (10, 2), (9, 6), (8, 7), (6, 8)], [(7, -4), (8, -3), (9, -1)], [(6, -4), (8, -2), (9, 1), (9, 3), (8, 6), (6, 8)]]),
-    (-7, 8, [[(-3, -3), (-2, -3), (-1, -2), (-1, 6), (-2, 6), (-4, 7), (-5, 9), (-5, 11), (-4, 13), (-2, 14), (1, 14), (4, 13), (4, 12), (3, 12), (3, 13)], [(-2, -4), (0, -2), (0, 6), (3, 8)], [(-4, -2), (-1, -5), (1, -3), (1, 6), (3, 7), (4, 8)], [(6, 7), (2, 9), (1, 8), (-1, 7), (-3, 7), (-5, 9)], [(3, -4), (4, -2), (6, -3), (5, -5), (1, -3)], [(4, -4), (5, -3)]]),
-    (-8, 9, [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6), (-5, 7)], [(-4, -4), (-4, -3), (-3, 0), (-3, 7), (-1, 8)], [(-4, -6), (-4, -5), (-3, -3), (-2, 0), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2, 9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4, 10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1), (5, 2), (5, 5), (4, 9), (2, 12)]]),
-    (-7, 7, [[(-4, -2), (1, -5), (3, -4), (4, -2), (4, 0), (3, 2), (-1, 4)], [(1, -4), (3, -3)], [(0, -4), (2, -3), (3, -1), (3, 0), (2, 2), (1, 3)], [(1, 3), (3, 5), (4, 7), (4, 11), (3, 13), (1, 14), (-1, 14), (-3, 13), (-4, 11), (-4, 9), (-3, 7), (-1, 6), (5, 4)], [(0, 4), (2, 5), (3, 7)], [(-1, 4), (2, 6), (3, 8), (3, 11), (2, 13), (1, 14)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]),
-]
-
-GOTHICENG = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-4, 5, [[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11), (0, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-11, 11, [[(-6, -9), (-4, -11), (-2, -12), (0, -12), (1, -11), (8, 5), (9, 6), (11, 6)], [(-1, -11), (0, -10), (7, 6), (8, 8), (9, 7), (7, 6)], [(-4, -11), (-2, -11), (-1, -10), (6, 6), (7, 8), (8, 9), (9, 9), (11, 6)], [(-6, -5), (-5, -6), (-3, -7), (-2, -7), (-1, -6)], [(-2, -6), (-2, -5)], [(-5, -6), (-3, -6), (-2, -4)], [(-11, 9), (-9, 7), (-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-4, 7), (-3, 8)], [(-11, 9), (-8, 8), (-5, 8), (-4, 9), (-2, 7)], [(0, -8), (-6, 6)], [(-4, 1), (4, 1)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (6, -12), (8, -11), (9, -9), (9, -7), (7, -5), (3, -3)], [(6, -11), (8, -9), (8, -7)], [(4, -11), (6, -10), (7, -9), (7, -6), (5, -4)], [(5, -4), (8, -2), (9, 0), (9, 6)], [(7, -2), (8, 0), (8, 5)], [(5, -4), (6, -3), (7, -1), (7, 6)], [(-8, 9), (-5, 7), (-2, 6), (2, 6), (5, 7)], [(-6, 8), (-3, 7), (2, 7), (4, 8)], [(-8, 9), (-4, 8), (1, 8), (3, 9), (5, 7), (7, 6), (9, 6)], [(3, -3), (3, 6)], [(3, 0), (7, 0)], [(3, 3), (7, 3)]]),
-    (-13, 11, [[(-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-8, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3)], [(-8, -7), (-9, -4), (-9, 1), (-7, 5), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 0), (-7, 3), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 3)], [(-2, -8), (-2, 4)], [(-1, -8), (-1, 2)], [(0, -9), (0, 1), (-1, 3), (-2, 4)], [(-2, -8), (0, -9), (3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11), (4, -10), (6, -10)], [(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)], [(5, -9), (5, 6)]]),
-    (-11, 12, [[(-9, -12), (5, -12), (7, -11), (8, -9), (8, 6)], [(-7, -11), (5, -11), (7, -9), (7, 5)], [(-9, -12), (-8, -11), (-6, -10), (5, -10), (6, -9), (6, 6)], [(-3, -7), (-4, -6), (-5, -4), (-5, -3), (-7, -3), (-8, -2), (-8, 0), (-7, -1), (-5, -1), (-5, 4)], [(-4, -5), (-4, 2)], [(-7, -2), (-4, -2)], [(-3, -7), (-3, 1), (-4, 3), (-5, 4)], [(-9, 9), (-6, 7), (-3, 6), (1, 6), (4, 7)], [(-7, 8), (-4, 7), (1, 7), (3, 8)], [(-9, 9), (-5, 8), (0, 8), (2, 9), (4, 7), (6, 6), (8, 6)], [(0, -10), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-11, 11, [[(-9, -10), (-7, -12), (-5, -12), (-3, -11), (-1, -12)], [(-6, -11), (-4, -11)], [(-9, -10), (-7, -11), (-5, -10), (-3, -10), (-1, -12)], [(-4, -7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)], [(-4, -7), (-4, 2), (-5, 4), (-6, 5)], [(-1, -5), (0, -8), (1, -10), (2, -11), (4, -12), (6, -12), (9, -11)], [(2, -10), (4, -11), (6, -11), (8, -10)], [(0, -8), (1, -9), (3, -10), (5, -10), (7, -9), (9, -11)], [(-1, 3), (0, 0), (1, -2), (2, -3), (4, -3), (6, -2)], [(2, -2), (4, -2), (5, -1)], [(0, 0), (1, -1), (3, -1), (4, 0), (6, -2)], [(-7, 9), (-4, 7), (0, 6), (5, 6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8), (4, 8), (7, 9), (9, 7)], [(-1, -5), (-1, 6)]]),
-    (-12, 11, [[(-8, -10), (-6, -12), (-3, -12), (-1, -11), (1, -12)], [(-5, -11), (-2, -11)], [(-8, -10), (-6, -11), (-4, -10), (-1, -10), (1, -12)], [(-2, -7), (-3, -6), (-4, -4), (-4, -3), (-6, -3), (-7, -2), (-7, 0), (-6, -1), (-4, -1), (-4, 4)], [(-3, -5), (-3, 2)], [(-6, -2), (-3, -2)], [(-2, -7), (-2, 1), (-3, 3), (-4, 4)], [(1, -8), (1, 7), (0, 8), (-1, 8), (-5, 6), (-7, 6), (-9, 7), (-11, 9)], [(2, -8), (2, 6)], [(2, -2), (6, -2)], [(-2, 8), (-3, 8), (-5, 7), (-8, 7)], [(3, -9), (3, -3), (6, -3)], [(6, -1), (3, -1), (3, 5), (2, 7), (-2, 9), (-4, 9), (-6, 8), (-8, 8), (-11, 9)], [(1, -8), (3, -9), (6, -12), (8, -11), (10, -11), (11, -12)], [(5, -11), (7, -10), (9, -10)], [(4, -10), (6, -9), (8, -9), (10, -10), (11, -12)], [(6, -9), (6, 5)]]),
-    (-13, 12, [[(-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 6), (9, 4), (9, 1), (8, -1), (7, -2), (5, -3), (3, -3)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 6), (8, 5), (8, 1), (7, -1)], [(3, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (3, -3)], [(-2, -8), (-2, 5)], [(-1, -8), (-1, 3)], [(0, -9), (0, 2), (-1, 4), (-2, 5)], [(-2, -8), (0, -9), (3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11), (4, -10), (6, -10)], [(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)], [(7, -10), (3, -3), (3, 9)], [(3, 1), (7, 1)], [(3, 4), (7, 4)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-3, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11), (6, -11), (7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3), (5, -4), (7, -6), (8, -5), (9, -2), (9, 2), (8, 6), (6, 9)], [(6, -5), (7, -4), (8, -2), (8, 3), (7, 6)], [(5, -4), (6, -4), (7, -2), (7, 3), (6, 9)], [(3, -3), (3, 7)], [(3, 0), (7, 0)], [(3, 3), (7, 3)]]),
-    (-9, 10, [[(-6, -10), (-4, -12), (-1, -12), (2, -11), (4, -12)], [(-3, -11), (1, -11)], [(-6, -10), (-4, -11), (-1, -10), (2, -10), (4, -12)], [(1, -7), (0, -6), (-1, -4), (-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3, -1), (-1, -1), (-1, 4)], [(0, -5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7), (1, 1), (0, 3), (-1, 4)], [(7, -10), (5, -8), (4, -5), (4, 6), (3, 8), (1, 8), (-3, 6), (-5, 6), (-7, 7), (-9, 9)], [(5, -7), (5, 5)], [(0, 8), (-1, 8), (-3, 7), (-6, 7)], [(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-7, 8), (-9, 9)]]),
-    (-10, 10, [[(-6, -10), (-4, -12), (-1, -12), (2, -11), (4, -12)], [(-3, -11), (1, -11)], [(-6, -10), (-4, -11), (-1, -10), (2, -10), (4, -12)], [(1, -7), (0, -6), (-1, -4), (-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3, -1), (-1, -1), (-1, 4)], [(0, -5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7), (1, 1), (0, 3), (-1, 4)], [(7, -10), (5, -8), (4, -5), (4, 6), (3, 8)], [(5, -7), (5, 5)], [(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 3), (-5, 4), (-6, 5), (-7, 5)], [(-8, 4), (-5, 4)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-4, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11), (6, -11), (7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3), (6, -6), (7, -5), (9, -4)], [(5, -5), (7, -4), (9, -4)], [(9, -4), (7, -1), (5, 1), (3, 3)], [(5, 1), (7, 2), (8, 6), (9, 8), (10, 8)], [(7, 4), (8, 8)], [(5, 1), (6, 2), (7, 8), (8, 9), (9, 9), (10, 8)], [(3, -3), (3, 7)]]),
-    (-11, 11, [[(-9, -10), (-7, -12), (-4, -12), (-2, -11), (0, -12)], [(-6, -11), (-3, -11)], [(-9, -10), (-7, -11), (-5, -10), (-2, -10), (0, -12)], [(-4, -7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)], [(-4, -7), (-4, 2), (-5, 4), (-6, 5)], [(-7, 9), (-4, 7), (0, 6), (5, 6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8), (4, 8), (7, 9), (9, 7)], [(1, -9), (0, -8), (-1, -6), (-1, 3)], [(0, -7), (0, 1)], [(1, -9), (1, 0), (0, 2), (-1, 3)], [(1, -9), (3, -11), (5, -12), (7, -12), (9, -11)], [(6, -11), (7, -11), (8, -10)], [(3, -11), (5, -11), (7, -9), (9, -11)], [(5, -11), (5, 6)]]),
-    (-14, 14, [[(-6, -8), (-7, -7), (-8, -5), (-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 3)], [(-7, -6), (-7, 1)], [(-10, -2), (-7, -2)], [(-6, -8), (-6, 0), (-7, 2), (-8, 3)], [(-13, 9), (-11, 7), (-9, 6), (-7, 6), (-5, 7), (-4, 7), (-3, 6)], [(-10, 7), (-7, 7), (-5, 8)], [(-13, 9), (-11, 8), (-8, 8), (-6, 9), (-5, 9), (-4, 8), (-3, 6)], [(-6, -8), (-2, -12), (2, -8), (2, 5), (3, 7), (4, 7)], [(-2, -11), (1, -8), (1, 6), (0, 7), (1, 8), (2, 7), (1, 6)], [(-2, -2), (1, -2)], [(-4, -10), (-3, -10), (0, -7), (0, -3), (-3, -3)], [(-3, -1), (0, -1), (0, 6), (-1, 7), (1, 9), (4, 7), (5, 6)], [(2, -8), (6, -12), (10, -8), (10, 5), (11, 7), (12, 7)], [(6, -11), (9, -8), (9, 6), (11, 8)], [(6, -2), (9, -2)], [(4, -10), (5, -10), (8, -7), (8, -3), (5, -3)], [(5, -1), (8, -1), (8, 7), (10, 9), (12, 7)], [(-3, -10), (-3, 6)], [(5, -10), (5, 6)]]),
-    (-13, 12, [[(-11, -9), (-9, -11), (-7, -12), (-5, -12), (-3, -11), (-1, -8), (4, 3), (6, 6), (7, 7)], [(-5, -11), (-3, -9), (-2, -7), (4, 5), (7, 8)], [(-9, -11), (-7, -11), (-5, -10), (-3, -7), (2, 4), (4, 7), (5, 8), (7, 9)], [(4, -10), (6, -9), (8, -9), (10, -10), (11, -12)], [(5, -11), (7, -10), (9, -10)], [(4, -10), (6, -12), (8, -11), (10, -11), (11, -12)], [(-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1)], [(-9, -2), (-7, -2)], [(-11, 9), (-9, 7), (-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-5, 7), (-3, 8)], [(-11, 9), (-8, 8), (-5, 8), (-4, 9), (-2, 7)], [(-7, -11), (-7, 6)], [(7, -9), (7, 9)], [(0, -6), (1, -5), (3, -4), (5, -4), (7, -5)], [(-7, 2), (-5, 1), (-1, 1), (1, 2)]]),
-    (-13, 13, [[(-4, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (8, -9), (6, -11), (4, -12), (3, -11), (0, -9), (-3, -8)], [(-8, -8), (-9, -5), (-9, 1), (-8, 4)], [(-4, -12), (-6, -10), (-7, -8), (-8, -5), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -5), (7, -9), (6, -10)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -5), (7, -7), (5, -10), (3, -11)], [(-3, -8), (-3, 5)], [(-2, -8), (-2, 3)], [(-1, -8), (-1, 2), (-2, 4), (-3, 5)], [(3, -11), (3, 8)], [(3, -5), (5, -4), (6, -4), (8, -5)], [(3, 1), (5, 0), (6, 0), (8, 1)]]),
-    (-10, 12, [[(-7, -12), (-6, -11), (-5, -9), (-5, -3), (-7, -3), (-8, -2), (-8, 0), (-7, -1), (-5, -1), (-5, 7), (-8, 9), (-5, 8), (-5, 16), (-3, 14)], [(-5, -10), (-4, -8), (-4, 14)], [(-7, -2), (-4, -2)], [(-7, -12), (-5, -11), (-4, -10), (-3, -8), (-3, 14)], [(-3, -7), (0, -9), (4, -12), (8, -8), (8, 6)], [(4, -11), (7, -8), (7, 6)], [(2, -10), (3, -10), (6, -7), (6, 7)], [(0, 6), (3, 6), (6, 7)], [(1, 7), (3, 7), (5, 8)], [(0, 8), (2, 8), (4, 9), (6, 7), (8, 6)], [(0, -9), (0, 13)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-13, 13, [[(-4, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (8, -9), (6, -11), (4, -12), (3, -11), (0, -9), (-3, -8)], [(-8, -8), (-9, -5), (-9, 1), (-8, 4)], [(-4, -12), (-6, -10), (-7, -8), (-8, -5), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -5), (7, -9), (6, -10)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -5), (7, -7), (5, -10), (3, -11)], [(-3, -8), (-3, 5)], [(-2, -8), (-2, 3)], [(-1, -8), (-1, 2), (-2, 4), (-3, 5)], [(3, -11), (3, 8)], [(3, -5), (5, -4), (6, -4), (8, -5)], [(3, 1), (5, 0), (6, 0), (8, 1)], [(-2, 9), (-1, 8), (0, 8), (2, 9), (6, 14), (8, 15), (9, 15)], [(2, 10), (4, 13), (6, 15), (7, 15)], [(0, 8), (1, 9), (4, 15), (6, 16), (8, 16), (9, 15)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-5, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9), (-5, 7), (-2, 6), (0, 6), (3, 7)], [(-6, 8), (-4, 7), (0, 7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)], [(0, -9), (3, -11), (5, -12), (7, -11), (8, -9), (8, -6), (7, -4), (6, -3), (2, -1), (0, 0)], [(5, -11), (6, -11), (7, -9), (7, -5), (6, -4)], [(3, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -1)], [(2, -1), (4, 0), (5, 1), (8, 6), (9, 7), (10, 7)], [(5, 2), (7, 6), (9, 8)], [(2, -1), (4, 1), (6, 7), (8, 9), (10, 7)]]),
-    (-11, 12, [[(3, -9), (2, -10), (0, -11), (-3, -12)], [(4, -10), (2, -11)], [(5, -11), (1, -12), (-3, -12), (-6, -11), (-7, -10), (-8, -8), (-7, -6), (-6, -5), (-3, -4), (5, -4), (7, -3), (8, -2), (8, 0), (7, 3)], [(-7, -7), (-6, -6), (-3, -5), (6, -5), (8, -4), (9, -3), (9, -1), (8, 1)], [(-7, -10), (-7, -8), (-6, -7), (-3, -6), (7, -6), (9, -5), (10, -3), (10, -1), (7, 3), (3, 9)], [(-9, -3), (-8, -2), (-6, -1), (3, -1), (4, 0), (4, 1), (3, 3)], [(-8, -1), (-6, 0), (2, 0), (3, 1)], [(-9, -3), (-9, -2), (-8, 0), (-6, 1), (1, 1), (3, 2), (3, 3)], [(-9, 9), (-6, 7), (-2, 6), (1, 6), (4, 7)], [(-7, 8), (-4, 7), (0, 7), (3, 8)], [(-9, 9), (-5, 8), (0, 8), (3, 9)], [(5, -11), (3, -9), (1, -6)], [(0, -4), (-2, -1)], [(-3, 1), (-5, 3), (-7, 4), (-8, 4), (-8, 3), (-7, 4)]]),
-    (-13, 11, [[(-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3)], [(-9, 1), (-8, 4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-8, -8), (-9, -5), (-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 3)], [(-10, -9), (-9, -11), (-7, -12), (-3, -12), (3, -11), (7, -11), (9, -12)], [(-2, -11), (2, -10), (6, -10)], [(-10, -9), (-9, -10), (-7, -11), (-4, -11), (2, -9), (5, -9), (7, -10), (9, -12)], [(1, -9), (0, -8), (-2, -7), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8), (0, 1), (-1, 3), (-2, 4)], [(5, -9), (5, 6)]]),
-    (-12, 12, [[(-10, -10), (-8, -12), (-6, -12), (-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-5, -10), (-3, -10), (-1, -12)], [(-7, -8), (-8, -6), (-9, -3), (-9, 1), (-8, 4), (-7, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 9), (10, 7)], [(-8, 1), (-7, 4), (-4, 7), (-1, 8), (2, 8)], [(-7, -8), (-8, -4), (-8, -1), (-7, 2), (-6, 4), (-4, 6), (-1, 7), (3, 7), (6, 6)], [(3, -9), (-1, -8), (-2, -6), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8), (0, 1), (-1, 3), (-2, 4)], [(3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 5), (9, 7), (10, 7)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 6), (9, 8)], [(5, -10), (6, -9), (6, 6)], [(3, -9), (3, 7)], [(3, -4), (6, -4)], [(3, 0), (6, 0)]]),
-    (-11, 12, [[(-8, -12), (-7, -11), (-6, -9), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)], [(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7), (1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6), (3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6), (8, 6)], [(0, -8), (3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 6)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 5)], [(5, -10), (6, -9), (6, 6)], [(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-13, 14, [[(-10, -12), (-9, -11), (-8, -9), (-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 6), (-10, 7)], [(-8, -10), (-7, -8), (-7, 6)], [(-10, -2), (-7, -2)], [(-6, 7), (-4, 7), (-2, 8)], [(-10, -12), (-8, -11), (-7, -10), (-6, -8), (-6, 6), (-3, 6), (-1, 7)], [(-10, 7), (-7, 7), (-4, 8), (-3, 9), (-1, 7), (2, 6), (4, 7), (5, 9), (7, 7), (10, 6)], [(-3, -10), (0, -12), (2, -10), (2, 6), (5, 6), (7, 7)], [(0, -11), (1, -10), (1, 6)], [(-3, -10), (-1, -10), (0, -9), (0, 6), (-1, 7)], [(5, 7), (6, 8)], [(5, -10), (8, -12), (10, -10), (10, 6)], [(8, -11), (9, -10), (9, 6)], [(5, -10), (7, -10), (8, -9), (8, 6), (7, 7)], [(-3, -10), (-3, 6)], [(5, -10), (5, 6)], [(-3, -4), (0, -4)], [(-3, 0), (0, 0)], [(5, -4), (8, -4)], [(5, 0), (8, 0)]]),
-    (-11, 11, [[(-10, -9), (-8, -11), (-6, -12), (-4, -12), (-3, -11), (5, 7), (6, 8), (8, 8)], [(-5, -11), (-4, -10), (4, 7), (5, 8)], [(-8, -11), (-6, -11), (-5, -10), (3, 8), (4, 9), (6, 9), (8, 8), (10, 6)], [(5, -12), (7, -11), (9, -11), (10, -12)], [(5, -11), (6, -10), (8, -10)], [(4, -10), (5, -9), (7, -9), (9, -10), (10, -12)], [(-10, 9), (-9, 7), (-7, 6), (-5, 6), (-4, 7)], [(-8, 7), (-6, 7), (-5, 8)], [(-10, 9), (-9, 8), (-7, 8), (-5, 9)], [(5, -12), (1, -3)], [(-1, 0), (-5, 9)], [(-6, -2), (-2, -2)], [(1, -2), (6, -2)]]),
-    (-11, 12, [[(-8, -12), (-7, -11), (-6, -9), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)], [(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7), (1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6), (3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6)], [(0, -8), (3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 12), (7, 14), (5, 16), (3, 15), (-1, 14), (-6, 14)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 7)], [(5, -10), (6, -9), (6, 6), (8, 9)], [(6, 15), (4, 14), (1, 14)], [(7, 14), (4, 13), (-2, 13), (-6, 14)], [(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]),
-    (-10, 10, [[(6, -11), (5, -9), (0, -3), (-3, 1), (-5, 5), (-8, 9)], [(4, -7), (-4, 4)], [(8, -12), (5, -8), (3, -4), (0, 0), (-5, 6), (-6, 8)], [(-8, -10), (-6, -12), (-3, -11), (3, -11), (8, -12)], [(-7, -11), (-3, -10), (1, -10), (5, -11)], [(-8, -10), (-4, -9), (0, -9), (4, -10), (6, -11)], [(-6, 8), (-4, 7), (0, 6), (4, 6), (8, 7)], [(-5, 8), (-1, 7), (3, 7), (7, 8)], [(-8, 9), (-3, 8), (3, 8), (6, 9), (8, 7)], [(-5, -2), (-1, -2)], [(2, -2), (6, -2)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-11, 11, [[(-11, 16), (11, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-8, 9, [[(-2, 0), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (0, 7), (3, 6)], [(-5, 4), (-4, 6), (-3, 7), (-1, 8)], [(-4, 2), (-4, 4), (-3, 6), (-1, 7), (0, 7)], [(-4, -2), (-2, -2), (1, -3), (3, -4), (4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(-3, -4), (-4, -3), (-1, -3)], [(2, -3), (5, -3), (4, -4), (4, 7), (5, 8)], [(-5, -3), (-3, -5), (-2, -4), (0, -3), (3, -2), (3, 7), (5, 9), (7, 7)], [(-5, -3), (0, 2)]]),
-    (-9, 9, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7)], [(-4, -8), (-5, -10), (-4, -11), (-4, 6), (-1, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7)], [(2, -4), (4, -3), (4, 6)], [(0, -3), (1, -3), (3, -2), (3, 7)]]),
-    (-8, 6, [[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -3), (-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -3), (0, -4), (2, -5), (3, -4), (5, -3), (6, -3)], [(1, -4), (2, -3), (4, -3)], [(-2, -3), (0, -4), (2, -2), (4, -2), (6, -3)]]),
-    (-9, 8, [[(0, -5), (-2, -4), (-5, -3), (-5, 6), (-7, 7)], [(-4, -3), (-4, 6), (-1, 8)], [(0, -5), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-5, -10), (-2, -12), (-1, -9), (5, -3), (5, 7)], [(-2, -9), (-4, -10), (-3, -11), (-2, -9), (4, -3), (4, 6)], [(-5, -10), (3, -2), (3, 7)]]),
-    (-8, 6, [[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -3), (-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -3), (0, -4), (2, -5), (5, -1), (3, 0), (-2, 3)], [(1, -4), (4, -1)], [(-2, -3), (0, -4), (3, 0)]]),
-    (-8, 5, [[(-4, -10), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -10), (-3, 7), (-1, 8)], [(-2, -10), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -10), (-1, -11), (1, -12), (2, -11), (4, -10), (5, -10)], [(0, -11), (1, -10), (3, -10)], [(-2, -10), (-1, -11), (1, -9), (3, -9), (5, -10)], [(-7, -5), (-4, -5)], [(-2, -5), (2, -5)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(-4, -2), (-4, 7), (-2, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14), (-5, 14)], [(1, -4), (4, -2), (4, 10)], [(1, 15), (-1, 14), (-2, 14)], [(0, -4), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14), (-1, 13), (-3, 13), (-5, 14)]]),
-    (-9, 9, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-4, -8), (-5, -10), (-4, -11), (-4, 7), (-2, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7), (3, 9), (2, 11)], [(2, -4), (4, -3), (4, 7), (3, 9)], [(0, -3), (1, -3), (3, -2), (3, 7), (2, 11), (2, 14), (3, 16), (4, 16), (2, 14)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -9), (2, -10), (0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0, -5), (-1, -4), (-3, -3), (-1, -2), (-1, 7), (1, 9), (3, 7)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 8)], [(0, -5), (1, -4), (3, -3), (1, -2), (1, 6), (2, 7), (3, 7)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -9), (2, -10), (0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0, -5), (-1, -4), (-3, -3), (-1, -2), (-1, 7), (1, 9), (2, 11)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 9)], [(0, -5), (1, -4), (3, -3), (1, -2), (1, 7), (2, 11), (2, 14), (0, 16), (-2, 16), (-2, 15), (0, 16)]]),
-    (-9, 8, [[(-6, -10), (-5, -8), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-4, -8), (-5, -10), (-4, -11), (-4, 7), (-2, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1, -4), (3, -2)], [(0, -4), (2, -1)], [(1, 0), (2, 1), (4, 6), (5, 7), (6, 7)], [(1, 1), (2, 2), (3, 7), (4, 8)], [(0, 1), (1, 2), (2, 7), (4, 9), (6, 7)]]),
-    (-5, 5, [[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8), (1, 9)], [(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10), (1, -12), (1, 6), (3, 7), (4, 7), (2, 8), (1, 9)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-11, 7), (-10, 7), (-8, 8), (-7, 9)], [(-9, -4), (-8, -3), (-8, 7), (-6, 8)], [(-11, -3), (-9, -5), (-7, -3), (-7, 6), (-5, 7), (-7, 9)], [(-7, -2), (-4, -3), (-2, -4), (-1, -5), (1, -3), (1, 6), (3, 7), (1, 9)], [(-2, -4), (0, -3), (0, 7), (2, 8)], [(-4, -3), (-3, -3), (-1, -2), (-1, 6), (-2, 7), (0, 8), (1, 9)], [(1, -2), (4, -3), (6, -4), (7, -5), (8, -4), (10, -3), (11, -3), (9, -2), (9, 6), (10, 7), (11, 7)], [(6, -4), (8, -3), (8, 7), (9, 8)], [(4, -3), (5, -3), (7, -2), (7, 7), (9, 9), (11, 7)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(0, -3), (1, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4, 6), (-1, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 7)], [(1, -4), (4, -2), (4, 6)], [(0, -4), (1, -3), (3, -2), (3, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-7, 7), (-5, 7), (-5, 16)], [(-5, -4), (-4, -3), (-4, 15), (-3, 14), (-4, 12)], [(-4, 7), (-3, 7), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-3, 8), (-3, 12), (-2, 14), (-5, 16)], [(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7)], [(2, -4), (4, -3), (4, 6)], [(0, -3), (1, -3), (3, -2), (3, 7)]]),
-    (-9, 9, [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4, 7), (-2, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 16)], [(1, -4), (4, -2), (4, 15), (3, 14), (4, 12)], [(0, -4), (1, -3), (3, -2), (3, 12), (2, 14), (5, 16)]]),
-    (-8, 6, [[(-6, -3), (-5, -3), (-4, -2), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-5, -4), (-3, -3), (-3, 7), (-1, 8)], [(-6, -3), (-4, -5), (-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-2, -3), (2, -5), (3, -4), (5, -3), (6, -3)], [(1, -4), (2, -3), (4, -3)], [(0, -4), (2, -2), (4, -2), (6, -3)]]),
-    (-8, 8, [[(-5, -3), (-5, 1), (-3, 2), (3, 2), (5, 3), (5, 7)], [(-4, -3), (-4, 1)], [(4, 3), (4, 7)], [(-2, -4), (-3, -3), (-3, 1), (-1, 2)], [(1, 2), (3, 3), (3, 7), (2, 8)], [(-5, -3), (-2, -4), (0, -5), (2, -4), (4, -4), (5, -5)], [(-1, -4), (1, -4)], [(-2, -4), (0, -3), (2, -3), (4, -4)], [(5, 7), (2, 8), (0, 9), (-2, 8), (-4, 8), (-6, 9)], [(1, 8), (-1, 8)], [(2, 8), (0, 7), (-3, 7), (-6, 9)], [(5, -5), (4, -3), (2, 0), (-3, 5), (-6, 9)]]),
-    (-5, 5, [[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8), (1, 9)], [(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10), (1, -12), (1, 6), (3, 7), (4, 7), (2, 8), (1, 9)], [(-4, -5), (-1, -5)], [(1, -5), (4, -5)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7)], [(-6, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(3, -5), (1, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-2, 9), (0, 7), (3, 6), (5, 6)], [(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 5), (-2, 6), (0, 7)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6)], [(2, -4), (4, -3), (4, 5)], [(3, -5), (1, -3), (3, -2), (3, 6)]]),
-    (-13, 13, [[(-10, -5), (-9, -3), (-9, 6), (-6, 9), (-4, 7), (-1, 6)], [(-9, -4), (-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5), (-6, 6), (-4, 7)], [(-1, -5), (-3, -3), (-1, -2), (-1, 6), (2, 9), (4, 7), (7, 6), (9, 6)], [(-2, -4), (0, -3), (0, 6), (3, 8)], [(-1, -5), (0, -4), (2, -3), (1, -2), (1, 5), (2, 6), (4, 7)], [(7, -5), (8, -4), (10, -3), (11, -3), (9, -2), (9, 6)], [(6, -4), (8, -3), (8, 5)], [(7, -5), (5, -3), (7, -2), (7, 6)]]),
-    (-10, 9, [[(-7, -3), (-6, -3), (-4, -2), (-3, -1), (1, 7), (2, 8), (4, 9), (6, 7)], [(-5, -4), (-3, -3), (2, 7), (4, 8)], [(-7, -3), (-5, -5), (-3, -4), (-2, -3), (2, 5), (3, 6), (5, 7), (6, 7)], [(0, 1), (3, -5), (4, -4), (6, -4), (7, -5)], [(3, -4), (4, -3), (5, -3)], [(2, -3), (4, -2), (6, -3), (7, -5)], [(-1, 3), (-4, 9), (-5, 8), (-7, 8), (-8, 9)], [(-4, 8), (-5, 7), (-6, 7)], [(-3, 7), (-5, 6), (-7, 7), (-8, 9)], [(-5, 2), (-2, 2)], [(1, 2), (4, 2)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7)], [(-6, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14), (-5, 14)], [(2, -4), (4, -3), (4, 10)], [(1, 15), (-1, 14), (-2, 14)], [(3, -5), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14), (-1, 13), (-3, 13), (-5, 14)]]),
-    (-9, 9, [[(6, -5), (-6, 9)], [(-6, -3), (-4, -2), (-1, -2), (2, -3), (6, -5)], [(-5, -4), (-3, -3), (1, -3)], [(-6, -3), (-4, -5), (-2, -4), (2, -4), (6, -5)], [(-6, 9), (-2, 7), (1, 6), (4, 6), (6, 7)], [(-1, 7), (3, 7), (5, 8)], [(-6, 9), (-2, 8), (2, 8), (4, 9), (6, 7)], [(-4, 2), (4, 2)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-GOTHICGER = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-4, 5, [[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11), (0, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-12, 12, [[(-9, -10), (-8, -9), (-9, -8), (-10, -9), (-9, -11), (-7, -12), (-5, -12), (-3, -11), (-2, -10), (-1, -7), (-1, -3), (-2, 0), (-4, 2), (-6, 3), (-9, 4)], [(-3, -10), (-2, -7), (-2, -2), (-3, 0)], [(-5, -12), (-4, -11), (-3, -8), (-3, -2), (-4, 1), (-6, 3)], [(-6, 4), (-3, 7)], [(-7, 4), (-3, 8)], [(-9, 4), (-4, 9), (3, 4)], [(10, -11), (9, -10), (10, -10), (10, -11), (9, -12), (7, -12), (5, -11), (4, -10), (3, -8), (3, 7), (5, 9), (9, 5)], [(5, -10), (4, -8), (4, 6), (6, 8)], [(7, -12), (6, -11), (5, -8), (5, 5), (7, 7)]]),
-    (-13, 13, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0), (-1, 3), (-3, 5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11), (-2, -8), (-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (0, -2)], [(7, -5), (9, -3), (10, 0), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(6, -4), (7, -4), (9, -2)], [(4, -4), (7, -3), (9, -1), (10, 1)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)]]),
-    (-12, 12, [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9, -4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7), (-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3), (-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10), (-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1, -7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4), (4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12), (4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2, -11), (4, -9), (6, -9), (8, -10), (9, -11)]]),
-    (-13, 13, [[(-10, -6), (-10, -7), (-9, -9), (-7, -11), (-4, -12), (0, -12), (3, -11), (5, -10), (7, -8), (9, -5), (10, -1), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(-7, -10), (-5, -11), (0, -11), (3, -10), (5, -9), (7, -7), (9, -4)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(-10, -7), (-8, -9), (-5, -10), (0, -10), (3, -9), (5, -8), (7, -6), (9, -3), (10, 0)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(-2, -10), (-5, -7), (-6, -5), (-6, -3), (-4, 1), (-4, 3)], [(-5, -4), (-5, -3), (-4, -1), (-4, 0)], [(-5, -7), (-5, -5), (-3, -1), (-3, 1), (-4, 3), (-5, 4), (-7, 4), (-8, 3), (-8, 2)]]),
-    (-12, 12, [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9, -4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7), (-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3), (-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10), (-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1, -7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4), (4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12), (4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2, -11), (4, -9), (6, -9), (8, -10), (9, -11)], [(3, -4), (7, -7)], [(7, -7), (8, -6), (10, -6)], [(6, -6), (7, -5), (8, -5)], [(5, -5), (6, -4), (8, -4), (10, -6)]]),
-    (-12, 12, [[(-5, -4), (-7, -5), (-8, -7), (-8, -9), (-7, -11), (-4, -12), (-1, -12), (2, -11), (6, -9)], [(-7, -10), (-5, -11), (0, -11), (3, -10)], [(-8, -7), (-7, -9), (-5, -10), (0, -10), (6, -9), (8, -9), (9, -10), (9, -11), (8, -12), (7, -12)], [(1, -10), (0, -9), (-1, -7), (-1, -5), (0, -3), (4, 1), (5, 4), (5, 7), (4, 10), (3, 11), (1, 12)], [(2, -2), (5, 1), (6, 4), (6, 7), (5, 9)], [(-1, -5), (1, -3), (4, -1), (6, 1), (7, 4), (7, 7), (6, 9), (4, 11), (1, 12), (-3, 12), (-6, 11), (-7, 10), (-8, 8), (-8, 5), (-6, 2), (-6, 0), (-7, -1)], [(-6, 10), (-7, 9), (-7, 5), (-6, 3)], [(-3, 12), (-5, 11), (-6, 9), (-6, 5), (-5, 2), (-5, 0), (-6, -1), (-8, -1), (-9, 0), (-9, 1)], [(3, -2), (7, -6)], [(7, -6), (8, -5), (10, -5)], [(6, -5), (7, -4), (8, -4)], [(5, -4), (6, -3), (8, -3), (10, -5)]]),
-    (-13, 13, [[(3, -8), (2, -10), (1, -11), (-1, -12), (-4, -12), (-7, -11), (-9, -8), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (9, 5), (10, 2), (10, -1), (9, -4), (7, -6)], [(-7, -10), (-8, -8), (-9, -5), (-9, 0), (-8, 3), (-7, 5)], [(8, 5), (9, 3), (9, -1), (8, -4), (7, -5)], [(-4, -12), (-6, -11), (-7, -9), (-8, -5), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(5, 8), (7, 6), (8, 3), (8, -1), (7, -3), (5, -5)], [(3, -12), (0, -10), (-2, -8), (-3, -6), (-3, -5), (-2, -3), (1, -1), (2, 1), (2, 3)], [(-2, -6), (-2, -5), (2, -1), (2, 0)], [(-2, -8), (-2, -7), (-1, -5), (2, -3), (3, -1), (3, 1), (2, 3), (0, 4), (-1, 4), (-3, 3), (-4, 1)], [(2, -3), (7, -6), (8, -8)], [(10, -12), (8, -8)], [(7, -11), (11, -9)], [(10, -12), (9, -11), (7, -11), (8, -10), (8, -8), (9, -9), (11, -9), (10, -10), (10, -12)]]),
-    (-12, 13, [[(0, -12), (-2, -11), (-4, -9), (-5, -7), (-5, -5), (-4, -3), (-2, -1), (-1, 1), (-1, 3)], [(-4, -6), (-4, -5), (-1, -1), (-1, 0)], [(-4, -9), (-4, -7), (-3, -5), (-1, -3), (0, -1), (0, 1), (-1, 3), (-2, 4), (-4, 5), (-6, 5), (-8, 4), (-9, 3), (-10, 1), (-10, -1), (-9, -2), (-8, -1), (-9, 0)], [(0, -12), (2, -10), (4, -10), (6, -11)], [(-1, -11), (1, -10)], [(-2, -11), (-1, -10), (1, -9), (3, -9), (6, -11)], [(0, -2), (7, -7)], [(7, -7), (9, -4), (10, -1), (10, 2), (9, 5), (7, 7), (4, 8), (0, 9)], [(6, -6), (8, -4), (9, -1), (9, 3), (8, 5)], [(4, -5), (5, -5), (7, -3), (8, 0), (8, 4), (7, 6), (6, 7), (4, 8)], [(4, 8), (2, 8), (0, 7), (-2, 7), (-4, 8), (-5, 10), (-4, 12), (-2, 13), (0, 13), (2, 12)], [(1, 8), (-1, 8)], [(0, 9), (-2, 8), (-4, 8)]]),
-    (-12, 13, [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8, -6), (-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11), (5, -8), (7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)], [(-8, -8), (-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7), (9, -7), (10, -8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7), (-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10), (2, 12)], [(-4, 6), (-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5), (-4, 7), (-2, 10), (-1, 11), (1, 12), (4, 12), (6, 11), (7, 10), (8, 8), (8, 5), (7, 3), (5, 0), (4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0), (4, -1)], [(6, 11), (7, 9), (7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5, -4), (7, -4), (8, -3), (8, -2)]]),
-    (-12, 13, [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8, -6), (-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11), (5, -8), (7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)], [(-8, -8), (-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7), (9, -7), (10, -8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7), (-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10), (2, 12)], [(-4, 6), (-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5), (-4, 7), (-2, 10), (-1, 11), (1, 12), (4, 12), (6, 11), (7, 10), (8, 8), (8, 5), (7, 3), (5, 0), (4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0), (4, -1)], [(6, 11), (7, 9), (7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5, -4), (7, -4), (8, -3), (8, -2)]]),
-    (-13, 13, [[(9, -7), (8, -9), (6, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-6, -4), (-5, -1), (-2, 5), (-2, 7), (-4, 9)], [(-5, -4), (-5, -3), (-2, 3), (-2, 4)], [(-4, -10), (-5, -8), (-5, -5), (-4, -3), (-2, 1), (-1, 4), (-1, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8)], [(-10, 4), (-8, 8)], [(-11, 7), (-7, 5)], [(-10, 4), (-10, 6), (-11, 7), (-9, 7), (-8, 8), (-8, 6), (-7, 5), (-9, 5), (-10, 4)], [(-4, -3), (-4, -5), (-3, -7), (-1, -8), (2, -8), (4, -7), (6, -5), (7, -5)], [(3, -7), (5, -5)], [(0, -8), (2, -7), (3, -6), (4, -4)], [(7, -5), (-2, -1)], [(3, -3), (7, 6), (8, 7), (9, 7)], [(2, -2), (6, 6), (8, 8)], [(1, -2), (5, 7), (7, 9), (10, 6)]]),
-    (-11, 12, [[(8, 1), (7, 2), (4, 2), (3, 1), (3, -1), (4, -3), (6, -6), (7, -8), (7, -10)], [(4, -1), (4, -2), (7, -6), (7, -7)], [(5, 2), (4, 1), (4, 0), (5, -2), (7, -4), (8, -6), (8, -8), (7, -10), (6, -11), (3, -12), (-2, -12), (-5, -11), (-6, -10), (-7, -8), (-7, -6), (-6, -4), (-4, -1), (-3, 1), (-3, 2), (-4, 4)], [(-6, -7), (-6, -6), (-3, -1), (-3, 0)], [(-6, -10), (-6, -8), (-5, -6), (-3, -3), (-2, -1), (-2, 1), (-3, 3), (-5, 5), (-8, 7)], [(-5, 5), (-3, 5), (0, 7), (3, 8), (6, 8), (8, 7)], [(-4, 6), (-3, 6), (1, 8), (2, 8)], [(-8, 7), (-6, 6), (-5, 6), (-1, 8), (2, 9), (4, 9), (7, 8), (8, 7), (9, 5)]]),
-    (-16, 16, [[(-13, -1), (-13, 0), (-12, 1), (-10, 1), (-8, 0), (-8, -3), (-9, -5), (-11, -8), (-11, -10), (-9, -12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9, 0), (-9, -2), (-11, -5), (-12, -7), (-12, -9), (-11, -11), (-9, -12), (-7, -12), (-5, -11), (-3, -9), (-2, -6), (-2, 0), (-3, 3), (-4, 5), (-6, 7), (-9, 9), (-10, 8), (-11, 8)], [(-4, -9), (-3, -6), (-3, 0), (-4, 3), (-5, 5)], [(-8, 8), (-9, 7), (-10, 7)], [(-7, -12), (-5, -10), (-4, -7), (-4, 0), (-5, 4), (-6, 6), (-7, 7), (-8, 6), (-9, 6), (-12, 9)], [(-4, -11), (-2, -12), (0, -12), (2, -11), (4, -9), (5, -6), (5, 0), (4, 3), (3, 5), (1, 7), (-1, 9), (-2, 8), (-3, 8)], [(3, -9), (4, -6), (4, 0), (3, 4)], [(0, 8), (-1, 7), (-2, 7)], [(0, -12), (2, -10), (3, -7), (3, 1), (2, 5), (1, 7), (0, 6), (-1, 6), (-4, 9)], [(3, -10), (4, -11), (6, -12), (8, -12), (10, -11), (11, -10), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12), (9, -11), (10, -8), (11, -7), (13, -7)], [(13, -7), (10, -5), (9, -4), (8, -1), (8, 2), (9, 6), (11, 9), (14, 6)], [(10, -4), (9, -2), (9, 2), (10, 5), (12, 8)], [(13, -7), (11, -5), (10, -3), (10, 1), (11, 5), (13, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (0, -9), (1, -6), (1, 0), (0, 3), (-1, 5), (-3, 7), (-6, 9), (-7, 8), (-9, 8), (-11, 9)], [(-1, -9), (0, -7), (0, 0), (-1, 3), (-2, 5), (-3, 6)], [(-5, 8), (-7, 7), (-9, 7)], [(-4, -12), (-2, -10), (-1, -7), (-1, 0), (-2, 4), (-4, 7), (-6, 6), (-8, 6), (-11, 9)], [(0, -10), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (7, -5), (6, -4), (5, -1), (5, 2), (6, 6), (8, 9), (11, 6)], [(7, -4), (6, -2), (6, 2), (7, 5), (9, 8)], [(10, -7), (8, -5), (7, -3), (7, 1), (8, 5), (10, 7)]]),
-    (-14, 14, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3), (-5, -2)], [(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2), (-8, 2), (-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7), (9, -5), (10, -2), (10, 1), (9, 4), (8, 6), (6, 8), (3, 9), (0, 9), (-3, 8), (-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8), (7, -7), (8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6), (9, -4), (10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(7, 7), (5, 8), (2, 8), (-1, 7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-13, 14, [[(-10, -1), (-10, 0), (-9, 1), (-7, 1), (-5, 0), (-5, -3), (-6, -5), (-8, -8), (-8, -10), (-6, -12)], [(-6, -3), (-8, -7)], [(-7, 1), (-6, 0), (-6, -2), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -10), (1, -8), (1, 3)], [(1, 5), (1, 10), (0, 12), (-2, 13), (-5, 13), (-6, 12), (-6, 10), (-5, 9), (-4, 10), (-5, 11)], [(-1, -10), (0, -8), (0, 10), (-1, 12)], [(-3, -12), (-2, -11), (-1, -8), (-1, 3)], [(-1, 5), (-1, 10), (-2, 12), (-3, 13)], [(1, -8), (6, -12)], [(6, -12), (8, -9), (9, -7), (10, -3), (10, 0), (9, 3), (7, 6), (4, 9)], [(5, -11), (8, -7), (9, -4), (9, -3)], [(4, -10), (6, -8), (8, -5), (9, -2), (9, 1), (8, 4), (7, 6)], [(5, 7), (3, 4), (1, 3)], [(-1, 3), (-3, 4), (-5, 6)], [(5, 8), (3, 5), (1, 4), (-2, 4)], [(4, 9), (2, 6), (1, 5)], [(-1, 5), (-3, 5), (-5, 6)]]),
-    (-14, 14, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3), (-5, -2)], [(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2), (-8, 2), (-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7), (9, -5), (10, -2), (10, 1), (9, 4), (8, 6)], [(6, 8), (3, 9), (0, 9), (-3, 8), (-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8), (7, -7), (8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6), (9, -4), (10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(6, 8), (2, 8), (-1, 7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9), (-9, 8), (-10, 7)], [(2, 6), (4, 4), (6, 4), (10, 8), (11, 8)], [(5, 5), (6, 5), (9, 8)], [(3, 5), (4, 5), (8, 9), (10, 9), (12, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 4), (-1, 6), (-3, 8), (-5, 9), (-7, 9), (-9, 8)], [(-2, -10), (-1, -8), (-1, 4), (-2, 6)], [(-4, -12), (-3, -11), (-2, -8), (-2, 4), (-3, 7), (-5, 9)], [(-11, 4), (-9, 8)], [(-12, 7), (-8, 5)], [(-11, 4), (-11, 6), (-12, 7), (-10, 7), (-9, 8), (-9, 6), (-8, 5), (-10, 5), (-11, 4)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (0, -2)], [(2, -3), (6, 7), (8, 9), (11, 6)], [(3, -3), (7, 6), (9, 8)], [(4, -4), (8, 6), (9, 7), (10, 7)]]),
-    (-13, 14, [[(10, -10), (9, -11), (10, -12), (11, -11), (11, -9), (10, -7), (8, -7), (4, -9), (1, -10), (-3, -10), (-7, -9), (-9, -7)], [(7, -8), (4, -10), (1, -11), (-3, -11), (-6, -10)], [(11, -9), (10, -8), (8, -8), (4, -11), (1, -12), (-3, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7), (10, 5), (11, 2), (11, -1), (10, -3), (8, -4), (5, -4), (3, -3), (1, 0), (-1, 1), (-3, 1)], [(-6, 6), (-4, 7), (-1, 8), (3, 8), (7, 7)], [(-9, 3), (-7, 5), (-5, 6), (-2, 7), (3, 7), (7, 6), (9, 5), (10, 4), (11, 2)], [(6, -3), (5, -3), (1, 1), (0, 1)], [(11, -1), (9, -3), (7, -3), (5, -2), (3, 1), (1, 2), (-1, 2), (-3, 1), (-4, -1), (-4, -3), (-3, -5), (-1, -6)]]),
-    (-12, 13, [[(-6, -4), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-5, -12), (0, -12), (3, -11), (7, -8), (9, -8), (10, -9)], [(-8, -10), (-6, -11), (0, -11), (3, -10), (6, -8)], [(-9, -7), (-8, -9), (-6, -10), (0, -10), (3, -9), (7, -7), (9, -7), (10, -9), (10, -11), (9, -12), (8, -11), (9, -10)], [(3, -9), (0, -6), (-1, -4), (-1, -2), (1, 2), (1, 4)], [(0, -3), (0, -2), (1, 0), (1, 1)], [(0, -6), (0, -4), (2, 0), (2, 2), (1, 4), (0, 5), (-2, 5), (-3, 4), (-3, 2)], [(-8, 7), (-7, 8), (-8, 9), (-9, 8), (-9, 6), (-8, 4), (-6, 4), (-3, 5), (1, 7), (4, 8), (7, 8), (9, 7)], [(-6, 5), (-5, 5), (1, 8), (3, 8)], [(-9, 6), (-8, 5), (-7, 5), (-5, 6), (-1, 8), (2, 9), (5, 9), (8, 8), (10, 6)]]),
-    (-11, 11, [[(-8, -10), (-7, -10), (-6, -9), (-6, 5), (-8, 6)], [(-7, -11), (-5, -10), (-5, 6), (-2, 8)], [(-9, -9), (-6, -12), (-4, -10), (-4, 5), (-2, 7), (0, 7)], [(-8, 6), (-7, 6), (-5, 7), (-3, 9), (0, 7), (4, 4)], [(2, -10), (3, -10), (4, -9), (4, 7), (6, 9), (9, 6)], [(3, -11), (5, -10), (5, 7), (7, 8)], [(1, -9), (4, -12), (7, -10), (6, -9), (6, 6), (7, 7), (8, 7)]]),
-    (-14, 14, [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0), (-1, 3), (-3, 5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11), (-2, -8), (-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7), (10, -7)], [(8, -7), (6, -7), (5, -6), (5, -4), (6, -2), (9, 0), (10, 2)], [(6, -3), (9, -1)], [(5, -5), (6, -4), (9, -2), (10, 0), (10, 4), (9, 6), (7, 8), (5, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5), (-10, 6)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8), (-9, 7)]]),
-    (-16, 17, [[(-13, -1), (-13, 0), (-12, 1), (-10, 1), (-8, 0), (-8, -3), (-9, -5), (-11, -8), (-11, -10), (-9, -12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9, 0), (-9, -2), (-11, -5), (-12, -7), (-12, -9), (-11, -11), (-9, -12), (-6, -12), (-4, -11), (-3, -10), (-2, -8), (-2, -4), (-3, -1), (-5, 2), (-7, 4)], [(-4, -10), (-3, -8), (-3, -3), (-4, 0)], [(-6, -12), (-5, -11), (-4, -8), (-4, -3), (-5, 1), (-7, 4)], [(-4, -11), (-2, -12), (1, -12), (3, -11)], [(5, -12), (2, -11), (1, -9), (1, -5), (2, -2), (4, 1), (5, 3), (5, 5), (4, 7)], [(2, -5), (2, -4), (5, 1), (5, 2)], [(5, -12), (3, -11), (2, -9), (2, -6), (3, -4), (5, -1), (6, 2), (6, 4), (5, 6), (3, 8), (1, 9), (-3, 9), (-5, 8), (-7, 6), (-9, 5), (-11, 5), (-12, 6)], [(-4, 8), (-7, 5), (-8, 5)], [(-1, 9), (-3, 8), (-6, 5), (-8, 4), (-11, 4), (-12, 6), (-12, 8), (-11, 9), (-10, 8), (-11, 7)], [(5, -12), (8, -12), (10, -11), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12), (9, -11), (10, -8), (11, -7), (13, -7)], [(11, -7), (9, -7), (8, -6), (8, -4), (9, -2), (12, 0), (13, 2)], [(9, -3), (12, -1)], [(8, -5), (9, -4), (12, -2), (13, 0), (13, 5), (12, 7), (11, 8), (9, 9), (6, 9), (3, 8)], [(7, 8), (6, 8), (4, 7)], [(12, 7), (10, 8), (8, 8), (6, 7), (5, 6)]]),
-    (-12, 12, [[(-7, -10), (-5, -10), (-3, -9), (-2, -8), (-1, -5), (-1, -3)], [(-1, -1), (-1, 3), (-2, 6), (-5, 9), (-7, 8), (-9, 9)], [(-4, 8), (-6, 7), (-7, 7)], [(-3, 7), (-4, 7), (-6, 6), (-9, 9)], [(-5, -11), (-2, -10), (-1, -9), (0, -6), (0, 3), (1, 5), (3, 7), (5, 8)], [(-9, -9), (-4, -12), (-2, -11), (0, -9), (1, -6), (1, -3)], [(1, -1), (1, 2), (2, 5), (3, 6), (5, 7), (7, 7)], [(-1, 3), (0, 6), (2, 8), (4, 9), (9, 6)], [(1, -6), (2, -9), (5, -12), (7, -11), (9, -12)], [(4, -11), (6, -10), (7, -10)], [(3, -10), (4, -10), (6, -9), (9, -12)], [(-7, 1), (-5, -3), (-1, -3)], [(1, -3), (5, -3), (7, -5)], [(-5, -2), (5, -2)], [(-7, 1), (-5, -1), (-1, -1)], [(1, -1), (5, -1), (7, -5)]]),
-    (-13, 13, [[(-10, -1), (-10, 0), (-9, 1), (-7, 1), (-5, 0), (-5, -3), (-6, -5), (-8, -8), (-8, -10), (-6, -12)], [(-6, -3), (-8, -7)], [(-7, 1), (-6, 0), (-6, -2), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -10), (1, -8), (1, -3), (0, 0), (-1, 2), (-1, 3), (1, 5), (2, 5)], [(-1, -10), (0, -8), (0, -2), (-1, 1), (-2, 3), (1, 6)], [(-3, -12), (-2, -11), (-1, -8), (-1, -2), (-2, 2), (-3, 4), (0, 7), (3, 4)], [(1, -8), (9, -12)], [(7, -11), (7, 8), (6, 11)], [(8, -11), (8, 6), (7, 9)], [(9, -12), (9, 4), (8, 8), (7, 10), (5, 12), (2, 13), (-2, 13), (-5, 12), (-7, 10), (-8, 8), (-7, 7), (-6, 8), (-7, 9)]]),
-    (-12, 12, [[(-4, -9), (-3, -11), (-1, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -5), (5, -3), (4, -2), (2, -1)], [(-1, -1), (-3, -2), (-4, -4)], [(4, -10), (5, -9), (5, -4), (4, -3)], [(2, -12), (3, -11), (4, -9), (4, -4), (3, -2), (2, -1)], [(-5, 3), (-4, 1), (-3, 0), (-1, -1), (2, -1), (5, 0), (7, 2), (8, 4), (8, 8), (7, 10), (5, 12), (2, 13), (-2, 13), (-4, 12), (-7, 8), (-8, 7)], [(6, 2), (7, 4), (7, 8), (6, 10)], [(2, -1), (5, 1), (6, 3), (6, 9), (5, 11), (4, 12), (2, 13)], [(-3, 12), (-4, 11), (-6, 8), (-7, 7)], [(0, 13), (-2, 12), (-3, 11), (-5, 8), (-6, 7), (-9, 7), (-10, 8), (-10, 10), (-9, 11), (-8, 11)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-12, 12, [[(-12, 16), (12, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 4), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(1, -4), (4, -2), (4, 6), (6, 8)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-6, -10), (-5, -9), (-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6), (-5, 7)], [(-2, -9), (-3, -7), (-3, 6), (0, 8)], [(2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-7, 6, [[(0, -4), (2, -2), (4, -3), (2, -5), (0, -4), (-3, -2), (-4, 0), (-4, 5), (-3, 7), (-1, 9), (3, 7)], [(1, -4), (3, -3)], [(-2, -2), (-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(-1, -3), (-2, -1), (-2, 4), (-1, 6), (1, 8)]]),
-    (-8, 9, [[(-1, -12), (-4, -9), (-4, -7), (-3, -6), (1, -4), (4, -2), (5, 0), (5, 3), (4, 6), (2, 8)], [(-3, -8), (-3, -7), (1, -5), (4, -3), (5, -2)], [(-3, -10), (-3, -9), (-2, -8), (3, -5), (5, -3), (6, 0), (6, 3), (5, 6), (2, 8), (-1, 9)], [(0, -4), (-4, -2), (-4, 6), (-5, 7)], [(-3, -2), (-3, 6), (0, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9)]]),
-    (-7, 6, [[(-2, 3), (4, -1), (1, -5), (-3, -2), (-4, 0), (-4, 5), (-3, 7), (-1, 9), (3, 7)], [(3, -1), (0, -4)], [(-2, -2), (-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(2, 0), (0, -3), (-1, -3), (-2, -1), (-2, 4), (-1, 6), (1, 8)]]),
-    (-6, 7, [[(6, -12), (5, -11), (3, -11), (1, -12), (-1, -12), (-2, -10), (-2, -5), (-3, -3), (-4, -2)], [(4, -10), (2, -10), (0, -11), (-1, -11)], [(6, -12), (5, -10), (4, -9), (2, -9), (0, -10), (-1, -10), (-2, -9)], [(-2, -7), (-1, -5), (0, -4), (2, -3), (4, -3), (4, -2)], [(-4, -2), (-2, -2)], [(0, -2), (4, -2)], [(-2, -2), (-2, 2), (-1, 14)], [(1, -3), (-2, -3), (-1, -4), (-1, 9)], [(0, -2), (0, 2), (-1, 14)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 9), (4, 11), (3, 13)], [(1, -4), (4, -2), (4, 8)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 10), (4, 12), (3, 13), (1, 14), (-2, 14), (-4, 13), (-5, 12), (-5, 11), (-4, 11), (-4, 12)]]),
-    (-8, 9, [[(-6, -10), (-5, -9), (-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6), (-5, 7)], [(-2, -9), (-3, -7), (-3, 7), (-2, 8)], [(2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2, 9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4, 10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1), (5, 2), (5, 5), (4, 9), (2, 12)]]),
-    (-5, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10), (1, -11)], [(-3, -3), (-2, -3), (-1, -2), (-1, 7), (1, 9), (4, 6)], [(-2, -4), (0, -3), (0, 6), (2, 8)], [(-4, -2), (-1, -5), (0, -4), (2, -3)], [(1, -2), (2, -3)], [(1, -2), (1, 6), (2, 7), (3, 7)]]),
-    (-5, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10), (1, -11)], [(-3, -3), (-2, -3), (-1, -2), (-1, 9), (-2, 12), (-3, 13), (-5, 14)], [(-2, -4), (0, -3), (0, 9), (-1, 11)], [(-4, -2), (-1, -5), (0, -4), (2, -3)], [(1, -2), (2, -3)], [(1, -2), (1, 9), (0, 11), (-2, 13), (-5, 14)], [(1, 9), (2, 11), (3, 12)]]),
-    (-7, 7, [[(-4, -10), (-3, -9), (-2, -7)], [(3, -12), (1, -11), (-1, -9), (-2, -7), (-2, -5), (-3, -3), (-4, -2)], [(-2, -2), (-2, 6), (-3, 7)], [(0, -9), (-1, -7), (-1, -5)], [(-1, -3), (-2, -3), (-1, -5), (-1, 6), (1, 8)], [(3, -12), (1, -10), (0, -7), (0, -3)], [(0, -2), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9), (3, 6)], [(0, -6), (4, -9), (5, -8), (5, -6), (3, -4), (1, -3)], [(3, -8), (4, -7), (4, -6), (3, -4)], [(0, -3), (5, -3), (5, -2)], [(-4, -2), (-2, -2)], [(0, -2), (5, -2)]]),
-    (-5, 5, [[(-3, -10), (-2, -9), (-1, -7)], [(5, -12), (2, -11), (0, -9), (-1, -7), (-1, 6), (-2, 7)], [(1, -9), (0, -7), (0, 7), (2, 8)], [(5, -12), (3, -11), (2, -10), (1, -7), (1, 6), (2, 7), (3, 7)], [(-2, 7), (0, 8), (1, 9), (4, 6)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7), (-8, 9)], [(-10, -4), (-8, -2), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8, 6)], [(-12, -2), (-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-4, -4), (-2, -3), (-1, -1), (-1, 6), (-2, 7), (0, 9)], [(-2, -4), (-1, -3), (0, -1), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(-7, -2), (-4, -4), (-2, -5), (0, -4), (1, -2), (1, 6), (2, 7), (0, 9)], [(4, -4), (5, -3), (7, -2), (7, 7), (9, 9), (12, 6)], [(5, -4), (8, -2), (8, 6), (10, 8)], [(1, -2), (4, -4), (6, -5), (7, -4), (9, -3), (10, -3)], [(9, -2), (10, -3)], [(9, -2), (9, 6), (10, 7), (11, 7)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7), (-4, 9)], [(-6, -4), (-4, -2), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-8, -2), (-5, -5), (-3, -3), (-3, 6), (-2, 7), (-4, 9)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(1, -4), (4, -2), (4, 6), (6, 8)], [(-3, -2), (0, -4), (2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-4, -2), (-4, 6), (-5, 7)], [(-3, -2), (-3, 6), (0, 8)], [(-1, -3), (-2, -2), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-4, -2), (-1, -3), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-8, 9, [[(-3, -8), (-5, -6), (-5, -4), (-4, -1), (-4, 6), (-6, 8)], [(-4, 7), (-3, 14)], [(-4, -5), (-4, -4), (-3, -1), (-3, 9)], [(-4, -7), (-4, -6), (-3, -4), (-2, -1), (-2, 6), (-1, 6), (1, 7), (2, 8)], [(-2, 7), (-3, 14)], [(1, 8), (-1, 7)], [(2, 8), (0, 9), (-2, 7)], [(-4, 7), (-6, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-8, 9, [[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1), (-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 14)], [(1, -4), (4, -2), (4, 9)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (4, 14)]]),
-    (-7, 7, [[(-4, -3), (-3, -3), (-2, -2), (-2, 6), (-3, 7)], [(-3, -4), (-1, -2), (-1, 7), (1, 8)], [(-5, -2), (-2, -5), (0, -3), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9), (3, 6)], [(2, -4), (3, -2), (5, -3), (4, -5), (0, -3)], [(3, -4), (4, -3)]]),
-    (-6, 5, [[(6, -12), (5, -11), (3, -11), (1, -12), (-1, -12), (-2, -10), (-2, -5), (-3, -3), (-4, -2)], [(4, -10), (2, -10), (0, -11), (-1, -11)], [(6, -12), (5, -10), (4, -9), (2, -9), (0, -10), (-1, -10), (-2, -9)], [(-2, -7), (0, -2)], [(-2, -2), (-2, 2), (-1, 14)], [(-1, -3), (-2, -3), (-1, -4), (-1, 9)], [(0, -2), (0, 2), (-1, 14)], [(-4, -2), (-2, -2)]]),
-    (-6, 6, [[(1, -9), (0, -6), (-1, -4), (-2, -3), (-4, -2)], [(1, -9), (1, -3), (4, -3), (4, -2)], [(-4, -2), (-1, -2)], [(1, -2), (4, -2)], [(-1, -2), (-1, 6), (-2, 7)], [(0, -3), (-1, -3), (0, -5), (0, 6), (2, 8)], [(1, -2), (1, 6), (2, 7), (3, 7)], [(-2, 7), (0, 8), (1, 9), (4, 6)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7)], [(-6, -4), (-4, -2), (-4, 6), (-2, 8)], [(-8, -2), (-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-6, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 6)], [(4, -5), (2, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 6), (6, 8)], [(4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)]]),
-    (-8, 9, [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6), (-5, 7)], [(-4, -4), (-4, -3), (-3, 0), (-3, 6), (0, 8)], [(-4, -6), (-4, -5), (-3, -3), (-2, 0), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6), (2, 8)]]),
-    (-12, 13, [[(-7, -7), (-9, -5), (-9, -3), (-8, 0), (-8, 6), (-9, 7), (-7, 9)], [(-8, -4), (-8, -3), (-7, 0), (-7, 6), (-8, 7), (-7, 8), (-6, 7), (-7, 6)], [(-8, -6), (-8, -5), (-7, -3), (-6, 0), (-6, 6), (-5, 7), (-7, 9)], [(-3, -4), (-1, -3), (0, -1), (0, 6), (-1, 7)], [(-1, -4), (0, -3), (1, -1), (1, 6), (4, 8)], [(-6, -2), (-3, -4), (-1, -5), (1, -4), (2, -2), (2, 6), (4, 7), (5, 8)], [(-1, 7), (0, 7), (2, 8), (3, 9), (6, 8)], [(2, -2), (8, -5), (9, -3), (10, 0), (10, 2), (9, 6), (8, 7), (6, 8)], [(7, -4), (8, -3), (9, -1)], [(6, -4), (8, -2), (9, 1), (9, 3), (8, 6), (6, 8)]]),
-    (-7, 8, [[(-3, -3), (-2, -3), (-1, -2), (-1, 6), (-2, 6), (-4, 7), (-5, 9), (-5, 11), (-4, 13), (-2, 14), (1, 14), (4, 13), (4, 12), (3, 12), (3, 13)], [(-2, -4), (0, -2), (0, 6), (3, 8)], [(-4, -2), (-1, -5), (1, -3), (1, 6), (3, 7), (4, 8)], [(6, 7), (2, 9), (1, 8), (-1, 7), (-3, 7), (-5, 9)], [(3, -4), (4, -2), (6, -3), (5, -5), (1, -3)], [(4, -4), (5, -3)]]),
-    (-8, 9, [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6), (-5, 7)], [(-4, -4), (-4, -3), (-3, 0), (-3, 7), (-1, 8)], [(-4, -6), (-4, -5), (-3, -3), (-2, 0), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2, 9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4, 10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1), (5, 2), (5, 5), (4, 9), (2, 12)]]),
-    (-7, 7, [[(-4, -2), (1, -5), (3, -4), (4, -2), (4, 0), (3, 2), (-1, 4)], [(1, -4), (3, -3)], [(0, -4), (2, -3), (3, -1), (3, 0), (2, 2), (1, 3)], [(1, 3), (3, 5), (4, 7), (4, 11), (3, 13), (1, 14), (-1, 14), (-3, 13), (-4, 11), (-4, 9), (-3, 7), (-1, 6), (5, 4)], [(0, 4), (2, 5), (3, 7)], [(-1, 4), (2, 6), (3, 8), (3, 11), (2, 13), (1, 14)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-GOTHICITA = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-4, 5, [[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11), (0, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-13, 13, [[(-4, -10), (-6, -9), (-8, -7), (-9, -5), (-10, -2), (-10, 1), (-9, 3), (-7, 4)], [(-8, -6), (-9, -3), (-9, 1), (-8, 3)], [(-4, -10), (-6, -8), (-7, -6), (-8, -3), (-8, 0), (-7, 4), (-7, 6), (-8, 8), (-10, 9)], [(4, -10), (6, -10), (6, 7), (4, 7)], [(7, -10), (7, 7)], [(8, -11), (8, 8)], [(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10, -12)], [(-8, -2), (6, -2)], [(-10, 9), (-7, 8), (-1, 7), (4, 7), (8, 8), (10, 9)]]),
-    (-13, 13, [[(-6, -11), (-6, 8)], [(-5, -11), (-5, 8)], [(-2, -12), (-4, -11), (-4, 8), (-2, 9)], [(-10, -8), (-8, -10), (-6, -11), (-2, -12), (3, -12), (6, -11), (8, -9), (8, -7), (7, -5)], [(6, -10), (7, -9), (7, -7), (6, -5)], [(3, -12), (5, -11), (6, -9), (6, -7), (5, -6)], [(-1, 3), (-3, 2), (-4, 0), (-4, -2), (-3, -4), (-2, -5), (1, -6), (4, -6), (7, -5), (9, -3), (10, -1), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-6, 8), (-8, 7), (-10, 5)], [(8, -3), (9, -1), (9, 3), (8, 5)], [(4, -6), (7, -4), (8, -1), (8, 3), (7, 6), (5, 8)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6), (7, 4), (8, 1)]]),
-    (-13, 13, [[(-7, -11), (-7, 8)], [(-6, -11), (-6, 8)], [(-4, -12), (-5, -11), (-5, 8), (-4, 9)], [(-10, -7), (-9, -9), (-7, -11), (-4, -12), (1, -12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3), (10, 0), (9, 3), (8, 5), (6, 7), (4, 8), (1, 9), (-4, 9), (-7, 8), (-9, 6), (-10, 4)], [(8, -7), (9, -4), (9, 1), (8, 4)], [(4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -5), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6), (7, 4), (8, 1)], [(-8, -2), (-7, -3), (-4, -3), (3, -1), (6, -1), (8, -2)], [(-2, -2), (0, -1), (3, 0), (5, 0), (7, -1)], [(-5, -3), (0, 0), (3, 1), (5, 1), (7, 0), (8, -2)], [(8, -5), (7, -6), (6, -6), (5, -5), (6, -4), (7, -5)]]),
-    (-13, 13, [[(-8, -10), (-8, 8)], [(-5, -11), (-7, -10), (-7, 7)], [(-3, -12), (-5, -11), (-6, -9), (-6, 7), (-4, 7)], [(-10, -8), (-8, -10), (-6, -11), (-3, -12), (1, -12), (4, -11), (6, -10), (7, -9), (10, -12)], [(10, -12), (9, -10), (8, -6), (8, -3), (9, 1), (10, 3)], [(8, -9), (7, -7)], [(4, -11), (6, -9), (7, -6), (8, -3)], [(-6, -2), (-5, -3), (-3, -3), (2, -2), (5, -2), (7, -3)], [(-1, -2), (2, -1), (4, -1), (6, -2)], [(-4, -3), (2, 0), (4, 0), (6, -1), (7, -3), (7, -6), (6, -7), (5, -7), (4, -6), (5, -5), (6, -6)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 7), (7, 6), (8, 4), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(6, 6), (7, 4), (7, 0)], [(4, 8), (5, 7), (6, 4), (6, -1)], [(-7, 1), (-6, 0), (-5, 1), (-6, 2), (-7, 2), (-8, 1)], [(-8, -2), (-7, -4), (-5, -5), (-3, -5), (0, -4), (3, -2), (5, -1)], [(-7, -3), (-5, -4), (-3, -4), (0, -3), (2, -2)], [(-8, -2), (-6, -3), (-3, -3), (3, -1), (7, -1), (8, -2)]]),
-    (-13, 13, [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10), (-7, 8)], [(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6), (0, -7), (4, -7), (7, -6), (9, -4), (10, -1), (10, 2), (9, 3), (7, 4)], [(8, -4), (9, -2), (9, 1), (8, 3)], [(4, -7), (6, -6), (7, -5), (8, -3), (8, 1), (7, 4), (7, 6), (8, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-7, 8), (-3, 7), (3, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(2, -9), (4, -9), (4, 6), (3, 8), (1, 9)], [(5, -9), (5, 6), (4, 7)], [(6, -10), (6, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-9, -3), (-10, -1), (-10, 3), (-9, 6), (-7, 8), (-4, 9), (1, 9), (4, 8), (6, 7), (8, 5), (10, 2)], [(-9, 3), (-8, 6), (-7, 7)], [(-10, 1), (-8, 3), (-7, 6), (-6, 8), (-4, 9)]]),
-    (-13, 13, [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10), (-7, 8)], [(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6), (0, -7), (3, -7), (6, -6), (7, -5), (7, -3), (6, -2), (1, 0), (-1, 1), (-2, 2), (-2, 3), (-1, 4), (0, 3), (-1, 2)], [(5, -6), (6, -5), (6, -3), (5, -2)], [(3, -7), (5, -5), (5, -3), (4, -2), (1, 0)], [(1, 0), (4, 0), (7, 1), (8, 3), (8, 5), (7, 6)], [(5, 1), (7, 3), (7, 5)], [(1, 0), (4, 1), (6, 3), (7, 6), (8, 8), (9, 9), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-8, -11), (-8, 8)], [(-7, -10), (-7, 7)], [(-4, -10), (-6, -10), (-6, 7), (-4, 7)], [(10, -7), (8, -4), (7, -2), (6, 1), (6, 3), (7, 5), (9, 6)], [(8, -3), (7, 0), (7, 3), (8, 5)], [(10, -7), (9, -5), (8, -1), (8, 2), (9, 6), (10, 9)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)], [(-4, 7), (-6, 5), (-8, 4), (-9, 3), (-10, 0), (-10, -5), (-9, -8), (-7, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (7, -10), (9, -8), (10, -5), (10, 0), (9, 3), (8, 4), (6, 5), (4, 7)], [(-8, 3), (-9, 0), (-9, -5), (-8, -8)], [(-6, 5), (-7, 3), (-8, 0), (-8, -6), (-7, -9), (-5, -11)], [(8, -8), (9, -5), (9, 0), (8, 3)], [(5, -11), (7, -9), (8, -6), (8, 0), (7, 3), (6, 5)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-7, 8), (-3, 7), (3, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-8, -10), (-8, 8), (-10, 9)], [(-6, -10), (-7, -9), (-7, 8)], [(-3, -12), (-5, -11), (-6, -9), (-6, 8)], [(-10, -8), (-8, -10), (-6, -11), (-3, -12), (1, -12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3), (10, 1), (9, 3), (7, 4)], [(8, -7), (9, -4), (9, 0), (8, 3)], [(4, -11), (6, -9), (7, -7), (8, -4), (8, 0), (7, 4), (7, 6), (8, 8), (9, 9), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4), (8, -7)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11)]]),
-    (-13, 13, [[(-8, -9), (-8, 8)], [(-5, -10), (-7, -8), (-7, 7)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-6, 7), (-4, 7)], [(-10, -7), (-8, -9), (-4, -11), (-1, -12), (2, -12), (5, -11), (7, -10), (9, -8), (10, -5), (10, -3), (9, 0), (7, 2), (4, 3), (0, 3), (-3, 2), (-5, 0), (-6, -3)], [(8, -8), (9, -6), (9, -2), (8, 0)], [(5, -11), (7, -9), (8, -6), (8, -2), (7, 1), (4, 3)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4), (8, -7)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11)], [(-8, 1), (-7, 3), (-4, 4), (2, 5), (9, 5), (10, 6), (10, 8), (9, 9), (9, 8), (10, 7)], [(-2, 5), (0, 5)], [(-7, 3), (-4, 5), (-1, 6), (1, 6), (2, 5)]]),
-    (-13, 13, [[(-8, -9), (-8, 8), (-10, 9)], [(-7, -9), (-7, 8)], [(-6, -10), (-6, 8)], [(-10, -7), (-8, -9), (-6, -10), (-4, -11), (-1, -12), (3, -12), (7, -11), (9, -9), (10, -7), (10, -4), (9, -2), (8, -1)], [(7, -10), (8, -9), (9, -7), (9, -4), (8, -2)], [(3, -12), (5, -11), (7, -9), (8, -7), (8, -3), (7, -1)], [(6, 0), (3, 1), (0, 1), (-2, 0), (-2, -2), (0, -3), (3, -3), (6, -2), (8, 0), (10, 3), (10, 5), (9, 6), (8, 6)], [(6, -1), (7, 0), (9, 4), (9, 5), (8, 2)], [(2, -3), (4, -2), (6, 0), (7, 2), (8, 6), (9, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(2, -12), (8, -11), (10, -12), (9, -10), (9, -8), (7, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-8, -8), (-9, -5), (-9, -3), (-8, 0), (-6, 2), (-3, 3), (0, 3), (2, 2), (3, 1), (4, -1), (4, -2)], [(9, -11), (8, -10), (9, -8)], [(-8, -2), (-7, 0), (-6, 1), (-3, 2), (0, 2), (2, 1)], [(-7, -9), (-8, -7), (-8, -4), (-7, -2), (-5, 0), (-2, 1), (0, 1), (2, 0), (4, -2), (5, -3), (6, -3)], [(-6, -1), (-5, -1), (-4, -2), (-2, -4), (0, -5), (3, -5), (5, -4), (7, -2), (8, 0), (8, 3), (7, 6), (5, 8)], [(-2, -5), (0, -6), (3, -6), (6, -5), (8, -3), (9, 0), (9, 3), (8, 5)], [(-9, 5), (-8, 7), (-9, 8)], [(-4, -2), (-4, -3), (-3, -5), (-2, -6), (0, -7), (3, -7), (6, -6), (9, -3), (10, 0), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 7), (-9, 5), (-9, 7), (-10, 9), (-8, 8), (-2, 9)]]),
-    (-13, 13, [[(-1, -10), (-5, -10), (-7, -9), (-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-8, 6), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (7, -9), (5, -10)], [(3, -10), (2, -9), (2, -7), (3, -6), (4, -7), (3, -8)], [(-9, 1), (-8, 4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-8, -8), (-9, -4), (-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 2), (10, 0)], [(-10, -12), (-7, -9)], [(-7, -10), (-6, -11)], [(-9, -11), (-8, -11), (-7, -12), (-5, -11), (-1, -10), (5, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7)], [(-7, -8), (-8, -6), (-9, -3), (-9, 1), (-8, 4)], [(-7, -9), (-6, -8), (-6, -7), (-7, -5), (-8, -2), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(4, -10), (6, -10), (6, 6), (5, 8), (3, 9)], [(7, -10), (7, 6), (6, 7)], [(8, -11), (8, 7), (10, 9)], [(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-10, -12), (0, 9)], [(-9, -11), (-8, -10), (-1, 5), (0, 7)], [(-8, -11), (-7, -10), (0, 5), (1, 6)], [(10, -12), (0, 9)], [(5, -4), (3, 1)], [(7, -6), (3, -1), (2, 2), (2, 4)], [(-10, -12), (-8, -11), (-3, -10), (3, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10)], [(-8, -6), (-9, -3), (-9, 0), (-8, 3), (-7, 5)], [(-8, -8), (-7, -7), (-7, -6), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 3), (9, 0), (9, -3), (8, -6)], [(4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -6), (7, -7), (8, -8)], [(-1, -9), (-1, 9)], [(0, -8), (0, 8)], [(1, -9), (1, 9)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)]]),
-    (-13, 13, [[(-10, -12), (6, 7), (7, 8)], [(-9, -11), (-7, -10), (8, 8)], [(-6, -10), (10, 9)], [(10, -12), (1, -2)], [(-1, 0), (-8, 8)], [(-2, 1), (-5, 3), (-6, 5)], [(-1, 0), (-5, 2), (-6, 3), (-7, 5), (-7, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(6, -10), (6, 8)], [(7, -10), (7, 7)], [(8, -11), (8, 7)], [(-7, -10), (-9, -8), (-10, -5), (-10, -2), (-9, 1), (-7, 3), (-5, 4), (-2, 5), (1, 5), (4, 4), (6, 3)], [(-6, 3), (-3, 4), (3, 4)], [(-10, -2), (-9, 0), (-7, 2), (-4, 3), (2, 3), (4, 4)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 5), (-8, 7), (-6, 8), (-2, 9), (2, 9), (6, 8), (10, 6)]]),
-    (-13, 13, [[(-10, -12), (-9, -11), (-7, -10), (-4, -10), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5)], [(6, -11), (7, -9), (7, -7), (6, -5)], [(4, -12), (5, -11), (6, -9), (6, -6)], [(6, -4), (2, -3), (0, -3), (-2, -4), (-2, -6), (0, -7), (2, -7), (6, -6)], [(2, -7), (4, -6), (5, -5), (4, -4), (2, -3)], [(7, -5), (9, -3), (10, 0), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 7), (-9, 5), (-10, 2), (-10, 0), (-9, -3), (-8, -4), (-6, -5), (-4, -5), (-2, -4), (-2, -2), (-3, -1), (-4, -2), (-3, -3)], [(6, -5), (8, -3), (9, -1), (9, 3), (8, 5)], [(6, -4), (7, -3), (8, -1), (8, 3), (7, 6), (5, 8)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-13, 13, [[(-13, 16), (13, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-8, 9, [[(-2, -1), (-5, 2), (-5, 6), (-2, 9), (2, 7)], [(-4, 2), (-4, 6), (-2, 8)], [(-3, 0), (-3, 5), (0, 8)], [(0, 1), (-5, -4), (-4, -5), (-3, -4), (-4, -3)], [(-3, -4), (1, -4), (3, -5), (5, -3), (5, 6), (6, 7)], [(3, -4), (4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(1, -4), (3, -2), (3, 6), (2, 7), (4, 9), (6, 7)]]),
-    (-9, 8, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-2, 9), (3, 7), (5, 6)], [(-4, -10), (-4, 6), (-2, 8)], [(-4, -10), (-2, -12), (-3, -8), (-3, 5), (0, 8)], [(-3, -3), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-7, 5, [[(-4, -2), (-4, 7), (-2, 9), (0, 7)], [(-3, -2), (-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7), (0, 7)], [(-4, -2), (2, -5), (4, -3), (2, -2), (0, -4)], [(1, -4), (3, -3)]]),
-    (-8, 8, [[(0, -5), (-5, -2), (-5, 6), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-2, -9), (-2, -12), (-1, -9), (5, -2), (5, 7)], [(-2, -9), (4, -2), (4, 6)], [(-2, -9), (-5, -9), (-2, -8), (3, -2), (3, 7)]]),
-    (-7, 6, [[(-4, -2), (-4, 7), (-2, 9), (0, 7)], [(-3, -2), (-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7), (0, 7)], [(-4, -2), (2, -5), (5, -1), (-2, 3)], [(1, -4), (4, -1)], [(0, -4), (3, 0)]]),
-    (-7, 5, [[(-3, -9), (-3, 6), (-4, 7), (-2, 9)], [(-2, -9), (-2, 6), (-3, 7), (-2, 8), (-1, 7), (-2, 6)], [(-1, -10), (-1, 6), (0, 7), (-2, 9)], [(-3, -9), (3, -12), (5, -10), (3, -9), (1, -11)], [(2, -11), (4, -10)], [(-6, -5), (-3, -5)], [(-1, -5), (3, -5)]]),
-    (-8, 9, [[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(2, -4), (4, -2), (4, 11), (3, 13)], [(-2, 15), (-4, 15)], [(0, -4), (3, -1), (3, 12), (2, 14), (1, 15)]]),
-    (-9, 9, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-6, 7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)], [(-3, -3), (0, -4), (2, -5), (5, -2), (5, 7), (2, 11), (2, 14), (3, 16), (4, 16), (2, 14)], [(2, -4), (4, -2), (4, 7), (3, 9)], [(0, -4), (3, -1), (3, 8), (2, 11)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11), (-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2), (-1, 6), (-2, 7), (0, 9)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -5), (2, -3), (1, -2), (1, 6), (2, 7), (0, 9)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11), (-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2), (-1, 7), (2, 11)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 9)], [(0, -5), (2, -3), (1, -2), (1, 8), (2, 11), (2, 14), (0, 16), (-2, 15), (-2, 16), (0, 16)]]),
-    (-9, 8, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-6, 7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)], [(-3, -2), (0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1, -4), (3, -2)], [(0, -4), (2, -1)], [(0, 1), (1, 2), (2, 7), (4, 9), (6, 7)], [(1, 1), (2, 3), (3, 7), (4, 8)], [(1, 0), (2, 1), (4, 6), (5, 7), (6, 7)]]),
-    (-5, 5, [[(0, -10), (-2, -12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8), (1, 6), (2, 7), (0, 9)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7), (-8, 9)], [(-9, -4), (-8, -3), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8, 6)], [(-11, -3), (-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-7, -3), (-4, -4), (-2, -5), (1, -3), (1, 6), (2, 7), (0, 9)], [(-2, -4), (0, -3), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(-4, -4), (-1, -2), (-1, 6), (-2, 7), (0, 9)], [(1, -3), (4, -4), (6, -5), (9, -3), (9, 6), (10, 7), (8, 9)], [(6, -4), (8, -3), (8, 6), (7, 7), (8, 8), (9, 7), (8, 6)], [(4, -4), (7, -2), (7, 6), (6, 7), (8, 9)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7), (-4, 9)], [(-5, -4), (-4, -3), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-2, 7), (-4, 9)], [(-3, -3), (0, -4), (2, -5), (5, -3), (5, 6), (6, 7), (4, 9)], [(2, -4), (4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(0, -4), (3, -2), (3, 6), (2, 7), (4, 9)]]),
-    (-8, 8, [[(-5, -2), (-5, 6), (-2, 9), (3, 7), (5, 6)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-9, 8, [[(-6, -5), (-5, -3), (-5, 6), (-7, 7), (-5, 7), (-5, 13), (-6, 16), (-4, 14)], [(-4, -3), (-4, 14)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-4, 7), (-3, 7), (-1, 8)], [(-3, 8), (-2, 9), (3, 7), (5, 6)], [(-3, 8), (-3, 13), (-2, 16), (-4, 14)], [(-3, -3), (0, -4), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-8, 9, [[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 13), (6, 16), (4, 14)], [(2, -4), (4, -2), (4, 14)], [(0, -4), (3, -1), (3, 13), (2, 16), (4, 14)]]),
-    (-7, 6, [[(-5, -3), (-4, -3), (-3, -2), (-3, 6), (-4, 7), (-2, 9)], [(-3, -4), (-2, -3), (-2, 6), (-3, 7), (-2, 8), (-1, 7), (-2, 6)], [(-5, -3), (-3, -5), (-1, -3), (-1, 6), (0, 7), (-2, 9)], [(-1, -3), (3, -5), (5, -3), (3, -2), (1, -4)], [(2, -4), (4, -3)]]),
-    (-8, 8, [[(-5, -2), (-5, 1), (-3, 3), (3, 0), (5, 2), (5, 6)], [(-4, -2), (-4, 1), (-3, 2)], [(-3, -3), (-3, 1), (-2, 2)], [(3, 1), (4, 2), (4, 6)], [(2, 1), (3, 2), (3, 7)], [(-5, -2), (1, -5), (4, -4), (2, -3), (-1, -4)], [(0, -4), (3, -4)], [(5, 6), (-1, 9), (-5, 7), (-3, 6), (1, 8)], [(-3, 7), (-1, 8)]]),
-    (-5, 5, [[(0, -10), (-2, -12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8), (1, 6), (2, 7), (0, 9)], [(-4, -5), (-1, -5)], [(1, -5), (4, -5)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (0, 8)], [(4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 7), (5, 8)], [(4, -5), (2, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-1, 9), (1, 7), (5, 5)], [(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 5), (0, 7), (1, 7)], [(4, -5), (6, -3), (5, -2), (5, 5)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 5)], [(4, -5), (2, -3), (3, -2), (3, 6)]]),
-    (-13, 13, [[(-10, -5), (-9, -3), (-9, 6), (-5, 9), (-3, 7), (-1, 6)], [(-9, -4), (-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5), (-4, 7), (-3, 7)], [(0, -5), (-2, -3), (-1, -2), (-1, 6), (3, 9), (5, 7), (9, 5)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 6), (3, 8)], [(0, -5), (2, -3), (1, -2), (1, 5), (4, 7), (5, 7)], [(8, -5), (10, -3), (9, -2), (9, 5)], [(8, -2), (9, -3), (8, -4), (7, -3), (8, -2), (8, 5)], [(8, -5), (6, -3), (7, -2), (7, 6)]]),
-    (-9, 9, [[(-6, -3), (-4, -2), (3, 8), (4, 9), (6, 7)], [(-5, -4), (-3, -3), (3, 7), (5, 8)], [(-6, -3), (-4, -5), (-3, -4), (4, 6), (6, 7)], [(6, -5), (4, -5), (4, -3), (6, -3), (6, -5), (4, -3), (1, 1)], [(-1, 3), (-4, 7), (-6, 9), (-4, 9), (-4, 7), (-6, 7), (-6, 9)], [(-4, 2), (-1, 2)], [(1, 2), (4, 2)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (0, 8)], [(4, -5), (6, -3), (5, -2), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 12), (3, 13)], [(-2, 15), (-4, 15)], [(4, -5), (2, -3), (3, -2), (3, 12), (2, 14), (1, 15)]]),
-    (-6, 9, [[(0, -4), (-3, -2), (-3, -3), (0, -4), (2, -5), (5, -3), (5, 1), (0, 3)], [(2, -4), (4, -3), (4, 1)], [(0, -4), (3, -2), (3, 1), (2, 2)], [(0, 3), (5, 5), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(4, 5), (4, 12), (3, 13)], [(-2, 15), (-4, 15)], [(2, 4), (3, 5), (3, 12), (2, 14), (1, 15)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-GOTHITT = [
-    (-8, 8, [[]]),
-    (-6, 6, [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9), (1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11), (3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2), (9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4), (1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7), (-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1), (2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4, -11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]),
-    (-6, 6, [[(0, -6), (0, -8), (-2, -10), (0, -12), (1, -10), (1, -8), (0, -6), (-2, -5)], [(0, -11), (-1, -10), (0, -9), (0, -11)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 13, [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-6, 6, [[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)], [(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10), (0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8), (1, 9), (2, 8), (4, 7)]]),
-    (-10, 10, [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4, -10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10), (6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3, 7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9), (-2, 8), (3, 8), (6, 9), (8, 7)]]),
-    (-10, 10, [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0, -11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9), (-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10), (6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0), (6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3), (8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)], [(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)], [(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7), (3, 8), (4, 9), (5, 8), (7, 7)]]),
-    (-10, 10, [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)], [(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4, -6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3), (4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4), (6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6), (-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11), (5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9), (6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3), (2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5, -4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-7, -10), (-5, -12), (-2, -11), (3, -11), (8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3, -9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1, -3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5), (0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]),
-    (-10, 10, [[(-6, -9), (-6, -3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9), (1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)], [(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10), (6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3), (4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1), (-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4, 7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8), (-3, 9), (-1, 8), (4, 7), (6, 7)]]),
-    (-10, 10, [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9), (-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1, 0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-6, 6, [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8), (0, 9), (0, 7)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)], [(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8), (-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-13, 13, [[(-4, -10), (-6, -9), (-8, -7), (-9, -5), (-10, -2), (-10, 1), (-9, 3), (-7, 4)], [(-8, -6), (-9, -3), (-9, 1), (-8, 3)], [(-4, -10), (-6, -8), (-7, -6), (-8, -3), (-8, 0), (-7, 4), (-7, 6), (-8, 8), (-10, 9)], [(4, -10), (6, -10), (6, 7), (4, 7)], [(7, -10), (7, 7)], [(8, -11), (8, 8)], [(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10, -12)], [(-8, -2), (6, -2)], [(-10, 9), (-7, 8), (-1, 7), (4, 7), (8, 8), (10, 9)]]),
-    (-13, 13, [[(-6, -11), (-6, 8)], [(-5, -11), (-5, 8)], [(-2, -12), (-4, -11), (-4, 8), (-2, 9)], [(-10, -8), (-8, -10), (-6, -11), (-2, -12), (3, -12), (6, -11), (8, -9), (8, -7), (7, -5)], [(6, -10), (7, -9), (7, -7), (6, -5)], [(3, -12), (5, -11), (6, -9), (6, -7), (5, -6)], [(-1, 3), (-3, 2), (-4, 0), (-4, -2), (-3, -4), (-2, -5), (1, -6), (4, -6), (7, -5), (9, -3), (10, -1), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-6, 8), (-8, 7), (-10, 5)], [(8, -3), (9, -1), (9, 3), (8, 5)], [(4, -6), (7, -4), (8, -1), (8, 3), (7, 6), (5, 8)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6), (7, 4), (8, 1)]]),
-    (-13, 13, [[(-7, -11), (-7, 8)], [(-6, -11), (-6, 8)], [(-4, -12), (-5, -11), (-5, 8), (-4, 9)], [(-10, -7), (-9, -9), (-7, -11), (-4, -12), (1, -12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3), (10, 0), (9, 3), (8, 5), (6, 7), (4, 8), (1, 9), (-4, 9), (-7, 8), (-9, 6), (-10, 4)], [(8, -7), (9, -4), (9, 1), (8, 4)], [(4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -5), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6), (7, 4), (8, 1)], [(-8, -2), (-7, -3), (-4, -3), (3, -1), (6, -1), (8, -2)], [(-2, -2), (0, -1), (3, 0), (5, 0), (7, -1)], [(-5, -3), (0, 0), (3, 1), (5, 1), (7, 0), (8, -2)], [(8, -5), (7, -6), (6, -6), (5, -5), (6, -4), (7, -5)]]),
-    (-13, 13, [[(-8, -10), (-8, 8)], [(-5, -11), (-7, -10), (-7, 7)], [(-3, -12), (-5, -11), (-6, -9), (-6, 7), (-4, 7)], [(-10, -8), (-8, -10), (-6, -11), (-3, -12), (1, -12), (4, -11), (6, -10), (7, -9), (10, -12)], [(10, -12), (9, -10), (8, -6), (8, -3), (9, 1), (10, 3)], [(8, -9), (7, -7)], [(4, -11), (6, -9), (7, -6), (8, -3)], [(-6, -2), (-5, -3), (-3, -3), (2, -2), (5, -2), (7, -3)], [(-1, -2), (2, -1), (4, -1), (6, -2)], [(-4, -3), (2, 0), (4, 0), (6, -1), (7, -3), (7, -6), (6, -7), (5, -7), (4, -6), (5, -5), (6, -6)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 7), (7, 6), (8, 4), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7), (7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(6, 6), (7, 4), (7, 0)], [(4, 8), (5, 7), (6, 4), (6, -1)], [(-7, 1), (-6, 0), (-5, 1), (-6, 2), (-7, 2), (-8, 1)], [(-8, -2), (-7, -4), (-5, -5), (-3, -5), (0, -4), (3, -2), (5, -1)], [(-7, -3), (-5, -4), (-3, -4), (0, -3), (2, -2)], [(-8, -2), (-6, -3), (-3, -3), (3, -1), (7, -1), (8, -2)]]),
-    (-13, 13, [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10), (-7, 8)], [(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6), (0, -7), (4, -7), (7, -6), (9, -4), (10, -1), (10, 2), (9, 3), (7, 4)], [(8, -4), (9, -2), (9, 1), (8, 3)], [(4, -7), (6, -6), (7, -5), (8, -3), (8, 1), (7, 4), (7, 6), (8, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-7, 8), (-3, 7), (3, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(2, -9), (4, -9), (4, 6), (3, 8), (1, 9)], [(5, -9), (5, 6), (4, 7)], [(6, -10), (6, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-9, -3), (-10, -1), (-10, 3), (-9, 6), (-7, 8), (-4, 9), (1, 9), (4, 8), (6, 7), (8, 5), (10, 2)], [(-9, 3), (-8, 6), (-7, 7)], [(-10, 1), (-8, 3), (-7, 6), (-6, 8), (-4, 9)]]),
-    (-13, 13, [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10), (-7, 8)], [(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6), (0, -7), (3, -7), (6, -6), (7, -5), (7, -3), (6, -2), (1, 0), (-1, 1), (-2, 2), (-2, 3), (-1, 4), (0, 3), (-1, 2)], [(5, -6), (6, -5), (6, -3), (5, -2)], [(3, -7), (5, -5), (5, -3), (4, -2), (1, 0)], [(1, 0), (4, 0), (7, 1), (8, 3), (8, 5), (7, 6)], [(5, 1), (7, 3), (7, 5)], [(1, 0), (4, 1), (6, 3), (7, 6), (8, 8), (9, 9), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-8, -11), (-8, 8)], [(-7, -10), (-7, 7)], [(-4, -10), (-6, -10), (-6, 7), (-4, 7)], [(10, -7), (8, -4), (7, -2), (6, 1), (6, 3), (7, 5), (9, 6)], [(8, -3), (7, 0), (7, 3), (8, 5)], [(10, -7), (9, -5), (8, -1), (8, 2), (9, 6), (10, 9)], [(-10, -12), (-8, -11), (-4, -10), (1, -10), (7, -11), (10, -12)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)], [(-4, 7), (-6, 5), (-8, 4), (-9, 3), (-10, 0), (-10, -5), (-9, -8), (-7, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (7, -10), (9, -8), (10, -5), (10, 0), (9, 3), (8, 4), (6, 5), (4, 7)], [(-8, 3), (-9, 0), (-9, -5), (-8, -8)], [(-6, 5), (-7, 3), (-8, 0), (-8, -6), (-7, -9), (-5, -11)], [(8, -8), (9, -5), (9, 0), (8, 3)], [(5, -11), (7, -9), (8, -6), (8, 0), (7, 3), (6, 5)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-7, 8), (-3, 7), (3, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-8, -10), (-8, 8), (-10, 9)], [(-6, -10), (-7, -9), (-7, 8)], [(-3, -12), (-5, -11), (-6, -9), (-6, 8)], [(-10, -8), (-8, -10), (-6, -11), (-3, -12), (1, -12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3), (10, 1), (9, 3), (7, 4)], [(8, -7), (9, -4), (9, 0), (8, 3)], [(4, -11), (6, -9), (7, -7), (8, -4), (8, 0), (7, 4), (7, 6), (8, 8), (9, 9), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4), (8, -7)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11)]]),
-    (-13, 13, [[(-8, -9), (-8, 8)], [(-5, -10), (-7, -8), (-7, 7)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-6, 7), (-4, 7)], [(-10, -7), (-8, -9), (-4, -11), (-1, -12), (2, -12), (5, -11), (7, -10), (9, -8), (10, -5), (10, -3), (9, 0), (7, 2), (4, 3), (0, 3), (-3, 2), (-5, 0), (-6, -3)], [(8, -8), (9, -6), (9, -2), (8, 0)], [(5, -11), (7, -9), (8, -6), (8, -2), (7, 1), (4, 3)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4), (8, -7)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11)], [(-8, 1), (-7, 3), (-4, 4), (2, 5), (9, 5), (10, 6), (10, 8), (9, 9), (9, 8), (10, 7)], [(-2, 5), (0, 5)], [(-7, 3), (-4, 5), (-1, 6), (1, 6), (2, 5)]]),
-    (-13, 13, [[(-8, -9), (-8, 8), (-10, 9)], [(-7, -9), (-7, 8)], [(-6, -10), (-6, 8)], [(-10, -7), (-8, -9), (-6, -10), (-4, -11), (-1, -12), (3, -12), (7, -11), (9, -9), (10, -7), (10, -4), (9, -2), (8, -1)], [(7, -10), (8, -9), (9, -7), (9, -4), (8, -2)], [(3, -12), (5, -11), (7, -9), (8, -7), (8, -3), (7, -1)], [(6, 0), (3, 1), (0, 1), (-2, 0), (-2, -2), (0, -3), (3, -3), (6, -2), (8, 0), (10, 3), (10, 5), (9, 6), (8, 6)], [(6, -1), (7, 0), (9, 4), (9, 5), (8, 2)], [(2, -3), (4, -2), (6, 0), (7, 2), (8, 6), (9, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]),
-    (-13, 13, [[(2, -12), (8, -11), (10, -12), (9, -10), (9, -8), (7, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-8, -8), (-9, -5), (-9, -3), (-8, 0), (-6, 2), (-3, 3), (0, 3), (2, 2), (3, 1), (4, -1), (4, -2)], [(9, -11), (8, -10), (9, -8)], [(-8, -2), (-7, 0), (-6, 1), (-3, 2), (0, 2), (2, 1)], [(-7, -9), (-8, -7), (-8, -4), (-7, -2), (-5, 0), (-2, 1), (0, 1), (2, 0), (4, -2), (5, -3), (6, -3)], [(-6, -1), (-5, -1), (-4, -2), (-2, -4), (0, -5), (3, -5), (5, -4), (7, -2), (8, 0), (8, 3), (7, 6), (5, 8)], [(-2, -5), (0, -6), (3, -6), (6, -5), (8, -3), (9, 0), (9, 3), (8, 5)], [(-9, 5), (-8, 7), (-9, 8)], [(-4, -2), (-4, -3), (-3, -5), (-2, -6), (0, -7), (3, -7), (6, -6), (9, -3), (10, 0), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 7), (-9, 5), (-9, 7), (-10, 9), (-8, 8), (-2, 9)]]),
-    (-13, 13, [[(-1, -10), (-5, -10), (-7, -9), (-8, -8), (-9, -6), (-10, -3), (-10, 1), (-9, 4), (-8, 6), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (7, -9), (5, -10)], [(3, -10), (2, -9), (2, -7), (3, -6), (4, -7), (3, -8)], [(-9, 1), (-8, 4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-8, -8), (-9, -4), (-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 2), (10, 0)], [(-10, -12), (-7, -9)], [(-7, -10), (-6, -11)], [(-9, -11), (-8, -11), (-7, -12), (-5, -11), (-1, -10), (5, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7)], [(-7, -8), (-8, -6), (-9, -3), (-9, 1), (-8, 4)], [(-7, -9), (-6, -8), (-6, -7), (-7, -5), (-8, -2), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(4, -10), (6, -10), (6, 6), (5, 8), (3, 9)], [(7, -10), (7, 6), (6, 7)], [(8, -11), (8, 7), (10, 9)], [(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-10, -12), (0, 9)], [(-9, -11), (-8, -10), (-1, 5), (0, 7)], [(-8, -11), (-7, -10), (0, 5), (1, 6)], [(10, -12), (0, 9)], [(5, -4), (3, 1)], [(7, -6), (3, -1), (2, 2), (2, 4)], [(-10, -12), (-8, -11), (-3, -10), (3, -10), (8, -11), (10, -12)]]),
-    (-13, 13, [[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10)], [(-8, -6), (-9, -3), (-9, 0), (-8, 3), (-7, 5)], [(-8, -8), (-7, -7), (-7, -6), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 3), (9, 0), (9, -3), (8, -6)], [(4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -6), (7, -7), (8, -8)], [(-1, -9), (-1, 9)], [(0, -8), (0, 8)], [(1, -9), (1, 9)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)]]),
-    (-13, 13, [[(-10, -12), (6, 7), (7, 8)], [(-9, -11), (-7, -10), (8, 8)], [(-6, -10), (10, 9)], [(10, -12), (1, -2)], [(-1, 0), (-8, 8)], [(-2, 1), (-5, 3), (-6, 5)], [(-1, 0), (-5, 2), (-6, 3), (-7, 5), (-7, 7)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]),
-    (-13, 13, [[(6, -10), (6, 8)], [(7, -10), (7, 7)], [(8, -11), (8, 7)], [(-7, -10), (-9, -8), (-10, -5), (-10, -2), (-9, 1), (-7, 3), (-5, 4), (-2, 5), (1, 5), (4, 4), (6, 3)], [(-6, 3), (-3, 4), (3, 4)], [(-10, -2), (-9, 0), (-7, 2), (-4, 3), (2, 3), (4, 4)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 5), (-8, 7), (-6, 8), (-2, 9), (2, 9), (6, 8), (10, 6)]]),
-    (-13, 13, [[(-10, -12), (-9, -11), (-7, -10), (-4, -10), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5)], [(6, -11), (7, -9), (7, -7), (6, -5)], [(4, -12), (5, -11), (6, -9), (6, -6)], [(6, -4), (2, -3), (0, -3), (-2, -4), (-2, -6), (0, -7), (2, -7), (6, -6)], [(2, -7), (4, -6), (5, -5), (4, -4), (2, -3)], [(7, -5), (9, -3), (10, 0), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 7), (-9, 5), (-10, 2), (-10, 0), (-9, -3), (-8, -4), (-6, -5), (-4, -5), (-2, -4), (-2, -2), (-3, -1), (-4, -2), (-3, -3)], [(6, -5), (8, -3), (9, -1), (9, 3), (8, 5)], [(6, -4), (7, -3), (8, -1), (8, 3), (7, 6), (5, 8)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-6, 6, [[(2, -12), (0, -11), (-1, -9), (-1, -7), (0, -5), (2, -7), (0, -9), (0, -11)], [(0, -8), (0, -6), (1, -7), (0, -8)]]),
-    (-8, 9, [[(-2, -1), (-5, 2), (-5, 6), (-2, 9), (2, 7)], [(-4, 2), (-4, 6), (-2, 8)], [(-3, 0), (-3, 5), (0, 8)], [(0, 1), (-5, -4), (-4, -5), (-3, -4), (-4, -3)], [(-3, -4), (1, -4), (3, -5), (5, -3), (5, 6), (6, 7)], [(3, -4), (4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(1, -4), (3, -2), (3, 6), (2, 7), (4, 9), (6, 7)]]),
-    (-9, 8, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-2, 9), (3, 7), (5, 6)], [(-4, -10), (-4, 6), (-2, 8)], [(-4, -10), (-2, -12), (-3, -8), (-3, 5), (0, 8)], [(-3, -3), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-7, 5, [[(-4, -2), (-4, 7), (-2, 9), (0, 7)], [(-3, -2), (-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7), (0, 7)], [(-4, -2), (2, -5), (4, -3), (2, -2), (0, -4)], [(1, -4), (3, -3)]]),
-    (-8, 8, [[(0, -5), (-5, -2), (-5, 6), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-2, -9), (-2, -12), (-1, -9), (5, -2), (5, 7)], [(-2, -9), (4, -2), (4, 6)], [(-2, -9), (-5, -9), (-2, -8), (3, -2), (3, 7)]]),
-    (-7, 6, [[(-4, -2), (-4, 7), (-2, 9), (0, 7)], [(-3, -2), (-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7), (0, 7)], [(-4, -2), (2, -5), (5, -1), (-2, 3)], [(1, -4), (4, -1)], [(0, -4), (3, 0)]]),
-    (-7, 5, [[(-3, -9), (-3, 6), (-4, 7), (-2, 9)], [(-2, -9), (-2, 6), (-3, 7), (-2, 8), (-1, 7), (-2, 6)], [(-1, -10), (-1, 6), (0, 7), (-2, 9)], [(-3, -9), (3, -12), (5, -10), (3, -9), (1, -11)], [(2, -11), (4, -10)], [(-6, -5), (-3, -5)], [(-1, -5), (3, -5)]]),
-    (-8, 9, [[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(2, -4), (4, -2), (4, 11), (3, 13)], [(-2, 15), (-4, 15)], [(0, -4), (3, -1), (3, 12), (2, 14), (1, 15)]]),
-    (-9, 9, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-6, 7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)], [(-3, -3), (0, -4), (2, -5), (5, -2), (5, 7), (2, 11), (2, 14), (3, 16), (4, 16), (2, 14)], [(2, -4), (4, -2), (4, 7), (3, 9)], [(0, -4), (3, -1), (3, 8), (2, 11)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11), (-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2), (-1, 6), (-2, 7), (0, 9)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -5), (2, -3), (1, -2), (1, 6), (2, 7), (0, 9)]]),
-    (-5, 5, [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11), (-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2), (-1, 7), (2, 11)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 9)], [(0, -5), (2, -3), (1, -2), (1, 8), (2, 11), (2, 14), (0, 16), (-2, 15), (-2, 16), (0, 16)]]),
-    (-9, 8, [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-6, 7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)], [(-3, -2), (0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1, -4), (3, -2)], [(0, -4), (2, -1)], [(0, 1), (1, 2), (2, 7), (4, 9), (6, 7)], [(1, 1), (2, 3), (3, 7), (4, 8)], [(1, 0), (2, 1), (4, 6), (5, 7), (6, 7)]]),
-    (-5, 5, [[(0, -10), (-2, -12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8), (1, 6), (2, 7), (0, 9)]]),
-    (-13, 13, [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7), (-8, 9)], [(-9, -4), (-8, -3), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8, 6)], [(-11, -3), (-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-7, -3), (-4, -4), (-2, -5), (1, -3), (1, 6), (2, 7), (0, 9)], [(-2, -4), (0, -3), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(-4, -4), (-1, -2), (-1, 6), (-2, 7), (0, 9)], [(1, -3), (4, -4), (6, -5), (9, -3), (9, 6), (10, 7), (8, 9)], [(6, -4), (8, -3), (8, 6), (7, 7), (8, 8), (9, 7), (8, 6)], [(4, -4), (7, -2), (7, 6), (6, 7), (8, 9)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7), (-4, 9)], [(-5, -4), (-4, -3), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-2, 7), (-4, 9)], [(-3, -3), (0, -4), (2, -5), (5, -3), (5, 6), (6, 7), (4, 9)], [(2, -4), (4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(0, -4), (3, -2), (3, 6), (2, 7), (4, 9)]]),
-    (-8, 8, [[(-5, -2), (-5, 6), (-2, 9), (3, 7), (5, 6)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-9, 8, [[(-6, -5), (-5, -3), (-5, 6), (-7, 7), (-5, 7), (-5, 13), (-6, 16), (-4, 14)], [(-4, -3), (-4, 14)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-4, 7), (-3, 7), (-1, 8)], [(-3, 8), (-2, 9), (3, 7), (5, 6)], [(-3, 8), (-3, 13), (-2, 16), (-4, 14)], [(-3, -3), (0, -4), (2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]),
-    (-8, 9, [[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5, 13), (6, 16), (4, 14)], [(2, -4), (4, -2), (4, 14)], [(0, -4), (3, -1), (3, 13), (2, 16), (4, 14)]]),
-    (-7, 6, [[(-5, -3), (-4, -3), (-3, -2), (-3, 6), (-4, 7), (-2, 9)], [(-3, -4), (-2, -3), (-2, 6), (-3, 7), (-2, 8), (-1, 7), (-2, 6)], [(-5, -3), (-3, -5), (-1, -3), (-1, 6), (0, 7), (-2, 9)], [(-1, -3), (3, -5), (5, -3), (3, -2), (1, -4)], [(2, -4), (4, -3)]]),
-    (-8, 8, [[(-5, -2), (-5, 1), (-3, 3), (3, 0), (5, 2), (5, 6)], [(-4, -2), (-4, 1), (-3, 2)], [(-3, -3), (-3, 1), (-2, 2)], [(3, 1), (4, 2), (4, 6)], [(2, 1), (3, 2), (3, 7)], [(-5, -2), (1, -5), (4, -4), (2, -3), (-1, -4)], [(0, -4), (3, -4)], [(5, 6), (-1, 9), (-5, 7), (-3, 6), (1, 8)], [(-3, 7), (-1, 8)]]),
-    (-5, 5, [[(0, -10), (-2, -12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8), (1, 6), (2, 7), (0, 9)], [(-4, -5), (-1, -5)], [(1, -5), (4, -5)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (0, 8)], [(4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 7), (5, 8)], [(4, -5), (2, -3), (3, -2), (3, 7), (5, 9), (7, 7)]]),
-    (-9, 9, [[(-6, -5), (-5, -3), (-5, 6), (-1, 9), (1, 7), (5, 5)], [(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 5), (0, 7), (1, 7)], [(4, -5), (6, -3), (5, -2), (5, 5)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 5)], [(4, -5), (2, -3), (3, -2), (3, 6)]]),
-    (-13, 13, [[(-10, -5), (-9, -3), (-9, 6), (-5, 9), (-3, 7), (-1, 6)], [(-9, -4), (-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5), (-4, 7), (-3, 7)], [(0, -5), (-2, -3), (-1, -2), (-1, 6), (3, 9), (5, 7), (9, 5)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 6), (3, 8)], [(0, -5), (2, -3), (1, -2), (1, 5), (4, 7), (5, 7)], [(8, -5), (10, -3), (9, -2), (9, 5)], [(8, -2), (9, -3), (8, -4), (7, -3), (8, -2), (8, 5)], [(8, -5), (6, -3), (7, -2), (7, 6)]]),
-    (-9, 9, [[(-6, -3), (-4, -2), (3, 8), (4, 9), (6, 7)], [(-5, -4), (-3, -3), (3, 7), (5, 8)], [(-6, -3), (-4, -5), (-3, -4), (4, 6), (6, 7)], [(6, -5), (4, -5), (4, -3), (6, -3), (6, -5), (4, -3), (1, 1)], [(-1, 3), (-4, 7), (-6, 9), (-4, 9), (-4, 7), (-6, 7), (-6, 9)], [(-4, 2), (-1, 2)], [(1, 2), (4, 2)]]),
-    (-9, 9, [[(-7, -3), (-6, -3), (-5, -2), (-5, 7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (0, 8)], [(4, -5), (6, -3), (5, -2), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 12), (3, 13)], [(-2, 15), (-4, 15)], [(4, -5), (2, -3), (3, -2), (3, 12), (2, 14), (1, 15)]]),
-    (-6, 9, [[(0, -4), (-3, -2), (-3, -3), (0, -4), (2, -5), (5, -3), (5, 1), (0, 3)], [(2, -4), (4, -3), (4, 1)], [(0, -4), (3, -2), (3, 1), (2, 2)], [(0, 3), (5, 5), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16), (-1, 15)], [(4, 5), (4, 12), (3, 13)], [(-2, 15), (-4, 15)], [(2, 4), (3, 5), (3, 12), (2, 14), (1, 15)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]),
-]
-
-GREEK = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8, 0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9), (10, 8), (10, 7)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(-7, 9), (7, -12)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-8, 9), (8, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 10, [[(0, -12), (0, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3), (-7, 0), (-6, 2), (-5, 3), (-2, 4), (2, 4), (5, 3), (6, 2), (7, 0), (7, -3), (6, -5), (5, -6), (2, -7), (-2, -7)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, -12), (6, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-2, 3, [[(0, -1), (0, 0), (1, 0), (1, -1), (0, -1)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-3, -2), (3, -2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-9, 9, [[(-7, -12), (0, -2), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-9, 9, [[(-7, -7), (-7, -9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5), (0, 9)], [(7, -7), (7, -9), (6, -11), (5, -12), (3, -12), (2, -11), (1, -9), (0, -5)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-7, 9), (-3, 9), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (3, 9), (7, 9)]]),
-    (-9, 9, [[(-7, -12), (7, -12)], [(-3, -2), (3, -2)], [(-7, 9), (7, 9)]]),
-    (-11, 11, [[(0, -12), (0, 9)], [(-9, -6), (-8, -6), (-7, -5), (-6, -1), (-5, 1), (-4, 2), (-1, 3), (1, 3), (4, 2), (5, 1), (6, -1), (7, -5), (8, -6), (9, -6)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(0, -14), (-8, 0)], [(0, -14), (8, 0)]]),
-    (-9, 9, [[(-9, 16), (9, 16)]]),
-    (-4, 4, [[(1, -7), (-1, -5), (-1, -3), (0, -2), (1, -3), (0, -4), (-1, -3)]]),
-    (-10, 11, [[(-1, -5), (-3, -4), (-5, -2), (-6, 0), (-7, 3), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2), (8, -5)], [(-1, -5), (1, -5), (2, -4), (3, -2), (5, 6), (6, 8), (7, 9), (8, 9)]]),
-    (-9, 10, [[(3, -12), (1, -11), (-1, -9), (-3, -5), (-4, -2), (-5, 2), (-6, 8), (-7, 16)], [(3, -12), (5, -12), (7, -10), (7, -7), (6, -5), (5, -4), (3, -3), (0, -3)], [(0, -3), (2, -2), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (1, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 4)]]),
-    (-9, 9, [[(-7, -5), (-5, -5), (-3, -3), (3, 14), (5, 16), (7, 16)], [(8, -5), (7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]),
-    (-9, 9, [[(2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (5, 0), (4, -3), (2, -5), (0, -7), (-1, -9), (-1, -11), (0, -12), (2, -12), (4, -11), (6, -9)]]),
-    (-8, 8, [[(5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-3, -2), (-2, 0), (1, 1)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)]]),
-    (-11, 11, [[(-3, -4), (-5, -3), (-7, -1), (-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (5, 6), (7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3), (0, 1), (-2, 6), (-5, 16)]]),
-    (-9, 10, [[(-8, -2), (-6, -4), (-4, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 4), (0, 9)], [(8, -5), (7, -2), (6, 0), (0, 9), (-2, 13), (-3, 16)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-6, 9)], [(-4, 2), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -3), (6, 0), (5, 5), (2, 16)]]),
-    (-6, 5, [[(0, -5), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (0, 9), (2, 7), (3, 5)]]),
-    (-11, 11, [[(-7, -7), (7, 7)], [(7, -7), (-7, 7)]]),
-    (-9, 9, [[(-3, -5), (-7, 9)], [(7, -4), (6, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-4, 1)], [(-4, 1), (-2, 2), (-1, 3), (1, 8), (2, 9), (3, 9), (4, 8)]]),
-    (-8, 8, [[(-7, -12), (-5, -12), (-3, -11), (-2, -10), (6, 9)], [(0, -5), (-6, 9)]]),
-    (-10, 11, [[(-3, -5), (-9, 16)], [(-4, -1), (-5, 4), (-5, 7), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)]]),
-    (-9, 9, [[(-6, -5), (-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5), (6, -2), (5, 0), (3, 3), (0, 6), (-3, 8), (-6, 9)]]),
-    (-8, 9, [[(0, -5), (-2, -4), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5)]]),
-    (-11, 11, [[(-2, -5), (-6, 9)], [(3, -5), (4, 1), (5, 6), (6, 9)], [(-9, -2), (-7, -4), (-4, -5), (9, -5)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-4, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -5), (6, -8), (5, -11), (3, -12), (1, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2)]]),
-    (-9, 9, [[(-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5), (-2, -4), (-4, -2), (-5, 1), (-9, 16)]]),
-    (-9, 11, [[(9, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (5, 0), (4, -3), (3, -4), (1, -5)]]),
-    (-10, 10, [[(1, -5), (-2, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-5, 4), (-5, 7), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 2), (7, -2), (7, -5)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 0), (9, 0)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-12, 11, [[(-4, -5), (-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 5)], [(0, 1), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5), (8, 2), (8, -1), (7, -4), (6, -5)]]),
-    (-8, 8, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(3, -7), (0, -6), (-2, -5), (-3, -3), (-3, -1), (-1, 1), (2, 2), (4, 2)], [(2, 2), (-2, 3), (-4, 4), (-5, 6), (-5, 8), (-3, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)]]),
-    (-12, 11, [[(4, -12), (-4, 16)], [(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (8, -2), (9, -5)]]),
-    (-8, 7, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(6, -7), (2, -5), (-1, -3), (-4, 0), (-5, 3), (-5, 5), (-4, 7), (-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16), (-2, 14)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-GREEKC = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -9), (5, -8), (6, -7), (7, -8), (7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -12), (0, 0)], [(-5, -9), (5, -3)], [(5, -9), (-5, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8, -6), (7, -12)], [(-7, 9), (0, 9)]]),
-    (-10, 10, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(0, -9), (7, 9)], [(-7, 8), (7, 8)], [(-8, 9), (8, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-10, 10, [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-6, -12), (-7, -6), (-7, -12), (7, -12)], [(-7, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)], [(-3, -5), (-3, 2)], [(3, -5), (3, 2)], [(-3, -2), (3, -2)], [(-3, -1), (3, -1)]]),
-    (-5, 6, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(7, -12), (-6, 1)], [(-1, -3), (7, 9)], [(-2, -3), (6, 9)], [(-10, -12), (-3, -12)], [(3, -12), (9, -12)], [(-10, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-12, 13, [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]),
-    (-11, 12, [[(-6, -12), (-6, 9)], [(-5, -12), (7, 7)], [(-5, -10), (7, 9)], [(7, -12), (7, 9)], [(-9, -12), (-5, -12)], [(4, -12), (10, -12)], [(-9, 9), (-3, 9)]]),
-    (-11, 11, [[(-7, -13), (-8, -8)], [(8, -13), (7, -8)], [(-3, -4), (-4, 1)], [(4, -4), (3, 1)], [(-7, 5), (-8, 10)], [(8, 5), (7, 10)], [(-7, -11), (7, -11)], [(-7, -10), (7, -10)], [(-3, -2), (3, -2)], [(-3, -1), (3, -1)], [(-7, 7), (7, 7)], [(-7, 8), (7, 8)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]),
-    (-10, 11, [[(-7, -12), (0, -2), (-8, 9)], [(-8, -12), (-1, -2)], [(-8, -12), (7, -12), (8, -6), (6, -12)], [(-7, 8), (6, 8)], [(-8, 9), (7, 9), (8, 3), (6, 9)]]),
-    (-9, 10, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]),
-    (-9, 10, [[(-7, -7), (-7, -9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5), (0, 9)], [(-7, -9), (-5, -11), (-3, -11), (-1, -9)], [(8, -7), (8, -9), (7, -11), (6, -12), (4, -12), (3, -11), (2, -9), (1, -5), (1, 9)], [(8, -9), (6, -11), (4, -11), (2, -9)], [(-3, 9), (4, 9)]]),
-    (-10, 11, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3), (-7, 0), (-6, 2), (-5, 3), (-2, 4), (3, 4), (6, 3), (7, 2), (8, 0), (8, -3), (7, -5), (6, -6), (3, -7), (-2, -7)], [(-2, -7), (-4, -6), (-5, -5), (-6, -3), (-6, 0), (-5, 2), (-4, 3), (-2, 4)], [(3, 4), (5, 3), (6, 2), (7, 0), (7, -3), (6, -5), (5, -6), (3, -7)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-10, 10, [[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 12, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-9, -5), (-8, -6), (-6, -5), (-5, -1), (-4, 1), (-3, 2), (-1, 3)], [(-8, -6), (-7, -5), (-6, -1), (-5, 1), (-4, 2), (-1, 3), (2, 3), (5, 2), (6, 1), (7, -1), (8, -5), (9, -6)], [(2, 3), (4, 2), (5, 1), (6, -1), (7, -5), (9, -6), (10, -5)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-11, 11, [[(-8, 6), (-7, 9), (-3, 9), (-5, 5), (-7, 1), (-8, -2), (-8, -6), (-7, -9), (-5, -11), (-2, -12), (2, -12), (5, -11), (7, -9), (8, -6), (8, -2), (7, 1), (5, 5), (3, 9), (7, 9), (8, 6)], [(-5, 5), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11), (-2, -12)], [(2, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (5, 5)], [(-7, 8), (-4, 8)], [(4, 8), (7, 8)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 5, [[(1, -12), (0, -11), (-1, -9), (-1, -7), (0, -6), (1, -7), (0, -8)]]),
-    (-11, 12, [[(-1, -5), (-4, -4), (-6, -2), (-7, 0), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2), (8, -5)], [(-1, -5), (-3, -4), (-5, -2), (-6, 0), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(-1, -5), (1, -5), (3, -4), (4, -2), (6, 6), (7, 8), (8, 9)], [(1, -5), (2, -4), (3, -2), (5, 6), (6, 8), (8, 9), (9, 9)]]),
-    (-11, 10, [[(2, -12), (-1, -11), (-3, -9), (-5, -5), (-6, -2), (-7, 2), (-8, 8), (-9, 16)], [(2, -12), (0, -11), (-2, -9), (-4, -5), (-5, -2), (-6, 2), (-7, 8), (-8, 16)], [(2, -12), (4, -12), (6, -11), (7, -10), (7, -7), (6, -5), (5, -4), (2, -3), (-2, -3)], [(4, -12), (6, -10), (6, -7), (5, -5), (4, -4), (2, -3)], [(-2, -3), (2, -2), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4)], [(-2, -3), (1, -2), (3, 0), (4, 2), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-10, 10, [[(-9, -2), (-7, -4), (-5, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 4), (0, 8), (-3, 16)], [(-8, -3), (-6, -4), (-2, -4), (0, -3)], [(8, -5), (7, -2), (6, 0), (1, 7), (-2, 12), (-4, 16)], [(7, -5), (6, -2), (5, 0), (1, 7)]]),
-    (-9, 10, [[(4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (1, -8), (0, -10), (0, -12), (1, -13), (3, -13), (5, -12), (7, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4), (2, -7), (1, -9), (1, -11), (2, -12), (4, -12), (7, -10)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-2, -5), (-4, -4), (-4, -2), (-2, 0), (1, 1)], [(-2, -5), (-3, -4), (-3, -2), (-1, 0), (1, 1)], [(1, 1), (-4, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-9, 9, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (8, -7), (8, -8), (5, -7), (1, -5), (-2, -3), (-5, 0), (-6, 3), (-6, 5), (-5, 7), (-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16), (-2, 15)], [(3, -6), (-1, -3), (-4, 0), (-5, 3), (-5, 5), (-4, 7), (-2, 9)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-6, 9)], [(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-4, 2), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -4), (7, -3), (7, 0), (6, 5), (3, 16)], [(4, -5), (6, -3), (6, 0), (5, 5), (2, 16)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-4, 8), (-3, 9)], [(-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -5), (7, -9), (6, -11), (4, -12), (2, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2)], [(1, 8), (3, 5), (4, 3), (5, 0), (6, -5), (6, -9), (5, -11), (4, -12)]]),
-    (-6, 6, [[(0, -5), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3, 7), (4, 5)], [(1, -5), (-1, 2), (-2, 6), (-2, 8), (-1, 9)]]),
-    (-10, 10, [[(-4, -5), (-8, 9)], [(-3, -5), (-7, 9)], [(6, -5), (7, -4), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-5, 1)], [(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)]]),
-    (-10, 10, [[(-7, -12), (-5, -12), (-3, -11), (-2, -10), (-1, -8), (5, 6), (6, 8), (7, 9)], [(-5, -12), (-3, -10), (-2, -8), (4, 6), (5, 8), (7, 9), (8, 9)], [(0, -5), (-8, 9)], [(0, -5), (-7, 9)]]),
-    (-12, 11, [[(-5, -5), (-11, 16)], [(-4, -5), (-10, 16)], [(-5, -2), (-6, 4), (-6, 7), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3)], [(6, -5), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (4, 6), (4, 8), (5, 9)]]),
-    (-10, 10, [[(-4, -5), (-6, 9)], [(-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5), (6, -1), (4, 3)], [(8, -5), (7, -2), (6, 0), (4, 3), (2, 5), (-1, 7), (-3, 8), (-6, 9)], [(-7, -5), (-3, -5)]]),
-    (-9, 8, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(3, -7), (-1, -6), (-3, -5), (-4, -3), (-4, -1), (-2, 1), (1, 2), (4, 2)], [(3, -7), (0, -6), (-2, -5), (-3, -3), (-3, -1), (-1, 1), (1, 2)], [(1, 2), (-3, 3), (-5, 4), (-6, 6), (-6, 8), (-4, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)], [(1, 2), (-2, 3), (-4, 4), (-5, 6), (-5, 8), (-3, 10), (1, 12)]]),
-    (-9, 9, [[(0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)]]),
-    (-11, 11, [[(-2, -4), (-6, 9)], [(-2, -4), (-5, 9)], [(4, -4), (4, 9)], [(4, -4), (5, 9)], [(-9, -2), (-7, -4), (-4, -5), (9, -5)], [(-9, -2), (-7, -3), (-4, -4), (9, -4)]]),
-    (-10, 9, [[(-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-10, 16)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-9, 16)]]),
-    (-10, 11, [[(9, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 5), (5, 2), (5, -1), (4, -3), (3, -4), (1, -5)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-1, 9), (1, 8), (3, 5), (4, 2), (4, -2), (3, -4)], [(3, -4), (9, -4)]]),
-    (-10, 10, [[(1, -4), (-2, 9)], [(1, -4), (-1, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)], [(-8, -2), (-6, -3), (-3, -4), (8, -4)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -2), (-4, 4), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -2), (-5, 4), (-5, 7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (7, -3), (6, -5), (5, -4), (6, -3), (7, 0)], [(6, 3), (7, -3)]]),
-    (-11, 11, [[(-3, -4), (-5, -3), (-7, -1), (-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (5, 6), (7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3), (0, 1), (-2, 6), (-5, 16)], [(-8, 5), (-6, 7), (-4, 8), (-1, 8), (2, 7), (5, 5), (7, 3)], [(8, -3), (6, -4), (4, -4), (2, -2), (0, 1), (-2, 7), (-4, 16)]]),
-    (-9, 9, [[(-7, -5), (-5, -5), (-3, -4), (-2, -2), (3, 13), (4, 15), (5, 16)], [(-5, -5), (-4, -4), (-3, -2), (2, 13), (3, 15), (5, 16), (7, 16)], [(8, -5), (7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]),
-    (-12, 11, [[(3, -12), (-3, 16)], [(4, -12), (-4, 16)], [(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-3, 8), (0, 8), (2, 7), (5, 4), (7, 1)], [(-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (0, 9), (2, 8), (4, 6), (6, 3), (7, 1), (9, -5)]]),
-    (-12, 11, [[(-8, -1), (-6, -3), (-3, -4), (-4, -5), (-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 5), (0, 2)], [(-9, 5), (-8, 7), (-7, 8), (-5, 8), (-3, 7), (-1, 5)], [(-1, 2), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5), (8, 2), (8, -1), (7, -4), (6, -5), (5, -4), (7, -3), (8, -1)], [(-1, 5), (0, 7), (1, 8), (3, 8), (5, 7), (7, 5)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-]
-
-GREEKS = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8, 0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9), (10, 8), (10, 7)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]),
-    (-8, 8, [[(0, -12), (0, 0)], [(-5, -9), (5, -3)], [(5, -9), (-5, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 5, [[(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, -12), (6, -12)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-8, 9), (8, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-3, -2), (3, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-9, 9, [[(-7, -12), (7, -12)], [(-3, -2), (3, -2)], [(-7, 9), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-9, 9, [[(-7, -12), (0, -2), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-9, 9, [[(-7, -7), (-7, -9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5), (0, 9)], [(7, -7), (7, -9), (6, -11), (5, -12), (3, -12), (2, -11), (1, -9), (0, -5)]]),
-    (-10, 10, [[(0, -12), (0, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3), (-7, 0), (-6, 2), (-5, 3), (-2, 4), (2, 4), (5, 3), (6, 2), (7, 0), (7, -3), (6, -5), (5, -6), (2, -7), (-2, -7)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(-7, 9), (7, -12)]]),
-    (-11, 11, [[(0, -12), (0, 9)], [(-9, -6), (-8, -6), (-7, -5), (-6, -1), (-5, 1), (-4, 2), (-1, 3), (1, 3), (4, 2), (5, 1), (6, -1), (7, -5), (8, -6), (9, -6)]]),
-    (-10, 10, [[(-7, 9), (-3, 9), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (3, 9), (7, 9)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 5, [[(1, -12), (0, -11), (-1, -9), (-1, -7), (0, -6), (1, -7), (0, -8)]]),
-    (-10, 11, [[(-1, -5), (-3, -4), (-5, -2), (-6, 0), (-7, 3), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2), (8, -5)], [(-1, -5), (1, -5), (2, -4), (3, -2), (5, 6), (6, 8), (7, 9), (8, 9)]]),
-    (-9, 10, [[(3, -12), (1, -11), (-1, -9), (-3, -5), (-4, -2), (-5, 2), (-6, 8), (-7, 16)], [(3, -12), (5, -12), (7, -10), (7, -7), (6, -5), (5, -4), (3, -3), (0, -3)], [(0, -3), (2, -2), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (1, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 4)]]),
-    (-9, 10, [[(-8, -2), (-6, -4), (-4, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 4), (0, 9)], [(8, -5), (7, -2), (6, 0), (0, 9), (-2, 13), (-3, 16)]]),
-    (-9, 9, [[(2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (5, 0), (4, -3), (2, -5), (0, -7), (-1, -9), (-1, -11), (0, -12), (2, -12), (4, -11), (6, -9)]]),
-    (-8, 8, [[(5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-3, -2), (-2, 0), (1, 1)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)]]),
-    (-8, 7, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(6, -7), (2, -5), (-1, -3), (-4, 0), (-5, 3), (-5, 5), (-4, 7), (-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16), (-2, 14)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-6, 9)], [(-4, 2), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -3), (6, 0), (5, 5), (2, 16)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-4, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -5), (6, -8), (5, -11), (3, -12), (1, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2)]]),
-    (-6, 5, [[(0, -5), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (0, 9), (2, 7), (3, 5)]]),
-    (-9, 9, [[(-3, -5), (-7, 9)], [(7, -4), (6, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-4, 1)], [(-4, 1), (-2, 2), (-1, 3), (1, 8), (2, 9), (3, 9), (4, 8)]]),
-    (-8, 8, [[(-7, -12), (-5, -12), (-3, -11), (-2, -10), (6, 9)], [(0, -5), (-6, 9)]]),
-    (-10, 11, [[(-3, -5), (-9, 16)], [(-4, -1), (-5, 4), (-5, 7), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)]]),
-    (-9, 9, [[(-6, -5), (-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5), (6, -2), (5, 0), (3, 3), (0, 6), (-3, 8), (-6, 9)]]),
-    (-8, 8, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(3, -7), (0, -6), (-2, -5), (-3, -3), (-3, -1), (-1, 1), (2, 2), (4, 2)], [(2, 2), (-2, 3), (-4, 4), (-5, 6), (-5, 8), (-3, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)]]),
-    (-8, 9, [[(0, -5), (-2, -4), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5)]]),
-    (-11, 11, [[(-2, -5), (-6, 9)], [(3, -5), (4, 1), (5, 6), (6, 9)], [(-9, -2), (-7, -4), (-4, -5), (9, -5)]]),
-    (-9, 9, [[(-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5), (-2, -4), (-4, -2), (-5, 1), (-9, 16)]]),
-    (-9, 11, [[(9, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (5, 0), (4, -3), (3, -4), (1, -5)]]),
-    (-10, 10, [[(1, -5), (-2, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-5, 4), (-5, 7), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 2), (7, -2), (7, -5)]]),
-    (-11, 11, [[(-3, -4), (-5, -3), (-7, -1), (-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (5, 6), (7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3), (0, 1), (-2, 6), (-5, 16)]]),
-    (-9, 9, [[(-7, -5), (-5, -5), (-3, -3), (3, 14), (5, 16), (7, 16)], [(8, -5), (7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]),
-    (-12, 11, [[(4, -12), (-4, 16)], [(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (8, -2), (9, -5)]]),
-    (-12, 11, [[(-4, -5), (-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 5)], [(0, 1), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5), (8, 2), (8, -1), (7, -4), (6, -5)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-]
-
-JAPANESE = [
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 9), (-11, 8), (-10, 7), (-9, 8), (-9, 10), (-10, 12), (-11, 13)]]),
-    (-14, 13, [[(-10, -3), (-8, -1), (8, -2), (10, -1)], [(-9, -2), (10, -1)]]),
-    (-14, 13, [[(-5, -10), (-7, -11), (-7, 10)], [(-6, -10), (-6, 10)], [(-6, 8), (6, 8)], [(-6, -10), (6, -10)], [(5, -10), (6, -11), (8, -10), (7, -8)], [(6, -10), (6, 10)], [(7, -10), (7, 10)], [(-6, -1), (6, -1)]]),
-    (-14, 13, [[(-7, -11), (-9, -12), (-9, 9)], [(-8, -11), (-8, 9)], [(-8, -11), (7, -11)], [(6, -11), (7, -12), (9, -11), (8, -9)], [(7, -11), (7, 5), (6, 7), (5, 8)], [(7, 6), (7, 7), (6, 8)], [(8, -11), (8, 7), (7, 9), (6, 9), (5, 8), (3, 7)], [(-1, -11), (-1, -2)], [(0, -11), (0, -2)], [(-8, -2), (7, -2)]]),
-    (-14, 13, [[(-6, -12), (-8, -7), (-11, -1)], [(-6, -12), (-5, -11), (-6, -9), (-9, -4), (-11, -1)], [(-6, -9), (10, -9), (8, -11), (6, -9)], [(6, -9), (9, -10)], [(0, -9), (0, 10)], [(1, -9), (1, 10)], [(-4, -3), (-6, -4), (-6, 3)], [(-5, -3), (-5, 3)], [(-5, -3), (9, -3), (7, -5), (5, -3)], [(5, -3), (8, -4)], [(-11, 3), (11, 3), (9, 1), (7, 3)], [(7, 3), (10, 2)]]),
-    (-14, 13, [[(-1, -12), (-1, -6), (-2, -1), (-4, 3), (-6, 6), (-8, 8), (-11, 10)], [(0, -11), (0, -7)], [(-1, -12), (1, -11), (0, -4), (-1, 0), (-3, 4), (-6, 7), (-9, 9), (-11, 10)], [(-11, -5), (11, -5), (9, -7), (7, -5)], [(7, -5), (10, -6)], [(1, -5), (2, -1), (3, 2), (4, 4), (6, 7), (9, 10), (11, 9)], [(7, 7), (9, 9)], [(1, -5), (2, -2), (4, 2), (6, 5), (8, 7), (11, 9)]]),
-    (-14, 13, [[(-8, -11), (-10, -12), (-10, 10)], [(-9, -11), (-9, 10)], [(-9, -11), (9, -11)], [(8, -11), (9, -12), (11, -11), (10, -9)], [(9, -11), (9, 10)], [(10, -11), (10, 10)], [(-7, -7), (7, -7), (6, -8), (5, -7)], [(-1, -7), (-1, 5)], [(0, -7), (0, 5)], [(-6, -1), (6, -1), (5, -2), (4, -1)], [(-7, 5), (7, 5), (6, 4), (5, 5)], [(2, 1), (3, 3), (4, 3), (4, 2), (2, 1)], [(-9, 9), (9, 9)]]),
-    (-14, 13, [[(-1, -12), (-1, -6), (-2, -1), (-4, 3), (-6, 6), (-8, 8), (-11, 10)], [(0, -11), (0, -7)], [(-1, -12), (1, -11), (0, -4), (-1, 0), (-3, 4), (-6, 7), (-9, 9), (-11, 10)], [(1, -11), (1, -7), (2, -1), (3, 2), (4, 4), (6, 7), (9, 10), (11, 9)], [(7, 7), (9, 9)], [(1, -7), (2, -2), (4, 2), (6, 5), (8, 7), (11, 9)]]),
-    (-14, 13, [[(0, -11), (1, -12), (-1, -12), (-1, 10)], [(0, -11), (0, 10)], [(-11, -10), (11, -10), (9, -11), (8, -10)], [(-6, -6), (-8, -7), (-8, 3)], [(-7, -6), (-7, 3)], [(-7, -6), (6, -6)], [(5, -6), (6, -7), (8, -6), (7, -4)], [(6, -6), (6, 3)], [(7, -6), (7, 3)], [(-7, -2), (6, -2)], [(-7, 2), (6, 2)], [(-1, 2), (-4, 5), (-7, 7), (-11, 9)], [(-1, 4), (-4, 6), (-6, 7), (-11, 9)], [(0, 2), (3, 6), (6, 8), (9, 9), (11, 8)], [(0, 2), (3, 5), (7, 7), (11, 8)]]),
-    (-14, 13, [[(0, -10), (1, -11), (-1, -12), (-1, 11)], [(0, -11), (0, 11)], [(-8, -6), (-10, -7), (-10, 4)], [(-9, -6), (-9, 4)], [(-9, -6), (8, -6)], [(7, -6), (8, -7), (10, -6), (9, -4)], [(8, -6), (8, 4)], [(9, -6), (9, 4)], [(-9, 3), (8, 3)]]),
-    (-14, 13, [[(0, -10), (1, -11), (-1, -12), (-1, 10)], [(0, -11), (0, 10)], [(-11, -6), (11, -6), (9, -8), (7, -6)], [(7, -6), (10, -7)], [(-2, -6), (-5, 0), (-8, 4), (-11, 7)], [(-1, -5), (-3, -1), (-5, 2), (-7, 4), (-11, 7)], [(1, -5), (2, -2), (3, 0), (6, 4), (9, 7), (11, 6)], [(7, 4), (9, 6)], [(1, -5), (2, -3), (5, 1), (8, 4), (11, 6)], [(-5, 5), (4, 5), (3, 4), (2, 5)]]),
-    (-14, 13, [[(0, -11), (0, -12), (1, -13), (-1, -13), (-1, -11)], [(-11, -11), (11, -11), (9, -13), (7, -11)], [(7, -11), (10, -12)], [(-6, -7), (-8, -8), (-8, 0)], [(-7, -7), (-7, 0)], [(-7, -7), (6, -7)], [(5, -7), (6, -8), (8, -7), (7, -5)], [(6, -7), (6, 0)], [(7, -7), (7, 0)], [(-7, -1), (6, -1)], [(-1, -1), (-1, 6), (-2, 8), (-3, 9)], [(-1, 7), (-1, 8), (-2, 9)], [(0, -1), (0, 8), (-1, 10), (-2, 10), (-3, 9), (-5, 8)], [(-6, 2), (-11, 7)], [(-6, 2), (-5, 3), (-11, 7)], [(4, 2), (6, 4), (8, 7), (9, 7), (9, 6), (8, 5), (4, 2)]]),
-    (-14, 13, [[(-1, -12), (-1, 9)], [(-1, -12), (0, -12), (0, 9)], [(-8, -10), (-8, -2)], [(-8, -10), (-7, -10), (-7, -2)], [(-7, -3), (6, -3)], [(6, -10), (6, -2)], [(6, -10), (7, -10), (7, -2)], [(-10, 1), (-10, 10)], [(-10, 1), (-9, 1), (-9, 10)], [(-9, 9), (8, 9)], [(8, 1), (8, 10)], [(8, 1), (9, 1), (9, 10)]]),
-    (-14, 13, [[(-10, -12), (-10, 5)], [(-10, -12), (-9, -11), (-9, 5)], [(-9, -11), (-5, -11)], [(-5, -11), (-5, 4)], [(-6, -11), (-5, -12), (-4, -11), (-4, 4)], [(-9, -4), (-5, -4)], [(-9, 3), (-5, 3)], [(3, -11), (4, -12), (2, -12), (2, -4)], [(3, -11), (3, -4)], [(-2, -8), (9, -8), (7, -9), (6, -8)], [(-4, -4), (11, -4), (9, -5), (8, -4)], [(5, -4), (5, 8), (4, 9)], [(6, -4), (6, 8), (5, 10), (4, 9), (2, 8)], [(-4, 0), (11, 0), (9, -1), (8, 0)], [(-1, 2), (0, 3), (1, 5), (2, 5), (2, 4), (1, 3), (-1, 2)]]),
-    (-14, 13, [[(0, -10), (1, -11), (-1, -12), (-1, 9)], [(0, -11), (0, 9)], [(0, -2), (9, -2), (7, -4), (5, -2)], [(5, -2), (8, -3)], [(-11, 9), (11, 9), (9, 7), (7, 9)], [(7, 9), (10, 8)]]),
-    (-14, 13, [[(-1, -11), (0, -12), (-2, -12), (-2, -5)], [(-1, -11), (-1, -5)], [(-9, -9), (3, -9), (2, -10), (1, -9)], [(-11, -5), (11, -5), (9, -6), (8, -5)], [(6, -11), (3, -7), (0, -4), (-4, -1), (-9, 2)], [(6, -11), (7, -10), (2, -5), (-2, -2), (-5, 0), (-9, 2), (-11, 3)], [(-3, -1), (-5, -2), (-5, 10)], [(-4, -1), (-4, 10)], [(-4, -1), (6, -1)], [(5, -1), (6, -2), (8, -1), (7, 1)], [(6, -1), (6, 10)], [(7, -1), (7, 10)], [(-4, 4), (6, 4)], [(-4, 9), (6, 9)]]),
-    (-14, 13, [[(0, -10), (1, -11), (-1, -12), (-1, 10)], [(0, -11), (0, 10)], [(-11, -3), (11, -3), (9, -5), (7, -3)], [(7, -3), (10, -4)]]),
-    (-14, 13, [[(-11, -1), (11, -1), (8, -3), (6, -1)], [(6, -1), (9, -2)]]),
-    (-14, 13, [[(-8, -8), (8, -8), (6, -10), (4, -8)], [(4, -8), (7, -9)], [(-11, 6), (11, 6), (9, 4), (7, 6)], [(7, 6), (10, 5)]]),
-    (-14, 13, [[(-9, -9), (9, -9), (7, -11), (5, -9)], [(5, -9), (8, -10)], [(-7, -1), (7, -1), (5, -3), (3, -1)], [(3, -1), (6, -2)], [(-11, 8), (11, 8), (9, 6), (7, 8)], [(7, 8), (10, 7)]]),
-    (-14, 13, [[(-8, -9), (-10, -10), (-10, 8)], [(-9, -9), (-9, 8)], [(-9, -9), (9, -9)], [(8, -9), (9, -10), (11, -9), (10, -7)], [(9, -9), (9, 8)], [(10, -9), (10, 8)], [(-3, -9), (-3, -4), (-4, 0), (-5, 2)], [(-2, -9), (-2, -4), (-3, -1), (-5, 2), (-7, 4)], [(1, -9), (1, 1), (2, 2), (6, 2), (7, 1), (6, 0)], [(2, -9), (2, 0), (3, 1), (5, 1), (6, 0), (6, -2)], [(-9, 7), (9, 7)]]),
-    (-14, 13, [[(-9, -10), (8, -10), (6, -12), (4, -10)], [(4, -10), (7, -11)], [(-1, -10), (-4, 8)], [(0, -10), (-3, 8)], [(-9, -2), (4, -2)], [(3, -2), (4, -3), (6, -2), (5, 0)], [(4, -2), (3, 8)], [(5, -2), (5, 0), (4, 8)], [(-11, 8), (11, 8), (9, 6), (7, 8)], [(7, 8), (10, 7)]]),
-    (-14, 13, [[(0, -9), (1, -10), (-1, -11), (-1, -5)], [(0, -10), (0, -5)], [(-11, -5), (11, -5), (9, -7), (7, -5)], [(7, -5), (10, -6)], [(-5, -1), (-6, 2), (-8, 6), (-10, 9)], [(-4, 0), (-5, 2)], [(-5, -1), (-3, 0), (-5, 3), (-8, 7), (-10, 9)], [(2, -1), (4, 1), (7, 5), (8, 7), (9, 8), (10, 7), (9, 5), (6, 2), (2, -1)], [(7, 4), (9, 7)]]),
-    (-14, 13, [[(-5, -9), (-4, -10), (-6, -11), (-6, 8), (-5, 9), (7, 9), (8, 8), (7, 6)], [(6, 8), (7, 8), (7, 7)], [(-5, -10), (-5, 7), (-4, 8), (5, 8), (7, 6), (8, 3)], [(-10, -1), (-4, -2), (1, -3), (9, -5), (6, -6), (5, -4)], [(5, -4), (7, -5)]]),
-    (-14, 13, [[(0, -6), (-1, -3), (-3, 2), (-5, 5), (-8, 8), (-11, 10)], [(0, -6), (1, -5), (0, -2), (-2, 2), (-4, 5), (-6, 7), (-9, 9), (-11, 10)], [(-6, -11), (3, -11)], [(0, -11), (1, -12), (3, -11), (1, -9)], [(1, -11), (1, -6), (2, -1), (3, 2), (4, 4), (6, 7), (9, 10), (11, 9)], [(7, 7), (9, 9)], [(1, -6), (2, -2), (4, 2), (6, 5), (8, 7), (11, 9)]]),
-    (-14, 13, [[(-4, -9), (-3, -10), (-5, -11), (-5, 0), (-6, 4), (-8, 7), (-11, 10)], [(-4, -10), (-4, 0), (-5, 4), (-7, 7), (-11, 10)], [(-11, -4), (2, -5)], [(1, -5), (2, -6), (4, -5), (3, -3)], [(2, -5), (2, 8), (3, 9), (10, 9), (11, 8), (10, 6)], [(9, 8), (10, 8), (10, 7)], [(3, -5), (3, 7), (4, 8), (8, 8), (10, 6), (11, 3)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-3, -12), (-1, -11), (-1, -9), (-2, -6)], [(-2, -11), (-2, 0), (-1, 4)], [(-7, -7), (-5, -6), (0, -6), (3, -7), (6, -8)], [(3, -7), (4, -8), (6, -8)], [(1, 1), (2, -3), (3, -2), (1, 1), (-2, 5), (-4, 7), (-6, 8), (-8, 8), (-9, 7), (-9, 4), (-8, 2), (-6, 0), (-4, -1), (-1, -2), (4, -2), (7, -1), (9, 1), (10, 3), (10, 5), (9, 7), (7, 9), (4, 10), (2, 10)], [(-7, 8), (-8, 7), (-8, 4), (-7, 2), (-5, 0), (-1, -2)], [(4, -2), (6, -1), (8, 1), (9, 3), (9, 5), (8, 7), (6, 9), (4, 10)]]),
-    (-14, 13, [[(-10, -10), (-8, -9), (-8, -7), (-9, -5), (-10, -2)], [(-9, -9), (-9, -7), (-10, -2), (-10, 1), (-9, 4), (-8, 5), (-6, 6), (-5, 6), (-5, 4), (-4, 1), (-3, -1)], [(-8, 5), (-6, 5), (-5, 4)], [(5, -6), (7, -5), (9, -2), (10, 1), (10, 3), (8, 2), (5, 3)], [(9, -2), (9, 1), (8, 2)]]),
-    (-14, 13, [[(-4, -13), (-3, -12), (-1, -11), (3, -11)], [(-3, -12), (2, -12), (3, -11), (-1, -9)], [(-7, -5), (-7, -4), (-6, -3), (-5, -3), (-2, -5), (0, -6)], [(-7, -4), (-6, -4), (-3, -5), (0, -6), (2, -6), (5, -5), (6, -3), (6, 0), (5, 3), (3, 6), (0, 8), (-4, 10)], [(2, -6), (4, -5), (5, -3), (5, 0), (4, 3), (3, 5), (1, 7), (-2, 9)]]),
-    (-14, 13, [[(-4, -13), (-3, -12), (-1, -11), (3, -11)], [(-3, -12), (2, -12), (3, -11), (-1, -9)], [(-8, -5), (-8, -4), (-7, -3), (-5, -3), (0, -5), (3, -6), (4, -5)], [(-8, -4), (-5, -4), (0, -5)], [(4, -5), (0, -2), (-6, 4), (-10, 8)], [(3, -6), (0, -2)], [(-10, 8), (-10, 7), (-6, 4), (-4, 3), (0, 3), (1, 4), (2, 8), (3, 9), (10, 9)], [(5, 9), (8, 8), (9, 8), (10, 9)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-4, -5)], [(-4, -11), (-4, 9)], [(-4, 2), (-3, 8), (-4, 9), (-5, 7), (-7, 6), (-10, 5)], [(-10, -5), (-8, -4), (-4, -4), (-1, -5), (1, -6)], [(-4, -4), (-2, -5), (-1, -6), (1, -6)], [(-10, 6), (-6, 3), (-1, 0), (2, -1), (4, -1), (7, 0), (8, 2), (8, 4), (7, 6), (5, 7), (3, 7), (1, 6), (0, 4)], [(-10, 6), (-10, 5), (-6, 3)], [(4, -1), (6, 0), (7, 2), (7, 4), (6, 6), (5, 7)], [(5, -7), (7, -7), (9, -6), (10, -5), (8, -5), (7, -4)], [(7, -7), (8, -6), (8, -5)]]),
-    (-14, 13, [[(-4, -12), (-2, -11), (-2, -9), (-3, -6), (-5, -1), (-10, 9)], [(-3, -11), (-3, -9), (-5, -3), (-7, 2), (-10, 9)], [(-10, -5), (-10, -4), (-9, -3), (-8, -3), (-5, -5), (-3, -6), (0, -6), (2, -5), (3, -3), (3, 0), (2, 4), (0, 8), (-1, 9), (-2, 9), (-2, 8), (-3, 7), (-5, 6)], [(-10, -4), (-8, -4), (-5, -5)], [(0, -6), (2, -4), (2, 0), (1, 4), (0, 6), (-2, 8)], [(5, -5), (7, -4), (9, -2), (10, 0), (10, 2), (9, 1), (7, 2)], [(8, -3), (9, -1), (9, 1)]]),
-    (-14, 13, [[(-4, -12), (-1, -11), (0, -7), (1, -4), (3, 0), (6, 4), (5, 5)], [(-2, -11), (0, -7)], [(3, 0), (5, 5)], [(-6, -7), (-4, -6), (-1, -6), (2, -7)], [(-9, -3), (-8, -2), (-5, -1), (0, -1), (5, -2), (8, -3)], [(5, -2), (7, -4), (8, -3)], [(5, 5), (3, 4), (0, 3), (-4, 3), (-6, 4), (-7, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 10), (5, 10)], [(-4, 9), (4, 9), (5, 10)]]),
-    (-14, 13, [[(2, -12), (4, -11), (4, -10), (-4, -2)], [(3, -11), (2, -9), (-4, -2), (-4, -1), (1, 4), (3, 7), (4, 9)], [(-4, -1), (4, 6), (5, 8), (4, 9)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1), (-4, -3), (-3, -4), (-1, -5), (8, -5), (10, -6)], [(-9, 3), (-8, 5), (-7, 6)], [(4, -5), (8, -6), (9, -7), (10, -6)], [(4, -12), (6, -11), (6, 3), (5, 6), (3, 8), (0, 10)], [(5, -11), (6, -8)], [(6, 0), (5, 4), (3, 7), (0, 10)]]),
-    (-14, 13, [[(-5, -10), (-3, -9), (0, -8), (2, -8), (5, -9)], [(-3, -9), (2, -9), (4, -10), (5, -9), (-1, -6)], [(-7, 1), (-7, 3), (-6, 5), (-4, 6), (0, 7), (7, 7)], [(-4, 6), (6, 6), (7, 7)]]),
-    (-14, 13, [[(-8, -7), (-7, -6), (-4, -5), (0, -5), (4, -6), (6, -7), (7, -8)], [(4, -6), (6, -8), (7, -8)], [(-2, -12), (-1, -9), (0, -7), (3, -3), (5, 0), (6, 2)], [(-2, -12), (-1, -12), (-1, -10), (0, -7)], [(3, -3), (6, 0), (7, 2), (7, 3)], [(7, 3), (6, 2), (4, 1), (0, 0), (-4, 0), (-7, 1), (-8, 3), (-8, 5), (-7, 7), (-5, 8), (-1, 9), (3, 9)], [(-8, 5), (-7, 6), (-5, 7), (-1, 8), (4, 8), (3, 9)]]),
-    (-14, 13, [[(-6, -12), (-4, -11), (-5, 1), (-5, 6), (-4, 8)], [(-5, -11), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (1, 9), (4, 8), (7, 6), (9, 4)]]),
-    (-14, 13, [[(0, -12), (2, -11), (2, 1), (1, 3), (-1, 4), (-3, 3), (-4, 1), (-4, 0), (-3, -2), (-1, -3), (1, -2), (2, 0), (2, 4), (1, 8), (-1, 10)], [(1, -11), (2, -6)], [(2, 4), (1, 7), (-1, 10)], [(-10, -8), (-8, -6), (-5, -6), (4, -7), (8, -8), (10, -7)], [(-9, -7), (-5, -6)], [(4, -7), (10, -7)]]),
-    (-14, 13, [[(-6, -8), (-4, -7), (-4, 4), (-3, 6), (-2, 7), (0, 8), (8, 8)], [(-5, -7), (-4, -4)], [(3, 8), (6, 7), (7, 7), (8, 8)], [(3, -11), (5, -10), (5, 2), (4, 4), (3, 3), (0, 1)], [(4, -10), (5, -7)], [(5, -1), (4, 2), (3, 3)], [(-10, -4), (-8, -2), (-6, -2), (-2, -3), (3, -4), (7, -5), (9, -5), (10, -4)], [(-9, -3), (-2, -3)], [(3, -4), (10, -4)]]),
-    (-14, 13, [[(-4, -11), (-2, -9), (4, -11)], [(-3, -10), (-1, -10), (4, -11), (5, -10)], [(5, -10), (2, -7), (-4, -3), (-8, -1)], [(4, -11), (3, -9), (1, -7), (-4, -3)], [(-9, -2), (-7, 0), (-3, -2)], [(-8, -1), (-3, -2), (3, -3), (8, -4), (9, -3)], [(3, -3), (9, -3)], [(3, -3), (1, -2), (-1, 0), (-2, 2), (-2, 4), (-1, 6), (0, 7), (3, 8), (7, 8)], [(-1, 6), (2, 7), (6, 7), (7, 8)]]),
-    (-14, 13, [[(-4, -12), (-2, -11), (-2, -9), (-4, -3), (-5, 0), (-7, 5), (-9, 9)], [(-3, -11), (-3, -8), (-4, -3)], [(-5, 0), (-7, 4), (-9, 7), (-9, 9)], [(-10, -5), (-8, -4), (-5, -4), (-2, -5), (0, -6), (2, -7)], [(0, -6), (1, -8), (2, -7)], [(3, -4), (6, -4), (9, -3), (7, -3), (5, -2)], [(6, -4), (7, -3)], [(0, 4), (1, 6), (2, 7), (4, 8), (9, 8)], [(1, 6), (3, 7), (10, 7), (9, 8)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, -4), (-6, 0), (-6, 2), (-5, 3)], [(-4, -11), (-4, -7)], [(-5, -4), (-5, 3)], [(-10, -8), (-7, -7), (-3, -7), (1, -8), (3, -9)], [(1, -8), (2, -10), (3, -9)], [(-5, 3), (-3, 1), (0, -1), (3, -2), (6, -2), (8, -1), (9, 1), (9, 4), (8, 6), (5, 8), (1, 9), (-3, 9)], [(6, -2), (7, -1), (8, 1), (8, 4), (7, 6), (5, 8)]]),
-    (-14, 13, [[(-10, -6), (-8, -4), (-3, -6), (1, -7), (5, -7), (8, -6), (9, -5), (10, -3), (10, 0), (9, 2), (8, 3), (6, 4), (3, 5), (-2, 6)], [(-9, -5), (-3, -6)], [(5, -7), (7, -6), (8, -5), (9, -3), (9, 0), (8, 2), (6, 4)]]),
-    (-14, 13, [[(-10, -9), (-8, -7), (-6, -7), (-2, -8), (3, -9), (7, -10), (9, -10), (10, -9)], [(-9, -8), (-2, -8)], [(3, -9), (10, -9)], [(7, -9), (4, -8), (1, -6), (-1, -3), (-2, 0), (-2, 3), (-1, 6), (0, 7), (2, 8), (6, 9), (9, 9)], [(-2, 3), (-1, 5), (0, 6), (2, 7), (6, 8), (8, 8), (9, 9)]]),
-    (-14, 13, [[(-3, -12), (-1, -11), (-1, -1)], [(-2, -11), (-2, -5), (-1, -1)], [(5, -4), (7, -2), (-1, -1)], [(6, -3), (2, -2), (-1, -1), (-4, 0), (-6, 1), (-7, 3), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (8, 9)], [(-6, 7), (-4, 8), (7, 8), (8, 9)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, -3), (-6, 0), (-8, 5), (-10, 9)], [(-4, -11), (-4, -8), (-5, -3)], [(-6, 0), (-8, 4), (-10, 7), (-10, 9)], [(-10, -5), (-8, -4), (-6, -4), (-3, -5), (-1, -6), (1, -7)], [(-1, -6), (0, -8), (1, -7)], [(4, -8), (6, -8), (8, -7), (10, -5), (8, -6), (6, -5)], [(6, -8), (8, -6)], [(4, -3), (4, -1), (5, 2), (6, 4), (6, 6), (5, 8), (3, 9), (0, 9), (-2, 8), (-3, 6), (-2, 4), (0, 3), (3, 3), (5, 4), (9, 8)], [(4, -1), (5, 4), (5, 7), (3, 9)], [(7, 6), (8, 8), (9, 8)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(1, -8), (4, -9), (7, -9), (9, -8), (7, -8), (5, -7)], [(5, -9), (7, -8)], [(-1, 1), (-1, 3), (0, 5), (3, 6), (10, 6)], [(-1, 3), (0, 4), (3, 5), (8, 5), (10, 6)]]),
-    (-14, 13, [[(-8, -9), (-6, -8), (-6, -3)], [(-7, -8), (-6, -3), (-5, 0), (-4, 2), (-3, 4), (-2, 5)], [(-4, 2), (-2, 4), (-2, 5)], [(0, -11), (2, -10), (2, -8), (0, -3), (-3, 4), (-5, 7), (-7, 8), (-9, 8), (-10, 6), (-10, 4), (-9, 1), (-8, -1), (-6, -3), (-3, -5), (1, -6), (4, -6), (7, -5), (9, -3), (10, 0), (10, 3), (9, 6), (8, 7), (6, 8), (4, 8), (2, 7), (1, 6), (1, 5), (2, 4), (4, 3), (6, 3), (8, 4), (10, 7)], [(1, -10), (1, -8), (0, -3)], [(-8, 8), (-9, 6), (-9, 3), (-8, 0), (-6, -3)], [(4, -6), (6, -5), (8, -3), (9, 0), (9, 4), (8, 7)], [(8, 4), (10, 6), (10, 7)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, 9)], [(-4, -11), (-4, 9), (-5, 9), (-6, 6), (-7, 5), (-9, 4)], [(-10, -6), (-9, -4), (-7, -4), (-3, -6), (-3, -5)], [(-9, -5), (-6, -5), (-4, -6), (-5, -2)], [(-3, -5), (-5, -2), (-7, 1), (-10, 5), (-10, 4), (-7, 1), (-3, -3), (1, -6), (4, -7), (6, -7), (8, -6), (9, -4), (9, 3), (8, 6), (7, 7), (5, 8), (3, 8), (1, 7), (0, 6), (0, 5), (1, 4), (3, 3), (5, 3), (7, 4), (8, 5), (10, 8)], [(6, -7), (7, -6), (8, -4), (8, 4), (7, 7)], [(8, 5), (10, 7), (10, 8)]]),
-    (-14, 13, [[(-1, -10), (0, -8), (0, -5), (-1, -2), (-2, 0), (-4, 3), (-6, 5), (-8, 5), (-9, 4), (-10, 2), (-10, -1), (-9, -4), (-7, -7), (-4, -9), (-1, -10), (2, -10), (5, -9), (7, -8), (9, -6), (10, -3), (10, 0), (9, 3), (7, 5), (5, 6), (2, 7), (-1, 7)], [(-4, 3), (-6, 4), (-8, 4), (-9, 2), (-9, -1), (-8, -5), (-7, -7)], [(5, -9), (8, -6), (9, -3), (9, 0), (8, 3), (5, 6)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(3, -11), (5, -10), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -10), (5, -6)], [(4, 3), (9, 6), (9, 7)], [(-2, -5), (0, -4), (3, -4), (7, -5), (9, -6)], [(7, -5), (8, -7), (9, -6)]]),
-    (-14, 13, [[(-9, -11), (-8, -10), (-6, -9), (-2, -9)], [(-8, -10), (-3, -10), (-2, -9)], [(-2, -9), (-5, -7), (-7, -5), (-9, -2), (-10, 1), (-10, 4), (-9, 6), (-8, 7), (-6, 8), (-3, 8), (0, 7), (2, 5), (3, 3), (4, -1), (4, -5), (3, -9), (4, -9)], [(-10, 3), (-9, 5), (-8, 6), (-6, 7), (-3, 7), (0, 6), (2, 4), (3, 2), (4, -1)], [(4, -9), (6, -6), (7, -4), (9, -1), (10, 1), (8, 1), (7, 2)], [(3, -9), (6, -6)], [(7, -4), (8, -1), (8, 1)]]),
-    (-14, 13, [[(-2, -12), (-1, -9), (1, -8)], [(-1, -10), (1, -9), (2, -9), (2, -8)], [(2, -8), (-1, -7), (-3, -6), (-4, -5), (-4, -3), (-3, -2), (-1, -1), (1, 0), (2, 1), (3, 3), (3, 5), (2, 7), (0, 8), (-2, 8), (-5, 7), (-7, 5)], [(-1, -1), (1, 1), (2, 3), (2, 5), (1, 7), (0, 8)], [(-9, 7), (-6, 4), (-3, 2), (0, 1)], [(4, 1), (7, 2), (9, 4), (10, 6), (7, 6)], [(-9, 7), (-9, 6), (-6, 4)], [(4, 1), (6, 2), (8, 4), (9, 6)]]),
-    (-14, 13, [[(-10, -2), (-8, 0), (-5, -5)], [(-9, -1), (-4, -6), (-2, -6), (3, -1), (7, 2), (9, 3), (10, 4), (8, 4), (6, 5)], [(3, -1), (8, 4)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(-1, -11), (1, -10), (3, -10), (7, -11)], [(3, -10), (5, -11), (6, -12), (7, -11)], [(-2, -3), (1, -2), (4, -2), (7, -3), (9, -4)], [(7, -3), (8, -5), (9, -4)], [(3, -10), (5, -9), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -9), (5, -5)], [(4, 3), (9, 6), (9, 7)]]),
-    (-14, 13, [[(0, -12), (2, -11), (2, 6), (1, 8), (-1, 9), (-3, 9), (-5, 8), (-6, 6), (-5, 4), (-3, 3), (-1, 3), (2, 4), (5, 6), (8, 9)], [(1, -11), (2, -7)], [(5, 6), (8, 8), (8, 9)], [(-10, -9), (-8, -7), (1, -7), (8, -8)], [(-9, -8), (-4, -7)], [(1, -7), (5, -8), (7, -9), (8, -8)], [(-5, -2), (-3, -1), (1, -1), (5, -2), (7, -3)], [(5, -2), (6, -4), (7, -3)]]),
-    (-14, 13, [[(-8, -11), (-7, -9), (-5, -9), (-2, -10), (1, -12), (2, -11)], [(-7, -10), (-2, -10)], [(2, -11), (-2, -5), (-5, 1), (-7, 4), (-8, 5), (-9, 5), (-10, 4), (-10, 2), (-9, 0), (-7, -1), (-2, -1), (2, 0), (5, 1), (10, 3)], [(1, -12), (-2, -5)], [(2, 0), (10, 2), (10, 3)], [(4, -5), (6, -4), (6, 2), (5, 5), (3, 7), (1, 8), (-2, 9)], [(5, -4), (5, 3), (4, 6)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-4, -5), (-5, -1), (-6, 2), (-7, 4), (-8, 5), (-9, 5), (-10, 4), (-10, 2), (-9, 0), (-8, -1), (-7, -1), (-6, 0), (-6, 5), (-5, 8), (-3, 9), (3, 9), (6, 8), (7, 7), (6, 6), (5, 4), (4, 0), (4, -4), (5, -5), (7, -5), (9, -4), (10, -2), (10, -1), (9, -1), (7, 0)], [(-4, -11), (-4, -5)], [(-6, 5), (-5, 7), (-3, 8), (3, 8), (5, 7), (6, 6)], [(7, -5), (9, -3), (9, -1)], [(-10, -7), (-7, -6), (-4, -6), (-1, -7), (1, -8)], [(-1, -7), (0, -9), (1, -8)]]),
-    (-14, 13, [[(-8, -9), (-6, -8), (-6, -3)], [(-7, -8), (-6, -3), (-5, 0), (-4, 2), (-3, 4), (-2, 5)], [(-4, 2), (-2, 4), (-2, 5)], [(1, -11), (3, -10), (3, -8), (2, -5), (0, 0), (-1, 2), (-3, 5), (-5, 7), (-7, 8), (-9, 8), (-10, 7), (-10, 5), (-9, 2), (-8, 0), (-6, -2), (-3, -4), (0, -5), (4, -5), (7, -4), (9, -2), (10, 1), (10, 4), (9, 6), (8, 7), (6, 8), (3, 9), (0, 9)], [(2, -10), (2, -8), (0, 0)], [(-8, 8), (-9, 7), (-9, 4), (-8, 1), (-6, -2)], [(4, -5), (6, -4), (8, -2), (9, 1), (9, 4), (8, 6), (6, 8)]]),
-    (-14, 13, [[(-3, -12), (-1, -11), (-1, -9), (-2, -5)], [(-2, -11), (-2, 2), (-1, 6), (0, 8), (2, 9), (6, 9), (8, 8), (9, 6), (9, 4), (8, 2), (6, 0), (3, -2)], [(5, 9), (7, 8), (8, 6), (8, 3), (7, 1)], [(-6, -8), (-5, -7), (-2, -6), (1, -6)], [(-5, -7), (0, -7), (1, -6)], [(1, -6), (-2, -5), (-4, -4), (-6, -2), (-7, 0), (-6, 2), (-4, 3), (1, 3)]]),
-    (-14, 13, [[(-2, -12), (0, -11), (1, -10), (2, -8), (1, -7), (-2, -8), (-5, -8), (-6, -7), (-6, -5), (-3, 2), (-1, 9)], [(0, -11), (1, -9), (1, -7)], [(-3, 2), (0, 8), (-1, 9)], [(-10, -4), (-9, -2), (-7, -2), (-4, -4), (0, -6), (4, -7), (7, -7), (9, -6), (10, -4), (10, -2), (9, 0), (8, 1), (5, 2), (2, 2), (-1, 1)], [(-9, -3), (-7, -3), (-4, -4)], [(7, -7), (8, -6), (9, -4), (9, -2), (8, 0), (7, 1), (5, 2)]]),
-    (-14, 13, [[(-10, -10), (-8, -9), (-8, -7), (-9, -5), (-10, -2)], [(-9, -9), (-9, -7), (-10, -2), (-10, 1), (-9, 4), (-8, 5), (-6, 6), (-5, 6), (-5, 4), (-4, 1), (-3, -1)], [(-8, 5), (-6, 5), (-5, 4)], [(5, -6), (7, -5), (9, -2), (10, 1), (10, 3), (8, 2), (5, 3)], [(9, -2), (9, 1), (8, 2)]]),
-    (-14, 13, [[(-10, -8), (-8, -7), (-8, -5), (-9, -2)], [(-9, -7), (-9, 2), (-8, 5), (-7, 6), (-7, 4), (-6, 1), (-5, -1), (-3, -4), (0, -7), (3, -8), (6, -8), (8, -7), (9, -6), (10, -4), (10, -1), (9, 1), (7, 3), (5, 4), (2, 4), (0, 3), (-2, 1), (-3, -2), (-3, -5), (-2, -9), (-1, -11), (1, -12), (3, -12), (4, -10), (4, 1), (3, 5), (2, 7), (-1, 9)], [(-9, 2), (-8, 4), (-7, 4)], [(8, -7), (9, -4), (9, -1), (8, 2)], [(4, 1), (3, 4), (2, 6), (-1, 9)]]),
-    (-14, 13, [[(-4, -13), (-3, -12), (-1, -11), (3, -11)], [(-3, -12), (2, -12), (3, -11), (-1, -9)], [(-8, -5), (-8, -4), (-7, -3), (-5, -3), (0, -5), (3, -6), (4, -5)], [(-8, -4), (-5, -4), (0, -5)], [(4, -5), (0, -2), (-6, 4), (-10, 8)], [(3, -6), (0, -2)], [(-10, 8), (-10, 7), (-6, 4), (-4, 3), (0, 3), (1, 4), (2, 8), (3, 9), (10, 9)], [(5, 9), (8, 8), (9, 8), (10, 9)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, -9), (0, -4)], [(0, -11), (0, 6), (-1, 8), (-3, 9), (-6, 9), (-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 3), (-3, 3), (0, 4), (4, 6), (9, 9)], [(0, 4), (5, 6), (9, 8), (9, 9)], [(0, -4), (3, -4), (7, -5)], [(3, -4), (5, -5), (6, -6), (7, -5)]]),
-    (-14, 13, [[(-3, -12), (-1, -12), (1, -11), (2, -10), (0, -10), (-2, -9)], [(-1, -12), (0, -11), (0, -10)], [(-6, -6), (-7, -4), (-8, 0), (-8, 2), (-7, 3), (-3, 0), (-1, -1), (2, -2), (5, -2), (7, -1), (8, 1), (8, 3), (7, 5), (5, 7), (3, 8), (-1, 9), (-3, 9)], [(-8, 0), (-7, 2), (-6, 2)], [(5, -2), (6, -1), (7, 1), (7, 3), (6, 5), (4, 7), (2, 8), (-1, 9)]]),
-    (-14, 13, [[(-6, -12), (-4, -11), (-4, -9), (-6, -5)], [(-5, -11), (-5, -9), (-6, -5), (-6, -2), (-5, 1), (-4, 2), (-4, 0), (-3, -3), (-1, -6), (1, -8), (3, -9), (5, -9), (6, -8), (7, -5), (7, 0), (6, 4), (4, 7), (1, 9), (-3, 10)], [(-6, -2), (-5, 0), (-4, 0)], [(4, -9), (5, -8), (6, -5), (6, 0), (5, 4), (3, 7), (1, 9)]]),
-    (-14, 13, [[(-5, -11), (-4, -9), (-2, -9), (3, -11)], [(-4, -10), (-2, -10), (3, -11), (4, -10)], [(4, -10), (0, -7), (-4, -2), (-7, 3)], [(3, -11), (0, -7)], [(-4, -2), (-7, 1), (-7, 3)], [(-7, 3), (-5, 1), (-2, -1), (1, -2), (4, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (4, 9), (1, 9), (-1, 8), (-2, 7), (-2, 6), (-1, 5), (1, 5), (3, 6), (5, 8)], [(4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (4, 9)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, 9)], [(-4, -11), (-4, 9), (-5, 9), (-6, 6), (-7, 5), (-9, 4)], [(-10, -6), (-9, -4), (-7, -4), (-3, -6), (-3, -5)], [(-9, -5), (-6, -5), (-3, -6), (-5, -2)], [(-3, -5), (-5, -2), (-7, 1), (-10, 5), (-10, 4), (-7, 1), (-3, -3), (1, -6), (4, -7), (5, -7), (7, -6), (8, -4), (7, 6), (7, 8), (8, 9)], [(5, -7), (6, -6), (7, -4), (6, 6), (6, 8), (7, 9), (8, 9), (9, 8), (10, 6)]]),
-    (-14, 13, [[(-5, -11), (-4, -9), (-2, -9), (3, -11)], [(-4, -10), (-2, -10), (3, -11), (4, -10)], [(4, -10), (0, -7), (-4, -2), (-7, 3)], [(3, -11), (0, -7)], [(-4, -2), (-7, 1), (-7, 3)], [(-7, 3), (-5, 1), (-2, -1), (1, -2), (4, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (5, 9), (2, 10), (0, 10)], [(4, -2), (6, 0), (7, 2), (7, 5), (6, 8)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, 9)], [(-4, -11), (-4, 9), (-5, 9), (-6, 6), (-7, 5), (-9, 4)], [(-10, -6), (-9, -4), (-7, -4), (-3, -6), (-3, -5)], [(-9, -5), (-6, -5), (-3, -6), (-5, -2)], [(-3, -5), (-5, -2), (-7, 1), (-10, 5), (-10, 4), (-7, 1), (-4, -2), (-1, -4), (2, -5), (5, -5), (7, -4), (8, -3), (9, -1), (9, 2), (8, 5), (6, 7), (4, 8), (1, 9)], [(5, -5), (7, -3), (8, -1), (8, 2), (7, 5), (4, 8)]]),
-    (-14, 13, [[(-5, -11), (-4, -9), (-2, -9), (2, -11)], [(-4, -10), (-2, -10), (2, -11), (3, -10)], [(3, -10), (-1, -4), (-5, 4), (-6, 6), (-7, 7), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-7, -1), (-4, -3), (0, -4), (4, -4), (7, -3), (9, -1), (10, 1), (10, 4), (9, 6), (7, 8), (5, 9), (2, 9), (0, 8), (-1, 7), (-1, 6), (0, 5), (2, 5), (4, 6), (6, 8)], [(2, -11), (-1, -4)], [(-8, 7), (-9, 5), (-9, 3), (-8, 0)], [(8, -2), (9, 1), (9, 4), (8, 7)]]),
-    (-14, 13, [[(-4, -13), (-3, -12), (-1, -11), (3, -11)], [(-3, -12), (2, -12), (3, -11), (-1, -9)], [(-7, -5), (-7, -4), (-6, -3), (-5, -3), (-2, -5), (0, -6)], [(-7, -4), (-6, -4), (-3, -5), (0, -6), (2, -6), (5, -5), (6, -3), (6, 0), (5, 3), (3, 6), (0, 8), (-4, 10)], [(2, -6), (4, -5), (5, -3), (5, 0), (4, 3), (3, 5), (1, 7), (-2, 9)]]),
-    (-14, 13, [[(-6, -11), (-5, -9), (-3, -9), (-1, -10), (2, -12)], [(-5, -10), (-3, -10), (0, -11), (2, -12), (3, -11)], [(3, -11), (-1, -8), (-5, -4), (-8, 0)], [(2, -12), (-1, -8)], [(-8, 0), (-8, -2), (-5, -4), (-3, -5), (0, -6), (3, -6), (5, -5), (6, -3), (6, -1), (5, 1), (3, 2), (-2, 2), (-3, 1), (-3, -1), (-2, -2), (0, -2), (1, -1), (1, 1), (0, 2), (-4, 3), (-7, 5), (-10, 8), (-10, 9), (-9, 9), (-7, 5)], [(-8, 7), (-6, 6), (-4, 6), (-2, 8), (-1, 8), (1, 6), (4, 5), (7, 5), (9, 6), (10, 7), (10, 9), (9, 8), (7, 8)], [(-4, 6), (-2, 7), (-1, 7), (1, 6)], [(7, 5), (9, 7), (9, 8)]]),
-    (-14, 13, [[(-2, -12), (0, -11), (0, -10), (-2, -6), (-4, -3), (-7, 0), (-10, 3)], [(-1, -11), (-1, -10), (-2, -6)], [(-7, 0), (-10, 2), (-10, 3)], [(-5, -2), (-3, -3), (-1, -3), (1, -2), (2, 0), (2, 4)], [(-1, -3), (0, -2), (1, 0), (1, 5), (2, 4)], [(-9, -8), (-6, -7), (-3, -7), (1, -8), (5, -9)], [(1, -8), (4, -10), (5, -9)], [(9, -3), (10, -1), (2, 0), (-1, 1), (-3, 2), (-4, 4), (-4, 6), (-3, 8), (-1, 9), (7, 9)], [(9, -2), (2, 0)], [(2, 9), (6, 8), (7, 9)]]),
-    (-14, 13, [[(-1, -12), (1, -10), (-2, -5), (-6, 2), (-10, 9)], [(0, -11), (-2, -5)], [(-10, 9), (-10, 7), (-6, 2), (-4, 0), (-2, -1), (0, -1), (2, 0), (2, 5), (3, 7), (4, 8)], [(0, -1), (1, 0), (1, 5), (2, 7), (4, 8), (6, 8), (8, 7), (9, 5), (10, 2)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-4, -12), (-2, -11), (-2, -9), (-3, -6), (-5, -1), (-10, 9)], [(-3, -11), (-3, -9), (-5, -3), (-7, 2), (-10, 9)], [(-10, -5), (-10, -4), (-9, -3), (-8, -3), (-5, -5), (-3, -6), (0, -6), (2, -5), (3, -3), (3, 0), (2, 4), (0, 8), (-1, 9), (-2, 9), (-2, 8), (-3, 7), (-5, 6)], [(-10, -4), (-8, -4), (-5, -5)], [(0, -6), (2, -4), (2, 0), (1, 4), (0, 6), (-2, 8)], [(5, -5), (7, -4), (9, -2), (10, 0), (10, 2), (9, 1), (7, 2)], [(8, -3), (9, -1), (9, 1)], [(5, -10), (7, -8)], [(7, -12), (9, -10)]]),
-    (-14, 13, [[(-4, -12), (-1, -11), (0, -7), (1, -4), (3, 0), (6, 4), (5, 5)], [(-2, -11), (0, -7)], [(3, 0), (5, 5)], [(-6, -7), (-4, -6), (-1, -6), (2, -7)], [(-9, -3), (-8, -2), (-5, -1), (0, -1), (5, -2), (8, -3)], [(5, -2), (7, -4), (8, -3)], [(5, 5), (3, 4), (0, 3), (-4, 3), (-6, 4), (-7, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 10), (5, 10)], [(-4, 9), (4, 9), (5, 10)], [(5, -10), (7, -8)], [(7, -12), (9, -10)]]),
-    (-14, 13, [[(2, -12), (4, -11), (4, -10), (-4, -2)], [(3, -11), (2, -9), (-4, -2), (-4, -1), (1, 4), (3, 7), (4, 9)], [(-4, -1), (4, 6), (5, 8), (4, 9)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1), (-4, -3), (-3, -4), (-1, -5), (8, -5), (10, -6)], [(-9, 3), (-8, 5), (-7, 6)], [(4, -5), (8, -6), (9, -7), (10, -6)], [(4, -12), (6, -11), (6, 3), (5, 6), (3, 8), (0, 10)], [(5, -11), (6, -8)], [(6, 0), (5, 4), (3, 7), (0, 10)], [(9, -11), (11, -9)], [(11, -13), (13, -11)]]),
-    (-14, 13, [[(-5, -10), (-3, -9), (0, -8), (2, -8), (5, -9)], [(-3, -9), (2, -9), (4, -10), (5, -9), (-1, -6)], [(-7, 1), (-7, 3), (-6, 5), (-4, 6), (0, 7), (7, 7)], [(-4, 6), (6, 6), (7, 7)], [(7, -11), (9, -9)], [(9, -13), (11, -11)]]),
-    (-14, 13, [[(-8, -7), (-7, -6), (-4, -5), (0, -5), (4, -6), (6, -7), (7, -8)], [(4, -6), (6, -8), (7, -8)], [(-2, -12), (-1, -9), (0, -7), (3, -3), (5, 0), (6, 2)], [(-2, -12), (-1, -12), (-1, -10), (0, -7)], [(3, -3), (6, 0), (7, 2), (7, 3)], [(7, 3), (6, 2), (4, 1), (0, 0), (-4, 0), (-7, 1), (-8, 3), (-8, 5), (-7, 7), (-5, 8), (-1, 9), (3, 9)], [(-8, 5), (-7, 6), (-5, 7), (-1, 8), (4, 8), (3, 9)], [(8, -11), (10, -9)], [(10, -13), (12, -11)]]),
-    (-14, 13, [[(-6, -12), (-4, -11), (-5, 1), (-5, 6), (-4, 8)], [(-5, -11), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (1, 9), (4, 8), (7, 6), (9, 4)], [(1, -10), (3, -8)], [(3, -12), (5, -10)]]),
-    (-14, 13, [[(0, -12), (2, -11), (2, 1), (1, 3), (-1, 4), (-3, 3), (-4, 1), (-4, 0), (-3, -2), (-1, -3), (1, -2), (2, 0), (2, 4), (1, 8), (-1, 10)], [(1, -11), (2, -6)], [(2, 4), (1, 7), (-1, 10)], [(-10, -8), (-8, -6), (-5, -6), (4, -7), (8, -8), (10, -7)], [(-9, -7), (-5, -6)], [(4, -7), (10, -7)], [(6, -12), (8, -10)], [(9, -13), (11, -11)]]),
-    (-14, 13, [[(-6, -8), (-4, -7), (-4, 4), (-3, 6), (-2, 7), (0, 8), (8, 8)], [(-5, -7), (-4, -4)], [(3, 8), (6, 7), (7, 7), (8, 8)], [(3, -11), (5, -10), (5, 2), (4, 4), (3, 3), (0, 1)], [(4, -10), (5, -7)], [(5, -1), (4, 2), (3, 3)], [(-10, -4), (-8, -2), (-6, -2), (-2, -3), (3, -4), (7, -5), (9, -5), (10, -4)], [(-9, -3), (-2, -3)], [(3, -4), (10, -4)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-4, -11), (-2, -9), (4, -11)], [(-3, -10), (-1, -10), (4, -11), (5, -10)], [(5, -10), (2, -7), (-4, -3), (-8, -1)], [(4, -11), (3, -9), (1, -7), (-4, -3)], [(-9, -2), (-7, 0), (-3, -2)], [(-8, -1), (-3, -2), (3, -3), (8, -4), (9, -3)], [(3, -3), (9, -3)], [(3, -3), (1, -2), (-1, 0), (-2, 2), (-2, 4), (-1, 6), (0, 7), (3, 8), (7, 8)], [(-1, 6), (2, 7), (6, 7), (7, 8)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-4, -12), (-2, -11), (-2, -9), (-4, -3), (-5, 0), (-7, 5), (-9, 9)], [(-3, -11), (-3, -8), (-4, -3)], [(-5, 0), (-7, 4), (-9, 7), (-9, 9)], [(-10, -5), (-8, -4), (-5, -4), (-2, -5), (0, -6), (2, -7)], [(0, -6), (1, -8), (2, -7)], [(3, -4), (6, -4), (9, -3), (7, -3), (5, -2)], [(6, -4), (7, -3)], [(0, 4), (1, 6), (2, 7), (4, 8), (9, 8)], [(1, 6), (3, 7), (10, 7), (9, 8)], [(6, -10), (8, -8)], [(8, -12), (10, -10)]]),
-    (-14, 13, [[(-5, -12), (-3, -11), (-3, -9), (-5, -4), (-6, 0), (-6, 2), (-5, 3)], [(-4, -11), (-4, -7)], [(-5, -4), (-5, 3)], [(-10, -8), (-7, -7), (-3, -7), (1, -8), (3, -9)], [(1, -8), (2, -10), (3, -9)], [(-5, 3), (-3, 1), (0, -1), (3, -2), (6, -2), (8, -1), (9, 1), (9, 4), (8, 6), (5, 8), (1, 9), (-3, 9)], [(6, -2), (7, -1), (8, 1), (8, 4), (7, 6), (5, 8)], [(6, -9), (8, -7)], [(8, -11), (10, -9)]]),
-    (-14, 13, [[(-10, -6), (-8, -4), (-3, -6), (1, -7), (5, -7), (8, -6), (9, -5), (10, -3), (10, 0), (9, 2), (8, 3), (6, 4), (3, 5), (-2, 6)], [(-9, -5), (-3, -6)], [(5, -7), (7, -6), (8, -5), (9, -3), (9, 0), (8, 2), (6, 4)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-10, -9), (-8, -7), (-6, -7), (-2, -8), (3, -9), (7, -10), (9, -10), (10, -9)], [(-9, -8), (-2, -8)], [(3, -9), (10, -9)], [(7, -9), (4, -8), (1, -6), (-1, -3), (-2, 0), (-2, 3), (-1, 6), (0, 7), (2, 8), (6, 9), (9, 9)], [(-2, 3), (-1, 5), (0, 6), (2, 7), (6, 8), (8, 8), (9, 9)], [(8, -5), (10, -3)], [(10, -7), (12, -5)]]),
-    (-14, 13, [[(-3, -12), (-1, -11), (-1, -1)], [(-2, -11), (-2, -5), (-1, -1)], [(5, -4), (7, -2), (-1, -1)], [(6, -3), (2, -2), (-1, -1), (-4, 0), (-6, 1), (-7, 3), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (8, 9)], [(-6, 7), (-4, 8), (7, 8), (8, 9)], [(6, -9), (8, -7)], [(8, -11), (10, -9)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(3, -11), (5, -10), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -10), (5, -6)], [(4, 3), (9, 6), (9, 7)], [(-2, -5), (0, -4), (3, -4), (7, -5), (9, -6)], [(7, -5), (8, -7), (9, -6)], [(8, -11), (10, -9)], [(10, -13), (12, -11)]]),
-    (-14, 13, [[(-9, -11), (-8, -10), (-6, -9), (-2, -9)], [(-8, -10), (-3, -10), (-2, -9)], [(-2, -9), (-5, -7), (-7, -5), (-9, -2), (-10, 1), (-10, 4), (-9, 6), (-8, 7), (-6, 8), (-3, 8), (0, 7), (2, 5), (3, 3), (4, -1), (4, -5), (3, -9), (4, -9)], [(-10, 3), (-9, 5), (-8, 6), (-6, 7), (-3, 7), (0, 6), (2, 4), (3, 2), (4, -1)], [(4, -9), (6, -6), (7, -4), (9, -1), (10, 1), (8, 1), (7, 2)], [(3, -9), (6, -6)], [(7, -4), (8, -1), (8, 1)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-2, -12), (-1, -9), (1, -8)], [(-1, -10), (1, -9), (2, -9), (2, -8)], [(2, -8), (-1, -7), (-3, -6), (-4, -5), (-4, -3), (-3, -2), (-1, -1), (1, 0), (2, 1), (3, 3), (3, 5), (2, 7), (0, 8), (-2, 8), (-5, 7), (-7, 5)], [(-1, -1), (1, 1), (2, 3), (2, 5), (1, 7), (0, 8)], [(-9, 7), (-6, 4), (-3, 2), (0, 1)], [(4, 1), (7, 2), (9, 4), (10, 6), (7, 6)], [(-9, 7), (-9, 6), (-6, 4)], [(4, 1), (6, 2), (8, 4), (9, 6)], [(5, -9), (7, -7)], [(7, -11), (9, -9)]]),
-    (-14, 13, [[(-10, -2), (-8, 0), (-5, -5)], [(-9, -1), (-4, -6), (-2, -6), (3, -1), (7, 2), (9, 3), (10, 4), (8, 4), (6, 5)], [(3, -1), (8, 4)], [(3, -8), (5, -6)], [(5, -10), (7, -8)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(-1, -11), (1, -10), (3, -10), (7, -11)], [(3, -10), (5, -11), (6, -12), (7, -11)], [(-2, -3), (1, -2), (4, -2), (7, -3), (9, -4)], [(7, -3), (8, -5), (9, -4)], [(3, -10), (5, -9), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -9), (5, -5)], [(4, 3), (9, 6), (9, 7)], [(9, -9), (11, -7)], [(11, -11), (13, -9)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(3, -11), (5, -10), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -10), (5, -6)], [(4, 3), (9, 6), (9, 7)], [(-2, -5), (0, -4), (3, -4), (7, -5), (9, -6)], [(7, -5), (8, -7), (9, -6)], [(9, -13), (8, -12), (8, -10), (9, -9), (11, -9), (12, -10), (12, -12), (11, -13), (9, -13)]]),
-    (-14, 13, [[(-9, -11), (-8, -10), (-6, -9), (-2, -9)], [(-8, -10), (-3, -10), (-2, -9)], [(-2, -9), (-5, -7), (-7, -5), (-9, -2), (-10, 1), (-10, 4), (-9, 6), (-8, 7), (-6, 8), (-3, 8), (0, 7), (2, 5), (3, 3), (4, -1), (4, -5), (3, -9), (4, -9)], [(-10, 3), (-9, 5), (-8, 6), (-6, 7), (-3, 7), (0, 6), (2, 4), (3, 2), (4, -1)], [(4, -9), (6, -6), (7, -4), (9, -1), (10, 1), (8, 1), (7, 2)], [(3, -9), (6, -6)], [(7, -4), (8, -1), (8, 1)], [(8, -12), (7, -11), (7, -9), (8, -8), (10, -8), (11, -9), (11, -11), (10, -12), (8, -12)]]),
-    (-14, 13, [[(-2, -12), (-1, -9), (1, -8)], [(-1, -10), (1, -9), (2, -9), (2, -8)], [(2, -8), (-1, -7), (-3, -6), (-4, -5), (-4, -3), (-3, -2), (-1, -1), (1, 0), (2, 1), (3, 3), (3, 5), (2, 7), (0, 8), (-2, 8), (-5, 7), (-7, 5)], [(-1, -1), (1, 1), (2, 3), (2, 5), (1, 7), (0, 8)], [(-9, 7), (-6, 4), (-3, 2), (0, 1)], [(4, 1), (7, 2), (9, 4), (10, 6), (7, 6)], [(-9, 7), (-9, 6), (-6, 4)], [(4, 1), (6, 2), (8, 4), (9, 6)], [(6, -11), (5, -10), (5, -8), (6, -7), (8, -7), (9, -8), (9, -10), (8, -11), (6, -11)]]),
-    (-14, 13, [[(-10, -2), (-8, 0), (-5, -5)], [(-9, -1), (-4, -6), (-2, -6), (3, -1), (7, 2), (9, 3), (10, 4), (8, 4), (6, 5)], [(3, -1), (8, 4)], [(4, -10), (3, -9), (3, -7), (4, -6), (6, -6), (7, -7), (7, -9), (6, -10), (4, -10)]]),
-    (-14, 13, [[(-9, -11), (-7, -10), (-7, -8), (-8, -5), (-9, -1)], [(-8, -10), (-8, -7), (-9, -1), (-9, 3), (-8, 7), (-7, 8), (-7, 6), (-6, 2), (-5, -1)], [(-9, 3), (-8, 5), (-7, 6)], [(-1, -11), (1, -10), (3, -10), (7, -11)], [(3, -10), (5, -11), (6, -12), (7, -11)], [(-2, -3), (1, -2), (4, -2), (7, -3), (9, -4)], [(7, -3), (8, -5), (9, -4)], [(3, -10), (5, -9), (5, 5), (4, 7), (2, 8), (0, 8), (-2, 7), (-3, 5), (-2, 3), (0, 2), (2, 2), (4, 3), (9, 7)], [(4, -9), (5, -5)], [(4, 3), (9, 6), (9, 7)], [(10, -11), (9, -10), (9, -8), (10, -7), (12, -7), (13, -8), (13, -10), (12, -11), (10, -11)]]),
-    (-14, 13, [[(-10, -11), (-8, -9), (-3, -10), (3, -11), (8, -12), (10, -10)], [(-9, -10), (-3, -10)], [(3, -11), (9, -11)], [(10, -10), (8, -8), (4, -5), (2, -4)], [(9, -11), (7, -8), (5, -6), (2, -4)], [(0, -5), (2, -4), (2, -1), (1, 3), (-1, 6), (-4, 9)], [(0, -5), (1, -4), (1, -1), (0, 3), (-2, 7)]]),
-    (-14, 13, [[(4, -12), (6, -10), (3, -6), (0, -3), (-4, 0), (-7, 2)], [(5, -11), (4, -9), (1, -5), (-3, -1), (-7, 2)], [(1, -4), (3, -3), (3, 10)], [(1, -4), (2, -3), (2, 9), (3, 10)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, -9), (0, -7)], [(-2, -12), (0, -11), (0, -7)], [(-8, -9), (-7, -7), (-7, -2), (-6, -1)], [(-6, -7), (-6, -1)], [(-6, -7), (7, -7)], [(-8, -9), (-7, -8), (-3, -7)], [(3, -7), (6, -8), (8, -6)], [(8, -6), (5, 0), (3, 3), (0, 6), (-3, 8), (-5, 9)], [(7, -7), (6, -4), (4, 0), (1, 4), (-2, 7), (-5, 9)]]),
-    (-14, 13, [[(-1, -7), (1, -6), (1, 5)], [(0, -6), (0, 5)], [(-8, -8), (-6, -6), (6, -8), (8, -7)], [(-7, -7), (8, -7)], [(-10, 4), (-8, 6), (8, 4), (10, 5)], [(-9, 5), (10, 5)]]),
-    (-14, 13, [[(0, -12), (3, -11), (3, 7), (2, 9), (1, 7), (-2, 5)], [(2, -11), (2, 6), (1, 7)], [(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -6)], [(-9, -5), (-3, -5)], [(3, -6), (10, -6)], [(1, -5), (-2, -1), (-6, 3), (-10, 6)], [(2, -5), (0, -2), (-3, 1), (-7, 4), (-10, 6)]]),
-    (-14, 13, [[(-1, -12), (1, -10), (0, -7), (-2, -2), (-4, 2), (-6, 5), (-9, 9)], [(0, -11), (-1, -8), (-3, -2), (-5, 3), (-9, 9)], [(-9, -6), (-7, -4), (-3, -5), (2, -6), (6, -7), (8, -5)], [(-8, -5), (-3, -5)], [(2, -6), (7, -6)], [(8, -5), (7, 1), (6, 5), (5, 7), (3, 9), (2, 8), (0, 7)], [(7, -6), (6, 1), (5, 5), (4, 7), (2, 8)]]),
-    (-14, 13, [[(-3, -12), (0, -11), (2, 9)], [(-1, -11), (1, 10), (2, 9)], [(-8, -6), (-6, -4), (-2, -5), (2, -6), (6, -7), (8, -6)], [(-7, -5), (-2, -5)], [(2, -6), (8, -6)], [(-10, 0), (-8, 2), (-3, 1), (3, 0), (8, -1), (10, 0)], [(-9, 1), (-3, 1)], [(3, 0), (10, 0)]]),
-    (-14, 13, [[(-2, -12), (0, -10), (-2, -6), (-4, -3), (-6, -1), (-8, 1)], [(-1, -11), (-2, -8), (-4, -4), (-6, -1)], [(-1, -8), (1, -7), (6, -7)], [(3, -7), (5, -8), (7, -6)], [(7, -6), (4, 0), (1, 4), (-2, 7), (-5, 9), (-7, 10)], [(6, -7), (5, -4), (3, 0), (0, 4), (-3, 7), (-7, 10)]]),
-    (-14, 13, [[(-4, -12), (-2, -10), (-4, -6), (-6, -3), (-8, -1), (-10, 1)], [(-3, -11), (-4, -8), (-6, -4), (-8, -1)], [(-6, -3), (2, -4), (7, -5), (10, -4)], [(2, -4), (10, -4)], [(0, -3), (2, -1), (0, 3), (-2, 6), (-4, 8), (-6, 10)], [(1, -2), (0, 1), (-2, 5), (-4, 8)]]),
-    (-14, 13, [[(-8, -8), (-6, -6), (6, -8), (8, -6)], [(-7, -7), (7, -7)], [(8, -6), (7, -3), (6, 4)], [(7, -7), (6, -2), (6, 4)], [(-8, 4), (-6, 6), (6, 4), (7, 5)], [(-7, 5), (7, 5)]]),
-    (-14, 13, [[(-6, -9), (-4, -8), (-4, -3), (-5, 1)], [(-5, -8), (-5, 1)], [(2, -12), (5, -11), (5, -6), (4, -1), (3, 2), (2, 4), (0, 7), (-2, 9)], [(4, -11), (4, -6), (3, -1), (2, 3), (0, 7)], [(-10, -5), (-8, -3), (-3, -4), (3, -5), (8, -6), (10, -5)], [(-9, -4), (-3, -4)], [(3, -5), (10, -5)]]),
-    (-14, 13, [[(-5, -11), (-3, -10), (-2, -9), (-2, -8), (-3, -8), (-4, -10), (-5, -11)], [(-10, -4), (-8, -3), (-7, -2), (-7, -1), (-8, -1), (-9, -3), (-10, -4)], [(-9, 6), (-7, 8), (-3, 6), (1, 3), (5, -1), (9, -6)], [(-8, 7), (-3, 5), (1, 2), (9, -6)]]),
-    (-14, 13, [[(-8, -9), (-6, -7), (5, -9), (7, -7)], [(-7, -8), (6, -8)], [(7, -7), (5, -4), (2, -1), (-1, 1), (-3, 2), (-8, 4)], [(6, -8), (5, -6), (3, -3), (1, -1), (-2, 1), (-8, 4)], [(3, 1), (6, 3), (8, 5), (8, 6), (7, 6), (6, 4), (3, 1)]]),
-    (-14, 13, [[(-3, -11), (0, -10), (0, -8), (-1, 1)], [(-1, -10), (-1, 4), (0, 6), (2, 7), (9, 7)], [(4, 7), (8, 6), (9, 7)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -3)], [(-9, -3), (-3, -3)], [(3, -4), (9, -4)], [(10, -3), (7, -1), (4, 2)], [(9, -4), (4, 2)]]),
-    (-14, 13, [[(-9, -9), (-7, -8), (-6, -7), (-6, -6), (-7, -6), (-8, -8), (-9, -9)], [(6, -10), (8, -8), (5, -2), (2, 2), (-1, 5), (-4, 7), (-6, 8)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-6, 8)]]),
-    (-14, 13, [[(-2, -12), (0, -10), (-2, -6), (-4, -3), (-6, -1), (-8, 1)], [(-1, -11), (-2, -8), (-4, -4), (-6, -1)], [(-1, -8), (1, -7), (6, -7)], [(3, -7), (5, -8), (7, -6)], [(7, -6), (4, 0), (1, 4), (-2, 7), (-5, 9), (-7, 10)], [(6, -7), (5, -4), (3, 0), (0, 4), (-3, 7), (-7, 10)], [(-4, -2), (-1, -1), (1, 0), (4, 2), (5, 3), (5, 4), (4, 4), (3, 2), (1, 0)]]),
-    (-14, 13, [[(-6, -8), (-3, -8), (2, -9), (6, -11)], [(-3, -8), (0, -9), (2, -10), (5, -12), (6, -11)], [(-2, -8), (1, -7), (1, -1), (0, 3), (-2, 6), (-5, 9)], [(0, -7), (0, -1), (-1, 3), (-3, 7)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -4)], [(-9, -3), (-3, -3)], [(3, -4), (10, -4)]]),
-    (-14, 13, [[(-9, -9), (-7, -8), (-6, -7), (-6, -6), (-7, -6), (-8, -8), (-9, -9)], [(-3, -10), (-1, -9), (0, -8), (0, -7), (-1, -7), (-2, -9), (-3, -10)], [(6, -10), (8, -8), (5, -2), (2, 2), (-1, 5), (-4, 7), (-6, 8)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-6, 8)]]),
-    (-14, 13, [[(-6, -12), (-4, -10), (5, -12), (6, -11)], [(-5, -11), (6, -11)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -4)], [(-9, -3), (-3, -3)], [(3, -4), (10, -4)], [(1, -3), (1, -1), (0, 3), (-2, 6), (-5, 9)], [(0, -3), (0, -1), (-1, 3), (-3, 7)]]),
-    (-14, 13, [[(-5, -12), (-2, -11), (-2, 10)], [(-3, -11), (-3, 9), (-2, 10)], [(-2, -3), (0, -3), (3, -2), (4, -1), (4, 0), (3, 0), (2, -2), (0, -3)]]),
-    (-14, 13, [[(-1, -12), (2, -11), (2, -6), (1, -1), (0, 2), (-1, 4), (-3, 7), (-5, 9)], [(1, -11), (1, -6), (0, -1), (-1, 3), (-3, 7)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -4)], [(-9, -3), (-3, -3)], [(3, -4), (10, -4)]]),
-    (-14, 13, [[(-6, -8), (-4, -6), (5, -8), (6, -7)], [(-5, -7), (6, -7)], [(-10, 4), (-8, 6), (8, 4), (10, 5)], [(-9, 5), (10, 5)]]),
-    (-14, 13, [[(-8, -9), (-6, -7), (5, -9), (7, -7)], [(-7, -8), (6, -8)], [(7, -7), (5, -4), (2, -1), (-1, 1), (-3, 2), (-8, 4)], [(6, -8), (5, -6), (3, -3), (1, -1), (-2, 1), (-8, 4)], [(-5, -3), (-2, -2), (2, 0), (5, 2), (7, 4), (7, 5), (6, 5), (4, 2), (2, 0)]]),
-    (-14, 13, [[(-2, -12), (0, -11), (1, -10), (1, -9), (0, -9), (-1, -11), (-2, -12)], [(-8, -6), (-6, -4), (4, -6), (6, -4)], [(-7, -5), (5, -5)], [(6, -4), (2, 0), (-1, 2), (-3, 3), (-8, 5)], [(5, -5), (3, -2), (1, 0), (-2, 2), (-8, 5)], [(0, 1), (1, 2), (1, 10)], [(0, 1), (0, 9), (1, 10)], [(6, 3), (8, 4), (9, 5), (9, 6), (8, 6), (7, 4), (6, 3)]]),
-    (-14, 13, [[(5, -10), (7, -8), (4, -2), (1, 2), (-2, 5), (-5, 7), (-7, 8)], [(6, -9), (5, -6), (2, -1), (-1, 3), (-4, 6), (-7, 8)]]),
-    (-14, 13, [[(-6, -6), (-4, -4), (-5, -1), (-6, 1), (-8, 3), (-10, 4)], [(-5, -5), (-6, -1), (-8, 3)], [(4, -6), (6, -4), (8, -1), (10, 3), (10, 4), (9, 4), (8, 0), (6, -4)]]),
-    (-14, 13, [[(-9, -11), (-6, -10), (-6, -8), (-7, 1)], [(-7, -10), (-7, 4), (-6, 6), (-4, 7), (7, 7)], [(-1, 7), (3, 6), (5, 6), (7, 7)], [(-7, 0), (-3, -1), (0, -2), (6, -4)], [(0, -2), (4, -4), (6, -4)]]),
-    (-14, 13, [[(-8, -11), (-6, -9), (7, -9)], [(-7, -10), (-3, -9)], [(3, -9), (6, -10), (8, -8)], [(8, -8), (5, -2), (3, 1), (0, 4), (-3, 6), (-5, 7)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-5, 7)]]),
-    (-14, 13, [[(-11, -1), (-9, 1), (-2, -6), (-1, -6), (9, 4)], [(-10, 0), (-8, -1), (-4, -4)], [(3, -2), (8, 2), (10, 3), (9, 4)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, 7), (0, 9), (-1, 7), (-3, 6)], [(0, -11), (0, 6), (-1, 7)], [(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -6)], [(-9, -5), (-3, -5)], [(3, -6), (10, -6)], [(-6, 1), (-8, 4), (-9, 5), (-10, 5), (-10, 4), (-8, 3), (-6, 1)], [(6, 1), (9, 3), (10, 4), (10, 5), (9, 5), (8, 3), (6, 1)]]),
-    (-14, 13, [[(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -5)], [(-9, -5), (-3, -5)], [(3, -6), (9, -6)], [(10, -5), (8, -3), (4, 0), (2, 1)], [(9, -6), (7, -3), (5, -1), (2, 1)], [(-1, 0), (2, 2), (4, 4), (4, 5), (3, 5), (2, 3), (-1, 0)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (3, -10), (4, -9), (4, -8), (3, -8), (1, -10), (-2, -12)], [(-5, -5), (-2, -4), (0, -3), (1, -2), (1, -1), (0, -1), (-2, -3), (-5, -5)], [(-4, 4), (1, 6), (3, 7), (4, 8), (4, 9), (3, 9), (1, 7), (-2, 5), (-4, 4)]]),
-    (-14, 13, [[(0, -9), (2, -7), (-5, 5)], [(1, -8), (-5, 5)], [(-10, 5), (-8, 7), (7, 4)], [(-9, 6), (7, 4)], [(4, 1), (6, 3), (8, 6), (9, 6), (9, 5), (7, 3), (4, 1)]]),
-    (-14, 13, [[(5, -10), (7, -8), (4, -2), (1, 2), (-2, 5), (-5, 7), (-7, 8)], [(6, -9), (5, -6), (3, -2), (0, 2), (-3, 5), (-7, 8)], [(-3, -4), (1, -2), (4, 0), (6, 2), (6, 3), (5, 3), (4, 1), (2, -1), (-1, -3)]]),
-    (-14, 13, [[(-6, -9), (-4, -7), (5, -9), (6, -8)], [(-5, -8), (6, -8)], [(-1, -7), (-1, 4), (0, 6), (2, 7), (9, 7)], [(0, -7), (0, -5), (-1, 1)], [(4, 7), (8, 6), (9, 7)], [(-10, -1), (-8, 1), (-3, 0), (3, -1), (8, -2), (10, -1)], [(-9, 0), (-3, 0)], [(3, -1), (10, -1)]]),
-    (-14, 13, [[(-3, -12), (0, -11), (2, 9)], [(-1, -11), (1, 10), (2, 9)], [(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -5)], [(-9, -5), (-3, -5)], [(3, -6), (9, -6)], [(10, -5), (7, -2), (4, 0), (2, 1)], [(9, -6), (8, -4), (5, -1), (2, 1)]]),
-    (-14, 13, [[(4, -12), (6, -10), (3, -6), (0, -3), (-4, 0), (-7, 2)], [(5, -11), (4, -9), (1, -5), (-3, -1), (-7, 2)], [(1, -4), (3, -3), (3, 10)], [(1, -4), (2, -3), (2, 9), (3, 10)]]),
-    (-14, 13, [[(-9, -8), (-7, -6), (3, -8), (5, -6)], [(-8, -7), (4, -7)], [(5, -6), (4, -3), (3, 4)], [(4, -7), (3, -2), (3, 4)], [(-10, 4), (-8, 6), (8, 4), (10, 5)], [(-9, 5), (10, 5)]]),
-    (-14, 13, [[(-1, -7), (1, -6), (1, 5)], [(0, -6), (0, 5)], [(-8, -8), (-6, -6), (6, -8), (8, -7)], [(-7, -7), (8, -7)], [(-10, 4), (-8, 6), (8, 4), (10, 5)], [(-9, 5), (10, 5)]]),
-    (-14, 13, [[(-8, -8), (-6, -6), (6, -8), (8, -6)], [(-7, -7), (7, -7)], [(-8, -2), (-6, 0), (6, -2)], [(-7, -1), (6, -1)], [(-8, 4), (-6, 6), (6, 4)], [(-7, 5), (6, 5)], [(8, -6), (7, -3), (7, 7)], [(7, -7), (6, -2), (6, 7)]]),
-    (-14, 13, [[(-6, -12), (-4, -10), (5, -12), (6, -11)], [(-5, -11), (6, -11)], [(-8, -5), (-6, -3), (5, -5), (7, -3)], [(-7, -4), (6, -4)], [(7, -3), (5, 0), (2, 3), (-1, 5), (-3, 6), (-6, 7)], [(6, -4), (5, -2), (3, 1), (1, 3), (-2, 5), (-6, 7)]]),
-    (-14, 13, [[(-6, -9), (-4, -8), (-4, -3), (-5, 1)], [(-5, -8), (-5, 1)], [(2, -12), (5, -11), (5, -1), (4, 3), (2, 6), (-1, 9)], [(4, -11), (4, -1), (3, 3), (2, 5), (-1, 9)]]),
-    (-14, 13, [[(-6, -8), (-4, -7), (-4, -4), (-5, 0), (-7, 3), (-10, 6)], [(-5, -7), (-5, -4), (-6, 0), (-7, 2), (-10, 6)], [(-1, -9), (1, -8), (1, -5), (0, 1)], [(0, -8), (0, 4), (1, 6), (3, 6), (5, 5), (7, 3), (10, -1)], [(0, 4), (1, 5), (4, 5), (6, 4)]]),
-    (-14, 13, [[(-10, -9), (-7, -8), (-7, -5), (-8, 1)], [(-8, -8), (-8, 4), (-7, 6), (-4, 6), (-1, 5), (2, 3), (6, 0), (9, -3)], [(-8, 4), (-7, 5), (-4, 5), (-1, 4), (3, 2), (6, 0)]]),
-    (-14, 13, [[(-8, -8), (-6, -6), (6, -8), (8, -6)], [(-7, -7), (7, -7)], [(-7, -7), (-7, 8)], [(-6, -6), (-6, 6), (-7, 8)], [(8, -6), (7, -3), (6, 4)], [(7, -7), (6, -2), (6, 4)], [(-6, 6), (6, 4), (7, 5)], [(-6, 5), (7, 5)]]),
-    (-14, 13, [[(-8, -11), (-7, -9), (-7, -4), (-6, -3)], [(-6, -9), (-6, -3)], [(-6, -9), (7, -9)], [(-8, -11), (-7, -10), (-3, -9)], [(3, -9), (6, -10), (8, -8)], [(8, -8), (5, -2), (3, 1), (0, 4), (-3, 6), (-5, 7)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-5, 7)]]),
-    (-14, 13, [[(-1, -12), (2, -11), (2, 9)], [(1, -11), (1, 10), (2, 9)], [(-8, -8), (-6, -6), (6, -8), (8, -7)], [(-7, -7), (8, -7)], [(-6, -6), (-4, -5), (-4, 0)], [(-5, -5), (-5, 0)], [(-10, -1), (-8, 1), (8, -1), (10, 0)], [(-9, 0), (10, 0)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, -9), (0, -7)], [(-2, -12), (0, -11), (0, -7)], [(-8, -9), (-7, -7), (-7, -2), (-6, -1)], [(-6, -7), (-6, -1)], [(-6, -7), (7, -7)], [(-8, -9), (-7, -8), (-3, -7)], [(3, -7), (6, -8), (8, -6)], [(8, -6), (5, 0), (3, 3), (0, 6), (-3, 8), (-5, 9)], [(7, -7), (6, -4), (4, 0), (1, 4), (-2, 7), (-5, 9)]]),
-    (-14, 13, [[(-8, -8), (-6, -6), (6, -8), (8, -6)], [(-7, -7), (7, -7)], [(8, -6), (5, -4), (1, -1)], [(7, -7), (1, -1)], [(-1, -2), (1, -1), (1, 5)], [(0, -1), (0, 5)], [(-10, 4), (-8, 6), (8, 4), (10, 5)], [(-9, 5), (10, 5)]]),
-    (-14, 13, [[(-8, -11), (-6, -9), (7, -9)], [(-7, -10), (-3, -9)], [(3, -9), (6, -10), (8, -8)], [(-6, -4), (-4, -2), (4, -3)], [(-5, -3), (4, -3)], [(8, -8), (5, -2), (3, 1), (0, 4), (-3, 6), (-5, 7)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-5, 7)]]),
-    (-14, 13, [[(-8, -10), (-6, -9), (-5, -8), (-5, -7), (-6, -7), (-7, -9), (-8, -10)], [(-9, 5), (-7, 7), (-3, 5), (1, 2), (5, -2), (9, -7)], [(-8, 6), (-3, 4), (1, 1), (9, -7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-10, 7), (-11, 8), (-10, 9), (-9, 8), (-10, 7)]]),
-    (-14, 13, [[(-1, -12), (1, -10), (0, -7), (-2, -2), (-4, 2), (-6, 5), (-9, 9)], [(0, -11), (-1, -8), (-3, -2), (-5, 3), (-9, 9)], [(-9, -6), (-7, -4), (-3, -5), (2, -6), (6, -7), (8, -5)], [(-8, -5), (-3, -5)], [(2, -6), (7, -6)], [(8, -5), (7, 1), (6, 5), (5, 7), (3, 9), (2, 8), (0, 7)], [(7, -6), (6, 1), (5, 5), (4, 7), (2, 8)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-3, -12), (0, -11), (2, 9)], [(-1, -11), (1, 10), (2, 9)], [(-8, -6), (-6, -4), (-2, -5), (2, -6), (6, -7), (8, -6)], [(-7, -5), (-2, -5)], [(2, -6), (8, -6)], [(-10, 0), (-8, 2), (-3, 1), (3, 0), (8, -1), (10, 0)], [(-9, 1), (-3, 1)], [(3, 0), (10, 0)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-2, -12), (0, -10), (-2, -6), (-4, -3), (-6, -1), (-8, 1)], [(-1, -11), (-2, -8), (-4, -4), (-6, -1)], [(-1, -8), (1, -7), (6, -7)], [(3, -7), (5, -8), (7, -6)], [(7, -6), (4, 0), (1, 4), (-2, 7), (-5, 9), (-7, 10)], [(6, -7), (5, -4), (3, 0), (0, 4), (-3, 7), (-7, 10)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-4, -12), (-2, -10), (-4, -6), (-6, -3), (-8, -1), (-10, 1)], [(-3, -11), (-4, -8), (-6, -4), (-8, -1)], [(-6, -3), (2, -4), (7, -5), (10, -4)], [(2, -4), (10, -4)], [(0, -3), (2, -1), (0, 3), (-2, 6), (-4, 8), (-6, 10)], [(1, -2), (0, 1), (-2, 5), (-4, 8)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-8, -8), (-6, -6), (6, -8), (8, -6)], [(-7, -7), (7, -7)], [(8, -6), (7, -3), (6, 4)], [(7, -7), (6, -2), (6, 4)], [(-8, 4), (-6, 6), (6, 4), (7, 5)], [(-7, 5), (7, 5)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-6, -9), (-4, -8), (-4, -3), (-5, 1)], [(-5, -8), (-5, 1)], [(2, -12), (5, -11), (5, -6), (4, -1), (3, 2), (2, 4), (0, 7), (-2, 9)], [(4, -11), (4, -6), (3, -1), (2, 3), (0, 7)], [(-10, -5), (-8, -3), (-3, -4), (3, -5), (8, -6), (10, -5)], [(-9, -4), (-3, -4)], [(3, -5), (10, -5)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-5, -11), (-3, -10), (-2, -9), (-2, -8), (-3, -8), (-4, -10), (-5, -11)], [(-10, -4), (-8, -3), (-7, -2), (-7, -1), (-8, -1), (-9, -3), (-10, -4)], [(-9, 6), (-7, 8), (-3, 6), (1, 3), (5, -1), (9, -6)], [(-8, 7), (-3, 5), (1, 2), (9, -6)], [(4, -10), (6, -8)], [(6, -12), (8, -10)]]),
-    (-14, 13, [[(-8, -9), (-6, -7), (5, -9), (7, -7)], [(-7, -8), (6, -8)], [(7, -7), (5, -4), (2, -1), (-1, 1), (-3, 2), (-8, 4)], [(6, -8), (5, -6), (3, -3), (1, -1), (-2, 1), (-8, 4)], [(3, 1), (6, 3), (8, 5), (8, 6), (7, 6), (6, 4), (3, 1)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-3, -11), (0, -10), (0, -8), (-1, 1)], [(-1, -10), (-1, 4), (0, 6), (2, 7), (9, 7)], [(4, 7), (8, 6), (9, 7)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -3)], [(-9, -3), (-3, -3)], [(3, -4), (9, -4)], [(10, -3), (7, -1), (4, 2)], [(9, -4), (4, 2)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-9, -9), (-7, -8), (-6, -7), (-6, -6), (-7, -6), (-8, -8), (-9, -9)], [(6, -10), (8, -8), (5, -2), (2, 2), (-1, 5), (-4, 7), (-6, 8)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-6, 8)], [(9, -11), (11, -9)], [(11, -13), (13, -11)]]),
-    (-14, 13, [[(-2, -12), (0, -10), (-2, -6), (-4, -3), (-6, -1), (-8, 1)], [(-1, -11), (-2, -8), (-4, -4), (-6, -1)], [(-1, -8), (1, -7), (6, -7)], [(3, -7), (5, -8), (7, -6)], [(7, -6), (4, 0), (1, 4), (-2, 7), (-5, 9), (-7, 10)], [(6, -7), (5, -4), (3, 0), (0, 4), (-3, 7), (-7, 10)], [(-4, -2), (-1, -1), (1, 0), (4, 2), (5, 3), (5, 4), (4, 4), (3, 2), (1, 0)], [(7, -10), (9, -8)], [(9, -12), (11, -10)]]),
-    (-14, 13, [[(-6, -8), (-3, -8), (2, -9), (6, -11)], [(-3, -8), (0, -9), (2, -10), (5, -12), (6, -11)], [(-2, -8), (1, -7), (1, -1), (0, 3), (-2, 6), (-5, 9)], [(0, -7), (0, -1), (-1, 3), (-3, 7)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -4)], [(-9, -3), (-3, -3)], [(3, -4), (10, -4)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-9, -9), (-7, -8), (-6, -7), (-6, -6), (-7, -6), (-8, -8), (-9, -9)], [(-3, -10), (-1, -9), (0, -8), (0, -7), (-1, -7), (-2, -9), (-3, -10)], [(6, -10), (8, -8), (5, -2), (2, 2), (-1, 5), (-4, 7), (-6, 8)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-6, 8)], [(9, -11), (11, -9)], [(11, -13), (13, -11)]]),
-    (-14, 13, [[(-6, -12), (-4, -10), (5, -12), (6, -11)], [(-5, -11), (6, -11)], [(-10, -4), (-8, -2), (-3, -3), (3, -4), (8, -5), (10, -4)], [(-9, -3), (-3, -3)], [(3, -4), (10, -4)], [(1, -3), (1, -1), (0, 3), (-2, 6), (-5, 9)], [(0, -3), (0, -1), (-1, 3), (-3, 7)], [(8, -10), (10, -8)], [(10, -12), (12, -10)]]),
-    (-14, 13, [[(-5, -12), (-2, -11), (-2, 10)], [(-3, -11), (-3, 9), (-2, 10)], [(-2, -3), (0, -3), (3, -2), (4, -1), (4, 0), (3, 0), (2, -2), (0, -3)], [(2, -10), (4, -8)], [(4, -12), (6, -10)]]),
-    (-14, 13, [[(-6, -6), (-4, -4), (-5, -1), (-6, 1), (-8, 3), (-10, 4)], [(-5, -5), (-6, -1), (-8, 3)], [(4, -6), (6, -4), (8, -1), (10, 3), (10, 4), (9, 4), (8, 0), (6, -4)], [(7, -9), (9, -7)], [(9, -11), (11, -9)]]),
-    (-14, 13, [[(-9, -11), (-6, -10), (-6, -8), (-7, 1)], [(-7, -10), (-7, 4), (-6, 6), (-4, 7), (7, 7)], [(-1, 7), (3, 6), (5, 6), (7, 7)], [(-7, 0), (-3, -1), (0, -2), (6, -4)], [(0, -2), (4, -4), (6, -4)], [(7, -9), (9, -7)], [(9, -11), (11, -9)]]),
-    (-14, 13, [[(-8, -11), (-6, -9), (7, -9)], [(-7, -10), (-3, -9)], [(3, -9), (6, -10), (8, -8)], [(8, -8), (5, -2), (3, 1), (0, 4), (-3, 6), (-5, 7)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-5, 7)], [(9, -11), (11, -9)], [(11, -13), (13, -11)]]),
-    (-14, 13, [[(-11, -1), (-9, 1), (-2, -6), (-1, -6), (9, 4)], [(-10, 0), (-8, -1), (-4, -4)], [(3, -2), (8, 2), (10, 3), (9, 4)], [(4, -8), (6, -6)], [(6, -10), (8, -8)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, 7), (0, 9), (-1, 7), (-3, 6)], [(0, -11), (0, 6), (-1, 7)], [(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -6)], [(-9, -5), (-3, -5)], [(3, -6), (10, -6)], [(-6, 1), (-8, 4), (-9, 5), (-10, 5), (-10, 4), (-8, 3), (-6, 1)], [(6, 1), (9, 3), (10, 4), (10, 5), (9, 5), (8, 3), (6, 1)], [(8, -11), (10, -9)], [(10, -13), (12, -11)]]),
-    (-14, 13, [[(-6, -6), (-4, -4), (-5, -1), (-6, 1), (-8, 3), (-10, 4)], [(-5, -5), (-6, -1), (-8, 3)], [(4, -6), (6, -4), (8, -1), (10, 3), (10, 4), (9, 4), (8, 0), (6, -4)], [(8, -11), (7, -10), (7, -8), (8, -7), (10, -7), (11, -8), (11, -10), (10, -11), (8, -11)]]),
-    (-14, 13, [[(-9, -11), (-6, -10), (-6, -8), (-7, 1)], [(-7, -10), (-7, 4), (-6, 6), (-4, 7), (7, 7)], [(-1, 7), (3, 6), (5, 6), (7, 7)], [(-7, 0), (-3, -1), (0, -2), (6, -4)], [(0, -2), (4, -4), (6, -4)], [(8, -11), (7, -10), (7, -8), (8, -7), (10, -7), (11, -8), (11, -10), (10, -11), (8, -11)]]),
-    (-14, 13, [[(-8, -11), (-6, -9), (7, -9)], [(-7, -10), (-3, -9)], [(3, -9), (6, -10), (8, -8)], [(8, -8), (5, -2), (3, 1), (0, 4), (-3, 6), (-5, 7)], [(7, -9), (6, -6), (4, -2), (1, 2), (-2, 5), (-5, 7)], [(10, -13), (9, -12), (9, -10), (10, -9), (12, -9), (13, -10), (13, -12), (12, -13), (10, -13)]]),
-    (-14, 13, [[(-11, -1), (-9, 1), (-2, -6), (-1, -6), (9, 4)], [(-10, 0), (-8, -1), (-4, -4)], [(3, -2), (8, 2), (10, 3), (9, 4)], [(5, -10), (4, -9), (4, -7), (5, -6), (7, -6), (8, -7), (8, -9), (7, -10), (5, -10)]]),
-    (-14, 13, [[(-2, -12), (1, -11), (1, 7), (0, 9), (-1, 7), (-3, 6)], [(0, -11), (0, 6), (-1, 7)], [(-10, -6), (-8, -4), (-3, -5), (3, -6), (8, -7), (10, -6)], [(-9, -5), (-3, -5)], [(3, -6), (10, -6)], [(-6, 1), (-8, 4), (-9, 5), (-10, 5), (-10, 4), (-8, 3), (-6, 1)], [(6, 1), (9, 3), (10, 4), (10, 5), (9, 5), (8, 3), (6, 1)], [(9, -13), (8, -12), (8, -10), (9, -9), (11, -9), (12, -10), (12, -12), (11, -13), (9, -13)]]),
-]
-
-MARKERS = [
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6), (1, -7), (-1, -7)]]),
-    (-6, 6, [[(-6, -6), (-6, 6), (6, 6), (6, -6), (-6, -6)]]),
-    (-7, 7, [[(0, -8), (-7, 4), (7, 4), (0, -8)]]),
-    (-6, 6, [[(0, -10), (-6, 0), (0, 10), (6, 0), (0, -10)]]),
-    (-8, 8, [[(0, -9), (-2, -3), (-8, -3), (-3, 1), (-5, 7), (0, 3), (5, 7), (3, 1), (8, -3), (2, -3), (0, -9)]]),
-    (-6, 6, [[(-2, -6), (-2, -2), (-6, -2), (-6, 2), (-2, 2), (-2, 6), (2, 6), (2, 2), (6, 2), (6, -2), (2, -2), (2, -6), (-2, -6)]]),
-    (-7, 7, [[(0, -7), (0, 7)], [(-7, 0), (7, 0)]]),
-    (-5, 5, [[(-5, -5), (5, 5)], [(5, -5), (-5, 5)]]),
-    (-5, 5, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-4, 4, [[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)], [(-3, -1), (-3, 1)], [(-2, -2), (-2, 2)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -2), (2, 2)], [(3, -1), (3, 1)]]),
-    (-4, 4, [[(-4, -4), (-4, 4), (4, 4), (4, -4), (-4, -4)], [(-3, -3), (-3, 3)], [(-2, -3), (-2, 3)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -3), (2, 3)], [(3, -3), (3, 3)]]),
-    (-5, 5, [[(0, -6), (-5, 3), (5, 3), (0, -6)], [(0, -3), (-3, 2)], [(0, -3), (3, 2)], [(0, 0), (-1, 2)], [(0, 0), (1, 2)]]),
-    (-6, 3, [[(-6, 0), (3, 5), (3, -5), (-6, 0)], [(-3, 0), (2, 3)], [(-3, 0), (2, -3)], [(0, 0), (2, 1)], [(0, 0), (2, -1)]]),
-    (-5, 5, [[(0, 6), (5, -3), (-5, -3), (0, 6)], [(0, 3), (3, -2)], [(0, 3), (-3, -2)], [(0, 0), (1, -2)], [(0, 0), (-1, -2)]]),
-    (-3, 6, [[(6, 0), (-3, -5), (-3, 5), (6, 0)], [(3, 0), (-2, -3)], [(3, 0), (-2, 3)], [(0, 0), (-2, -1)], [(0, 0), (-2, 1)]]),
-    (-14, 14, [[(-14, 0), (14, 0)], [(-14, 0), (0, 16)], [(14, 0), (0, 16)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-7, 7, [[(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6), (1, -7), (-1, -7)]]),
-    (-6, 6, [[(-6, -6), (-6, 6), (6, 6), (6, -6), (-6, -6)]]),
-    (-7, 7, [[(0, -8), (-7, 4), (7, 4), (0, -8)]]),
-    (-6, 6, [[(0, -10), (-6, 0), (0, 10), (6, 0), (0, -10)]]),
-    (-8, 8, [[(0, -9), (-2, -3), (-8, -3), (-3, 1), (-5, 7), (0, 3), (5, 7), (3, 1), (8, -3), (2, -3), (0, -9)]]),
-    (-6, 6, [[(-2, -6), (-2, -2), (-6, -2), (-6, 2), (-2, 2), (-2, 6), (2, 6), (2, 2), (6, 2), (6, -2), (2, -2), (2, -6), (-2, -6)]]),
-    (-7, 7, [[(0, -7), (0, 7)], [(-7, 0), (7, 0)]]),
-    (-5, 5, [[(-5, -5), (5, 5)], [(5, -5), (-5, 5)]]),
-    (-5, 5, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-4, 4, [[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)], [(-3, -1), (-3, 1)], [(-2, -2), (-2, 2)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -2), (2, 2)], [(3, -1), (3, 1)]]),
-    (-4, 4, [[(-4, -4), (-4, 4), (4, 4), (4, -4), (-4, -4)], [(-3, -3), (-3, 3)], [(-2, -3), (-2, 3)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -3), (2, 3)], [(3, -3), (3, 3)]]),
-    (-5, 5, [[(0, -6), (-5, 3), (5, 3), (0, -6)], [(0, -3), (-3, 2)], [(0, -3), (3, 2)], [(0, 0), (-1, 2)], [(0, 0), (1, 2)]]),
-    (-6, 3, [[(-6, 0), (3, 5), (3, -5), (-6, 0)], [(-3, 0), (2, 3)], [(-3, 0), (2, -3)], [(0, 0), (2, 1)], [(0, 0), (2, -1)]]),
-    (-5, 5, [[(0, 6), (5, -3), (-5, -3), (0, 6)], [(0, 3), (3, -2)], [(0, 3), (-3, -2)], [(0, 0), (1, -2)], [(0, 0), (-1, -2)]]),
-    (-3, 6, [[(6, 0), (-3, -5), (-3, 5), (6, 0)], [(3, 0), (-2, -3)], [(3, 0), (-2, 3)], [(0, 0), (-2, -1)], [(0, 0), (-2, 1)]]),
-    (-14, 14, [[(-14, 0), (14, 0)], [(-14, 0), (0, 16)], [(14, 0), (0, 16)]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-    (-8, 8, [[]]),
-]
-
-MATHLOW = [
-    (-8, 8, [[]]),
-    (-12, 12, [[(0, -8), (0, 9)], [(-8, 0), (8, 0)], [(-8, 9), (8, 9)]]),
-    (-12, 12, [[(0, -8), (0, 9)], [(-8, -8), (8, -8)], [(-8, 0), (8, 0)]]),
-    (-11, 11, [[(-7, -7), (7, 7)], [(7, -7), (-7, 7)]]),
-    (-2, 3, [[(0, -1), (0, 0), (1, 0), (1, -1), (0, -1)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 12, [[(8, -12), (-8, -5), (8, 2)], [(-8, 4), (8, 4)], [(-8, 9), (8, 9)]]),
-    (-12, 12, [[(-8, -12), (8, -5), (-8, 2)], [(-8, 4), (8, 4)], [(-8, 9), (8, 9)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-17, 17, [[(-10, -16), (-10, 16)], [(-9, -16), (-9, 16)], [(9, -16), (9, 16)], [(10, -16), (10, 16)], [(-14, -16), (14, -16)], [(-14, 16), (-5, 16)], [(5, 16), (14, 16)]]),
-    (-16, 15, [[(-11, -16), (-1, -2), (-12, 16)], [(-12, -16), (-2, -2)], [(-13, -16), (-2, -1)], [(-13, -16), (10, -16), (12, -9), (9, -16)], [(-11, 15), (10, 15)], [(-12, 16), (10, 16), (12, 9), (9, 16)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-13, 13, [[(7, -9), (-7, 9)], [(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-13, 13, [[(-9, -5), (9, -5)], [(-9, 0), (9, 0)], [(-9, 5), (9, 5)]]),
-    (-9, 10, [[(6, -5), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-5, 7, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(6, -5), (6, 11), (5, 14), (4, 15), (2, 16), (-1, 16), (-3, 15)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-4, 4, [[(-1, -12), (0, -11), (1, -12), (0, -13), (-1, -12)], [(0, -5), (0, 9)]]),
-    (-5, 5, [[(0, -12), (1, -11), (2, -12), (1, -13), (0, -12)], [(1, -5), (1, 12), (0, 15), (-2, 16), (-4, 16)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(-1, 1), (6, 9)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-15, 15, [[(-11, -5), (-11, 9)], [(-11, -1), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -1), (0, 9)], [(0, -1), (3, -4), (5, -5), (8, -5), (10, -4), (11, -1), (11, 9)]]),
-    (-9, 10, [[(-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)]]),
-    (-10, 9, [[(-6, -5), (-6, 16)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 10, [[(6, -5), (6, 16)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-7, 6, [[(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 7, [[(0, -12), (0, 5), (1, 8), (3, 9), (5, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(-5, -5), (-5, 5), (-4, 8), (-2, 9), (1, 9), (3, 8), (6, 5)], [(6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9)]]),
-    (-11, 11, [[(-8, -5), (-4, 9)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)], [(8, -5), (4, 9)]]),
-    (-8, 9, [[(-5, -5), (6, 9)], [(6, -5), (-5, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16)]]),
-    (-8, 9, [[(6, -5), (-5, 9)], [(-5, -5), (6, -5)], [(-5, 9), (6, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-12, 13, [[(9, 5), (7, 5), (5, 4), (3, 2), (0, -2), (-1, -3), (-3, -4), (-5, -4), (-7, -3), (-8, -1), (-8, 1), (-7, 3), (-5, 4), (-3, 4), (-1, 3), (0, 2), (3, -2), (5, -4), (7, -5), (9, -5)]]),
-    (-12, 13, [[(10, 1), (9, 3), (7, 4), (5, 4), (3, 3), (2, 2), (-1, -2), (-2, -3), (-4, -4), (-6, -4), (-8, -3), (-9, -1), (-9, 1), (-8, 3), (-6, 4), (-4, 4), (-2, 3), (-1, 2), (2, -2), (3, -3), (5, -4), (7, -4), (9, -3), (10, -1), (10, 1)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-13, 9, [[(-10, -5), (-6, -5), (0, 7)], [(-7, -5), (0, 9)], [(9, -16), (0, 9)]]),
-    (-17, 16, [[(-14, -5), (-9, -5), (0, 7)], [(-10, -4), (0, 9)], [(16, -24), (0, 9)]]),
-    (-12, 12, [[(8, -8), (1, -8), (-3, -7), (-5, -6), (-7, -4), (-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8), (8, 8)]]),
-    (-12, 12, [[(-8, -8), (-8, -1), (-7, 3), (-6, 5), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 5), (7, 3), (8, -1), (8, -8)]]),
-    (-12, 12, [[(-8, -8), (-1, -8), (3, -7), (5, -6), (7, -4), (8, -1), (8, 1), (7, 4), (5, 6), (3, 7), (-1, 8), (-8, 8)]]),
-    (-12, 12, [[(-8, 8), (-8, 1), (-7, -3), (-6, -5), (-4, -7), (-1, -8), (1, -8), (4, -7), (6, -5), (7, -3), (8, 1), (8, 8)]]),
-    (-12, 12, [[(8, -8), (1, -8), (-3, -7), (-5, -6), (-7, -4), (-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8), (8, 8)], [(-8, 0), (4, 0)]]),
-    (-13, 13, [[(6, -2), (9, 0), (6, 2)], [(3, -5), (8, 0), (3, 5)], [(-9, 0), (8, 0)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-13, 13, [[(-6, -2), (-9, 0), (-6, 2)], [(-3, -5), (-8, 0), (-3, 5)], [(-8, 0), (9, 0)]]),
-    (-8, 8, [[(-2, 6), (0, 9), (2, 6)], [(-5, 3), (0, 8), (5, 3)], [(0, -9), (0, 8)]]),
-    (-9, 10, [[(6, 0), (5, -3), (4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (6, 3), (7, -2), (7, -7), (6, -10), (5, -11), (3, -12), (0, -12), (-2, -11), (-3, -10), (-3, -9), (-2, -9), (-2, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 6), (5, 3), (6, -2), (6, -7), (5, -10), (3, -12)]]),
-    (-10, 10, [[(-8, -12), (0, 9)], [(-7, -12), (0, 7)], [(8, -12), (0, 9)], [(-8, -12), (8, -12)], [(-7, -11), (7, -11)]]),
-    (-17, 16, [[(-14, -5), (-9, -5), (0, 7)], [(-10, -4), (0, 9)], [(16, -24), (0, 9)]]),
-    (-12, 12, [[(9, -15), (8, -14), (9, -13), (10, -14), (10, -15), (9, -16), (7, -16), (5, -15), (3, -13), (2, -11), (1, -8), (0, -4), (-2, 8), (-3, 12), (-4, 14)], [(4, -14), (3, -12), (2, -8), (0, 4), (-1, 8), (-2, 11), (-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 14), (-9, 13), (-8, 14), (-9, 15)]]),
-    (-15, 15, [[(11, -36), (10, -36), (9, -35), (9, -34), (10, -33), (11, -33), (12, -34), (12, -36), (11, -38), (9, -39), (7, -39), (5, -38), (3, -36), (2, -34), (1, -31), (0, -24), (-1, -8), (-1, 24), (-2, 33), (-3, 36)], [(10, -35), (10, -34), (11, -34), (11, -35), (10, -35)], [(0, -24), (0, 24)], [(3, -36), (2, -33), (1, -24), (1, 8), (0, 24), (-1, 31), (-2, 34), (-3, 36), (-5, 38), (-7, 39), (-9, 39), (-11, 38), (-12, 36), (-12, 34), (-11, 33), (-10, 33), (-9, 34), (-9, 35), (-10, 36), (-11, 36)], [(-11, 34), (-11, 35), (-10, 35), (-10, 34), (-11, 34)]]),
-    (-9, 9, [[(6, -39), (3, -33), (0, -26), (-2, -21), (-3, -17), (-4, -12), (-5, -4), (-5, 4), (-4, 12), (-3, 17), (-2, 21), (0, 26), (3, 33), (6, 39)], [(3, -33), (1, -28), (-1, -22), (-2, -18), (-3, -12), (-4, -4), (-4, 4), (-3, 12), (-2, 18), (-1, 22), (1, 28), (3, 33)]]),
-    (-9, 9, [[(-6, -39), (-3, -33), (0, -26), (2, -21), (3, -17), (4, -12), (5, -4), (5, 4), (4, 12), (3, 17), (2, 21), (0, 26), (-3, 33), (-6, 39)], [(-3, -33), (-1, -28), (1, -22), (2, -18), (3, -12), (4, -4), (4, 4), (3, 12), (2, 18), (1, 22), (-1, 28), (-3, 33)]]),
-    (-9, 9, [[(-5, -39), (-5, 0), (-5, 39)], [(-4, -39), (-4, 0), (-4, 39)], [(-5, -39), (6, -39)], [(-5, 39), (6, 39)]]),
-    (-9, 9, [[(4, -39), (4, 0), (4, 39)], [(5, -39), (5, 0), (5, 39)], [(-6, -39), (5, -39)], [(-6, 39), (5, 39)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(-7, -12), (6, -12)], [(-2, -2), (6, -2)], [(-7, 9), (6, 9)]]),
-    (-10, 10, [[(-7, -9), (-6, -7), (6, 5), (7, 7), (7, 9)], [(-6, -6), (6, 6)], [(-7, -9), (-7, -7), (-6, -5), (6, 7), (7, 9)], [(-2, -2), (-6, 2), (-7, 4), (-7, 6), (-6, 8), (-7, 9)], [(-7, 4), (-5, 8)], [(-6, 2), (-6, 4), (-5, 6), (-5, 8), (-7, 9)], [(1, 1), (6, -4)], [(4, -9), (4, -6), (5, -4), (7, -4), (7, -6), (5, -7), (4, -9)], [(4, -9), (5, -6), (7, -4)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 0), (9, 0)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(3, -16), (3, 16)]]),
-    (-12, 12, [[(0, -16), (0, 9)], [(-9, 9), (9, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-12, 12, [[(9, -16), (-9, 9), (9, 9)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 7), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(9, 7), (8, 8), (9, 9), (10, 8), (9, 7)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-MATHUPP = [
-    (-8, 8, [[]]),
-    (-12, 12, [[(0, -8), (0, 9)], [(-8, 0), (8, 0)], [(-8, 9), (8, 9)]]),
-    (-12, 12, [[(0, -8), (0, 9)], [(-8, -8), (8, -8)], [(-8, 0), (8, 0)]]),
-    (-11, 11, [[(-7, -7), (7, 7)], [(7, -7), (-7, 7)]]),
-    (-2, 3, [[(0, -1), (0, 0), (1, 0), (1, -1), (0, -1)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 12, [[(8, -12), (-8, -5), (8, 2)], [(-8, 4), (8, 4)], [(-8, 9), (8, 9)]]),
-    (-12, 12, [[(-8, -12), (8, -5), (-8, 2)], [(-8, 4), (8, 4)], [(-8, 9), (8, 9)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 5, [[(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-17, 17, [[(-10, -16), (-10, 16)], [(-9, -16), (-9, 16)], [(9, -16), (9, 16)], [(10, -16), (10, 16)], [(-14, -16), (14, -16)], [(-14, 16), (-5, 16)], [(5, 16), (14, 16)]]),
-    (-16, 15, [[(-11, -16), (-1, -2), (-12, 16)], [(-12, -16), (-2, -2)], [(-13, -16), (-2, -1)], [(-13, -16), (10, -16), (12, -9), (9, -16)], [(-11, 15), (10, 15)], [(-12, 16), (10, 16), (12, 9), (9, 16)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-13, 13, [[(7, -9), (-7, 9)], [(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-13, 13, [[(-9, -5), (9, -5)], [(-9, 0), (9, 0)], [(-9, 5), (9, 5)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (0, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (0, 9), (-7, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 8, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 1)], [(3, 1), (8, 1)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-8, 8, [[(4, -12), (4, 4), (3, 7), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4), (-6, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, 9), (6, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(1, 5), (7, 11)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2), (-7, -2)], [(0, -2), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)]]),
-    (-9, 9, [[(-8, -12), (0, 9)], [(8, -12), (0, 9)]]),
-    (-12, 12, [[(-10, -12), (-5, 9)], [(0, -12), (-5, 9)], [(0, -12), (5, 9)], [(10, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(7, -12), (-7, 9)]]),
-    (-9, 9, [[(-8, -12), (0, -2), (0, 9)], [(8, -12), (0, -2)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-12, 13, [[(9, 5), (7, 5), (5, 4), (3, 2), (0, -2), (-1, -3), (-3, -4), (-5, -4), (-7, -3), (-8, -1), (-8, 1), (-7, 3), (-5, 4), (-3, 4), (-1, 3), (0, 2), (3, -2), (5, -4), (7, -5), (9, -5)]]),
-    (-12, 13, [[(10, 1), (9, 3), (7, 4), (5, 4), (3, 3), (2, 2), (-1, -2), (-2, -3), (-4, -4), (-6, -4), (-8, -3), (-9, -1), (-9, 1), (-8, 3), (-6, 4), (-4, 4), (-2, 3), (-1, 2), (2, -2), (3, -3), (5, -4), (7, -4), (9, -3), (10, -1), (10, 1)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 9, [[(-10, -5), (-6, -5), (0, 7)], [(-7, -5), (0, 9)], [(9, -16), (0, 9)]]),
-    (-17, 16, [[(-14, -5), (-9, -5), (0, 7)], [(-10, -4), (0, 9)], [(16, -24), (0, 9)]]),
-    (-12, 12, [[(8, -8), (1, -8), (-3, -7), (-5, -6), (-7, -4), (-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8), (8, 8)]]),
-    (-12, 12, [[(-8, -8), (-8, -1), (-7, 3), (-6, 5), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 5), (7, 3), (8, -1), (8, -8)]]),
-    (-12, 12, [[(-8, -8), (-1, -8), (3, -7), (5, -6), (7, -4), (8, -1), (8, 1), (7, 4), (5, 6), (3, 7), (-1, 8), (-8, 8)]]),
-    (-12, 12, [[(-8, 8), (-8, 1), (-7, -3), (-6, -5), (-4, -7), (-1, -8), (1, -8), (4, -7), (6, -5), (7, -3), (8, 1), (8, 8)]]),
-    (-12, 12, [[(8, -8), (1, -8), (-3, -7), (-5, -6), (-7, -4), (-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8), (8, 8)], [(-8, 0), (4, 0)]]),
-    (-13, 13, [[(6, -2), (9, 0), (6, 2)], [(3, -5), (8, 0), (3, 5)], [(-9, 0), (8, 0)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-13, 13, [[(-6, -2), (-9, 0), (-6, 2)], [(-3, -5), (-8, 0), (-3, 5)], [(-8, 0), (9, 0)]]),
-    (-8, 8, [[(-2, 6), (0, 9), (2, 6)], [(-5, 3), (0, 8), (5, 3)], [(0, -9), (0, 8)]]),
-    (-9, 10, [[(6, 0), (5, -3), (4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (6, 3), (7, -2), (7, -7), (6, -10), (5, -11), (3, -12), (0, -12), (-2, -11), (-3, -10), (-3, -9), (-2, -9), (-2, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 6), (5, 3), (6, -2), (6, -7), (5, -10), (3, -12)]]),
-    (-10, 10, [[(-8, -12), (0, 9)], [(-7, -12), (0, 7)], [(8, -12), (0, 9)], [(-8, -12), (8, -12)], [(-7, -11), (7, -11)]]),
-    (-17, 16, [[(-14, -5), (-9, -5), (0, 7)], [(-10, -4), (0, 9)], [(16, -24), (0, 9)]]),
-    (-12, 12, [[(9, -15), (8, -14), (9, -13), (10, -14), (10, -15), (9, -16), (7, -16), (5, -15), (3, -13), (2, -11), (1, -8), (0, -4), (-2, 8), (-3, 12), (-4, 14)], [(4, -14), (3, -12), (2, -8), (0, 4), (-1, 8), (-2, 11), (-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 14), (-9, 13), (-8, 14), (-9, 15)]]),
-    (-15, 15, [[(11, -36), (10, -36), (9, -35), (9, -34), (10, -33), (11, -33), (12, -34), (12, -36), (11, -38), (9, -39), (7, -39), (5, -38), (3, -36), (2, -34), (1, -31), (0, -24), (-1, -8), (-1, 24), (-2, 33), (-3, 36)], [(10, -35), (10, -34), (11, -34), (11, -35), (10, -35)], [(0, -24), (0, 24)], [(3, -36), (2, -33), (1, -24), (1, 8), (0, 24), (-1, 31), (-2, 34), (-3, 36), (-5, 38), (-7, 39), (-9, 39), (-11, 38), (-12, 36), (-12, 34), (-11, 33), (-10, 33), (-9, 34), (-9, 35), (-10, 36), (-11, 36)], [(-11, 34), (-11, 35), (-10, 35), (-10, 34), (-11, 34)]]),
-    (-9, 9, [[(6, -39), (3, -33), (0, -26), (-2, -21), (-3, -17), (-4, -12), (-5, -4), (-5, 4), (-4, 12), (-3, 17), (-2, 21), (0, 26), (3, 33), (6, 39)], [(3, -33), (1, -28), (-1, -22), (-2, -18), (-3, -12), (-4, -4), (-4, 4), (-3, 12), (-2, 18), (-1, 22), (1, 28), (3, 33)]]),
-    (-9, 9, [[(-6, -39), (-3, -33), (0, -26), (2, -21), (3, -17), (4, -12), (5, -4), (5, 4), (4, 12), (3, 17), (2, 21), (0, 26), (-3, 33), (-6, 39)], [(-3, -33), (-1, -28), (1, -22), (2, -18), (3, -12), (4, -4), (4, 4), (3, 12), (2, 18), (1, 22), (-1, 28), (-3, 33)]]),
-    (-9, 9, [[(-5, -39), (-5, 0), (-5, 39)], [(-4, -39), (-4, 0), (-4, 39)], [(-5, -39), (6, -39)], [(-5, 39), (6, 39)]]),
-    (-9, 9, [[(4, -39), (4, 0), (4, 39)], [(5, -39), (5, 0), (5, 39)], [(-6, -39), (5, -39)], [(-6, 39), (5, 39)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(-7, -12), (6, -12)], [(-2, -2), (6, -2)], [(-7, 9), (6, 9)]]),
-    (-10, 10, [[(-7, -9), (-6, -7), (6, 5), (7, 7), (7, 9)], [(-6, -6), (6, 6)], [(-7, -9), (-7, -7), (-6, -5), (6, 7), (7, 9)], [(-2, -2), (-6, 2), (-7, 4), (-7, 6), (-6, 8), (-7, 9)], [(-7, 4), (-5, 8)], [(-6, 2), (-6, 4), (-5, 6), (-5, 8), (-7, 9)], [(1, 1), (6, -4)], [(4, -9), (4, -6), (5, -4), (7, -4), (7, -6), (5, -7), (4, -9)], [(4, -9), (5, -6), (7, -4)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 0), (9, 0)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(3, -16), (3, 16)]]),
-    (-12, 12, [[(0, -16), (0, 9)], [(-9, 9), (9, 9)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-12, 12, [[(9, -16), (-9, 9), (9, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 7), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(9, 7), (8, 8), (9, 9), (10, 8), (9, 7)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-METEOROLOGY = [
-    (-8, 8, [[]]),
-    (-2, 1, [[(1, 0), (0, 1), (-1, 1), (-2, 0), (-2, -1), (-1, -2), (0, -2), (1, -1), (1, 1), (0, 3), (-1, 4)], [(-1, -1), (-1, 0), (0, 0), (0, -1), (-1, -1)]]),
-    (-2, 2, [[(-1, -2), (-2, -1), (-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1), (1, -2), (-1, -2)], [(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]),
-    (-4, 4, [[(-2, -3), (2, 3)], [(2, -3), (-2, 3)], [(-4, 0), (4, 0)]]),
-    (-5, 5, [[(0, -7), (-1, -5), (-3, -2), (-5, 0)], [(0, -7), (1, -5), (3, -2), (5, 0)], [(0, -5), (-3, -1)], [(0, -5), (3, -1)], [(0, -3), (-2, -1)], [(0, -3), (2, -1)], [(-1, -1), (1, -1)], [(-5, 0), (5, 0)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-5, 5, [[(-5, 0), (-5, -1), (-4, -3), (-3, -4), (-1, -5), (1, -5), (3, -4), (4, -3), (5, -1), (5, 0)], [(-2, -4), (2, -4)], [(-3, -3), (3, -3)], [(-4, -2), (4, -2)], [(-4, -1), (4, -1)], [(-5, 0), (5, 0)]]),
-    (-6, 0, [[(-6, -12), (-6, 0), (0, 0), (-6, -12)], [(-6, -9), (-2, -1)], [(-6, -6), (-3, 0)], [(-6, -3), (-5, -1)]]),
-    (-5, 5, [[(0, -7), (-1, -5), (-3, -2), (-5, 0)], [(0, -7), (1, -5), (3, -2), (5, 0)]]),
-    (-5, 5, [[(5, 0), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 0)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-11, 11, [[(11, 0), (11, -2), (10, -5), (8, -8), (5, -10), (2, -11), (-2, -11), (-5, -10), (-8, -8), (-10, -5), (-11, -2), (-11, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-5, 5, [[(-5, 0), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3), (5, 1), (5, 0)]]),
-    (-6, 6, [[(-6, -2), (-4, 0), (-1, 1), (1, 1), (4, 0), (6, -2)]]),
-    (0, 3, [[(0, 3), (2, 2), (3, 0), (2, -2), (0, -3)]]),
-    (0, 4, [[(0, 0), (3, -2), (4, -4), (4, -6), (3, -7), (2, -7)]]),
-    (-4, 0, [[(0, 0), (-3, -2), (-4, -4), (-4, -6), (-3, -7), (-2, -7)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (0, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (0, 9), (-7, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 8, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 1)], [(3, 1), (8, 1)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-8, 8, [[(4, -12), (4, 4), (3, 7), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4), (-6, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, 9), (6, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(1, 5), (7, 11)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2), (-7, -2)], [(0, -2), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)]]),
-    (-9, 9, [[(-8, -12), (0, 9)], [(8, -12), (0, 9)]]),
-    (-12, 12, [[(-10, -12), (-5, 9)], [(0, -12), (-5, 9)], [(0, -12), (5, 9)], [(10, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(7, -12), (-7, 9)]]),
-    (-9, 9, [[(-8, -12), (0, -2), (0, 9)], [(8, -12), (0, -2)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-11, 11, [[(0, 0), (2, 3), (3, 4), (5, 5), (7, 5), (9, 4), (10, 3), (11, 1), (11, -1), (10, -3), (9, -4), (7, -5), (5, -5), (3, -4), (2, -3), (-2, 3), (-3, 4), (-5, 5), (-7, 5), (-9, 4), (-10, 3), (-11, 1), (-11, -1), (-10, -3), (-9, -4), (-7, -5), (-5, -5), (-3, -4), (-2, -3), (0, 0)]]),
-    (-11, 11, [[(-9, 5), (-10, 4), (-11, 2), (-11, -1), (-10, -3), (-9, -4), (-7, -5), (-5, -5), (-3, -4), (-2, -3), (2, 3), (3, 4), (5, 5), (7, 5), (9, 4), (10, 3), (11, 1), (11, -2), (10, -4), (9, -5)]]),
-    (-9, 10, [[(6, -5), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-5, 7, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(6, -5), (6, 11), (5, 14), (4, 15), (2, 16), (-1, 16), (-3, 15)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-4, 4, [[(-1, -12), (0, -11), (1, -12), (0, -13), (-1, -12)], [(0, -5), (0, 9)]]),
-    (-5, 5, [[(0, -12), (1, -11), (2, -12), (1, -13), (0, -12)], [(1, -5), (1, 12), (0, 15), (-2, 16), (-4, 16)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(-1, 1), (6, 9)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-15, 15, [[(-11, -5), (-11, 9)], [(-11, -1), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -1), (0, 9)], [(0, -1), (3, -4), (5, -5), (8, -5), (10, -4), (11, -1), (11, 9)]]),
-    (-9, 10, [[(-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)]]),
-    (-10, 9, [[(-6, -5), (-6, 16)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 10, [[(6, -5), (6, 16)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-7, 6, [[(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 7, [[(0, -12), (0, 5), (1, 8), (3, 9), (5, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(-5, -5), (-5, 5), (-4, 8), (-2, 9), (1, 9), (3, 8), (6, 5)], [(6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9)]]),
-    (-11, 11, [[(-8, -5), (-4, 9)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)], [(8, -5), (4, 9)]]),
-    (-8, 9, [[(-5, -5), (6, 9)], [(6, -5), (-5, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16)]]),
-    (-8, 9, [[(6, -5), (-5, 9)], [(-5, -5), (6, -5)], [(-5, 9), (6, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-10, 10, [[(-7, -12), (-7, 9)], [(-10, -12), (9, -12), (-1, -2), (9, 8)], [(8, 4), (9, 7), (10, 9)], [(8, 4), (8, 7)], [(5, 7), (8, 7)], [(5, 7), (8, 8), (10, 9)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-7, 7, [[(3, -17), (0, -16), (-2, -15), (-4, -13), (-6, -10), (-7, -6), (-7, 0), (-6, 3), (-4, 5), (-1, 6), (1, 6), (4, 5), (6, 3), (7, 0)], [(-7, -2), (-6, -5), (-4, -7), (-1, -8), (1, -8), (4, -7), (6, -5), (7, -2), (7, 4), (6, 8), (4, 11), (2, 13), (0, 14), (-3, 15)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-MUSIC = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-5, -2), (-1, 0), (2, 2), (4, 4), (5, 7), (5, 9), (4, 11), (3, 12)], [(-5, -1), (1, 2)], [(-5, 0), (-2, 1), (2, 3), (4, 5), (5, 7)]]),
-    (-8, 8, [[(5, -7), (4, -5), (2, -3), (-2, -1), (-5, 0)], [(1, -2), (-5, 1)], [(3, -12), (4, -11), (5, -9), (5, -7), (4, -4), (2, -2), (-1, 0), (-5, 2)]]),
-    (-10, 10, [[(1, -5), (-3, -4), (-6, -2), (-7, 0), (-7, 2), (-6, 4), (-4, 5), (-1, 5), (3, 4), (6, 2), (7, 0), (7, -2), (6, -4), (4, -5), (1, -5)], [(6, -4), (1, -5)], [(4, -5), (-1, -4), (-6, -2)], [(-3, -4), (-7, 0)], [(-6, 4), (-1, 5)], [(-4, 5), (1, 4), (6, 2)], [(3, 4), (7, 0)]]),
-    (-10, 10, [[(1, -5), (-3, -4), (-6, -2), (-7, 0), (-7, 2), (-6, 4), (-4, 5), (-1, 5), (3, 4), (6, 2), (7, 0), (7, -2), (6, -4), (4, -5), (1, -5)], [(6, -4), (1, -5)], [(4, -5), (-1, -4), (-6, -2)], [(-3, -4), (-7, 0)], [(-6, 4), (-1, 5)], [(-4, 5), (1, 4), (6, 2)], [(3, 4), (7, 0)]]),
-    (-8, 9, [[(1, -5), (-2, -4), (-4, -2), (-5, 0), (-5, 2), (-4, 4), (-2, 5), (0, 5), (3, 4), (5, 2), (6, 0), (6, -2), (5, -4), (3, -5), (1, -5)], [(-3, -2), (3, -5)], [(-4, 0), (4, -4)], [(-5, 2), (5, -3)], [(-4, 3), (6, -2)], [(-3, 4), (5, 0)], [(-2, 5), (4, 2)]]),
-    (-8, 8, [[(-3, -11), (-3, 12)], [(3, -12), (3, 11)], [(-5, -4), (5, -6)], [(-5, -3), (5, -5)], [(-5, 5), (5, 3)], [(-5, 6), (5, 4)]]),
-    (-8, 8, [[(-4, -12), (-4, 6)], [(4, -6), (4, 12)], [(-4, -4), (4, -6)], [(-4, -3), (4, -5)], [(-4, 5), (4, 3)], [(-4, 6), (4, 4)]]),
-    (-8, 8, [[(-4, -16), (-4, 5)], [(-4, -4), (-1, -6), (2, -6), (4, -5), (5, -3), (5, -1), (4, 1), (1, 3), (-1, 4), (-4, 5)], [(-4, -4), (-1, -5), (2, -5), (4, -4)], [(3, -5), (4, -3), (4, -1), (3, 1), (1, 3)]]),
-    (-13, 13, [[(-10, -9), (-10, -6)], [(10, -9), (10, -6)], [(-10, -9), (10, -9)], [(-10, -8), (10, -8)], [(-10, -7), (10, -7)], [(-10, -6), (10, -6)]]),
-    (-8, 8, [[(-5, -4), (-5, -1)], [(5, -4), (5, -1)], [(-5, -4), (5, -4)], [(-5, -3), (5, -3)], [(-5, -2), (5, -2)], [(-5, -1), (5, -1)]]),
-    (-8, 8, [[(-5, -6), (5, 6)], [(-5, -6), (-3, -4), (-1, -3), (2, -3), (4, -4), (5, -5), (5, -7), (3, -7), (3, -5), (2, -3)], [(-3, -4), (2, -3)], [(-1, -3), (5, -5)], [(4, -7), (4, -4)], [(3, -6), (5, -6)], [(5, 6), (3, 4), (1, 3), (-2, 3), (-4, 4), (-5, 5), (-5, 7), (-3, 7), (-3, 5), (-2, 3)], [(3, 4), (-2, 3)], [(1, 3), (-5, 5)], [(-4, 4), (-4, 7)], [(-5, 6), (-3, 6)]]),
-    (-8, 8, [[(-2, -3), (-3, -5), (-3, -7), (-5, -7), (-5, -5), (-4, -4), (-2, -3), (1, -3), (3, -4), (5, -6)], [(-4, -7), (-4, -4)], [(-5, -6), (-3, -6)], [(-5, -5), (1, -3)], [(-2, -3), (3, -4)], [(5, -6), (5, 7)]]),
-    (-8, 8, [[(-1, -15), (4, -5), (0, 2), (0, 3)], [(3, -6), (-1, 1)], [(2, -9), (2, -7), (-2, 0), (0, 3), (3, 7)], [(5, 10), (3, 7), (1, 6), (-1, 6), (-3, 7), (-4, 9), (-4, 11), (-3, 13), (0, 15)], [(5, 10), (3, 8), (1, 7), (-3, 7), (-3, 11), (-2, 13), (0, 15)], [(1, 6), (-2, 8), (-4, 11)]]),
-    (-13, 20, [[(-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-2, 9), (1, 10), (4, 10), (7, 9), (9, 7), (10, 5), (11, 2), (11, -2), (10, -5), (8, -8), (6, -9), (3, -10), (0, -10), (-3, -9), (-5, -8), (-7, -6), (-9, -3), (-10, 1), (-10, 6), (-9, 11), (-7, 15), (-5, 17), (-2, 19), (2, 20), (7, 20), (11, 19), (14, 17), (16, 15)], [(-7, -6), (-8, -4), (-9, 0), (-9, 6), (-8, 10), (-6, 14), (-4, 16), (-1, 18), (3, 19), (7, 19), (11, 18), (13, 17), (16, 15)], [(-2, -3), (2, -3)], [(-3, -2), (3, -2)], [(-4, -1), (4, -1)], [(-4, 0), (4, 0)], [(-4, 1), (4, 1)], [(-3, 2), (3, 2)], [(-2, 3), (2, 3)], [(15, -6), (15, -4), (17, -4), (17, -6), (15, -6)], [(16, -6), (16, -4)], [(15, -5), (17, -5)], [(15, 4), (15, 6), (17, 6), (17, 4), (15, 4)], [(16, 4), (16, 6)], [(15, 5), (17, 5)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-17, 12, [[(-11, 20), (-10, 20), (-9, 19), (-9, 18), (-10, 17), (-11, 17), (-12, 18), (-12, 20), (-11, 22), (-9, 23), (-7, 23), (-4, 22), (-2, 20), (-1, 18), (0, 14), (0, 3), (-1, -23), (-1, -30), (0, -35), (1, -37), (3, -38), (4, -38), (6, -37), (7, -35), (7, -31), (6, -28), (5, -26), (3, -23), (-2, -19), (-8, -15), (-10, -13), (-12, -10), (-13, -8), (-14, -4), (-14, 0), (-13, 4), (-11, 7), (-8, 9), (-4, 10), (0, 10), (4, 9), (6, 8), (8, 5), (9, 2), (9, -2), (8, -5), (7, -7), (5, -9), (2, -10), (-2, -10), (-5, -9), (-7, -7), (-8, -4), (-8, 0), (-7, 3), (-5, 5)], [(-11, 18), (-11, 19), (-10, 19), (-10, 18), (-11, 18)], [(3, -23), (-1, -19), (-6, -15), (-9, -12), (-11, -9), (-12, -7), (-13, -4), (-13, 0), (-12, 4), (-11, 6), (-8, 9)], [(0, 10), (3, 9), (5, 8), (7, 5), (8, 2), (8, -2), (7, -5), (6, -7), (4, -9), (2, -10)]]),
-    (-13, 20, [[(-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-2, 9), (1, 10), (4, 10), (7, 9), (9, 7), (10, 5), (11, 2), (11, -2), (10, -5), (8, -8), (6, -9), (3, -10), (0, -10), (-3, -9), (-5, -8), (-7, -6), (-9, -3), (-10, 1), (-10, 6), (-9, 11), (-7, 15), (-5, 17), (-2, 19), (2, 20), (7, 20), (11, 19), (14, 17), (16, 15)], [(-7, -6), (-8, -4), (-9, 0), (-9, 6), (-8, 10), (-6, 14), (-4, 16), (-1, 18), (3, 19), (7, 19), (11, 18), (13, 17), (16, 15)], [(-2, -3), (2, -3)], [(-3, -2), (3, -2)], [(-4, -1), (4, -1)], [(-4, 0), (4, 0)], [(-4, 1), (4, 1)], [(-3, 2), (3, 2)], [(-2, 3), (2, 3)], [(15, -6), (15, -4), (17, -4), (17, -6), (15, -6)], [(16, -6), (16, -4)], [(15, -5), (17, -5)], [(15, 4), (15, 6), (17, 6), (17, 4), (15, 4)], [(16, 4), (16, 6)], [(15, 5), (17, 5)]]),
-    (-9, 24, [[(-4, -1), (-3, -3), (-1, -4), (1, -4), (3, -3), (4, -1), (4, 1), (3, 3), (1, 4), (-1, 4), (-3, 3), (-4, 2), (-5, -1), (-5, -4), (-4, -7), (-2, -9), (1, -10), (5, -10), (9, -9), (12, -7), (14, -4), (15, 0), (15, 5), (14, 9), (13, 11), (11, 14), (8, 17), (4, 20), (-1, 23), (-5, 25)], [(5, -10), (8, -9), (11, -7), (13, -4), (14, 0), (14, 5), (13, 9), (12, 11), (10, 14), (7, 17), (2, 21), (-1, 23)], [(-2, -3), (2, -3)], [(-3, -2), (3, -2)], [(-4, -1), (4, -1)], [(-4, 0), (4, 0)], [(-4, 1), (4, 1)], [(-3, 2), (3, 2)], [(-2, 3), (2, 3)], [(19, -6), (19, -4), (21, -4), (21, -6), (19, -6)], [(20, -6), (20, -4)], [(19, -5), (21, -5)], [(19, 4), (19, 6), (21, 6), (21, 4), (19, 4)], [(20, 4), (20, 6)], [(19, 5), (21, 5)]]),
-    (-14, 14, [[(-10, -18), (-10, 18)], [(-5, -18), (-5, 18)], [(5, -18), (5, 18)], [(10, -18), (10, 18)], [(-5, -5), (5, -7)], [(-5, -4), (5, -6)], [(-5, -3), (5, -5)], [(-5, 5), (5, 3)], [(-5, 6), (5, 4)], [(-5, 7), (5, 5)]]),
-    (-14, 14, [[(-10, -20), (-10, 20)], [(-9, -20), (-9, 20)], [(-5, -20), (-5, 20)], [(-1, -16), (1, -16), (1, -14), (-1, -14), (-1, -17), (0, -19), (2, -20), (5, -20), (7, -19), (9, -17), (10, -14), (10, -9), (9, -6), (7, -4), (5, -3), (3, -3), (1, -4), (0, -6), (-1, -4), (-3, -1), (-4, 0), (-3, 1), (-1, 4), (0, 6), (1, 4), (3, 3), (5, 3), (7, 4), (9, 6), (10, 9), (10, 14), (9, 17), (7, 19), (5, 20), (2, 20), (0, 19), (-1, 17), (-1, 14), (1, 14), (1, 16), (-1, 16)], [(0, -16), (0, -14)], [(-1, -15), (1, -15)], [(7, -19), (8, -17), (9, -14), (9, -9), (8, -6), (7, -4)], [(0, -6), (0, -4), (-2, -1), (-4, 0), (-2, 1), (0, 4), (0, 6)], [(7, 4), (8, 6), (9, 9), (9, 14), (8, 17), (7, 19)], [(0, 14), (0, 16)], [(-1, 15), (1, 15)]]),
-    (-8, 8, [[(-5, -4), (-5, -1)], [(5, -4), (5, -1)], [(-5, -4), (5, -4)], [(-5, -3), (5, -3)], [(-5, -2), (5, -2)], [(-5, -1), (5, -1)]]),
-    (-10, 10, [[(3, -12), (-10, 9)], [(3, -12), (4, 9)], [(2, -10), (3, 9)], [(-6, 3), (3, 3)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -4), (6, -3), (4, -2)], [(-5, -2), (4, -2), (6, -1), (7, 1), (7, 3), (6, 6), (4, 8), (0, 9), (-12, 9)], [(4, -2), (5, -1), (6, 1), (6, 3), (5, 6), (3, 8), (0, 9)]]),
-    (-10, 11, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6), (6, 4)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (3, -12), (6, -11), (7, -10), (8, -7), (8, -3), (7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-12, 9)], [(3, -12), (5, -11), (6, -10), (7, -7), (7, -3), (6, 1), (4, 5), (2, 7), (0, 8), (-3, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)], [(-6, -12), (9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9), (3, 9), (5, 4), (2, 9)]]),
-    (-12, 10, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)], [(-6, -12), (9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9), (-5, 9)]]),
-    (-10, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (7, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9)], [(0, 9), (2, 8), (4, 6), (6, 2)], [(3, 2), (10, 2)]]),
-    (-13, 13, [[(-4, -12), (-10, 9)], [(-3, -12), (-9, 9)], [(9, -12), (3, 9)], [(10, -12), (4, 9)], [(-7, -12), (0, -12)], [(6, -12), (13, -12)], [(-6, -2), (6, -2)], [(-13, 9), (-6, 9)], [(0, 9), (7, 9)]]),
-    (-6, 7, [[(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(0, -12), (7, -12)], [(-6, 9), (1, 9)]]),
-    (-9, 9, [[(6, -12), (1, 5), (0, 7), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(5, -12), (0, 5), (-1, 7), (-3, 9)], [(2, -12), (9, -12)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(11, -12), (-6, 1)], [(1, -3), (5, 9)], [(0, -3), (4, 9)], [(-6, -12), (1, -12)], [(7, -12), (13, -12)], [(-12, 9), (-5, 9)], [(1, 9), (7, 9)]]),
-    (-10, 10, [[(-1, -12), (-7, 9)], [(0, -12), (-6, 9)], [(-4, -12), (3, -12)], [(-10, 9), (5, 9), (7, 3), (4, 9)]]),
-    (-13, 14, [[(-4, -12), (-10, 9)], [(-4, -12), (-3, 9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(10, -12), (4, 9)], [(11, -12), (5, 9)], [(-7, -12), (-3, -12)], [(10, -12), (14, -12)], [(-13, 9), (-7, 9)], [(1, 9), (8, 9)]]),
-    (-12, 13, [[(-3, -12), (-9, 9)], [(-3, -12), (4, 6)], [(-3, -9), (4, 9)], [(10, -12), (4, 9)], [(-6, -12), (-3, -12)], [(7, -12), (13, -12)], [(-12, 9), (-6, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (6, -12), (9, -11), (10, -9), (10, -7), (9, -4), (7, -2), (3, -1), (-5, -1)], [(6, -12), (8, -11), (9, -9), (9, -7), (8, -4), (6, -2), (3, -1)], [(-12, 9), (-5, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)], [(-6, 7), (-6, 6), (-5, 4), (-3, 3), (-2, 3), (0, 4), (1, 6), (1, 13), (2, 14), (4, 14), (5, 12), (5, 11)], [(1, 6), (2, 12), (3, 13), (4, 13), (5, 12)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2), (-5, -2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -4), (6, -3), (4, -2)], [(0, -2), (2, -1), (3, 0), (4, 8), (5, 9), (7, 9), (8, 7), (8, 6)], [(3, 0), (5, 7), (6, 8), (7, 8), (8, 7)], [(-12, 9), (-5, 9)]]),
-    (-11, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-9, 9), (-8, 7), (-7, 7)]]),
-    (-10, 11, [[(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(-3, -12), (-6, -6), (-4, -12), (11, -12), (10, -6), (10, -12)], [(-6, 9), (1, 9)]]),
-    (-12, 13, [[(-4, -12), (-7, -1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (3, 8), (5, 6), (6, 3), (10, -12)], [(-3, -12), (-6, -1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(-7, -12), (0, -12)], [(7, -12), (13, -12)]]),
-    (-10, 10, [[(-4, -12), (-3, 9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(-6, -12), (0, -12)], [(6, -12), (12, -12)]]),
-    (-13, 13, [[(-5, -12), (-7, 9)], [(-4, -12), (-6, 7)], [(3, -12), (-7, 9)], [(3, -12), (1, 9)], [(4, -12), (2, 7)], [(11, -12), (1, 9)], [(-8, -12), (-1, -12)], [(8, -12), (14, -12)]]),
-    (-11, 11, [[(-4, -12), (3, 9)], [(-3, -12), (4, 9)], [(10, -12), (-10, 9)], [(-6, -12), (0, -12)], [(6, -12), (12, -12)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]),
-    (-10, 11, [[(-4, -12), (0, -2), (-3, 9)], [(-3, -12), (1, -2), (-2, 9)], [(11, -12), (1, -2)], [(-6, -12), (0, -12)], [(7, -12), (13, -12)], [(-6, 9), (1, 9)]]),
-    (-11, 11, [[(9, -12), (-10, 9)], [(10, -12), (-9, 9)], [(-3, -12), (-6, -6), (-4, -12), (10, -12)], [(-10, 9), (4, 9), (6, 3), (3, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-6, 6, [[(2, -12), (-3, -6)], [(2, -12), (3, -11), (-3, -6)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-10, 11, [[(6, -5), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]),
-    (-10, 9, [[(-2, -12), (-6, 1), (-6, 4), (-5, 7), (-4, 8)], [(-1, -12), (-5, 1)], [(-5, 1), (-4, -2), (-2, -4), (0, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 2), (5, 5), (3, 8), (0, 9), (-2, 9), (-4, 8), (-5, 5), (-5, 1)], [(4, -4), (5, -2), (5, 2), (4, 5), (2, 8), (0, 9)], [(-5, -12), (-1, -12)]]),
-    (-9, 9, [[(5, -2), (5, -1), (6, -1), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)]]),
-    (-10, 11, [[(8, -12), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(9, -12), (5, 2), (4, 6), (4, 8), (5, 9)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(5, -12), (9, -12)]]),
-    (-9, 9, [[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)]]),
-    (-7, 8, [[(8, -11), (7, -10), (8, -9), (9, -10), (9, -11), (8, -12), (6, -12), (4, -11), (3, -10), (2, -8), (1, -5), (-2, 9), (-3, 13), (-4, 15)], [(6, -12), (4, -10), (3, -8), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14), (-8, 15)], [(-3, -5), (7, -5)]]),
-    (-10, 10, [[(7, -5), (3, 9), (2, 12), (0, 15), (-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 13), (-8, 12), (-7, 13), (-8, 14)], [(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]),
-    (-10, 11, [[(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5), (5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(-5, -12), (-1, -12)]]),
-    (-6, 7, [[(3, -12), (2, -11), (3, -10), (4, -11), (3, -12)], [(-5, -1), (-4, -3), (-2, -5), (1, -5), (2, -4), (2, -1), (0, 5), (0, 8), (1, 9)], [(0, -5), (1, -4), (1, -1), (-1, 5), (-1, 8), (0, 9), (3, 9), (5, 7), (6, 5)]]),
-    (-6, 7, [[(4, -12), (3, -11), (4, -10), (5, -11), (4, -12)], [(-4, -1), (-3, -3), (-1, -5), (2, -5), (3, -4), (3, -1), (0, 9), (-1, 12), (-2, 14), (-3, 15), (-5, 16), (-7, 16), (-8, 15), (-8, 14), (-7, 13), (-6, 14), (-7, 15)], [(1, -5), (2, -4), (2, -1), (-1, 9), (-2, 12), (-3, 14), (-5, 16)]]),
-    (-10, 10, [[(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(6, -4), (5, -3), (6, -2), (7, -3), (7, -4), (6, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-5, 1)], [(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)], [(-5, -12), (-1, -12)]]),
-    (-5, 7, [[(3, -12), (-1, 2), (-2, 6), (-2, 8), (-1, 9), (2, 9), (4, 7), (5, 5)], [(4, -12), (0, 2), (-1, 6), (-1, 8), (0, 9)], [(0, -12), (4, -12)]]),
-    (-17, 16, [[(-16, -1), (-15, -3), (-13, -5), (-10, -5), (-9, -4), (-9, -2), (-10, 2), (-12, 9)], [(-11, -5), (-10, -4), (-10, -2), (-11, 2), (-13, 9)], [(-10, 2), (-8, -2), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -3), (1, -1), (-2, 9)], [(-2, -5), (0, -3), (0, -1), (-3, 9)], [(0, 2), (2, -2), (4, -4), (6, -5), (8, -5), (10, -4), (11, -3), (11, -1), (9, 5), (9, 8), (10, 9)], [(8, -5), (10, -3), (10, -1), (8, 5), (8, 8), (9, 9), (12, 9), (14, 7), (15, 5)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-6, -5), (-5, -4), (-5, -2), (-6, 2), (-8, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5), (5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)]]),
-    (-9, 9, [[(0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-8, 16)], [(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-9, 16)], [(-4, 2), (-3, -1), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (7, -1), (7, 2), (6, 5), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 5), (-4, 2)], [(5, -4), (6, -2), (6, 2), (5, 5), (3, 8), (1, 9)], [(-12, 16), (-5, 16)]]),
-    (-10, 10, [[(6, -5), (0, 16)], [(7, -5), (1, 16)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-3, 16), (4, 16)]]),
-    (-9, 8, [[(-8, -1), (-7, -3), (-5, -5), (-2, -5), (-1, -4), (-1, -2), (-2, 2), (-4, 9)], [(-3, -5), (-2, -4), (-2, -2), (-3, 2), (-5, 9)], [(-2, 2), (0, -2), (2, -4), (4, -5), (6, -5), (7, -4), (7, -3), (6, -2), (5, -3), (6, -4)]]),
-    (-8, 9, [[(6, -3), (6, -2), (7, -2), (7, -3), (6, -4), (3, -5), (0, -5), (-3, -4), (-4, -3), (-4, -1), (-3, 0), (4, 4), (5, 5)], [(-4, -2), (-3, -1), (4, 3), (5, 4), (5, 7), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 6), (-5, 6), (-5, 7)]]),
-    (-7, 7, [[(2, -12), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3, 7), (4, 5)], [(3, -12), (-1, 2), (-2, 6), (-2, 8), (-1, 9)], [(-4, -5), (5, -5)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -1), (-6, 5), (-6, 7), (-4, 9)], [(-6, -5), (-5, -4), (-5, -1), (-7, 5), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 2)], [(6, -5), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -1), (-4, 5), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5, 7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, -1), (7, -5), (6, -5), (7, -3)]]),
-    (-15, 14, [[(-14, -1), (-13, -3), (-11, -5), (-8, -5), (-7, -4), (-7, -1), (-9, 5), (-9, 7), (-7, 9)], [(-9, -5), (-8, -4), (-8, -1), (-10, 5), (-10, 7), (-9, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 6), (0, 4)], [(2, -5), (0, 4), (0, 7), (1, 8), (3, 9), (5, 9), (7, 8), (9, 6), (10, 4), (11, 0), (11, -5), (10, -5), (11, -3)], [(3, -5), (1, 4), (1, 7), (3, 9)]]),
-    (-10, 10, [[(-7, -1), (-5, -4), (-3, -5), (0, -5), (1, -3), (1, 0)], [(-1, -5), (0, -3), (0, 0), (-1, 4), (-2, 6), (-4, 8), (-6, 9), (-7, 9), (-8, 8), (-8, 7), (-7, 6), (-6, 7), (-7, 8)], [(-1, 4), (-1, 7), (0, 9), (3, 9), (5, 8), (7, 5)], [(7, -4), (6, -3), (7, -2), (8, -3), (8, -4), (7, -5), (6, -5), (4, -4), (2, -2), (1, 0), (0, 4), (0, 7), (1, 9)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5, 7), (-3, 9)], [(-5, -5), (-4, -4), (-4, -1), (-6, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(8, -5), (4, 9), (3, 12), (1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14), (-8, 13), (-7, 12), (-6, 13), (-7, 14)], [(7, -5), (3, 9), (2, 12), (0, 15), (-2, 16)]]),
-    (-10, 10, [[(7, -5), (6, -3), (4, -1), (-4, 5), (-6, 7), (-7, 9)], [(-6, -1), (-5, -3), (-3, -5), (0, -5), (4, -3)], [(-5, -3), (-3, -4), (0, -4), (4, -3), (6, -3)], [(-6, 7), (-4, 7), (0, 8), (3, 8), (5, 7)], [(-4, 7), (0, 9), (3, 9), (5, 7), (6, 5)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-ROWMAND = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(0, -12), (0, 2), (1, 2)], [(0, -12), (1, -12), (1, 2)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-9, 10, [[(0, -16), (0, 13), (1, 13)], [(0, -16), (1, -16), (1, 13)], [(5, -9), (7, -9), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-6, -7), (-5, -5), (-4, -4), (4, 0), (5, 1), (6, 3), (6, 5), (5, 7), (2, 8), (-1, 8), (-3, 7), (-4, 6)], [(5, -9), (4, -10), (2, -11), (-1, -11), (-4, -10), (-5, -9), (-5, -7), (-4, -5), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-4, 6)], [(6, 6), (3, 8)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(10, -5), (8, -5), (6, -4), (5, -2), (3, 4), (2, 6), (1, 7), (-1, 8), (-5, 8), (-7, 7), (-8, 5), (-8, 3), (-7, 1), (-6, 0), (-1, -3), (1, -5), (2, -7), (2, -9), (1, -11), (-1, -12), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 5), (6, 8), (8, 9), (10, 9)], [(10, -5), (10, -4), (8, -4), (6, -3)], [(7, -4), (6, -2), (4, 4), (3, 6), (1, 8), (-1, 9), (-5, 9), (-7, 8), (-8, 7), (-9, 5), (-9, 3), (-8, 1), (-6, -1), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11)], [(1, -10), (-1, -11), (-2, -11), (-4, -10)], [(-3, -11), (-4, -9), (-4, -7), (-3, -4), (-1, -1), (4, 5), (6, 7), (8, 8), (10, 8), (10, 9)]]),
-    (-5, 6, [[(2, -10), (1, -9), (0, -9), (-1, -10), (-1, -11), (0, -12), (1, -12), (2, -11), (2, -8), (1, -6), (-1, -5)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(1, -9), (2, -8)], [(2, -10), (1, -6)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16), (4, 16)], [(3, -16), (4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16), (-3, 16)], [(-4, -16), (-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 13, [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-3, -11), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-3, 8)], [(-4, 7), (-1, 8), (1, 8), (4, 7)], [(3, 8), (5, 5), (6, 0), (6, -3), (5, -8), (3, -11)], [(4, -10), (1, -11), (-1, -11), (-4, -10)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(-4, -8), (-4, -7), (-2, -8), (0, -10), (0, 9), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-6, 9)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-2, -11), (2, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -1), (-7, 9)], [(-6, 8), (7, 8), (7, 9)], [(-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (-1, -3)], [(-5, -12), (-5, -11), (5, -11)], [(5, -12), (-2, -3)], [(-1, -4), (1, -4), (4, -3), (6, -1), (7, 2), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-6, 5)], [(-2, -3), (1, -3), (4, -2), (6, 1)], [(2, -3), (5, -1), (6, 2), (6, 3), (5, 6), (2, 8)], [(6, 4), (4, 7), (1, 8), (-2, 8), (-5, 7), (-6, 5)], [(-3, 8), (-6, 6)]]),
-    (-10, 10, [[(3, -9), (3, 9), (4, 9)], [(4, -12), (4, 9)], [(4, -12), (-7, 4), (8, 4)], [(3, -9), (-6, 4)], [(-6, 3), (8, 3), (8, 4)]]),
-    (-10, 10, [[(-5, -12), (-6, -3)], [(-4, -11), (-5, -4)], [(-5, -12), (5, -12), (5, -11)], [(-4, -11), (5, -11)], [(-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-6, 5)], [(-6, -3), (-5, -3), (-3, -4), (1, -4), (4, -3), (6, 0)], [(2, -4), (5, -2), (6, 1), (6, 3), (5, 6), (2, 8)], [(6, 4), (4, 7), (1, 8), (-2, 8), (-5, 7), (-6, 5)], [(-3, 8), (-6, 6)]]),
-    (-10, 10, [[(4, -11), (5, -9), (6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1)], [(5, -10), (2, -11), (0, -11), (-3, -10)], [(-2, -11), (-4, -8), (-5, -3), (-5, 2), (-4, 6), (-1, 8)], [(-5, 4), (-3, 7), (0, 8), (1, 8), (4, 7), (6, 4)], [(2, 8), (5, 6), (6, 3), (6, 2), (5, -1), (2, -3)], [(6, 1), (4, -2), (1, -3), (0, -3), (-3, -2), (-5, 1)], [(-1, -3), (-4, -1), (-5, 2)]]),
-    (-10, 10, [[(-7, -12), (7, -12), (-3, 9)], [(-7, -12), (-7, -11), (6, -11)], [(6, -12), (-4, 9), (-3, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-4, -4), (-2, -3), (2, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (2, 8), (-2, 8), (-5, 7), (-6, 5), (-6, 2), (-5, 0), (-4, -1), (-2, -2), (2, -3), (4, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-4, -11), (-5, -9), (-5, -7), (-4, -5), (-2, -4), (2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-2, -3), (2, -4), (4, -5), (5, -7), (5, -9), (4, -11)], [(5, -10), (2, -11), (-2, -11), (-5, -10)], [(-6, 6), (-3, 8)], [(3, 8), (6, 6)]]),
-    (-10, 10, [[(5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6), (-5, 6), (-4, 8)], [(5, -5), (4, -2), (1, 0)], [(5, -4), (3, -1), (0, 0), (-1, 0), (-4, -1), (-6, -4)], [(-2, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-2, -11)], [(-6, -7), (-4, -10), (-1, -11), (0, -11), (3, -10), (5, -7)], [(1, -11), (4, -9), (5, -5), (5, 0), (4, 5), (2, 8)], [(3, 7), (0, 8), (-2, 8), (-5, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-1, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2), (0, -1)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-1, -11), (2, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -3), (0, -2)], [(-5, -9), (-2, -11)], [(3, -11), (6, -9)], [(6, -5), (2, -2)], [(0, -2), (0, 2), (1, 2), (1, -2)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-8, 9)], [(0, -9), (-7, 9), (-8, 9)], [(0, -9), (7, 9), (8, 9)], [(0, -12), (8, 9)], [(-5, 3), (5, 3)], [(-6, 4), (6, 4)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-6, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1)], [(-5, -11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2)], [(-5, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-6, 9)], [(-5, -1), (2, -1), (5, 0), (6, 2), (6, 5), (5, 7), (2, 8), (-5, 8)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)], [(8, -7), (7, -7), (6, -9), (5, -10), (3, -11), (-1, -11), (-3, -10), (-5, -7), (-6, -4), (-6, 1), (-5, 4), (-3, 7), (-1, 8), (3, 8), (5, 7), (6, 6), (7, 4), (8, 4)]]),
-    (-10, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-6, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-6, 9)], [(-5, -11), (1, -11), (4, -10), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (4, 7), (1, 8), (-5, 8)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-4, -11), (-4, 8)], [(-5, -12), (7, -12)], [(-4, -11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)], [(-4, -1), (2, -1)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]),
-    (-9, 9, [[(-5, -12), (-5, 9)], [(-4, -11), (-4, 9), (-5, 9)], [(-5, -12), (7, -12)], [(-4, -11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)], [(-4, -1), (2, -1)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 0), (3, 0)], [(8, -7), (7, -7), (6, -9), (5, -10), (3, -11), (-1, -11), (-3, -10), (-4, -9), (-5, -7), (-6, -4), (-6, 1), (-5, 4), (-4, 6), (-3, 7), (-1, 8), (3, 8), (5, 7), (6, 6), (7, 4), (7, 1), (3, 1), (3, 0)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (-6, -12), (-6, 9), (-7, 9)], [(7, -12), (6, -12), (6, 9), (7, 9)], [(7, -12), (7, 9)], [(-6, -2), (6, -2)], [(-6, -1), (6, -1)]]),
-    (-4, 5, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)]]),
-    (-8, 9, [[(4, -12), (4, 4), (3, 7), (1, 8), (-1, 8), (-3, 7), (-4, 4), (-5, 4)], [(4, -12), (5, -12), (5, 4), (4, 7), (3, 8), (1, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 4)]]),
-    (-10, 11, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(8, -12), (7, -12), (-5, 0)], [(8, -12), (-5, 1)], [(-2, -3), (7, 9), (8, 9)], [(-1, -3), (8, 9)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(-5, -12), (-4, -12), (-4, 8)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-7, -7), (-7, 9), (-8, 9)], [(-7, -7), (0, 9)], [(-8, -12), (0, 6)], [(8, -12), (0, 6)], [(7, -7), (0, 9)], [(7, -7), (7, 9), (8, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-6, -9), (-6, 9), (-7, 9)], [(-6, -9), (7, 9)], [(-7, -12), (6, 6)], [(6, -12), (6, 6)], [(6, -12), (7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1, -11), (-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11), (-1, -11)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1), (-5, -1)], [(-5, -11), (3, -11), (5, -10), (6, -8), (6, -5), (5, -3), (3, -2), (-5, -2)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1, -11), (-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8), (1, 8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11), (-1, -11)], [(1, 6), (6, 11), (7, 11)], [(1, 6), (2, 6), (7, 11)]]),
-    (-10, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-5, -1)], [(-5, -11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2), (-5, -2)], [(0, -1), (6, 9), (7, 9)], [(1, -1), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (2, -1), (4, 0), (5, 1), (6, 3), (6, 6), (5, 7), (2, 8), (-2, 8), (-4, 7), (-5, 6), (-7, 6)], [(7, -9), (5, -9), (4, -10), (2, -11), (-2, -11), (-5, -10), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (2, -2), (4, -1), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 9, [[(0, -11), (0, 9)], [(1, -11), (1, 9), (0, 9)], [(-6, -12), (7, -12), (7, -11)], [(-6, -12), (-6, -11), (7, -11)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)], [(-7, -12), (-6, -12), (-6, 3), (-5, 6), (-4, 7), (-1, 8), (1, 8), (4, 7), (5, 6), (6, 3), (6, -12), (7, -12)]]),
-    (-10, 10, [[(-8, -12), (0, 9)], [(-8, -12), (-7, -12), (0, 6)], [(8, -12), (7, -12), (0, 6)], [(8, -12), (0, 9)]]),
-    (-13, 13, [[(-11, -12), (-5, 9)], [(-11, -12), (-10, -12), (-5, 6)], [(0, -12), (-5, 6)], [(0, -9), (-5, 9)], [(0, -9), (5, 9)], [(0, -12), (5, 6)], [(11, -12), (10, -12), (5, 6)], [(11, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (6, 9), (7, 9)], [(-7, -12), (-6, -12), (7, 9)], [(7, -12), (6, -12), (-7, 9)], [(7, -12), (-6, 9), (-7, 9)]]),
-    (-9, 10, [[(-7, -12), (0, -2), (0, 9), (1, 9)], [(-7, -12), (-6, -12), (1, -2)], [(8, -12), (7, -12), (0, -2)], [(8, -12), (1, -2), (1, 9)]]),
-    (-10, 10, [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-7, -12), (7, -12)], [(-7, -12), (-7, -11), (6, -11)], [(-6, 8), (7, 8), (7, 9)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 6, [[(2, -12), (0, -11), (-1, -9), (-1, -6), (0, -5), (1, -5), (2, -6), (2, -7), (1, -8), (0, -8), (-1, -7)], [(0, -7), (0, -6), (1, -6), (1, -7), (0, -7)], [(0, -11), (-1, -7)], [(-1, -9), (0, -8)]]),
-    (-10, 10, [[(5, -5), (5, 9), (6, 9)], [(5, -5), (6, -5), (6, 9)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-10, 10, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (-1, -5), (2, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (2, 9), (-1, 9), (-3, 8), (-5, 6)], [(-5, -2), (-1, -4), (2, -4), (4, -3), (5, -2), (6, 1), (6, 3), (5, 6), (4, 7), (2, 8), (-1, 8), (-5, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)], [(6, -2), (5, -1), (4, -3), (2, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 5), (6, 6)]]),
-    (-10, 10, [[(5, -12), (5, 9), (6, 9)], [(5, -12), (6, -12), (6, 9)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-9, 9, [[(-5, 2), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)], [(-5, 1), (5, 1), (5, -1), (4, -3), (2, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 5), (6, 6)]]),
-    (-6, 8, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9), (1, 9)], [(5, -12), (5, -11), (3, -11), (1, -10)], [(2, -11), (1, -8), (1, 9)], [(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4), (4, -4)]]),
-    (-10, 10, [[(6, -5), (5, -5), (5, 10), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-4, 13), (-6, 13)], [(6, -5), (6, 10), (5, 13), (3, 15), (1, 16), (-2, 16), (-4, 15), (-6, 13)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-10, 10, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)], [(-5, -1), (-2, -3), (0, -4), (2, -4), (4, -3), (5, -1), (5, 9), (6, 9)]]),
-    (-4, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -9), (2, -10), (2, -11), (1, -12), (0, -12)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(0, -5), (0, 9), (1, 9)], [(0, -5), (1, -5), (1, 9)]]),
-    (-4, 5, [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -9), (2, -10), (2, -11), (1, -12), (0, -12)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(0, -5), (0, 16), (1, 16)], [(0, -5), (1, -5), (1, 16)]]),
-    (-10, 9, [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5, -12), (-5, 9)], [(6, -5), (5, -5), (-5, 5)], [(6, -5), (-5, 6)], [(-2, 2), (4, 9), (6, 9)], [(-1, 1), (6, 9)]]),
-    (-4, 5, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)]]),
-    (-15, 16, [[(-11, -5), (-11, 9), (-10, 9)], [(-11, -5), (-10, -5), (-10, 9)], [(-10, -1), (-7, -4), (-5, -5), (-2, -5), (0, -4), (1, -1), (1, 9)], [(-10, -1), (-7, -3), (-5, -4), (-3, -4), (-1, -3), (0, -1), (0, 9), (1, 9)], [(1, -1), (4, -4), (6, -5), (9, -5), (11, -4), (12, -1), (12, 9)], [(1, -1), (4, -3), (6, -4), (8, -4), (10, -3), (11, -1), (11, 9), (12, 9)]]),
-    (-10, 10, [[(-6, -5), (-6, 9), (-5, 9)], [(-6, -5), (-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)], [(-5, -1), (-2, -3), (0, -4), (2, -4), (4, -3), (5, -1), (5, 9), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)], [(-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7), (5, 6), (6, 3), (6, 1), (5, -2), (4, -3), (2, -4), (-1, -4)]]),
-    (-10, 10, [[(-6, -5), (-6, 16), (-5, 16)], [(-6, -5), (-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1, -5), (2, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (2, 9), (-1, 9), (-3, 8), (-5, 6)], [(-5, -2), (-1, -4), (2, -4), (4, -3), (5, -2), (6, 1), (6, 3), (5, 6), (4, 7), (2, 8), (-1, 8), (-5, 6)]]),
-    (-10, 10, [[(5, -5), (5, 16), (6, 16)], [(5, -5), (6, -5), (6, 16)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]),
-    (-7, 7, [[(-3, -5), (-3, 9), (-2, 9)], [(-3, -5), (-2, -5), (-2, 9)], [(-2, 1), (-1, -2), (1, -4), (3, -5), (6, -5)], [(-2, 1), (-1, -1), (1, -3), (3, -4), (6, -4), (6, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 3), (5, 4)], [(4, 3), (5, 5), (5, 6), (4, 8)], [(5, 7), (2, 8), (-1, 8), (-4, 7)], [(-3, 8), (-4, 6), (-5, 6)], [(6, -2), (5, -2), (4, -4)], [(5, -3), (2, -4), (-1, -4), (-4, -3)], [(-3, -4), (-4, -2), (-3, 0)], [(-4, -1), (-2, 0), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 6, [[(0, -12), (0, 9), (1, 9)], [(0, -12), (1, -12), (1, 9)], [(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4), (4, -4)]]),
-    (-10, 10, [[(-6, -5), (-6, 5), (-5, 8), (-3, 9), (0, 9), (2, 8), (5, 5)], [(-6, -5), (-5, -5), (-5, 5), (-4, 7), (-2, 8), (0, 8), (2, 7), (5, 5)], [(5, -5), (5, 9), (6, 9)], [(5, -5), (6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(-6, -5), (-5, -5), (0, 7)], [(6, -5), (5, -5), (0, 7)], [(6, -5), (0, 9)]]),
-    (-12, 12, [[(-9, -5), (-4, 9)], [(-9, -5), (-8, -5), (-4, 6)], [(0, -5), (-4, 6)], [(0, -2), (-4, 9)], [(0, -2), (4, 9)], [(0, -5), (4, 6)], [(9, -5), (8, -5), (4, 6)], [(9, -5), (4, 9)]]),
-    (-9, 9, [[(-6, -5), (5, 9), (6, 9)], [(-6, -5), (-5, -5), (6, 9)], [(6, -5), (5, -5), (-6, 9)], [(6, -5), (-5, 9), (-6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(-6, -5), (-5, -5), (0, 7)], [(6, -5), (5, -5), (0, 7), (-4, 16)], [(6, -5), (0, 9), (-3, 16), (-4, 16)]]),
-    (-9, 9, [[(4, -4), (-6, 9)], [(6, -5), (-4, 8)], [(-6, -5), (6, -5)], [(-6, -5), (-6, -4), (4, -4)], [(-4, 8), (6, 8), (6, 9)], [(-6, 9), (6, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]),
-]
-
-ROWMANS = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8, 0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9), (10, 8), (10, 7)]]),
-    (-5, 5, [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7), (-1, -6)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]),
-    (-8, 8, [[(0, -12), (0, 0)], [(-5, -9), (5, -3)], [(5, -9), (-5, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 5, [[(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)]]),
-    (-10, 10, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -1), (-7, 9), (7, 9)]]),
-    (-10, 10, [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(3, -12), (-7, 2), (8, 2)], [(3, -12), (3, 9)]]),
-    (-10, 10, [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]),
-    (-10, 10, [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11), (-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)]]),
-    (-10, 10, [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12), (-2, -12)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6, 6)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-5, 5, [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-9, 9, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (0, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (0, 9), (-7, 9)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]),
-    (-10, 8, [[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)]]),
-    (-10, 11, [[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6), (8, 4), (8, 1)], [(3, 1), (8, 1)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -2), (7, -2)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-8, 8, [[(4, -12), (4, 4), (3, 7), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4), (-6, 2)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]),
-    (-10, 7, [[(-6, -12), (-6, 9)], [(-6, 9), (6, 9)]]),
-    (-12, 12, [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)], [(8, -12), (8, 9)]]),
-    (-11, 11, [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]),
-    (-11, 11, [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(1, 5), (7, 11)]]),
-    (-11, 10, [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2), (-7, -2)], [(0, -2), (7, 9)]]),
-    (-10, 10, [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]),
-    (-8, 8, [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]),
-    (-11, 11, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)]]),
-    (-9, 9, [[(-8, -12), (0, 9)], [(8, -12), (0, 9)]]),
-    (-12, 12, [[(-10, -12), (-5, 9)], [(0, -12), (-5, 9)], [(0, -12), (5, 9)], [(10, -12), (5, 9)]]),
-    (-10, 10, [[(-7, -12), (7, 9)], [(7, -12), (-7, 9)]]),
-    (-9, 9, [[(-8, -12), (0, -2), (0, 9)], [(8, -12), (0, -2)]]),
-    (-10, 10, [[(7, -12), (-7, 9)], [(-7, -12), (7, -12)], [(-7, 9), (7, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 5, [[(1, -12), (0, -11), (-1, -9), (-1, -7), (0, -6), (1, -7), (0, -8)]]),
-    (-9, 10, [[(6, -5), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-10, 9, [[(-6, -12), (-6, 9)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(6, -12), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-5, 7, [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(6, -5), (6, 11), (5, 14), (4, 15), (2, 16), (-1, 16), (-3, 15)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-9, 10, [[(-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-4, 4, [[(-1, -12), (0, -11), (1, -12), (0, -13), (-1, -12)], [(0, -5), (0, 9)]]),
-    (-5, 5, [[(0, -12), (1, -11), (2, -12), (1, -13), (0, -12)], [(1, -5), (1, 12), (0, 15), (-2, 16), (-4, 16)]]),
-    (-9, 8, [[(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(-1, 1), (6, 9)]]),
-    (-4, 4, [[(0, -12), (0, 9)]]),
-    (-15, 15, [[(-11, -5), (-11, 9)], [(-11, -1), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -1), (0, 9)], [(0, -1), (3, -4), (5, -5), (8, -5), (10, -4), (11, -1), (11, 9)]]),
-    (-9, 10, [[(-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)]]),
-    (-10, 9, [[(-6, -5), (-6, 16)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6, 6)]]),
-    (-9, 10, [[(6, -5), (6, 16)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]),
-    (-7, 6, [[(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5)]]),
-    (-8, 9, [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0), (-2, 1), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]),
-    (-5, 7, [[(0, -12), (0, 5), (1, 8), (3, 9), (5, 9)], [(-3, -5), (4, -5)]]),
-    (-9, 10, [[(-5, -5), (-5, 5), (-4, 8), (-2, 9), (1, 9), (3, 8), (6, 5)], [(6, -5), (6, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9)]]),
-    (-11, 11, [[(-8, -5), (-4, 9)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)], [(8, -5), (4, 9)]]),
-    (-8, 9, [[(-5, -5), (6, 9)], [(6, -5), (-5, 9)]]),
-    (-8, 8, [[(-6, -5), (0, 9)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16)]]),
-    (-8, 9, [[(6, -5), (-5, 9)], [(-5, -5), (6, -5)], [(-5, 9), (6, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-]
-
-ROWMANT = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(0, -12), (-1, -11), (-1, -9), (0, -1)], [(0, -12), (0, 2), (1, 2)], [(0, -12), (1, -12), (1, 2)], [(1, -12), (2, -11), (2, -9), (1, -1)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -7), (6, -8), (5, -8), (5, -6), (7, -6), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 3), (-5, 3), (-5, 5), (-6, 5), (-6, 4)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(9, -3), (9, -4), (8, -4), (8, -2), (10, -2), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -3), (-2, 0), (2, 5), (5, 8), (7, 9), (9, 9), (10, 7), (10, 6)], [(-7, 8), (-8, 6), (-8, 3), (-7, 1), (-6, 0)], [(0, -5), (1, -9)], [(1, -7), (0, -11)], [(-4, -11), (-5, -7)], [(-4, -4), (-2, -1), (2, 4), (5, 7), (7, 8)], [(-4, 9), (-6, 8), (-7, 6), (-7, 3), (-6, 1), (-2, -3)], [(-5, -9), (-4, -5), (-1, -1), (3, 4), (6, 7), (8, 8), (9, 8), (10, 7)]]),
-    (-5, 6, [[(2, -10), (1, -9), (0, -9), (-1, -10), (-1, -11), (0, -12), (1, -12), (2, -11), (2, -8), (1, -6), (-1, -5)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(1, -9), (2, -8)], [(2, -10), (1, -6)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 13, [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-4, -10), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-4, 7)], [(4, 7), (5, 5), (6, 1), (6, -4), (5, -8), (4, -10)], [(-1, -12), (-3, -11), (-4, -9), (-5, -4), (-5, 1), (-4, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 6), (5, 1), (5, -4), (4, -9), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-1, -10), (-1, 9)], [(0, -10), (0, 8)], [(1, -12), (1, 9)], [(1, -12), (-2, -9), (-4, -8)], [(-5, 9), (5, 9)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-10, 10, [[(-6, -8), (-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9), (-5, -9), (-4, -8), (-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(5, -10), (6, -8), (6, -6), (5, -4)], [(2, -12), (4, -11), (5, -8), (5, -6), (4, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 7), (5, 7), (7, 6)], [(-4, 6), (1, 8), (5, 8), (6, 7)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9), (-5, -9), (-4, -8), (-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3)], [(4, -11), (5, -9), (5, -6), (4, -4)], [(1, -12), (3, -11), (4, -9), (4, -6), (3, -4), (1, -3)], [(-1, -3), (2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3), (-4, 4), (-4, 5), (-5, 6), (-6, 6)], [(5, 0), (6, 2), (6, 5), (5, 7)], [(1, -3), (3, -2), (4, -1), (5, 2), (5, 5), (4, 8), (2, 9)], [(-6, 4), (-6, 5), (-5, 5), (-5, 4), (-6, 4)]]),
-    (-10, 10, [[(1, -9), (1, 9)], [(2, -10), (2, 8)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-2, 9), (6, 9)], [(1, 8), (-1, 9)], [(1, 7), (0, 9)], [(3, 7), (4, 9)], [(3, 8), (5, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3), (-4, 4), (-4, 5), (-5, 6), (-6, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-6, 4), (-6, 5), (-5, 5), (-5, 4), (-6, 4)], [(-5, -12), (5, -12)], [(-5, -11), (3, -11)], [(-5, -10), (-1, -10), (3, -11), (5, -12)]]),
-    (-10, 10, [[(4, -9), (4, -8), (5, -8), (5, -9), (4, -9)], [(5, -10), (4, -10), (3, -9), (3, -8), (4, -7), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 0)], [(-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-4, 7)], [(5, 6), (6, 4), (6, 1), (5, -1)], [(0, -12), (-2, -11), (-3, -10), (-4, -8), (-5, -4), (-5, 3), (-4, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 1), (4, -2), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 5), (0, 9)], [(1, 0), (0, 2), (-1, 5), (-1, 9)], [(6, -6), (1, -1), (-1, 2), (-2, 5), (-2, 9), (0, 9)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-5, -10), (-4, -11), (-2, -11), (0, -10)], [(-7, -8), (-6, -9), (-4, -10), (-2, -10), (3, -9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-4, -11), (-5, -9), (-5, -6), (-4, -4)], [(4, -4), (5, -6), (5, -9), (4, -11)], [(-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-2, -3)], [(2, -3), (3, -4), (4, -6), (4, -9), (3, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-5, -1), (-6, 1), (-6, 5), (-5, 7)], [(5, 7), (6, 5), (6, 1), (5, -1)], [(-2, -3), (-4, -2), (-5, 1), (-5, 5), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 5), (5, 1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(-5, 5), (-5, 6), (-4, 6), (-4, 5), (-5, 5)], [(5, -3), (4, -1), (3, 0), (1, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 4), (-3, 5), (-3, 6), (-4, 7), (-5, 7)], [(-5, -2), (-6, -4), (-6, -7), (-5, -9)], [(4, -10), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6)], [(-1, 1), (-3, 0), (-4, -1), (-5, -4), (-5, -7), (-4, -10), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (5, -6), (5, 1), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 10, [[(-5, -7), (-5, -8), (-4, -8), (-4, -6), (-6, -6), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (1, -1)], [(5, -10), (6, -9), (6, -5), (5, -4)], [(2, -12), (4, -11), (5, -9), (5, -5), (4, -3), (3, -2)], [(0, -1), (0, 2), (1, 2), (1, -1), (0, -1)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 8)], [(-1, -9), (5, 9)], [(0, -9), (6, 9)], [(0, -12), (7, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-7, 8), (-8, 9)], [(-7, 8), (-5, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(6, 7), (8, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(-4, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(6, 0), (7, 2), (7, 5), (6, 7)], [(3, -2), (5, -1), (6, 1), (6, 6), (5, 8), (3, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 4)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)], [(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6)], [(1, -12), (3, -11), (5, -8), (6, -4), (6, 1), (5, 5), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (7, 9), (7, 3)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-11, 9, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 12, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 8), (7, 9), (7, 1)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(6, 2), (6, 7)], [(5, 1), (5, 7), (4, 8)], [(2, 1), (10, 1)], [(3, 1), (5, 2)], [(4, 1), (5, 3)], [(8, 1), (7, 3)], [(9, 1), (7, 2)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(5, -12), (5, 9)], [(6, -11), (6, 8)], [(7, -12), (7, 9)], [(-10, -12), (-2, -12)], [(2, -12), (10, -12)], [(-5, -2), (5, -2)], [(-10, 9), (-2, 9)], [(2, 9), (10, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(3, -12), (5, -11)], [(4, -12), (5, -10)], [(8, -12), (7, -10)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(-4, -12), (4, -12)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(2, -12), (1, -10)], [(3, -12), (1, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-8, -8, [[(1, -12), (1, 5), (0, 8), (-1, 9)], [(2, -11), (2, 5), (1, 8)], [(3, -12), (3, 5), (2, 8), (-1, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 4), (-5, 3), (-4, 3), (-3, 4), (-3, 5), (-4, 6), (-5, 6)], [(-5, 4), (-5, 5), (-4, 5), (-4, 4), (-5, 4)], [(-2, -12), (6, -12)], [(-1, -12), (1, -11)], [(0, -12), (1, -10)], [(4, -12), (3, -10)], [(5, -12), (3, -11)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(6, -11), (-5, 0)], [(-2, -2), (5, 9)], [(-1, -2), (6, 9)], [(-1, -4), (7, 9)], [(-10, -12), (-2, -12)], [(3, -12), (9, -12)], [(-10, 9), (-2, 9)], [(2, 9), (9, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (6, -11)], [(8, -12), (6, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 7), (3, 9)], [(5, 7), (8, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -11), (-3, 8)], [(-2, -12), (-2, 9)], [(-7, -12), (1, -12)], [(-7, 9), (8, 9), (8, 3)], [(-6, -12), (-4, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-2, -10)], [(0, -12), (-2, -11)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)], [(3, 9), (8, 8)], [(5, 9), (8, 7)], [(6, 9), (8, 6)], [(7, 9), (8, 3)]]),
-    (-13, 13, [[(-8, -12), (-8, 8)], [(-8, -12), (-1, 9)], [(-7, -12), (-1, 6)], [(-6, -12), (0, 6)], [(6, -12), (-1, 9)], [(6, -12), (6, 9)], [(7, -11), (7, 8)], [(8, -12), (8, 9)], [(-11, -12), (-6, -12)], [(6, -12), (11, -12)], [(-11, 9), (-5, 9)], [(3, 9), (11, 9)], [(-10, -12), (-8, -11)], [(9, -12), (8, -10)], [(10, -12), (8, -11)], [(-8, 8), (-10, 9)], [(-8, 8), (-6, 9)], [(6, 8), (4, 9)], [(6, 7), (5, 9)], [(8, 7), (9, 9)], [(8, 8), (10, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 8)], [(-7, -12), (7, 9)], [(-6, -12), (6, 6)], [(-5, -12), (7, 6)], [(7, -11), (7, 9)], [(-10, -12), (-5, -12)], [(4, -12), (10, -12)], [(-10, 9), (-4, 9)], [(-9, -12), (-7, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 8), (-5, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-4, -1)], [(6, -10), (7, -8), (7, -5), (6, -3)], [(3, -12), (5, -11), (6, -9), (6, -4), (5, -2), (3, -1)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)], [(-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 12), (5, 14), (7, 14), (8, 12), (8, 10)], [(4, 10), (5, 12), (6, 13), (7, 13)], [(3, 6), (5, 11), (6, 12), (7, 12), (8, 11)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2), (-4, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(0, -2), (2, -1), (3, 1), (5, 7), (6, 9), (8, 9), (9, 7), (9, 5)], [(5, 5), (6, 7), (7, 8), (8, 8)], [(2, -1), (3, 0), (6, 6), (7, 7), (8, 7), (9, 6)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-10, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3), (-7, 9), (-6, 6)]]),
-    (-10, 10, [[(-8, -12), (-8, -6)], [(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(8, -12), (8, -6)], [(-8, -12), (8, -12)], [(-4, 9), (4, 9)], [(-7, -12), (-8, -6)], [(-6, -12), (-8, -9)], [(-5, -12), (-8, -10)], [(-3, -12), (-8, -11)], [(3, -12), (8, -11)], [(5, -12), (8, -10)], [(6, -12), (8, -9)], [(7, -12), (8, -6)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -11)], [(-6, -11), (-6, 4), (-5, 6)], [(-5, -12), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(-10, -12), (-2, -12)], [(4, -12), (10, -12)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)]]),
-    (-10, 10, [[(-7, -12), (0, 9)], [(-6, -12), (0, 6), (0, 9)], [(-5, -12), (1, 6)], [(7, -11), (0, 9)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-8, -12), (-6, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(8, -12), (7, -11)]]),
-    (-12, 12, [[(-8, -12), (-4, 9)], [(-7, -12), (-4, 4), (-4, 9)], [(-6, -12), (-3, 4)], [(0, -12), (-3, 4), (-4, 9)], [(0, -12), (4, 9)], [(1, -12), (4, 4), (4, 9)], [(2, -12), (5, 4)], [(8, -11), (5, 4), (4, 9)], [(-11, -12), (-3, -12)], [(0, -12), (2, -12)], [(5, -12), (11, -12)], [(-10, -12), (-7, -11)], [(-9, -12), (-7, -10)], [(-5, -12), (-6, -10)], [(-4, -12), (-6, -11)], [(6, -12), (8, -11)], [(10, -12), (8, -11)]]),
-    (-10, 10, [[(-7, -12), (5, 9)], [(-6, -12), (6, 9)], [(-5, -12), (7, 9)], [(6, -11), (-6, 8)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-8, -12), (-5, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(4, -12), (6, -11)], [(8, -12), (6, -11)], [(-6, 8), (-8, 9)], [(-6, 8), (-4, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(5, 7), (8, 9)]]),
-    (-11, 11, [[(-8, -12), (-1, -1), (-1, 9)], [(-7, -12), (0, -1), (0, 8)], [(-6, -12), (1, -1), (1, 9)], [(7, -11), (1, -1)], [(-10, -12), (-3, -12)], [(4, -12), (10, -12)], [(-4, 9), (4, 9)], [(-9, -12), (-7, -11)], [(-4, -12), (-6, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-10, 10, [[(7, -12), (-7, -12), (-7, -6)], [(5, -12), (-7, 9)], [(6, -12), (-6, 9)], [(7, -12), (-5, 9)], [(-7, 9), (7, 9), (7, 3)], [(-6, -12), (-7, -6)], [(-5, -12), (-7, -9)], [(-4, -12), (-7, -10)], [(-2, -12), (-7, -11)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 6, [[(2, -12), (0, -11), (-1, -9), (-1, -6), (0, -5), (1, -5), (2, -6), (2, -7), (1, -8), (0, -8), (-1, -7)], [(0, -7), (0, -6), (1, -6), (1, -7), (0, -7)], [(0, -11), (-1, -7)], [(-1, -9), (0, -8)]]),
-    (-9, 11, [[(-4, -2), (-4, -3), (-3, -3), (-3, -1), (-5, -1), (-5, -3), (-4, -4), (-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(4, -3), (5, -1), (5, 6), (6, 8)], [(2, -5), (3, -4), (4, -2), (4, 6), (5, 8), (8, 9), (9, 9)], [(4, 0), (3, 1), (-2, 2), (-5, 3), (-6, 5), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (4, 6)], [(-4, 3), (-5, 5), (-5, 6), (-4, 8)], [(3, 1), (-1, 2), (-3, 3), (-4, 5), (-4, 6), (-3, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9), (-5, 8), (-3, 8)], [(-5, -11), (-5, 7)], [(-9, -12), (-4, -12), (-4, 8)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)]]),
-    (-10, 9, [[(5, -1), (5, -2), (4, -2), (4, 0), (6, 0), (6, -2), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)]]),
-    (-10, 11, [[(4, -12), (4, 9), (9, 9)], [(5, -11), (5, 8)], [(1, -12), (6, -12), (6, 9)], [(4, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (4, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(2, -12), (4, -11)], [(3, -12), (4, -10)], [(6, 7), (7, 9)], [(6, 8), (8, 9)]]),
-    (-10, 9, [[(-5, 1), (6, 1), (6, -1), (5, -3), (4, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 0), (5, -1), (4, -3)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(4, 1), (4, -2), (3, -4), (1, -5)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)]]),
-    (-7, 7, [[(5, -10), (5, -11), (4, -11), (4, -9), (6, -9), (6, -11), (5, -12), (2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 9)], [(0, -10), (-1, -7), (-1, 8)], [(2, -12), (1, -11), (0, -9), (0, 9)], [(-5, -5), (4, -5)], [(-5, 9), (3, 9)], [(-2, 8), (-4, 9)], [(-2, 7), (-3, 9)], [(0, 7), (1, 9)], [(0, 8), (2, 9)]]),
-    (-9, 10, [[(6, -4), (7, -3), (8, -4), (7, -5), (6, -5), (4, -4), (3, -3)], [(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3), (5, 1), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)], [(-3, -3), (-4, -1), (-4, 1), (-3, 3)], [(3, 3), (4, 1), (4, -1), (3, -3)], [(-1, -5), (-2, -4), (-3, -2), (-3, 2), (-2, 4), (-1, 5)], [(1, 5), (2, 4), (3, 2), (3, -2), (2, -4), (1, -5)], [(-4, 3), (-5, 4), (-6, 6), (-6, 7), (-5, 9), (-4, 10), (-1, 11), (3, 11), (6, 12), (7, 13)], [(-4, 9), (-1, 10), (3, 10), (6, 11)], [(-6, 7), (-5, 8), (-2, 9), (3, 9), (6, 10), (7, 12), (7, 13), (6, 15), (3, 16), (-3, 16), (-6, 15), (-7, 13), (-7, 12), (-6, 10), (-3, 9)], [(-3, 16), (-5, 15), (-6, 13), (-6, 12), (-5, 10), (-3, 9)]]),
-    (-11, 12, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12), (-4, -12), (-4, 9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -3), (7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)], [(3, -5), (4, -4), (5, -1), (5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, -10), (1, -10), (1, -12), (-1, -12)], [(0, -12), (0, -10)], [(-1, -11), (1, -11)], [(-1, -5), (-1, 9)], [(0, -4), (0, 8)], [(-4, -5), (1, -5), (1, 9)], [(-4, 9), (4, 9)], [(-3, -5), (-1, -4)], [(-2, -5), (-1, -3)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-7, 6, [[(0, -12), (0, -10), (2, -10), (2, -12), (0, -12)], [(1, -12), (1, -10)], [(0, -11), (2, -11)], [(0, -5), (0, 12), (-1, 15), (-2, 16)], [(1, -4), (1, 11), (0, 14)], [(-3, -5), (2, -5), (2, 11), (1, 14), (0, 15), (-2, 16), (-5, 16), (-6, 15), (-6, 13), (-4, 13), (-4, 15), (-5, 15), (-5, 14)], [(-2, -5), (0, -4)], [(-1, -5), (0, -3)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12), (-4, -12), (-4, 9)], [(5, -4), (-4, 5)], [(0, 1), (7, 9)], [(0, 2), (6, 9)], [(-1, 2), (5, 9)], [(2, -5), (9, -5)], [(-9, 9), (-1, 9)], [(2, 9), (9, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(3, -5), (5, -4)], [(8, -5), (5, -4)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 7), (3, 9)], [(4, 7), (8, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(-4, -12), (1, -12), (1, 9)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-17, 17, [[(-12, -5), (-12, 9)], [(-11, -4), (-11, 8)], [(-15, -5), (-10, -5), (-10, 9)], [(-10, -1), (-9, -3), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 9)], [(-1, -3), (0, 0), (0, 8)], [(-3, -5), (-2, -4), (-1, -1), (-1, 9)], [(1, -1), (2, -3), (3, -4), (5, -5), (8, -5), (10, -4), (11, -3), (12, 0), (12, 9)], [(10, -3), (11, 0), (11, 8)], [(8, -5), (9, -4), (10, -1), (10, 9)], [(-15, 9), (-7, 9)], [(-4, 9), (4, 9)], [(7, 9), (15, 9)], [(-14, -5), (-12, -4)], [(-13, -5), (-12, -3)], [(-12, 8), (-14, 9)], [(-12, 7), (-13, 9)], [(-10, 7), (-9, 9)], [(-10, 8), (-8, 9)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)], [(10, 8), (8, 9)], [(10, 7), (9, 9)], [(12, 7), (13, 9)], [(12, 8), (14, 9)]]),
-    (-11, 12, [[(-6, -5), (-6, 9)], [(-5, -4), (-5, 8)], [(-9, -5), (-4, -5), (-4, 9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -3), (7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)], [(3, -5), (4, -4), (5, -1), (5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10, 9)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (6, 0), (5, -2)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 0), (4, -3), (3, -4), (1, -5)]]),
-    (-11, 10, [[(-6, -5), (-6, 16)], [(-5, -4), (-5, 15)], [(-9, -5), (-4, -5), (-4, 16)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-9, 16), (-1, 16)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(-6, 15), (-8, 16)], [(-6, 14), (-7, 16)], [(-4, 14), (-3, 16)], [(-4, 15), (-2, 16)]]),
-    (-10, 10, [[(4, -4), (4, 16)], [(5, -3), (5, 15)], [(3, -4), (5, -4), (6, -5), (6, 16)], [(4, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (4, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(1, 16), (9, 16)], [(4, 15), (2, 16)], [(4, 14), (3, 16)], [(6, 14), (7, 16)], [(6, 15), (8, 16)]]),
-    (-9, 8, [[(-4, -5), (-4, 9)], [(-3, -4), (-3, 8)], [(-7, -5), (-2, -5), (-2, 9)], [(5, -3), (5, -4), (4, -4), (4, -2), (6, -2), (6, -4), (5, -5), (3, -5), (1, -4), (-1, -2), (-2, 1)], [(-7, 9), (1, 9)], [(-6, -5), (-4, -4)], [(-5, -5), (-4, -3)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)]]),
-    (-8, 9, [[(5, -3), (6, -5), (6, -1), (5, -3), (4, -4), (2, -5), (-2, -5), (-4, -4), (-5, -3), (-5, -1), (-4, 1), (-2, 2), (3, 3), (5, 4), (6, 7)], [(-4, -4), (-5, -1)], [(-4, 0), (-2, 1), (3, 2), (5, 3)], [(6, 4), (5, 8)], [(-5, -3), (-4, -1), (-2, 0), (3, 1), (5, 2), (6, 4), (6, 7), (5, 8), (3, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 5), (-5, 9), (-4, 7)]]),
-    (-7, 8, [[(-2, -10), (-2, 4), (-1, 7), (0, 8), (2, 9), (4, 9), (6, 8), (7, 6)], [(-1, -10), (-1, 5), (0, 7)], [(-2, -10), (0, -12), (0, 5), (1, 8), (2, 9)], [(-5, -5), (4, -5)]]),
-    (-11, 12, [[(-6, -5), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (1, 9), (3, 8), (4, 7), (5, 5)], [(-5, -4), (-5, 5), (-4, 7)], [(-9, -5), (-4, -5), (-4, 5), (-3, 8), (-2, 9)], [(5, -5), (5, 9), (10, 9)], [(6, -4), (6, 8)], [(2, -5), (7, -5), (7, 9)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-9, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (0, 9)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)], [(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]),
-    (-12, 12, [[(-8, -5), (-4, 9)], [(-7, -5), (-4, 6)], [(-6, -5), (-3, 6)], [(0, -5), (-3, 6), (-4, 9)], [(0, -5), (4, 9)], [(1, -5), (4, 6)], [(0, -5), (2, -5), (5, 6)], [(8, -4), (5, 6), (4, 9)], [(-11, -5), (-3, -5)], [(5, -5), (11, -5)], [(-10, -5), (-7, -4)], [(-4, -5), (-6, -4)], [(6, -5), (8, -4)], [(10, -5), (8, -4)]]),
-    (-10, 10, [[(-6, -5), (4, 9)], [(-5, -5), (5, 9)], [(-4, -5), (6, 9)], [(5, -4), (-5, 8)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)], [(1, 9), (8, 9)], [(-7, -5), (-5, -4)], [(-2, -5), (-4, -4)], [(3, -5), (5, -4)], [(7, -5), (5, -4)], [(-5, 8), (-7, 9)], [(-5, 8), (-3, 9)], [(4, 8), (2, 9)], [(5, 8), (7, 9)]]),
-    (-10, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (-2, 13), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8, 14)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)], [(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]),
-    (-9, 9, [[(4, -5), (-6, 9)], [(5, -5), (-5, 9)], [(6, -5), (-4, 9)], [(6, -5), (-6, -5), (-6, -1)], [(-6, 9), (6, 9), (6, 5)], [(-5, -5), (-6, -1)], [(-4, -5), (-6, -2)], [(-3, -5), (-6, -3)], [(-1, -5), (-6, -4)], [(1, 9), (6, 8)], [(3, 9), (6, 7)], [(4, 9), (6, 6)], [(5, 9), (6, 5)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]),
-]
-
-SCRIPTC = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(3, -12), (2, -11), (0, 1)], [(3, -11), (0, 1)], [(3, -12), (4, -11), (0, 1)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-9, 9, [[(-2, -12), (-4, -5)], [(-1, -12), (-4, -5)], [(7, -12), (5, -5)], [(8, -12), (5, -5)]]),
-    (-10, 11, [[(1, -12), (-6, 16)], [(7, -12), (0, 16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]),
-    (-10, 11, [[(2, -16), (-6, 13)], [(7, -16), (-1, 13)], [(8, -8), (7, -7), (8, -6), (9, -7), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -4), (9, -3), (10, -2), (11, -3), (11, -4), (10, -5), (9, -5), (7, -4), (5, -2), (0, 6), (-2, 8), (-4, 9), (-7, 9), (-10, 8), (-11, 6), (-11, 4), (-10, 2), (-9, 1), (-7, 0), (-2, -2), (0, -3), (2, -5), (3, -7), (3, -9), (2, -11), (0, -12), (-2, -11), (-3, -9), (-3, -6), (-2, 0), (-1, 3), (1, 6), (3, 8), (5, 9), (7, 9), (8, 7), (8, 6)], [(-7, 9), (-9, 8), (-10, 6), (-10, 4), (-9, 2), (-8, 1), (-2, -2)], [(-3, -6), (-2, -1), (-1, 2), (1, 5), (3, 7), (5, 8), (7, 8), (8, 7)]]),
-    (-5, 6, [[(3, -10), (2, -11), (3, -12), (4, -11), (4, -10), (3, -8), (1, -6)]]),
-    (-7, 8, [[(8, -16), (4, -13), (1, -10), (-1, -7), (-3, -3), (-4, 2), (-4, 6), (-3, 11), (-2, 14), (-1, 16)], [(4, -13), (1, -9), (-1, -5), (-2, -2), (-3, 3), (-3, 8), (-2, 13), (-1, 16)]]),
-    (-8, 7, [[(1, -16), (2, -14), (3, -11), (4, -6), (4, -2), (3, 3), (1, 7), (-1, 10), (-4, 13), (-8, 16)], [(1, -16), (2, -13), (3, -8), (3, -3), (2, 2), (1, 5), (-1, 9), (-4, 13)]]),
-    (-8, 9, [[(2, -12), (2, 0)], [(-3, -9), (7, -3)], [(7, -9), (-3, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-11, 11, [[(13, -16), (-13, 16)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-3, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]),
-    (-10, 11, [[(2, -8), (-3, 9)], [(4, -12), (-2, 9)], [(4, -12), (1, -9), (-2, -7), (-4, -6)], [(3, -9), (-1, -7), (-4, -6)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (5, -3), (2, -1), (-2, 1), (-5, 3), (-7, 5), (-9, 9)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (-2, 1)], [(-8, 7), (-7, 6), (-5, 6), (0, 8), (3, 8), (5, 7), (6, 5)], [(-5, 6), (0, 9), (3, 9), (5, 8), (6, 5)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (4, -3), (1, -2)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -2), (3, -1), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (1, 9)]]),
-    (-10, 11, [[(6, -11), (0, 9)], [(7, -12), (1, 9)], [(7, -12), (-8, 3), (8, 3)]]),
-    (-10, 11, [[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (4, -11), (9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -4), (3, -3), (4, -2), (5, 0), (5, 3), (4, 6), (2, 8), (0, 9)]]),
-    (-10, 11, [[(7, -9), (6, -8), (7, -7), (8, -8), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-5, 0), (-6, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 6), (-5, 8)], [(0, 9), (2, 8), (4, 6), (5, 4), (5, 0), (4, -2)]]),
-    (-10, 11, [[(-4, -12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (1, 0), (-1, 3), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)], [(-4, -10), (-2, -11), (0, -11), (5, -9), (7, -9), (8, -10), (9, -12)]]),
-    (-10, 11, [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3), (-1, -2), (2, -2), (6, -3), (7, -4), (8, -6), (8, -9), (7, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-2, -10), (-3, -8), (-3, -5), (-2, -3), (-1, -2)], [(2, -2), (5, -3), (6, -4), (7, -6), (7, -9), (6, -11), (4, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(-1, -2), (-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(0, 9), (3, 8), (4, 7), (5, 5), (5, 1), (4, -1)]]),
-    (-10, 11, [[(7, -5), (6, -3), (4, -1), (2, 0), (-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12), (6, -11), (7, -10), (8, -8), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)], [(-3, -1), (-4, -3), (-4, -7), (-3, -9), (-1, -11), (1, -12)], [(6, -11), (7, -9), (7, -4), (6, 0), (5, 3), (3, 6), (1, 8), (-1, 9)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (1, -2), (-1, -1), (-1, 1), (0, 2), (2, 2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-13, 10, [[(6, -12), (4, -10), (2, -7), (-1, -2), (-3, 1), (-6, 5), (-9, 8), (-11, 9), (-13, 9), (-14, 8), (-14, 6), (-13, 5), (-12, 6), (-13, 7)], [(6, -12), (5, -8), (3, 2), (2, 9)], [(6, -12), (3, 9)], [(2, 9), (2, 7), (1, 4), (0, 2), (-2, 0), (-4, -1), (-6, -1), (-7, 0), (-7, 2), (-6, 5), (-3, 8), (0, 9), (4, 9), (6, 8)]]),
-    (-12, 12, [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6), (-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3), (-8, -4), (-8, -6), (-7, -8), (-5, -10), (-3, -11), (0, -12), (6, -12), (8, -11), (9, -9), (9, -7), (8, -5), (6, -4), (2, -3), (0, -3)], [(6, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4)], [(2, -3), (5, -2), (6, -1), (7, 1), (7, 4), (6, 7), (5, 8), (3, 9), (1, 9), (0, 8), (0, 6), (1, 3)], [(2, -3), (4, -2), (5, -1), (6, 1), (6, 4), (5, 7), (3, 9)]]),
-    (-10, 11, [[(-7, -10), (-8, -8), (-8, -6), (-7, -4), (-4, -3), (-1, -3), (3, -4), (5, -5), (7, -7), (8, -9), (8, -11), (7, -12), (5, -12), (2, -11), (-1, -8), (-3, -5), (-5, -1), (-6, 3), (-6, 6), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 2), (5, 0), (3, 0), (1, 1), (0, 3)], [(5, -12), (3, -11), (0, -8), (-2, -5), (-4, -1), (-5, 3), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 11, [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-8, 5), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6), (7, 2), (8, -3), (8, -6), (7, -9), (5, -11), (3, -12), (-2, -12), (-5, -11), (-7, -9), (-8, -7), (-8, -5), (-7, -4), (-5, -4), (-4, -5), (-3, -7)]]),
-    (-9, 10, [[(5, -9), (4, -8), (4, -6), (5, -5), (7, -5), (8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (0, -11), (-1, -10), (-2, -8), (-2, -6), (-1, -4), (1, -3)], [(2, -12), (0, -10), (-1, -8), (-1, -5), (1, -3)], [(1, -3), (-1, -3), (-4, -2), (-6, 0), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 2), (5, 0), (3, 0), (1, 1), (0, 3)], [(-1, -3), (-3, -2), (-5, 0), (-6, 2), (-6, 6), (-5, 8)]]),
-    (-11, 10, [[(5, -10), (4, -8), (2, -3), (0, 3), (-1, 5), (-3, 8), (-5, 9)], [(-1, -6), (-2, -4), (-4, -3), (-6, -3), (-7, -5), (-7, -7), (-6, -9), (-4, -11), (-1, -12), (9, -12), (6, -11), (5, -10), (4, -7), (2, 1), (1, 4), (0, 6), (-2, 8), (-5, 9), (-7, 9), (-9, 8), (-10, 7), (-10, 6), (-9, 5), (-8, 6), (-9, 7)], [(1, -12), (5, -11), (6, -11)], [(-3, 1), (-2, 0), (0, -1), (4, -1), (6, -2), (8, -5), (6, 2)]]),
-    (-11, 11, [[(-8, -9), (-9, -7), (-9, -5), (-8, -3), (-6, -2), (-3, -2), (0, -3), (2, -4), (5, -7), (6, -10), (6, -11), (5, -12), (4, -12), (2, -11), (0, -9), (-1, -7), (-2, -4), (-2, -1), (-1, 1), (1, 2), (3, 2), (5, 1), (7, -1), (8, -3)], [(5, -12), (3, -11), (1, -9), (0, -7), (-1, -4), (-1, 0), (1, 2)], [(8, -3), (7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 5), (-8, 4), (-7, 5), (-8, 6)], [(7, 1), (5, 4), (3, 6), (0, 8), (-3, 9)]]),
-    (-12, 12, [[(-6, -6), (-7, -7), (-7, -9), (-6, -11), (-3, -12), (0, -12), (-3, -1), (-5, 5), (-6, 7), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11, 5), (-10, 6), (-11, 7)], [(0, -12), (-3, -3), (-4, 0), (-6, 5), (-7, 7), (-9, 9)], [(-8, 2), (-7, 1), (-5, 0), (4, -3), (6, -4), (9, -6), (11, -8), (12, -10), (12, -11), (11, -12), (10, -12), (8, -11), (6, -8), (5, -6), (3, 0), (2, 4), (2, 7), (4, 9), (5, 9), (7, 8), (9, 6)], [(10, -12), (8, -10), (6, -6), (4, 0), (3, 4), (3, 7), (4, 9)]]),
-    (-9, 7, [[(5, -10), (3, -7), (1, -2), (-1, 3), (-2, 5), (-4, 8), (-6, 9)], [(7, -6), (5, -4), (2, -3), (-1, -3), (-3, -4), (-4, -6), (-4, -8), (-3, -10), (-1, -11), (3, -12), (7, -12), (5, -10), (4, -8), (2, -2), (0, 4), (-1, 6), (-3, 8), (-6, 9), (-8, 9), (-9, 8), (-9, 6), (-8, 5), (-7, 6), (-8, 7)]]),
-    (-9, 8, [[(7, -12), (5, -10), (3, -7), (1, -2), (-2, 7), (-4, 11)], [(7, -5), (5, -3), (2, -2), (-1, -2), (-3, -3), (-4, -5), (-4, -7), (-3, -9), (-1, -11), (3, -12), (7, -12), (5, -9), (4, -7), (1, 2), (-1, 6), (-2, 8), (-4, 11), (-5, 12), (-7, 13), (-8, 12), (-8, 10), (-7, 8), (-5, 6), (-3, 5), (0, 4), (4, 3)]]),
-    (-12, 12, [[(-6, -6), (-7, -7), (-7, -9), (-5, -11), (-2, -12), (0, -12), (-3, -1), (-5, 5), (-6, 7), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11, 5), (-10, 6), (-11, 7)], [(0, -12), (-3, -3), (-4, 0), (-6, 5), (-7, 7), (-9, 9)], [(8, -11), (5, -7), (3, -5), (1, -4), (-2, -3)], [(11, -11), (10, -10), (11, -9), (12, -10), (12, -11), (11, -12), (10, -12), (8, -11), (5, -6), (4, -5), (2, -4), (-2, -3)], [(-2, -3), (1, -2), (2, 0), (3, 7), (4, 9)], [(-2, -3), (0, -2), (1, 0), (2, 7), (4, 9), (5, 9), (7, 8), (9, 6)]]),
-    (-9, 9, [[(-5, -9), (-6, -7), (-6, -5), (-5, -3), (-3, -2), (0, -2), (3, -3), (5, -4), (8, -7), (9, -10), (9, -11), (8, -12), (7, -12), (5, -11), (4, -10), (2, -7), (-2, 3), (-3, 5), (-5, 8), (-7, 9)], [(4, -10), (2, -6), (0, 1), (-1, 4), (-2, 6), (-4, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (0, 9), (3, 9), (5, 8), (7, 6)]]),
-    (-14, 14, [[(0, -12), (-4, -3), (-7, 3), (-9, 6), (-11, 8), (-13, 9), (-15, 9), (-16, 8), (-16, 6), (-15, 5), (-14, 6), (-15, 7)], [(0, -12), (-2, -5), (-3, -1), (-4, 4), (-4, 8), (-2, 9)], [(0, -12), (-1, -8), (-2, -3), (-3, 4), (-3, 8), (-2, 9)], [(9, -12), (5, -3), (0, 6), (-2, 9)], [(9, -12), (7, -5), (6, -1), (5, 4), (5, 8), (7, 9), (8, 9), (10, 8), (12, 6)], [(9, -12), (8, -8), (7, -3), (6, 4), (6, 8), (7, 9)]]),
-    (-11, 12, [[(0, -12), (-1, -8), (-3, -2), (-5, 3), (-6, 5), (-8, 8), (-10, 9), (-12, 9), (-13, 8), (-13, 6), (-12, 5), (-11, 6), (-12, 7)], [(0, -12), (0, -7), (1, 4), (2, 9)], [(0, -12), (1, -7), (2, 4), (2, 9)], [(14, -11), (13, -10), (14, -9), (15, -10), (15, -11), (14, -12), (12, -12), (10, -11), (8, -8), (7, -6), (5, -1), (3, 5), (2, 9)]]),
-    (-10, 11, [[(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 1), (8, -3), (8, -7), (7, -10), (6, -11), (5, -11), (3, -10), (1, -8), (-1, -4), (-2, 1), (-2, 4)], [(-1, -11), (-3, -8), (-5, -4), (-6, 0), (-6, 4), (-5, 7), (-3, 9)]]),
-    (-12, 11, [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6), (-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3), (-8, -4), (-8, -6), (-7, -8), (-5, -10), (-3, -11), (0, -12), (4, -12), (7, -11), (8, -10), (9, -8), (9, -5), (8, -3), (7, -2), (4, -1), (2, -1), (0, -2)], [(4, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (4, -1)]]),
-    (-10, 11, [[(3, -8), (3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9), (8, -5), (7, -2), (5, 1), (1, 5), (-2, 7), (-4, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (1, 9), (4, 9), (6, 8), (8, 6)], [(5, -12), (6, -11), (7, -9), (7, -5), (6, -2), (4, 1), (1, 4), (-3, 7), (-7, 9)]]),
-    (-12, 12, [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6), (-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3), (-8, -4), (-8, -6), (-7, -8), (-5, -10), (-3, -11), (0, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (4, -3), (0, -3)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(0, -3), (3, -2), (4, 0), (5, 7), (6, 9)], [(0, -3), (2, -2), (3, 0), (4, 7), (6, 9), (7, 9), (9, 8), (11, 6)]]),
-    (-10, 10, [[(-4, -9), (-5, -7), (-5, -5), (-4, -3), (-2, -2), (1, -2), (4, -3), (6, -4), (9, -7), (10, -10), (10, -11), (9, -12), (8, -12), (6, -11), (5, -10), (4, -8), (3, -5), (1, 2), (0, 5), (-2, 8), (-4, 9)], [(4, -8), (3, -4), (2, 3), (1, 6), (-1, 8), (-4, 9), (-7, 9), (-9, 8), (-10, 6), (-10, 5), (-9, 4), (-8, 5), (-9, 6)]]),
-    (-9, 9, [[(7, -10), (6, -8), (4, -3), (2, 3), (1, 5), (-1, 8), (-3, 9)], [(1, -6), (0, -4), (-2, -3), (-4, -3), (-5, -5), (-5, -7), (-4, -9), (-2, -11), (1, -12), (10, -12), (8, -11), (7, -10), (6, -7), (4, 1), (3, 4), (2, 6), (0, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 7), (-8, 6), (-7, 5), (-6, 6), (-7, 7)], [(3, -12), (7, -11), (8, -11)]]),
-    (-11, 11, [[(-10, -8), (-8, -11), (-6, -12), (-5, -12), (-3, -10), (-3, -7), (-4, -4), (-7, 4), (-7, 7), (-6, 9)], [(-5, -12), (-4, -10), (-4, -7), (-7, 1), (-8, 4), (-8, 7), (-6, 9), (-4, 9), (-2, 8), (1, 5), (3, 2), (4, 0)], [(8, -12), (4, 0), (3, 4), (3, 7), (5, 9), (6, 9), (8, 8), (10, 6)], [(9, -12), (5, 0), (4, 4), (4, 7), (5, 9)]]),
-    (-11, 10, [[(-10, -8), (-8, -11), (-6, -12), (-5, -12), (-3, -10), (-3, -7), (-4, -3), (-6, 4), (-6, 7), (-5, 9)], [(-5, -12), (-4, -10), (-4, -7), (-6, 0), (-7, 4), (-7, 7), (-5, 9), (-4, 9), (-1, 8), (2, 5), (4, 2), (6, -2), (7, -5), (8, -9), (8, -11), (7, -12), (6, -12), (5, -11), (4, -9), (4, -6), (5, -4), (7, -2), (9, -1), (11, -1)]]),
-    (-12, 11, [[(-9, -6), (-10, -6), (-11, -7), (-11, -9), (-10, -11), (-8, -12), (-4, -12), (-5, -10), (-6, -6), (-7, 3), (-8, 9)], [(-6, -6), (-6, 3), (-7, 9)], [(4, -12), (2, -10), (0, -6), (-3, 3), (-5, 7), (-7, 9)], [(4, -12), (3, -10), (2, -6), (1, 3), (0, 9)], [(2, -6), (2, 3), (1, 9)], [(14, -12), (12, -11), (10, -9), (8, -6), (5, 3), (3, 7), (1, 9)]]),
-    (-10, 10, [[(-2, -7), (-3, -6), (-5, -6), (-6, -7), (-6, -9), (-5, -11), (-3, -12), (-1, -12), (1, -11), (2, -9), (2, -6), (1, -2), (-1, 3), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6), (-10, 7)], [(-1, -12), (0, -11), (1, -9), (1, -6), (0, -2), (-2, 3), (-4, 6), (-6, 8), (-8, 9)], [(11, -11), (10, -10), (11, -9), (12, -10), (12, -11), (11, -12), (9, -12), (7, -11), (5, -9), (3, -6), (1, -2), (0, 3), (0, 6), (1, 8), (2, 9), (3, 9), (5, 8), (7, 6)]]),
-    (-11, 11, [[(-8, -8), (-6, -11), (-4, -12), (-3, -12), (-1, -11), (-1, -9), (-3, -3), (-3, 0), (-2, 2)], [(-3, -12), (-2, -11), (-2, -9), (-4, -3), (-4, 0), (-2, 2), (0, 2), (3, 1), (5, -1), (7, -4), (8, -6)], [(10, -12), (8, -6), (5, 2), (3, 6)], [(11, -12), (9, -6), (7, -1), (5, 3), (3, 6), (1, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 5), (-8, 4), (-7, 5), (-8, 6)]]),
-    (-11, 10, [[(8, -10), (7, -8), (5, -3), (4, 0), (3, 2), (1, 5), (-1, 7), (-3, 8), (-6, 9)], [(1, -6), (0, -4), (-2, -3), (-4, -3), (-5, -5), (-5, -7), (-4, -9), (-2, -11), (1, -12), (11, -12), (9, -11), (8, -10), (7, -7), (6, -3), (4, 3), (2, 6), (-1, 8), (-6, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-8, 5), (-6, 6), (-3, 8), (-1, 9), (2, 9), (5, 8), (7, 6)], [(4, -12), (8, -11), (9, -11)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 6, [[(4, -12), (2, -10), (1, -8), (1, -7), (2, -6), (3, -7), (2, -8)]]),
-    (-7, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4, 2), (-5, 4), (-5, 7), (-3, 9)], [(4, 0), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)], [(5, 0), (3, 6), (3, 8), (4, 9)]]),
-    (-6, 8, [[(-6, 4), (-4, 1), (-2, -3)], [(1, -12), (-5, 6), (-5, 8), (-3, 9), (-2, 9), (0, 8), (2, 6), (3, 3), (3, 0), (4, 4), (5, 5), (6, 5), (8, 4)], [(2, -12), (-4, 6), (-4, 8), (-3, 9)]]),
-    (-6, 6, [[(2, 1), (1, 2), (2, 2), (2, 1), (1, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (4, 7), (6, 4)], [(-1, 0), (-3, 2), (-4, 4), (-4, 7), (-2, 9)]]),
-    (-7, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4, 2), (-5, 4), (-5, 7), (-3, 9)], [(8, -12), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)], [(9, -12), (3, 6), (3, 8), (4, 9)]]),
-    (-6, 6, [[(-3, 7), (-1, 6), (0, 5), (1, 3), (1, 1), (0, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (4, 7), (6, 4)], [(-1, 0), (-3, 2), (-4, 4), (-4, 7), (-2, 9)]]),
-    (-3, 6, [[(0, 0), (3, -3), (5, -6), (6, -9), (6, -11), (5, -12), (3, -11), (2, -9), (-7, 18), (-7, 20), (-6, 21), (-4, 20), (-3, 17), (-2, 8), (-1, 9), (1, 9), (3, 8), (4, 7), (6, 4)], [(2, -9), (1, -4), (0, 0), (-3, 9), (-5, 14), (-7, 18)]]),
-    (-7, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4, 2), (-5, 4), (-5, 7), (-3, 9)], [(4, 0), (-2, 18)], [(5, 0), (2, 9), (0, 14), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-3, 13), (0, 11), (4, 9), (7, 7), (9, 4)]]),
-    (-6, 9, [[(-6, 4), (-4, 1), (-2, -3)], [(1, -12), (-6, 9)], [(2, -12), (-5, 9)], [(-3, 3), (-1, 1), (1, 0), (2, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9)], [(2, 0), (3, 1), (3, 3), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-4, 4, [[(1, -6), (0, -5), (1, -4), (2, -5), (1, -6)], [(-1, 0), (-3, 6), (-3, 8), (-1, 9), (1, 8), (2, 7), (4, 4)], [(0, 0), (-2, 6), (-2, 8), (-1, 9)]]),
-    (-4, 4, [[(1, -6), (0, -5), (1, -4), (2, -5), (1, -6)], [(-1, 0), (-7, 18)], [(0, 0), (-3, 9), (-5, 14), (-7, 18), (-8, 20), (-10, 21), (-11, 20), (-11, 18), (-10, 15), (-8, 13), (-5, 11), (-1, 9), (2, 7), (4, 4)]]),
-    (-6, 8, [[(-6, 4), (-4, 1), (-2, -3)], [(1, -12), (-6, 9)], [(2, -12), (-5, 9)], [(3, 0), (3, 1), (4, 1), (3, 0), (2, 0), (0, 2), (-3, 3)], [(-3, 3), (0, 4), (1, 8), (2, 9)], [(-3, 3), (-1, 4), (0, 8), (2, 9), (3, 9), (6, 7), (8, 4)]]),
-    (-4, 4, [[(-4, 4), (-2, 1), (0, -3)], [(3, -12), (-3, 6), (-3, 8), (-1, 9), (1, 8), (2, 7), (4, 4)], [(4, -12), (-2, 6), (-2, 8), (-1, 9)]]),
-    (-13, 12, [[(-13, 4), (-11, 1), (-9, 0), (-7, 1), (-7, 3), (-9, 9)], [(-9, 0), (-8, 1), (-8, 3), (-10, 9)], [(-7, 3), (-5, 1), (-3, 0), (-2, 0), (0, 1), (0, 3), (-2, 9)], [(-2, 0), (-1, 1), (-1, 3), (-3, 9)], [(0, 3), (2, 1), (4, 0), (5, 0), (7, 1), (7, 3), (6, 6), (6, 8), (7, 9)], [(5, 0), (6, 1), (6, 3), (5, 6), (5, 8), (7, 9), (9, 8), (10, 7), (12, 4)]]),
-    (-9, 9, [[(-9, 4), (-7, 1), (-5, 0), (-3, 1), (-3, 3), (-5, 9)], [(-5, 0), (-4, 1), (-4, 3), (-6, 9)], [(-3, 3), (-1, 1), (1, 0), (2, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9)], [(2, 0), (3, 1), (3, 3), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-7, 7, [[(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (3, 3), (2, 1), (0, 0), (-1, 1), (-1, 3), (0, 5), (2, 6), (4, 6), (6, 5), (7, 4)], [(-2, 0), (-4, 2), (-5, 4), (-5, 7), (-3, 9)]]),
-    (-6, 9, [[(-6, 4), (-4, 1), (-2, -3)], [(-1, -6), (-10, 21)], [(0, -6), (-9, 21)], [(-3, 3), (-1, 1), (1, 0), (2, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9)], [(2, 0), (3, 1), (3, 3), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-7, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8)], [(-2, 0), (-4, 2), (-5, 4), (-5, 7), (-3, 9)], [(4, 0), (-2, 18), (-2, 20), (-1, 21), (1, 20), (2, 17), (2, 9), (4, 9), (7, 7), (9, 4)], [(5, 0), (2, 9), (0, 14), (-2, 18)]]),
-    (-6, 8, [[(-6, 4), (-4, 1), (-2, 0), (0, 1), (0, 3), (-2, 9)], [(-2, 0), (-1, 1), (-1, 3), (-3, 9)], [(0, 3), (2, 1), (4, 0), (5, 0), (4, 3)], [(4, 0), (4, 3), (5, 5), (6, 5), (8, 4)]]),
-    (-4, 8, [[(-4, 4), (-2, 1), (-1, -1), (-1, 1), (2, 3), (3, 5), (3, 7), (2, 8), (0, 9)], [(-1, 1), (1, 3), (2, 5), (2, 7), (0, 9)], [(-4, 8), (-2, 9), (3, 9), (6, 7), (8, 4)]]),
-    (-4, 4, [[(-4, 4), (-2, 1), (0, -3)], [(3, -12), (-3, 6), (-3, 8), (-1, 9), (1, 8), (2, 7), (4, 4)], [(4, -12), (-2, 6), (-2, 8), (-1, 9)], [(-2, -4), (4, -4)]]),
-    (-7, 9, [[(-4, 0), (-6, 6), (-6, 8), (-4, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(-3, 0), (-5, 6), (-5, 8), (-4, 9)], [(4, 0), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)], [(5, 0), (3, 6), (3, 8), (4, 9)]]),
-    (-7, 8, [[(-4, 0), (-5, 2), (-6, 5), (-6, 8), (-4, 9), (-3, 9), (0, 8), (2, 6), (3, 3), (3, 0)], [(-3, 0), (-4, 2), (-5, 5), (-5, 8), (-4, 9)], [(3, 0), (4, 4), (5, 5), (6, 5), (8, 4)]]),
-    (-10, 11, [[(-6, 0), (-8, 2), (-9, 5), (-9, 8), (-7, 9), (-6, 9), (-4, 8), (-2, 6)], [(-5, 0), (-7, 2), (-8, 5), (-8, 8), (-7, 9)], [(0, 0), (-2, 6), (-2, 8), (0, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0)], [(1, 0), (-1, 6), (-1, 8), (0, 9)], [(6, 0), (7, 4), (8, 5), (9, 5), (11, 4)]]),
-    (-8, 8, [[(-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 3), (-2, 6), (-3, 8), (-5, 9), (-6, 9), (-7, 8), (-7, 7), (-6, 7), (-7, 8)], [(5, 1), (4, 2), (5, 2), (5, 1), (4, 0), (3, 0), (1, 1), (0, 3), (-1, 6), (-1, 8), (0, 9), (3, 9), (6, 7), (8, 4)], [(-1, 1), (0, 3)], [(1, 1), (-1, 3)], [(-2, 6), (-1, 8)], [(-1, 6), (-3, 8)]]),
-    (-7, 9, [[(-4, 0), (-6, 6), (-6, 8), (-4, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(-3, 0), (-5, 6), (-5, 8), (-4, 9)], [(4, 0), (-2, 18)], [(5, 0), (2, 9), (0, 14), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-3, 13), (0, 11), (4, 9), (7, 7), (9, 4)]]),
-    (-6, 7, [[(-6, 4), (-4, 1), (-2, 0), (0, 0), (2, 1), (2, 4), (1, 6), (-2, 8), (-4, 9)], [(0, 0), (1, 1), (1, 4), (0, 6), (-2, 8)], [(-4, 9), (-2, 10), (-1, 12), (-1, 15), (-2, 18), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-3, 12), (0, 10), (4, 7), (7, 4)], [(-4, 9), (-3, 10), (-2, 12), (-2, 15), (-3, 18), (-4, 20)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 8, [[(1, -12), (-1, -11), (-2, -9), (-2, -7), (-1, -5), (1, -4), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11), (3, -12), (1, -12)]]),
-]
-
-SCRIPTS = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(3, -12), (2, -11), (0, 1)], [(3, -11), (0, 1)], [(3, -12), (4, -11), (0, 1)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-9, 9, [[(-2, -12), (-4, -5)], [(-1, -12), (-4, -5)], [(7, -12), (5, -5)], [(8, -12), (5, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 11, [[(2, -16), (-6, 13)], [(7, -16), (-1, 13)], [(8, -8), (7, -7), (8, -6), (9, -7), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -4), (9, -3), (10, -2), (11, -3), (11, -4), (10, -5), (9, -5), (7, -4), (5, -2), (0, 6), (-2, 8), (-4, 9), (-7, 9), (-10, 8), (-11, 6), (-11, 4), (-10, 2), (-9, 1), (-7, 0), (-2, -2), (0, -3), (2, -5), (3, -7), (3, -9), (2, -11), (0, -12), (-2, -11), (-3, -9), (-3, -6), (-2, 0), (-1, 3), (1, 6), (3, 8), (5, 9), (7, 9), (8, 7), (8, 6)], [(-7, 9), (-9, 8), (-10, 6), (-10, 4), (-9, 2), (-8, 1), (-2, -2)], [(-3, -6), (-2, -1), (-1, 2), (1, 5), (3, 7), (5, 8), (7, 8), (8, 7)]]),
-    (-5, 6, [[(3, -10), (2, -11), (3, -12), (4, -11), (4, -10), (3, -8), (1, -6)]]),
-    (-7, 8, [[(8, -16), (4, -13), (1, -10), (-1, -7), (-3, -3), (-4, 2), (-4, 6), (-3, 11), (-2, 14), (-1, 16)], [(4, -13), (1, -9), (-1, -5), (-2, -2), (-3, 3), (-3, 8), (-2, 13), (-1, 16)]]),
-    (-8, 7, [[(1, -16), (2, -14), (3, -11), (4, -6), (4, -2), (3, 3), (1, 7), (-1, 10), (-4, 13), (-8, 16)], [(1, -16), (2, -13), (3, -8), (3, -3), (2, 2), (1, 5), (-1, 9), (-4, 13)]]),
-    (-8, 9, [[(2, -12), (2, 0)], [(-3, -9), (7, -3)], [(7, -9), (-3, -3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 5, [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-11, 11, [[(13, -16), (-13, 16)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-3, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]),
-    (-10, 11, [[(2, -8), (-3, 9)], [(4, -12), (-2, 9)], [(4, -12), (1, -9), (-2, -7), (-4, -6)], [(3, -9), (-1, -7), (-4, -6)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (5, -3), (2, -1), (-2, 1), (-5, 3), (-7, 5), (-9, 9)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (-2, 1)], [(-8, 7), (-7, 6), (-5, 6), (0, 8), (3, 8), (5, 7), (6, 5)], [(-5, 6), (0, 9), (3, 9), (5, 8), (6, 5)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (4, -3), (1, -2)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -2), (3, -1), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (1, 9)]]),
-    (-10, 11, [[(6, -11), (0, 9)], [(7, -12), (1, 9)], [(7, -12), (-8, 3), (8, 3)]]),
-    (-10, 11, [[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (4, -11), (9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -4), (3, -3), (4, -2), (5, 0), (5, 3), (4, 6), (2, 8), (0, 9)]]),
-    (-10, 11, [[(7, -9), (6, -8), (7, -7), (8, -8), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-5, 0), (-6, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 6), (-5, 8)], [(0, 9), (2, 8), (4, 6), (5, 4), (5, 0), (4, -2)]]),
-    (-10, 11, [[(-4, -12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (1, 0), (-1, 3), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)], [(-4, -10), (-2, -11), (0, -11), (5, -9), (7, -9), (8, -10), (9, -12)]]),
-    (-10, 11, [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3), (-1, -2), (2, -2), (6, -3), (7, -4), (8, -6), (8, -9), (7, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-2, -10), (-3, -8), (-3, -5), (-2, -3), (-1, -2)], [(2, -2), (5, -3), (6, -4), (7, -6), (7, -9), (6, -11), (4, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(-1, -2), (-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(0, 9), (3, 8), (4, 7), (5, 5), (5, 1), (4, -1)]]),
-    (-10, 11, [[(7, -5), (6, -3), (4, -1), (2, 0), (-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12), (6, -11), (7, -10), (8, -8), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)], [(-3, -1), (-4, -3), (-4, -7), (-3, -9), (-1, -11), (1, -12)], [(6, -11), (7, -9), (7, -4), (6, 0), (5, 3), (3, 6), (1, 8), (-1, 9)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (1, -2), (-1, -1), (-1, 1), (0, 2), (2, 2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-11, 9, [[(-11, 9), (-9, 8), (-6, 5), (-3, 1), (1, -6), (4, -12), (4, 9), (3, 6), (1, 3), (-1, 1), (-4, -1), (-6, -1), (-7, 0), (-7, 2), (-6, 4), (-4, 6), (-1, 8), (2, 9), (7, 9)]]),
-    (-12, 11, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (6, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (5, -3), (2, -2)], [(1, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9), (0, 9), (-2, 8), (-3, 6)]]),
-    (-10, 10, [[(2, -6), (2, -5), (3, -4), (5, -4), (7, -5), (8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (5, 4)]]),
-    (-11, 12, [[(2, -12), (0, -11), (-1, -9), (-2, -5), (-3, 1), (-4, 4), (-5, 6), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11, 5), (-9, 5), (-7, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (8, 2), (9, -3), (9, -7), (8, -10), (7, -11), (5, -12), (2, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2), (10, 3)]]),
-    (-10, 10, [[(4, -8), (4, -7), (5, -6), (7, -6), (8, -7), (8, -9), (7, -11), (4, -12), (0, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-2, -3), (1, -2), (-2, -2), (-5, -1), (-6, 0), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (7, 4)]]),
-    (-10, 10, [[(0, -6), (-2, -6), (-4, -7), (-5, -9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11), (11, -12)], [(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)], [(-1, -2), (8, -2)]]),
-    (-11, 12, [[(-11, 9), (-9, 8), (-5, 4), (-2, -1), (-1, -4), (0, -8), (0, -11), (-1, -12), (-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-1, -3), (3, -3), (6, -4), (7, -5), (8, -7), (8, -1), (7, 4), (6, 6), (4, 8), (1, 9), (-3, 9), (-6, 8), (-8, 6), (-9, 4), (-9, 2)]]),
-    (-12, 12, [[(-5, -5), (-7, -6), (-8, -8), (-8, -9), (-7, -11), (-5, -12), (-4, -12), (-2, -11), (-1, -9), (-1, -7), (-2, -3), (-4, 3), (-6, 7), (-8, 9), (-10, 9), (-11, 8), (-11, 6)], [(-5, 0), (4, -3), (6, -4), (9, -6), (11, -8), (12, -10), (12, -11), (11, -12), (10, -12), (8, -10), (6, -6), (4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-9, 8, [[(5, 4), (3, 2), (1, -1), (0, -3), (-1, -6), (-1, -9), (0, -11), (1, -12), (3, -12), (4, -11), (5, -9), (5, -6), (4, -1), (2, 4), (1, 6), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-5, 3), (-3, 4)]]),
-    (-8, 7, [[(2, 12), (0, 9), (-2, 4), (-3, -2), (-3, -8), (-2, -11), (0, -12), (2, -12), (3, -11), (4, -8), (4, -5), (3, 0), (0, 9), (-2, 15), (-3, 18), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-4, 12), (-2, 10), (1, 8), (5, 6)]]),
-    (-12, 12, [[(-5, -5), (-7, -6), (-8, -8), (-8, -9), (-7, -11), (-5, -12), (-4, -12), (-2, -11), (-1, -9), (-1, -7), (-2, -3), (-4, 3), (-6, 7), (-8, 9), (-10, 9), (-11, 8), (-11, 6)], [(12, -9), (12, -11), (11, -12), (10, -12), (8, -11), (6, -9), (4, -6), (2, -4), (0, -3), (-2, -3)], [(0, -3), (1, -1), (1, 6), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-9, 10, [[(-5, 0), (-3, 0), (1, -1), (4, -3), (6, -5), (7, -7), (7, -10), (6, -12), (4, -12), (3, -11), (2, -9), (1, -4), (0, 1), (-1, 4), (-2, 6), (-4, 8), (-6, 9), (-8, 9), (-9, 8), (-9, 6), (-8, 5), (-6, 5), (-4, 6), (-1, 8), (2, 9), (4, 9), (7, 8), (9, 6)]]),
-    (-18, 15, [[(-13, -5), (-15, -6), (-16, -8), (-16, -9), (-15, -11), (-13, -12), (-12, -12), (-10, -11), (-9, -9), (-9, -7), (-10, -2), (-11, 2), (-13, 9)], [(-11, 2), (-8, -6), (-6, -10), (-5, -11), (-3, -12), (-2, -12), (0, -11), (1, -9), (1, -7), (0, -2), (-1, 2), (-3, 9)], [(-1, 2), (2, -6), (4, -10), (5, -11), (7, -12), (8, -12), (10, -11), (11, -9), (11, -7), (10, -2), (8, 5), (8, 8), (9, 9), (10, 9), (12, 8), (13, 7), (15, 4)]]),
-    (-13, 11, [[(-8, -5), (-10, -6), (-11, -8), (-11, -9), (-10, -11), (-8, -12), (-7, -12), (-5, -11), (-4, -9), (-4, -7), (-5, -2), (-6, 2), (-8, 9)], [(-6, 2), (-3, -6), (-1, -10), (0, -11), (2, -12), (4, -12), (6, -11), (7, -9), (7, -7), (6, -2), (4, 5), (4, 8), (5, 9), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 1), (8, -3), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12), (0, -10), (0, -7), (1, -4), (3, -1), (5, 1), (8, 3), (10, 4)]]),
-    (-12, 13, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (8, -12), (10, -11), (11, -10), (12, -8), (12, -5), (11, -3), (10, -2), (8, -1), (5, -1), (3, -2), (2, -3)]]),
-    (-10, 12, [[(3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9), (8, -5), (7, -2), (5, 1), (1, 5), (-2, 7), (-4, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (1, 9), (4, 9), (7, 8), (9, 6)]]),
-    (-12, 13, [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (7, -12), (9, -11), (10, -10), (11, -8), (11, -5), (10, -3), (9, -2), (7, -1), (4, -1), (1, -2), (2, -1), (3, 1), (3, 6), (4, 8), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-10, 10, [[(-10, 9), (-8, 8), (-6, 6), (-3, 2), (-1, -1), (1, -5), (2, -8), (2, -11), (1, -12), (0, -12), (-1, -11), (-2, -9), (-2, -7), (-1, -5), (1, -3), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-8, 4), (-8, 2)]]),
-    (-10, 9, [[(0, -6), (-2, -6), (-4, -7), (-5, -9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11), (11, -12)], [(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)]]),
-    (-13, 11, [[(-8, -5), (-10, -6), (-11, -8), (-11, -9), (-10, -11), (-8, -12), (-7, -12), (-5, -11), (-4, -9), (-4, -7), (-5, -3), (-6, 0), (-7, 4), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (3, 3), (6, -5), (8, -12)], [(6, -5), (5, -1), (4, 5), (4, 8), (5, 9), (6, 9), (8, 8), (9, 7), (11, 4)]]),
-    (-12, 11, [[(-7, -5), (-9, -6), (-10, -8), (-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4, -11), (-3, -9), (-3, -7), (-4, -3), (-5, 0), (-6, 4), (-6, 7), (-5, 9), (-3, 9), (-1, 8), (2, 5), (4, 2), (6, -2), (7, -5), (8, -9), (8, -11), (7, -12), (6, -12), (5, -11), (4, -9), (4, -7), (5, -4), (7, -2), (9, -1)]]),
-    (-15, 13, [[(-10, -5), (-12, -6), (-13, -8), (-13, -9), (-12, -11), (-10, -12), (-9, -12), (-7, -11), (-6, -9), (-6, -6), (-7, 9)], [(3, -12), (-7, 9)], [(3, -12), (1, 9)], [(15, -12), (13, -11), (10, -8), (7, -4), (4, 2), (1, 9)]]),
-    (-12, 12, [[(-4, -6), (-6, -6), (-7, -7), (-7, -9), (-6, -11), (-4, -12), (-2, -12), (0, -11), (1, -9), (1, -6), (-1, 3), (-1, 6), (0, 8), (2, 9), (4, 9), (6, 8), (7, 6), (7, 4), (6, 3), (4, 3)], [(11, -9), (11, -11), (10, -12), (8, -12), (6, -11), (4, -9), (2, -6), (-2, 3), (-4, 6), (-6, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6)]]),
-    (-12, 11, [[(-7, -5), (-9, -6), (-10, -8), (-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4, -11), (-3, -9), (-3, -7), (-4, -3), (-5, 0), (-6, 4), (-6, 6), (-5, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3), (5, 1), (7, -5)], [(9, -12), (7, -5), (4, 5), (2, 11), (0, 16), (-2, 20), (-4, 21), (-5, 20), (-5, 18), (-4, 15), (-2, 12), (1, 9), (4, 7), (9, 4)]]),
-    (-10, 11, [[(3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9), (8, -5), (7, -2), (5, 2), (2, 5), (-2, 8), (-4, 9), (-7, 9), (-8, 8), (-8, 6), (-7, 5), (-4, 5), (-2, 6), (-1, 7), (0, 9), (0, 12), (-1, 15), (-2, 17), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-4, 12), (-1, 9), (2, 7), (8, 4)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-8, 8, [[(-2, -6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]),
-    (-8, 8, [[(-8, 11), (8, 11)]]),
-    (-5, 6, [[(4, -12), (2, -10), (1, -8), (1, -7), (2, -6), (3, -7), (2, -8)]]),
-    (-6, 10, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6), (4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-5, 9, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 2), (-4, 8), (-3, 9), (-2, 9), (0, 8), (2, 6), (3, 3), (3, 0), (4, 4), (5, 5), (7, 5), (9, 4)]]),
-    (-5, 6, [[(2, 2), (2, 1), (1, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (4, 7), (6, 4)]]),
-    (-6, 10, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6), (8, -12)], [(4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-4, 6, [[(-3, 7), (-1, 6), (0, 5), (1, 3), (1, 1), (0, 0), (-1, 0), (-3, 1), (-4, 3), (-4, 6), (-3, 8), (-1, 9), (1, 9), (3, 8), (4, 7), (6, 4)]]),
-    (-3, 5, [[(-3, 4), (1, -1), (3, -4), (4, -6), (5, -9), (5, -11), (4, -12), (2, -11), (1, -9), (-1, -1), (-4, 8), (-7, 15), (-8, 18), (-8, 20), (-7, 21), (-5, 20), (-4, 17), (-3, 8), (-2, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-6, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7)], [(4, 0), (2, 7), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-5, 10, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1), (-5, 9)], [(-5, 9), (-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-2, 5, [[(1, -5), (1, -4), (2, -4), (2, -5), (1, -5)], [(-2, 4), (0, 0), (-2, 6), (-2, 8), (-1, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-2, 5, [[(1, -5), (1, -4), (2, -4), (2, -5), (1, -5)], [(-2, 4), (0, 0), (-6, 18), (-7, 20), (-9, 21), (-10, 20), (-10, 18), (-9, 15), (-6, 12), (-3, 10), (-1, 9), (2, 7), (5, 4)]]),
-    (-5, 9, [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1), (-5, 9)], [(-5, 9), (-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (2, 4), (-1, 4)], [(-1, 4), (1, 5), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-3, 5, [[(-3, 4), (-1, 1), (2, -4), (3, -6), (4, -9), (4, -11), (3, -12), (1, -11), (0, -9), (-1, -5), (-2, 2), (-2, 8), (-1, 9), (0, 9), (2, 8), (3, 7), (5, 4)]]),
-    (-13, 12, [[(-13, 4), (-11, 1), (-9, 0), (-8, 1), (-8, 2), (-9, 6), (-10, 9)], [(-9, 6), (-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 2), (-2, 6), (-3, 9)], [(-2, 6), (-1, 4), (1, 1), (3, 0), (5, 0), (6, 1), (6, 3), (5, 6), (5, 8), (6, 9), (7, 9), (9, 8), (10, 7), (12, 4)]]),
-    (-8, 10, [[(-8, 4), (-6, 1), (-4, 0), (-3, 1), (-3, 2), (-4, 6), (-5, 9)], [(-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]),
-    (-6, 8, [[(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (3, 3), (2, 1), (0, 0), (-1, 1), (-1, 3), (0, 5), (2, 6), (5, 6), (7, 5), (8, 4)]]),
-    (-7, 8, [[(-7, 4), (-5, 1), (-4, -1), (-5, 3), (-11, 21)], [(-5, 3), (-4, 1), (-2, 0), (0, 0), (2, 1), (3, 3), (3, 5), (2, 7), (1, 8), (-1, 9)], [(-5, 8), (-3, 9), (0, 9), (3, 8), (5, 7), (8, 4)]]),
-    (-6, 9, [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8)], [(4, 0), (3, 3), (1, 8), (-2, 15), (-3, 18), (-3, 20), (-2, 21), (0, 20), (1, 17), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-5, 8, [[(-5, 4), (-3, 1), (-2, -1), (-2, 1), (1, 1), (2, 2), (2, 4), (1, 7), (1, 8), (2, 9), (3, 9), (5, 8), (6, 7), (8, 4)]]),
-    (-4, 7, [[(-4, 4), (-2, 1), (-1, -1), (-1, 1), (1, 4), (2, 6), (2, 8), (0, 9)], [(-4, 8), (-2, 9), (2, 9), (4, 8), (5, 7), (7, 4)]]),
-    (-3, 6, [[(-3, 4), (-1, 1), (1, -3)], [(4, -12), (-2, 6), (-2, 8), (-1, 9), (1, 9), (3, 8), (4, 7), (6, 4)], [(-2, -4), (5, -4)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-6, 6), (-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0), (2, 6), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-5, 5), (-5, 8), (-4, 9), (-3, 9), (0, 8), (2, 6), (3, 3), (3, 0)], [(3, 0), (4, 4), (5, 5), (7, 5), (9, 4)]]),
-    (-9, 12, [[(-6, 0), (-8, 2), (-9, 5), (-9, 7), (-8, 9), (-6, 9), (-4, 8), (-2, 6)], [(0, 0), (-2, 6), (-2, 8), (-1, 9), (1, 9), (3, 8), (5, 6), (6, 3), (6, 0)], [(6, 0), (7, 4), (8, 5), (10, 5), (12, 4)]]),
-    (-8, 8, [[(-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 8), (0, 9), (3, 9), (6, 7), (8, 4)], [(5, 1), (4, 0), (2, 0), (1, 1), (-3, 8), (-4, 9), (-6, 9), (-7, 8)]]),
-    (-6, 9, [[(-6, 4), (-4, 0), (-6, 6), (-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (3, 9), (6, 7), (9, 4)]]),
-    (-6, 8, [[(-6, 4), (-4, 1), (-2, 0), (0, 0), (2, 2), (2, 4), (1, 6), (-1, 8), (-4, 9), (-2, 10), (-1, 12), (-1, 15), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (5, 7), (8, 4)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-]
-
-SYMBOLIC = [
-    (-8, 8, [[]]),
-    (-14, 14, [[(-14, 0), (14, 0)]]),
-    (-14, 14, [[(-14, 14), (14, -14)]]),
-    (0, 0, [[(0, -20), (0, 20)]]),
-    (-14, 14, [[(-14, -14), (14, 14)]]),
-    (-14, 14, [[(-14, 0), (14, 0)]]),
-    (-12, 12, [[(-12, 7), (12, -7)]]),
-    (-7, 7, [[(-7, 12), (7, -12)]]),
-    (0, 0, [[(0, -14), (0, 14)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-12, 12, [[(-12, -7), (12, 7)]]),
-    (-7, 7, [[(-7, 0), (7, 0)]]),
-    (-5, 5, [[(-5, 5), (5, -5)]]),
-    (0, 0, [[(0, -7), (0, 7)]]),
-    (-5, 5, [[(-5, -5), (5, 5)]]),
-    (-11, 0, [[(0, -11), (-2, -11), (-5, -10), (-8, -8), (-10, -5), (-11, -2), (-11, 0)]]),
-    (-11, 0, [[(-11, 0), (-11, 2), (-10, 5), (-8, 8), (-5, 10), (-2, 11), (0, 11)]]),
-    (0, 11, [[(0, 11), (2, 11), (5, 10), (8, 8), (10, 5), (11, 2), (11, 0)]]),
-    (0, 11, [[(11, 0), (11, -2), (10, -5), (8, -8), (5, -10), (2, -11), (0, -11)]]),
-    (-14, 14, [[(-14, -3), (-11, -1), (-7, 1), (-2, 2), (2, 2), (7, 1), (11, -1), (14, -3)]]),
-    (-2, 3, [[(3, -14), (1, -11), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (1, 11), (3, 14)]]),
-    (-3, 2, [[(-3, -14), (-1, -11), (1, -7), (2, -2), (2, 2), (1, 7), (-1, 11), (-3, 14)]]),
-    (-14, 14, [[(-14, 3), (-11, 1), (-7, -1), (-2, -2), (2, -2), (7, -1), (11, 1), (14, 3)]]),
-    (-7, 7, [[(0, -8), (7, -4), (-7, 4), (0, 8)]]),
-    (-8, 8, [[(-8, 0), (-4, -7), (4, 7), (8, 0)]]),
-    (-7, 7, [[(-7, 4), (-7, -4), (7, 4), (7, -4)]]),
-    (-8, 8, [[(-6, 6), (-8, -2), (8, 2), (6, -6)]]),
-    (-8, 8, [[(-8, 11), (-6, 11), (-3, 10), (-1, 9), (2, 6), (3, 4), (4, 1), (4, -3), (3, -6), (2, -8), (1, -9), (-1, -9), (-2, -8), (-3, -6), (-4, -3), (-4, 1), (-3, 4), (-2, 6), (1, 9), (3, 10), (6, 11), (8, 11)]]),
-    (-9, 11, [[(11, 8), (11, 6), (10, 3), (9, 1), (6, -2), (4, -3), (1, -4), (-3, -4), (-6, -3), (-8, -2), (-9, -1), (-9, 1), (-8, 2), (-6, 3), (-3, 4), (1, 4), (4, 3), (6, 2), (9, -1), (10, -3), (11, -6), (11, -8)]]),
-    (-8, 8, [[(8, -11), (6, -11), (3, -10), (1, -9), (-2, -6), (-3, -4), (-4, -1), (-4, 3), (-3, 6), (-2, 8), (-1, 9), (1, 9), (2, 8), (3, 6), (4, 3), (4, -1), (3, -4), (2, -6), (-1, -9), (-3, -10), (-6, -11), (-8, -11)]]),
-    (-11, 9, [[(-11, -8), (-11, -6), (-10, -3), (-9, -1), (-6, 2), (-4, 3), (-1, 4), (3, 4), (6, 3), (8, 2), (9, 1), (9, -1), (8, -2), (6, -3), (3, -4), (-1, -4), (-4, -3), (-6, -2), (-9, 1), (-10, 3), (-11, 6), (-11, 8)]]),
-    (-13, 9, [[(-13, -2), (-12, 0), (-10, 2), (-8, 3), (-5, 4), (-1, 4), (3, 3), (6, 1), (8, -2), (9, -4), (8, -6), (5, -6), (1, -5), (-1, -4), (-4, -2), (-6, 1), (-7, 4), (-7, 7), (-6, 10), (-5, 12)]]),
-    (-13, 7, [[(-13, 2), (-10, 4), (-7, 5), (-2, 5), (1, 4), (4, 2), (6, -1), (7, -4), (7, -6), (6, -7), (4, -7), (1, -6), (-2, -4), (-4, -1), (-5, 2), (-5, 7), (-4, 10), (-2, 13)]]),
-    (-3, 3, [[(-1, -3), (-3, -1), (-3, 1), (-1, 3), (1, 3), (3, 1), (3, -1), (1, -3), (-1, -3)], [(-1, -2), (-2, -1), (-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1), (1, -2), (-1, -2)], [(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]),
-    (0, 5, [[(0, -5), (1, -5), (3, -4), (4, -3), (5, -1), (5, 1), (4, 3), (3, 4), (1, 5), (0, 5)]]),
-    (-14, 14, [[(-14, 0), (-8, 0)], [(-3, 0), (3, 0)], [(8, 0), (14, 0)]]),
-    (-14, 14, [[(-14, 3), (-14, -3), (14, -3), (14, 3)]]),
-    (-8, 8, [[(0, -14), (-8, 0)], [(0, -14), (8, 0)]]),
-    (-14, 14, [[(-14, 0), (14, 0)], [(-8, 7), (8, 7)], [(-2, 14), (2, 14)]]),
-    (-14, 14, [[(-14, 0), (14, 0)], [(-14, 0), (0, 16)], [(14, 0), (0, 16)]]),
-    (-7, 7, [[(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6), (1, -7), (-1, -7)]]),
-    (-6, 6, [[(-6, -6), (-6, 6), (6, 6), (6, -6), (-6, -6)]]),
-    (-7, 7, [[(0, -8), (-7, 4), (7, 4), (0, -8)]]),
-    (-6, 6, [[(0, -10), (-6, 0), (0, 10), (6, 0), (0, -10)]]),
-    (-8, 8, [[(0, -9), (-2, -3), (-8, -3), (-3, 1), (-5, 7), (0, 3), (5, 7), (3, 1), (8, -3), (2, -3), (0, -9)]]),
-    (-7, 7, [[(0, -7), (0, 7)], [(-7, 0), (7, 0)]]),
-    (-5, 5, [[(-5, -5), (5, 5)], [(5, -5), (-5, 5)]]),
-    (-5, 5, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-4, 4, [[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)], [(-3, -1), (-3, 1)], [(-2, -2), (-2, 2)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -2), (2, 2)], [(3, -1), (3, 1)]]),
-    (-4, 4, [[(-4, -4), (-4, 4), (4, 4), (4, -4), (-4, -4)], [(-3, -3), (-3, 3)], [(-2, -3), (-2, 3)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -3), (2, 3)], [(3, -3), (3, 3)]]),
-    (-5, 5, [[(0, -6), (-5, 3), (5, 3), (0, -6)], [(0, -3), (-3, 2)], [(0, -3), (3, 2)], [(0, 0), (-1, 2)], [(0, 0), (1, 2)]]),
-    (-6, 3, [[(-6, 0), (3, 5), (3, -5), (-6, 0)], [(-3, 0), (2, 3)], [(-3, 0), (2, -3)], [(0, 0), (2, 1)], [(0, 0), (2, -1)]]),
-    (-5, 5, [[(0, 6), (5, -3), (-5, -3), (0, 6)], [(0, 3), (3, -2)], [(0, 3), (-3, -2)], [(0, 0), (1, -2)], [(0, 0), (-1, -2)]]),
-    (-3, 6, [[(6, 0), (-3, -5), (-3, 5), (6, 0)], [(3, 0), (-2, -3)], [(3, 0), (-2, 3)], [(0, 0), (-2, -1)], [(0, 0), (-2, 1)]]),
-    (0, 7, [[(0, -7), (0, 7)], [(0, -7), (7, -4), (0, -1)], [(1, -5), (4, -4), (1, -3)]]),
-    (-9, 9, [[(0, -11), (0, 4)], [(-5, -8), (5, -2)], [(5, -8), (-5, -2)], [(-9, 4), (-6, 10)], [(9, 4), (6, 10)], [(-9, 4), (9, 4)], [(-6, 10), (6, 10)]]),
-    (-5, 5, [[(0, -6), (0, 6)], [(-3, -3), (3, -3)], [(-5, 3), (-3, 5), (-1, 6), (1, 6), (3, 5), (5, 3)]]),
-    (-6, 6, [[(0, -6), (0, 6)], [(-6, -1), (-5, -3), (5, -3), (6, -1)], [(-2, 5), (2, 5)]]),
-    (-7, 7, [[(-5, -4), (5, 6)], [(5, -4), (-5, 6)], [(-3, -6), (-6, -3), (-7, -1)], [(3, -6), (6, -3), (7, -1)]]),
-    (-9, 9, [[(-4, -9), (-9, 9)], [(4, -9), (9, 9)], [(-5, -5), (9, 9)], [(5, -5), (-9, 9)], [(-4, -9), (4, -9)], [(-5, -5), (5, -5)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-11, 9, [[(-5, -8), (1, 4)], [(-7, -2), (1, -6)], [(-11, 10), (9, 10), (9, 0), (-11, 10)]]),
-    (-6, 6, [[(-2, -6), (-2, -2), (-6, -2), (-6, 2), (-2, 2), (-2, 6), (2, 6), (2, 2), (6, 2), (6, -2), (2, -2), (2, -6), (-2, -6)]]),
-    (-7, 7, [[(7, -2), (6, -4), (4, -6), (1, -7), (-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 2)], [(7, -2), (5, -4), (3, -5), (1, -5), (-1, -4), (-2, -3), (-3, -1), (-3, 1), (-2, 3), (-1, 4), (1, 5), (3, 5), (5, 4), (7, 2)]]),
-    (-7, 7, [[(0, -8), (-7, 4), (7, 4), (0, -8)], [(0, 8), (7, -4), (-7, -4), (0, 8)]]),
-    (-11, 11, [[(-2, -9), (-2, -11), (-1, -12), (1, -12), (2, -11), (2, -9)], [(-11, 8), (-10, 6), (-8, 4), (-7, 2), (-6, -2), (-6, -7), (-5, -8), (-3, -9), (3, -9), (5, -8), (6, -7), (6, -2), (7, 2), (8, 4), (10, 6), (11, 8)], [(-11, 8), (11, 8)], [(-1, 8), (-2, 9), (-1, 10), (1, 10), (2, 9), (1, 8)]]),
-    (-8, 8, [[(0, -5), (0, 1)], [(0, 1), (-1, 10)], [(0, 1), (1, 10)], [(-1, 10), (1, 10)], [(0, -5), (-1, -8), (-2, -10), (-4, -11)], [(-1, -8), (-4, -11)], [(0, -5), (1, -8), (2, -10), (4, -11)], [(1, -8), (4, -11)], [(0, -5), (-4, -7), (-6, -7), (-8, -5)], [(-2, -6), (-6, -6), (-8, -5)], [(0, -5), (4, -7), (6, -7), (8, -5)], [(2, -6), (6, -6), (8, -5)], [(0, -5), (-2, -4), (-3, -3), (-3, 0)], [(0, -5), (-2, -3), (-3, 0)], [(0, -5), (2, -4), (3, -3), (3, 0)], [(0, -5), (2, -3), (3, 0)]]),
-    (-8, 8, [[(0, -9), (0, -7)], [(0, -4), (0, -2)], [(0, 1), (0, 3)], [(0, 7), (-1, 10)], [(0, 7), (1, 10)], [(-1, 10), (1, 10)], [(0, -11), (-1, -9), (-2, -8)], [(0, -11), (1, -9), (2, -8)], [(-2, -8), (0, -9), (2, -8)], [(0, -7), (-2, -4), (-4, -3), (-5, -4)], [(0, -7), (2, -4), (4, -3), (5, -4)], [(-4, -3), (-2, -3), (0, -4), (2, -3), (4, -3)], [(0, -2), (-2, 1), (-4, 2), (-6, 2), (-7, 0), (-7, 1), (-6, 2)], [(0, -2), (2, 1), (4, 2), (6, 2), (7, 0), (7, 1), (6, 2)], [(-4, 2), (-2, 2), (0, 1), (2, 2), (4, 2)], [(0, 3), (-2, 6), (-3, 7), (-5, 8), (-6, 8), (-7, 7), (-8, 5), (-8, 7), (-6, 8)], [(0, 3), (2, 6), (3, 7), (5, 8), (6, 8), (7, 7), (8, 5), (8, 7), (6, 8)], [(-5, 8), (-3, 8), (0, 7), (3, 8), (5, 8)]]),
-    (-8, 8, [[(0, 7), (-1, 10)], [(0, 7), (1, 10)], [(-1, 10), (1, 10)], [(0, 7), (3, 8), (6, 8), (8, 6), (8, 3), (7, 2), (5, 2), (7, 0), (8, -3), (7, -5), (5, -6), (3, -5), (4, -8), (3, -10), (1, -11), (-1, -11), (-3, -10), (-4, -8), (-3, -5), (-5, -6), (-7, -5), (-8, -3), (-7, 0), (-5, 2), (-7, 2), (-8, 3), (-8, 6), (-6, 8), (-3, 8), (0, 7)]]),
-    (-8, 8, [[(0, 7), (-1, 10)], [(0, 7), (1, 10)], [(-1, 10), (1, 10)], [(0, 7), (4, 6), (4, 4), (6, 3), (6, 0), (8, -1), (8, -6), (7, -9), (6, -10), (4, -10), (2, -11), (-2, -11), (-4, -10), (-6, -10), (-7, -9), (-8, -6), (-8, -1), (-6, 0), (-6, 3), (-4, 4), (-4, 6), (0, 7)]]),
-    (-9, 9, [[(-9, -2), (-7, 0)], [(-6, -7), (-4, -2)], [(0, -11), (0, -3)], [(6, -7), (4, -2)], [(9, -2), (7, 0)]]),
-    (-11, 11, [[(-9, -9), (-8, -7), (-7, -3), (-7, 3), (-8, 7), (-9, 9)], [(9, -9), (8, -7), (7, -3), (7, 3), (8, 7), (9, 9)], [(-9, -9), (-7, -8), (-3, -7), (3, -7), (7, -8), (9, -9)], [(-9, 9), (-7, 8), (-3, 7), (3, 7), (7, 8), (9, 9)]]),
-    (-12, 12, [[(0, 0), (0, 9), (-1, 10)], [(0, 4), (-1, 10)], [(0, -9), (-1, -10), (-3, -10), (-4, -9), (-4, -7), (-3, -4), (0, 0)], [(0, -9), (1, -10), (3, -10), (4, -9), (4, -7), (3, -4), (0, 0)], [(0, 0), (-4, -3), (-6, -4), (-8, -4), (-9, -3), (-9, -1), (-8, 0)], [(0, 0), (4, -3), (6, -4), (8, -4), (9, -3), (9, -1), (8, 0)], [(0, 0), (-4, 3), (-6, 4), (-8, 4), (-9, 3), (-9, 1), (-8, 0)], [(0, 0), (4, 3), (6, 4), (8, 4), (9, 3), (9, 1), (8, 0)]]),
-    (-8, 8, [[(3, -9), (2, -8), (3, -7), (4, -8), (4, -9), (3, -11), (1, -12), (-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -3), (4, 0)], [(-3, -5), (2, -2), (4, 0), (5, 2), (5, 4), (4, 6), (2, 8)], [(-2, -4), (-4, -2), (-5, 0), (-5, 2), (-4, 4), (-2, 6), (3, 9)], [(-4, 4), (1, 7), (3, 9), (4, 11), (4, 13), (3, 15), (1, 16), (-1, 16), (-3, 15), (-4, 13), (-4, 12), (-3, 11), (-2, 12), (-3, 13)]]),
-    (-8, 8, [[(0, -12), (-1, -10), (0, -8), (1, -10), (0, -12)], [(0, -12), (0, 16)], [(0, -1), (-1, 2), (0, 16), (1, 2), (0, -1)], [(-6, -5), (-4, -4), (-2, -5), (-4, -6), (-6, -5)], [(-6, -5), (6, -5)], [(2, -5), (4, -4), (6, -5), (4, -6), (2, -5)]]),
-    (-8, 8, [[(0, -12), (-1, -10), (0, -8), (1, -10), (0, -12)], [(0, -12), (0, 2)], [(0, -2), (-1, 0), (1, 4), (0, 6), (-1, 4), (1, 0), (0, -2)], [(0, 2), (0, 16)], [(0, 12), (-1, 14), (0, 16), (1, 14), (0, 12)], [(-6, -5), (-4, -4), (-2, -5), (-4, -6), (-6, -5)], [(-6, -5), (6, -5)], [(2, -5), (4, -4), (6, -5), (4, -6), (2, -5)], [(-6, 9), (-4, 10), (-2, 9), (-4, 8), (-6, 9)], [(-6, 9), (6, 9)], [(2, 9), (4, 10), (6, 9), (4, 8), (2, 9)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 7), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(9, 7), (8, 8), (9, 9), (10, 8), (9, 7)]]),
-    (-12, 12, [[(0, -10), (-4, -6), (-7, -2), (-8, 1), (-8, 3), (-7, 5), (-5, 6), (-3, 6), (-1, 5), (0, 3)], [(0, -10), (4, -6), (7, -2), (8, 1), (8, 3), (7, 5), (5, 6), (3, 6), (1, 5), (0, 3)], [(0, 3), (-1, 7), (-2, 10)], [(0, 3), (1, 7), (2, 10)], [(-2, 10), (2, 10)]]),
-    (-12, 12, [[(0, -4), (-1, -7), (-2, -9), (-4, -10), (-5, -10), (-7, -9), (-8, -7), (-8, -3), (-7, 0), (-6, 2), (-4, 5), (0, 10)], [(0, -4), (1, -7), (2, -9), (4, -10), (5, -10), (7, -9), (8, -7), (8, -3), (7, 0), (6, 2), (4, 5), (0, 10)]]),
-    (-12, 12, [[(0, -11), (-2, -8), (-6, -3), (-9, 0)], [(0, -11), (2, -8), (6, -3), (9, 0)], [(-9, 0), (-6, 3), (-2, 8), (0, 11)], [(9, 0), (6, 3), (2, 8), (0, 11)]]),
-    (-12, 12, [[(0, 2), (2, 5), (4, 6), (6, 6), (8, 5), (9, 3), (9, 1), (8, -1), (6, -2), (4, -2), (1, -1)], [(1, -1), (3, -3), (4, -5), (4, -7), (3, -9), (1, -10), (-1, -10), (-3, -9), (-4, -7), (-4, -5), (-3, -3), (-1, -1)], [(-1, -1), (-4, -2), (-6, -2), (-8, -1), (-9, 1), (-9, 3), (-8, 5), (-6, 6), (-4, 6), (-2, 5), (0, 2)], [(0, 2), (-1, 7), (-2, 10)], [(0, 2), (1, 7), (2, 10)], [(-2, 10), (2, 10)]]),
-    (-9, 9, [[(4, -39), (1, -37), (-1, -35), (-2, -33), (-3, -30), (-3, -26), (-2, -22), (2, -14), (3, -11), (3, -8), (2, -5), (0, -2)], [(1, -37), (-1, -34), (-2, -30), (-2, -26), (-1, -23), (3, -15), (4, -11), (4, -8), (3, -5), (0, -2), (-4, 0), (0, 2), (3, 5), (4, 8), (4, 11), (3, 15), (-1, 23), (-2, 26), (-2, 30), (-1, 34), (1, 37)], [(0, 2), (2, 5), (3, 8), (3, 11), (2, 14), (-2, 22), (-3, 26), (-3, 30), (-2, 33), (-1, 35), (1, 37), (4, 39)]]),
-    (-9, 9, [[(-4, -39), (-1, -37), (1, -35), (2, -33), (3, -30), (3, -26), (2, -22), (-2, -14), (-3, -11), (-3, -8), (-2, -5), (0, -2)], [(-1, -37), (1, -34), (2, -30), (2, -26), (1, -23), (-3, -15), (-4, -11), (-4, -8), (-3, -5), (0, -2), (4, 0), (0, 2), (-3, 5), (-4, 8), (-4, 11), (-3, 15), (1, 23), (2, 26), (2, 30), (1, 34), (-1, 37)], [(0, 2), (-2, 5), (-3, 8), (-3, 11), (-2, 14), (2, 22), (3, 26), (3, 30), (2, 33), (1, 35), (-1, 37), (-4, 39)]]),
-    (-9, 9, [[(4, -36), (1, -33), (-1, -30), (-3, -26), (-4, -21), (-4, -15), (-3, -9), (-2, -5), (1, 6), (2, 10), (3, 16), (3, 21), (2, 26), (1, 29), (-1, 33)], [(1, -33), (-1, -29), (-2, -26), (-3, -21), (-3, -16), (-2, -10), (-1, -6), (2, 5), (3, 9), (4, 15), (4, 21), (3, 26), (1, 30), (-1, 33), (-4, 36)]]),
-    (-9, 9, [[(-4, -36), (-1, -33), (1, -30), (3, -26), (4, -21), (4, -15), (3, -9), (2, -5), (-1, 6), (-2, 10), (-3, 16), (-3, 21), (-2, 26), (-1, 29), (1, 33)], [(-1, -33), (1, -29), (2, -26), (3, -21), (3, -16), (2, -10), (1, -6), (-2, 5), (-3, 9), (-4, 15), (-4, 21), (-3, 26), (-1, 30), (1, 33), (4, 36)]]),
-    (-27, 8, [[(-24, 0), (-17, 0), (0, 29)], [(-18, 0), (-1, 29)], [(-19, 0), (0, 32)], [(8, -48), (4, -8), (0, 32)]]),
-    (-9, 9, [[(2, -5), (4, -4), (6, -2), (6, -3), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -3), (-6, -1), (-6, 1), (-5, 3), (-3, 5), (1, 8)], [(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (1, 8), (2, 10), (2, 12), (1, 13), (-1, 13)]]),
-    (-11, 11, [[(-6, -5), (-7, -4), (-8, -2), (-8, 0), (-7, 3), (-3, 7), (-2, 9)], [(-8, 0), (-7, 2), (-3, 6), (-2, 9), (-2, 11), (-3, 14), (-5, 16), (-6, 16), (-7, 15), (-8, 13), (-8, 10), (-7, 6), (-5, 2), (-3, -1), (0, -4), (2, -5), (4, -5), (7, -4), (8, -2), (8, 2), (7, 6), (5, 8), (3, 9), (2, 9), (1, 8), (1, 6), (2, 5), (3, 6), (2, 7)], [(4, -5), (6, -4), (7, -2), (7, 2), (6, 6), (5, 8)]]),
-    (-13, 13, [[(7, -11), (6, -10), (7, -9), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-4, -7), (-5, -4), (-6, 0), (-8, 9), (-9, 13), (-10, 15)], [(2, -12), (0, -11), (-2, -9), (-3, -7), (-4, -4), (-6, 5), (-7, 9), (-8, 12), (-9, 14), (-10, 15), (-12, 16), (-14, 16), (-15, 15), (-15, 14), (-14, 13), (-13, 14), (-14, 15)], [(13, -11), (12, -10), (13, -9), (14, -10), (14, -11), (13, -12), (11, -12), (9, -11), (8, -10), (7, -8), (6, -5), (3, 9), (2, 13), (1, 15)], [(11, -12), (9, -10), (8, -8), (7, -4), (5, 5), (4, 9), (3, 12), (2, 14), (1, 15), (-1, 16), (-3, 16), (-4, 15), (-4, 14), (-3, 13), (-2, 14), (-3, 15)], [(-9, -5), (12, -5)]]),
-    (-12, 12, [[(9, -11), (8, -10), (9, -9), (10, -10), (9, -11), (6, -12), (3, -12), (0, -11), (-2, -9), (-3, -7), (-4, -4), (-5, 0), (-7, 9), (-8, 13), (-9, 15)], [(3, -12), (1, -11), (-1, -9), (-2, -7), (-3, -4), (-5, 5), (-6, 9), (-7, 12), (-8, 14), (-9, 15), (-11, 16), (-13, 16), (-14, 15), (-14, 14), (-13, 13), (-12, 14), (-13, 15)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9), (8, 9), (10, 7), (11, 5)], [(8, -5), (6, 2), (5, 6), (5, 8), (6, 9)], [(-8, -5), (8, -5)]]),
-    (-12, 12, [[(7, -11), (6, -10), (7, -9), (8, -10), (8, -11), (6, -12)], [(10, -12), (3, -12), (0, -11), (-2, -9), (-3, -7), (-4, -4), (-5, 0), (-7, 9), (-8, 13), (-9, 15)], [(3, -12), (1, -11), (-1, -9), (-2, -7), (-3, -4), (-5, 5), (-6, 9), (-7, 12), (-8, 14), (-9, 15), (-11, 16), (-13, 16), (-14, 15), (-14, 14), (-13, 13), (-12, 14), (-13, 15)], [(9, -12), (5, 2), (4, 6), (4, 8), (5, 9), (8, 9), (10, 7), (11, 5)], [(10, -12), (6, 2), (5, 6), (5, 8), (6, 9)], [(-8, -5), (7, -5)]]),
-    (-18, 17, [[(2, -11), (1, -10), (2, -9), (3, -10), (2, -11), (0, -12), (-3, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-11, 0), (-13, 9), (-14, 13), (-15, 15)], [(-3, -12), (-5, -11), (-7, -9), (-8, -7), (-9, -4), (-11, 5), (-12, 9), (-13, 12), (-14, 14), (-15, 15), (-17, 16), (-19, 16), (-20, 15), (-20, 14), (-19, 13), (-18, 14), (-19, 15)], [(14, -11), (13, -10), (14, -9), (15, -10), (14, -11), (11, -12), (8, -12), (5, -11), (3, -9), (2, -7), (1, -4), (0, 0), (-2, 9), (-3, 13), (-4, 15)], [(8, -12), (6, -11), (4, -9), (3, -7), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14), (-8, 15)], [(12, -5), (10, 2), (9, 6), (9, 8), (10, 9), (13, 9), (15, 7), (16, 5)], [(13, -5), (11, 2), (10, 6), (10, 8), (11, 9)], [(-14, -5), (13, -5)]]),
-    (-18, 17, [[(2, -11), (1, -10), (2, -9), (3, -10), (2, -11), (0, -12), (-3, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-11, 0), (-13, 9), (-14, 13), (-15, 15)], [(-3, -12), (-5, -11), (-7, -9), (-8, -7), (-9, -4), (-11, 5), (-12, 9), (-13, 12), (-14, 14), (-15, 15), (-17, 16), (-19, 16), (-20, 15), (-20, 14), (-19, 13), (-18, 14), (-19, 15)], [(12, -11), (11, -10), (12, -9), (13, -10), (13, -11), (11, -12)], [(15, -12), (8, -12), (5, -11), (3, -9), (2, -7), (1, -4), (0, 0), (-2, 9), (-3, 13), (-4, 15)], [(8, -12), (6, -11), (4, -9), (3, -7), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14), (-8, 15)], [(14, -12), (10, 2), (9, 6), (9, 8), (10, 9), (13, 9), (15, 7), (16, 5)], [(15, -12), (11, 2), (10, 6), (10, 8), (11, 9)], [(-14, -5), (12, -5)]]),
-    (-6, 7, [[(-5, -1), (-4, -3), (-2, -5), (1, -5), (2, -4), (2, -1), (0, 5), (0, 8), (1, 9)], [(0, -5), (1, -4), (1, -1), (-1, 5), (-1, 8), (0, 9), (3, 9), (5, 7), (6, 5)]]),
-    (-6, 6, [[(0, -6), (-4, 5), (6, -2), (-6, -2), (4, 5), (0, -6)], [(0, 0), (0, -6)], [(0, 0), (-6, -2)], [(0, 0), (-4, 5)], [(0, 0), (4, 5)], [(0, 0), (6, -2)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-]
-
-TIMESG = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-8, 8, [[(-4, -12), (-5, -5)], [(-3, -12), (-5, -5)], [(4, -12), (3, -5)], [(5, -12), (3, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -9), (5, -8), (6, -7), (7, -8), (7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-4, 4, [[(0, -12), (-1, -5)], [(1, -12), (-1, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16), (4, 16)], [(3, -16), (4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16), (-3, 16)], [(-4, -16), (-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-10, 10, [[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-10, 10, [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(0, -9), (7, 9)], [(-7, 8), (7, 8)], [(-8, 9), (8, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-10, 11, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3), (-7, 0), (-6, 2), (-5, 3), (-2, 4), (3, 4), (6, 3), (7, 2), (8, 0), (8, -3), (7, -5), (6, -6), (3, -7), (-2, -7)], [(-2, -7), (-4, -6), (-5, -5), (-6, -3), (-6, 0), (-5, 2), (-4, 3), (-2, 4)], [(3, 4), (5, 3), (6, 2), (7, 0), (7, -3), (6, -5), (5, -6), (3, -7)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8, -6), (7, -12)], [(-7, 9), (0, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-5, 6, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-2, 3, [[(0, -1), (0, 0), (1, 0), (1, -1), (0, -1)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(7, -12), (-6, 1)], [(-1, -3), (7, 9)], [(-2, -3), (6, 9)], [(-10, -12), (-3, -12)], [(3, -12), (9, -12)], [(-10, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-12, 13, [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]),
-    (-11, 12, [[(-6, -12), (-6, 9)], [(-5, -12), (7, 7)], [(-5, -10), (7, 9)], [(7, -12), (7, 9)], [(-9, -12), (-5, -12)], [(4, -12), (10, -12)], [(-9, 9), (-3, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)], [(-3, -5), (-3, 2)], [(3, -5), (3, 2)], [(-3, -2), (3, -2)], [(-3, -1), (3, -1)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]),
-    (-10, 11, [[(-7, -12), (0, -2), (-8, 9)], [(-8, -12), (-1, -2)], [(-8, -12), (7, -12), (8, -6), (6, -12)], [(-7, 8), (6, 8)], [(-8, 9), (7, 9), (8, 3), (6, 9)]]),
-    (-9, 10, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]),
-    (-9, 10, [[(-7, -7), (-7, -9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5), (0, 9)], [(-7, -9), (-5, -11), (-3, -11), (-1, -9)], [(8, -7), (8, -9), (7, -11), (6, -12), (4, -12), (3, -11), (2, -9), (1, -5), (1, 9)], [(8, -9), (6, -11), (4, -11), (2, -9)], [(-3, 9), (4, 9)]]),
-    (-7, 7, [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]),
-    (-11, 11, [[(-8, 6), (-7, 9), (-3, 9), (-5, 5), (-7, 1), (-8, -2), (-8, -6), (-7, -9), (-5, -11), (-2, -12), (2, -12), (5, -11), (7, -9), (8, -6), (8, -2), (7, 1), (5, 5), (3, 9), (7, 9), (8, 6)], [(-5, 5), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11), (-2, -12)], [(2, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (5, 5)], [(-7, 8), (-4, 8)], [(4, 8), (7, 8)]]),
-    (-11, 11, [[(-7, -13), (-8, -8)], [(8, -13), (7, -8)], [(-3, -4), (-4, 1)], [(4, -4), (3, 1)], [(-7, 5), (-8, 10)], [(8, 5), (7, 10)], [(-7, -11), (7, -11)], [(-7, -10), (7, -10)], [(-3, -2), (3, -2)], [(-3, -1), (3, -1)], [(-7, 7), (7, 7)], [(-7, 8), (7, 8)]]),
-    (-11, 12, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-9, -5), (-8, -6), (-6, -5), (-5, -1), (-4, 1), (-3, 2), (-1, 3)], [(-8, -6), (-7, -5), (-6, -1), (-5, 1), (-4, 2), (-1, 3), (2, 3), (5, 2), (6, 1), (7, -1), (8, -5), (9, -6)], [(2, 3), (4, 2), (5, 1), (6, -1), (7, -5), (9, -6), (10, -5)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-10, 10, [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-6, -12), (-7, -6), (-7, -12), (7, -12)], [(-7, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-11, 12, [[(-1, -5), (-4, -4), (-6, -2), (-7, 0), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2), (8, -5)], [(-1, -5), (-3, -4), (-5, -2), (-6, 0), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(-1, -5), (1, -5), (3, -4), (4, -2), (6, 6), (7, 8), (8, 9)], [(1, -5), (2, -4), (3, -2), (5, 6), (6, 8), (8, 9), (9, 9)]]),
-    (-11, 10, [[(2, -12), (-1, -11), (-3, -9), (-5, -5), (-6, -2), (-7, 2), (-8, 8), (-9, 16)], [(2, -12), (0, -11), (-2, -9), (-4, -5), (-5, -2), (-6, 2), (-7, 8), (-8, 16)], [(2, -12), (4, -12), (6, -11), (7, -10), (7, -7), (6, -5), (5, -4), (2, -3), (-2, -3)], [(4, -12), (6, -10), (6, -7), (5, -5), (4, -4), (2, -3)], [(-2, -3), (2, -2), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (0, 9), (-2, 9), (-4, 8), (-5, 7), (-6, 4)], [(-2, -3), (1, -2), (3, 0), (4, 2), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-9, 9, [[(-7, -5), (-5, -5), (-3, -4), (-2, -2), (3, 13), (4, 15), (5, 16)], [(-5, -5), (-4, -4), (-3, -2), (2, 13), (3, 15), (5, 16), (7, 16)], [(8, -5), (7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]),
-    (-9, 10, [[(4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (1, -8), (0, -10), (0, -12), (1, -13), (3, -13), (5, -12), (7, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4), (2, -7), (1, -9), (1, -11), (2, -12), (4, -12), (7, -10)]]),
-    (-9, 9, [[(6, -2), (4, -4), (2, -5), (-2, -5), (-4, -4), (-4, -2), (-2, 0), (1, 1)], [(-2, -5), (-3, -4), (-3, -2), (-1, 0), (1, 1)], [(1, 1), (-4, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-11, 11, [[(-3, -4), (-5, -3), (-7, -1), (-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (5, 6), (7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3), (0, 1), (-2, 6), (-5, 16)], [(-8, 5), (-6, 7), (-4, 8), (-1, 8), (2, 7), (5, 5), (7, 3)], [(8, -3), (6, -4), (4, -4), (2, -2), (0, 1), (-2, 7), (-4, 16)]]),
-    (-10, 10, [[(-9, -2), (-7, -4), (-5, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 4), (0, 8), (-3, 16)], [(-8, -3), (-6, -4), (-2, -4), (0, -3)], [(8, -5), (7, -2), (6, 0), (1, 7), (-2, 12), (-4, 16)], [(7, -5), (6, -2), (5, 0), (1, 7)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-6, 9)], [(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-4, 2), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -4), (7, -3), (7, 0), (6, 5), (3, 16)], [(4, -5), (6, -3), (6, 0), (5, 5), (2, 16)]]),
-    (-6, 6, [[(0, -5), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3, 7), (4, 5)], [(1, -5), (-1, 2), (-2, 6), (-2, 8), (-1, 9)]]),
-    (-11, 11, [[(-7, -7), (7, 7)], [(7, -7), (-7, 7)]]),
-    (-10, 10, [[(-4, -5), (-8, 9)], [(-3, -5), (-7, 9)], [(6, -5), (7, -4), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-5, 1)], [(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)]]),
-    (-10, 10, [[(-7, -12), (-5, -12), (-3, -11), (-2, -10), (-1, -8), (5, 6), (6, 8), (7, 9)], [(-5, -12), (-3, -10), (-2, -8), (4, 6), (5, 8), (7, 9), (8, 9)], [(0, -5), (-8, 9)], [(0, -5), (-7, 9)]]),
-    (-12, 11, [[(-5, -5), (-11, 16)], [(-4, -5), (-10, 16)], [(-5, -2), (-6, 4), (-6, 7), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3)], [(6, -5), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (4, 6), (4, 8), (5, 9)]]),
-    (-10, 10, [[(-4, -5), (-6, 9)], [(-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5), (6, -1), (4, 3)], [(8, -5), (7, -2), (6, 0), (4, 3), (2, 5), (-1, 7), (-3, 8), (-6, 9)], [(-7, -5), (-3, -5)]]),
-    (-9, 9, [[(0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)]]),
-    (-11, 11, [[(-2, -4), (-6, 9)], [(-2, -4), (-5, 9)], [(4, -4), (4, 9)], [(4, -4), (5, 9)], [(-9, -2), (-7, -4), (-4, -5), (9, -5)], [(-9, -2), (-7, -3), (-4, -4), (9, -4)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-4, 8), (-3, 9)], [(-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -5), (7, -9), (6, -11), (4, -12), (2, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2)], [(1, 8), (3, 5), (4, 3), (5, 0), (6, -5), (6, -9), (5, -11), (4, -12)]]),
-    (-10, 9, [[(-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-10, 16)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-9, 16)]]),
-    (-10, 11, [[(9, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 5), (5, 2), (5, -1), (4, -3), (3, -4), (1, -5)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-1, 9), (1, 8), (3, 5), (4, 2), (4, -2), (3, -4)], [(3, -4), (9, -4)]]),
-    (-10, 10, [[(1, -4), (-2, 9)], [(1, -4), (-1, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)], [(-8, -2), (-6, -3), (-3, -4), (8, -4)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -2), (-4, 4), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -2), (-5, 4), (-5, 7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (7, -3), (6, -5), (5, -4), (6, -3), (7, 0)], [(6, 3), (7, -3)]]),
-    (-13, 13, [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 0), (9, 0)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-12, 11, [[(-8, -1), (-6, -3), (-3, -4), (-4, -5), (-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 5), (0, 2)], [(-9, 5), (-8, 7), (-7, 8), (-5, 8), (-3, 7), (-1, 5)], [(-1, 2), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5), (8, 2), (8, -1), (7, -4), (6, -5), (5, -4), (7, -3), (8, -1)], [(-1, 5), (0, 7), (1, 8), (3, 8), (5, 7), (7, 5)]]),
-    (-9, 8, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (6, -7)], [(3, -7), (-1, -6), (-3, -5), (-4, -3), (-4, -1), (-2, 1), (1, 2), (4, 2)], [(3, -7), (0, -6), (-2, -5), (-3, -3), (-3, -1), (-1, 1), (1, 2)], [(1, 2), (-3, 3), (-5, 4), (-6, 6), (-6, 8), (-4, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)], [(1, 2), (-2, 3), (-4, 4), (-5, 6), (-5, 8), (-3, 10), (1, 12)]]),
-    (-12, 11, [[(3, -12), (-3, 16)], [(4, -12), (-4, 16)], [(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-3, 8), (0, 8), (2, 7), (5, 4), (7, 1)], [(-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (0, 9), (2, 8), (4, 6), (6, 3), (7, 1), (9, -5)]]),
-    (-9, 9, [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (8, -7), (8, -8), (5, -7), (1, -5), (-2, -3), (-5, 0), (-6, 3), (-6, 5), (-5, 7), (-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16), (-2, 15)], [(3, -6), (-1, -3), (-4, 0), (-5, 3), (-5, 5), (-4, 7), (-2, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-TIMESI = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(3, -12), (2, -11), (0, 1)], [(3, -11), (0, 1)], [(3, -12), (4, -11), (0, 1)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-9, 9, [[(-2, -12), (-4, -5)], [(-1, -12), (-4, -5)], [(7, -12), (5, -5)], [(8, -12), (5, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 11, [[(2, -16), (-6, 13)], [(7, -16), (-1, 13)], [(8, -8), (7, -7), (8, -6), (9, -7), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-4, 5, [[(3, -12), (1, -5)], [(4, -12), (1, -5)]]),
-    (-7, 8, [[(8, -16), (4, -13), (1, -10), (-1, -7), (-3, -3), (-4, 2), (-4, 6), (-3, 11), (-2, 14), (-1, 16)], [(4, -13), (1, -9), (-1, -5), (-2, -2), (-3, 3), (-3, 8), (-2, 13), (-1, 16)]]),
-    (-8, 7, [[(1, -16), (2, -14), (3, -11), (4, -6), (4, -2), (3, 3), (1, 7), (-1, 10), (-4, 13), (-8, 16)], [(1, -16), (2, -13), (3, -8), (3, -3), (2, 2), (1, 5), (-1, 9), (-4, 13)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-3, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]),
-    (-10, 11, [[(2, -8), (-3, 9)], [(4, -12), (-2, 9)], [(4, -12), (1, -9), (-2, -7), (-4, -6)], [(3, -9), (-1, -7), (-4, -6)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (5, -3), (2, -1), (-2, 1), (-5, 3), (-7, 5), (-9, 9)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (-2, 1)], [(-8, 7), (-7, 6), (-5, 6), (0, 8), (3, 8), (5, 7), (6, 5)], [(-5, 6), (0, 9), (3, 9), (5, 8), (6, 5)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (4, -3), (1, -2)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5), (4, -3)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -2), (3, -1), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (1, 9)]]),
-    (-10, 11, [[(6, -11), (0, 9)], [(7, -12), (1, 9)], [(7, -12), (-8, 3), (8, 3)]]),
-    (-10, 11, [[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (4, -11), (9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -4), (3, -3), (4, -2), (5, 0), (5, 3), (4, 6), (2, 8), (0, 9)]]),
-    (-10, 11, [[(7, -9), (6, -8), (7, -7), (8, -8), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-5, 0), (-6, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 6), (-5, 8)], [(0, 9), (2, 8), (4, 6), (5, 4), (5, 0), (4, -2)]]),
-    (-10, 11, [[(-4, -12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (1, 0), (-1, 3), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)], [(-4, -10), (-2, -11), (0, -11), (5, -9), (7, -9), (8, -10), (9, -12)]]),
-    (-10, 11, [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3), (-1, -2), (2, -2), (6, -3), (7, -4), (8, -6), (8, -9), (7, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-2, -10), (-3, -8), (-3, -5), (-2, -3), (-1, -2)], [(2, -2), (5, -3), (6, -4), (7, -6), (7, -9), (6, -11), (4, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(-1, -2), (-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(0, 9), (3, 8), (4, 7), (5, 5), (5, 1), (4, -1)]]),
-    (-10, 11, [[(7, -5), (6, -3), (4, -1), (2, 0), (-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12), (6, -11), (7, -10), (8, -8), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)], [(-3, -1), (-4, -3), (-4, -7), (-3, -9), (-1, -11), (1, -12)], [(6, -11), (7, -9), (7, -4), (6, 0), (5, 3), (3, 6), (1, 8), (-1, 9)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8)]]),
-    (-5, 6, [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)], [(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-10, 11, [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (1, -2), (-1, -1), (-1, 1), (0, 2), (2, 2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(3, -12), (-10, 9)], [(3, -12), (4, 9)], [(2, -10), (3, 9)], [(-6, 3), (3, 3)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -4), (6, -3), (4, -2)], [(-5, -2), (4, -2), (6, -1), (7, 1), (7, 3), (6, 6), (4, 8), (0, 9), (-12, 9)], [(4, -2), (5, -1), (6, 1), (6, 3), (5, 6), (3, 8), (0, 9)]]),
-    (-10, 11, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6), (6, 4)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (3, -12), (6, -11), (7, -10), (8, -7), (8, -3), (7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-12, 9)], [(3, -12), (5, -11), (6, -10), (7, -7), (7, -3), (6, 1), (4, 5), (2, 7), (0, 8), (-3, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)], [(-6, -12), (9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9), (3, 9), (5, 4), (2, 9)]]),
-    (-12, 10, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)], [(-6, -12), (9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9), (-5, 9)]]),
-    (-10, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (7, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9)], [(0, 9), (2, 8), (4, 6), (6, 2)], [(3, 2), (10, 2)]]),
-    (-13, 13, [[(-4, -12), (-10, 9)], [(-3, -12), (-9, 9)], [(9, -12), (3, 9)], [(10, -12), (4, 9)], [(-7, -12), (0, -12)], [(6, -12), (13, -12)], [(-6, -2), (6, -2)], [(-13, 9), (-6, 9)], [(0, 9), (7, 9)]]),
-    (-6, 7, [[(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(0, -12), (7, -12)], [(-6, 9), (1, 9)]]),
-    (-9, 9, [[(6, -12), (1, 5), (0, 7), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(5, -12), (0, 5), (-1, 7), (-3, 9)], [(2, -12), (9, -12)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(11, -12), (-6, 1)], [(1, -3), (5, 9)], [(0, -3), (4, 9)], [(-6, -12), (1, -12)], [(7, -12), (13, -12)], [(-12, 9), (-5, 9)], [(1, 9), (7, 9)]]),
-    (-10, 10, [[(-1, -12), (-7, 9)], [(0, -12), (-6, 9)], [(-4, -12), (3, -12)], [(-10, 9), (5, 9), (7, 3), (4, 9)]]),
-    (-13, 14, [[(-4, -12), (-10, 9)], [(-4, -12), (-3, 9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(10, -12), (4, 9)], [(11, -12), (5, 9)], [(-7, -12), (-3, -12)], [(10, -12), (14, -12)], [(-13, 9), (-7, 9)], [(1, 9), (8, 9)]]),
-    (-12, 13, [[(-3, -12), (-9, 9)], [(-3, -12), (4, 6)], [(-3, -9), (4, 9)], [(10, -12), (4, 9)], [(-6, -12), (-3, -12)], [(7, -12), (13, -12)], [(-12, 9), (-6, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (6, -12), (9, -11), (10, -9), (10, -7), (9, -4), (7, -2), (3, -1), (-5, -1)], [(6, -12), (8, -11), (9, -9), (9, -7), (8, -4), (6, -2), (3, -1)], [(-12, 9), (-5, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)], [(-6, 7), (-6, 6), (-5, 4), (-3, 3), (-2, 3), (0, 4), (1, 6), (1, 13), (2, 14), (4, 14), (5, 12), (5, 11)], [(1, 6), (2, 12), (3, 13), (4, 13), (5, 12)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2), (-5, -2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7, -4), (6, -3), (4, -2)], [(0, -2), (2, -1), (3, 0), (4, 8), (5, 9), (7, 9), (8, 7), (8, 6)], [(3, 0), (5, 7), (6, 8), (7, 8), (8, 7)], [(-12, 9), (-5, 9)]]),
-    (-11, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-9, 9), (-8, 7), (-7, 7)]]),
-    (-10, 11, [[(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(-3, -12), (-6, -6), (-4, -12), (11, -12), (10, -6), (10, -12)], [(-6, 9), (1, 9)]]),
-    (-12, 13, [[(-4, -12), (-7, -1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (3, 8), (5, 6), (6, 3), (10, -12)], [(-3, -12), (-6, -1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(-7, -12), (0, -12)], [(7, -12), (13, -12)]]),
-    (-10, 10, [[(-4, -12), (-3, 9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(-6, -12), (0, -12)], [(6, -12), (12, -12)]]),
-    (-13, 13, [[(-5, -12), (-7, 9)], [(-4, -12), (-6, 7)], [(3, -12), (-7, 9)], [(3, -12), (1, 9)], [(4, -12), (2, 7)], [(11, -12), (1, 9)], [(-8, -12), (-1, -12)], [(8, -12), (14, -12)]]),
-    (-11, 11, [[(-4, -12), (3, 9)], [(-3, -12), (4, 9)], [(10, -12), (-10, 9)], [(-6, -12), (0, -12)], [(6, -12), (12, -12)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]),
-    (-10, 11, [[(-4, -12), (0, -2), (-3, 9)], [(-3, -12), (1, -2), (-2, 9)], [(11, -12), (1, -2)], [(-6, -12), (0, -12)], [(7, -12), (13, -12)], [(-6, 9), (1, 9)]]),
-    (-11, 11, [[(9, -12), (-10, 9)], [(10, -12), (-9, 9)], [(-3, -12), (-6, -6), (-4, -12), (10, -12)], [(-10, 9), (4, 9), (6, 3), (3, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-10, 11, [[(6, -5), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]),
-    (-10, 9, [[(-2, -12), (-6, 1), (-6, 4), (-5, 7), (-4, 8)], [(-1, -12), (-5, 1)], [(-5, 1), (-4, -2), (-2, -4), (0, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 2), (5, 5), (3, 8), (0, 9), (-2, 9), (-4, 8), (-5, 5), (-5, 1)], [(4, -4), (5, -2), (5, 2), (4, 5), (2, 8), (0, 9)], [(-5, -12), (-1, -12)]]),
-    (-9, 9, [[(5, -2), (5, -1), (6, -1), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)]]),
-    (-10, 11, [[(8, -12), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(9, -12), (5, 2), (4, 6), (4, 8), (5, 9)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(5, -12), (9, -12)]]),
-    (-9, 9, [[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)]]),
-    (-7, 8, [[(8, -11), (7, -10), (8, -9), (9, -10), (9, -11), (8, -12), (6, -12), (4, -11), (3, -10), (2, -8), (1, -5), (-2, 9), (-3, 13), (-4, 15)], [(6, -12), (4, -10), (3, -8), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14), (-8, 15)], [(-3, -5), (7, -5)]]),
-    (-10, 10, [[(7, -5), (3, 9), (2, 12), (0, 15), (-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 13), (-8, 12), (-7, 13), (-8, 14)], [(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]),
-    (-10, 11, [[(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5), (5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(-5, -12), (-1, -12)]]),
-    (-6, 7, [[(3, -12), (2, -11), (3, -10), (4, -11), (3, -12)], [(-5, -1), (-4, -3), (-2, -5), (1, -5), (2, -4), (2, -1), (0, 5), (0, 8), (1, 9)], [(0, -5), (1, -4), (1, -1), (-1, 5), (-1, 8), (0, 9), (3, 9), (5, 7), (6, 5)]]),
-    (-6, 7, [[(4, -12), (3, -11), (4, -10), (5, -11), (4, -12)], [(-4, -1), (-3, -3), (-1, -5), (2, -5), (3, -4), (3, -1), (0, 9), (-1, 12), (-2, 14), (-3, 15), (-5, 16), (-7, 16), (-8, 15), (-8, 14), (-7, 13), (-6, 14), (-7, 15)], [(1, -5), (2, -4), (2, -1), (-1, 9), (-2, 12), (-3, 14), (-5, 16)]]),
-    (-10, 10, [[(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(6, -4), (5, -3), (6, -2), (7, -3), (7, -4), (6, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-5, 1)], [(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)], [(-5, -12), (-1, -12)]]),
-    (-5, 7, [[(3, -12), (-1, 2), (-2, 6), (-2, 8), (-1, 9), (2, 9), (4, 7), (5, 5)], [(4, -12), (0, 2), (-1, 6), (-1, 8), (0, 9)], [(0, -12), (4, -12)]]),
-    (-17, 16, [[(-16, -1), (-15, -3), (-13, -5), (-10, -5), (-9, -4), (-9, -2), (-10, 2), (-12, 9)], [(-11, -5), (-10, -4), (-10, -2), (-11, 2), (-13, 9)], [(-10, 2), (-8, -2), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -3), (1, -1), (-2, 9)], [(-2, -5), (0, -3), (0, -1), (-3, 9)], [(0, 2), (2, -2), (4, -4), (6, -5), (8, -5), (10, -4), (11, -3), (11, -1), (9, 5), (9, 8), (10, 9)], [(8, -5), (10, -3), (10, -1), (8, 5), (8, 8), (9, 9), (12, 9), (14, 7), (15, 5)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-6, -5), (-5, -4), (-5, -2), (-6, 2), (-8, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5), (5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)]]),
-    (-9, 9, [[(0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-8, 16)], [(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-9, 16)], [(-4, 2), (-3, -1), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -3), (7, -1), (7, 2), (6, 5), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 5), (-4, 2)], [(5, -4), (6, -2), (6, 2), (5, 5), (3, 8), (1, 9)], [(-12, 16), (-5, 16)]]),
-    (-10, 10, [[(6, -5), (0, 16)], [(7, -5), (1, 16)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-3, 16), (4, 16)]]),
-    (-9, 8, [[(-8, -1), (-7, -3), (-5, -5), (-2, -5), (-1, -4), (-1, -2), (-2, 2), (-4, 9)], [(-3, -5), (-2, -4), (-2, -2), (-3, 2), (-5, 9)], [(-2, 2), (0, -2), (2, -4), (4, -5), (6, -5), (7, -4), (7, -3), (6, -2), (5, -3), (6, -4)]]),
-    (-8, 9, [[(6, -3), (6, -2), (7, -2), (7, -3), (6, -4), (3, -5), (0, -5), (-3, -4), (-4, -3), (-4, -1), (-3, 0), (4, 4), (5, 5)], [(-4, -2), (-3, -1), (4, 3), (5, 4), (5, 7), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 6), (-5, 6), (-5, 7)]]),
-    (-7, 7, [[(2, -12), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3, 7), (4, 5)], [(3, -12), (-1, 2), (-2, 6), (-2, 8), (-1, 9)], [(-4, -5), (5, -5)]]),
-    (-12, 11, [[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -1), (-6, 5), (-6, 7), (-4, 9)], [(-6, -5), (-5, -4), (-5, -1), (-7, 5), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 2)], [(6, -5), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -1), (-4, 5), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5, 7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, -1), (7, -5), (6, -5), (7, -3)]]),
-    (-15, 14, [[(-14, -1), (-13, -3), (-11, -5), (-8, -5), (-7, -4), (-7, -1), (-9, 5), (-9, 7), (-7, 9)], [(-9, -5), (-8, -4), (-8, -1), (-10, 5), (-10, 7), (-9, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 6), (0, 4)], [(2, -5), (0, 4), (0, 7), (1, 8), (3, 9), (5, 9), (7, 8), (9, 6), (10, 4), (11, 0), (11, -5), (10, -5), (11, -3)], [(3, -5), (1, 4), (1, 7), (3, 9)]]),
-    (-10, 10, [[(-7, -1), (-5, -4), (-3, -5), (0, -5), (1, -3), (1, 0)], [(-1, -5), (0, -3), (0, 0), (-1, 4), (-2, 6), (-4, 8), (-6, 9), (-7, 9), (-8, 8), (-8, 7), (-7, 6), (-6, 7), (-7, 8)], [(-1, 4), (-1, 7), (0, 9), (3, 9), (5, 8), (7, 5)], [(7, -4), (6, -3), (7, -2), (8, -3), (8, -4), (7, -5), (6, -5), (4, -4), (2, -2), (1, 0), (0, 4), (0, 7), (1, 9)]]),
-    (-11, 10, [[(-10, -1), (-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5, 7), (-3, 9)], [(-5, -5), (-4, -4), (-4, -1), (-6, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(8, -5), (4, 9), (3, 12), (1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14), (-8, 13), (-7, 12), (-6, 13), (-7, 14)], [(7, -5), (3, 9), (2, 12), (0, 15), (-2, 16)]]),
-    (-10, 10, [[(7, -5), (6, -3), (4, -1), (-4, 5), (-6, 7), (-7, 9)], [(-6, -1), (-5, -3), (-3, -5), (0, -5), (4, -3)], [(-5, -3), (-3, -4), (0, -4), (4, -3), (6, -3)], [(-6, 7), (-4, 7), (0, 8), (3, 8), (5, 7)], [(-4, 7), (0, 9), (3, 9), (5, 7), (6, 5)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-TIMESIB = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(4, -12), (3, -12), (2, -11), (0, 2)], [(4, -11), (3, -11), (0, 2)], [(4, -11), (4, -10), (0, 2)], [(4, -12), (5, -11), (5, -10), (0, 2)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9), (-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)]]),
-    (-9, 9, [[(-2, -12), (-4, -5)], [(-1, -12), (-4, -5)], [(7, -12), (5, -5)], [(8, -12), (5, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 11, [[(2, -16), (-6, 13)], [(7, -16), (-1, 13)], [(8, -7), (8, -8), (7, -8), (7, -6), (9, -6), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -2), (4, 1), (5, 3), (5, 6), (4, 8)], [(-4, -6), (-3, -4), (4, 0), (5, 2)], [(-3, -11), (-4, -9), (-4, -7), (-3, -5), (3, -2), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5), (-7, 4)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(10, -3), (10, -4), (9, -4), (9, -2), (11, -2), (11, -4), (10, -5), (9, -5), (7, -4), (5, -2), (0, 6), (-2, 8), (-4, 9), (-7, 9), (-10, 8), (-11, 6), (-11, 4), (-10, 2), (-9, 1), (-7, 0), (-2, -2), (0, -3), (2, -5), (3, -7), (3, -9), (2, -11), (0, -12), (-2, -11), (-3, -9), (-3, -6), (-2, 0), (-1, 3), (0, 5), (2, 8), (4, 9), (6, 9), (7, 7), (7, 6)], [(-6, 9), (-10, 8)], [(-9, 8), (-10, 6), (-10, 4), (-9, 2), (-8, 1), (-6, 0)], [(-2, -2), (-1, 1), (2, 7), (4, 8)], [(-7, 9), (-8, 8), (-9, 6), (-9, 4), (-8, 2), (-7, 1), (-5, 0), (0, -3)], [(-3, -6), (-2, -3), (-1, 0), (1, 4), (3, 7), (5, 8), (6, 8), (7, 7)]]),
-    (-4, 5, [[(3, -12), (1, -5)], [(4, -12), (1, -5)]]),
-    (-8, 8, [[(8, -16), (6, -15), (3, -13), (0, -10), (-2, -7), (-4, -3), (-5, 1), (-5, 6), (-4, 10), (-3, 13), (-1, 16)], [(1, -10), (-1, -7), (-3, -3), (-4, 2), (-4, 10)], [(8, -16), (5, -14), (2, -11), (0, -8), (-1, -6), (-2, -3), (-3, 1), (-4, 10)], [(-4, 2), (-3, 11), (-2, 14), (-1, 16)]]),
-    (-8, 8, [[(1, -16), (3, -13), (4, -10), (5, -6), (5, -1), (4, 3), (2, 7), (0, 10), (-3, 13), (-6, 15), (-8, 16)], [(4, -10), (4, -2), (3, 3), (1, 7), (-1, 10)], [(1, -16), (2, -14), (3, -11), (4, -2)], [(4, -10), (3, -1), (2, 3), (1, 6), (0, 8), (-2, 11), (-5, 14), (-8, 16)]]),
-    (-8, 9, [[(2, -12), (1, -11), (3, -1), (2, 0)], [(2, -12), (2, 0)], [(2, -12), (3, -11), (1, -1), (2, 0)], [(-3, -9), (-2, -9), (6, -3), (7, -3)], [(-3, -9), (7, -3)], [(-3, -9), (-3, -8), (7, -4), (7, -3)], [(7, -9), (6, -9), (-2, -3), (-3, -3)], [(7, -9), (-3, -3)], [(7, -9), (7, -8), (-3, -4), (-3, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(-1, 9), (-2, 9), (-3, 8), (-3, 7), (-2, 6), (-1, 6), (0, 7), (0, 9), (-1, 11), (-2, 12), (-4, 13)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)], [(-1, 9), (-1, 10), (-2, 12)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 6, [[(-2, 6), (-3, 7), (-3, 8), (-2, 9), (-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 11, [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)], [(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(2, 7), (4, 5), (5, 3), (6, 0), (7, -4), (7, -8), (6, -10)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-3, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -4), (6, -9), (5, -11), (4, -12)]]),
-    (-10, 11, [[(2, -8), (-3, 9), (-1, 9)], [(5, -12), (3, -8), (-2, 9)], [(5, -12), (-1, 9)], [(5, -12), (2, -9), (-1, -7), (-3, -6)], [(2, -8), (0, -7), (-3, -6)]]),
-    (-10, 11, [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (5, -3), (-5, 3), (-7, 5), (-9, 9)], [(6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (1, -1)], [(4, -12), (5, -11), (6, -9), (6, -7), (5, -5), (3, -3), (-5, 3)], [(-8, 7), (-7, 6), (-5, 6), (0, 7), (5, 7), (6, 6)], [(-5, 6), (0, 8), (5, 8)], [(-5, 6), (0, 9), (3, 9), (5, 8), (6, 6), (6, 5)]]),
-    (-10, 11, [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8), (-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3), (1, -2)], [(6, -11), (7, -9), (7, -7), (6, -5), (5, -4)], [(4, -12), (5, -11), (6, -9), (6, -7), (5, -5), (3, -3), (1, -2)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5), (-7, 4)], [(4, 0), (5, 2), (5, 5), (4, 7)], [(1, -2), (3, -1), (4, 1), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-10, 11, [[(5, -8), (0, 9), (2, 9)], [(8, -12), (6, -8), (1, 9)], [(8, -12), (2, 9)], [(8, -12), (-8, 3), (8, 3)]]),
-    (-10, 11, [[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (7, -11)], [(-2, -10), (3, -10), (7, -11), (9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5), (-7, 4)], [(4, -2), (5, 0), (5, 3), (4, 6), (2, 8)], [(1, -4), (3, -3), (4, -1), (4, 3), (3, 6), (1, 8), (-1, 9)]]),
-    (-10, 11, [[(7, -8), (7, -9), (6, -9), (6, -7), (8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1)], [(-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(4, 6), (5, 4), (5, 1), (4, -1)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-3, 9)], [(0, 9), (2, 8), (3, 7), (4, 4), (4, 0), (3, -2), (2, -3)]]),
-    (-10, 11, [[(-4, -12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (2, -1), (0, 2), (-1, 5), (-2, 9)], [(0, 1), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9), (-2, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)], [(-3, -11), (0, -11), (5, -9)], [(-5, -9), (-3, -10), (0, -10), (5, -9), (7, -9), (8, -10), (9, -12)]]),
-    (-10, 11, [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3), (-1, -2), (2, -2), (5, -3), (7, -4), (8, -6), (8, -9), (7, -11), (5, -12), (1, -12)], [(3, -12), (-2, -11)], [(-2, -10), (-3, -8), (-3, -4), (-2, -3)], [(-3, -3), (0, -2)], [(1, -2), (5, -3)], [(6, -4), (7, -6), (7, -9), (6, -11)], [(7, -11), (3, -12)], [(1, -12), (-1, -10), (-2, -8), (-2, -4), (-1, -2)], [(2, -2), (4, -3), (5, -4), (6, -6), (6, -10), (5, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(0, -2), (-5, -1)], [(-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8)], [(-7, 8), (-2, 9), (4, 8)], [(4, 7), (5, 5), (5, 2), (4, 0)], [(4, -1), (1, -2)], [(-1, -2), (-3, -1), (-5, 1), (-6, 3), (-6, 6), (-5, 8), (-4, 9)], [(0, 9), (2, 8), (3, 7), (4, 5), (4, 1), (3, -1), (2, -2)]]),
-    (-10, 11, [[(6, -4), (5, -2), (4, -1), (2, 0), (-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12), (6, -11), (7, -10), (8, -7), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 4), (-5, 4), (-5, 6), (-6, 6), (-6, 5)], [(-3, -2), (-4, -4), (-4, -7), (-3, -9)], [(6, -10), (7, -8), (7, -4), (6, 0), (5, 3), (3, 6)], [(-1, 0), (-2, -1), (-3, -3), (-3, -7), (-2, -10), (-1, -11), (1, -12)], [(4, -12), (5, -11), (6, -9), (6, -4), (5, 0), (4, 3), (3, 5), (1, 8), (-1, 9)]]),
-    (-5, 6, [[(1, -5), (0, -4), (0, -3), (1, -2), (2, -2), (3, -3), (3, -4), (2, -5), (1, -5)], [(1, -4), (1, -3), (2, -3), (2, -4), (1, -4)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9), (-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)]]),
-    (-5, 6, [[(1, -5), (0, -4), (0, -3), (1, -2), (2, -2), (3, -3), (3, -4), (2, -5), (1, -5)], [(1, -4), (1, -3), (2, -3), (2, -4), (1, -4)], [(-1, 9), (-2, 9), (-3, 8), (-3, 7), (-2, 6), (-1, 6), (0, 7), (0, 9), (-1, 11), (-2, 12), (-4, 13)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)], [(-1, 9), (-1, 10), (-2, 12)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-10, 11, [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8), (-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -5), (7, -4), (5, -3), (1, -2), (-1, -1), (-1, 1), (1, 2), (2, 2)], [(3, -12), (8, -11)], [(7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(5, -12), (6, -11), (7, -9), (7, -7), (6, -5), (5, -4), (1, -2), (0, -1), (0, 1), (1, 2)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9), (-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7), (-2, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(3, -12), (-9, 8)], [(1, -8), (2, 9)], [(2, -10), (3, 8)], [(3, -12), (3, -10), (4, 7), (4, 9)], [(-6, 3), (2, 3)], [(-12, 9), (-6, 9)], [(-1, 9), (6, 9)], [(-9, 8), (-11, 9)], [(-9, 8), (-7, 9)], [(2, 8), (0, 9)], [(2, 7), (1, 9)], [(4, 7), (5, 9)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2)], [(7, -11), (8, -9), (8, -7), (7, -4), (6, -3)], [(5, -12), (6, -11), (7, -9), (7, -7), (6, -4), (4, -2)], [(-4, -2), (4, -2), (6, -1), (7, 1), (7, 3), (6, 6), (4, 8), (0, 9), (-12, 9)], [(5, -1), (6, 1), (6, 3), (5, 6), (3, 8)], [(4, -2), (5, 0), (5, 3), (4, 6), (2, 8), (0, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]),
-    (-10, 11, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6), (6, 4)], [(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (3, -12), (6, -11), (7, -10), (8, -7), (8, -3), (7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-12, 9)], [(5, -11), (6, -10), (7, -7), (7, -3), (6, 1), (4, 5), (2, 7)], [(3, -12), (5, -10), (6, -7), (6, -3), (5, 1), (3, 5), (0, 8), (-3, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(3, -6), (1, 2)], [(-6, -12), (9, -12), (8, -6)], [(-4, -2), (2, -2)], [(-12, 9), (3, 9), (5, 4)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(5, -12), (8, -11)], [(6, -12), (8, -10)], [(7, -12), (8, -9)], [(8, -12), (8, -6)], [(3, -6), (1, -2), (1, 2)], [(2, -4), (0, -2), (1, 0)], [(2, -3), (-1, -2), (1, -1)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)], [(-2, 9), (3, 8)], [(0, 9), (3, 7)], [(3, 7), (5, 4)]]),
-    (-12, 10, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(3, -6), (1, 2)], [(-6, -12), (9, -12), (8, -6)], [(-4, -2), (2, -2)], [(-12, 9), (-4, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(5, -12), (8, -11)], [(6, -12), (8, -10)], [(7, -12), (8, -9)], [(8, -12), (8, -6)], [(3, -6), (1, -2), (1, 2)], [(2, -4), (0, -2), (1, 0)], [(2, -3), (-1, -2), (1, -1)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]),
-    (-10, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (7, 2)], [(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)], [(4, 6), (5, 5), (6, 2)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-2, 9)], [(0, 9), (2, 8), (4, 5), (5, 2)], [(2, 2), (10, 2)], [(3, 2), (5, 3)], [(4, 2), (5, 5)], [(8, 2), (6, 4)], [(9, 2), (6, 3)]]),
-    (-13, 13, [[(-4, -12), (-10, 9)], [(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(8, -12), (2, 9)], [(9, -12), (3, 9)], [(10, -12), (4, 9)], [(-7, -12), (1, -12)], [(5, -12), (13, -12)], [(-6, -2), (6, -2)], [(-13, 9), (-5, 9)], [(-1, 9), (7, 9)], [(-6, -12), (-3, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-3, -10)], [(0, -12), (-3, -11)], [(6, -12), (9, -11)], [(7, -12), (8, -10)], [(11, -12), (9, -10)], [(12, -12), (9, -11)], [(-9, 8), (-12, 9)], [(-9, 7), (-11, 9)], [(-8, 7), (-7, 9)], [(-9, 8), (-6, 9)], [(3, 8), (0, 9)], [(3, 7), (1, 9)], [(4, 7), (5, 9)], [(3, 8), (6, 9)]]),
-    (-7, 7, [[(2, -12), (-4, 9)], [(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(-1, -12), (7, -12)], [(-7, 9), (1, 9)], [(0, -12), (3, -11)], [(1, -12), (2, -10)], [(5, -12), (3, -10)], [(6, -12), (3, -11)], [(-3, 8), (-6, 9)], [(-3, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-3, 8), (0, 9)]]),
-    (-9, 10, [[(5, -12), (0, 5), (-1, 7), (-3, 9)], [(6, -12), (2, 1), (1, 4), (0, 6)], [(7, -12), (3, 1), (1, 6), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 3), (-5, 4), (-5, 5), (-6, 6), (-7, 6)], [(-7, 4), (-7, 5), (-6, 5), (-6, 4), (-7, 4)], [(2, -12), (10, -12)], [(3, -12), (6, -11)], [(4, -12), (5, -10)], [(8, -12), (6, -10)], [(9, -12), (6, -11)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(10, -11), (-5, 0)], [(-1, -3), (3, 9)], [(0, -3), (4, 9)], [(1, -4), (5, 8)], [(-6, -12), (2, -12)], [(7, -12), (13, -12)], [(-12, 9), (-4, 9)], [(0, 9), (7, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(8, -12), (10, -11)], [(12, -12), (10, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)], [(3, 8), (1, 9)], [(3, 7), (2, 9)], [(4, 7), (6, 9)]]),
-    (-10, 10, [[(-1, -12), (-7, 9)], [(0, -12), (-6, 9)], [(1, -12), (-5, 9)], [(-4, -12), (4, -12)], [(-10, 9), (5, 9), (7, 3)], [(-3, -12), (0, -11)], [(-2, -12), (-1, -10)], [(2, -12), (0, -10)], [(3, -12), (0, -11)], [(-6, 8), (-9, 9)], [(-6, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-6, 8), (-3, 9)], [(0, 9), (5, 8)], [(2, 9), (6, 6)], [(4, 9), (7, 3)]]),
-    (-14, 14, [[(-5, -12), (-11, 8)], [(-5, -11), (-4, 7), (-4, 9)], [(-4, -12), (-3, 7)], [(-3, -12), (-2, 6)], [(9, -12), (-2, 6), (-4, 9)], [(9, -12), (3, 9)], [(10, -12), (4, 9)], [(11, -12), (5, 9)], [(-8, -12), (-3, -12)], [(9, -12), (14, -12)], [(-14, 9), (-8, 9)], [(0, 9), (8, 9)], [(-7, -12), (-5, -11)], [(-6, -12), (-5, -10)], [(12, -12), (10, -10)], [(13, -12), (10, -11)], [(-11, 8), (-13, 9)], [(-11, 8), (-9, 9)], [(4, 8), (1, 9)], [(4, 7), (2, 9)], [(5, 7), (6, 9)], [(4, 8), (7, 9)]]),
-    (-12, 13, [[(-3, -12), (-9, 8)], [(-3, -12), (4, 9)], [(-2, -12), (4, 6)], [(-1, -12), (5, 6)], [(10, -11), (5, 6), (4, 9)], [(-6, -12), (-1, -12)], [(7, -12), (13, -12)], [(-12, 9), (-6, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-2, -10)], [(8, -12), (10, -11)], [(12, -12), (10, -11)], [(-9, 8), (-11, 9)], [(-9, 8), (-7, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7)], [(3, 6), (5, 3), (6, 0), (7, -4), (7, -8), (6, -10)], [(1, -12), (-1, -11), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 6), (-5, 8), (-4, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -4), (6, -9), (5, -11), (4, -12)]]),
-    (-12, 11, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (6, -12), (9, -11), (10, -9), (10, -7), (9, -4), (7, -2), (3, -1), (-5, -1)], [(8, -11), (9, -9), (9, -7), (8, -4), (6, -2)], [(6, -12), (7, -11), (8, -9), (8, -7), (7, -4), (5, -2), (3, -1)], [(-12, 9), (-4, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]),
-    (-11, 11, [[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7)], [(3, 6), (5, 3), (6, 0), (7, -4), (7, -8), (6, -10)], [(1, -12), (-1, -11), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 6), (-5, 8), (-4, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -4), (6, -9), (5, -11), (4, -12)], [(-6, 6), (-5, 4), (-3, 3), (-2, 3), (0, 4), (1, 6), (2, 11), (3, 12), (4, 12), (5, 11)], [(2, 12), (3, 13), (4, 13)], [(1, 6), (1, 13), (2, 14), (4, 14), (5, 11), (5, 10)]]),
-    (-12, 12, [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2), (-4, -2)], [(7, -11), (8, -9), (8, -7), (7, -4), (6, -3)], [(5, -12), (6, -11), (7, -9), (7, -7), (6, -4), (4, -2)], [(0, -2), (2, -1), (3, 0), (5, 6), (6, 7), (7, 7), (8, 6)], [(5, 7), (6, 8), (7, 8)], [(3, 0), (4, 8), (5, 9), (7, 9), (8, 6), (8, 5)], [(-12, 9), (-4, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]),
-    (-11, 12, [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -2), (4, 1), (5, 3), (5, 6), (4, 8)], [(-4, -6), (-3, -4), (4, 0), (5, 2)], [(-3, -11), (-4, -9), (-4, -7), (-3, -5), (3, -2), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-9, 9), (-8, 7), (-7, 7)]]),
-    (-11, 11, [[(2, -12), (-4, 9)], [(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(-5, -12), (-7, -6)], [(11, -12), (10, -6)], [(-5, -12), (11, -12)], [(-7, 9), (1, 9)], [(-4, -12), (-7, -6)], [(-2, -12), (-6, -9)], [(0, -12), (-5, -11)], [(7, -12), (10, -11)], [(8, -12), (10, -10)], [(9, -12), (10, -9)], [(10, -12), (10, -6)], [(-3, 8), (-6, 9)], [(-3, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-3, 8), (0, 9)]]),
-    (-12, 13, [[(-4, -12), (-7, -1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (3, 8), (5, 6), (6, 3), (10, -11)], [(-3, -12), (-6, -1), (-7, 3), (-7, 7), (-6, 8)], [(-2, -12), (-5, -1), (-6, 3), (-6, 7), (-4, 9)], [(-7, -12), (1, -12)], [(7, -12), (13, -12)], [(-6, -12), (-3, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-3, -10)], [(0, -12), (-3, -11)], [(8, -12), (10, -11)], [(12, -12), (10, -11)]]),
-    (-10, 10, [[(-4, -12), (-4, -10), (-3, 7), (-3, 9)], [(-3, -11), (-2, 6)], [(-2, -12), (-1, 5)], [(9, -11), (-3, 9)], [(-6, -12), (1, -12)], [(6, -12), (12, -12)], [(-5, -12), (-4, -10)], [(-1, -12), (-2, -10)], [(0, -12), (-3, -11)], [(7, -12), (9, -11)], [(11, -12), (9, -11)]]),
-    (-13, 13, [[(-5, -12), (-5, -10), (-7, 7), (-7, 9)], [(-4, -11), (-6, 6)], [(-3, -12), (-5, 5)], [(3, -12), (-5, 5), (-7, 9)], [(3, -12), (3, -10), (1, 7), (1, 9)], [(4, -11), (2, 6)], [(5, -12), (3, 5)], [(11, -11), (3, 5), (1, 9)], [(-8, -12), (0, -12)], [(3, -12), (5, -12)], [(8, -12), (14, -12)], [(-7, -12), (-4, -11)], [(-6, -12), (-5, -10)], [(-2, -12), (-4, -9)], [(-1, -12), (-4, -11)], [(9, -12), (11, -11)], [(13, -12), (11, -11)]]),
-    (-11, 11, [[(-4, -12), (2, 9)], [(-3, -12), (3, 9)], [(-2, -12), (4, 9)], [(9, -11), (-9, 8)], [(-6, -12), (1, -12)], [(6, -12), (12, -12)], [(-12, 9), (-6, 9)], [(-1, 9), (6, 9)], [(-5, -12), (-3, -10)], [(-1, -12), (-2, -10)], [(0, -12), (-2, -11)], [(7, -12), (9, -11)], [(11, -12), (9, -11)], [(-9, 8), (-11, 9)], [(-9, 8), (-7, 9)], [(2, 8), (0, 9)], [(2, 7), (1, 9)], [(3, 7), (5, 9)]]),
-    (-11, 11, [[(-5, -12), (-1, -2), (-4, 9)], [(-4, -12), (0, -2), (-3, 9)], [(-3, -12), (1, -2), (-2, 9)], [(10, -11), (1, -2)], [(-7, -12), (0, -12)], [(7, -12), (13, -12)], [(-7, 9), (1, 9)], [(-6, -12), (-4, -11)], [(-2, -12), (-3, -10)], [(-1, -12), (-4, -11)], [(8, -12), (10, -11)], [(12, -12), (10, -11)], [(-3, 8), (-6, 9)], [(-3, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-3, 8), (0, 9)]]),
-    (-11, 11, [[(8, -12), (-10, 9)], [(9, -12), (-9, 9)], [(10, -12), (-8, 9)], [(10, -12), (-4, -12), (-6, -6)], [(-10, 9), (4, 9), (6, 3)], [(-3, -12), (-6, -6)], [(-2, -12), (-5, -9)], [(0, -12), (-4, -11)], [(0, 9), (4, 8)], [(2, 9), (5, 6)], [(3, 9), (6, 3)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-11, 11, [[(5, -5), (3, 2), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(6, -5), (4, 2), (4, 8)], [(5, -5), (7, -5), (5, 2), (4, 6)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-4, -4), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)]]),
-    (-9, 10, [[(-2, -12), (-4, -5), (-5, 1), (-5, 5), (-4, 7), (-3, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (3, -5), (1, -5), (-1, -4), (-2, -3), (-3, -1), (-4, 2)], [(-1, -12), (-3, -5), (-4, -1), (-4, 5), (-3, 8)], [(4, 7), (5, 5), (6, 2), (6, -1), (5, -3)], [(-5, -12), (0, -12), (-2, -5), (-4, 2)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1), (4, -4), (3, -5)], [(-4, -12), (-1, -11)], [(-3, -12), (-2, -10)]]),
-    (-9, 9, [[(5, -1), (5, -2), (4, -2), (4, 0), (6, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)], [(0, -5), (-2, -3), (-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]),
-    (-11, 11, [[(7, -12), (4, -1), (3, 3), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(8, -12), (5, -1), (4, 3), (4, 8)], [(4, -12), (9, -12), (5, 2), (4, 6)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)], [(5, -12), (8, -11)], [(6, -12), (7, -10)]]),
-    (-9, 9, [[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)], [(0, -5), (-2, -3), (-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]),
-    (-8, 8, [[(8, -10), (8, -11), (7, -11), (7, -9), (9, -9), (9, -11), (8, -12), (6, -12), (4, -11), (2, -9), (1, -7), (0, -4), (-1, 0), (-3, 9), (-4, 12), (-5, 14), (-7, 16)], [(2, -8), (1, -5), (0, 0), (-2, 9), (-3, 12)], [(6, -12), (4, -10), (3, -8), (2, -5), (1, 0), (-1, 8), (-2, 11), (-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 13), (-8, 13), (-8, 15), (-9, 15), (-9, 14)], [(-4, -5), (7, -5)]]),
-    (-10, 11, [[(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)], [(7, -5), (3, 9), (1, 13)], [(6, -5), (8, -5), (4, 9), (2, 13), (0, 15), (-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 12), (-7, 12), (-7, 14), (-8, 14), (-8, 13)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (4, 2)], [(-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 7)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 8), (-3, 9)]]),
-    (-11, 11, [[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (-1, -12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4), (6, -2), (6, 1), (4, 6)], [(5, -4), (5, 0), (4, 4), (4, 8)], [(5, -2), (3, 3), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)]]),
-    (-7, 6, [[(1, -12), (1, -10), (3, -10), (3, -12), (1, -12)], [(2, -12), (2, -10)], [(1, -11), (3, -11)], [(-6, -1), (-5, -3), (-3, -5), (-1, -5), (0, -4), (1, -2), (1, 1), (-1, 6)], [(0, -4), (0, 0), (-1, 4), (-1, 8)], [(0, -2), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)]]),
-    (-7, 6, [[(3, -12), (3, -10), (5, -10), (5, -12), (3, -12)], [(4, -12), (4, -10)], [(3, -11), (5, -11)], [(-5, -1), (-4, -3), (-2, -5), (0, -5), (1, -4), (2, -2), (2, 1), (0, 8), (-1, 11), (-2, 13), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8, 14)], [(1, -4), (1, 1), (-1, 8), (-2, 11), (-3, 13)], [(1, -2), (0, 2), (-2, 9), (-3, 12), (-4, 14), (-6, 16)]]),
-    (-11, 11, [[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (-1, -12), (-7, 9)], [(7, -3), (7, -4), (6, -4), (6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3, 1)], [(-5, 1), (-3, 1), (-1, 2), (0, 3), (2, 7), (3, 8), (5, 8)], [(-1, 3), (1, 7), (2, 8)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)]]),
-    (-6, 6, [[(2, -12), (-1, -1), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3), (-1, 8)], [(-1, -12), (4, -12), (0, 2), (-1, 6)], [(0, -12), (3, -11)], [(1, -12), (2, -10)]]),
-    (-18, 17, [[(-17, -1), (-16, -3), (-14, -5), (-12, -5), (-11, -4), (-10, -2), (-10, 1), (-12, 9)], [(-11, -4), (-11, 1), (-13, 9)], [(-11, -2), (-12, 2), (-14, 9), (-12, 9)], [(-10, 1), (-8, -2), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -2), (1, 1), (-1, 9)], [(0, -4), (0, 1), (-2, 9)], [(0, -2), (-1, 2), (-3, 9), (-1, 9)], [(1, 1), (3, -2), (5, -4), (7, -5), (9, -5), (11, -4), (12, -2), (12, 1), (10, 6)], [(11, -4), (11, 0), (10, 4), (10, 8)], [(11, -2), (9, 3), (9, 6), (10, 8), (11, 9), (13, 9), (15, 7), (16, 5)]]),
-    (-12, 12, [[(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-4, -2), (-4, 1), (-6, 9)], [(-5, -4), (-5, 1), (-7, 9)], [(-5, -2), (-6, 2), (-8, 9), (-6, 9)], [(-4, 1), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -4), (7, -2), (7, 1), (5, 6)], [(6, -4), (6, 0), (5, 4), (5, 8)], [(6, -2), (4, 3), (4, 6), (5, 8), (6, 9), (8, 9), (10, 7), (11, 5)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (2, -5), (-1, -5)], [(-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 7)], [(4, 7), (5, 5), (6, 2), (6, -1), (5, -3)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 8), (-2, 9)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1), (4, -4), (2, -5)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1), (-4, 5), (-7, 16)], [(-4, -4), (-4, 1), (-5, 5), (-8, 16)], [(-4, -2), (-5, 2), (-9, 16)], [(-3, 2), (-2, -1), (-1, -3), (0, -4), (2, -5), (4, -5), (6, -4), (7, -3), (8, 0), (8, 2), (7, 5), (5, 8), (2, 9), (0, 9), (-2, 8), (-3, 5), (-3, 2)], [(6, -3), (7, -1), (7, 2), (6, 5), (5, 7)], [(4, -5), (5, -4), (6, -1), (6, 2), (5, 5), (4, 7), (2, 9)], [(-12, 16), (-4, 16)], [(-8, 15), (-11, 16)], [(-8, 14), (-10, 16)], [(-7, 14), (-6, 16)], [(-8, 15), (-5, 16)]]),
-    (-11, 10, [[(5, -5), (-1, 16)], [(6, -5), (0, 16)], [(5, -5), (7, -5), (1, 16)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3), (-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8), (-4, 9)], [(-4, 16), (4, 16)], [(0, 15), (-3, 16)], [(0, 14), (-2, 16)], [(1, 14), (2, 16)], [(0, 15), (3, 16)]]),
-    (-9, 9, [[(-8, -1), (-7, -3), (-5, -5), (-3, -5), (-2, -4), (-1, -2), (-1, 2), (-3, 9)], [(-2, -4), (-2, 2), (-4, 9)], [(-2, -2), (-3, 2), (-5, 9), (-3, 9)], [(7, -3), (7, -4), (6, -4), (6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (1, -2), (-1, 2)]]),
-    (-8, 9, [[(6, -2), (6, -3), (5, -3), (5, -1), (7, -1), (7, -3), (6, -4), (3, -5), (0, -5), (-3, -4), (-4, -3), (-4, -1), (-3, 1), (-1, 2), (2, 3), (4, 4), (5, 6)], [(-3, -4), (-4, -1)], [(-3, 0), (-1, 1), (2, 2), (4, 3)], [(5, 4), (4, 8)], [(-4, -3), (-3, -1), (-1, 0), (2, 1), (4, 2), (5, 4), (5, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 5), (-4, 5), (-4, 7), (-5, 7), (-5, 6)]]),
-    (-7, 7, [[(2, -12), (-1, -1), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3), (-1, 8)], [(2, -12), (4, -12), (0, 2), (-1, 6)], [(-4, -5), (6, -5)]]),
-    (-12, 12, [[(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-4, -2), (-4, 1), (-6, 6)], [(-5, -4), (-5, 0), (-6, 4), (-6, 8)], [(-5, -2), (-7, 3), (-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3)], [(6, -5), (4, 3), (4, 6), (5, 8), (6, 9), (8, 9), (10, 7), (11, 5)], [(7, -5), (5, 3), (5, 8)], [(6, -5), (8, -5), (6, 2), (5, 6)]]),
-    (-10, 10, [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-2, -2), (-2, 1), (-4, 6)], [(-3, -4), (-3, 0), (-4, 4), (-4, 8)], [(-3, -2), (-5, 3), (-5, 6), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (6, 3), (7, -1), (7, -5), (6, -5), (6, -4), (7, -2)]]),
-    (-15, 15, [[(-14, -1), (-13, -3), (-11, -5), (-9, -5), (-8, -4), (-7, -2), (-7, 1), (-9, 6)], [(-8, -4), (-8, 0), (-9, 4), (-9, 8)], [(-8, -2), (-10, 3), (-10, 6), (-9, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 6), (0, 3)], [(2, -5), (0, 3), (0, 6), (1, 8), (3, 9), (5, 9), (7, 8), (9, 6), (11, 3), (12, -1), (12, -5), (11, -5), (11, -4), (12, -2)], [(3, -5), (1, 3), (1, 8)], [(2, -5), (4, -5), (2, 2), (1, 6)]]),
-    (-11, 11, [[(-8, -1), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -2), (1, 0)], [(-2, -5), (-1, -4), (-1, 0), (-2, 4), (-3, 6), (-5, 8), (-7, 9), (-9, 9), (-10, 8), (-10, 6), (-8, 6), (-8, 8), (-9, 8), (-9, 7)], [(0, -3), (0, 0), (-1, 4), (-1, 7)], [(8, -3), (8, -4), (7, -4), (7, -2), (9, -2), (9, -4), (8, -5), (6, -5), (4, -4), (2, -2), (1, 0), (0, 4), (0, 8), (1, 9)], [(-2, 4), (-2, 6), (-1, 8), (1, 9), (3, 9), (5, 8), (7, 5)]]),
-    (-11, 11, [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1), (-5, 6)], [(-4, -4), (-4, 0), (-5, 4), (-5, 8)], [(-4, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(7, -5), (3, 9), (2, 12), (0, 15), (-2, 16)], [(8, -5), (4, 9), (2, 13)], [(7, -5), (9, -5), (5, 9), (3, 13), (1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14), (-8, 12), (-6, 12), (-6, 14), (-7, 14), (-7, 13)]]),
-    (-10, 10, [[(7, -5), (6, -3), (4, -1), (-4, 5), (-6, 7), (-7, 9)], [(6, -3), (-3, -3), (-5, -2), (-6, 0)], [(4, -3), (0, -4), (-3, -4), (-4, -3)], [(4, -3), (0, -5), (-3, -5), (-5, -3), (-6, 0)], [(-6, 7), (3, 7), (5, 6), (6, 4)], [(-4, 7), (0, 8), (3, 8), (4, 7)], [(-4, 7), (0, 9), (3, 9), (5, 7), (6, 4)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-TIMESR = [
-    (-8, 8, [[]]),
-    (-5, 5, [[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -9), (5, -8), (6, -7), (7, -8), (7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-12, 13, [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6), (-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8, 9)]]),
-    (-4, 4, [[(0, -12), (-1, -5)], [(1, -12), (-1, -5)]]),
-    (-7, 7, [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]),
-    (-7, 7, [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]),
-    (-8, 8, [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3), (-5, 3)]]),
-    (-13, 13, [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]),
-    (-4, 4, [[(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-4, 4, [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-11, 11, [[(9, -16), (-9, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6, -3), (5, -8), (4, -10), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8), (6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]),
-    (-10, 10, [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-1, 9), (6, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]),
-    (-10, 10, [[(5, -9), (4, -8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4), (-1, 9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4), (5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7), (6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6), (2, 8), (0, 9)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]),
-    (-4, 4, [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-13, 13, [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 9, [[(-5, -8), (-4, -7), (-5, -6), (-6, -7), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3, -11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]),
-    (-11, 10, [[(6, -9), (7, -6), (7, -12), (6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)], [(1, -12), (3, -11), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (1, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-11, 9, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (-2, 9)]]),
-    (-11, 12, [[(6, -9), (7, -6), (7, -12), (6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(6, 1), (6, 9)], [(7, 1), (7, 9)], [(3, 1), (10, 1)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)]]),
-    (-5, 6, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]),
-    (-7, 8, [[(3, -12), (3, 5), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 6), (-5, 4), (-4, 3), (-3, 4), (-4, 5)], [(2, -12), (2, 5), (1, 8), (0, 9)], [(-1, -12), (6, -12)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(7, -12), (-6, 1)], [(-1, -3), (7, 9)], [(-2, -3), (6, 9)], [(-10, -12), (-3, -12)], [(3, -12), (9, -12)], [(-10, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (0, -12)], [(-7, 9), (8, 9), (8, 3), (7, 9)]]),
-    (-12, 13, [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]),
-    (-11, 12, [[(-6, -12), (-6, 9)], [(-5, -12), (7, 7)], [(-5, -10), (7, 9)], [(7, -12), (7, 9)], [(-9, -12), (-5, -12)], [(4, -12), (10, -12)], [(-9, 9), (-3, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)], [(-4, 7), (-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 13), (5, 14), (7, 14), (8, 12), (8, 11)], [(3, 6), (4, 10), (5, 12), (6, 13), (7, 13), (8, 12)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2), (-5, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-9, 9), (-2, 9)], [(0, -2), (2, -1), (3, 0), (6, 7), (7, 8), (8, 8), (9, 7)], [(2, -1), (3, 1), (5, 8), (6, 9), (8, 9), (9, 7), (9, 6)]]),
-    (-10, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3), (-7, 9), (-6, 6)]]),
-    (-9, 10, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)], [(-6, -12), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(-10, -12), (-3, -12)], [(4, -12), (10, -12)]]),
-    (-10, 10, [[(-7, -12), (0, 9)], [(-6, -12), (0, 6)], [(7, -12), (0, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)]]),
-    (-12, 12, [[(-8, -12), (-4, 9)], [(-7, -12), (-4, 4)], [(0, -12), (-4, 9)], [(0, -12), (4, 9)], [(1, -12), (4, 4)], [(8, -12), (4, 9)], [(-11, -12), (-4, -12)], [(5, -12), (11, -12)]]),
-    (-10, 10, [[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]),
-    (-10, 11, [[(-7, -12), (0, -1), (0, 9)], [(-6, -12), (1, -1), (1, 9)], [(8, -12), (1, -1)], [(-9, -12), (-3, -12)], [(4, -12), (10, -12)], [(-3, 9), (4, 9)]]),
-    (-10, 10, [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-6, -12), (-7, -6), (-7, -12), (7, -12)], [(-7, 9), (7, 9), (7, 3), (6, 9)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-9, 11, [[(-4, -3), (-4, -2), (-5, -2), (-5, -3), (-4, -4), (-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(5, -3), (5, 6), (6, 8), (8, 9), (9, 9)], [(5, -1), (4, 0), (-2, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(-2, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -12), (-5, -12)]]),
-    (-10, 9, [[(5, -2), (4, -1), (5, 0), (6, -1), (6, -2), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-10, 11, [[(5, -12), (5, 9)], [(6, -12), (6, 9)], [(5, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (5, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(2, -12), (6, -12)], [(5, 9), (9, 9)]]),
-    (-10, 9, [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 1), (5, -2), (4, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]),
-    (-7, 6, [[(3, -11), (2, -10), (3, -9), (4, -10), (4, -11), (3, -12), (1, -12), (-1, -11), (-2, -9), (-2, 9)], [(1, -12), (0, -11), (-1, -9), (-1, 9)], [(-5, -5), (3, -5)], [(-5, 9), (2, 9)]]),
-    (-9, 10, [[(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3), (5, 1), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)], [(-3, -4), (-4, -2), (-4, 2), (-3, 4)], [(3, 4), (4, 2), (4, -2), (3, -4)], [(4, -3), (5, -4), (7, -5), (7, -4), (5, -4)], [(-4, 3), (-5, 4), (-6, 6), (-6, 7), (-5, 9), (-2, 10), (3, 10), (6, 11), (7, 12)], [(-6, 7), (-5, 8), (-2, 9), (3, 9), (6, 10), (7, 12), (7, 13), (6, 15), (3, 16), (-3, 16), (-6, 15), (-7, 13), (-7, 12), (-6, 10), (-3, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (0, -5), (2, -5), (5, -4), (6, -2), (6, 9)], [(2, -5), (4, -4), (5, -2), (5, 9)], [(-9, -12), (-5, -12)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-5, 6, [[(0, -12), (-1, -11), (0, -10), (1, -11), (0, -12)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (1, -5)], [(-3, 9), (4, 9)]]),
-    (-5, 6, [[(1, -12), (0, -11), (1, -10), (2, -11), (1, -12)], [(2, -5), (2, 13), (1, 15), (-1, 16), (-3, 16), (-4, 15), (-4, 14), (-3, 13), (-2, 14), (-3, 15)], [(1, -5), (1, 13), (0, 15), (-1, 16)], [(-2, -5), (2, -5)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(0, 1), (6, 9)], [(-1, 1), (5, 9)], [(-9, -12), (-5, -12)], [(2, -5), (8, -5)], [(-9, 9), (-2, 9)], [(2, 9), (8, 9)]]),
-    (-5, 6, [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (1, -12)], [(-3, 9), (4, 9)]]),
-    (-16, 17, [[(-11, -5), (-11, 9)], [(-10, -5), (-10, 9)], [(-10, -2), (-8, -4), (-5, -5), (-3, -5), (0, -4), (1, -2), (1, 9)], [(-3, -5), (-1, -4), (0, -2), (0, 9)], [(1, -2), (3, -4), (6, -5), (8, -5), (11, -4), (12, -2), (12, 9)], [(8, -5), (10, -4), (11, -2), (11, 9)], [(-14, -5), (-10, -5)], [(-14, 9), (-7, 9)], [(-3, 9), (4, 9)], [(8, 9), (15, 9)]]),
-    (-11, 11, [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(-5, -2), (-3, -4), (0, -5), (2, -5), (5, -4), (6, -2), (6, 9)], [(2, -5), (4, -4), (5, -2), (5, 9)], [(-9, -5), (-5, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]),
-    (-11, 10, [[(-6, -5), (-6, 16)], [(-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -5), (-5, -5)], [(-9, 16), (-2, 16)]]),
-    (-10, 10, [[(5, -5), (5, 16)], [(6, -5), (6, 16)], [(5, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (5, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(2, 16), (9, 16)]]),
-    (-9, 8, [[(-4, -5), (-4, 9)], [(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5), (6, -4), (6, -3), (5, -2), (4, -3), (5, -4)], [(-7, -5), (-3, -5)], [(-7, 9), (0, 9)]]),
-    (-8, 9, [[(5, -3), (6, -5), (6, -1), (5, -3), (4, -4), (2, -5), (-2, -5), (-4, -4), (-5, -3), (-5, -1), (-4, 0), (-2, 1), (3, 3), (5, 4), (6, 5)], [(-5, -2), (-4, -1), (-2, 0), (3, 2), (5, 3), (6, 4), (6, 7), (5, 8), (3, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 5), (-5, 9), (-4, 7)]]),
-    (-7, 8, [[(-2, -12), (-2, 5), (-1, 8), (1, 9), (3, 9), (5, 8), (6, 6)], [(-1, -12), (-1, 5), (0, 8), (1, 9)], [(-5, -5), (3, -5)]]),
-    (-11, 11, [[(-6, -5), (-6, 6), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6)], [(-5, -5), (-5, 6), (-4, 8), (-2, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-5, -5)], [(2, -5), (6, -5)], [(5, 9), (9, 9)]]),
-    (-9, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)]]),
-    (-12, 12, [[(-8, -5), (-4, 9)], [(-7, -5), (-4, 6)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)], [(1, -5), (4, 6)], [(8, -5), (4, 9)], [(-11, -5), (-4, -5)], [(5, -5), (11, -5)]]),
-    (-10, 10, [[(-6, -5), (5, 9)], [(-5, -5), (6, 9)], [(6, -5), (-6, 9)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)], [(2, 9), (8, 9)]]),
-    (-10, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16), (-8, 15), (-7, 14), (-6, 15)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)]]),
-    (-9, 9, [[(5, -5), (-6, 9)], [(6, -5), (-5, 9)], [(-5, -5), (-6, -1), (-6, -5), (6, -5)], [(-6, 9), (6, 9), (6, 5), (5, 9)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
-
-TIMESRB = [
-    (-8, 8, [[]]),
-    (-5, 6, [[(0, -12), (-1, -11), (-1, -9), (0, -1)], [(0, -12), (0, 2), (1, 2)], [(0, -12), (1, -12), (1, 2)], [(1, -12), (2, -11), (2, -9), (1, -1)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-9, 9, [[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]),
-    (-10, 11, [[(1, -16), (-6, 16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]),
-    (-10, 10, [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -7), (6, -8), (5, -8), (5, -6), (7, -6), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 3), (-5, 3), (-5, 5), (-6, 5), (-6, 4)]]),
-    (-12, 12, [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10), (-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)], [(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4), (7, 2), (5, 2)]]),
-    (-13, 13, [[(9, -3), (9, -4), (8, -4), (8, -2), (10, -2), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9), (-5, -6), (-4, -3), (-2, 0), (2, 5), (5, 8), (7, 9), (9, 9), (10, 7), (10, 6)], [(-7, 8), (-8, 6), (-8, 3), (-7, 1), (-6, 0)], [(0, -5), (1, -9)], [(1, -7), (0, -11)], [(-4, -11), (-5, -7)], [(-4, -4), (-2, -1), (2, 4), (5, 7), (7, 8)], [(-4, 9), (-6, 8), (-7, 6), (-7, 3), (-6, 1), (-2, -3)], [(-5, -9), (-4, -5), (-1, -1), (3, 4), (6, 7), (8, 8), (9, 8), (10, 7)]]),
-    (-4, 5, [[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11), (0, -5)]]),
-    (-7, 7, [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]),
-    (-7, 7, [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]),
-    (-8, 8, [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]),
-    (-12, 13, [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]),
-    (-5, 6, [[(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-13, 13, [[(-9, 0), (9, 0)]]),
-    (-5, 6, [[(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-11, 12, [[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]),
-    (-10, 10, [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-4, -10), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-4, 7)], [(4, 7), (5, 5), (6, 1), (6, -4), (5, -8), (4, -10)], [(-1, -12), (-3, -11), (-4, -9), (-5, -4), (-5, 1), (-4, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 6), (5, 1), (5, -4), (4, -9), (3, -11), (1, -12)]]),
-    (-10, 10, [[(-1, -10), (-1, 9)], [(0, -10), (0, 8)], [(1, -12), (1, 9)], [(1, -12), (-2, -9), (-4, -8)], [(-5, 9), (5, 9)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-10, 10, [[(-6, -8), (-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9), (-5, -9), (-4, -8), (-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(5, -10), (6, -8), (6, -6), (5, -4)], [(2, -12), (4, -11), (5, -8), (5, -6), (4, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 7), (5, 7), (7, 6)], [(-4, 6), (1, 8), (5, 8), (6, 7)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]),
-    (-10, 10, [[(-6, -8), (-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9), (-5, -9), (-4, -8), (-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3)], [(4, -11), (5, -9), (5, -6), (4, -4)], [(1, -12), (3, -11), (4, -9), (4, -6), (3, -4), (1, -3)], [(-1, -3), (2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3), (-4, 4), (-4, 5), (-5, 6), (-6, 6)], [(5, 0), (6, 2), (6, 5), (5, 7)], [(1, -3), (3, -2), (4, -1), (5, 2), (5, 5), (4, 8), (2, 9)], [(-6, 4), (-6, 5), (-5, 5), (-5, 4), (-6, 4)]]),
-    (-10, 10, [[(1, -9), (1, 9)], [(2, -10), (2, 8)], [(3, -12), (3, 9)], [(3, -12), (-8, 3), (8, 3)], [(-2, 9), (6, 9)], [(1, 8), (-1, 9)], [(1, 7), (0, 9)], [(3, 7), (4, 9)], [(3, 8), (5, 9)]]),
-    (-10, 10, [[(-5, -12), (-7, -2), (-5, -4), (-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3), (-4, 4), (-4, 5), (-5, 6), (-6, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-6, 4), (-6, 5), (-5, 5), (-5, 4), (-6, 4)], [(-5, -12), (5, -12)], [(-5, -11), (3, -11)], [(-5, -10), (-1, -10), (3, -11), (5, -12)]]),
-    (-10, 10, [[(4, -9), (4, -8), (5, -8), (5, -9), (4, -9)], [(5, -10), (4, -10), (3, -9), (3, -8), (4, -7), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 0)], [(-4, -9), (-5, -7), (-6, -3), (-6, 3), (-5, 6), (-4, 7)], [(5, 6), (6, 4), (6, 1), (5, -1)], [(0, -12), (-2, -11), (-3, -10), (-4, -8), (-5, -4), (-5, 3), (-4, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 1), (4, -2), (3, -3), (1, -4)]]),
-    (-10, 10, [[(-7, -12), (-7, -6)], [(7, -12), (7, -9), (6, -6), (2, -1), (1, 1), (0, 5), (0, 9)], [(1, 0), (0, 2), (-1, 5), (-1, 9)], [(6, -6), (1, -1), (-1, 2), (-2, 5), (-2, 9), (0, 9)], [(-7, -8), (-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-5, -10), (-4, -11), (-2, -11), (0, -10)], [(-7, -8), (-6, -9), (-4, -10), (-2, -10), (3, -9)]]),
-    (-10, 10, [[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3), (5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-4, -11), (-5, -9), (-5, -6), (-4, -4)], [(4, -4), (5, -6), (5, -9), (4, -11)], [(-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-2, -3)], [(2, -3), (3, -4), (4, -6), (4, -9), (3, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-5, -1), (-6, 1), (-6, 5), (-5, 7)], [(5, 7), (6, 5), (6, 1), (5, -1)], [(-2, -3), (-4, -2), (-5, 1), (-5, 5), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 5), (5, 1), (4, -2), (2, -3)]]),
-    (-10, 10, [[(-5, 5), (-5, 6), (-4, 6), (-4, 5), (-5, 5)], [(5, -3), (4, -1), (3, 0), (1, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 4), (-3, 5), (-3, 6), (-4, 7), (-5, 7)], [(-5, -2), (-6, -4), (-6, -7), (-5, -9)], [(4, -10), (5, -9), (6, -6), (6, 0), (5, 4), (4, 6)], [(-1, 1), (-3, 0), (-4, -1), (-5, -4), (-5, -7), (-4, -10), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (5, -6), (5, 1), (4, 5), (3, 7), (2, 8), (0, 9)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-5, 6, [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]),
-    (-12, 12, [[(8, -9), (-8, 0), (8, 9)]]),
-    (-12, 13, [[(-8, -5), (9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9, 4)]]),
-    (-12, 12, [[(-8, -9), (8, 0), (-8, 9)]]),
-    (-9, 10, [[(-5, -7), (-5, -8), (-4, -8), (-4, -6), (-6, -6), (-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (1, -1)], [(5, -10), (6, -9), (6, -5), (5, -4)], [(2, -12), (4, -11), (5, -9), (5, -5), (4, -3), (3, -2)], [(0, -1), (0, 2), (1, 2), (1, -1), (0, -1)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]),
-    (-13, 14, [[(5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1), (-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2), (-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4), (10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]),
-    (-10, 10, [[(0, -12), (-7, 8)], [(-1, -9), (5, 9)], [(0, -9), (6, 9)], [(0, -12), (7, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-7, 8), (-8, 9)], [(-7, 8), (-5, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(6, 7), (8, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(-4, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(6, 0), (7, 2), (7, 5), (6, 7)], [(3, -2), (5, -1), (6, 1), (6, 6), (5, 8), (3, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 4)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)], [(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6)], [(1, -12), (3, -11), (5, -8), (6, -4), (6, 1), (5, 5), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (7, 9), (7, 3)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-11, 9, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6), (2, 2)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12), (7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7, -6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3), (-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 12, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 8), (7, 9), (7, 1)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(6, 2), (6, 7)], [(5, 1), (5, 7), (4, 8)], [(2, 1), (10, 1)], [(3, 1), (5, 2)], [(4, 1), (5, 3)], [(8, 1), (7, 3)], [(9, 1), (7, 2)]]),
-    (-12, 12, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(5, -12), (5, 9)], [(6, -11), (6, 8)], [(7, -12), (7, 9)], [(-10, -12), (-2, -12)], [(2, -12), (10, -12)], [(-5, -2), (5, -2)], [(-10, 9), (-2, 9)], [(2, 9), (10, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(3, -12), (5, -11)], [(4, -12), (5, -10)], [(8, -12), (7, -10)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(-4, -12), (4, -12)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(2, -12), (1, -10)], [(3, -12), (1, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-8, 8, [[(1, -12), (1, 5), (0, 8), (-1, 9)], [(2, -11), (2, 5), (1, 8)], [(3, -12), (3, 5), (2, 8), (-1, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 4), (-5, 3), (-4, 3), (-3, 4), (-3, 5), (-4, 6), (-5, 6)], [(-5, 4), (-5, 5), (-4, 5), (-4, 4), (-5, 4)], [(-2, -12), (6, -12)], [(-1, -12), (1, -11)], [(0, -12), (1, -10)], [(4, -12), (3, -10)], [(5, -12), (3, -11)]]),
-    (-12, 10, [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(6, -11), (-5, 0)], [(-2, -2), (5, 9)], [(-1, -2), (6, 9)], [(-1, -4), (7, 9)], [(-10, -12), (-2, -12)], [(3, -12), (9, -12)], [(-10, 9), (-2, 9)], [(2, 9), (9, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (6, -11)], [(8, -12), (6, -11)], [(-7, 8), (-9, 9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 7), (3, 9)], [(5, 7), (8, 9)]]),
-    (-9, 9, [[(-4, -12), (-4, 9)], [(-3, -11), (-3, 8)], [(-2, -12), (-2, 9)], [(-7, -12), (1, -12)], [(-7, 9), (8, 9), (8, 3)], [(-6, -12), (-4, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-2, -10)], [(0, -12), (-2, -11)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)], [(3, 9), (8, 8)], [(5, 9), (8, 7)], [(6, 9), (8, 6)], [(7, 9), (8, 3)]]),
-    (-13, 13, [[(-8, -12), (-8, 8)], [(-8, -12), (-1, 9)], [(-7, -12), (-1, 6)], [(-6, -12), (0, 6)], [(6, -12), (-1, 9)], [(6, -12), (6, 9)], [(7, -11), (7, 8)], [(8, -12), (8, 9)], [(-11, -12), (-6, -12)], [(6, -12), (11, -12)], [(-11, 9), (-5, 9)], [(3, 9), (11, 9)], [(-10, -12), (-8, -11)], [(9, -12), (8, -10)], [(10, -12), (8, -11)], [(-8, 8), (-10, 9)], [(-8, 8), (-6, 9)], [(6, 8), (4, 9)], [(6, 7), (5, 9)], [(8, 7), (9, 9)], [(8, 8), (10, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 8)], [(-7, -12), (7, 9)], [(-6, -12), (6, 6)], [(-5, -12), (7, 6)], [(7, -11), (7, 9)], [(-10, -12), (-5, -12)], [(4, -12), (10, -12)], [(-10, 9), (-4, 9)], [(-9, -12), (-7, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 8), (-5, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1), (-4, -1)], [(6, -10), (7, -8), (7, -5), (6, -3)], [(3, -12), (5, -11), (6, -9), (6, -4), (5, -2), (3, -1)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-11, 11, [[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)], [(-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 12), (5, 14), (7, 14), (8, 12), (8, 10)], [(4, 10), (5, 12), (6, 13), (7, 13)], [(3, 6), (5, 11), (6, 12), (7, 12), (8, 11)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2), (-4, -2)], [(6, -10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3), (3, -2)], [(0, -2), (2, -1), (3, 1), (5, 7), (6, 9), (8, 9), (9, 7), (9, 5)], [(5, 5), (6, 7), (7, 8), (8, 8)], [(2, -1), (3, 0), (6, 6), (7, 7), (8, 7), (9, 6)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]),
-    (-10, 10, [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3), (-7, 9), (-6, 6)]]),
-    (-10, 10, [[(-8, -12), (-8, -6)], [(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(8, -12), (8, -6)], [(-8, -12), (8, -12)], [(-4, 9), (4, 9)], [(-7, -12), (-8, -6)], [(-6, -12), (-8, -9)], [(-5, -12), (-8, -10)], [(-3, -12), (-8, -11)], [(3, -12), (8, -11)], [(5, -12), (8, -10)], [(6, -12), (8, -9)], [(7, -12), (8, -6)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-12, 12, [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -11)], [(-6, -11), (-6, 4), (-5, 6)], [(-5, -12), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(-10, -12), (-2, -12)], [(4, -12), (10, -12)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)]]),
-    (-10, 10, [[(-7, -12), (0, 9)], [(-6, -12), (0, 6), (0, 9)], [(-5, -12), (1, 6)], [(7, -11), (0, 9)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-8, -12), (-6, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(8, -12), (7, -11)]]),
-    (-12, 12, [[(-8, -12), (-4, 9)], [(-7, -12), (-4, 4), (-4, 9)], [(-6, -12), (-3, 4)], [(0, -12), (-3, 4), (-4, 9)], [(0, -12), (4, 9)], [(1, -12), (4, 4), (4, 9)], [(2, -12), (5, 4)], [(8, -11), (5, 4), (4, 9)], [(-11, -12), (-3, -12)], [(0, -12), (2, -12)], [(5, -12), (11, -12)], [(-10, -12), (-7, -11)], [(-9, -12), (-7, -10)], [(-5, -12), (-6, -10)], [(-4, -12), (-6, -11)], [(6, -12), (8, -11)], [(10, -12), (8, -11)]]),
-    (-10, 10, [[(-7, -12), (5, 9)], [(-6, -12), (6, 9)], [(-5, -12), (7, 9)], [(6, -11), (-6, 8)], [(-9, -12), (-2, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-8, -12), (-5, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)], [(4, -12), (6, -11)], [(8, -12), (6, -11)], [(-6, 8), (-8, 9)], [(-6, 8), (-4, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(5, 7), (8, 9)]]),
-    (-11, 11, [[(-8, -12), (-1, -1), (-1, 9)], [(-7, -12), (0, -1), (0, 8)], [(-6, -12), (1, -1), (1, 9)], [(7, -11), (1, -1)], [(-10, -12), (-3, -12)], [(4, -12), (10, -12)], [(-4, 9), (4, 9)], [(-9, -12), (-7, -11)], [(-4, -12), (-6, -11)], [(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-10, 10, [[(7, -12), (-7, -12), (-7, -6)], [(5, -12), (-7, 9)], [(6, -12), (-6, 9)], [(7, -12), (-5, 9)], [(-7, 9), (7, 9), (7, 3)], [(-6, -12), (-7, -6)], [(-5, -12), (-7, -9)], [(-4, -12), (-7, -10)], [(-2, -12), (-7, -11)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5, 9), (7, 6)], [(6, 9), (7, 3)]]),
-    (-7, 7, [[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]),
-    (-7, 7, [[(-7, -12), (7, 12)]]),
-    (-7, 7, [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]),
-    (-11, 11, [[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]),
-    (-10, 10, [[(-10, 16), (10, 16)]]),
-    (-6, 6, [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11), (3, -6)]]),
-    (-9, 11, [[(-4, -2), (-4, -3), (-3, -3), (-3, -1), (-5, -1), (-5, -3), (-4, -4), (-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(4, -3), (5, -1), (5, 6), (6, 8)], [(2, -5), (3, -4), (4, -2), (4, 6), (5, 8), (8, 9), (9, 9)], [(4, 0), (3, 1), (-2, 2), (-5, 3), (-6, 5), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (4, 6)], [(-4, 3), (-5, 5), (-5, 6), (-4, 8)], [(3, 1), (-1, 2), (-3, 3), (-4, 5), (-4, 6), (-3, 8), (-2, 9)]]),
-    (-11, 10, [[(-6, -12), (-6, 9), (-5, 8), (-3, 8)], [(-5, -11), (-5, 7)], [(-9, -12), (-4, -12), (-4, 8)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)]]),
-    (-10, 9, [[(5, -1), (5, -2), (4, -2), (4, 0), (6, 0), (6, -2), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)]]),
-    (-10, 11, [[(4, -12), (4, 9), (9, 9)], [(5, -11), (5, 8)], [(1, -12), (6, -12), (6, 9)], [(4, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (4, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(2, -12), (4, -11)], [(3, -12), (4, -10)], [(6, 7), (7, 9)], [(6, 8), (8, 9)]]),
-    (-10, 9, [[(-5, 1), (6, 1), (6, -1), (5, -3), (4, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 0), (5, -1), (4, -3)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(4, 1), (4, -2), (3, -4), (1, -5)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)]]),
-    (-7, 7, [[(5, -10), (5, -11), (4, -11), (4, -9), (6, -9), (6, -11), (5, -12), (2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 9)], [(0, -10), (-1, -7), (-1, 8)], [(2, -12), (1, -11), (0, -9), (0, 9)], [(-5, -5), (4, -5)], [(-5, 9), (3, 9)], [(-2, 8), (-4, 9)], [(-2, 7), (-3, 9)], [(0, 7), (1, 9)], [(0, 8), (2, 9)]]),
-    (-9, 10, [[(6, -4), (7, -3), (8, -4), (7, -5), (6, -5), (4, -4), (3, -3)], [(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3), (5, 1), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)], [(-3, -3), (-4, -1), (-4, 1), (-3, 3)], [(3, 3), (4, 1), (4, -1), (3, -3)], [(-1, -5), (-2, -4), (-3, -2), (-3, 2), (-2, 4), (-1, 5)], [(1, 5), (2, 4), (3, 2), (3, -2), (2, -4), (1, -5)], [(-4, 3), (-5, 4), (-6, 6), (-6, 7), (-5, 9), (-4, 10), (-1, 11), (3, 11), (6, 12), (7, 13)], [(-4, 9), (-1, 10), (3, 10), (6, 11)], [(-6, 7), (-5, 8), (-2, 9), (3, 9), (6, 10), (7, 12), (7, 13), (6, 15), (3, 16), (-3, 16), (-6, 15), (-7, 13), (-7, 12), (-6, 10), (-3, 9)], [(-3, 16), (-5, 15), (-6, 13), (-6, 12), (-5, 10), (-3, 9)]]),
-    (-11, 12, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12), (-4, -12), (-4, 9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -3), (7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)], [(3, -5), (4, -4), (5, -1), (5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, -10), (1, -10), (1, -12), (-1, -12)], [(0, -12), (0, -10)], [(-1, -11), (1, -11)], [(-1, -5), (-1, 9)], [(0, -4), (0, 8)], [(-4, -5), (1, -5), (1, 9)], [(-4, 9), (4, 9)], [(-3, -5), (-1, -4)], [(-2, -5), (-1, -3)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-7, 6, [[(0, -12), (0, -10), (2, -10), (2, -12), (0, -12)], [(1, -12), (1, -10)], [(0, -11), (2, -11)], [(0, -5), (0, 12), (-1, 15), (-2, 16)], [(1, -4), (1, 11), (0, 14)], [(-3, -5), (2, -5), (2, 11), (1, 14), (0, 15), (-2, 16), (-5, 16), (-6, 15), (-6, 13), (-4, 13), (-4, 15), (-5, 15), (-5, 14)], [(-2, -5), (0, -4)], [(-1, -5), (0, -3)]]),
-    (-11, 11, [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12), (-4, -12), (-4, 9)], [(5, -4), (-4, 5)], [(0, 1), (7, 9)], [(0, 2), (6, 9)], [(-1, 2), (5, 9)], [(2, -5), (9, -5)], [(-9, 9), (-1, 9)], [(2, 9), (9, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(3, -5), (5, -4)], [(8, -5), (5, -4)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 7), (3, 9)], [(4, 7), (8, 9)]]),
-    (-6, 6, [[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(-4, -12), (1, -12), (1, 9)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]),
-    (-17, 17, [[(-12, -5), (-12, 9)], [(-11, -4), (-11, 8)], [(-15, -5), (-10, -5), (-10, 9)], [(-10, -1), (-9, -3), (-8, -4), (-6, -5), (-3, -5), (-1, -4), (0, -3), (1, 0), (1, 9)], [(-1, -3), (0, 0), (0, 8)], [(-3, -5), (-2, -4), (-1, -1), (-1, 9)], [(1, -1), (2, -3), (3, -4), (5, -5), (8, -5), (10, -4), (11, -3), (12, 0), (12, 9)], [(10, -3), (11, 0), (11, 8)], [(8, -5), (9, -4), (10, -1), (10, 9)], [(-15, 9), (-7, 9)], [(-4, 9), (4, 9)], [(7, 9), (15, 9)], [(-14, -5), (-12, -4)], [(-13, -5), (-12, -3)], [(-12, 8), (-14, 9)], [(-12, 7), (-13, 9)], [(-10, 7), (-9, 9)], [(-10, 8), (-8, 9)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)], [(10, 8), (8, 9)], [(10, 7), (9, 9)], [(12, 7), (13, 9)], [(12, 8), (14, 9)]]),
-    (-11, 12, [[(-6, -5), (-6, 9)], [(-5, -4), (-5, 8)], [(-9, -5), (-4, -5), (-4, 9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -3), (7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)], [(3, -5), (4, -4), (5, -1), (5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10, 9)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-10, 10, [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (6, 0), (5, -2)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 0), (4, -3), (3, -4), (1, -5)]]),
-    (-11, 10, [[(-6, -5), (-6, 16)], [(-5, -4), (-5, 15)], [(-9, -5), (-4, -5), (-4, 16)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-9, 16), (-1, 16)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(-6, 15), (-8, 16)], [(-6, 14), (-7, 16)], [(-4, 14), (-3, 16)], [(-4, 15), (-2, 16)]]),
-    (-10, 10, [[(4, -4), (4, 16)], [(5, -3), (5, 15)], [(3, -4), (5, -4), (6, -5), (6, 16)], [(4, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (4, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(1, 16), (9, 16)], [(4, 15), (2, 16)], [(4, 14), (3, 16)], [(6, 14), (7, 16)], [(6, 15), (8, 16)]]),
-    (-9, 8, [[(-4, -5), (-4, 9)], [(-3, -4), (-3, 8)], [(-7, -5), (-2, -5), (-2, 9)], [(5, -3), (5, -4), (4, -4), (4, -2), (6, -2), (6, -4), (5, -5), (3, -5), (1, -4), (-1, -2), (-2, 1)], [(-7, 9), (1, 9)], [(-6, -5), (-4, -4)], [(-5, -5), (-4, -3)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)]]),
-    (-8, 9, [[(5, -3), (6, -5), (6, -1), (5, -3), (4, -4), (2, -5), (-2, -5), (-4, -4), (-5, -3), (-5, -1), (-4, 1), (-2, 2), (3, 3), (5, 4), (6, 7)], [(-4, -4), (-5, -1)], [(-4, 0), (-2, 1), (3, 2), (5, 3)], [(6, 4), (5, 8)], [(-5, -3), (-4, -1), (-2, 0), (3, 1), (5, 2), (6, 4), (6, 7), (5, 8), (3, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 5), (-5, 9), (-4, 7)]]),
-    (-7, 8, [[(-2, -10), (-2, 4), (-1, 7), (0, 8), (2, 9), (4, 9), (6, 8), (7, 6)], [(-1, -10), (-1, 5), (0, 7)], [(-2, -10), (0, -12), (0, 5), (1, 8), (2, 9)], [(-5, -5), (4, -5)]]),
-    (-11, 12, [[(-6, -5), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (1, 9), (3, 8), (4, 7), (5, 5)], [(-5, -4), (-5, 5), (-4, 7)], [(-9, -5), (-4, -5), (-4, 5), (-3, 8), (-2, 9)], [(5, -5), (5, 9), (10, 9)], [(6, -4), (6, 8)], [(2, -5), (7, -5), (7, 9)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]),
-    (-9, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (0, 9)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)], [(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]),
-    (-12, 12, [[(-8, -5), (-4, 9)], [(-7, -5), (-4, 6)], [(-6, -5), (-3, 6)], [(0, -5), (-3, 6), (-4, 9)], [(0, -5), (4, 9)], [(1, -5), (4, 6)], [(0, -5), (2, -5), (5, 6)], [(8, -4), (5, 6), (4, 9)], [(-11, -5), (-3, -5)], [(5, -5), (11, -5)], [(-10, -5), (-7, -4)], [(-4, -5), (-6, -4)], [(6, -5), (8, -4)], [(10, -5), (8, -4)]]),
-    (-10, 10, [[(-6, -5), (4, 9)], [(-5, -5), (5, 9)], [(-4, -5), (6, 9)], [(5, -4), (-5, 8)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)], [(1, 9), (8, 9)], [(-7, -5), (-5, -4)], [(-2, -5), (-4, -4)], [(3, -5), (5, -4)], [(7, -5), (5, -4)], [(-5, 8), (-7, 9)], [(-5, 8), (-3, 9)], [(4, 8), (2, 9)], [(5, 8), (7, 9)]]),
-    (-10, 9, [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (-2, 13), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8, 14)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)], [(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]),
-    (-9, 9, [[(4, -5), (-6, 9)], [(5, -5), (-5, 9)], [(6, -5), (-4, 9)], [(6, -5), (-6, -5), (-6, -1)], [(-6, 9), (6, 9), (6, 5)], [(-5, -5), (-6, -1)], [(-4, -5), (-6, -2)], [(-3, -5), (-6, -3)], [(-1, -5), (-6, -4)], [(1, 9), (6, 8)], [(3, 9), (6, 7)], [(4, 9), (6, 6)], [(5, 9), (6, 5)]]),
-    (-7, 7, [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15), (2, 16)]]),
-    (-4, 4, [[(0, -16), (0, 16)]]),
-    (-7, 7, [[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]),
-    (-12, 12, [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3), (-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1), (-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1), (9, -3)]]),
-    (-8, 8, [[(-8, -12), (-8, 9), (-7, 9), (-7, -12), (-6, -12), (-6, 9), (-5, 9), (-5, -12), (-4, -12), (-4, 9), (-3, 9), (-3, -12), (-2, -12), (-2, 9), (-1, 9), (-1, -12), (0, -12), (0, 9), (1, 9), (1, -12), (2, -12), (2, 9), (3, 9), (3, -12), (4, -12), (4, 9), (5, 9), (5, -12), (6, -12), (6, 9), (7, 9), (7, -12), (8, -12), (8, 9)]]),
-]
+from __future__ import division
+
+import mmap
+import numpy as np
+import os
+import struct
+
+# the hershey fonts are stored in hershey_fonts.bin, all values little endian:
+#   header    magic, version, number of fonts, glyphs, strokes and points
+#   fonts     name, index of the first glyph and number of glyphs per font
+#   metrics   int8 (left, right) per glyph
+#   glyphs    int32 index of the first stroke per glyph, plus the end
+#   strokes   int32 index of the first point per stroke, plus the end
+#   points    int8 (x, y) per point
+# the file is memory mapped and glyphs are decoded when they are first used.
+
+MAGIC = b'AXHF'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIII')
+FONT = struct.Struct('<16sII')
+
+FILENAME = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    'hershey_fonts.bin')
+
+class FontData(object):
+    # a sequence of (left, right, strokes) glyphs like the lists the fonts
+    # used to be defined as
+    def __init__(self, name, data, first, count):
+        self.name = name
+        self.data = data
+        self.first = first
+        self.count = count
+        self.cache = {}
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError('glyph index out of range')
+        glyph = self.cache.get(index)
+        if glyph is None:
+            glyph = self.cache[index] = self.data.glyph(self.first + index)
+        return glyph
+
+    @property
+    def metrics(self):
+        # (left, right) of all glyphs as an int8 array
+        return self.data.metrics[self.first:self.first + self.count]
+
+    def strokes(self, index):
+        # the strokes of a glyph as arrays
+        return self.data.strokes(self.first + index)
+
+    def __repr__(self):
+        return 'FontData(%r)' % self.name
+
+class FontFile(object):
+    def __init__(self, filename=FILENAME):
+        with open(filename, 'rb') as fp:
+            buffer = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, fonts, glyphs, strokes, points = \
+            HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise Exception('not a font file: %s' % filename)
+        if version > VERSION:
+            raise Exception('unsupported font file version: %d' % version)
+        position = HEADER.size
+        self.fonts = {}
+        for i in range(fonts):
+            name, first, count = FONT.unpack_from(buffer, position)
+            name = name.rstrip(b'\0').decode('ascii')
+            self.fonts[name] = FontData(name, self, first, count)
+            position += FONT.size
+        self.names = sorted(self.fonts)
+        self.metrics = np.frombuffer(
+            buffer, '<i1', glyphs * 2, position).reshape(-1, 2)
+        position += self.metrics.nbytes
+        self.glyphs = np.frombuffer(buffer, '<i4', glyphs + 1, position)
+        position += self.glyphs.nbytes
+        self.offsets = np.frombuffer(buffer, '<i4', strokes + 1, position)
+        position += self.offsets.nbytes
+        self.points = np.frombuffer(
+            buffer, '<i1', points * 2, position).reshape(-1, 2)
+
+    def strokes(self, glyph):
+        i, j = self.glyphs[glyph], self.glyphs[glyph + 1]
+        offsets = self.offsets[i:j + 1]
+        return [self.points[a:b] for a, b in zip(offsets, offsets[1:])]
+
+    def glyph(self, glyph):
+        left, right = self.metrics[glyph].tolist()
+        strokes = [list(map(tuple, s.tolist())) for s in self.strokes(glyph)]
+        return (left, right, strokes)
+
+def write_fonts(fp, fonts):
+    # fonts is a list of (name, glyphs) with glyphs as (left, right, strokes)
+    glyphs = [g for name, font in fonts for g in font]
+    strokes = [s for left, right, ss in glyphs for s in ss]
+    points = [p for s in strokes for p in s]
+    fp.write(HEADER.pack(
+        MAGIC, VERSION, len(fonts), len(glyphs), len(strokes), len(points)))
+    first = 0
+    for name, font in fonts:
+        fp.write(FONT.pack(name.encode('ascii'), first, len(font)))
+        first += len(font)
+    metrics = [(left, right) for left, right, ss in glyphs]
+    fp.write(np.array(metrics, dtype='<i1').tobytes())
+    counts = [len(ss) for left, right, ss in glyphs]
+    fp.write(np.cumsum([0] + counts, dtype='<i4').tobytes())
+    counts = [len(s) for s in strokes]
+    fp.write(np.cumsum([0] + counts, dtype='<i4').tobytes())
+    fp.write(np.array(points, dtype='<i1').reshape(-1, 2).tobytes())
+
+_font_file = None
+
+def font_file():
+    global _font_file
+    if _font_file is None:
+        _font_file = FontFile()
+    return _font_file
+
+def __getattr__(name):
+    fonts = font_file().fonts
+    if name in fonts:
+        return fonts[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
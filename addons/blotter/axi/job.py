@@ -0,0 +1,111 @@
+from __future__ import division
+
+import threading
+
+from .control import Cancelled, PlotControl
+from .pipeline import Pipeline, PipelineCache
+from .progress import StatusSink
+
+# runs Device.run_drawing on a background thread so that a user interface
+# can stay responsive. the job is controlled through a PlotControl that
+# run_drawing checks between time slices.
+
+class PlotJob(threading.Thread):
+    # prepare returns the drawing and is called on the worker thread, so
+    # that expensive steps like sorting do not block the caller either.
+    # connect returns a Device, disconnect is called with it when the job
+    # is done, also if it failed or was cancelled.
+    def __init__(self, prepare, connect, disconnect=None, checkpoint=None,
+            resume=False):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.prepare = prepare
+        self.connect = connect
+        self.disconnect = disconnect
+        self.checkpoint = checkpoint
+        self.resume_checkpoint = resume
+        self.control = PlotControl()
+        self.progress = StatusSink()
+        self.drawing = None
+        self.error = None
+        self.status = 'preparing'
+        self.prompt = None # what the user should do before resuming
+
+    @property
+    def paths(self):
+        return len(self.drawing.paths) if self.drawing is not None else 0
+
+    def pause(self):
+        self.control.pause()
+
+    def resume(self):
+        self.control.resume()
+
+    def cancel(self):
+        self.control.cancel()
+
+    def wait(self, prompt):
+        # pauses until resume is called
+        self.prompt = prompt
+        self.control.pause()
+        self.control.check()
+        self.prompt = None
+
+    def pen_change(self, layer, name):
+        self.wait('change the pen for %s' % (name or layer))
+
+    def plot(self, device, drawing, plans=None):
+        self.drawing = drawing
+        self.status = 'plotting'
+        device.run_drawing(drawing, self.progress, self.checkpoint,
+            self.resume_checkpoint, self.control, self.pen_change, plans)
+
+    def execute(self):
+        drawing = self.prepare()
+        self.control.check()
+        self.status = 'connecting'
+        self.device = self.connect()
+        self.plot(self.device, drawing)
+
+    def run(self):
+        self.device = None
+        try:
+            self.execute()
+            self.status = 'done'
+        except Cancelled:
+            self.status = 'cancelled'
+        except Exception as e:
+            self.error = e
+            self.status = 'failed'
+        finally:
+            if self.device is not None and self.disconnect is not None:
+                self.disconnect(self.device)
+
+class BatchPlotJob(PlotJob):
+    # plots a sequence of frames, e.g. of an animation, one sheet each.
+    # frames is a list of (frame, drawing) tuples that are optimized with
+    # Pipeline(**options). unchanged frames are taken from the cache.
+    # timings holds (frame, Pipeline.timings) of the frames plotted so far,
+    # for the caller to report.
+    def __init__(self, frames, options, connect, disconnect=None,
+            cache=None):
+        PlotJob.__init__(self, None, connect, disconnect)
+        self.frames = frames
+        self.options = options
+        self.cache = cache if cache is not None else PipelineCache()
+        self.frame = None
+        self.timings = []
+
+    def execute(self):
+        self.status = 'connecting'
+        self.device = self.connect()
+        for i, (frame, drawing) in enumerate(self.frames):
+            self.frame = frame
+            self.status = 'preparing'
+            pipeline = Pipeline(device=self.device, plan=True,
+                cache=self.cache, **self.options)
+            drawing = pipeline.run(drawing)
+            self.timings.append((frame, pipeline.timings))
+            if i > 0:
+                self.wait('change the paper for frame %d' % frame)
+            self.plot(self.device, drawing, pipeline.plans)
@@ -1,14 +1,75 @@
+import numpy as np
 import random
 import re
 
 from math import sin, cos, radians
 
 from .drawing import Drawing
+from .packed import PackedPaths
+
+class _Pen(object):
+    # the state of the interpreter, segments are collected as
+    # (x1, y1, x2, y2) rows
+    def __init__(self):
+        self.x = 0.0
+        self.y = 0.0
+        self.a = 0.0
+        self.stack = []
+        self.segments = []
+        self.chunks = []
+
+    def add(self, segments, dx, dy, da):
+        # draws a fragment at the current position and heading
+        c = cos(self.a)
+        s = sin(self.a)
+        if len(segments):
+            if self.segments:
+                self.chunks.append(np.array(self.segments, dtype=np.float64))
+                self.segments = []
+            u = segments[:, 0::2]
+            v = segments[:, 1::2]
+            result = np.empty_like(segments)
+            result[:, 0::2] = self.x + c * u - s * v
+            result[:, 1::2] = self.y + s * u + c * v
+            self.chunks.append(result)
+        self.x, self.y = self.x + c * dx - s * dy, self.y + s * dx + c * dy
+        self.a += da
+
+    def array(self):
+        if self.segments:
+            self.chunks.append(np.array(self.segments, dtype=np.float64))
+            self.segments = []
+        if not self.chunks:
+            return np.zeros((0, 4))
+        return np.concatenate(self.chunks).reshape(-1, 4)
+
+def _pack_segments(segments, tolerance=1e-9):
+    # a segment continues the current path if it starts where the previous
+    # one ended, otherwise it starts a new path
+    n = len(segments)
+    if n == 0:
+        return PackedPaths(np.zeros((0, 2)), np.zeros(1, dtype=np.int64))
+    starts = segments[:, :2]
+    ends = segments[:, 2:]
+    new = np.ones(n, dtype=bool)
+    d = starts[1:] - ends[:-1]
+    new[1:] = np.hypot(d[:, 0], d[:, 1]) > tolerance
+    last = np.cumsum(1 + new) - 1
+    coords = np.empty((last[-1] + 1, 2))
+    coords[last] = ends
+    coords[last[new] - 1] = starts[new]
+    offsets = np.append(last[new] - 1, len(coords)).astype(np.int64)
+    return PackedPaths(coords, offsets)
 
 class LSystem(object):
     def __init__(self, rules):
         self.rules = rules
         self.pattern = re.compile('|'.join('(%s)' % x for x in rules))
+        # rules for single literal characters can be expanded recursively,
+        # other patterns need the whole string to be substituted each step
+        self.lazy = all(len(x) == 1 and re.escape(x) == x for x in rules)
+        self.shapes = {}
+        self.fragments = {}
 
     def step(self, value):
         def func(match):
@@ -19,35 +80,99 @@ class LSystem(object):
         return self.pattern.sub(func, value)
 
     def steps(self, value, iterations):
+        if self.lazy:
+            return ''.join(self.expand(value, iterations))
         for i in range(iterations):
             value = self.step(value)
         return value
 
+    def expand(self, value, iterations):
+        # yields the characters of steps(value, iterations) one by one
+        # without building the string
+        if not self.lazy:
+            for x in self.steps(value, iterations):
+                yield x
+            return
+        for x in value:
+            rule = self.rules.get(x) if iterations else None
+            if rule is None:
+                yield x
+                continue
+            if not isinstance(rule, str):
+                rule = random.choice(rule)
+            for y in self.expand(rule, iterations - 1):
+                yield y
+
+    def shape(self, symbol, iterations):
+        # (net, low) bracket depth of the expansion of symbol, None if it
+        # involves random rules
+        key = (symbol, iterations)
+        if key not in self.shapes:
+            rule = self.rules[symbol]
+            result = None
+            if isinstance(rule, str):
+                net = low = 0
+                for x in rule:
+                    if x == '[':
+                        net += 1
+                    elif x == ']':
+                        net -= 1
+                        low = min(low, net)
+                    elif x in self.rules and iterations > 1:
+                        s = self.shape(x, iterations - 1)
+                        if s is None:
+                            break
+                        low = min(low, net + s[1])
+                        net += s[0]
+                else:
+                    result = (net, low)
+            self.shapes[key] = result
+        return self.shapes[key]
+
+    def fragment(self, symbol, iterations, angle):
+        # the segments drawn by the expansion of symbol starting at the
+        # origin along x, and the position and heading it ends at. only
+        # valid for deterministic expansions that keep their brackets.
+        key = (symbol, iterations)
+        if key not in self.fragments:
+            pen = _Pen()
+            self.draw(self.rules[symbol], iterations - 1, angle, pen)
+            self.fragments[key] = (pen.array(), pen.x, pen.y, pen.a)
+        return self.fragments[key]
+
+    def draw(self, value, iterations, angle, pen):
+        # interprets the expansion of value, drawing memoized fragments for
+        # the symbols whose expansion allows it
+        for x in value:
+            rule = self.rules.get(x) if iterations and self.lazy else None
+            if rule is not None:
+                if self.shape(x, iterations) == (0, 0):
+                    pen.add(*self.fragment(x, iterations, angle))
+                    continue
+                if not isinstance(rule, str):
+                    rule = random.choice(rule)
+                self.draw(rule, iterations - 1, angle, pen)
+            elif x == '-':
+                pen.a -= angle
+            elif x == '+':
+                pen.a += angle
+            elif x == '[':
+                pen.stack.append((pen.x, pen.y, pen.a))
+            elif x == ']':
+                pen.x, pen.y, pen.a = pen.stack.pop()
+            else:
+                x = pen.x + cos(pen.a)
+                y = pen.y + sin(pen.a)
+                pen.segments.append((pen.x, pen.y, x, y))
+                pen.x = x
+                pen.y = y
+
     def run(self, start, iterations, angle=None):
-        program = self.steps(start, iterations)
         angle = angle and radians(angle)
-        state = (0.0, 0.0, 0.0)
-        stack = []
-        paths = []
-        point = (0.0, 0.0)
-        for instruction in program:
-            x, y, a = state
-            if instruction == '-':
-                a -= angle
-            elif instruction == '+':
-                a += angle
-            elif instruction == '[':
-                stack.append(state)
-            elif instruction == ']':
-                x, y, a = stack.pop()
-                point = (x, y)
-            else:
-                x += cos(a)
-                y += sin(a)
-                if paths and point == paths[-1][-1]:
-                    paths[-1].append((x, y))
-                else:
-                    paths.append([point, (x, y)])
-                point = (x, y)
-            state = (x, y, a)
-        return Drawing(paths)
+        pen = _Pen()
+        if self.lazy:
+            self.fragments = {}
+            self.draw(start, iterations, angle, pen)
+        else:
+            self.draw(self.steps(start, iterations), 0, angle, pen)
+        return Drawing(_pack_segments(pen.array()))
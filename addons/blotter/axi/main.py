@@ -16,9 +16,35 @@ def main():
         d = axi.Drawing.load(args[0])
         d = d.rotate_and_scale_to_fit(12, 8.5, step=90)
         path = args[1] if len(args) > 1 else 'out.png'
-        im = d.render()
+        if axi.drawing.cairo is None:
+            im = d.render_preview()
+        else:
+            im = d.render()
         im.write_to_png(path)
         return
+    if command == 'convert':
+        d = axi.Drawing.load(args[0])
+        path = args[1]
+        if path.endswith('.svg'):
+            d.dump_svg(path)
+        elif path.endswith('.axb'):
+            d.dump_binary(path)
+        else:
+            d.dump(path)
+        return
+    if command == 'pipeline':
+        axi.pipeline.main(args)
+        return
+    if command == 'motion':
+        d = axi.Drawing.load(args[0])
+        path = args[1] if len(args) > 1 else 'motion.png'
+        t = axi.trajectory(d)
+        bounds = d.bounds
+        if '%' in path:
+            axi.motion.render_frames(t, bounds, path)
+        else:
+            axi.motion.render_velocity(t, bounds).write_to_png(path)
+        return
     device = axi.Device()
     if command == 'zero':
         device.zero_position()
@@ -40,7 +66,10 @@ def main():
         device.goto(x, y)
     elif command == 'draw':
         d = axi.Drawing.load(args[0])
-        axi.draw(d)
+        axi.draw(d, checkpoint=args[0] + '.checkpoint')
+    elif command == 'resume':
+        d = axi.Drawing.load(args[0])
+        axi.draw(d, checkpoint=args[0] + '.checkpoint', resume=True)
     else:
         pass
 
@@ -0,0 +1,132 @@
+from __future__ import division
+
+import numpy as np
+
+from .estimate import Estimator
+from .raster import Image, _layout, splat_segments
+
+# samples the motion plans of a whole drawing into a time indexed
+# trajectory and renders it colored by velocity, to find where the planner
+# slows down (sharp corners, throttled curves) when tuning corner_factor
+
+class Trajectory(object):
+    def __init__(self, t, points, v, pen):
+        self.t = t # time of each sample
+        self.points = points # (n, 2) positions
+        self.v = v # velocity
+        self.pen = pen # True while the pen is down
+
+    def __len__(self):
+        return len(self.t)
+
+    @property
+    def duration(self):
+        return float(self.t[-1]) if len(self.t) else 0
+
+def plan_drawing(drawing, **kwargs):
+    # returns a list of (plan, pen down) tuples, jogs are planned with the
+    # jog settings like in Device.run_drawing
+    estimator = Estimator(**kwargs)
+    planner = estimator.make_planner()
+    jog_planner = estimator.make_planner(jog=True)
+    result = []
+    position = (0, 0)
+    for path in drawing.paths:
+        result.append((jog_planner.plan([position, path[0]]), False))
+        result.append((planner.plan(path), True))
+        position = path[-1]
+    result.append((jog_planner.plan([position, (0, 0)]), False))
+    return result
+
+def sample_plans(plans, dt=0.01):
+    # evaluates Block.instant for all blocks of all plans at once
+    rows = []
+    t0 = 0
+    for plan, pen in plans:
+        for t, b in zip(plan.ts, plan.blocks):
+            v = b.p2.sub(b.p1).normalize()
+            rows.append((t0 + t, b.t, b.a, b.vi, b.s, b.p1.x, b.p1.y, v.x, v.y, pen))
+        t0 += plan.t
+    if not rows:
+        empty = np.zeros(0)
+        return Trajectory(empty, np.zeros((0, 2)), empty, empty.astype(bool))
+    start, duration, a, vi, s, x, y, ux, uy, pen = np.array(rows).T
+    t = np.arange(0, t0 + dt, dt)
+    i = np.searchsorted(start, t, side='right') - 1
+    tau = np.clip(t - start[i], 0, duration[i])
+    d = np.clip(vi[i] * tau + a[i] * tau * tau / 2, 0, s[i])
+    points = np.column_stack([x[i] + ux[i] * d, y[i] + uy[i] * d])
+    v = vi[i] + a[i] * tau
+    return Trajectory(t, points, v, pen[i].astype(bool))
+
+def trajectory(drawing, dt=0.01, **kwargs):
+    return sample_plans(plan_drawing(drawing, **kwargs), dt)
+
+def colormap(x):
+    # blue (slow) to red (fast) through green, x in [0, 1]
+    x = np.clip(x, 0, 1)[..., None]
+    slow = np.array([0, 0, 255])
+    mid = np.array([0, 200, 0])
+    fast = np.array([255, 0, 0])
+    return np.where(x < 0.5,
+        slow + (mid - slow) * x * 2, mid + (fast - mid) * (x * 2 - 1))
+
+class VelocityCanvas(object):
+    # accumulates trajectory samples, the color of a pixel is the coverage
+    # weighted mean velocity of the samples drawn over it
+    def __init__(self, bounds, scale=109, margin=1, vmax=None, travel=True):
+        self.width, self.height, self.transform, _ = _layout(
+            bounds, scale, margin)
+        self.vmax = vmax
+        self.travel = travel
+        self.coverage = np.zeros((self.height, self.width))
+        self.velocity = np.zeros((self.height, self.width))
+        self.travel_coverage = np.zeros((self.height, self.width))
+
+    def add(self, traj, i=0, j=None):
+        # draws the segments between samples i and j
+        j = len(traj) if j is None else j
+        if j - i < 2:
+            return
+        scale, dx, dy = self.transform
+        p = traj.points[i:j] * scale + (dx, dy)
+        pen = traj.pen[i:j - 1] & traj.pen[i + 1:j]
+        v = (traj.v[i:j - 1] + traj.v[i + 1:j]) / 2
+        splat_segments(self.coverage, p[:-1][pen], p[1:][pen])
+        splat_segments(self.velocity, p[:-1][pen], p[1:][pen], v[pen])
+        if self.travel:
+            up = ~pen
+            splat_segments(self.travel_coverage, p[:-1][up], p[1:][up])
+
+    def image(self, vmax):
+        alpha = np.minimum(self.coverage, 1)[..., None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            v = np.where(self.coverage > 0, self.velocity / self.coverage, 0)
+        color = colormap(v / vmax)
+        travel = np.minimum(self.travel_coverage, 1)[..., None] * 0.3
+        background = 255 - travel * 255
+        result = background * (1 - alpha) + color * alpha
+        return Image((result + 0.5).astype(np.uint8))
+
+def render_velocity(traj, bounds, scale=109, margin=1, vmax=None,
+        travel=True):
+    canvas = VelocityCanvas(bounds, scale, margin, vmax, travel)
+    canvas.add(traj)
+    return canvas.image(vmax or max(float(traj.v.max()) if len(traj) else 1, 1e-9))
+
+def render_frames(traj, bounds, pattern='frame%05d.png', fps=25, speed=1,
+        scale=109, margin=1, vmax=None, travel=True):
+    # writes an image sequence showing the plot progressing at speed times
+    # real time, returns the number of frames
+    canvas = VelocityCanvas(bounds, scale, margin, vmax, travel)
+    vmax = vmax or max(float(traj.v.max()) if len(traj) else 1, 1e-9)
+    step = speed / fps
+    times = np.arange(0, traj.duration + step, step)
+    ends = np.searchsorted(traj.t, times, side='right')
+    previous = 0
+    for frame, end in enumerate(ends):
+        # segments connect consecutive samples, so overlap by one sample
+        canvas.add(traj, max(previous - 1, 0), end)
+        previous = end
+        canvas.image(vmax).write_to_png(pattern % frame)
+    return len(ends)
@@ -0,0 +1,217 @@
+from __future__ import division
+
+import json
+import mmap
+import numpy as np
+import struct
+
+from itertools import chain
+
+# packed paths store all points of all paths in a single (n, 2) coordinate
+# array plus an offsets array of length len(paths) + 1, so that path i is
+# coords[offsets[i]:offsets[i + 1]]. layers optionally holds an integer
+# (pen, layer, ...) per path and meta a json serializable dict.
+class PackedPaths(object):
+    def __init__(self, coords, offsets, layers=None, meta=None):
+        self.coords = coords
+        self.offsets = offsets
+        self.layers = layers
+        self.meta = meta or {}
+
+    @classmethod
+    def from_paths(cls, paths):
+        if isinstance(paths, PackedPaths):
+            return paths
+        paths = [path for path in paths if len(path)]
+        counts = np.fromiter(
+            (len(path) for path in paths), dtype=np.int64, count=len(paths))
+        offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        values = chain.from_iterable(chain.from_iterable(paths))
+        coords = np.fromiter(values, dtype=np.float64, count=offsets[-1] * 2)
+        return cls(coords.reshape(-1, 2), offsets)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        points = list(map(tuple, self.coords.tolist()))
+        offsets = self.offsets.tolist()
+        for i, j in zip(offsets, offsets[1:]):
+            yield points[i:j]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        n = len(self)
+        if index < 0:
+            index += n
+        if index < 0 or index >= n:
+            raise IndexError('path index out of range')
+        i, j = self.offsets[index], self.offsets[index + 1]
+        return [tuple(p) for p in self.coords[i:j].tolist()]
+
+    def array(self, index):
+        # returns a view of the coordinates of a single path
+        return self.coords[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def counts(self):
+        return np.diff(self.offsets)
+
+    @property
+    def starts(self):
+        return self.offsets[:-1]
+
+    @property
+    def ends(self):
+        return self.offsets[1:] - 1
+
+    def path_lengths(self):
+        index, path = self.segments()
+        d = self.coords[index + 1] - self.coords[index]
+        lengths = np.hypot(d[:, 0], d[:, 1])
+        return np.bincount(path, weights=lengths, minlength=len(self))
+
+    def path_bounds(self):
+        # per path (x1, y1, x2, y2) as an (n, 4) array
+        if len(self) == 0:
+            return np.zeros((0, 4))
+        starts = self.starts
+        lo = np.minimum.reduceat(self.coords, starts, axis=0)
+        hi = np.maximum.reduceat(self.coords, starts, axis=0)
+        return np.hstack([lo, hi])
+
+    def segments(self):
+        # returns (index of first point, path index) of every segment that
+        # connects two consecutive points of the same path
+        n = len(self.coords)
+        if n < 2:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        mask = np.ones(n - 1, dtype=bool)
+        ends = self.ends
+        mask[ends[ends < n - 1]] = False
+        index = np.flatnonzero(mask)
+        path = np.searchsorted(self.offsets, index, side='right') - 1
+        return index, path
+
+    def select(self, indexes):
+        # returns a new PackedPaths with the given paths, in the given order
+        indexes = np.asarray(indexes, dtype=np.int64)
+        counts = self.counts[indexes]
+        offsets = np.zeros(len(indexes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        starts = self.starts[indexes]
+        points = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - starts, counts)
+        layers = None if self.layers is None else self.layers[indexes]
+        return PackedPaths(self.coords[points], offsets, layers, self.meta)
+
+def pack_paths(paths):
+    return PackedPaths.from_paths(paths)
+
+def pack_arrays(arrays):
+    # packs a list of (n, 2) coordinate arrays, dropping empty ones
+    arrays = [a for a in arrays if len(a)]
+    counts = np.array([len(a) for a in arrays], dtype=np.int64)
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    if not arrays:
+        return PackedPaths(np.zeros((0, 2)), offsets)
+    return PackedPaths(np.concatenate(arrays).astype(np.float64), offsets)
+
+def pack_visible(coords, visible):
+    # splits a polyline into the runs of visible segments. the segment from
+    # point i to i + 1 is visible if visible[i] is set, so a run ends with
+    # the first invisible point and the next one starts at a visible point
+    coords = np.asarray(coords, dtype=np.float64)
+    drawn = np.asarray(visible[:-1], dtype=np.int8)
+    edges = np.diff(np.concatenate([[0], drawn, [0]]))
+    begin = np.flatnonzero(edges == 1)
+    end = np.flatnonzero(edges == -1)
+    counts = end - begin + 1
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    index = np.arange(offsets[-1]) - np.repeat(offsets[:-1] - begin, counts)
+    return PackedPaths(coords[index], offsets)
+
+def concat_packed(chunks):
+    chunks = list(chunks)
+    if not chunks:
+        return PackedPaths(np.zeros((0, 2)), np.zeros(1, dtype=np.int64))
+    if len(chunks) == 1:
+        return chunks[0]
+    coords = np.concatenate([c.coords for c in chunks])
+    sizes = np.cumsum([0] + [len(c.coords) for c in chunks[:-1]])
+    offsets = np.concatenate(
+        [c.offsets[:-1] + n for c, n in zip(chunks, sizes)] + [[len(coords)]])
+    layers = None
+    if any(c.layers is not None for c in chunks):
+        layers = np.concatenate([
+            np.zeros(len(c), dtype=np.int32) if c.layers is None else c.layers
+            for c in chunks])
+    return PackedPaths(coords, offsets, layers, chunks[0].meta)
+
+# binary format, all values little endian:
+#   header    magic, version, flags, number of paths, number of points and
+#             size of the json metadata
+#   offsets   int64 x (number of paths + 1)
+#   coords    float32 or float64 x (number of points * 2)
+#   layers    int32 x number of paths, if FLAG_LAYERS is set
+#   meta      utf-8 encoded json, if its size is not zero
+MAGIC = b'AXIB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQI4x')
+
+FLAG_FLOAT32 = 1
+FLAG_LAYERS = 2
+
+def is_binary(filename):
+    with open(filename, 'rb') as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+def dump_packed(packed, fp, dtype=np.float64):
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise Exception('unsupported coordinate type: %s' % dtype)
+    flags = 0
+    if dtype == np.float32:
+        flags |= FLAG_FLOAT32
+    if packed.layers is not None:
+        flags |= FLAG_LAYERS
+    meta = json.dumps(packed.meta).encode('utf-8') if packed.meta else b''
+    fp.write(HEADER.pack(
+        MAGIC, VERSION, flags, len(packed), len(packed.coords), len(meta)))
+    fp.write(np.ascontiguousarray(packed.offsets, '<i8').tobytes())
+    fp.write(np.ascontiguousarray(packed.coords, dtype.newbyteorder('<')).tobytes())
+    if packed.layers is not None:
+        fp.write(np.ascontiguousarray(packed.layers, '<i4').tobytes())
+    fp.write(meta)
+
+def load_packed(filename, use_mmap=True):
+    # with use_mmap the returned arrays are read only views of the mapped
+    # file, the mapping is released when the arrays are no longer referenced
+    with open(filename, 'rb') as fp:
+        if use_mmap:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = fp.read()
+    magic, version, flags, n, m, size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise Exception('not a binary drawing: %s' % filename)
+    if version > VERSION:
+        raise Exception('unsupported binary drawing version: %d' % version)
+    position = HEADER.size
+    offsets = np.frombuffer(data, '<i8', n + 1, position)
+    position += offsets.nbytes
+    dtype = '<f4' if flags & FLAG_FLOAT32 else '<f8'
+    coords = np.frombuffer(data, dtype, m * 2, position).reshape(-1, 2)
+    position += coords.nbytes
+    layers = None
+    if flags & FLAG_LAYERS:
+        layers = np.frombuffer(data, '<i4', n, position)
+        position += layers.nbytes
+    meta = None
+    if size:
+        meta = json.loads(bytes(data[position:position + size]).decode('utf-8'))
+    return PackedPaths(coords, offsets, layers, meta)
@@ -1,6 +1,10 @@
-from math import hypot
+import numpy as np
+
+from itertools import islice
+from math import acos, ceil, cos, hypot, sin
 from shapely import geometry
 
+from .packed import PackedPaths, concat_packed, pack_paths
 from .spatial import Index
 
 try:
@@ -8,16 +12,75 @@ try:
 except ImportError:
     ConvexHull = None
 
+def parse_path(line, separator=None):
+    points = filter(None, line.strip().split(separator))
+    path = [tuple(map(float, x.split(','))) for x in points]
+    return expand_quadratics(path)
+
+def parse_packed(lines, separator=None):
+    # bulk parses a block of lines with a single numeric conversion, falls
+    # back to parse_path if the block contains quadratic control points
+    lines = [x for x in lines if not x.lstrip().startswith('#')]
+    text = ' '.join(lines).replace(',', ' ')
+    if separator:
+        text = text.replace(separator, ' ')
+    values = np.fromstring(text, sep=' ') if text.strip() else np.zeros(0)
+    counts = np.array([x.count(',') for x in lines], dtype=np.int64)
+    if len(values) != 2 * counts.sum():
+        return pack_paths(parse_path(x, separator) for x in lines)
+    counts = counts[counts > 0]
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return PackedPaths(values.reshape(-1, 2), offsets)
+
+def read_packed(fp, separator=None, chunk_size=65536):
+    # yields PackedPaths chunks of at most chunk_size lines from a file object
+    while True:
+        lines = list(islice(fp, chunk_size))
+        if not lines:
+            break
+        chunk = parse_packed(lines, separator)
+        if len(chunk):
+            yield chunk
+
+def read_paths(fp, separator=None):
+    # yields one path at a time from a file object
+    for line in fp:
+        if line.lstrip().startswith('#'):
+            continue
+        path = parse_path(line, separator)
+        if path:
+            yield path
+
+class PathReader(object):
+    # a file backed sequence of paths that is parsed again on each iteration
+    # instead of being held in memory
+    def __init__(self, filename, separator=None):
+        self.filename = filename
+        self.separator = separator
+        self._size = None
+
+    def __len__(self):
+        if self._size is None:
+            self._size = sum(len(chunk) for chunk in self.chunks())
+        return self._size
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            for path in chunk:
+                yield path
+
+    def chunks(self, chunk_size=65536):
+        with open(self.filename) as fp:
+            for chunk in read_packed(fp, self.separator, chunk_size):
+                yield chunk
+
+    def load(self):
+        return concat_packed(self.chunks())
+
 def load_paths(filename):
-    paths = []
     with open(filename) as fp:
-        for line in fp:
-            points = filter(None, line.strip().split(';'))
-            if not points:
-                continue
-            path = [tuple(map(float, x.split(','))) for x in points]
-            paths.append(path)
-    return paths
+        return list(read_paths(fp, ';'))
 
 def path_length(points):
     result = 0
@@ -39,6 +102,9 @@ def simplify_paths(paths, tolerance):
     return [simplify_path(x, tolerance) for x in paths]
 
 def sort_paths(paths, reversable=True):
+    paths = list(paths)
+    if len(paths) < 2:
+        return paths
     first = paths[0]
     paths.remove(first)
     result = [first]
@@ -63,6 +129,18 @@ def sort_paths(paths, reversable=True):
             result.append(path)
     return result
 
+def remove_duplicates(paths):
+    # drops paths that repeat an earlier path, in either direction
+    seen = set()
+    result = []
+    for path in paths:
+        key = tuple(path)
+        if key in seen or key[::-1] in seen:
+            continue
+        seen.add(key)
+        result.append(path)
+    return result
+
 def join_paths(paths, tolerance):
     if len(paths) < 2:
         return paths
@@ -77,52 +155,83 @@ def join_paths(paths, tolerance):
             result.append(list(path))
     return result
 
-def crop_interpolate(x1, y1, x2, y2, ax, ay, bx, by):
-    dx = bx - ax
-    dy = by - ay
-    t1 = (x1 - ax) / dx if dx else -1
-    t2 = (y1 - ay) / dy if dy else -1
-    t3 = (x2 - ax) / dx if dx else -1
-    t4 = (y2 - ay) / dy if dy else -1
-    ts = [t1, t2, t3, t4]
-    ts = [t for t in ts if t >= 0 and t <= 1]
-    t = min(ts)
-    x = ax + (bx - ax) * t
-    y = ay + (by - ay) * t
-    return (x, y)
+def join_packed(packed, tolerance):
+    # like join_paths on all paths at once, paths of different layers are
+    # not joined
+    if len(packed) < 2:
+        return packed
+    ends = packed.coords[packed.offsets[1:-1] - 1]
+    starts = packed.coords[packed.offsets[1:-1]]
+    join = np.hypot(*(starts - ends).T) <= tolerance
+    if packed.layers is not None:
+        join &= packed.layers[1:] == packed.layers[:-1]
+    keep = np.concatenate([[True], ~join, [True]])
+    layers = None if packed.layers is None else packed.layers[keep[:-1]]
+    return PackedPaths(
+        packed.coords, packed.offsets[keep], layers, packed.meta)
 
-def crop_path(path, x1, y1, x2, y2):
+def crop_packed(packed, x1, y1, x2, y2):
+    # liang-barsky clipping of all segments at once
     e = 1e-9
-    result = []
-    buf = []
-    previous_point = None
-    previous_inside = False
-    for x, y in path:
-        inside = x >= x1 - e and y >= y1 - e and x <= x2 + e and y <= y2 + e
-        if inside:
-            if not previous_inside and previous_point:
-                px, py = previous_point
-                ix, iy = crop_interpolate(x1, y1, x2, y2, x, y, px, py)
-                buf.append((ix, iy))
-            buf.append((x, y))
-        else:
-            if previous_inside and previous_point:
-                px, py = previous_point
-                ix, iy = crop_interpolate(x1, y1, x2, y2, x, y, px, py)
-                buf.append((ix, iy))
-                result.append(buf)
-                buf = []
-        previous_point = (x, y)
-        previous_inside = inside
-    if buf:
-        result.append(buf)
-    return result
+    x1, y1, x2, y2 = x1 - e, y1 - e, x2 + e, y2 + e
+    bounds = packed.path_bounds()
+    bx1, by1, bx2, by2 = bounds.T
+    inside = (bx1 >= x1) & (by1 >= y1) & (bx2 <= x2) & (by2 <= y2)
+    outside = (bx2 < x1) | (bx1 > x2) | (by2 < y1) | (by1 > y2)
+    accepted = np.flatnonzero(inside)
+    partial = np.flatnonzero(~inside & ~outside)
+
+    # clip the segments of the paths that cross the crop rectangle
+    sub = packed.select(partial)
+    index, source = sub.segments()
+    p0 = sub.coords[index]
+    d = sub.coords[index + 1] - p0
+    t0 = np.zeros(len(index))
+    t1 = np.ones(len(index))
+    visible = np.ones(len(index), dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for p, q in [
+                (-d[:, 0], p0[:, 0] - x1), (d[:, 0], x2 - p0[:, 0]),
+                (-d[:, 1], p0[:, 1] - y1), (d[:, 1], y2 - p0[:, 1])]:
+            r = q / p
+            t0 = np.where(p < 0, np.maximum(t0, r), t0)
+            t1 = np.where(p > 0, np.minimum(t1, r), t1)
+            visible &= (p != 0) | (q >= 0)
+    visible &= t0 <= t1
+    index, source = index[visible], partial[source[visible]]
+    p0, d, t0, t1 = p0[visible], d[visible], t0[visible], t1[visible]
+    lo = (x1 + e, y1 + e)
+    hi = (x2 - e, y2 - e)
+    c0 = np.clip(p0 + d * t0[:, None], lo, hi)
+    c1 = np.clip(p0 + d * t1[:, None], lo, hi)
+
+    # consecutive visible segments whose shared point was not clipped
+    # continue the same piece, all others start a new one
+    start = np.ones(len(index), dtype=bool)
+    start[1:] = ~(
+        (index[1:] == index[:-1] + 1) & (t1[:-1] == 1) & (t0[1:] == 0))
+    counts = start + 1
+    positions = np.cumsum(counts) - counts
+    coords = np.empty((positions[-1] + counts[-1] if len(index) else 0, 2))
+    coords[positions[start]] = c0[start]
+    coords[positions + start] = c1
+    offsets = np.append(positions[start], len(coords))
+
+    # merge the pieces with the untouched paths, keeping the path order
+    kept = packed.select(accepted)
+    coords = np.concatenate([kept.coords, coords])
+    offsets = np.concatenate([kept.offsets[:-1], offsets + len(kept.coords)])
+    sources = np.concatenate([accepted, source[start]])
+    order = np.argsort(sources, kind='stable')
+    layers = None if packed.layers is None else packed.layers[sources]
+    result = PackedPaths(coords, offsets, layers, packed.meta)
+    return result.select(order)
+
+def crop_path(path, x1, y1, x2, y2):
+    return crop_paths([path], x1, y1, x2, y2)
 
 def crop_paths(paths, x1, y1, x2, y2):
-    result = []
-    for path in paths:
-        result.extend(crop_path(path, x1, y1, x2, y2))
-    return result
+    return list(crop_packed(pack_paths(paths), x1, y1, x2, y2))
 
 def convex_hull(points):
     if ConvexHull is None:
@@ -132,23 +241,69 @@ def convex_hull(points):
     vertices = set(i for v in hull.vertices for i in v)
     return [hull.points[i] for i in vertices]
 
-def quadratic_path(x0, y0, x1, y1, x2, y2):
-    n = int(hypot(x1 - x0, y1 - y0) + hypot(x2 - x1, y2 - y1))
-    n = max(n, 4)
-    points = []
-    m = 1 / float(n - 1)
-    for i in range(n):
-        t = i * m
-        u = 1 - t
-        a = u * u
-        b = 2 * u * t
-        c = t * t
-        x = a * x0 + b * x1 + c * x2
-        y = a * y0 + b * y1 + c * y2
-        points.append((x, y))
-    return points
-
-def expand_quadratics(path):
+# maximum distance of flattened curves from the true curve
+TOLERANCE = 0.001
+
+# the flattening functions below pick the number of uniform steps so that
+# the chord deviation from the curve stays below tolerance (wang's formula
+# for bezier curves, the sagitta for arcs)
+def flatten_beziers(control, tolerance):
+    # control is a (k, degree + 1, 2) array of k curves of the same degree,
+    # returns the points of all curves without their start points
+    control = np.asarray(control, dtype=np.float64)
+    degree = control.shape[1] - 1
+    if degree not in (1, 2, 3):
+        raise Exception('unsupported bezier degree: %d' % degree)
+    if degree > 1:
+        dd = control[:, 2:] - 2 * control[:, 1:-1] + control[:, :-2]
+        m = np.hypot(dd[..., 0], dd[..., 1]).max(axis=1)
+        n = np.ceil(np.sqrt(degree * (degree - 1) * m / (8 * tolerance)))
+        n = np.maximum(n, 1).astype(np.int64)
+    else:
+        n = np.ones(len(control), dtype=np.int64)
+    starts = np.cumsum(n) - n
+    index = np.repeat(np.arange(len(control)), n)
+    t = ((np.arange(n.sum()) - starts[index] + 1) / n[index])[:, None]
+    u = 1 - t
+    c = control[index]
+    if degree == 1:
+        return u * c[:, 0] + t * c[:, 1]
+    if degree == 2:
+        return u * u * c[:, 0] + 2 * u * t * c[:, 1] + t * t * c[:, 2]
+    return (u * u * u * c[:, 0] + 3 * u * u * t * c[:, 1] +
+        3 * u * t * t * c[:, 2] + t * t * t * c[:, 3])
+
+def bezier_points(control, tolerance):
+    # returns a single curve as an (n, 2) array including both end points
+    control = np.asarray(control, dtype=np.float64)
+    points = flatten_beziers(control[None], tolerance)
+    return np.vstack([control[:1], points])
+
+def arc_points(cx, cy, rx, ry, phi, a1, da, tolerance):
+    # elliptical arc starting at angle a1 sweeping da radians, rotated by phi,
+    # as an (n, 2) array including both end points
+    r = max(abs(rx), abs(ry))
+    if r > tolerance:
+        step = 2 * acos(1 - tolerance / r)
+        n = max(int(ceil(abs(da) / step)), 1)
+    else:
+        n = 1
+    a = a1 + da * np.linspace(0, 1, n + 1)
+    x = rx * np.cos(a)
+    y = ry * np.sin(a)
+    c = cos(phi)
+    s = sin(phi)
+    return np.column_stack([cx + x * c - y * s, cy + x * s + y * c])
+
+def quadratic_path(x0, y0, x1, y1, x2, y2, tolerance=TOLERANCE):
+    control = [(x0, y0), (x1, y1), (x2, y2)]
+    return [tuple(p) for p in bezier_points(control, tolerance).tolist()]
+
+def cubic_path(x0, y0, x1, y1, x2, y2, x3, y3, tolerance=TOLERANCE):
+    control = [(x0, y0), (x1, y1), (x2, y2), (x3, y3)]
+    return [tuple(p) for p in bezier_points(control, tolerance).tolist()]
+
+def expand_quadratics(path, tolerance=TOLERANCE):
     result = []
     previous = (0, 0)
     for point in path:
@@ -158,7 +313,8 @@ def expand_quadratics(path):
         elif len(point) == 4:
             x0, y0 = previous
             x1, y1, x2, y2 = point
-            result.extend(quadratic_path(x0, y0, x1, y1, x2, y2))
+            points = quadratic_path(x0, y0, x1, y1, x2, y2, tolerance)
+            result.extend(points[1:] if result else points)
             previous = (x2, y2)
         else:
             raise Exception('invalid point: %r' % point)
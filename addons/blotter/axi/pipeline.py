@@ -0,0 +1,259 @@
+from __future__ import division, print_function
+
+import argparse
+import hashlib
+import json
+import numpy as np
+import time
+
+from collections import OrderedDict
+from multiprocessing import Pool
+
+from .device import Device, plan_steps, STEPS_PER_INCH
+from .drawing import Drawing
+from .estimate import Estimator
+
+# the steps from captured strokes to the plotter, usable without blender.
+# each stage is run if its setting is not None / False and is timed, so the
+# pipeline can be profiled on stroke dumps written by the addon.
+
+STAGES = [
+    'scale', 'crop', 'dedupe', 'simplify', 'join', 'sort', 'plan', 'stream']
+
+# stages that work on each layer separately, these run for all layers of a
+# drawing in parallel
+LAYER_STAGES = ['dedupe', 'simplify', 'join', 'sort']
+
+def _run_stage(args):
+    stage, value, drawing = args
+    return getattr(Pipeline(**{stage: value}), 'run_' + stage)(drawing)
+
+class PipelineCache(object):
+    # results of Pipeline.run keyed by the content of the input drawing and
+    # the pipeline settings, so that unchanged drawings, e.g. frames of an
+    # animation, are not optimized and planned again. size limits the number
+    # of entries, the least recently used ones are dropped first.
+    def __init__(self, size=None):
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries[key] = entry
+        return entry
+
+    def put(self, key, entry):
+        self.entries.pop(key, None)
+        self.entries[key] = entry
+        if self.size is not None:
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+class Pipeline(object):
+    def __init__(self, **kwargs):
+        self.scale = None # scale factor
+        self.crop = None # (x1, y1, x2, y2)
+        self.dedupe = False # remove duplicate paths
+        self.simplify = None # tolerance
+        self.join = None # tolerance
+        self.sort = False
+        self.plan = False # plan the motion, results are kept in plans
+        self.stream = False # compile the plans into steps or run a device
+        self.device = None # a Device for the stream stage, None for a dry run
+        self.progress = True
+        self.processes = None # worker processes for the layers, 1 for none
+        self.cache = None # a PipelineCache
+
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+        self.plans = None
+        self.steps = 0 # number of time slices compiled by a dry run
+        self.timings = [] # (stage, seconds, number of paths)
+
+    def enabled(self, stage):
+        value = getattr(self, stage)
+        return value is not None and value is not False
+
+    def run(self, drawing):
+        self.plans = None
+        self.timings = []
+        # paths of a layer are plotted together even if no stage that
+        # works on the layers is enabled
+        drawing = drawing.group_layers()
+        pool = None
+        key = None
+        cached = None
+        if self.cache is not None:
+            start = time.time()
+            key = self.key(drawing)
+            cached = self.cache.get(key)
+            if cached is not None:
+                drawing, self.plans = cached
+                self.timings.append(
+                    ('cached', time.time() - start, len(drawing.paths)))
+        try:
+            layered = drawing.layers is not None and \
+                len(np.unique(drawing.layers)) > 1
+            if cached is None and layered and self.processes != 1 and \
+                    any(self.enabled(stage) for stage in LAYER_STAGES):
+                pool = Pool(self.processes)
+            for stage in STAGES:
+                if not self.enabled(stage):
+                    continue
+                if cached is not None and stage != 'stream':
+                    continue
+                if key is not None and cached is None and stage == 'stream':
+                    self.cache.put(key, (drawing, self.plans))
+                    key = None
+                start = time.time()
+                if pool and stage in LAYER_STAGES:
+                    drawing = self.run_layers(pool, stage, drawing)
+                else:
+                    drawing = getattr(self, 'run_' + stage)(drawing)
+                self.timings.append(
+                    (stage, time.time() - start, len(drawing.paths)))
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+        if key is not None and cached is None:
+            self.cache.put(key, (drawing, self.plans))
+        return drawing
+
+    def key(self, drawing):
+        # hashes the drawing and every setting that affects the result up
+        # to the plan stage
+        packed = drawing.packed
+        h = hashlib.sha1()
+        for a in (packed.offsets, packed.coords, packed.layers):
+            if a is not None:
+                h.update(np.ascontiguousarray(a).tobytes())
+        settings = dict((stage, getattr(self, stage)) for stage in STAGES)
+        settings['stream'] = None
+        settings['meta'] = packed.meta
+        if self.plan:
+            planner = self.make_planner()
+            jog_planner = self.make_planner(jog=True)
+            settings['planner'] = [
+                planner.acceleration, planner.max_velocity,
+                planner.corner_factor, jog_planner.acceleration,
+                jog_planner.max_velocity]
+        h.update(json.dumps(settings, sort_keys=True).encode('utf-8'))
+        return h.hexdigest()
+
+    def run_layers(self, pool, stage, drawing):
+        value = getattr(self, stage)
+        layers = drawing.split_layers()
+        jobs = [(stage, value, d) for layer, d in layers]
+        results = pool.map(_run_stage, jobs)
+        layers = [(layer, d) for (layer, _), d in zip(layers, results)]
+        return Drawing.merge_layers(layers, drawing.paths.meta)
+
+    def run_scale(self, drawing):
+        return drawing.scale(self.scale)
+
+    def run_crop(self, drawing):
+        return drawing.crop_paths(*self.crop)
+
+    def run_dedupe(self, drawing):
+        return drawing.remove_duplicates()
+
+    def run_simplify(self, drawing):
+        return drawing.simplify_paths(self.simplify)
+
+    def run_join(self, drawing):
+        return drawing.join_paths(self.join)
+
+    def run_sort(self, drawing):
+        return drawing.sort_paths()
+
+    def run_plan(self, drawing):
+        planner = self.make_planner()
+        jog_planner = self.make_planner(jog=True)
+        self.plans = []
+        for i, path in enumerate(drawing.all_paths):
+            p = jog_planner if i % 2 == 0 else planner
+            self.plans.append(p.plan(path))
+        return drawing
+
+    def run_stream(self, drawing):
+        if self.device is not None:
+            self.device.run_drawing(drawing, self.progress, plans=self.plans)
+            return drawing
+        if self.plans is None:
+            self.run_plan(drawing)
+        steps_per_unit = STEPS_PER_INCH
+        self.steps = 0
+        error = (0, 0)
+        for plan in self.plans:
+            for i, sx, sy, error in plan_steps(plan, steps_per_unit, error):
+                self.steps += 1
+        return drawing
+
+    def make_planner(self, jog=False):
+        if self.device is not None:
+            return self.device.make_planner(jog)
+        return Estimator().make_planner(jog)
+
+    def report(self):
+        lines = []
+        for stage, seconds, paths in self.timings:
+            lines.append('%-8s : %8.3fs %8d paths' % (stage, seconds, paths))
+        total = sum(seconds for stage, seconds, paths in self.timings)
+        lines.append('%-8s : %8.3fs' % ('total', total))
+        return '\n'.join(lines)
+
+def run(drawing, **kwargs):
+    return Pipeline(**kwargs).run(drawing)
+
+def parse_args(args):
+    parser = argparse.ArgumentParser(prog='axi pipeline')
+    parser.add_argument('input', help='stroke dump or drawing file')
+    parser.add_argument('output', nargs='?', help='file for the result')
+    parser.add_argument('--scale', type=float)
+    parser.add_argument('--crop', type=float, nargs=4,
+        metavar=('X1', 'Y1', 'X2', 'Y2'))
+    parser.add_argument('--dedupe', action='store_true')
+    parser.add_argument('--simplify', type=float, metavar='TOLERANCE')
+    parser.add_argument('--join', type=float, metavar='TOLERANCE')
+    parser.add_argument('--sort', action='store_true')
+    parser.add_argument('--plan', action='store_true')
+    parser.add_argument('--stream', action='store_true',
+        help='compile the step stream without a device')
+    parser.add_argument('--plot', action='store_true',
+        help='stream to a connected device')
+    return parser.parse_args(args)
+
+def main(args):
+    args = parse_args(args)
+    drawing = Drawing.load(args.input)
+    # stroke dumps of the addon carry the settings they were captured with,
+    # command line options take precedence
+    options = dict(drawing.packed.meta.get('pipeline', {}))
+    for stage in STAGES:
+        value = getattr(args, stage)
+        if value is not None and value is not False:
+            options[stage] = value
+    if args.plot:
+        options['device'] = Device()
+        options['stream'] = True
+    pipeline = Pipeline(**options)
+    drawing = pipeline.run(drawing)
+    print(pipeline.report())
+    if pipeline.steps:
+        print('%d time slices' % pipeline.steps)
+    if args.output:
+        if args.output.endswith('.svg'):
+            drawing.dump_svg(args.output)
+        elif args.output.endswith('.axb'):
+            drawing.dump_binary(args.output)
+        else:
+            drawing.dump(args.output)
+    return drawing
@@ -1,5 +1,7 @@
 from __future__ import division
 
+import numpy as np
+
 from bisect import bisect
 from collections import namedtuple
 from math import sqrt, hypot
@@ -302,3 +304,55 @@ def constant_acceleration_plan(points, a, vmax, cf):
     # filter out zero-duration blocks and return
     blocks = [b for b in blocks if b.t > EPS]
     return Plan(blocks)
+
+# vectorized estimation of plan durations. this uses the same constant
+# acceleration and corner velocity model as constant_acceleration_plan, but
+# solves the velocity limits for all segments of all paths at once. the
+# throttler is not applied, so dense curved paths may take somewhat longer
+# on the device than estimated.
+
+def profile_times(s, vi, vf, a, vmax):
+    # duration of moving distance s starting at vi and ending at vf
+    vp = np.sqrt(np.maximum((2 * a * s + vi * vi + vf * vf) / 2, 0))
+    triangle = (2 * vp - vi - vf) / a
+    s1 = (vmax * vmax - vi * vi) / (2 * a)
+    s3 = (vmax * vmax - vf * vf) / (2 * a)
+    trapezoid = (2 * vmax - vi - vf) / a + (s - s1 - s3) / vmax
+    return np.where(vp <= vmax, triangle, trapezoid)
+
+def estimate_path_times(packed, a, vmax, cf):
+    # returns the planned duration of each path of a PackedPaths
+    index, path = packed.segments()
+    d = packed.coords[index + 1] - packed.coords[index]
+    s = np.hypot(d[:, 0], d[:, 1])
+    keep = s > EPS
+    path, d, s = path[keep], d[keep], s[keep]
+    if not len(s):
+        return np.zeros(len(packed))
+    u = d / s[:, None]
+
+    # squared velocity limit at the start of each segment, zero at the start
+    # of each path and after the last segment
+    limit = np.zeros(len(s) + 1)
+    inner = np.flatnonzero(path[1:] == path[:-1]) + 1
+    cosine = -(u[inner - 1] * u[inner]).sum(axis=1)
+    sine = np.sqrt(np.clip((1 - cosine) / 2, 0, 1))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v = np.sqrt(a * cf * sine / (1 - sine))
+    v = np.where(np.abs(sine - 1) < EPS, vmax, np.minimum(v, vmax))
+    v = np.where(np.abs(cosine - 1) < EPS, 0, v)
+    limit[inner] = v * v
+    ends = np.append(np.flatnonzero(path[1:] != path[:-1]) + 1, len(s))
+    limit[ends] = 0
+
+    # forward pass w[i] = min(limit[i], w[i - 1] + 2 a s[i - 1]) and the
+    # same backwards, as running minimums. the zero limits at the path
+    # boundaries make sure that paths do not influence each other.
+    ds = np.concatenate([[0], np.cumsum(2 * a * s)])
+    w = ds + np.minimum.accumulate(limit - ds)
+    rs = ds[-1] - ds
+    w = np.minimum(w, rs + np.minimum.accumulate((w - rs)[::-1])[::-1])
+    v = np.sqrt(np.maximum(w, 0))
+
+    t = profile_times(s, v[:-1], v[1:], a, vmax)
+    return np.bincount(path, weights=t, minlength=len(packed))
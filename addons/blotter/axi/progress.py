@@ -8,15 +8,52 @@ def pretty_time(seconds):
     h = (seconds / 3600)
     return '%d:%02d:%02d' % (h, m, s)
 
+# sinks receive the bar on update and when it stops. updates are rate
+# limited by the bar, so sinks can be slow (redraw a user interface etc.)
+class ConsoleSink(object):
+
+    def update(self, bar):
+        sys.stdout.write('  %s    \r' % bar.render())
+        sys.stdout.flush()
+
+    def stop(self, bar):
+        sys.stdout.write('\n')
+        sys.stdout.flush()
+
+class StatusSink(object):
+    # keeps the last state of the bar, for user interfaces that poll the
+    # progress from another thread
+
+    def __init__(self):
+        self.percent_complete = 0
+        self.elapsed_time = 0
+        self.eta = 0
+        self.message = ''
+        self.stopped = False
+
+    def update(self, bar):
+        self.percent_complete = bar.percent_complete
+        self.elapsed_time = bar.elapsed_time
+        self.eta = bar.eta
+        self.message = bar.message
+
+    def stop(self, bar):
+        self.stopped = True
+
 class Bar(object):
 
-    def __init__(self, max_value=100, min_value=0, enabled=True):
+    def __init__(self, max_value=100, min_value=0, enabled=True, sink=None,
+                 interval=0.1):
         self.min_value = min_value
         self.max_value = max_value
         self.value = min_value
         self.start_time = time.time()
         self.end_time = None
         self.enabled = enabled
+        self.sink = sink or ConsoleSink()
+        self.interval = interval # minimum seconds between sink updates
+        self.last_update = None
+        self.message = '' # what is being worked on, shown by some sinks
 
     @property
     def percent_complete(self):
@@ -49,19 +86,23 @@ class Bar(object):
     def increment(self, delta):
         self.update(self.value + delta)
 
-    def update(self, value):
+    def update(self, value, force=False):
         self.value = value
-        if self.enabled:
-            sys.stdout.write('  %s    \r' % self.render())
-            sys.stdout.flush()
+        if not self.enabled:
+            return
+        now = time.time()
+        if force or self.last_update is None or \
+                now - self.last_update >= self.interval:
+            self.last_update = now
+            self.sink.update(self)
 
     def done(self):
-        self.update(self.max_value)
+        self.update(self.max_value, force=True)
         self.stop()
 
     def stop(self):
-        sys.stdout.write('\n')
-        sys.stdout.flush()
+        if self.enabled:
+            self.sink.stop(self)
 
     def render(self):
         items = [
@@ -93,6 +134,37 @@ class Bar(object):
     def render_eta(self):
         return pretty_time(self.eta)
 
+class TimeBar(Bar):
+    # a bar whose values are planned seconds, for example from the motion
+    # plan. the eta is the remaining planned time scaled by the observed
+    # ratio of wall clock to planned time, which starts out at 1 and
+    # follows the measured drift as more time is observed.
+
+    def __init__(self, max_value=100, min_value=0, enabled=True, sink=None,
+                 interval=0.1, prior=10):
+        Bar.__init__(self, max_value, min_value, enabled, sink, interval)
+        self.prior = prior # planned seconds the initial ratio of 1 weighs
+        self.skipped = 0
+
+    def skip(self, delta):
+        # advances without the time being observed, e.g. work that was
+        # done before resuming
+        self.skipped += delta
+        self.increment(delta)
+
+    @property
+    def drift(self):
+        planned = self.value - self.min_value - self.skipped
+        return (self.elapsed_time + self.prior) / (max(planned, 0) + self.prior)
+
+    @property
+    def eta(self):
+        return max(self.max_value - self.value, 0) * self.drift
+
+    def render_value(self):
+        return '(%s of %s)' % (
+            pretty_time(self.value), pretty_time(self.max_value))
+
 if __name__ == '__main__':
     bar = Bar()
     for i in bar(range(3517)):
@@ -0,0 +1,264 @@
+from __future__ import division
+
+import numpy as np
+import struct
+import zlib
+
+from multiprocessing import Pool
+
+from .packed import PackedPaths
+from .paths import crop_packed
+
+# a numpy rasterizer for quick previews that does not depend on cairo.
+# segments are sampled at half pixel spacing and the samples are splatted
+# into a coverage buffer with bilinear weights, which gives anti-aliased
+# lines of about one pixel width. wider lines are produced by a box filter.
+
+SAMPLE_SPACING = 0.5
+CHUNK_SIZE = 1 << 20
+
+class PNGWriter(object):
+    # writes 8 bit grayscale or rgb images row by row
+    def __init__(self, fp, width, height, channels=1, level=6):
+        self.fp = fp
+        self.compressor = zlib.compressobj(level)
+        self.channels = channels
+        fp.write(b'\x89PNG\r\n\x1a\n')
+        color_type = {1: 0, 3: 2}[channels]
+        self.chunk(b'IHDR', struct.pack(
+            '>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+
+    def chunk(self, kind, data):
+        self.fp.write(struct.pack('>I', len(data)))
+        self.fp.write(kind)
+        self.fp.write(data)
+        crc = zlib.crc32(data, zlib.crc32(kind))
+        self.fp.write(struct.pack('>I', crc & 0xffffffff))
+
+    def write_rows(self, rows):
+        rows = np.ascontiguousarray(rows, dtype=np.uint8)
+        rows = rows.reshape(len(rows), -1)
+        # each row is prefixed with filter type 0
+        data = np.hstack([np.zeros((len(rows), 1), dtype=np.uint8), rows])
+        data = self.compressor.compress(data.tobytes())
+        if data:
+            self.chunk(b'IDAT', data)
+
+    def close(self):
+        self.chunk(b'IDAT', self.compressor.flush())
+        self.chunk(b'IEND', b'')
+
+def write_png(filename, array):
+    array = np.asarray(array)
+    height, width = array.shape[:2]
+    channels = 1 if array.ndim == 2 else array.shape[2]
+    with open(filename, 'wb') as fp:
+        writer = PNGWriter(fp, width, height, channels)
+        writer.write_rows(array)
+        writer.close()
+
+class Image(object):
+    # an 8 bit grayscale or rgb image, mirrors the write_to_png method of cairo
+    # surfaces so that it can be used in place of Drawing.render()
+    def __init__(self, array):
+        self.array = array
+
+    @property
+    def width(self):
+        return self.array.shape[1]
+
+    @property
+    def height(self):
+        return self.array.shape[0]
+
+    def write_to_png(self, filename):
+        write_png(filename, self.array)
+
+def simplify_packed(packed, resolution):
+    # level of detail: drops points that fall into the same cell of a grid
+    # with the given resolution as the previous point of the same path
+    cells = np.floor(packed.coords / resolution).astype(np.int64)
+    keep = np.ones(len(cells), dtype=bool)
+    keep[1:] = np.any(cells[1:] != cells[:-1], axis=1)
+    keep[packed.starts] = True
+    keep[packed.ends] = True
+    counts = np.add.reduceat(keep, packed.starts) if len(packed) else []
+    offsets = np.zeros(len(packed) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return type(packed)(packed.coords[keep], offsets, packed.layers, packed.meta)
+
+def splat_segments(buffer, p0, p1, values=None):
+    # accumulates anti-aliased segments given in pixel coordinates. with
+    # values the coverage of each segment is multiplied by its value.
+    height, width = buffer.shape
+    d = p1 - p0
+    length = np.hypot(d[:, 0], d[:, 1])
+    n = np.maximum(np.ceil(length / SAMPLE_SPACING), 1).astype(np.int64)
+    weight = np.where(length > 0, length / n, 1)
+    if values is not None:
+        weight = weight * values
+    # process the segments in chunks of about CHUNK_SIZE samples
+    ends = np.cumsum(n)
+    bounds = np.searchsorted(ends, np.arange(0, ends[-1], CHUNK_SIZE)) if len(n) else []
+    for i, j in zip(bounds, list(bounds[1:]) + [len(n)]):
+        nn = n[i:j]
+        index = np.repeat(np.arange(i, j), nn)
+        starts = np.repeat(np.cumsum(nn) - nn, nn)
+        t = (np.arange(len(index)) - starts + 0.5) / n[index]
+        points = p0[index] + d[index] * t[:, None] - 0.5
+        x0 = np.floor(points[:, 0]).astype(np.int64)
+        y0 = np.floor(points[:, 1]).astype(np.int64)
+        fx = points[:, 0] - x0
+        fy = points[:, 1] - y0
+        w = weight[index]
+        x = np.concatenate([x0, x0 + 1, x0, x0 + 1])
+        y = np.concatenate([y0, y0, y0 + 1, y0 + 1])
+        f = np.concatenate([
+            w * (1 - fx) * (1 - fy), w * fx * (1 - fy),
+            w * (1 - fx) * fy, w * fx * fy])
+        mask = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        buffer += np.bincount(
+            y[mask] * width + x[mask], weights=f[mask],
+            minlength=width * height).reshape(height, width)
+
+def _box_filter(buffer, radius):
+    if radius < 1:
+        return buffer
+    k = 2 * radius + 1
+    for axis in (0, 1):
+        pad = [(0, 0), (0, 0)]
+        pad[axis] = (radius + 1, radius)
+        c = np.cumsum(np.pad(buffer, pad), axis=axis)
+        if axis == 0:
+            buffer = c[k:] - c[:-k]
+        else:
+            buffer = c[:, k:] - c[:, :-k]
+    return buffer
+
+def rasterize(packed, transform, width, height, line_width=1, lod=True):
+    # returns a float coverage buffer. transform is (scale, dx, dy) mapping
+    # drawing units to pixels.
+    scale, dx, dy = transform
+    if lod:
+        packed = simplify_packed(packed, 1 / scale)
+    buffer = np.zeros((height, width), dtype=np.float64)
+    # only the parts of the paths inside the buffer are sampled
+    packed = PackedPaths(packed.coords * scale + (dx, dy), packed.offsets)
+    packed = crop_packed(packed, -1, -1, width + 1, height + 1)
+    index, _ = packed.segments()
+    coords = packed.coords
+    # single points are drawn as dots
+    single = packed.starts[packed.counts == 1]
+    p0 = np.concatenate([coords[index], coords[single]])
+    p1 = np.concatenate([coords[index + 1], coords[single]])
+    splat_segments(buffer, p0, p1)
+    radius = int(round((line_width - 1) / 2))
+    if radius >= 1:
+        buffer = np.minimum(buffer, 1)
+        buffer = _box_filter(buffer, radius)
+    return buffer
+
+def _draw_outline(buffer, box):
+    height, width = buffer.shape
+    box = PackedPaths(np.vstack([box, box[:1]]), np.array([0, 5]))
+    outline = rasterize(box, (1, 0, 0), width, height, lod=False)
+    return np.maximum(buffer, np.minimum(outline, 1) * 0.5)
+
+def _layout(bounds, scale, margin):
+    x1, y1, x2, y2 = bounds
+    margin *= scale
+    width = int(scale * (x2 - x1) + margin * 2)
+    height = int(scale * (y2 - y1) + margin * 2)
+    transform = (scale, margin - x1 * scale, margin - y1 * scale)
+    box = np.array([(x1, y1), (x2, y1), (x2, y2), (x1, y2)])
+    box = box * scale + transform[1:]
+    return width, height, transform, box
+
+def render(packed, bounds, scale=109, margin=1, line_width=0.35/25.4,
+        show_bounds=True, lod=True):
+    width, height, transform, box = _layout(bounds, scale, margin)
+    buffer = rasterize(packed, transform, width, height,
+        line_width * scale, lod)
+    if show_bounds:
+        buffer = _draw_outline(buffer, box)
+    return Image(to_gray(buffer))
+
+def to_gray(buffer):
+    # black lines on white background
+    return (255 - np.minimum(buffer, 1) * 255 + 0.5).astype(np.uint8)
+
+# tiled rendering for very large images: paths are binned into tiles by
+# their bounding boxes, tiles are rasterized in a process pool and written
+# to the png file one row of tiles at a time, so memory is bounded by the
+# tile size instead of the image size
+
+def _bin_paths(packed, transform, width, height, tile_size, pad):
+    # returns a list of path indexes per tile, in row major tile order
+    columns = (width + tile_size - 1) // tile_size
+    rows = (height + tile_size - 1) // tile_size
+    scale, dx, dy = transform
+    bounds = packed.path_bounds() * scale + (dx, dy, dx, dy)
+    visible = np.flatnonzero(
+        (bounds[:, 2] >= -pad) & (bounds[:, 0] <= width + pad) &
+        (bounds[:, 3] >= -pad) & (bounds[:, 1] <= height + pad))
+    bounds = bounds[visible]
+    tx0 = np.clip((bounds[:, 0] - pad) // tile_size, 0, columns - 1).astype(np.int64)
+    ty0 = np.clip((bounds[:, 1] - pad) // tile_size, 0, rows - 1).astype(np.int64)
+    tx1 = np.clip((bounds[:, 2] + pad) // tile_size, 0, columns - 1).astype(np.int64)
+    ty1 = np.clip((bounds[:, 3] + pad) // tile_size, 0, rows - 1).astype(np.int64)
+    w = tx1 - tx0 + 1
+    counts = w * (ty1 - ty0 + 1)
+    index = np.repeat(np.arange(len(visible)), counts)
+    local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    tiles = (ty0[index] + local // w[index]) * columns + tx0[index] + local % w[index]
+    order = np.argsort(tiles, kind='stable')
+    tiles = tiles[order]
+    paths = visible[index[order]]
+    splits = np.searchsorted(tiles, np.arange(rows * columns + 1))
+    return [paths[i:j] for i, j in zip(splits, splits[1:])], columns, rows
+
+def _render_tile(args):
+    coords, offsets, transform, width, height, line_width, box, pad = args
+    scale, dx, dy = transform
+    transform = (scale, dx + pad, dy + pad)
+    packed = PackedPaths(coords, offsets)
+    buffer = rasterize(packed, transform, width + 2 * pad, height + 2 * pad,
+        line_width, lod=False)
+    if box is not None:
+        buffer = _draw_outline(buffer, box + pad)
+    return to_gray(buffer[pad:pad + height, pad:pad + width])
+
+def render_tiled(packed, bounds, filename, scale=109, margin=1,
+        line_width=0.35/25.4, show_bounds=True, lod=True, tile_size=1024,
+        processes=None):
+    width, height, transform, box = _layout(bounds, scale, margin)
+    line_width *= scale
+    if lod:
+        packed = simplify_packed(packed, 1 / scale)
+    pad = int(round((line_width - 1) / 2)) + 2
+    tiles, columns, rows = _bin_paths(
+        packed, transform, width, height, tile_size, pad)
+
+    def jobs():
+        for i, paths in enumerate(tiles):
+            x = (i % columns) * tile_size
+            y = (i // columns) * tile_size
+            sub = packed.select(paths)
+            scale, dx, dy = transform
+            yield (sub.coords, sub.offsets, (scale, dx - x, dy - y),
+                min(tile_size, width - x), min(tile_size, height - y),
+                line_width, box - (x, y) if show_bounds else None, pad)
+
+    pool = Pool(processes) if processes != 1 else None
+    results = pool.imap(_render_tile, jobs()) if pool else map(_render_tile, jobs())
+    try:
+        with open(filename, 'wb') as fp:
+            writer = PNGWriter(fp, width, height)
+            for row in range(rows):
+                band = [next(results) for column in range(columns)]
+                writer.write_rows(np.hstack(band))
+            writer.close()
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
@@ -14,8 +14,9 @@ class Index(object):
             self.insert(point)
 
     def normalize(self, x, y):
-        px = (x - self.x1) / (self.x2 - self.x1)
-        py = (y - self.y1) / (self.y2 - self.y1)
+        # points on a line, e.g. of a layer with few paths, have no extent
+        px = (x - self.x1) / ((self.x2 - self.x1) or 1)
+        py = (y - self.y1) / ((self.y2 - self.y1) or 1)
         i = int(px * self.n)
         j = int(py * self.n)
         return (i, j)
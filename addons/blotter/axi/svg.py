@@ -0,0 +1,461 @@
+from __future__ import division
+
+import numpy as np
+import re
+import xml.etree.ElementTree as ET
+
+from math import atan2, cos, hypot, pi, radians, sin, sqrt, tan
+from xml.sax.saxutils import quoteattr
+
+from .packed import pack_arrays
+from .paths import arc_points, flatten_beziers
+
+STYLE = {
+    'fill': 'none',
+    'stroke': 'black',
+    'stroke-width': 0.01,
+    'stroke-linecap': 'round',
+    'stroke-linejoin': 'round',
+}
+
+TRAVEL_STYLE = dict(STYLE, stroke='red')
+
+def _attributes(style, factor=1):
+    style = dict(style)
+    style['stroke-width'] = '%g' % (float(style['stroke-width']) * factor)
+    return ' '.join('%s=%s' % (k, quoteattr(str(v))) for k, v in sorted(style.items()))
+
+# number of points formatted at a time by the writer
+CHUNK_SIZE = 65536
+
+# decimals of relative coordinates written without a precision
+RELATIVE_PRECISION = 3
+
+def _path_data(packed, precision, relative):
+    # yields the path elements in pieces of at most CHUNK_SIZE points. with
+    # a precision the coordinates are written as integers in units of
+    # 10 ** -precision, relative moves are computed from the rounded values
+    # so that no error accumulates
+    coords = packed.coords
+    offsets = packed.offsets
+    line = 'l' if relative else 'L'
+    for i in range(0, len(coords), CHUNK_SIZE):
+        j = min(i + CHUNK_SIZE, len(coords))
+        # one more point in front for the first relative move
+        k = max(i - 1, 0)
+        values = coords[k:j]
+        if precision is not None:
+            values = np.rint(values * 10 ** precision).astype(np.int64)
+        if relative:
+            values = np.diff(values, axis=0, prepend=values[:1])
+            starts = offsets[(offsets >= k) & (offsets < j)] - k
+            values[starts] = np.rint(coords[starts + k] * 10 ** precision)
+        values = values[i - k:]
+        if precision is None:
+            values = ['%g' % x for x in values.ravel().tolist()]
+        else:
+            values = list(map(str, values.ravel().tolist()))
+        first = np.searchsorted(offsets, i, side='right') - 1
+        last = np.searchsorted(offsets, j, side='left')
+        for a, b in zip(offsets[first:last].tolist(),
+                offsets[first + 1:last + 1].tolist()):
+            text = []
+            if a >= i:
+                text.append('<path d="M%s %s' % (
+                    values[2 * (a - i)], values[2 * (a - i) + 1]))
+                a += 1
+                if a < b:
+                    text.append(line)
+            else:
+                a = i
+                text.append(' ')
+            text.append(' '.join(values[2 * (a - i):2 * (min(b, j) - i)]))
+            if b <= j:
+                text.append('"/>\n')
+            yield ''.join(text)
+
+def _travel_data(packed, precision):
+    starts = packed.coords[packed.starts]
+    ends = packed.coords[packed.ends]
+    moves = np.vstack([[(0, 0)], ends])
+    targets = np.vstack([starts, [(0, 0)]])
+    if precision is None:
+        fmt = 'M%g %gL%g %g'
+    else:
+        moves = np.rint(moves * 10 ** precision).astype(np.int64)
+        targets = np.rint(targets * 10 ** precision).astype(np.int64)
+        fmt = 'M%d %dL%d %d'
+    for (x1, y1), (x2, y2) in zip(moves.tolist(), targets.tolist()):
+        yield fmt % (x1, y1, x2, y2)
+
+def write_svg(fp, packed, bounds, scale=96, precision=None, relative=False,
+        travel=False, style=None):
+    # streams a drawing to fp. paths are grouped in inkscape layers with the
+    # style attributes set once per group, with a precision coordinates are
+    # written as integers and scaled back by the group transform. relative
+    # output uses RELATIVE_PRECISION if no precision is given.
+    style = dict(STYLE, **(style or {}))
+    if relative and precision is None:
+        precision = RELATIVE_PRECISION
+    x1, y1, x2, y2 = bounds
+    w = (x2 - x1 + 2) * scale
+    h = (y2 - y1 + 2) * scale
+    fp.write('<svg xmlns="http://www.w3.org/2000/svg" xmlns:inkscape="%s" version="1.1" width="%g" height="%g">\n' % (INKSCAPE[1:-1], w, h))
+    transform = 'scale(%g) translate(1 1)' % scale
+    factor = 1
+    if precision is not None:
+        factor = 10 ** precision
+        transform += ' scale(%g)' % (1 / factor)
+    fp.write('<g transform="%s">\n' % transform)
+    if packed.layers is None:
+        groups = [(None, packed)]
+    else:
+        names = packed.meta.get('layers', [])
+        groups = []
+        for layer in np.unique(packed.layers).tolist():
+            name = names[layer] if layer < len(names) else 'layer%d' % layer
+            groups.append((name, packed.select(np.flatnonzero(packed.layers == layer))))
+    for name, group in groups:
+        # inkscape layers, so that read_svg restores them
+        label = '' if name is None else \
+            'inkscape:groupmode="layer" inkscape:label=%s ' % quoteattr(name)
+        fp.write('<g %s%s>\n' % (label, _attributes(style, factor)))
+        for text in _path_data(group, precision, relative):
+            fp.write(text)
+        fp.write('</g>\n')
+    if travel and len(packed):
+        fp.write('<g id="travel" %s>\n' % _attributes(TRAVEL_STYLE, factor))
+        fp.write('<path d="')
+        for text in _travel_data(packed, precision):
+            fp.write(text)
+        fp.write('"/>\n')
+        fp.write('</g>\n')
+    fp.write('</g>\n')
+    fp.write('</svg>\n')
+
+# svg import
+
+NUMBER = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+COMMAND = re.compile(r'([MmLlHhVvCcSsQqTtAaZz])')
+
+# number of values each path command takes
+ARGUMENTS = dict(M=2, L=2, H=1, V=1, C=6, S=4, Q=4, T=2, A=7, Z=0)
+TRANSFORM = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+LENGTH = re.compile(r'\s*([-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?)\s*([a-z%]*)')
+
+# inches per unit
+UNITS = {
+    '': 1 / 96, 'px': 1 / 96, 'in': 1, 'mm': 1 / 25.4, 'cm': 1 / 2.54,
+    'pt': 1 / 72, 'pc': 1 / 6,
+}
+
+SHAPES = set(['path', 'polyline', 'polygon', 'line', 'rect', 'circle', 'ellipse'])
+SKIPPED = set([
+    'defs', 'clipPath', 'mask', 'symbol', 'marker', 'pattern', 'metadata',
+    'title', 'desc', 'style', 'script', 'text'])
+
+INKSCAPE = '{http://www.inkscape.org/namespaces/inkscape}'
+
+IDENTITY = (1, 0, 0, 1, 0, 0)
+
+def _multiply(m, n):
+    # returns the transform that applies n first, then m
+    a, b, c, d, e, f = m
+    g, h, i, j, k, l = n
+    return (
+        a * g + c * h, b * g + d * h, a * i + c * j, b * i + d * j,
+        a * k + c * l + e, b * k + d * l + f)
+
+def parse_transform(value):
+    m = IDENTITY
+    for name, args in TRANSFORM.findall(value or ''):
+        v = [float(x) for x in NUMBER.findall(args)] + [0, 0]
+        if name == 'matrix':
+            n = tuple(v[:6])
+        elif name == 'translate':
+            n = (1, 0, 0, 1, v[0], v[1])
+        elif name == 'scale':
+            n = (v[0], 0, 0, v[1] if len(v) > 3 else v[0], 0, 0)
+        elif name == 'rotate':
+            c = cos(radians(v[0]))
+            s = sin(radians(v[0]))
+            cx, cy = v[1], v[2]
+            n = (c, s, -s, c, cx - c * cx + s * cy, cy - s * cx - c * cy)
+        elif name == 'skewX':
+            n = (1, 0, tan(radians(v[0])), 1, 0, 0)
+        else:
+            n = (1, tan(radians(v[0])), 0, 1, 0, 0)
+        m = _multiply(m, n)
+    return m
+
+def parse_length(value, default=0):
+    # returns a length in user units (pixels)
+    match = LENGTH.match(value or '')
+    if not match:
+        return default
+    number, unit = match.groups()
+    return float(number) * UNITS.get(unit, 1 / 96) * 96
+
+def _arc_flags(numbers):
+    # arc flags may be written without separators, e.g. "a5 5 0 015 5"
+    result = []
+    count = 0
+    for x in numbers:
+        while True:
+            if count % 7 in (3, 4) and len(x) > 1 and x[0] in '01':
+                result.append(x[0])
+                x = x[1:]
+                count += 1
+                continue
+            result.append(x)
+            count += 1
+            break
+    return result
+
+def _endpoint_arc(x1, y1, rx, ry, phi, large, sweep, x2, y2, tolerance):
+    # converts an endpoint parameterized arc to its center parameterization
+    # https://www.w3.org/TR/SVG/implnote.html#ArcConversionEndpointToCenter
+    rx = abs(rx)
+    ry = abs(ry)
+    if rx == 0 or ry == 0:
+        return np.array([(x2, y2)], dtype=np.float64)
+    phi = radians(phi % 360)
+    c = cos(phi)
+    s = sin(phi)
+    dx = (x1 - x2) / 2
+    dy = (y1 - y2) / 2
+    x = c * dx + s * dy
+    y = -s * dx + c * dy
+    scale = (x * x) / (rx * rx) + (y * y) / (ry * ry)
+    if scale > 1:
+        rx *= sqrt(scale)
+        ry *= sqrt(scale)
+    num = rx * rx * ry * ry - rx * rx * y * y - ry * ry * x * x
+    den = rx * rx * y * y + ry * ry * x * x
+    k = sqrt(max(num, 0) / den) if den else 0
+    if large == sweep:
+        k = -k
+    cx1 = k * rx * y / ry
+    cy1 = -k * ry * x / rx
+    cx = c * cx1 - s * cy1 + (x1 + x2) / 2
+    cy = s * cx1 + c * cy1 + (y1 + y2) / 2
+    a1 = atan2((y - cy1) / ry, (x - cx1) / rx)
+    a2 = atan2((-y - cy1) / ry, (-x - cx1) / rx)
+    da = a2 - a1
+    if sweep and da < 0:
+        da += 2 * pi
+    elif not sweep and da > 0:
+        da -= 2 * pi
+    points = arc_points(cx, cy, rx, ry, phi, a1, da, tolerance)
+    points[-1] = (x2, y2)
+    return points[1:]
+
+def parse_path_data(d, tolerance):
+    # returns the subpaths of svg path data as a list of (n, 2) arrays
+    result = []
+    current = []
+    x = y = 0.0
+    sx = sy = 0.0
+    previous = None
+    control = None
+    tokens = COMMAND.split(d)
+    for command, args in zip(tokens[1::2], tokens[2::2]):
+        numbers = NUMBER.findall(args)
+        if command in 'Aa':
+            numbers = _arc_flags(numbers)
+        values = np.array(numbers, dtype=np.float64)
+        relative = command.islower()
+        c = command.upper()
+        if len(values) < ARGUMENTS[c] or (c == 'Z' and not current):
+            # degenerate commands draw nothing
+            continue
+        if c != 'M' and not current:
+            current = [np.array([(x, y)])]
+        if c == 'Z':
+            current.append(np.array([(sx, sy)]))
+            result.append(np.vstack(current))
+            current = []
+            x, y = sx, sy
+            previous = c
+            continue
+        if c == 'M':
+            if len(current) > 0:
+                result.append(np.vstack(current))
+            points = values[:len(values) // 2 * 2].reshape(-1, 2)
+            if relative:
+                points = np.cumsum(np.vstack([[(x, y)], points]), axis=0)[1:]
+            current = [points]
+            x, y = points[-1]
+            sx, sy = points[0]
+        elif c == 'L':
+            points = values[:len(values) // 2 * 2].reshape(-1, 2)
+            if relative:
+                points = np.cumsum(np.vstack([[(x, y)], points]), axis=0)[1:]
+            current.append(points)
+            x, y = points[-1]
+        elif c in 'HV':
+            v = np.cumsum(values) + (x if c == 'H' else y) if relative else values
+            if c == 'H':
+                points = np.column_stack([v, np.full(len(v), y)])
+            else:
+                points = np.column_stack([np.full(len(v), x), v])
+            current.append(points)
+            x, y = points[-1]
+        elif c in 'CQ':
+            k = 6 if c == 'C' else 4
+            values = values[:len(values) // k * k].reshape(-1, k // 2, 2)
+            if relative:
+                ends = np.cumsum(values[:, -1], axis=0) + (x, y)
+                starts = np.vstack([[(x, y)], ends[:-1]])
+                values = values + starts[:, None]
+            else:
+                starts = np.vstack([[(x, y)], values[:-1, -1]])
+            control = np.concatenate([starts[:, None], values], axis=1)
+            current.append(flatten_beziers(control, tolerance))
+            control = tuple(control[-1, -2])
+            x, y = values[-1, -1]
+        elif c in 'ST':
+            k = 4 if c == 'S' else 2
+            curves = []
+            for i in range(0, len(values) // k * k, k):
+                v = values[i:i + k].reshape(-1, 2)
+                if relative:
+                    v = v + (x, y)
+                if control is not None and previous in ('CS' if c == 'S' else 'QT'):
+                    c1 = (2 * x - control[0], 2 * y - control[1])
+                else:
+                    c1 = (x, y)
+                curves.append(np.vstack([[(x, y), c1], v]))
+                control = tuple(v[-2]) if c == 'S' else c1
+                x, y = v[-1]
+                previous = c
+            if curves:
+                current.append(flatten_beziers(np.array(curves), tolerance))
+        elif c == 'A':
+            for i in range(0, len(values) // 7 * 7, 7):
+                rx, ry, phi, large, sweep, x2, y2 = values[i:i + 7]
+                if relative:
+                    x2 += x
+                    y2 += y
+                current.append(_endpoint_arc(
+                    x, y, rx, ry, phi, large, sweep, x2, y2, tolerance))
+                x, y = x2, y2
+        if c not in 'ST':
+            previous = c
+            if c not in 'CQ':
+                control = None
+    if len(current) > 0:
+        result.append(np.vstack(current))
+    return result
+
+def _shape_data(tag, attrib):
+    # converts basic shapes to path data
+    def length(name):
+        return parse_length(attrib.get(name))
+    if tag == 'line':
+        return 'M%r %rL%r %r' % (
+            length('x1'), length('y1'), length('x2'), length('y2'))
+    if tag in ('polyline', 'polygon'):
+        d = 'M' + attrib.get('points', '')
+        return d + 'Z' if tag == 'polygon' else d
+    if tag == 'rect':
+        x, y = length('x'), length('y')
+        w, h = length('width'), length('height')
+        rx = parse_length(attrib.get('rx', attrib.get('ry')))
+        ry = parse_length(attrib.get('ry', attrib.get('rx')))
+        rx, ry = min(rx, w / 2), min(ry, h / 2)
+        if w <= 0 or h <= 0:
+            return ''
+        if rx <= 0 or ry <= 0:
+            return 'M%r %rH%rV%rH%rZ' % (x, y, x + w, y + h, x)
+        return ('M%r %rH%rA%r %r 0 0 1 %r %rV%rA%r %r 0 0 1 %r %r'
+            'H%rA%r %r 0 0 1 %r %rV%rA%r %r 0 0 1 %r %rZ') % (
+            x + rx, y, x + w - rx, rx, ry, x + w, y + ry, y + h - ry,
+            rx, ry, x + w - rx, y + h, x + rx, rx, ry, x, y + h - ry,
+            y + ry, rx, ry, x + rx, y)
+    if tag in ('circle', 'ellipse'):
+        cx, cy = length('cx'), length('cy')
+        if tag == 'circle':
+            rx = ry = length('r')
+        else:
+            rx, ry = length('rx'), length('ry')
+        if rx <= 0 or ry <= 0:
+            return ''
+        return 'M%r %rA%r %r 0 0 1 %r %rA%r %r 0 0 1 %r %rZ' % (
+            cx + rx, cy, rx, ry, cx - rx, cy, rx, ry, cx + rx, cy)
+    return attrib.get('d', '')
+
+def _hidden(attrib):
+    if attrib.get('display') == 'none' or attrib.get('visibility') == 'hidden':
+        return True
+    return 'display:none' in attrib.get('style', '').replace(' ', '')
+
+def read_svg(source, tolerance=0.001):
+    # parses an svg file or file object into packed paths in inches.
+    # curves are flattened so that they deviate at most tolerance inches
+    # from the true shape. inkscape layers become path layers.
+    arrays = []
+    layers = []
+    names = []
+    stack = []
+    skip = 0
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        tag = elem.tag.rsplit('}', 1)[-1]
+        if event == 'end':
+            if stack:
+                stack.pop()
+            if skip:
+                skip -= 1
+            elem.clear()
+            continue
+        if skip or tag in SKIPPED or _hidden(elem.attrib):
+            skip += 1
+            stack.append(None)
+            continue
+        if stack:
+            matrix, layer = stack[-1]
+        else:
+            matrix, layer = (UNITS[''], 0, 0, UNITS[''], 0, 0), -1
+        if tag == 'svg':
+            matrix = _multiply(matrix, _viewport(elem.attrib, not stack))
+        elif tag == 'g' and elem.get(INKSCAPE + 'groupmode') == 'layer':
+            layer = len(names)
+            names.append(elem.get(INKSCAPE + 'label') or elem.get('id') or
+                'layer%d' % layer)
+        matrix = _multiply(matrix, parse_transform(elem.get('transform')))
+        stack.append((matrix, layer))
+        if tag not in SHAPES:
+            continue
+        a, b, c, d, e, f = matrix
+        scale = max(hypot(a, b), hypot(c, d)) or 1
+        for points in parse_path_data(_shape_data(tag, elem.attrib),
+                tolerance / scale):
+            x = points[:, 0]
+            y = points[:, 1]
+            arrays.append(np.column_stack([a * x + c * y + e, b * x + d * y + f]))
+            layers.append(layer)
+    packed = pack_arrays(arrays)
+    if names:
+        # elements outside of the inkscape layers get a layer of their own
+        if -1 in layers:
+            layers = [len(names) if x < 0 else x for x in layers]
+            names.append('unlayered')
+        layers = [x for x, a in zip(layers, arrays) if len(a)]
+        packed.layers = np.array(layers, dtype=np.int32)
+        packed.meta = {'layers': names}
+    return packed
+
+def _viewport(attrib, root):
+    # maps the user units of an svg element to the units of its parent,
+    # in the outermost element to inches
+    x = parse_length(attrib.get('x')) if not root else 0
+    y = parse_length(attrib.get('y')) if not root else 0
+    box = [float(v) for v in NUMBER.findall(attrib.get('viewBox', ''))]
+    if len(box) != 4 or box[2] <= 0 or box[3] <= 0:
+        return (1, 0, 0, 1, x, y)
+    vx, vy, vw, vh = box
+    w = parse_length(attrib.get('width'), vw)
+    h = parse_length(attrib.get('height'), vh)
+    sx = w / vw
+    sy = h / vh
+    return (sx, 0, 0, sy, x - vx * sx, y - vy * sy)
@@ -1,6 +1,7 @@
 import math
 
 from .drawing import Drawing
+from .paths import TOLERANCE, arc_points
 
 def to_degrees(x):
     return math.degrees(x) % 360
@@ -89,21 +90,28 @@ class Turtle(object):
         self.seth(self.h - angle)
     left = lt
 
-    def circle(self, radius, extent=None, steps=None):
+    def circle(self, radius, extent=None, steps=None, tolerance=TOLERANCE):
+        # without steps the number of points is chosen so that the chords
+        # deviate at most tolerance from the circle
         if extent is None:
             extent = 360
-        if steps is None:
-            steps = int(round(abs(2 * math.pi * radius * extent / 360)))
-            steps = max(steps, 4)
         cx = self.x + radius * math.cos(math.radians(self.h + 90))
         cy = self.y + radius * math.sin(math.radians(self.h + 90))
         a1 = to_degrees(math.atan2(self.y - cy, self.x - cx))
         a2 = a1 + extent if radius >= 0 else a1 - extent
-        for i in range(steps):
-            p = i / float(steps - 1)
-            a = a1 + (a2 - a1) * p
-            x = cx + abs(radius) * math.cos(math.radians(a))
-            y = cy + abs(radius) * math.sin(math.radians(a))
+        if steps is None:
+            points = arc_points(cx, cy, abs(radius), abs(radius), 0,
+                math.radians(a1), math.radians(a2 - a1), tolerance)
+            points = points.tolist()[1:]
+        else:
+            points = []
+            for i in range(steps):
+                p = i / float(steps - 1)
+                a = a1 + (a2 - a1) * p
+                x = cx + abs(radius) * math.cos(math.radians(a))
+                y = cy + abs(radius) * math.sin(math.radians(a))
+                points.append((x, y))
+        for x, y in points:
             self.goto(x, y)
         if radius >= 0:
             self.seth(self.h + extent)
@@ -5,9 +5,10 @@ def reset():
     d.disable_motors()
     d.pen_up()
 
-def draw(drawing, progress=True):
+def draw(drawing, progress=True, checkpoint=None, resume=False):
     # TODO: support drawing, list of paths, or single path
+    drawing = drawing.group_layers()
     d = Device()
     d.enable_motors()
-    d.run_drawing(drawing, progress)
+    d.run_drawing(drawing, progress, checkpoint, resume)
     d.disable_motors()
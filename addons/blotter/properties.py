@@ -5,8 +5,10 @@ from bpy import (
 )
 
 from bpy.props import (
+    EnumProperty,
     FloatProperty,
     BoolProperty,
+    StringProperty,
     PointerProperty
 )
 
@@ -59,6 +61,64 @@ class PlotProperties(types.PropertyGroup):
         precision=3
     )
 
+    layer_by: EnumProperty(
+        name="Pens",
+        description="Which strokes are plotted with the same pen. The "
+                    "plot pauses for changing the pen between them",
+        items=(
+            ('LINESTYLE', "Per Line Style", "One pen per Freestyle line style"),
+            ('LINESET', "Per Line Set", "One pen per Freestyle line set"),
+        ),
+        default='LINESTYLE'
+    )
+
+    dump_strokes: StringProperty(
+        name="Stroke Dump",
+        description="Also write the captured strokes to this file, to run "
+                    "the plotting pipeline with 'axi pipeline <file>'",
+        default="",
+        subtype="FILE_PATH"
+    )
+
+    estimate: StringProperty(
+        name="Estimated Time",
+        description="Estimated plotting time of the last render",
+        default=""
+    )
+
+    status: StringProperty(
+        name="Status",
+        description="Status of the last plot",
+        default=""
+    )
+
+    plotting: BoolProperty(
+        name="Plotting",
+        description="Whether a plot is running",
+        default=False
+    )
+
+    progress: FloatProperty(
+        name="Progress",
+        description="Progress of the running plot",
+        min=0,
+        max=100,
+        default=0,
+        subtype="PERCENTAGE"
+    )
+
+    eta: StringProperty(
+        name="Time",
+        description="Elapsed and remaining time of the running plot",
+        default=""
+    )
+
+    paused: BoolProperty(
+        name="Paused",
+        description="Whether plotting is paused",
+        default=False
+    )
+
 
 def register():
     utils.register_class(PlotProperties)
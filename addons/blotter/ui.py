@@ -34,8 +34,30 @@ class PlotPanel(types.Panel):
         col.active = plotter.join_paths
         col.prop(plotter, "join_paths_threshold")
 
+        col = layout.column()
+        col.prop(plotter, "layer_by")
+        col.prop(plotter, "dump_strokes")
+
         row = layout.row()
+        row.operator("plot.estimate")
+        row.operator("plot.export")
         row.operator("plot.plot")
+        row.operator("plot.frames")
+
+        row = layout.row()
+        row.operator("plot.pause",
+                     text="Continue" if plotter.paused else "Pause")
+        row.operator("plot.cancel")
+
+        col = layout.column()
+        if plotter.estimate:
+            col.label(text="Estimated time: %s" % plotter.estimate)
+        if plotter.status:
+            col.label(text=plotter.status)
+        if plotter.plotting:
+            col.prop(plotter, "progress", slider=True)
+            if plotter.eta:
+                col.label(text=plotter.eta)
 
 
 def register():
@@ -0,0 +1,55 @@
+"""Measures the time of 'import axi' and of the first font access.
+
+Each measurement runs in a fresh interpreter. With --cold the bytecode
+cache is redirected to an empty directory, which is what Blender sees the
+first time it loads the addon.
+
+    python test/bench_import.py [--cold] [-n RUNS]
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+addon_dir = os.path.join(base_dir, '..', 'addons', 'blotter')
+
+SNIPPETS = [
+    ('import axi', 'import axi'),
+    ('import axi + FUTURAL', 'import axi; axi.FUTURAL'),
+]
+
+TIMER = '''
+import sys, time
+sys.path.insert(0, %r)
+t = time.perf_counter()
+%s
+print(time.perf_counter() - t)
+'''
+
+
+def measure(code, cold):
+    env = dict(os.environ)
+    if cold:
+        env['PYTHONPYCACHEPREFIX'] = tempfile.mkdtemp()
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER % (addon_dir, code)], env=env)
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--cold', action='store_true')
+    parser.add_argument('-n', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in SNIPPETS:
+        times = sorted(measure(code, args.cold) for _ in range(args.n))
+        print('%-24s min %7.1f ms  median %7.1f ms' % (
+            name, times[0] * 1000, times[len(times) // 2] * 1000))
+
+
+main()
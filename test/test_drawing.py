@@ -0,0 +1,48 @@
+"""Checks that a lazy drawing is measured and estimated without loading it.
+
+    python -m pytest test/test_drawing.py
+
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'addons', 'blotter'))
+
+import axi  # noqa: E402
+from axi.paths import PathReader  # noqa: E402
+
+
+def test_lazy_drawing(tmp_path, monkeypatch):
+    random = np.random.RandomState(0)
+    paths = [random.uniform(0, 5, (n, 2)) for n in random.randint(1, 6, 50)]
+    filename = str(tmp_path / 'paths.txt')
+    with open(filename, 'w') as fp:
+        for path in paths:
+            fp.write(' '.join('%.17g,%.17g' % tuple(p) for p in path) + '\n')
+    parses = []
+    read = PathReader.chunks
+
+    def chunks(self):
+        # small chunks, counting how often the file is parsed
+        parses.append(1)
+        return read(self, 8)
+
+    monkeypatch.setattr(PathReader, 'chunks', chunks)
+    lazy = axi.Drawing.load(filename, lazy=True)
+    drawing = axi.Drawing(axi.packed.pack_arrays(paths))
+    assert lazy.count == len(paths)
+    assert np.allclose(lazy.bounds, drawing.bounds)
+    assert np.isclose(lazy.length, drawing.length)
+    assert np.isclose(lazy.down_length, drawing.down_length)
+    assert len(parses) == 1
+    a = axi.estimate(lazy)
+    b = axi.estimate(drawing)
+    assert np.allclose(a.path_times, b.path_times)
+    assert np.allclose(a.jog_times, b.jog_times)
+    assert np.isclose(a.time, b.time)
+    assert len(parses) == 2
+    assert lazy._packed is None
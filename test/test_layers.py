@@ -0,0 +1,120 @@
+"""Checks that the paths of a layer are plotted with a single pen change.
+
+Runs without a device, with pytest or as a script:
+
+    python -m pytest test/test_layers.py
+
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'addons', 'blotter'))
+
+import axi  # noqa: E402
+from axi import checkpoint, device  # noqa: E402
+
+
+class FakeDevice(device.Device):
+    """A Device that counts the steps it is sent instead of moving"""
+
+    def __init__(self):
+        self.steps_per_unit = device.STEPS_PER_INCH
+        self.pen_up_position = device.PEN_UP_POSITION
+        self.pen_up_speed = device.PEN_UP_SPEED
+        self.pen_up_delay = 0
+        self.pen_down_position = device.PEN_DOWN_POSITION
+        self.pen_down_speed = device.PEN_DOWN_SPEED
+        self.pen_down_delay = 0
+        self.acceleration = device.ACCELERATION
+        self.max_velocity = device.MAX_VELOCITY
+        self.corner_factor = device.CORNER_FACTOR
+        self.jog_acceleration = device.JOG_ACCELERATION
+        self.jog_max_velocity = device.JOG_MAX_VELOCITY
+        self.error = (0, 0)
+        self.steps = [0, 0]
+
+    def command(self, *args):
+        if args[0] == 'XM':
+            self.steps[0] += args[2]
+            self.steps[1] += args[3]
+        return ''
+
+    def read_position(self):
+        return (self.steps[0] / self.steps_per_unit,
+                self.steps[1] / self.steps_per_unit)
+
+
+def interleaved_drawing():
+    # linesets of the layers A, B, A
+    paths = [np.array([(i, 0), (i, 1)], dtype=float) / 10 for i in range(6)]
+    packed = axi.packed.pack_arrays(paths)
+    packed.layers = np.array([0, 0, 1, 1, 0, 0], dtype=np.int32)
+    packed.meta = {'layers': ['A', 'B']}
+    return axi.Drawing(packed)
+
+
+def test_pipeline_groups_layers_without_optimizations():
+    drawing = axi.Pipeline(progress=False).run(interleaved_drawing())
+    assert drawing.layers.tolist() == [0, 0, 0, 0, 1, 1]
+    # the order within a layer is kept
+    xs = [path[0][0] for path in drawing.paths]
+    assert np.allclose(xs, [0, 0.1, 0.4, 0.5, 0.2, 0.3])
+    assert drawing.paths.meta['layers'] == ['A', 'B']
+
+
+def test_one_pen_change_per_layer():
+    changes = []
+    fake = FakeDevice()
+    pipeline = axi.Pipeline(device=fake, plan=True, progress=False)
+    drawing = pipeline.run(interleaved_drawing())
+    fake.run_drawing(drawing, False, plans=pipeline.plans,
+                     pen_change=lambda layer, name: changes.append(name))
+    assert changes == ['B']
+
+
+def test_sort_layers_with_aligned_paths():
+    # the remaining paths of each layer lie on a vertical line
+    drawing = axi.Pipeline(sort=True, processes=1, progress=False).run(
+        interleaved_drawing())
+    assert drawing.layers.tolist() == [0, 0, 0, 0, 1, 1]
+
+
+def test_layers_kept_by_drawing_operations():
+    drawing = interleaved_drawing()
+    moved = drawing.transform(lambda x, y: (x + 1, y))
+    assert moved.layers.tolist() == [0, 0, 1, 1, 0, 0]
+    inside = drawing.remove_paths_outside(0.25, 1)
+    assert inside.layers.tolist() == [0, 0, 1]
+    # the layers of the added drawing are matched by name
+    packed = axi.packed.pack_arrays([np.array([(0, 0), (1, 1)], float)] * 2)
+    packed.layers = np.array([0, 1], dtype=np.int32)
+    packed.meta = {'layers': ['B', 'C']}
+    drawing.add(axi.Drawing(packed))
+    assert drawing.layers.tolist() == [0, 0, 1, 1, 0, 0, 1, 2]
+    assert drawing.paths.meta['layers'] == ['A', 'B', 'C']
+
+
+def test_pen_change_when_resuming(tmp_path):
+    changes = []
+    fake = FakeDevice()
+    pipeline = axi.Pipeline(device=fake, plan=True, progress=False)
+    drawing = pipeline.run(interleaved_drawing())
+    # the plot stopped after the first path of layer B
+    filename = str(tmp_path / 'checkpoint.json')
+    checkpoint.Checkpoint(filename, drawing).update(5, 0, force=True)
+    fake.run_drawing(drawing, False, checkpoint=filename, resume=True,
+                     plans=pipeline.plans,
+                     pen_change=lambda layer, name: changes.append(name))
+    assert changes == ['B']
+
+
+if __name__ == '__main__':
+    test_pipeline_groups_layers_without_optimizations()
+    test_one_pen_change_per_layer()
+    test_sort_layers_with_aligned_paths()
+    test_layers_kept_by_drawing_operations()
+    print('ok')
@@ -0,0 +1,100 @@
+"""Round trips of drawings through the svg writer and reader.
+
+    python -m pytest test/test_svg.py
+
+"""
+
+import io
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'addons', 'blotter'))
+
+from axi.packed import pack_arrays  # noqa: E402
+from axi import svg  # noqa: E402
+from axi.svg import parse_path_data, read_svg, write_svg  # noqa: E402
+
+
+def round_trip(packed, **kwargs):
+    fp = io.StringIO()
+    write_svg(fp, packed, (0, 0, 0, 0), **kwargs)
+    fp.seek(0)
+    return read_svg(fp)
+
+
+def test_long_relative_path():
+    # a random walk whose deltas are not representable with a few digits
+    random = np.random.RandomState(0)
+    path = np.cumsum(random.uniform(-1e-3, 1e-3, (20000, 2)), axis=0) + 5
+    result = round_trip(pack_arrays([path]), relative=True)
+    assert len(result) == 1
+    # the writer adds a margin of an inch. relative moves are rounded to
+    # the default precision, without the error adding up along the path
+    error = 0.5 * 10 ** -svg.RELATIVE_PRECISION + 1e-9
+    assert np.abs(result.coords - (path + 1)).max() < error
+
+
+def test_paths_across_chunks(monkeypatch):
+    random = np.random.RandomState(1)
+    paths = [random.uniform(0, 5, (n, 2)) for n in (1, 7, 3, 12, 1, 6)]
+    packed = pack_arrays(paths)
+    expected = round_trip(packed, precision=6)
+    monkeypatch.setattr(svg, 'CHUNK_SIZE', 5)
+    for kwargs in ({}, {'precision': 6}, {'relative': True, 'precision': 6}):
+        result = round_trip(packed, **kwargs)
+        assert result.offsets.tolist() == packed.offsets.tolist()
+        assert np.allclose(result.coords, expected.coords, atol=1e-5)
+
+
+def test_degenerate_path_data():
+    assert parse_path_data('', 0.001) == []
+    assert parse_path_data('M', 0.001) == []
+    assert parse_path_data('MZ', 0.001) == []
+    for d in ('M0 0L', 'M0 0C1 1', 'M0 0Q', 'M0 0A1 1 0 0 1', 'M0 0H'):
+        paths = parse_path_data(d + ' M2 3L4 5', 0.001)
+        assert [p.tolist() for p in paths][-1] == [[2, 3], [4, 5]]
+
+
+def test_empty_shapes():
+    svg = '''<svg xmlns="http://www.w3.org/2000/svg" width="1in" height="1in"
+        viewBox="0 0 1 1"><polyline points=""/><polygon points=""/>
+        <path d="M0 0L"/><line x1="0" y1="0" x2="1" y2="1"/></svg>'''
+    packed = read_svg(io.StringIO(svg))
+    # the lone move of the path is kept as a point, like 'M0 0' alone
+    assert [len(path) for path in packed] == [1, 2]
+
+
+def test_unlayered_elements():
+    svg = '''<svg xmlns="http://www.w3.org/2000/svg"
+        xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
+        width="1in" height="1in" viewBox="0 0 1 1">
+        <path d="M0 0L1 0"/>
+        <g inkscape:groupmode="layer" inkscape:label="red">
+        <path d="M0 1L1 1"/></g></svg>'''
+    packed = read_svg(io.StringIO(svg))
+    names = packed.meta['layers']
+    assert [names[x] for x in packed.layers] == ['unlayered', 'red']
+
+
+def test_layers_round_trip():
+    paths = [np.array([(i, 0), (i, 1)], dtype=float) for i in range(4)]
+    packed = pack_arrays(paths)
+    packed.layers = np.array([1, 0, 1, 0], dtype=np.int32)
+    packed.meta = {'layers': ['pen "A"', 'pen B']}
+    result = round_trip(packed)
+    # the paths are grouped by layer
+    assert result.meta['layers'] == ['pen "A"', 'pen B']
+    assert result.layers.tolist() == [0, 0, 1, 1]
+    assert [p[0][0] for p in result] == [2, 4, 1, 3]
+
+
+if __name__ == '__main__':
+    test_long_relative_path()
+    test_degenerate_path_data()
+    test_empty_shapes()
+    test_unlayered_elements()
+    test_layers_round_trip()
+    print('ok')